@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+Checks the SpatiaLite overlay (sql_backend) against the Python overlay.
+
+Run with the Python interpreter of a QGIS installation, e.g.
+
+    python benchmarks/check_sql_backend.py --sizes 1000 10000
+
+Synthetic layers are written as tables of one GeoPackage and read back, so
+both overlays see the same features and feature ids. Area per plan feature,
+source and Before value, and the aggregated Before -> After areas, must match
+within --tolerance; a GeoPackage with an invalid polygon must be refused.
+Exits with status 1 on any mismatch.
+"""
+import argparse
+import os
+import sys
+import tempfile
+from collections import defaultdict
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PLUGIN_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, PLUGIN_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+from qgis.core import QgsApplication, QgsFeature, QgsGeometry, QgsVectorLayer  # noqa: E402
+
+DEFAULT_TOLERANCE = 0.01
+
+
+# ============================================================
+# OVERLAYS
+# ============================================================
+def geopackage_layer(gpkg_path: str, table: str) -> QgsVectorLayer:
+    layer = QgsVectorLayer(f"{gpkg_path}|layername={table}", table, "ogr")
+    if not layer.isValid():
+        raise RuntimeError(f"Could not read {table} from {gpkg_path}")
+    return layer
+
+
+def python_overlay_rows(base_layer, plan_layer, field_name: str) -> list:
+    import script_core
+
+    geom_by_field, union_by_field = script_core.build_union_geometries(base_layer, field_name)
+    return script_core.calculate_atomic_change_rows(
+        union_by_field=union_by_field,
+        total_base_union=script_core.build_total_base_union(geom_by_field),
+        plan_features=script_core.collect_plan_features(plan_layer, field_name),
+    )
+
+
+# ============================================================
+# COMPARISON
+# ============================================================
+def _area_by(rows: list, keys: tuple) -> dict:
+    areas = defaultdict(float)
+    for r in rows:
+        areas[tuple(r[k] for k in keys)] += r["Area"]
+    return areas
+
+
+def area_mismatches(expected: dict, actual: dict, tolerance: float) -> list:
+    """Keys missing on either side or with an area difference above tolerance."""
+    mismatches = []
+    for key in sorted(set(expected) | set(actual), key=str):
+        if key not in actual:
+            mismatches.append(f"{key}: missing in SQL result ({expected[key]:.2f} m²)")
+        elif key not in expected:
+            mismatches.append(f"{key}: only in SQL result ({actual[key]:.2f} m²)")
+        elif abs(expected[key] - actual[key]) > tolerance:
+            mismatches.append(f"{key}: Python {expected[key]:.2f} m², SQL {actual[key]:.2f} m²")
+    return mismatches
+
+
+def overlay_mismatches(python_rows: list, sql_rows: list, aggregated_rows: list, tolerance: float) -> list:
+    """
+    Compares atomic rows per (PlanFid, Source, Before, After) and the
+    aggregated intersection areas per (Before, After).
+    """
+    keys = ("PlanFid", "Source", "Before", "After")
+    mismatches = area_mismatches(_area_by(python_rows, keys), _area_by(sql_rows, keys), tolerance)
+
+    python_intersections = [r for r in python_rows if r["Source"] == "intersection"]
+    mismatches += [
+        "aggregated " + m
+        for m in area_mismatches(
+            _area_by(python_intersections, ("Before", "After")),
+            _area_by(aggregated_rows, ("Before", "After")),
+            tolerance,
+        )
+    ]
+    return mismatches
+
+
+def check_geopackage(gpkg_path: str, base_table: str, plan_table: str, field_name: str, tolerance: float) -> list:
+    import sql_backend
+
+    python_rows = python_overlay_rows(
+        geopackage_layer(gpkg_path, base_table), geopackage_layer(gpkg_path, plan_table), field_name
+    )
+    sql_rows = sql_backend.calculate_atomic_change_rows_sql(gpkg_path, base_table, field_name, plan_table, field_name)
+    aggregated = sql_backend.aggregated_change_rows_sql(gpkg_path, base_table, field_name, plan_table, field_name)
+    print(
+        f"  Python {len(python_rows)} rows / {sum(r['Area'] for r in python_rows):.2f} m², "
+        f"SQL {len(sql_rows)} rows / {sum(r['Area'] for r in sql_rows):.2f} m²"
+    )
+    return overlay_mismatches(python_rows, sql_rows, aggregated, tolerance)
+
+
+def check_invalid_input_refused(gpkg_path: str, base_layer, plan_layer, field_name: str) -> list:
+    """A self-intersecting plan polygon must make the SQL overlay raise ValueError."""
+    import sql_backend
+    from run_benchmarks import write_shared_geopackage
+
+    bowtie = QgsFeature(plan_layer.fields())
+    bowtie.setGeometry(QgsGeometry.fromWkt("POLYGON((0 0, 10 10, 10 0, 0 10, 0 0))"))
+    bowtie[field_name] = next(plan_layer.getFeatures())[field_name]
+    plan_layer.dataProvider().addFeatures([bowtie])
+    write_shared_geopackage([base_layer, plan_layer], gpkg_path)
+
+    try:
+        sql_backend.calculate_atomic_change_rows_sql(gpkg_path, "base", field_name, "plan", field_name)
+    except ValueError as e:
+        print(f"  invalid input refused: {e}")
+        return []
+    return ["invalid plan polygon was not refused by the SQL overlay"]
+
+
+# ============================================================
+# MAIN
+# ============================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the SpatiaLite overlay against the Python overlay.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed area difference per key in m²")
+    args = parser.parse_args(argv)
+
+    qgs = QgsApplication([], False)
+    qgs.initQgis()
+
+    from run_benchmarks import write_shared_geopackage
+    from synthetic_layers import CATEGORY_FIELD, make_benchmark_layers
+
+    failed = False
+    try:
+        with tempfile.TemporaryDirectory(prefix="bgib_sqlcheck_") as output_dir:
+            for size in args.sizes:
+                print(f"\n=== {size} polygons ===")
+                base_layer, plan_layer = make_benchmark_layers(size, seed=args.seed)
+                base_layer.setName("base")
+                plan_layer.setName("plan")
+
+                gpkg_path = os.path.join(output_dir, f"check_{size}.gpkg")
+                write_shared_geopackage([base_layer, plan_layer], gpkg_path)
+                mismatches = check_geopackage(gpkg_path, "base", "plan", CATEGORY_FIELD, args.tolerance)
+
+                invalid_path = os.path.join(output_dir, f"check_{size}_invalid.gpkg")
+                mismatches += check_invalid_input_refused(invalid_path, base_layer, plan_layer, CATEGORY_FIELD)
+
+                for m in mismatches[:20]:
+                    print(f"  MISMATCH {m}")
+                if mismatches:
+                    print(f"  {len(mismatches)} mismatches")
+                    failed = True
+                else:
+                    print("  OK")
+    finally:
+        qgs.exitQgis()
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
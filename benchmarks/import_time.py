@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Import-time measurement for the plugin and its heavy dependencies.
+
+Every target is imported in a fresh interpreter, so results are not
+affected by modules cached from a previous import. Run with the Python
+interpreter of a QGIS installation:
+
+    python benchmarks/import_time.py --repeat 5 --output import_time.json
+
+'plugin (classFactory)' imports the package the same way QGIS does at
+startup; pandas / plotly should not show up as loaded there.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PLUGIN_DIR = os.path.dirname(BENCH_DIR)
+
+HEAVY_MODULES = ("pandas", "numpy", "plotly", "pyarrow")
+
+# imports the plugin as package (relative imports) like QGIS' plugin loader
+PLUGIN_IMPORT = f"""
+import importlib.util
+spec = importlib.util.spec_from_file_location(
+    "bgib_plugin", {os.path.join(PLUGIN_DIR, "__init__.py")!r}, submodule_search_locations=[{PLUGIN_DIR!r}]
+)
+module = importlib.util.module_from_spec(spec)
+sys.modules["bgib_plugin"] = module
+spec.loader.exec_module(module)
+import bgib_plugin.netto_null_bilanz
+"""
+
+TARGETS = (
+    ("qgis.core / qgis.gui", "import qgis.core, qgis.gui"),
+    ("plugin (classFactory)", PLUGIN_IMPORT),
+    ("pandas", "import pandas"),
+    ("plotly.graph_objects", "import plotly.graph_objects"),
+    ("script_core", "import script_core"),
+    ("plotting", "import plotting"),
+)
+
+PROBE = """
+import json, sys, time
+sys.path.insert(0, {plugin_dir!r})
+import qgis.core, qgis.gui  # QGIS is always loaded before plugins
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "seconds": elapsed,
+    "loaded": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def measure(statement: str) -> dict:
+    code = PROBE.format(plugin_dir=PLUGIN_DIR, statement=statement, heavy=HEAVY_MODULES)
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "import failed")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure import time of the plugin and its dependencies.")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per target (median is reported)")
+    parser.add_argument("--output", default=None, help="Optional JSON result file")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"  {'Target':<24} {'Median [s]':>11} {'Min [s]':>9}  Heavy modules loaded")
+    for label, statement in TARGETS:
+        try:
+            runs = [measure(statement) for _ in range(max(1, args.repeat))]
+        except RuntimeError as e:
+            print(f"  {label:<24} failed: {e}")
+            results.append({"target": label, "error": str(e)})
+            continue
+
+        seconds = [r["seconds"] for r in runs]
+        loaded = runs[-1]["loaded"]
+        results.append({
+            "target": label,
+            "median_s": round(statistics.median(seconds), 4),
+            "min_s": round(min(seconds), 4),
+            "heavy_modules_loaded": loaded,
+        })
+        print(
+            f"  {label:<24} {statistics.median(seconds):>11.3f} {min(seconds):>9.3f}  "
+            f"{', '.join(loaded) or '-'}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "results": results}, f, indent=2)
+        print(f"\nImport times written to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
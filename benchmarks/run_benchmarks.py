@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark suite for the script_core stages on synthetic data.
+
+Run with the Python interpreter of a QGIS installation, e.g.
+
+    python benchmarks/run_benchmarks.py --sizes 1000 10000 --output bench.json
+
+Each stage is timed (wall / CPU) and its peak Python memory is measured with
+tracemalloc, using the same instrumentation.StageRecorder as the plugin.
+Results are written as JSON so runs can be compared over time.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import tempfile
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PLUGIN_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, PLUGIN_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+from qgis.core import Qgis, QgsApplication  # noqa: E402
+
+from instrumentation import StageRecorder  # noqa: E402
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+FACTORS_CSV = os.path.join(PLUGIN_DIR, "data", "factors.csv")
+
+
+# ============================================================
+# REPORTING
+# ============================================================
+def collect(perf, size: int, results: list) -> None:
+    for record in perf.stages:
+        results.append({"size": size, **record})
+        print(
+            f"  {record['stage']:<30} wall={record['wall_s']:>9.3f}s cpu={record['cpu_s']:>9.3f}s "
+            f"peak={record['peak_mem_mb']:>9.2f} MB items={record['items']}"
+        )
+
+
+# ============================================================
+# STAGES
+# ============================================================
+def write_shared_geopackage(layers, path: str) -> None:
+    """Writes the synthetic layers as tables of one GeoPackage (with R-tree)."""
+    from qgis.core import QgsProject, QgsVectorFileWriter
+
+    for i, layer in enumerate(layers):
+        options = QgsVectorFileWriter.SaveVectorOptions()
+        options.driverName = "GPKG"
+        options.layerName = layer.name()
+        if i > 0:
+            options.actionOnExistingFile = QgsVectorFileWriter.CreateOrOverwriteLayer
+        error = QgsVectorFileWriter.writeAsVectorFormatV3(
+            layer, path, QgsProject.instance().transformContext(), options
+        )
+        if error[0] != QgsVectorFileWriter.NoError:
+            raise RuntimeError(f"Could not write {layer.name()}: {error[1]}")
+
+
+def run_sql_overlay(size: int, base_layer, plan_layer, perf, output_dir: str) -> None:
+    """
+    SpatiaLite overlay on a GeoPackage copy of the layers, checked against
+    the Python overlay of the same copy (raises on a mismatch).
+    """
+    import sql_backend
+    from check_sql_backend import DEFAULT_TOLERANCE, check_geopackage
+    from synthetic_layers import CATEGORY_FIELD
+
+    gpkg_path = os.path.join(output_dir, f"bench_{size}_inputs.gpkg")
+    base_layer.setName("base")
+    plan_layer.setName("plan")
+    write_shared_geopackage([base_layer, plan_layer], gpkg_path)
+
+    with perf.stage("sql_atomic_change_rows") as rec:
+        rows = sql_backend.calculate_atomic_change_rows_sql(
+            gpkg_path, "base", CATEGORY_FIELD, "plan", CATEGORY_FIELD
+        )
+        rec["items"] = len(rows)
+
+    with perf.stage("sql_aggregated_change_rows") as rec:
+        aggregated = sql_backend.aggregated_change_rows_sql(
+            gpkg_path, "base", CATEGORY_FIELD, "plan", CATEGORY_FIELD
+        )
+        rec["items"] = len(aggregated)
+
+    mismatches = check_geopackage(gpkg_path, "base", "plan", CATEGORY_FIELD, DEFAULT_TOLERANCE)
+    if mismatches:
+        raise RuntimeError(f"SQL overlay differs from the Python overlay: {mismatches[:5]}")
+
+
+def run_size(size: int, args, results: list, output_dir: str) -> None:
+    import script_core
+    from synthetic_layers import CATEGORY_FIELD, make_benchmark_layers, parse_mix
+
+    print(f"\n=== {size} polygons ===")
+    perf = StageRecorder(trace_memory=True)
+
+    with perf.stage("generate_layers") as rec:
+        base_layer, plan_layer = make_benchmark_layers(
+            size,
+            seed=args.seed,
+            vertices_per_edge=args.vertices_per_edge,
+            jitter=args.jitter,
+            uncovered_share=args.uncovered_share,
+            base_mix=parse_mix(args.base_mix),
+            plan_mix=parse_mix(args.plan_mix),
+        )
+        rec["items"] = base_layer.featureCount() + plan_layer.featureCount()
+
+    if not args.skip_overlaps:
+        with perf.stage("find_polygon_overlaps") as rec:
+            overlaps = script_core.find_polygon_overlaps(base_layer)
+            rec["items"] = len(overlaps)
+
+    with perf.stage("build_union_geometries") as rec:
+        geom_by_field, union_by_field = script_core.build_union_geometries(base_layer, CATEGORY_FIELD)
+        rec["items"] = len(union_by_field)
+
+    with perf.stage("build_total_base_union") as rec:
+        total_base_union = script_core.build_total_base_union(geom_by_field)
+        rec["items"] = 1 if total_base_union is not None else 0
+
+    with perf.stage("collect_plan_features") as rec:
+        plan_features = script_core.collect_plan_features(plan_layer, CATEGORY_FIELD)
+        rec["items"] = len(plan_features)
+
+    with perf.stage("calculate_atomic_change_rows") as rec:
+        rows = script_core.calculate_atomic_change_rows(
+            union_by_field=union_by_field,
+            total_base_union=total_base_union,
+            plan_features=plan_features,
+        )
+        rec["items"] = len(rows)
+
+    if args.sql:
+        run_sql_overlay(size, base_layer, plan_layer, perf, output_dir)
+
+    with perf.stage("apply_factors_to_rows") as rec:
+        df_atomic = script_core.apply_factors_to_rows(rows, args.factors_csv)
+        rec["items"] = len(df_atomic)
+
+    with perf.stage("aggregate_change_rows") as rec:
+        df_agg = script_core.aggregate_change_rows(df_atomic)
+        rec["items"] = len(df_agg)
+
+    with perf.stage("write_spatial_change_layer") as rec:
+        script_core.write_spatial_change_layer(
+            df_atomic,
+            output_path=os.path.join(output_dir, f"bench_{size}_spatial_changes.gpkg"),
+            crs=plan_layer.crs(),
+        )
+        rec["items"] = len(df_atomic)
+
+    collect(perf, size, results)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark script_core stages on synthetic layers.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Number of polygons per layer (default: 1k 10k 100k 1M)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--vertices-per-edge", type=int, default=1,
+                        help="Vertex density: vertices per polygon edge")
+    parser.add_argument("--jitter", type=float, default=0.2,
+                        help="Plan node jitter as share of the cell size (< 0.5)")
+    parser.add_argument("--uncovered-share", type=float, default=0.05,
+                        help="Share of base cells left empty (produces 'Uncovered' rows)")
+    parser.add_argument("--base-mix", default=None,
+                        help="Base category mix 'Category=weight,...' (default: from example_data)")
+    parser.add_argument("--plan-mix", default=None,
+                        help="Plan category mix 'Category=weight,...' (default: from example_data)")
+    parser.add_argument("--factors-csv", default=FACTORS_CSV)
+    parser.add_argument("--skip-overlaps", action="store_true", help="Skip the overlap check stage")
+    parser.add_argument("--sql", action="store_true",
+                        help="Also run the SpatiaLite overlay (sql_backend) on a GeoPackage copy of the layers")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON result file")
+    args = parser.parse_args(argv)
+
+    qgs = QgsApplication([], False)
+    qgs.initQgis()
+
+    results = []
+    try:
+        with tempfile.TemporaryDirectory(prefix="bgib_bench_") as output_dir:
+            for size in args.sizes:
+                run_size(size, args, results, output_dir)
+    finally:
+        payload = {
+            "meta": {
+                "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+                "python": sys.version.split()[0],
+                "qgis": Qgis.QGIS_VERSION,
+                "platform": platform.platform(),
+                "parameters": {k: v for k, v in vars(args).items() if k != "output"},
+            },
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False)
+        print(f"\nBenchmark results written to: {args.output}")
+        qgs.exitQgis()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+Synthetic base / plan layers for benchmarking script_core.
+
+The base layer is a regular parcel grid, the plan layer a jittered and
+shifted tessellation of the same extent (no overlaps inside one layer,
+many partial intersections between the layers). CRS, origin, parcel size
+and the category mix are seeded from the example data in example_data/.
+"""
+import math
+import os
+import random
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from qgis.core import (
+    QgsFeature,
+    QgsGeometry,
+    QgsPointXY,
+    QgsVectorLayer,
+)
+
+
+PLUGIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXAMPLE_BASE = os.path.join(PLUGIN_DIR, "example_data", "example_base.geojson")
+EXAMPLE_PLAN = os.path.join(PLUGIN_DIR, "example_data", "example_plan.geojson")
+
+CATEGORY_FIELD = "Flächentyp"
+
+
+# ============================================================
+# SEED FROM EXAMPLE DATA
+# ============================================================
+def _area_weighted_mix(layer: QgsVectorLayer, field_name: str) -> Dict[str, float]:
+    area_by_value = defaultdict(float)
+    for feat in layer.getFeatures():
+        geom = feat.geometry()
+        if not geom or geom.isEmpty():
+            continue
+        value = feat[field_name]
+        if value is None or not str(value).strip():
+            continue
+        area_by_value[str(value).strip()] += geom.area()
+
+    total = sum(area_by_value.values())
+    if total <= 0:
+        return {}
+    return {k: v / total for k, v in area_by_value.items()}
+
+
+def seed_from_example_data(
+    base_path: str = EXAMPLE_BASE,
+    plan_path: str = EXAMPLE_PLAN,
+    base_field: str = "Surface",
+    plan_field: str = "BFF_Description",
+) -> dict:
+    """
+    Reads CRS, origin, typical parcel size and category mixes from the example data.
+    """
+    base = QgsVectorLayer(base_path, "example_base", "ogr")
+    plan = QgsVectorLayer(plan_path, "example_plan", "ogr")
+    if not base.isValid() or not plan.isValid():
+        raise ValueError(f"Could not read example data: {base_path}, {plan_path}")
+
+    areas = [f.geometry().area() for f in plan.getFeatures() if f.geometry() and not f.geometry().isEmpty()]
+    mean_area = sum(areas) / len(areas) if areas else 100.0
+    extent = base.extent()
+
+    return {
+        "crs": base.crs().authid() or "EPSG:25832",
+        "origin": (extent.xMinimum(), extent.yMinimum()),
+        "cell_size": max(1.0, math.sqrt(mean_area)),
+        "base_mix": _area_weighted_mix(base, base_field),
+        "plan_mix": _area_weighted_mix(plan, plan_field),
+    }
+
+
+def parse_mix(text: Optional[str]) -> Optional[Dict[str, float]]:
+    """
+    'Versiegelte Belagsfläche=0.6,Gründach (extensiv)=0.4' -> normalized dict.
+    """
+    if not text:
+        return None
+    mix = {}
+    for part in text.split(","):
+        if "=" not in part:
+            raise ValueError(f"Invalid category mix entry '{part}', expected 'Category=weight'")
+        key, weight = part.rsplit("=", 1)
+        mix[key.strip()] = float(weight)
+    total = sum(mix.values())
+    if total <= 0:
+        raise ValueError("Category mix weights must sum to a positive value")
+    return {k: v / total for k, v in mix.items()}
+
+
+# ============================================================
+# GEOMETRY GENERATION
+# ============================================================
+def _lattice(cols: int, rows: int, origin, cell_size: float, jitter: float, offset: float, rng: random.Random):
+    """
+    Grid nodes, optionally jittered. Neighbouring cells share their corner nodes,
+    so the resulting tessellation has no overlaps as long as jitter < 0.5.
+    """
+    x0, y0 = origin
+    nodes = []
+    for j in range(rows + 1):
+        row = []
+        for i in range(cols + 1):
+            dx = rng.uniform(-jitter, jitter) * cell_size if jitter else 0.0
+            dy = rng.uniform(-jitter, jitter) * cell_size if jitter else 0.0
+            row.append((
+                x0 + (i + offset) * cell_size + dx,
+                y0 + (j + offset) * cell_size + dy,
+            ))
+        nodes.append(row)
+    return nodes
+
+
+def _densified_edge(p1, p2, vertices_per_edge: int) -> List[QgsPointXY]:
+    # p1 included, p2 excluded; deterministic so shared edges stay identical
+    steps = max(1, vertices_per_edge)
+    return [
+        QgsPointXY(p1[0] + (p2[0] - p1[0]) * k / steps, p1[1] + (p2[1] - p1[1]) * k / steps)
+        for k in range(steps)
+    ]
+
+
+def _cell_geometry(nodes, i: int, j: int, vertices_per_edge: int) -> QgsGeometry:
+    corners = [nodes[j][i], nodes[j][i + 1], nodes[j + 1][i + 1], nodes[j + 1][i]]
+    ring = []
+    for k in range(4):
+        ring.extend(_densified_edge(corners[k], corners[(k + 1) % 4], vertices_per_edge))
+    ring.append(ring[0])
+    return QgsGeometry.fromPolygonXY([ring])
+
+
+def _pick(mix: Dict[str, float], rng: random.Random) -> str:
+    keys = list(mix.keys())
+    return rng.choices(keys, weights=[mix[k] for k in keys], k=1)[0]
+
+
+def make_grid_layer(
+    name: str,
+    n_polygons: int,
+    crs: str,
+    origin,
+    cell_size: float,
+    mix: Dict[str, float],
+    vertices_per_edge: int = 1,
+    jitter: float = 0.0,
+    offset: float = 0.0,
+    drop_share: float = 0.0,
+    seed: int = 0,
+    batch_size: int = 10_000,
+) -> QgsVectorLayer:
+    """
+    Memory layer with about n_polygons cells and field 'Flächentyp'.
+
+    drop_share leaves random cells empty (e.g. to produce 'Uncovered' plan areas).
+    """
+    if not mix:
+        raise ValueError(f"Empty category mix for layer '{name}'")
+
+    rng = random.Random(seed)
+    cols = max(1, int(math.ceil(math.sqrt(n_polygons))))
+    rows = max(1, int(math.ceil(n_polygons / cols)))
+    nodes = _lattice(cols, rows, origin, cell_size, jitter, offset, rng)
+
+    layer = QgsVectorLayer(f"Polygon?crs={crs}&field={CATEGORY_FIELD}:string(120)", name, "memory")
+    provider = layer.dataProvider()
+    fields = layer.fields()
+
+    batch = []
+    created = 0
+    for j in range(rows):
+        for i in range(cols):
+            if created >= n_polygons:
+                break
+            created += 1
+            if drop_share and rng.random() < drop_share:
+                continue
+
+            feat = QgsFeature(fields)
+            feat.setGeometry(_cell_geometry(nodes, i, j, vertices_per_edge))
+            feat[CATEGORY_FIELD] = _pick(mix, rng)
+            batch.append(feat)
+
+            if len(batch) >= batch_size:
+                provider.addFeatures(batch)
+                batch = []
+
+    if batch:
+        provider.addFeatures(batch)
+
+    layer.updateExtents()
+    return layer
+
+
+def make_benchmark_layers(
+    n_polygons: int,
+    seed: int = 42,
+    vertices_per_edge: int = 1,
+    jitter: float = 0.2,
+    uncovered_share: float = 0.05,
+    base_mix: Optional[Dict[str, float]] = None,
+    plan_mix: Optional[Dict[str, float]] = None,
+) -> tuple:
+    """
+    Returns (base_layer, plan_layer) with n_polygons features each (minus
+    dropped base cells), seeded from example_data/.
+    """
+    seed_info = seed_from_example_data()
+
+    base_layer = make_grid_layer(
+        "bench_base",
+        n_polygons,
+        crs=seed_info["crs"],
+        origin=seed_info["origin"],
+        cell_size=seed_info["cell_size"],
+        mix=base_mix or seed_info["base_mix"],
+        vertices_per_edge=vertices_per_edge,
+        drop_share=uncovered_share,
+        seed=seed,
+    )
+    plan_layer = make_grid_layer(
+        "bench_plan",
+        n_polygons,
+        crs=seed_info["crs"],
+        origin=seed_info["origin"],
+        cell_size=seed_info["cell_size"],
+        mix=plan_mix or seed_info["plan_mix"],
+        vertices_per_edge=vertices_per_edge,
+        jitter=jitter,
+        offset=0.37,
+        seed=seed + 1,
+    )
+    return base_layer, plan_layer
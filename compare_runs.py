@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+Difference between two balance runs from their stored spatial change
+layers ('<csv>_spatial_changes.gpkg'), without any new overlay.
+
+Change rows are matched by (PlanFid, Before, After, GeomHash): rows present
+in both runs are unchanged, all others were removed (only in run A) or
+added (only in run B). Attributes are joined first; geometries are only
+read for the changed rows.
+
+Rows without geometry (non-spatial manual measures) are not part of the
+change layer, so all deltas per feature / transition are spatial only. The
+total Net Balance delta is taken from the balance CSVs of both runs when
+they are found next to the change layers.
+"""
+import os
+from typing import Callable, Optional
+
+import pandas as pd
+from qgis.PyQt.QtCore import QVariant
+from qgis.core import (
+    QgsFeature,
+    QgsFeatureRequest,
+    QgsField,
+    QgsFields,
+    QgsProject,
+    QgsVectorFileWriter,
+    QgsVectorLayer,
+    QgsWkbTypes,
+)
+
+try:
+    from .script_core import geometry_hash
+except ImportError:
+    from script_core import geometry_hash
+
+
+CHANGE_LAYER_NAME = "spatial_changes"
+CHANGE_LAYER_SUFFIX = "_spatial_changes.gpkg"
+MATCH_KEYS = ["PlanFid", "Before", "After", "GeomHash"]
+VALUE_COLUMNS = ["Area", "BFF_Area", "Final_BFF"]
+
+
+# ============================================================
+# INPUT
+# ============================================================
+def open_change_layer(gpkg_path: str) -> QgsVectorLayer:
+    layer = QgsVectorLayer(f"{gpkg_path}|layername={CHANGE_LAYER_NAME}", "spatial_changes", "ogr")
+    if not layer.isValid():
+        raise ValueError(f"Could not read spatial change layer: {gpkg_path}")
+    return layer
+
+
+def read_change_table(layer: QgsVectorLayer) -> pd.DataFrame:
+    """
+    Attribute table of a spatial change layer (no geometry). Layers of runs
+    before GeomHash was stored get the hash computed from their geometry.
+    """
+    field_names = [f.name() for f in layer.fields()]
+    has_hash = "GeomHash" in field_names
+
+    request = QgsFeatureRequest()
+    if has_hash:
+        request.setFlags(QgsFeatureRequest.NoGeometry)
+
+    records = []
+    for feat in layer.getFeatures(request):
+        records.append({
+            "fid": feat.id(),
+            "PlanFid": feat["PlanFid"] if "PlanFid" in field_names else None,
+            "Before": feat["Before"],
+            "After": feat["After"],
+            "Area": feat["Area"],
+            "BFF_Area": feat["BFF_Area"],
+            "Final_BFF": feat["Final_BFF"],
+            "GeomHash": feat["GeomHash"] if has_hash else geometry_hash(feat.geometry()),
+        })
+
+    df = pd.DataFrame(records, columns=["fid"] + MATCH_KEYS + VALUE_COLUMNS)
+    df["PlanFid"] = pd.to_numeric(df["PlanFid"], errors="coerce").fillna(-1).astype("int64")
+    for c in VALUE_COLUMNS:
+        df[c] = pd.to_numeric(df[c], errors="coerce").fillna(0.0)
+    return df
+
+
+def balance_csv_for(gpkg_path: str) -> Optional[str]:
+    """
+    Balance CSV written by the same run as the change layer, if present.
+    """
+    if not gpkg_path.endswith(CHANGE_LAYER_SUFFIX):
+        return None
+    path = gpkg_path[: -len(CHANGE_LAYER_SUFFIX)] + ".csv"
+    return path if os.path.exists(path) else None
+
+
+def net_balance_from_csv(csv_path: str) -> float:
+    df = pd.read_csv(csv_path, encoding="utf-8-sig")
+    return float(pd.to_numeric(df["BFF_Area"], errors="coerce").fillna(0.0).sum())
+
+
+# ============================================================
+# DIFF
+# ============================================================
+def match_change_rows(df_a: pd.DataFrame, df_b: pd.DataFrame) -> pd.DataFrame:
+    """
+    Outer join on MATCH_KEYS; Status is 'unchanged', 'removed' or 'added'.
+    Duplicate keys inside one run are matched by their order.
+    """
+    a = df_a.assign(_n=df_a.groupby(MATCH_KEYS).cumcount())
+    b = df_b.assign(_n=df_b.groupby(MATCH_KEYS).cumcount())
+    merged = a.merge(b, on=MATCH_KEYS + ["_n"], how="outer", suffixes=("_a", "_b"), indicator=True)
+    merged["Status"] = merged["_merge"].map({"both": "unchanged", "left_only": "removed", "right_only": "added"})
+    return merged.drop(columns=["_merge", "_n"])
+
+
+def delta_by(merged: pd.DataFrame, keys: list) -> pd.DataFrame:
+    """
+    Sums of both runs and their difference (B - A) per key.
+    """
+    cols = {}
+    for c in VALUE_COLUMNS:
+        cols[f"{c}_a"] = "sum"
+        cols[f"{c}_b"] = "sum"
+    df = merged.groupby(keys, as_index=False, dropna=False).agg(cols)
+    for c in VALUE_COLUMNS:
+        df[f"{c}_delta"] = (df[f"{c}_b"].fillna(0.0) - df[f"{c}_a"].fillna(0.0)).round(2)
+
+    changed = merged[merged["Status"] != "unchanged"]
+    changed_area = (
+        changed.assign(_area=changed["Area_a"].fillna(0.0) + changed["Area_b"].fillna(0.0))
+        .groupby(keys, dropna=False)["_area"].sum()
+        .rename("Changed_Area")
+        .reset_index()
+    )
+    df = df.merge(changed_area, on=keys, how="left")
+    df["Changed_Area"] = df["Changed_Area"].fillna(0.0).round(2)
+    return df.sort_values("BFF_Area_delta", key=lambda s: s.abs(), ascending=False)
+
+
+# ============================================================
+# OUTPUT
+# ============================================================
+def write_changed_areas(
+    merged: pd.DataFrame,
+    layer_a: QgsVectorLayer,
+    layer_b: QgsVectorLayer,
+    output_path: str,
+    layer_name: str = "changed_areas",
+) -> int:
+    """
+    Removed and added change rows with their geometry; Delta is the signed
+    BFF contribution (-A for removed, +B for added rows).
+    """
+    fields = QgsFields()
+    fields.append(QgsField("Status", QVariant.String))
+    fields.append(QgsField("PlanFid", QVariant.LongLong))
+    fields.append(QgsField("Before", QVariant.String))
+    fields.append(QgsField("After", QVariant.String))
+    fields.append(QgsField("Area", QVariant.Double))
+    fields.append(QgsField("Delta", QVariant.Double))
+
+    options = QgsVectorFileWriter.SaveVectorOptions()
+    options.driverName = "GPKG"
+    options.layerName = layer_name
+
+    writer = QgsVectorFileWriter.create(
+        output_path,
+        fields,
+        QgsWkbTypes.MultiPolygon,
+        layer_b.crs(),
+        QgsProject.instance().transformContext(),
+        options,
+    )
+    if writer.hasError() != QgsVectorFileWriter.NoError:
+        raise ValueError(f"Could not create comparison output: {writer.errorMessage()}")
+
+    written = 0
+    for status, layer, suffix, sign in (("removed", layer_a, "_a", -1.0), ("added", layer_b, "_b", 1.0)):
+        rows = merged[merged["Status"] == status]
+        if rows.empty:
+            continue
+        by_fid = rows.set_index(f"fid{suffix}")
+        request = QgsFeatureRequest().setFilterFids([int(fid) for fid in by_fid.index])
+        for src in layer.getFeatures(request):
+            row = by_fid.loc[src.id()]
+            feat = QgsFeature(fields)
+            feat.setGeometry(src.geometry())
+            feat["Status"] = status
+            feat["PlanFid"] = int(row["PlanFid"]) if row["PlanFid"] >= 0 else None
+            feat["Before"] = str(row["Before"])
+            feat["After"] = str(row["After"])
+            feat["Area"] = float(row[f"Area{suffix}"])
+            feat["Delta"] = sign * float(row[f"BFF_Area{suffix}"])
+            writer.addFeature(feat)
+            written += 1
+
+    del writer
+    return written
+
+
+def compare_runs(
+    gpkg_a: str,
+    gpkg_b: str,
+    output_stem: str,
+    log_cb: Optional[Callable[[str], None]] = None,
+) -> dict:
+    """
+    Compares run A (reference) with run B. Writes
+      '<stem>_features.csv'    per plan feature deltas
+      '<stem>_transitions.csv' per Before -> After deltas
+      '<stem>_changed.gpkg'    removed / added change areas
+    and returns a dict with the totals and output paths.
+    """
+    layer_a = open_change_layer(gpkg_a)
+    layer_b = open_change_layer(gpkg_b)
+
+    merged = match_change_rows(read_change_table(layer_a), read_change_table(layer_b))
+    feature_delta = delta_by(merged, ["PlanFid"])
+    transition_delta = delta_by(merged, ["Before", "After"])
+
+    output_dir = os.path.dirname(output_stem)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    features_path = output_stem + "_features.csv"
+    transitions_path = output_stem + "_transitions.csv"
+    changed_path = output_stem + "_changed.gpkg"
+
+    feature_delta.to_csv(features_path, index=False, encoding="utf-8-sig")
+    transition_delta.to_csv(transitions_path, index=False, encoding="utf-8-sig")
+    written = write_changed_areas(merged, layer_a, layer_b, changed_path)
+
+    counts = merged["Status"].value_counts()
+    spatial_delta = float(merged["BFF_Area_b"].fillna(0.0).sum() - merged["BFF_Area_a"].fillna(0.0).sum())
+    result = {
+        "Run A": gpkg_a,
+        "Run B": gpkg_b,
+        "Unchanged rows": int(counts.get("unchanged", 0)),
+        "Removed rows": int(counts.get("removed", 0)),
+        "Added rows": int(counts.get("added", 0)),
+        "Spatial Net Balance delta": f"{spatial_delta:.2f} m2",
+    }
+    csv_a, csv_b = balance_csv_for(gpkg_a), balance_csv_for(gpkg_b)
+    if csv_a and csv_b:
+        net_delta = net_balance_from_csv(csv_b) - net_balance_from_csv(csv_a)
+        result["Net Balance delta"] = f"{net_delta:.2f} m2"
+    result.update({
+        "Changed plan features": int((feature_delta["Changed_Area"] > 0).sum()),
+        "Feature delta path": features_path,
+        "Transition delta path": transitions_path,
+        "Changed areas path": changed_path,
+    })
+
+    if log_cb:
+        log_cb("===== RUN COMPARISON (B - A) =====")
+        for key, value in result.items():
+            log_cb(f"{key:<26}: {value}")
+        log_cb("")
+        if "Net Balance delta" not in result:
+            log_cb("Balance CSV of a run not found, deltas cover spatial rows only.")
+        log_cb("Largest changes by transition (spatial rows):")
+        for row in transition_delta.head(10).to_dict(orient="records"):
+            if row["BFF_Area_delta"] == 0:
+                continue
+            log_cb(f"  {row['Before']} -> {row['After']}: {row['BFF_Area_delta']:+.2f} m²")
+        log_cb(f"  ({written} changed areas written)")
+        log_cb("")
+    return result
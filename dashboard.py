@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import shutil
+from typing import Callable, Optional
+
+import pandas as pd
+
+try:
+    from .plotting import ensure_plotlyjs, plotlyjs_version
+except ImportError:  # standalone use (benchmarks, console)
+    from plotting import ensure_plotlyjs, plotlyjs_version
+
+
+PAYLOAD_VERSION = 1
+COST_VARIANTS = ("billig", "mittel", "teuer")
+
+# placeholder in Dashboard.html that receives an embedded payload
+PAYLOAD_TAG = '<script type="application/json" id="bgibPayload"></script>'
+
+# CDN references in Dashboard.html and the local file replacing each of them,
+# all taken from vendor/ of the plugin (see vendor/fetch_assets.py). plotly.js
+# may instead come from the installed plotly package, but only if it bundles
+# exactly the pinned version Dashboard.html was written for.
+VENDOR_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "vendor")
+DASHBOARD_PLOTLYJS_VERSION = "2.32.0"
+DASHBOARD_PLOTLYJS_FILENAME = f"plotly-{DASHBOARD_PLOTLYJS_VERSION}.min.js"
+CDN_ASSETS = (
+    (
+        '<link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css" rel="stylesheet">',
+        "bootstrap.min.css",
+    ),
+    (
+        f'<script src="https://cdn.plot.ly/plotly-{DASHBOARD_PLOTLYJS_VERSION}.min.js"></script>',
+        DASHBOARD_PLOTLYJS_FILENAME,
+    ),
+    (
+        '<script src="https://cdn.jsdelivr.net/npm/papaparse@5.4.1/papaparse.min.js"></script>',
+        "papaparse.min.js",
+    ),
+    (
+        '<script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js"></script>',
+        "bootstrap.bundle.min.js",
+    ),
+)
+
+
+# ============================================================
+# PAYLOAD
+# ============================================================
+def load_cost_table(costs_csv: str) -> list:
+    """
+    Cost variants in €/m² per measure ('Description;billig;mittel;teuer').
+    """
+    if not costs_csv or not os.path.exists(costs_csv):
+        return []
+
+    df_costs = pd.read_csv(costs_csv, sep=";")
+    df_costs.columns = [c.strip() for c in df_costs.columns]
+    if "Description" not in df_costs.columns:
+        raise ValueError("Cost CSV must contain column 'Description'")
+
+    costs = pd.DataFrame({"beschreibung": df_costs["Description"].astype(str).str.strip()})
+    for variant in COST_VARIANTS:
+        if variant in df_costs.columns:
+            costs[variant] = pd.to_numeric(df_costs[variant], errors="coerce").fillna(0.0).astype(float)
+        else:
+            costs[variant] = 0.0
+    return costs.to_dict(orient="records")
+
+
+def build_dashboard_payload(
+    results_df: pd.DataFrame,
+    factors_csv: str,
+    project_title: str,
+    summary: dict = None,
+    costs_csv: str = None,
+) -> dict:
+    """
+    Compact, pre-aggregated input for Dashboard.html.
+
+    transitions are stored column-wise with indices into 'categories', so
+    the dashboard needs no CSV parsing and no delimiter / number sniffing.
+    """
+    df_factors = pd.read_csv(factors_csv, sep=";")
+    df_factors.columns = [c.strip() for c in df_factors.columns]
+    factors = pd.DataFrame({
+        "beschreibung": df_factors["Description"].astype(str).str.strip(),
+        "faktor": pd.to_numeric(df_factors["BFF_2020"], errors="coerce").fillna(0.0).astype(float),
+    }).to_dict(orient="records")
+
+    if results_df.empty:
+        categories = []
+        transitions = {"before": [], "after": [], "area": [], "bff_area": []}
+    else:
+        df = results_df.groupby(["Before", "After"], as_index=False, sort=False)[["Area", "BFF_Area"]].sum()
+        codes, categories = pd.factorize(pd.concat([df["Before"], df["After"]], ignore_index=True).astype(str))
+        n = len(df)
+        transitions = {
+            "before": codes[:n].tolist(),
+            "after": codes[n:].tolist(),
+            "area": df["Area"].round(2).tolist(),
+            "bff_area": df["BFF_Area"].round(2).tolist(),
+        }
+        categories = categories.tolist()
+
+    def column_sum(col):
+        return round(float(results_df[col].sum()), 2) if col in results_df.columns else 0.0
+
+    return {
+        "version": PAYLOAD_VERSION,
+        "project": project_title,
+        "categories": categories,
+        "transitions": transitions,
+        "factors": factors,
+        "costs": load_cost_table(costs_csv),
+        "totals": {
+            "area": column_sum("Area"),
+            "bff_area": column_sum("BFF_Area"),
+            "final_bff_area": column_sum("Final_BFF_Area"),
+            "summary": dict(summary or {}),
+        },
+    }
+
+
+def write_dashboard_payload(payload: dict, output_path: str) -> str:
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+    return output_path
+
+
+# ============================================================
+# DASHBOARD COPY WITH EMBEDDED PAYLOAD
+# ============================================================
+def embed_payload(html_text: str, payload: dict) -> str:
+    if PAYLOAD_TAG not in html_text:
+        raise ValueError("Dashboard template has no payload placeholder (id='bgibPayload')")
+
+    # '</' would end the script element early
+    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).replace("</", "<\\/")
+    return html_text.replace(
+        PAYLOAD_TAG,
+        f'<script type="application/json" id="bgibPayload">{data}</script>',
+        1,
+    )
+
+
+def bundle_assets(
+    html_text: str,
+    output_dir: str,
+    vendor_dir: str = VENDOR_DIR,
+    log_cb: Optional[Callable[[str], None]] = None,
+) -> str:
+    """
+    Replaces the CDN references by local copies in output_dir, so the
+    dashboard starts without network access. Each asset is written once per
+    results folder. Assets missing in vendor_dir keep their CDN reference,
+    except plotly.js, which is shared with the HTML report if the installed
+    plotly package bundles the pinned version.
+    """
+    missing = []
+    for cdn_tag, filename in CDN_ASSETS:
+        if cdn_tag not in html_text:
+            continue
+
+        target = os.path.join(output_dir, filename)
+        source = os.path.join(vendor_dir, filename)
+        if not os.path.exists(target):
+            if os.path.exists(source):
+                shutil.copyfile(source, target)
+            elif filename == DASHBOARD_PLOTLYJS_FILENAME and plotlyjs_version() == DASHBOARD_PLOTLYJS_VERSION:
+                filename = os.path.basename(ensure_plotlyjs(output_dir))
+            else:
+                missing.append(filename)
+                continue
+
+        if filename.endswith(".css"):
+            local_tag = f'<link href="{filename}" rel="stylesheet">'
+        else:
+            local_tag = f'<script src="{filename}"></script>'
+        html_text = html_text.replace(cdn_tag, local_tag)
+
+    if missing and log_cb:
+        log_cb(
+            "Dashboard: not found in vendor/ (run vendor/fetch_assets.py), "
+            "loaded from CDN instead: " + ", ".join(missing)
+        )
+    return html_text
+
+
+def write_dashboard(
+    template_path: str,
+    payload: dict,
+    output_path: str,
+    offline: bool = True,
+    log_cb: Optional[Callable[[str], None]] = None,
+) -> str:
+    """
+    Writes a copy of Dashboard.html that opens directly with the project's payload.
+    With offline=True, plotly / Bootstrap / PapaParse are bundled next to it.
+    """
+    with open(template_path, "r", encoding="utf-8") as f:
+        html_text = f.read()
+
+    html_text = embed_payload(html_text, payload)
+    if offline:
+        html_text = bundle_assets(html_text, os.path.dirname(output_path) or ".", log_cb=log_cb)
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(html_text)
+    return output_path
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Optional
+
+
+class StageRecorder:
+    """
+    Lightweight per-stage instrumentation.
+
+    Records wall time, CPU time and an optional item count per stage; with
+    trace_memory=True also the peak tracemalloc memory (Python allocations
+    only, GEOS memory is not visible). Tracing slows allocation-heavy code
+    down, so it is opt-in.
+
+    Usage:
+        perf = StageRecorder()
+        with perf.stage("overlay") as rec:
+            rows = ...
+            rec["items"] = len(rows)
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name: str, items: Optional[int] = None):
+        record = {"stage": name, "items": items}
+
+        started_tracing = False
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            elif hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield record
+        finally:
+            record["wall_s"] = round(time.perf_counter() - wall_start, 4)
+            record["cpu_s"] = round(time.process_time() - cpu_start, 4)
+            record["peak_mem_mb"] = None
+            if self.trace_memory and tracemalloc.is_tracing():
+                record["peak_mem_mb"] = round(tracemalloc.get_traced_memory()[1] / 1024 ** 2, 2)
+            if started_tracing:
+                tracemalloc.stop()
+            self.stages.append(record)
+
+    def total_wall(self) -> float:
+        return round(sum(s["wall_s"] for s in self.stages), 4)
+
+    def total_cpu(self) -> float:
+        return round(sum(s["cpu_s"] for s in self.stages), 4)
+
+    def to_dict(self) -> dict:
+        return {
+            "total_wall_s": self.total_wall(),
+            "total_cpu_s": self.total_cpu(),
+            "stages": list(self.stages),
+        }
+
+    def as_text(self) -> str:
+        if not self.stages:
+            return "  (no stages recorded)"
+
+        lines = [
+            f"  {'Stage':<24} {'Wall [s]':>10} {'CPU [s]':>10} {'Peak [MB]':>10} {'Items':>10}"
+        ]
+        for s in self.stages:
+            peak = "-" if s["peak_mem_mb"] is None else f"{s['peak_mem_mb']:.2f}"
+            items = "-" if s["items"] is None else str(s["items"])
+            lines.append(
+                f"  {s['stage']:<24} {s['wall_s']:>10.3f} {s['cpu_s']:>10.3f} {peak:>10} {items:>10}"
+            )
+        lines.append(f"  {'Total':<24} {self.total_wall():>10.3f} {self.total_cpu():>10.3f}")
+        return "\n".join(lines)
+
+    def write_json(self, path: str, extra: Optional[dict] = None) -> str:
+        payload = self.to_dict()
+        if extra:
+            payload.update(extra)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False)
+        return path
+
+
+class HotspotRecorder:
+    """
+    Collects GEOS time per geometry-heavy item (plan feature, base category)
+    to find pathological digitizing.
+
+    kind: e.g. 'plan_feature', 'base_intersection', 'base_union'
+    key : plan fid or category value
+    """
+
+    TITLES = {
+        "plan_feature": "Plan features by GEOS time (intersection + difference)",
+        "base_intersection": "Base categories by intersection time",
+        "base_union": "Base categories by union time",
+    }
+
+    def __init__(self):
+        self.entries = {}
+
+    def add(self, kind: str, key, seconds: float, vertices: int = 0, label: Optional[str] = None) -> None:
+        entry = self.entries.get((kind, key))
+        if entry is None:
+            entry = {
+                "kind": kind,
+                "key": key,
+                "label": label or str(key),
+                "seconds": 0.0,
+                "vertices": 0,
+                "calls": 0,
+            }
+            self.entries[(kind, key)] = entry
+        entry["seconds"] += seconds
+        entry["vertices"] = max(entry["vertices"], int(vertices or 0))
+        entry["calls"] += 1
+
+    def top(self, kind: str, n: int = 20) -> list:
+        items = [e for e in self.entries.values() if e["kind"] == kind]
+        return sorted(items, key=lambda e: e["seconds"], reverse=True)[:n]
+
+    def as_text(self, n: int = 20) -> str:
+        lines = ["===== SLOWEST GEOMETRIES ====="]
+        for kind, title in self.TITLES.items():
+            top = self.top(kind, n)
+            if not top:
+                continue
+            lines.append("")
+            lines.append(f"Top {len(top)} {title}:")
+            lines.append(f"  {'Rank':>4} {'Seconds':>10} {'Vertices':>10} {'Calls':>7}  Item")
+            for rank, e in enumerate(top, start=1):
+                lines.append(
+                    f"  {rank:>4} {e['seconds']:>10.4f} {e['vertices']:>10} {e['calls']:>7}  {e['label']}"
+                )
+        lines.append("===== END SLOWEST GEOMETRIES =====")
+        return "\n".join(lines)
@@ -1,17 +1,34 @@
 # -*- coding: utf-8 -*-
 import os
 import re
+import time
 import datetime
 import traceback
+from typing import TYPE_CHECKING
 
-import pandas as pd
 from qgis.PyQt.QtCore import Qt
 from qgis.PyQt.QtWidgets import QAction, QMessageBox
 from qgis.PyQt.QtGui import QIcon
-from qgis.core import QgsProject
+from qgis.core import QgsApplication, QgsProject, QgsTask
 
 from .netto_null_bilanz_dialog import NettoNullBilanzDialog
-from . import script_core, plotting
+from .instrumentation import StageRecorder
+
+# pandas, plotly and the calculation modules are imported inside the methods
+# that need them, so loading the plugin at QGIS startup stays cheap.
+if TYPE_CHECKING:  # only for the "pd.DataFrame" annotations
+    import pandas as pd
+
+# balance values shown at the top of the HTML report
+REPORT_SUMMARY_KEYS = (
+    "Total planning area",
+    "Net Balance",
+    "Percentage",
+    "Final BFF Area",
+    "Final BFF Factor",
+    "Final BFF Percentage",
+    "Calculation time",
+)
 
 
 def sanitize_project_name(name: str) -> str:
@@ -29,25 +46,6 @@ def sanitize_project_name(name: str) -> str:
     return name
 
 
-def normalize_key(s: str) -> str:
-    """Normalization for matching layer values to CSV keys."""
-    if s is None:
-        return ""
-    s = str(s).strip()
-    if not s:
-        return ""
-    s = s.casefold()
-    s = (
-        s.replace("ä", "ae")
-         .replace("ö", "oe")
-         .replace("ü", "ue")
-         .replace("ß", "ss")
-    )
-    s = s.replace("-", "_")
-    s = re.sub(r"\s+", " ", s)
-    return s
-
-
 class NettoNullBilanz:
     """Main QGIS plugin class."""
 
@@ -56,6 +54,9 @@ class NettoNullBilanz:
         self.plugin_dir = os.path.dirname(__file__)
         self.action = None
         self.dlg = None
+        self._plot_task = None
+        # cancelled report tasks, referenced until the task manager finishes them
+        self._cancelled_plot_tasks = []
 
     # ------------------------------------------------------------------
     # QGIS integration
@@ -80,6 +81,9 @@ class NettoNullBilanz:
         if self.dlg is None:
             self.dlg = NettoNullBilanzDialog(self.plugin_dir)
             self.dlg.run_requested.connect(self._run_with_params)
+            self.dlg.reevaluate_requested.connect(self._reevaluate_with_params)
+            self.dlg.optimize_requested.connect(self._optimize_with_params)
+            self.dlg.compare_requested.connect(self._compare_with_params)
         self.dlg.show()
         self.dlg.raise_()
         self.dlg.activateWindow()
@@ -94,6 +98,119 @@ class NettoNullBilanz:
             return os.path.dirname(project_path), project_path
         return os.path.expanduser("~"), ""
 
+    def _start_plot_task(self, df: "pd.DataFrame", project_title: str, output_dir: str, summary: dict,
+                         report_extras: dict = None) -> None:
+        """
+        Build the HTML report in a background QgsTask; the result is appended
+        to the dialog log. A report task of an earlier run is cancelled.
+        """
+        from . import plotting
+
+        self._cancel_plot_task()
+
+        def build(task):
+            started = time.perf_counter()
+            path = plotting.write_report(
+                df, project_title, output_dir, summary=summary, is_canceled=task.isCanceled, **(report_extras or {})
+            )
+            if path is None:
+                return None
+            return path, time.perf_counter() - started
+
+        def finished(exception, result=None):
+            if self._plot_task is plot_task:
+                self._plot_task = None
+            if plot_task in self._cancelled_plot_tasks:
+                self._cancelled_plot_tasks.remove(plot_task)
+            if plot_task.isCanceled():
+                return
+            if exception is not None:
+                self.dlg.append_log(f"⚠ Plotting failed: {exception}")
+                return
+            if result is None:
+                return
+            path, seconds = result
+            self.dlg.append_log(f"📊 Report written ({seconds:.1f} s): {path}")
+
+        plot_task = QgsTask.fromFunction(
+            f"Blue-Green Balance: Diagramme ({project_title})", build, on_finished=finished
+        )
+        # keep a reference, otherwise the task is garbage collected while running
+        self._plot_task = plot_task
+        QgsApplication.taskManager().addTask(plot_task)
+
+    def _cancel_plot_task(self) -> None:
+        """Cancel a running report task (rerun, or the run that started it failed)."""
+        if self._plot_task is not None:
+            self._plot_task.cancel()
+            self._cancelled_plot_tasks.append(self._plot_task)
+            self._plot_task = None
+
+    def _output_paths(self, params: dict) -> dict:
+        project_title = sanitize_project_name(params.get("project_title") or "") or "UnnamedProject"
+        project_dir, project_path = self._project_dir()
+        output_dir = os.path.join(project_dir, f"Results_BlueGreenBalance__{project_title}")
+        return {
+            "project_title": project_title,
+            "project_path": project_path,
+            "output_dir": output_dir,
+            "output_csv_path": os.path.join(output_dir, f"{project_title}__bgig_balance.csv"),
+            "log_path": os.path.join(output_dir, f"{project_title}__bgig_log.txt"),
+            "perf_path": os.path.join(output_dir, f"{project_title}__bgig_performance.json"),
+        }
+
+    def _export_report_and_dashboard(self, df: "pd.DataFrame", results_info: dict, *, project_title: str,
+                                     output_dir: str, factors_csv: str, background_plots: bool,
+                                     perf, log_cb, report_extras: dict = None) -> list:
+        """
+        HTML report (unless already started in background) and dashboard export.
+        Failures are returned as warnings, the balance itself is already written.
+        """
+        from . import plotting, dashboard
+
+        warnings = []
+        if background_plots:
+            results_info["Report path"] = (
+                plotting.report_path(output_dir, project_title) + " (created in background)"
+            )
+        else:
+            try:
+                with perf.stage("plotting") as rec:
+                    report_summary = {k: results_info[k] for k in REPORT_SUMMARY_KEYS if k in results_info}
+                    results_info["Report path"] = plotting.write_report(
+                        df, project_title, output_dir, summary=report_summary, **(report_extras or {})
+                    )
+                    rec["items"] = len(df)
+            except Exception as pe:
+                warnings.append(f"Plotting failed: {pe}")
+                self.dlg.append_log(f"⚠ Plotting failed: {pe}")
+
+        try:
+            with perf.stage("dashboard") as rec:
+                payload = dashboard.build_dashboard_payload(
+                    df,
+                    factors_csv=factors_csv,
+                    project_title=project_title,
+                    summary={k: results_info[k] for k in REPORT_SUMMARY_KEYS if k in results_info},
+                    costs_csv=os.path.join(self.plugin_dir, "data", "costs.csv"),
+                )
+                results_info["Dashboard data path"] = dashboard.write_dashboard_payload(
+                    payload, os.path.join(output_dir, f"{project_title}__bgig_dashboard.json")
+                )
+                results_info["Dashboard path"] = dashboard.write_dashboard(
+                    os.path.join(self.plugin_dir, "Dashboard.html"),
+                    payload,
+                    os.path.join(output_dir, f"{project_title}__bgig_dashboard.html"),
+                    log_cb=log_cb,
+                )
+                rec["items"] = len(payload["transitions"]["before"])
+            self.dlg.append_log(f"Dashboard written to: {results_info['Dashboard path']}")
+        except Exception as de:
+            warnings.append(f"Dashboard export failed: {de}")
+            self.dlg.append_log(f"⚠ Dashboard export failed: {de}")
+
+        return warnings
+
     def _write_log(self, log_path: str, text: str, overwrite: bool = True) -> None:
         """Write Windows-Notepad friendly log (UTF-8 BOM + CRLF)."""
         mode = "w" if overwrite else "a"
@@ -106,11 +223,14 @@ class NettoNullBilanz:
         with open(log_path, mode=mode, encoding="utf-8-sig", newline="") as f:
             f.write(normalized)
 
-    def _format_used_factors(self, factors_csv: str, df: pd.DataFrame) -> str:
+    def _format_used_factors(self, factors_csv: str, df: "pd.DataFrame") -> str:
         """
         Build a log section with only the factor rows actually used
         in the calculation (Before/After categories from results df).
         """
+        import pandas as pd
+        from .script_core import normalize_key
+
         if df is None or df.empty:
             return "  (no result rows)\n"
 
@@ -130,19 +250,16 @@ class NettoNullBilanz:
             used_values = set()
 
             if "Before" in df.columns:
-                used_values.update(
-                    str(v).strip() for v in df["Before"].dropna().unique() if str(v).strip()
-                )
+                used_values.update(normalize_key(v) for v in df["Before"].dropna().unique())
             if "After" in df.columns:
-                used_values.update(
-                    str(v).strip() for v in df["After"].dropna().unique() if str(v).strip()
-                )
+                used_values.update(normalize_key(v) for v in df["After"].dropna().unique())
+            used_values.discard("")
 
             if not used_values:
                 return "  (no used categories found in result dataframe)\n"
 
             df_f["Description_norm"] = df_f["Description"].astype(str).str.strip()
-            df_used = df_f[df_f["Description_norm"].isin(used_values)].copy()
+            df_used = df_f[df_f["Description"].map(normalize_key).isin(used_values)].copy()
 
             if df_used.empty:
                 return "  (no matching factor rows found)\n"
@@ -161,7 +278,7 @@ class NettoNullBilanz:
                        base_layer_name, base_field_name, plan_layer_name, plan_field_name,
                        building_green_layer_name, building_green_field_name,
                        validation_text, warnings, status, results_info=None, error=None,
-                       used_factors_text=None) -> str:
+                       used_factors_text=None, performance_text=None) -> str:
         lines = []
         lines.append("========================================")
         lines.append("Blue-Green Infrastructure Balance – Log")
@@ -220,6 +337,13 @@ class NettoNullBilanz:
             lines.append(str(error))
             lines.append("")
 
+        if performance_text:
+            lines.append("----------------------------------------")
+            lines.append("Performance:")
+            lines.append("----------------------------------------")
+            lines.append(performance_text.rstrip())
+            lines.append("")
+
         if validation_text:
             lines.append("----------------------------------------")
             lines.append("Validation report:")
@@ -232,11 +356,24 @@ class NettoNullBilanz:
         return "\n".join(lines)
 
     def _validate_matching(self, *, base_layer_name, base_field_name, plan_layer_name, plan_field_name,
-                           factors_csv, project_title, building_green_layer_name=None, building_green_field_name=None):
+                           factors_csv, project_title, building_green_layer_name=None, building_green_field_name=None,
+                           fail_fast=False, phase_layer_names=None):
         """
-        Strict validation that all unique values in Base / Plan / (optional) Building-green
-        exist in the factors CSV column 'Description' (after normalization).
+        Strict validation that all unique values in Base / Plan / (optional) phase layers /
+        (optional) Building-green exist in the factors CSV column 'Description' (after
+        normalization). Phase layers use the plan field and must share the plan CRS.
+
+        Checks run cheapest first: factors CSV, layer/field existence, CRS compatibility,
+        then provider-side distinct values. With fail_fast=True the first layer with
+        missing values or a CRS mismatch aborts the validation; otherwise the full
+        report is collected.
+
+        Values are matched with script_core.normalize_key, the same rule the
+        calculation uses to look up factors.
         """
+        import pandas as pd
+        from .script_core import layer_distinct_values, missing_factor_values, normalize_key
+
         warnings = []
         lines = []
         lines.append(f"Projekt: {project_title}")
@@ -252,12 +389,14 @@ class NettoNullBilanz:
         if not {"Description", "BFF_2020"}.issubset(df_f.columns):
             raise ValueError("Factor CSV must contain columns: 'Description' and 'BFF_2020'")
 
-        csv_keys_raw = [str(x).strip() for x in df_f["Description"].dropna().tolist()]
-        csv_keys_norm = {normalize_key(x): x for x in csv_keys_raw if normalize_key(x)}
+        csv_keys_norm = {}
+        for x in df_f["Description"].dropna():
+            csv_keys_norm.setdefault(normalize_key(x), str(x).strip())
+        csv_keys_norm.pop("", None)
         if not csv_keys_norm:
             raise ValueError("Factors CSV contains no usable 'Description' values.")
 
-        def unique_values(layer_name: str, field_name: str):
+        def get_layer(layer_name: str, field_name: str):
             layer_list = QgsProject.instance().mapLayersByName(layer_name)
             if not layer_list:
                 raise ValueError(f"Layer not found: {layer_name}")
@@ -265,35 +404,33 @@ class NettoNullBilanz:
             field_names = [f.name() for f in lyr.fields()]
             if field_name not in field_names:
                 raise ValueError(f"Field '{field_name}' not found in layer '{layer_name}'. Available: {field_names}")
+            return lyr
 
-            vals = set()
-            for feat in lyr.getFeatures():
-                v = feat[field_name]
-                if v is None:
-                    continue
-                s = str(v).strip()
-                if s:
-                    vals.add(s)
-            return vals
-
-        base_vals = unique_values(base_layer_name, base_field_name)
-        plan_vals = unique_values(plan_layer_name, plan_field_name)
-
-        bg_vals = set()
         bg_used = bool(building_green_layer_name) and building_green_layer_name != "(None)"
-        if bg_used:
-            if not building_green_field_name:
-                raise ValueError("Building-green layer selected, but building-green field is empty.")
-            bg_vals = unique_values(building_green_layer_name, building_green_field_name)
+        if bg_used and not building_green_field_name:
+            raise ValueError("Building-green layer selected, but building-green field is empty.")
+
+        # layer / field existence
+        base_lyr = get_layer(base_layer_name, base_field_name)
+        plan_lyr = get_layer(plan_layer_name, plan_field_name)
+        bg_lyr = get_layer(building_green_layer_name, building_green_field_name) if bg_used else None
+
+        # CRS compatibility
+        crs_mismatch = base_lyr.crs() != plan_lyr.crs()
+        if crs_mismatch:
+            lines.append(
+                f"❌ CRS mismatch: base layer '{base_layer_name}' uses {base_lyr.crs().authid() or '(unknown)'}, "
+                f"plan layer '{plan_layer_name}' uses {plan_lyr.crs().authid() or '(unknown)'}. "
+                "Both layers must use the same projected CRS."
+            )
+            lines.append("")
+            if fail_fast:
+                raise ValueError("\n".join(lines))
+        if plan_lyr.crs().isGeographic():
+            warnings.append("Geographic CRS selected: areas are not in m². Use a projected CRS.")
 
-        base_missing = sorted([v for v in base_vals if normalize_key(v) not in csv_keys_norm])
-        plan_missing = sorted([v for v in plan_vals if normalize_key(v) not in csv_keys_norm])
-        bg_missing = sorted([v for v in bg_vals if normalize_key(v) not in csv_keys_norm]) if bg_used else []
-
-        all_layer_norms = {normalize_key(v) for v in (list(base_vals) + list(plan_vals) + list(bg_vals)) if normalize_key(v)}
-        unused = sorted([csv_keys_norm[k] for k in csv_keys_norm.keys() if k not in all_layer_norms])
-        if unused:
-            warnings.append(f"{len(unused)} CSV keys unused (present in CSV but not in selected layers).")
+        base_vals = layer_distinct_values(base_lyr, base_field_name)
+        base_missing = missing_factor_values(base_vals, csv_keys_norm)
 
         lines.append(f"Base layer '{base_layer_name}' / field '{base_field_name}': {len(base_vals)} unique values")
         if base_missing:
@@ -304,6 +441,12 @@ class NettoNullBilanz:
             lines.append("✅ All base layer values found in CSV factor table.")
         lines.append("")
 
+        if fail_fast and base_missing:
+            raise ValueError("\n".join(lines))
+
+        plan_vals = layer_distinct_values(plan_lyr, plan_field_name)
+        plan_missing = missing_factor_values(plan_vals, csv_keys_norm)
+
         lines.append(f"Plan layer '{plan_layer_name}' / field '{plan_field_name}': {len(plan_vals)} unique values")
         if plan_missing:
             lines.append("❌ Values from plan layer not found in CSV-factor table:")
@@ -313,6 +456,47 @@ class NettoNullBilanz:
             lines.append("✅ All plan layer values found in CSV factor table.")
         lines.append("")
 
+        if fail_fast and plan_missing:
+            raise ValueError("\n".join(lines))
+
+        phase_vals = set()
+        phase_failed = False
+        for phase_name in phase_layer_names or []:
+            phase_lyr = get_layer(phase_name, plan_field_name)
+            vals = layer_distinct_values(phase_lyr, plan_field_name)
+            missing = missing_factor_values(vals, csv_keys_norm)
+            phase_vals |= vals
+
+            lines.append(f"Phase layer '{phase_name}' / field '{plan_field_name}': {len(vals)} unique values")
+            if phase_lyr.crs() != plan_lyr.crs():
+                lines.append(
+                    f"❌ CRS mismatch: uses {phase_lyr.crs().authid() or '(unknown)'}, "
+                    f"plan layer uses {plan_lyr.crs().authid() or '(unknown)'}."
+                )
+                phase_failed = True
+            if missing:
+                lines.append("❌ Values from phase layer not found in CSV-factor table:")
+                for v in missing:
+                    lines.append(f"  - {v}")
+                phase_failed = True
+            elif phase_lyr.crs() == plan_lyr.crs():
+                lines.append("✅ All phase layer values found in CSV factor table.")
+            lines.append("")
+
+            if fail_fast and phase_failed:
+                raise ValueError("\n".join(lines))
+
+        bg_vals = layer_distinct_values(bg_lyr, building_green_field_name) if bg_used else set()
+        bg_missing = missing_factor_values(bg_vals, csv_keys_norm) if bg_used else []
+
+        all_layer_norms = {
+            normalize_key(v) for v in (list(base_vals) + list(plan_vals) + list(phase_vals) + list(bg_vals))
+            if normalize_key(v)
+        }
+        unused = sorted([csv_keys_norm[k] for k in csv_keys_norm.keys() if k not in all_layer_norms])
+        if unused:
+            warnings.append(f"{len(unused)} CSV keys unused (present in CSV but not in selected layers).")
+
         if bg_used:
             lines.append(f"Building-green layer '{building_green_layer_name}' / field '{building_green_field_name}': {len(bg_vals)} unique values")
             if bg_missing:
@@ -334,7 +518,7 @@ class NettoNullBilanz:
 
         report = "\n".join(lines)
 
-        if base_missing or plan_missing or bg_missing:
+        if crs_mismatch or base_missing or plan_missing or phase_failed or bg_missing:
             raise ValueError(report)
 
         return warnings, report
@@ -343,6 +527,8 @@ class NettoNullBilanz:
     # Main execution
     # ------------------------------------------------------------------
     def _run_with_params(self, params: dict):
+        from . import script_core
+
         # Start fresh in the dialog log area
         try:
             self.dlg.clear_log()
@@ -354,19 +540,34 @@ class NettoNullBilanz:
         plan_layer_name = params.get("plan_layer_name", "")
         plan_field_name = params.get("plan_field_name", "")
         max_allowed_overlap_area = float(params.get("max_allowed_overlap_area", 30.0))
+        atomic_export_format = params.get("atomic_export_format")
+        fail_fast = bool(params.get("fail_fast", True))
+        profile = bool(params.get("profile", False))
+        background_plots = bool(params.get("background_plots", True))
+        sensitivity_samples = int(params.get("sensitivity_samples", 0))
+        use_cache = bool(params.get("use_cache", True))
+        out_of_core = bool(params.get("out_of_core", False))
+        overlay_engine = params.get("overlay_engine") or "python"
         factors_csv = params.get("factors_csv", "")
         building_green = params.get("building_green", [])
         building_green_layer_name = params.get("building_green_layer_name")
         building_green_field_name = params.get("building_green_field_name")
-
-        project_title = sanitize_project_name(params.get("project_title") or "") or "UnnamedProject"
-
-        project_dir, project_path = self._project_dir()
-        output_dir = os.path.join(project_dir, f"Results_BlueGreenBalance__{project_title}")
+        zones_layer_name = params.get("zones_layer_name")
+        zones_field_name = params.get("zones_field_name")
+        phase_layer_names = params.get("phase_layer_names") or []
+
+        paths = self._output_paths(params)
+        project_title = paths["project_title"]
+        project_path = paths["project_path"]
+        output_dir = paths["output_dir"]
         os.makedirs(output_dir, exist_ok=True)
 
-        output_csv_path = os.path.join(output_dir, f"{project_title}__bgig_balance.csv")
-        log_path = os.path.join(output_dir, f"{project_title}__bgig_log.txt")
+        output_csv_path = paths["output_csv_path"]
+        log_path = paths["log_path"]
+        perf_path = paths["perf_path"]
+        # tracemalloc slows allocation-heavy stages noticeably, so memory is
+        # only traced together with the profiler
+        perf = StageRecorder(trace_memory=profile)
 
         if not base_layer_name or not base_field_name or not plan_layer_name or not plan_field_name:
             QMessageBox.warning(
@@ -383,16 +584,19 @@ class NettoNullBilanz:
         # Validation
         self.dlg.append_log("Validating inputs…")
         try:
-            warnings, validation_text = self._validate_matching(
-                base_layer_name=base_layer_name,
-                base_field_name=base_field_name,
-                plan_layer_name=plan_layer_name,
-                plan_field_name=plan_field_name,
-                factors_csv=factors_csv,
-                project_title=project_title,
-                building_green_layer_name=building_green_layer_name,
-                building_green_field_name=building_green_field_name,
-            )
+            with perf.stage("validation"):
+                warnings, validation_text = self._validate_matching(
+                    base_layer_name=base_layer_name,
+                    base_field_name=base_field_name,
+                    plan_layer_name=plan_layer_name,
+                    plan_field_name=plan_field_name,
+                    factors_csv=factors_csv,
+                    project_title=project_title,
+                    building_green_layer_name=building_green_layer_name,
+                    building_green_field_name=building_green_field_name,
+                    fail_fast=fail_fast,
+                    phase_layer_names=phase_layer_names,
+                )
             self.dlg.append_log("✅ Validation OK")
         except Exception as e:
             self.dlg.append_log("❌ Validation failed")
@@ -425,6 +629,7 @@ class NettoNullBilanz:
                 used_factors_text=None,
             )
             self._write_log(log_path, log_text, overwrite=True)
+            self._write_perf_json(perf, perf_path, project_title, "validation_failed", error=str(e))
             return
 
         # Run processing
@@ -433,6 +638,14 @@ class NettoNullBilanz:
             def log_cb(t: str):
                 self.dlg.append_log(t)
 
+            ready = {}
+
+            def on_results_ready(results_df, balance_summary, report_extras=None):
+                ready.update(report_extras or {})
+                if background_plots:
+                    # charts are built while CSV/GPKG are still being written
+                    self._start_plot_task(results_df, project_title, output_dir, balance_summary, report_extras)
+
             results_info, df = script_core.main(
                 base_layer_name=base_layer_name,
                 base_field_name=base_field_name,
@@ -443,18 +656,37 @@ class NettoNullBilanz:
                 building_green=building_green,
                 building_green_layer_name=building_green_layer_name,
                 building_green_field_name=building_green_field_name,
+                zones_layer_name=zones_layer_name,
+                zones_field_name=zones_field_name,
+                phase_layer_names=phase_layer_names,
                 max_allowed_overlap_area=max_allowed_overlap_area,
+                atomic_export_format=atomic_export_format,
+                fail_fast=fail_fast,
+                # fields, CRS and factor coverage were checked by _validate_matching
+                inputs_validated=True,
+                profile=profile,
+                sensitivity_samples=sensitivity_samples,
+                use_cache=use_cache,
+                out_of_core=out_of_core,
+                overlay_engine=overlay_engine,
                 log_cb=log_cb,
+                perf=perf,
+                results_ready_cb=on_results_ready,
             )
 
-            try:
-                plotting.waterfall(df, project_title, output_dir)
-                plotting.waterfall_short(df, project_title, output_dir)
-                plotting.sankey_plot(df, project_title, output_dir)
-            except Exception as pe:
-                warnings = warnings or []
-                warnings.append(f"Plotting failed: {pe}")
-                self.dlg.append_log(f"⚠ Plotting failed: {pe}")
+            export_warnings = self._export_report_and_dashboard(
+                df,
+                results_info,
+                project_title=project_title,
+                output_dir=output_dir,
+                factors_csv=factors_csv,
+                background_plots=background_plots,
+                perf=perf,
+                log_cb=log_cb,
+                report_extras=ready,
+            )
+            if export_warnings:
+                warnings = (warnings or []) + export_warnings
 
             self.dlg.append_log("")
             self.dlg.append_log("✅ Done.")
@@ -490,13 +722,17 @@ class NettoNullBilanz:
                 validation_text=validation_text,
                 warnings=warnings,
                 status="success",
-                results_info={**results_info, "total_balance_m2": total_balance},
+                results_info={**results_info, "total_balance_m2": total_balance, "Performance path": perf_path},
                 used_factors_text=used_factors_text,
+                performance_text=perf.as_text(),
             )
+            self._write_perf_json(perf, perf_path, project_title, "success")
             self._write_log(log_path, log_text, overwrite=True)
 
         except Exception as e:
             traceback.print_exc()
+            # the report task was started before the outputs were written
+            self._cancel_plot_task()
             self.dlg.append_log("❌ Error during processing")
             self.dlg.append_log(str(e))
             QMessageBox.critical(None, "Error", f"❌ {str(e)}")
@@ -518,8 +754,244 @@ class NettoNullBilanz:
                 status="failed",
                 error=str(e),
                 used_factors_text=None,
+                performance_text=perf.as_text(),
             )
             try:
                 self._write_log(log_path, log_text, overwrite=True)
             except Exception:
                 pass
+            self._write_perf_json(perf, perf_path, project_title, "failed", error=str(e))
+
+    def _write_perf_json(self, perf, perf_path: str, project_title: str, status: str, error: str = None):
+        """
+        Stage timings of the run, also for failed runs (the stages up to the
+        error). Never raises, so it cannot mask the run's own error.
+        """
+        extra = {"project": project_title, "status": status}
+        if error:
+            extra["error"] = error
+        try:
+            perf.write_json(perf_path, extra=extra)
+        except Exception:
+            traceback.print_exc()
+
+    def _reevaluate_with_params(self, params: dict):
+        """
+        Recompute the balance of the last run of this project with the current
+        factor table, from the cached transition matrix (no geometry work).
+        """
+        from . import script_core
+
+        try:
+            self.dlg.clear_log()
+        except Exception:
+            pass
+
+        paths = self._output_paths(params)
+        project_title = paths["project_title"]
+        output_dir = paths["output_dir"]
+        output_csv_path = paths["output_csv_path"]
+        factors_csv = params.get("factors_csv", "")
+        background_plots = bool(params.get("background_plots", True))
+        sensitivity_samples = int(params.get("sensitivity_samples", 0))
+        transitions_path = script_core.transitions_path_for(output_csv_path)
+        perf = StageRecorder()
+
+        if not os.path.exists(transitions_path):
+            QMessageBox.warning(
+                None,
+                "No cached run",
+                f"No transition cache found for project '{project_title}'.\n"
+                "Please run the full calculation once first.",
+            )
+            return
+
+        self.dlg.append_log(f"Projekt: {project_title}")
+        self.dlg.append_log("Re-evaluating factors…")
+        warnings = []
+        try:
+            def log_cb(t: str):
+                self.dlg.append_log(t)
+
+            ready = {}
+
+            def on_results_ready(results_df, balance_summary, report_extras=None):
+                ready.update(report_extras or {})
+                if background_plots:
+                    self._start_plot_task(results_df, project_title, output_dir, balance_summary, report_extras)
+
+            with perf.stage("reevaluate") as rec:
+                results_info, df = script_core.reevaluate_factors(
+                    transitions_path,
+                    factors_csv,
+                    output_csv_path,
+                    sensitivity_samples=sensitivity_samples,
+                    log_cb=log_cb,
+                    results_ready_cb=on_results_ready,
+                )
+                rec["items"] = len(df)
+
+            warnings = self._export_report_and_dashboard(
+                df,
+                results_info,
+                project_title=project_title,
+                output_dir=output_dir,
+                factors_csv=factors_csv,
+                background_plots=background_plots,
+                perf=perf,
+                log_cb=log_cb,
+                report_extras=ready,
+            )
+            self.dlg.append_log("")
+            self.dlg.append_log("✅ Done.")
+            status = "reevaluated"
+            error = None
+        except Exception as e:
+            traceback.print_exc()
+            self._cancel_plot_task()
+            self.dlg.append_log("❌ Error during re-evaluation")
+            self.dlg.append_log(str(e))
+            QMessageBox.critical(None, "Error", f"❌ {str(e)}")
+            results_info, df = None, None
+            status = "reevaluation_failed"
+            error = str(e)
+
+        log_text = self._make_log_text(
+            project_title=project_title,
+            project_path=paths["project_path"],
+            output_dir=output_dir,
+            output_csv_path=output_csv_path,
+            factors_csv=factors_csv,
+            base_layer_name=params.get("base_layer_name", ""),
+            base_field_name=params.get("base_field_name", ""),
+            plan_layer_name=params.get("plan_layer_name", ""),
+            plan_field_name=params.get("plan_field_name", ""),
+            building_green_layer_name=params.get("building_green_layer_name"),
+            building_green_field_name=params.get("building_green_field_name"),
+            validation_text="",
+            warnings=warnings,
+            status=status,
+            results_info=results_info,
+            error=error,
+            used_factors_text=self._format_used_factors(factors_csv, df) if df is not None else None,
+            performance_text=perf.as_text(),
+        )
+        try:
+            self._write_log(paths["log_path"], log_text, overwrite=True)
+        except Exception:
+            pass
+
+    def _optimize_with_params(self, params: dict):
+        """
+        Cheapest measures reaching the target, based on the cached transition
+        matrix of the last run; the proposal can be added to the measures table.
+        """
+        from . import script_core, optimizer
+
+        try:
+            self.dlg.clear_log()
+        except Exception:
+            pass
+
+        paths = self._output_paths(params)
+        project_title = paths["project_title"]
+        factors_csv = params.get("factors_csv", "")
+        transitions_path = script_core.transitions_path_for(paths["output_csv_path"])
+
+        if not os.path.exists(transitions_path):
+            QMessageBox.warning(
+                None,
+                "No cached run",
+                f"No transition cache found for project '{project_title}'.\n"
+                "Please run the full calculation once first.",
+            )
+            return
+
+        self.dlg.append_log(f"Projekt: {project_title}")
+        self.dlg.append_log("Optimizing measures…")
+        try:
+            results_df, transitions_df, meta = script_core.load_cached_balance(transitions_path, factors_csv)
+            result = optimizer.optimize_measures(
+                results_df,
+                factors_csv=factors_csv,
+                costs_csv=os.path.join(self.plugin_dir, "data", "costs.csv"),
+                total_planning_area=float(meta.get("total_planning_area") or 0.0),
+                target=params.get("optimize_target") or optimizer.TARGET_NET_BALANCE,
+                target_value=float(params.get("optimize_target_value", 0.0)),
+                variant=params.get("cost_variant") or "mittel",
+                transitions_df=transitions_df,
+            )
+        except Exception as e:
+            traceback.print_exc()
+            self.dlg.append_log("❌ Optimization failed")
+            self.dlg.append_log(str(e))
+            QMessageBox.critical(None, "Error", f"❌ {str(e)}")
+            return
+
+        for line in optimizer.optimization_lines(result):
+            self.dlg.append_log(line)
+
+        measures = result["measures"]
+        if measures.empty:
+            return
+
+        answer = QMessageBox.question(
+            None,
+            "Maßnahmen übernehmen",
+            f"{len(measures)} Maßnahme(n) für {result['total_cost']:.0f} € in die Tabelle übernehmen?\n"
+            "Anschließend die Berechnung erneut starten.",
+            QMessageBox.Yes | QMessageBox.No,
+        )
+        if answer == QMessageBox.Yes:
+            self.dlg.add_measure_rows(measures.to_dict(orient="records"))
+
+    def _compare_with_params(self, params: dict):
+        """
+        Differences between an earlier run (A, chosen in the dialog) and the
+        last run of this project (B), from their stored spatial change layers.
+        """
+        from . import compare_runs
+
+        try:
+            self.dlg.clear_log()
+        except Exception:
+            pass
+
+        paths = self._output_paths(params)
+        project_title = paths["project_title"]
+        gpkg_a = params.get("compare_with", "")
+        gpkg_b = os.path.splitext(paths["output_csv_path"])[0] + "_spatial_changes.gpkg"
+
+        if not os.path.exists(gpkg_b):
+            QMessageBox.warning(
+                None,
+                "No stored run",
+                f"No spatial change layer found for project '{project_title}'.\n"
+                "Please run the full calculation once first.",
+            )
+            return
+        if os.path.abspath(gpkg_a) == os.path.abspath(gpkg_b):
+            QMessageBox.warning(None, "Same run", "Please select the change layer of a different run.")
+            return
+
+        def log_cb(t: str):
+            self.dlg.append_log(t)
+
+        self.dlg.append_log(f"Projekt: {project_title}")
+        self.dlg.append_log("Comparing runs…")
+        try:
+            result = compare_runs.compare_runs(
+                gpkg_a,
+                gpkg_b,
+                os.path.join(paths["output_dir"], f"{project_title}__bgig_compare"),
+                log_cb=log_cb,
+            )
+        except Exception as e:
+            traceback.print_exc()
+            self.dlg.append_log("❌ Comparison failed")
+            self.dlg.append_log(str(e))
+            QMessageBox.critical(None, "Error", f"❌ {str(e)}")
+            return
+
+        self.dlg.append_log("✅ Done.")
+        self.iface.addVectorLayer(result["Changed areas path"], f"{project_title} – Änderungen", "ogr")
@@ -13,10 +13,19 @@ class NettoNullBilanzDialog(QtWidgets.QDialog):
     Key behavior:
       - Dialog stays open
       - Clicking "Run" emits run_requested(params: dict)
+      - Clicking "Faktoren neu bewerten" emits reevaluate_requested(params: dict)
+        (balance of the last run recomputed with the current factor table)
+      - Clicking "Maßnahmen optimieren" emits optimize_requested(params: dict);
+        proposed measures can be added to the building-green table via add_measure_rows()
+      - Clicking "Läufe vergleichen…" asks for the spatial change layer of an
+        earlier run and emits compare_requested(params: dict) with 'compare_with'
       - A log box at the bottom can be appended to via append_log()
     """
 
     run_requested = QtCore.pyqtSignal(dict)
+    reevaluate_requested = QtCore.pyqtSignal(dict)
+    optimize_requested = QtCore.pyqtSignal(dict)
+    compare_requested = QtCore.pyqtSignal(dict)
 
     def __init__(self, plugin_dir: str):
         super().__init__()
@@ -102,6 +111,17 @@ class NettoNullBilanzDialog(QtWidgets.QDialog):
         self.building_green_field_combo = QtWidgets.QComboBox()
         self.update_building_green_field_list()
 
+        # Optional zone layer + field (Baublöcke, Flurstücke, Bauabschnitte)
+        self.zones_layer_combo = QgsMapLayerComboBox()
+        self.zones_layer_combo.setProject(QgsProject.instance())
+        self.zones_layer_combo.setFilters(QgsMapLayerProxyModel.PolygonLayer)
+        self.zones_layer_combo.setAllowEmptyLayer(True)
+        self.zones_layer_combo.setCurrentIndex(-1)
+        self.zones_layer_combo.layerChanged.connect(self.update_zones_field_list)
+
+        self.zones_field_combo = QtWidgets.QComboBox()
+        self.update_zones_field_list()
+
         # Set defaults after initial population
         self._set_default_field(self.base_field_combo, "Flächentyp")
         self._set_default_field(self.plan_field_combo, "Flächentyp")
@@ -113,9 +133,37 @@ class NettoNullBilanzDialog(QtWidgets.QDialog):
         form_layout.addRow("After (field):", self.plan_field_combo)
         form_layout.addRow("Optional: Building Green (layer):", self.building_green_layer_combo)
         form_layout.addRow("Optional: Building Green (field):", self.building_green_field_combo)
+        form_layout.addRow("Optional: Zonen (layer):", self.zones_layer_combo)
+        form_layout.addRow("Optional: Zonen (field):", self.zones_field_combo)
 
         main_layout.addWidget(form_box)
 
+        # ============================================================
+        # === FURTHER PHASES (optional, in construction order) ===
+        # ============================================================
+        phases_box = QtWidgets.QGroupBox(
+            "Weitere Bauabschnitte (optional, in Reihenfolge; After-Layer = Abschnitt 1, gleiches Feld)"
+        )
+        phases_layout = QtWidgets.QGridLayout(phases_box)
+
+        self.phase_layer_combo = QgsMapLayerComboBox()
+        self.phase_layer_combo.setProject(QgsProject.instance())
+        self.phase_layer_combo.setFilters(QgsMapLayerProxyModel.PolygonLayer)
+
+        self.phase_list = QtWidgets.QListWidget()
+        self.phase_list.setMaximumHeight(70)
+
+        self.btn_add_phase = QtWidgets.QPushButton("Hinzufügen")
+        self.btn_remove_phase = QtWidgets.QPushButton("Entfernen")
+        self.btn_add_phase.clicked.connect(self.add_phase_layer)
+        self.btn_remove_phase.clicked.connect(self.remove_phase_layer)
+
+        phases_layout.addWidget(self.phase_layer_combo, 0, 0)
+        phases_layout.addWidget(self.btn_add_phase, 0, 1)
+        phases_layout.addWidget(self.btn_remove_phase, 0, 2)
+        phases_layout.addWidget(self.phase_list, 1, 0, 1, 3)
+        main_layout.addWidget(phases_box)
+
         # ============================================================
         # === BUILDING GREEN TABLE SECTION (manual rows) ===
         # ============================================================
@@ -172,17 +220,136 @@ class NettoNullBilanzDialog(QtWidgets.QDialog):
         overlap_layout.addWidget(self.maxOverlapAreaSpinBox)
 
         main_layout.addLayout(overlap_layout)
+
+        # ============================================================
+        # === OPTIONS ===
+        # ============================================================
+        options_box = QtWidgets.QGroupBox("Optionen")
+        options_layout = QtWidgets.QFormLayout(options_box)
+
+        self.atomic_export_combo = QtWidgets.QComboBox()
+        self.atomic_export_combo.addItem("(kein Export)", None)
+        self.atomic_export_combo.addItem("GeoParquet (.parquet)", "parquet")
+        self.atomic_export_combo.addItem("Feather / Arrow (.feather)", "feather")
+
+        options_layout.addRow("Atomare Änderungszeilen exportieren:", self.atomic_export_combo)
+
+        self.full_report_checkbox = QtWidgets.QCheckBox(
+            "Vollständigen Prüfbericht sammeln (kein Abbruch beim ersten Fehler)"
+        )
+        self.full_report_checkbox.setChecked(False)
+        options_layout.addRow("Validierung:", self.full_report_checkbox)
+
+        self.profile_checkbox = QtWidgets.QCheckBox(
+            "Profiling (cProfile + langsamste Geometrien protokollieren)"
+        )
+        self.profile_checkbox.setChecked(False)
+        options_layout.addRow("Diagnose:", self.profile_checkbox)
+
+        self.background_plots_checkbox = QtWidgets.QCheckBox(
+            "Im Hintergrund erstellen (Ergebnisse sofort verfügbar)"
+        )
+        self.background_plots_checkbox.setChecked(True)
+        options_layout.addRow("Diagramme:", self.background_plots_checkbox)
+
+        self.sensitivity_samples_spin = QtWidgets.QSpinBox()
+        self.sensitivity_samples_spin.setRange(0, 1_000_000)
+        self.sensitivity_samples_spin.setSingleStep(5000)
+        # off until the shipped factor table has BFF_2020_min / _max ranges
+        self.sensitivity_samples_spin.setValue(0)
+        self.sensitivity_samples_spin.setSuffix(" Stichproben")
+        self.sensitivity_samples_spin.setSpecialValueText("aus")
+        self.sensitivity_samples_spin.setToolTip(
+            "Monte-Carlo-Analyse der Faktorunsicherheit. Spannweiten aus den Spalten "
+            "BFF_2020_min / BFF_2020_max der Faktorentabelle; ohne diese Spalten wird sie übersprungen."
+        )
+        options_layout.addRow("Sensitivität:", self.sensitivity_samples_spin)
+
+        self.use_cache_checkbox = QtWidgets.QCheckBox(
+            "Ergebnisse bei unveränderten Eingaben wiederverwenden"
+        )
+        self.use_cache_checkbox.setChecked(True)
+        options_layout.addRow("Cache:", self.use_cache_checkbox)
+
+        self.out_of_core_checkbox = QtWidgets.QCheckBox(
+            "Große Layer fensterweise über den räumlichen Index der Datenquelle lesen"
+        )
+        self.out_of_core_checkbox.setToolTip(
+            "Für Layer, die nicht in den Arbeitsspeicher passen (GeoPackage, PostGIS). "
+            "Überschneidungsprüfung und Verschneidung lesen nur die Geometrien im jeweiligen Ausschnitt."
+        )
+        self.out_of_core_checkbox.setChecked(False)
+        options_layout.addRow("Speicher:", self.out_of_core_checkbox)
+
+        self.overlay_engine_combo = QtWidgets.QComboBox()
+        self.overlay_engine_combo.addItem("Python / GEOS", "python")
+        self.overlay_engine_combo.addItem("SpatiaLite-SQL (Bestand und Planung im selben GeoPackage)", "sql")
+        self.overlay_engine_combo.setToolTip(
+            "Liegen Bestands- und Planungslayer im selben GeoPackage, läuft die Verschneidung "
+            "als eine SQL-Abfrage in der Datenbank. Sonst wird automatisch Python verwendet."
+        )
+        options_layout.addRow("Verschneidung:", self.overlay_engine_combo)
+        main_layout.addWidget(options_box)
+
+        # ============================================================
+        # === MEASURE OPTIMIZATION (net-zero target solver) ===
+        # ============================================================
+        optimize_box = QtWidgets.QGroupBox("Maßnahmen-Optimierung (auf Basis des letzten Laufs)")
+        optimize_layout = QtWidgets.QHBoxLayout(optimize_box)
+
+        self.optimize_target_combo = QtWidgets.QComboBox()
+        self.optimize_target_combo.addItem("Netto-Bilanz ≥ (m²)", "net_balance")
+        self.optimize_target_combo.addItem("Finaler BFF-Faktor ≥", "final_bff_factor")
+
+        self.optimize_target_spin = QtWidgets.QDoubleSpinBox()
+        self.optimize_target_spin.setRange(-999999999.0, 999999999.0)
+        self.optimize_target_spin.setDecimals(4)
+        self.optimize_target_spin.setValue(0.0)
+
+        self.cost_variant_combo = QtWidgets.QComboBox()
+        self.cost_variant_combo.addItem("Kosten: billig", "billig")
+        self.cost_variant_combo.addItem("Kosten: mittel", "mittel")
+        self.cost_variant_combo.addItem("Kosten: teuer", "teuer")
+        self.cost_variant_combo.setCurrentIndex(1)
+
+        self.btn_optimize = QtWidgets.QPushButton("Maßnahmen optimieren")
+        self.btn_optimize.setToolTip(
+            "Günstigste Kombination von Maßnahmen (Gründach, Fassadengrün, Entsiegelung) "
+            "auf versiegelten Flächen und Dächern, die das Ziel erreicht."
+        )
+        self.btn_optimize.clicked.connect(self._on_optimize_clicked)
+
+        optimize_layout.addWidget(self.optimize_target_combo)
+        optimize_layout.addWidget(self.optimize_target_spin)
+        optimize_layout.addWidget(self.cost_variant_combo)
+        optimize_layout.addWidget(self.btn_optimize)
+        main_layout.addWidget(optimize_box)
+
         # ============================================================
         # === DIALOG BUTTONS (Run / Close) ===
         # ============================================================
         buttons = QtWidgets.QHBoxLayout()
         self.btn_run = QtWidgets.QPushButton("▶ Run")
+        self.btn_reevaluate = QtWidgets.QPushButton("↻ Faktoren neu bewerten")
+        self.btn_reevaluate.setToolTip(
+            "Bilanz des letzten Laufs dieses Projekts mit der aktuellen Faktorentabelle "
+            "neu berechnen (ohne Geometrieverschneidung)."
+        )
+        self.btn_compare = QtWidgets.QPushButton("Läufe vergleichen…")
+        self.btn_compare.setToolTip(
+            "Letzten Lauf dieses Projekts mit einem früheren Lauf (*_spatial_changes.gpkg) "
+            "vergleichen: Differenz je Planfläche, je Übergang und geänderte Flächen."
+        )
         self.btn_close = QtWidgets.QPushButton("Close")
 
         self.btn_run.clicked.connect(self._on_run_clicked)
+        self.btn_reevaluate.clicked.connect(self._on_reevaluate_clicked)
+        self.btn_compare.clicked.connect(self._on_compare_clicked)
         self.btn_close.clicked.connect(self.close)
 
         buttons.addStretch(1)
+        buttons.addWidget(self.btn_compare)
+        buttons.addWidget(self.btn_reevaluate)
         buttons.addWidget(self.btn_run)
         buttons.addWidget(self.btn_close)
         main_layout.addLayout(buttons)
@@ -310,6 +477,34 @@ class NettoNullBilanzDialog(QtWidgets.QDialog):
 
         self.building_green_field_combo.blockSignals(False)
 
+    def update_zones_field_list(self):
+        self.zones_field_combo.blockSignals(True)
+        current = self.zones_field_combo.currentText()
+        self.zones_field_combo.clear()
+
+        layer = self._current_layer(self.zones_layer_combo)
+        if layer:
+            for f in layer.fields():
+                self.zones_field_combo.addItem(f.name())
+
+        idx = self.zones_field_combo.findText(current)
+        if idx >= 0:
+            self.zones_field_combo.setCurrentIndex(idx)
+
+        self.zones_field_combo.blockSignals(False)
+
+    # ---------------------------------------------------------
+    # Phase list management
+    # ---------------------------------------------------------
+    def add_phase_layer(self):
+        layer = self._current_layer(self.phase_layer_combo)
+        if layer:
+            self.phase_list.addItem(layer.name())
+
+    def remove_phase_layer(self):
+        for item in self.phase_list.selectedItems():
+            self.phase_list.takeItem(self.phase_list.row(item))
+
     # ---------------------------------------------------------
     # Building-green table management
     # ---------------------------------------------------------
@@ -328,6 +523,15 @@ class NettoNullBilanzDialog(QtWidgets.QDialog):
         area_item = QtWidgets.QTableWidgetItem("0")
         self.green_table.setItem(row, 2, area_item)
 
+    def add_measure_rows(self, rows: list):
+        """Append rows {'Before', 'After', 'Area'} (e.g. optimizer results) to the table."""
+        for measure in rows:
+            self.add_green_row()
+            row = self.green_table.rowCount() - 1
+            self.green_table.cellWidget(row, 0).setCurrentText(str(measure["Before"]))
+            self.green_table.cellWidget(row, 1).setCurrentText(str(measure["After"]))
+            self.green_table.item(row, 2).setText(f"{float(measure['Area']):.1f}")
+
     def remove_green_row(self):
         for idx in sorted({i.row() for i in self.green_table.selectedIndexes()}, reverse=True):
             self.green_table.removeRow(idx)
@@ -339,6 +543,24 @@ class NettoNullBilanzDialog(QtWidgets.QDialog):
         params = self.get_parameters()
         self.run_requested.emit(params)
 
+    def _on_reevaluate_clicked(self):
+        params = self.get_parameters()
+        self.reevaluate_requested.emit(params)
+
+    def _on_optimize_clicked(self):
+        params = self.get_parameters()
+        self.optimize_requested.emit(params)
+
+    def _on_compare_clicked(self):
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self, "Select earlier run (spatial changes)", "", "GeoPackage (*_spatial_changes.gpkg *.gpkg)"
+        )
+        if not path:
+            return
+        params = self.get_parameters()
+        params["compare_with"] = path
+        self.compare_requested.emit(params)
+
     # ---------------------------------------------------------
     # Collect parameters
     # ---------------------------------------------------------
@@ -364,6 +586,7 @@ class NettoNullBilanzDialog(QtWidgets.QDialog):
         base_layer = self._current_layer(self.base_layer_combo)
         plan_layer = self._current_layer(self.plan_layer_combo)
         building_green_layer = self._current_layer(self.building_green_layer_combo)
+        zones_layer = self._current_layer(self.zones_layer_combo)
 
         return {
             "project_title": self.project_title_edit.text().strip(),
@@ -378,9 +601,23 @@ class NettoNullBilanzDialog(QtWidgets.QDialog):
             "building_green": building_green,
             "building_green_layer_name": building_green_layer.name() if building_green_layer else None,
             "building_green_field_name": self.building_green_field_combo.currentText(),
+            "zones_layer_name": zones_layer.name() if zones_layer else None,
+            "zones_field_name": self.zones_field_combo.currentText() or None,
+            "phase_layer_names": [self.phase_list.item(i).text() for i in range(self.phase_list.count())],
             "factors_csv": self._factors_csv_path,
 
             "max_allowed_overlap_area": self.maxOverlapAreaSpinBox.value(),
+            "atomic_export_format": self.atomic_export_combo.currentData(),
+            "fail_fast": not self.full_report_checkbox.isChecked(),
+            "profile": self.profile_checkbox.isChecked(),
+            "background_plots": self.background_plots_checkbox.isChecked(),
+            "sensitivity_samples": self.sensitivity_samples_spin.value(),
+            "use_cache": self.use_cache_checkbox.isChecked(),
+            "out_of_core": self.out_of_core_checkbox.isChecked(),
+            "overlay_engine": self.overlay_engine_combo.currentData(),
+            "optimize_target": self.optimize_target_combo.currentData(),
+            "optimize_target_value": self.optimize_target_spin.value(),
+            "cost_variant": self.cost_variant_combo.currentData(),
             
             # optional robuster für spätere Weiterentwicklung
             "base_layer": base_layer,
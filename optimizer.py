@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+"""
+Cheapest combination of measures (green roofs, facade green, unsealing)
+that reaches a target net balance or Final BFF factor.
+
+Each m² of an area pool (sealed surface or an existing roof category in the
+results) can receive at most one measure. With cost c_j and gain g_j per m²
+this is the LP relaxation of a multiple-choice knapsack:
+
+    min  sum c_j x_j
+    s.t. sum g_j x_j          >= required gain
+         sum_{j in pool} x_j  <= pool area
+         x_j >= 0
+
+It is solved exactly with the classic greedy: per pool the measures on the
+lower convex hull of (gain, cost) become incremental upgrade steps, which
+are taken across all pools in order of cost per gained m².
+
+Gains follow how script_core books manual measure rows (Before = pool,
+After = measure): the net balance gains (f_after - f_before) per m², the
+Final BFF area gains f_after per m².
+
+Categories of results, factors and costs are matched with
+script_core.normalize_key, the rule of the balance and its validation.
+"""
+import math
+from typing import Optional
+
+import pandas as pd
+
+try:
+    from .dashboard import COST_VARIANTS, load_cost_table
+    from .script_core import normalize_key
+except ImportError:  # standalone use (benchmarks, console)
+    from dashboard import COST_VARIANTS, load_cost_table
+    from script_core import normalize_key
+
+
+SEALED = "Versiegelte Belagsfläche"
+
+# area pool (After category in the results) -> possible measures on it;
+# None means every category with costs in costs.csv
+MEASURE_POOLS = {
+    SEALED: None,
+    "Gründach (extensiv)": ("Gründach (einfach-intensiv)", "Gründach (intensiv)"),
+    "Gründach (einfach-intensiv)": ("Gründach (intensiv)",),
+}
+
+# transition sources (script_core transition cache) that are measures on
+# existing surfaces and therefore already use pool area
+MEASURE_SOURCES = ("manual", "building_green_layer")
+
+TARGET_NET_BALANCE = "net_balance"
+TARGET_FINAL_FACTOR = "final_bff_factor"
+
+
+# ============================================================
+# INPUTS
+# ============================================================
+def used_pool_areas(transitions_df: Optional[pd.DataFrame]) -> dict:
+    """
+    Pool area already covered by measure rows of the cached run, keyed by
+    normalize_key(Before).
+    """
+    if transitions_df is None or transitions_df.empty or "Source" not in transitions_df.columns:
+        return {}
+    measures = transitions_df[transitions_df["Source"].isin(MEASURE_SOURCES)]
+    return measures.groupby(measures["Before"].map(normalize_key))["Area"].sum().to_dict()
+
+
+def pool_areas(results_df: pd.DataFrame, used: Optional[dict] = None) -> dict:
+    """
+    Available area per pool (MEASURE_POOLS name): planned (After) area of
+    the pool categories minus the area already used by measures
+    (used_pool_areas).
+    """
+    if results_df.empty:
+        return {}
+    used = used or {}
+    areas = results_df.groupby(results_df["After"].map(normalize_key))["Area"].sum()
+
+    pools = {}
+    for pool in MEASURE_POOLS:
+        key = normalize_key(pool)
+        available = float(areas.get(key, 0.0)) - float(used.get(key, 0.0))
+        if available > 0:
+            pools[pool] = available
+    return pools
+
+
+def build_measures(
+    factors: dict,
+    costs: dict,
+    pools: dict,
+    variant: str,
+    target: str,
+    descriptions: Optional[dict] = None,
+) -> list:
+    """
+    One candidate per (pool, measure) with cost and gain per m².
+
+    factors and costs are keyed by normalize_key; After is reported as the
+    factor table Description (descriptions: key -> Description).
+    """
+    descriptions = descriptions or {}
+    measures = []
+    for pool in pools:
+        pool_key = normalize_key(pool)
+        targets = MEASURE_POOLS[pool] or tuple(costs)
+        for after in targets:
+            key = normalize_key(after)
+            if key == pool_key or key not in costs or key not in factors:
+                continue
+            gain = factors[key] if target == TARGET_FINAL_FACTOR else factors[key] - factors.get(pool_key, 0.0)
+            cost = costs[key][variant]
+            if gain <= 0:
+                continue
+            measures.append({"Before": pool, "After": descriptions.get(key, after), "cost": cost, "gain": gain})
+    return measures
+
+
+# ============================================================
+# SOLVER
+# ============================================================
+def _hull_steps(measures: list) -> list:
+    """
+    Lower convex hull of (gain, cost) from (0, 0) as incremental steps
+    (from, to, d_gain, d_cost), ordered by increasing cost per gain.
+    """
+    points = sorted(measures, key=lambda m: (m["gain"], m["cost"]))
+    hull = [{"gain": 0.0, "cost": 0.0}]
+    for m in points:
+        if m["gain"] <= hull[-1]["gain"]:
+            continue
+        while len(hull) >= 2:
+            a, b = hull[-2], hull[-1]
+            # drop b if it lies on or above the segment a -> m
+            cross = (b["gain"] - a["gain"]) * (m["cost"] - a["cost"]) - (b["cost"] - a["cost"]) * (m["gain"] - a["gain"])
+            if cross <= 0:
+                hull.pop()
+            else:
+                break
+        hull.append(m)
+
+    steps = []
+    for prev, cur in zip(hull, hull[1:]):
+        steps.append((prev if prev.get("After") else None, cur, cur["gain"] - prev["gain"], cur["cost"] - prev["cost"]))
+    return steps
+
+
+def solve_measures(measures: list, pools: dict, required_gain: float) -> tuple:
+    """
+    Returns ({(pool, after): area}, achieved gain). If the pools cannot
+    deliver required_gain the maximum possible gain is returned.
+    """
+    steps = []
+    for pool, area in pools.items():
+        for step in _hull_steps([m for m in measures if m["Before"] == pool]):
+            steps.append((pool, area) + step)
+    steps.sort(key=lambda s: s[5] / s[4])
+
+    # area per pool currently assigned to each measure
+    assigned = {}
+    achieved = 0.0
+    for pool, area, prev, cur, d_gain, d_cost in steps:
+        if achieved >= required_gain:
+            break
+        share = min(1.0, (required_gain - achieved) / (d_gain * area))
+        # upgrading the same m² from prev to cur, so the hull order keeps prev fully assigned
+        moved = share * area
+        if prev is not None:
+            key_prev = (pool, prev["After"])
+            assigned[key_prev] = assigned.get(key_prev, 0.0) - moved
+        key = (pool, cur["After"])
+        assigned[key] = assigned.get(key, 0.0) + moved
+        achieved += d_gain * moved
+
+    return {k: v for k, v in assigned.items() if v > 1e-9}, achieved
+
+
+def optimize_measures(
+    results_df: pd.DataFrame,
+    factors_csv: str,
+    costs_csv: str,
+    total_planning_area: float,
+    target: str = TARGET_NET_BALANCE,
+    target_value: float = 0.0,
+    variant: str = "mittel",
+    transitions_df: Optional[pd.DataFrame] = None,
+) -> dict:
+    """
+    results_df: aggregated balance (script_core.aggregate_change_rows).
+    target: TARGET_NET_BALANCE (m²) or TARGET_FINAL_FACTOR (0..1).
+    transitions_df: optional cached transition rows (with Source) to
+    exclude pool area already used by measures.
+
+    Returns a dict with the measure table (Before, After, Area, Cost,
+    BFF_Area), total cost, required / achieved gain and feasibility.
+    """
+    if variant not in COST_VARIANTS:
+        raise ValueError(f"Unknown cost variant '{variant}', expected one of {', '.join(COST_VARIANTS)}")
+    if target not in (TARGET_NET_BALANCE, TARGET_FINAL_FACTOR):
+        raise ValueError(f"Unknown optimization target '{target}'")
+
+    df_factors = pd.read_csv(factors_csv, sep=";")
+    df_factors.columns = [c.strip() for c in df_factors.columns]
+    # first row per key wins, like script_core._factors_by_key
+    factors, descriptions = {}, {}
+    for description, value in zip(
+        df_factors["Description"].astype(str).str.strip(),
+        pd.to_numeric(df_factors["BFF_2020"], errors="coerce").fillna(0.0).astype(float),
+    ):
+        key = normalize_key(description)
+        if key and key not in factors:
+            factors[key] = value
+            descriptions[key] = description
+
+    costs = {}
+    for row in load_cost_table(costs_csv):
+        costs.setdefault(
+            normalize_key(row["beschreibung"]), dict(zip(COST_VARIANTS, (row[v] for v in COST_VARIANTS)))
+        )
+
+    if target == TARGET_FINAL_FACTOR:
+        if total_planning_area <= 0:
+            raise ValueError("Final BFF factor target requires a positive planning area")
+        current = float(results_df["Final_BFF_Area"].sum())
+        required = target_value * total_planning_area - current
+    else:
+        current = float(results_df["BFF_Area"].sum())
+        required = target_value - current
+
+    pools = pool_areas(results_df, used_pool_areas(transitions_df))
+    measures = build_measures(factors, costs, pools, variant, target, descriptions=descriptions)
+
+    if required <= 0:
+        assigned, achieved = {}, 0.0
+    else:
+        assigned, achieved = solve_measures(measures, pools, required)
+
+    by_key = {(m["Before"], m["After"]): m for m in measures}
+    rows = []
+    for (pool, after), area in assigned.items():
+        m = by_key[(pool, after)]
+        # round up to full 0.1 m², so the target is still reached after rounding
+        area = math.ceil(area * 10 - 1e-6) / 10
+        rows.append({
+            "Before": pool,
+            "After": after,
+            "Area": area,
+            "Cost": round(area * m["cost"], 2),
+            "BFF_Area": round(area * m["gain"], 2),
+        })
+    df_measures = pd.DataFrame(rows, columns=["Before", "After", "Area", "Cost", "BFF_Area"])
+
+    return {
+        "target": target,
+        "target_value": target_value,
+        "variant": variant,
+        "current": current,
+        "required_gain": max(0.0, required),
+        "achieved_gain": float(df_measures["BFF_Area"].sum()) if rows else 0.0,
+        "feasible": required <= 0 or achieved >= required - 1e-6,
+        "pools": pools,
+        "measures": df_measures,
+        "total_cost": float(df_measures["Cost"].sum()) if rows else 0.0,
+    }
+
+
+# ============================================================
+# REPORTING
+# ============================================================
+def optimization_lines(result: dict) -> list:
+    if result["target"] == TARGET_FINAL_FACTOR:
+        target_text = f"Final BFF Factor >= {result['target_value']:.4f}"
+    else:
+        target_text = f"Net Balance >= {result['target_value']:.2f} m²"
+
+    lines = [
+        "===== MEASURE OPTIMIZATION =====",
+        f"Target              : {target_text}",
+        f"Cost variant        : {result['variant']}",
+        f"Required gain       : {result['required_gain']:.2f} m²",
+    ]
+    for pool, area in result["pools"].items():
+        lines.append(f"Available ({pool}): {area:.2f} m²")
+
+    if result["required_gain"] <= 0:
+        lines.append("Target already reached, no measures needed.")
+        lines.append("")
+        return lines
+
+    if not result["feasible"]:
+        lines.append("⚠ Target not reachable with the available areas, showing the maximum possible.")
+
+    for row in result["measures"].itertuples(index=False):
+        lines.append(
+            f"  {row.Before} -> {row.After}: {row.Area:.1f} m² "
+            f"(+{row.BFF_Area:.2f} m² BFF, {row.Cost:.0f} €)"
+        )
+    lines.append(f"Achieved gain       : {result['achieved_gain']:.2f} m²")
+    lines.append(f"Total cost          : {result['total_cost']:.0f} €")
+    lines.append("")
+    return lines
@@ -1,7 +1,9 @@
+import html
 import os
 import pandas as pd
 import plotly
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 
 
 # ============================================================
@@ -99,6 +101,77 @@ def build_transition_label(before, after):
     return f"{short_label(before)} → {short_label(after)}"
 
 
+# ============================================================
+# VECTORIZED LABELS (column operations instead of apply/iterrows)
+# ============================================================
+OTHER_LABEL = "Other"
+
+
+def short_labels(series):
+    series = series.astype(str)
+    return series.map(SHORT_LABELS).fillna(series)
+
+
+def factor_columns(df):
+    """
+    Before/after factors per row: from the balance columns Factor_before /
+    Factor_after if present, otherwise from FACTOR_LABELS.
+    """
+    if "Factor_before" in df.columns and "Factor_after" in df.columns:
+        before = pd.to_numeric(df["Factor_before"], errors="coerce")
+        after = pd.to_numeric(df["Factor_after"], errors="coerce")
+    else:
+        before = df["Before"].map(FACTOR_LABELS)
+        after = df["After"].map(FACTOR_LABELS)
+
+    # bucketed rows mix several factors
+    if OTHER_LABEL in set(df["Before"]):
+        other = df["Before"] == OTHER_LABEL
+        before = before.mask(other)
+        after = after.mask(other)
+    return before.astype(float), after.astype(float)
+
+
+def format_numbers(series, decimals=2, missing="?"):
+    text = series.round(decimals).map(("{:." + str(decimals) + "f}").format)
+    return text.where(series.notna(), missing)
+
+
+def format_factors(series):
+    # like factor_label(): shortest representation, '?' for unknown factors
+    text = series.round(3).astype(str).str.replace(r"\.0$", "", regex=True)
+    return text.where(series.notna(), "?")
+
+
+def unique_label_series(series):
+    """Vectorized unique_labels(): repeated labels get a ' ·n' suffix."""
+    occurrence = series.groupby(series).cumcount() + 1
+    return series.where(occurrence == 1, series + " ·" + occurrence.astype(str))
+
+
+def bucket_transitions(df, top_n, value_col="BFF_Area"):
+    """
+    Keeps the top_n transitions by abs(value_col) and sums the rest into one
+    'Other' row (Before = After = 'Other'). top_n=None keeps all rows.
+    """
+    if top_n is None or top_n <= 0 or len(df) <= top_n:
+        return df, 0
+
+    order = df[value_col].abs().sort_values(ascending=False).index
+    top = df.loc[order[:top_n]]
+    rest = df.loc[order[top_n:]]
+
+    numeric_cols = [c for c in rest.columns if c not in ("Before", "After") and pd.api.types.is_numeric_dtype(rest[c])]
+    other = {c: rest[c].sum() for c in numeric_cols}
+    other["Before"] = OTHER_LABEL
+    other["After"] = OTHER_LABEL
+    for c in ("Factor_before", "Factor_after", "DeltaFactor"):
+        if c in other:
+            other[c] = float("nan")
+
+    return pd.concat([top, pd.DataFrame([other])], ignore_index=True), len(rest)
+
+
 def apply_layout(fig, title, xaxis_title="", yaxis_title="", height=760):
     fig.update_layout(
         title=dict(
@@ -149,12 +222,45 @@ def apply_layout(fig, title, xaxis_title="", yaxis_title="", height=760):
     )
 
 
+# ============================================================
+# OUTPUT
+# ============================================================
+PLOTLYJS_FILENAME = "plotly.min.js"
+
+
+def ensure_plotlyjs(output_dir):
+    """
+    Writes plotly.js once into output_dir so all HTML files can share it.
+    """
+    path = os.path.join(output_dir, PLOTLYJS_FILENAME)
+    if not os.path.exists(path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(plotly.offline.get_plotlyjs())
+    return path
+
+
+def plotlyjs_version():
+    """Version of the plotly.js bundled with the installed plotly package."""
+    try:
+        return plotly.offline.get_plotlyjs_version()
+    except Exception:
+        return None
+
+
+def write_figure(fig, filename):
+    # references the shared plotly.min.js instead of embedding ~3.5 MB per file
+    ensure_plotlyjs(os.path.dirname(filename) or ".")
+    fig.write_html(filename, include_plotlyjs=PLOTLYJS_FILENAME, auto_open=False)
+    return filename
+
+
 # ============================================================
 # WATERFALL
 # ============================================================
-def waterfall(df, project_title, output_dir, min_share_of_max=0.01):
+def build_waterfall_figure(df, project_title, min_share_of_max=0.01, top_n=None):
     """
-    Waterfall plot with optional filtering of very small contributions.
+    Waterfall figure with optional filtering of very small contributions.
+    Returns None if there is nothing to plot.
 
     Parameters
     ----------
@@ -163,12 +269,15 @@ def waterfall(df, project_title, output_dir, min_share_of_max=0.01):
         Example: 0.02 means all transitions with abs(BFF_Area) < 0.2% of the
         maximum absolute contribution are hidden.
         Final Balance still uses the full unfiltered dataset.
+    top_n : int or None
+        Show only the top_n largest transitions; the rest is summed into
+        one 'Other' bar.
     """
     df = df[df["BFF_Area"] != 0].copy()
 
     if df.empty:
         print("No non-zero values for waterfall plot.")
-        return
+        return None
 
     # sort once for reference
     df = df.reindex(df["BFF_Area"].abs().sort_values(ascending=False).index).reset_index(drop=True)
@@ -199,24 +308,27 @@ def waterfall(df, project_title, output_dir, min_share_of_max=0.01):
 
     if df_display.empty:
         print("All display values were filtered out in waterfall plot.")
-        return
+        return None
+
+    df_display, bucketed_count = bucket_transitions(df_display, top_n)
+    is_other = df_display["Before"] == OTHER_LABEL
 
     # compact x labels
-    df_display["XBase"] = df_display.apply(
-        lambda r: build_transition_label(r["Before"], r["After"]),
-        axis=1
-    )
-    df_display["XLabel"] = unique_labels(df_display["XBase"].tolist())
+    df_display["XBase"] = short_labels(df_display["Before"]) + " → " + short_labels(df_display["After"])
+    df_display.loc[is_other, "XBase"] = f"{OTHER_LABEL} ({bucketed_count} transitions)"
+    df_display["XLabel"] = unique_label_series(df_display["XBase"])
 
     # full hover
-    df_display["HoverLabel"] = df_display.apply(
-        lambda r: (
-            f"<b>{r['Before']} → {r['After']}</b><br>"
-            f"Before factor: {factor_label(r['Before'])}<br>"
-            f"After factor: {factor_label(r['After'])}<br>"
-            f"Balance contribution: {r['BFF_Area']:.1f}"
-        ),
-        axis=1
+    factor_before, factor_after = factor_columns(df_display)
+    df_display["HoverLabel"] = (
+        "<b>" + df_display["Before"].astype(str) + " → " + df_display["After"].astype(str) + "</b><br>"
+        + "Before factor: " + format_factors(factor_before) + "<br>"
+        + "After factor: " + format_factors(factor_after) + "<br>"
+        + "Balance contribution: " + format_numbers(df_display["BFF_Area"], 1)
+    )
+    df_display.loc[is_other, "HoverLabel"] = (
+        f"<b>{bucketed_count} smaller transitions</b><br>"
+        + "Balance contribution: " + format_numbers(df_display.loc[is_other, "BFF_Area"], 1)
     )
 
     df_total = pd.DataFrame({
@@ -248,7 +360,7 @@ def waterfall(df, project_title, output_dir, min_share_of_max=0.01):
         increasing={"marker": {"color": COLORS["pos"]}},
         decreasing={"marker": {"color": COLORS["neg"]}},
         totals={"marker": {"color": total_color}},
-        text=[f"{v:.1f}" for v in df_plot["BFF_Area"]],
+        text=format_numbers(df_plot["BFF_Area"], 1),
         textposition="outside",
         textfont=dict(size=11, color=COLORS["text"]),
         customdata=df_plot["HoverLabel"],
@@ -322,18 +434,22 @@ def waterfall(df, project_title, output_dir, min_share_of_max=0.01):
             borderpad=6
         )
 
+    return fig
+
+
+def waterfall(df, project_title, output_dir, min_share_of_max=0.01, top_n=None):
+    fig = build_waterfall_figure(df, project_title, min_share_of_max=min_share_of_max, top_n=top_n)
+    if fig is None:
+        return None
+
     print("Plotting Waterfall Diagram.")
-    plotly.offline.plot(
-        fig,
-        filename=os.path.join(output_dir, "plot_waterfall_" + project_title + ".html"),
-        auto_open=False
-    )
+    return write_figure(fig, os.path.join(output_dir, "plot_waterfall_" + project_title + ".html"))
 
 
 # ============================================================
 # WATERFALL SHORT
 # ============================================================
-def waterfall_short(df, project_title, output_dir):
+def build_waterfall_short_figure(df, project_title):
     df = df[df["BFF_Area"] != 0].copy()
 
     positive = df.loc[df["BFF_Area"] > 0, "BFF_Area"].sum()
@@ -397,34 +513,46 @@ def waterfall_short(df, project_title, output_dir):
 
     fig.update_xaxes(tickangle=0)
 
+    return fig
+
+
+def waterfall_short(df, project_title, output_dir):
+    fig = build_waterfall_short_figure(df, project_title)
+
     print("Plotting Short Waterfall Diagram.")
-    plotly.offline.plot(
-        fig,
-        filename=os.path.join(output_dir, "plot_waterfall_short_" + project_title + ".html"),
-        auto_open=False
-    )
+    return write_figure(fig, os.path.join(output_dir, "plot_waterfall_short_" + project_title + ".html"))
 
 
 # ============================================================
 # SANKEY
 # ============================================================
-def sankey_plot(df, project_title, output_dir):
+def build_sankey_figure(df, project_title, top_n=None):
+    """
+    Sankey of Before → After transitions. With top_n, only the top_n largest
+    links are drawn; the rest is summed into one 'Other' link.
+    """
     df = df[df["BFF_Area"] != 0].copy()
 
-    # group transitions
-    df_grouped = (
-        df.groupby(["Before", "After"], as_index=False)["BFF_Area"]
-        .sum()
-    )
+    # group transitions (factors are unique per Before / After)
+    agg = {"BFF_Area": "sum"}
+    for c in ("Factor_before", "Factor_after"):
+        if c in df.columns:
+            agg[c] = "first"
+    df_grouped = df.groupby(["Before", "After"], as_index=False).agg(agg)
+    df_grouped, bucketed_count = bucket_transitions(df_grouped, top_n)
 
     # Sankey values as positive magnitudes
     df_grouped["Flow_Area"] = df_grouped["BFF_Area"].abs()
 
     # factors
-    df_grouped["BeforeScore"] = df_grouped["Before"].map(FACTOR_LABELS)
-    df_grouped["AfterScore"] = df_grouped["After"].map(FACTOR_LABELS)
+    df_grouped["BeforeScore"], df_grouped["AfterScore"] = factor_columns(df_grouped)
     df_grouped["DeltaScore"] = df_grouped["AfterScore"] - df_grouped["BeforeScore"]
 
+    # separate 'Other' nodes on both sides, otherwise the bucket is a self-loop
+    is_other = df_grouped["Before"] == OTHER_LABEL
+    df_grouped.loc[is_other, "Before"] = f"{OTHER_LABEL} ({bucketed_count} transitions)"
+    df_grouped.loc[is_other, "After"] = f"{OTHER_LABEL} "
+
     green_categories = {
         "Vegetationsfläche (hohes Grünvolumen)",
         "Vegetationsfläche (mittleres Grünvolumen)",
@@ -450,36 +578,22 @@ def sankey_plot(df, project_title, output_dir):
             return COLORS["node_grey"]
         return COLORS["node_blue"]
 
-    def link_color(delta):
-        if pd.isna(delta):
-            return COLORS["link_unknown"]
-        elif delta > 0:
-            return COLORS["link_pos"]
-        elif delta < 0:
-            return COLORS["link_neg"]
-        else:
-            return COLORS["link_neutral"]
-
-    df_grouped["LinkColor"] = df_grouped["DeltaScore"].apply(link_color)
+    delta = df_grouped["DeltaScore"]
+    df_grouped["LinkColor"] = COLORS["link_neutral"]
+    df_grouped.loc[delta > 0, "LinkColor"] = COLORS["link_pos"]
+    df_grouped.loc[delta < 0, "LinkColor"] = COLORS["link_neg"]
+    df_grouped.loc[delta.isna(), "LinkColor"] = COLORS["link_unknown"]
 
-    labels = list(pd.concat([df_grouped["Before"], df_grouped["After"]]).unique())
-    label_to_index = {label: i for i, label in enumerate(labels)}
+    labels = pd.Index(pd.concat([df_grouped["Before"], df_grouped["After"]]).unique())
     node_colors = [node_color(label) for label in labels]
-    short_labels = [short_label(l) for l in labels]
-
-    hover_text = []
-    for _, row in df_grouped.iterrows():
-        before_score = "?" if pd.isna(row["BeforeScore"]) else f"{row['BeforeScore']:.2f}"
-        after_score = "?" if pd.isna(row["AfterScore"]) else f"{row['AfterScore']:.2f}"
-        delta_score = "?" if pd.isna(row["DeltaScore"]) else f"{row['DeltaScore']:.2f}"
-
-        hover_text.append(
-            f"<b>{row['Before']} → {row['After']}</b><br>"
-            f"Area: {row['Flow_Area']:.1f}<br>"
-            f"Before factor: {before_score}<br>"
-            f"After factor: {after_score}<br>"
-            f"Delta: {delta_score}"
-        )
+
+    hover_text = (
+        "<b>" + df_grouped["Before"].astype(str) + " → " + df_grouped["After"].astype(str) + "</b><br>"
+        + "Area: " + format_numbers(df_grouped["Flow_Area"], 1) + "<br>"
+        + "Before factor: " + format_numbers(df_grouped["BeforeScore"]) + "<br>"
+        + "After factor: " + format_numbers(df_grouped["AfterScore"]) + "<br>"
+        + "Delta: " + format_numbers(df_grouped["DeltaScore"])
+    )
 
     fig = go.Figure(go.Sankey(
         arrangement="snap",
@@ -487,14 +601,14 @@ def sankey_plot(df, project_title, output_dir):
             pad=22,
             thickness=18,
             line=dict(color="rgba(100,116,139,0.18)", width=0.6),
-            label=short_labels,
+            label=short_labels(labels.to_series()).tolist(),
             color=node_colors,
-            customdata=labels,
+            customdata=labels.tolist(),
             hovertemplate="<b>%{customdata}</b><extra></extra>"
         ),
         link=dict(
-            source=df_grouped["Before"].map(label_to_index),
-            target=df_grouped["After"].map(label_to_index),
+            source=labels.get_indexer(df_grouped["Before"]),
+            target=labels.get_indexer(df_grouped["After"]),
             value=df_grouped["Flow_Area"],
             color=df_grouped["LinkColor"],
             customdata=hover_text,
@@ -530,9 +644,210 @@ def sankey_plot(df, project_title, output_dir):
         )
     )
 
+    return fig
+
+
+def sankey_plot(df, project_title, output_dir, top_n=None):
+    fig = build_sankey_figure(df, project_title, top_n=top_n)
+
     print("Plotting Sankey Diagram.")
-    plotly.offline.plot(
+    return write_figure(fig, os.path.join(output_dir, project_title + "plot_sankey_" + project_title + ".html"))
+
+
+# ============================================================
+# PHASES
+# ============================================================
+def build_phase_waterfall_figure(phases, project_title):
+    """
+    Net balance per construction phase and cumulative total
+    (phase table of script_core.calculate_phase_chain, None if empty).
+    """
+    if phases is None or phases.empty:
+        return None
+
+    labels = [f"{p}: {short_label(layer)}" for p, layer in zip(phases["Phase"], phases["Layer"])]
+    values = phases["Net_Balance"].tolist()
+    cumulative = float(phases["Cumulative_Net_Balance"].iloc[-1])
+    hover = [
+        f"<b>Phase {p} — {layer}</b><br>"
+        f"Net balance: {net:.1f}<br>Cumulative: {cum:.1f}<br>State BFF factor: {factor:.4f}"
+        for p, layer, net, cum, factor in zip(
+            phases["Phase"], phases["Layer"], phases["Net_Balance"],
+            phases["Cumulative_Net_Balance"], phases["State_BFF_Factor"],
+        )
+    ]
+    hover.append(f"<b>Cumulative net balance</b><br>Area: {cumulative:.1f}")
+
+    fig = go.Figure(go.Waterfall(
+        orientation="v",
+        x=labels + ["Cumulative"],
+        y=values + [cumulative],
+        measure=["relative"] * len(values) + ["total"],
+        connector={
+            "line": {"color": COLORS["line"], "width": 0.8, "dash": "dot"}
+        },
+        increasing={"marker": {"color": COLORS["pos"]}},
+        decreasing={"marker": {"color": COLORS["neg"]}},
+        totals={"marker": {"color": COLORS["total_pos"] if cumulative >= 0 else COLORS["total_neg"]}},
+        text=[f"{v:.1f}" for v in values + [cumulative]],
+        textposition="outside",
+        textfont=dict(size=12, color=COLORS["text"]),
+        customdata=hover,
+        hovertemplate="%{customdata}<extra></extra>"
+    ))
+
+    apply_layout(
         fig,
-        filename=os.path.join(output_dir, project_title + "plot_sankey_" + project_title + ".html"),
-        auto_open=False
+        title=f"Blue–Green Infrastructure Balance — Phases — {project_title}",
+        xaxis_title="Phase",
+        yaxis_title="Area",
+        height=620
     )
+    return fig
+
+
+# ============================================================
+# SENSITIVITY
+# ============================================================
+def build_sensitivity_figure(sensitivity, project_title):
+    """
+    Histograms of Net Balance and Final BFF Factor over the Monte Carlo
+    samples of sensitivity.run_sensitivity (None if no result).
+    """
+    if not sensitivity:
+        return None
+
+    net_p = sensitivity["net_balance_percentiles"]
+    factor_p = sensitivity["final_bff_factor_percentiles"]
+
+    fig = make_subplots(
+        rows=1,
+        cols=2,
+        subplot_titles=(
+            f"Net Balance — P(loss) = {sensitivity['prob_net_loss'] * 100:.1f} %",
+            "Final BFF Factor",
+        ),
+    )
+    fig.add_trace(
+        go.Histogram(
+            x=sensitivity["net_balance"],
+            nbinsx=60,
+            marker=dict(color=COLORS["pos"]),
+            hovertemplate="Net Balance: %{x}<br>Samples: %{y}<extra></extra>",
+        ),
+        row=1,
+        col=1,
+    )
+    fig.add_trace(
+        go.Histogram(
+            x=sensitivity["final_bff_factor"],
+            nbinsx=60,
+            marker=dict(color=COLORS["node_blue"]),
+            hovertemplate="Final BFF Factor: %{x}<br>Samples: %{y}<extra></extra>",
+        ),
+        row=1,
+        col=2,
+    )
+
+    fig.add_vline(x=0, line=dict(color=COLORS["total_neg"], width=1.0, dash="dash"), row=1, col=1)
+    for p, dash in ((5, "dot"), (50, "solid"), (95, "dot")):
+        fig.add_vline(x=net_p[p], line=dict(color=COLORS["line"], width=1.0, dash=dash), row=1, col=1)
+        fig.add_vline(x=factor_p[p], line=dict(color=COLORS["line"], width=1.0, dash=dash), row=1, col=2)
+
+    apply_layout(
+        fig,
+        title=f"Sensitivity to factor uncertainty ({sensitivity['samples']} samples, P5 / P50 / P95) — {project_title}",
+        yaxis_title="Samples",
+        height=520,
+    )
+    fig.update_layout(bargap=0.02)
+    return fig
+
+
+# ============================================================
+# COMBINED REPORT
+# ============================================================
+# keeps chart generation fast for fine-grained category schemes
+REPORT_TOP_N = 40
+
+REPORT_CSS = """
+body { font-family: Inter, Arial, Helvetica, sans-serif; color: #1F2937; margin: 24px 32px; }
+h1 { font-size: 24px; font-weight: 600; margin-bottom: 4px; }
+.muted { color: #6B7280; font-size: 13px; }
+table.summary { border-collapse: collapse; margin: 18px 0 28px 0; font-size: 14px; }
+table.summary td { padding: 5px 14px; border-bottom: 1px solid #E5E7EB; }
+table.summary td.value { text-align: right; font-variant-numeric: tabular-nums; }
+.figure { margin-bottom: 36px; }
+"""
+
+
+def report_path(output_dir, project_title):
+    return os.path.join(output_dir, "report_" + project_title + ".html")
+
+
+def write_report(df, project_title, output_dir, summary=None, min_share_of_max=0.01, top_n=REPORT_TOP_N,
+                 sensitivity=None, phases=None, is_canceled=None):
+    """
+    Writes one HTML report with the balance summary and all figures
+    (short waterfall, waterfall, sankey and, if given, the phase waterfall
+    and the sensitivity histograms of sensitivity.run_sensitivity).
+
+    plotly.js is written once as 'plotly.min.js' into output_dir and
+    referenced by the report instead of being embedded per figure.
+
+    summary: optional dict label -> value shown as table above the figures.
+    top_n: transitions shown per chart, the rest is bucketed as 'Other'
+    (None shows all).
+    is_canceled: optional callable (e.g. QgsTask.isCanceled); if it returns
+    True once the figures are built, nothing is written and None returned.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    ensure_plotlyjs(output_dir)
+
+    figures = [
+        build_waterfall_short_figure(df, project_title),
+        build_waterfall_figure(df, project_title, min_share_of_max=min_share_of_max, top_n=top_n),
+        build_sankey_figure(df, project_title, top_n=top_n),
+        build_phase_waterfall_figure(phases, project_title),
+        build_sensitivity_figure(sensitivity, project_title),
+    ]
+
+    parts = [
+        "<!DOCTYPE html>",
+        "<html>",
+        "<head>",
+        '<meta charset="utf-8">',
+        f"<title>Blue–Green Infrastructure Balance — {html.escape(project_title)}</title>",
+        f"<style>{REPORT_CSS}</style>",
+        f'<script src="{PLOTLYJS_FILENAME}"></script>',
+        "</head>",
+        "<body>",
+        f"<h1>Blue–Green Infrastructure Balance — {html.escape(project_title)}</h1>",
+    ]
+
+    if summary:
+        parts.append('<table class="summary">')
+        for label, value in summary.items():
+            parts.append(
+                f'<tr><td>{html.escape(str(label))}</td>'
+                f'<td class="value">{html.escape(str(value))}</td></tr>'
+            )
+        parts.append("</table>")
+
+    for fig in figures:
+        if fig is None:
+            continue
+        parts.append('<div class="figure">')
+        parts.append(fig.to_html(full_html=False, include_plotlyjs=False))
+        parts.append("</div>")
+
+    parts.extend(["</body>", "</html>"])
+
+    if is_canceled is not None and is_canceled():
+        return None
+
+    path = report_path(output_dir, project_title)
+    print("Writing combined report.")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(parts))
+    return path
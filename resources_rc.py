@@ -1,5024 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.3)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x01\x36\x6e\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x0d\xb4\x00\x00\x09\xb0\x08\x02\x00\x00\x00\x77\x32\xdb\xa7\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x2e\x23\x00\x00\x2e\x23\
-\x01\x78\xa5\x3f\x76\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\
-\x65\x52\x65\x61\x64\x79\x71\xc9\x65\x3c\x00\x01\x35\xfb\x49\x44\
-\x41\x54\x78\xda\xec\xda\xbd\x95\x5c\xc7\x15\x85\x51\x48\x36\x82\
-\x41\x08\xa0\x25\xda\x54\x00\x40\x26\x22\x19\x09\x90\x02\x65\x50\
-\x29\xc0\x9b\x10\x90\x02\x22\x80\x16\x56\x61\xe1\x67\xa6\xa7\xfb\
-\xf5\xfb\x39\xaf\xea\xd6\xde\xde\xf5\x6a\x9d\x72\xbf\x7f\x7c\xfe\
-\xfc\xf9\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\x15\xff\x34\
-\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x50\x89\x38\x12\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x28\x45\x1c\x09\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x94\x22\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x4a\x11\x47\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa5\x88\
-\x23\x01\x00\x00\x00\x00\x00\x00\x00\x00\x80\x52\xc4\x91\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x40\x29\xe2\x48\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\xa0\x14\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x50\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x45\
-\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\x94\x22\x8e\x04\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x4a\x11\x47\x02\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xa5\x88\x23\x01\x00\x00\x00\x00\x00\x00\x00\
-\x00\x80\x52\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\x29\
-\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa0\x14\x71\x24\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x50\x8a\x38\x12\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x28\x45\x1c\x09\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x94\x22\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x4a\
-\x11\x47\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa5\x88\x23\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\x80\x52\xc4\x91\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x40\x29\xe2\x48\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\xa0\x14\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x50\
-\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x45\x1c\x09\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x94\x22\x8e\x04\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x4a\x11\x47\x02\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xa5\x88\x23\x01\x00\x00\x00\x00\x00\x00\x00\x00\x80\
-\x52\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\x29\xe2\x48\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa0\x14\x71\x24\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x50\x8a\x38\x12\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x28\x45\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x94\x22\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x4a\x11\x47\
-\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa5\x88\x23\x01\x00\x00\
-\x00\x00\x00\x00\x00\x00\x80\x52\xc4\x91\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x40\x29\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\xa0\x14\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x50\x8a\x38\
-\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x45\x1c\x09\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x94\x22\x8e\x04\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x4a\x11\x47\x02\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xa5\x88\x23\x01\x00\x00\x00\x00\x00\x00\x00\x00\x80\x52\xc4\
-\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\x29\xe2\x48\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\xa0\x14\x71\x24\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x50\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x28\x45\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\x94\x22\
-\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x4a\x11\x47\x02\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\xa5\x88\x23\x01\x00\x00\x00\x00\
-\x00\x00\x00\x00\x80\x52\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x40\x29\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa0\x14\
-\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x50\x8a\x38\x12\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x28\x45\x1c\x09\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x94\x22\x8e\x04\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x4a\x11\x47\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa5\
-\x88\x23\x01\x00\x00\x00\x00\x00\x00\x00\x00\x80\x52\xc4\x91\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x40\x29\xe2\x48\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xa0\x14\x71\x24\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x50\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\
-\x45\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\x94\x22\x8e\x04\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x4a\x11\x47\x02\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\xa5\x88\x23\x01\x00\x00\x00\x00\x00\x00\
-\x00\x00\x80\x52\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\
-\x29\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa0\x14\x71\x24\
-\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x56\x1f\x3f\x7e\x34\x02\xf4\
-\x43\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\xb0\xc9\xc3\xc3\xc3\
-\xab\x57\xaf\xde\xbe\x7d\x6b\x0a\xe8\x84\x38\x12\x00\x00\x00\x00\
-\x00\x00\x00\x00\x60\xbd\x87\x87\x87\xd7\xaf\x5f\x7f\xfa\xf4\xe9\
-\xfd\xfb\xf7\xfa\x48\xe8\x84\x38\x12\x00\x00\x00\x00\x00\x00\x00\
-\x00\x60\xa5\x6f\x65\x64\x3b\xf5\x91\xd0\x09\x71\x24\x00\x00\x00\
-\x00\x00\x00\x00\x00\xc0\x1a\x8f\xca\xc8\x46\x1f\x09\x3d\x10\x47\
-\x02\x00\x00\x00\x00\x00\x00\x00\x00\xdc\xed\x62\x19\xd9\xe8\x23\
-\xe1\x74\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x00\x80\xfb\x5c\x29\
-\x23\x1b\x7d\x24\x9c\x4b\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\
-\x70\x87\x9b\x65\x64\xa3\x8f\x84\x13\x89\x23\x01\x00\x00\x00\x00\
-\x00\x00\x00\x00\x96\x5a\x58\x46\x36\xfa\x48\x38\x8b\x38\x12\x00\
-\x00\x00\x00\x00\x00\x00\x00\x60\x91\xbb\xca\xc8\x46\x1f\x09\xa7\
-\x10\x47\x02\x00\x00\x00\x00\x00\x00\x00\x00\xdc\xb6\xa2\x8c\x6c\
-\xf4\x91\x90\x27\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x00\xb8\x61\
-\x75\x19\xd9\xe8\x23\x21\x4c\x1c\x09\x00\x00\x00\x00\x00\x00\x00\
-\x00\x70\xcd\xc6\x32\xb2\xd1\x47\x42\x92\x38\x12\x00\x00\x00\x00\
-\x00\x00\x00\x00\xe0\x59\xbb\x94\x91\x8d\x3e\x12\x62\xc4\x91\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x97\xed\x58\x46\x36\xfa\x48\xc8\
-\x10\x47\x02\x00\x00\x00\x00\x00\x00\x00\x00\x5c\xb0\x7b\x19\xd9\
-\xe8\x23\x21\x40\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\xf0\xd8\
-\x41\x65\x64\xa3\x8f\x84\xa3\x89\x23\x01\x00\x00\x00\x00\x00\x00\
-\x00\x00\x7e\x72\x68\x19\xd9\xe8\x23\xe1\x50\xe2\x48\x00\x00\x00\
-\x00\x00\x00\x00\x00\x80\xef\x02\x65\x64\xa3\x8f\x84\xe3\x88\x23\
-\x01\x00\x00\x00\x00\x00\x00\x00\x00\xbe\x8a\x95\x91\x8d\x3e\x12\
-\x0e\x22\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x00\xf8\x22\x5c\x46\
-\x36\xfa\x48\x38\x82\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\xe0\
-\x9c\x32\xb2\xd1\x47\xc2\xee\xc4\x91\x00\x00\x00\x00\x00\x00\x00\
-\x00\xc0\xec\x4e\x2c\x23\x1b\x7d\x24\xec\x4b\x1c\x09\x00\x00\x00\
-\x00\x00\x00\x00\x00\x4c\xed\xf4\x32\xb2\xd1\x47\xc2\x8e\xc4\x91\
-\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xbc\x3a\x29\x23\x1b\x7d\x24\
-\xec\x45\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x4c\xaa\xab\x32\
-\xb2\xd1\x47\xc2\x2e\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\xc0\
-\x8c\x3a\x2c\x23\x1b\x7d\x24\x6c\x27\x8e\x04\x00\x00\x00\x00\x00\
-\x00\x00\x00\xa6\xd3\x6d\x19\xd9\xe8\x23\x61\x23\x71\x24\x00\x00\
-\x00\x00\x00\x00\x00\x00\x30\x97\xce\xcb\xc8\x46\x1f\x09\x5b\x88\
-\x23\x01\x00\x00\x00\x00\x00\x00\x00\x80\x89\x0c\x51\x46\x36\xfa\
-\x48\x58\x4d\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\xcc\x62\xa0\
-\x32\xb2\xd1\x47\xc2\x3a\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x00\
-\x60\x0a\xc3\x95\x91\x8d\x3e\x12\x56\x10\x47\x02\x00\x00\x00\x00\
-\x00\x00\x00\x00\xf5\x0d\x5a\x46\x36\xfa\x48\xb8\x97\x38\x12\x00\
-\x00\x00\x00\x00\x00\x00\x00\x28\x6e\xe8\x32\xb2\xd1\x47\xc2\x5d\
-\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\x40\x65\x05\xca\xc8\x46\
-\x1f\x09\xcb\x89\x23\x01\x00\x00\x00\x00\x00\x00\x00\x80\xb2\xca\
-\x94\x91\x8d\x3e\x12\x16\x12\x47\x02\x00\x00\x00\x00\x00\x00\x00\
-\x00\x35\x15\x2b\x23\x1b\x7d\x24\x2c\x21\x8e\x04\x00\x00\x00\x00\
-\x00\x00\x00\x00\x0a\x2a\x59\x46\x36\xfa\x48\xb8\x49\x1c\x09\x00\
-\x00\x00\x00\x00\x00\x00\x00\x54\x53\xb8\x8c\x6c\xf4\x91\x70\x9d\
-\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x28\xa5\x7c\x19\xd9\xe8\
-\x23\xe1\x0a\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x50\xc7\x24\
-\x65\x64\xa3\x8f\x84\xe7\x88\x23\x01\x00\x00\x00\x00\x00\x00\x00\
-\x80\x22\xa6\x2a\x23\x1b\x7d\x24\x5c\x24\x8e\x04\x00\x00\x00\x00\
-\x00\x00\x00\x00\x2a\x98\xb0\x8c\x6c\xf4\x91\xf0\x94\x38\x12\x00\
-\x00\x00\x00\x00\x00\x00\x00\x18\xde\xb4\x65\x64\xa3\x8f\x84\x47\
-\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xd8\x26\x2f\x23\x1b\
-\x7d\x24\xfc\x48\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x4c\
-\x19\xf9\x8d\x3e\x12\xbe\x11\x47\x02\x00\x00\x00\x00\x00\x00\x00\
-\x00\xa3\x52\x46\x3e\xa2\x8f\x84\x46\x1c\x09\x00\x00\x00\x00\x00\
-\x00\x00\x00\x0c\x49\x19\x79\x91\x3e\x12\x5e\x88\x23\x01\x00\x00\
-\x00\x00\x00\x00\x00\x80\x11\x29\x23\xaf\xd0\x47\x82\x38\x12\x00\
-\x00\x00\x00\x00\x00\x00\x00\x18\x8c\x32\xf2\x26\x7d\x24\x93\x13\
-\x47\x02\x00\x00\x00\x00\x00\x00\x00\x00\x23\x51\x46\x2e\xa4\x8f\
-\x64\x66\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x00\x60\x18\xca\xc8\
-\xbb\xe8\x23\x99\x96\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x18\
-\x83\x32\x72\x05\x7d\x24\x73\x12\x47\x02\x00\x00\x00\x00\x00\x00\
-\x00\x00\x03\x50\x46\xae\xa6\x8f\x64\x42\xe2\x48\x00\x00\x00\x00\
-\x00\x00\x00\x00\xa0\x77\xca\xc8\x8d\xf4\x91\xcc\x46\x1c\x09\x00\
-\x00\x00\x00\x00\x00\x00\x00\x74\x4d\x19\xb9\x0b\x7d\x24\x53\x11\
-\x47\x02\x00\x00\x00\x00\x00\x00\x00\x00\xfd\x52\x46\xee\x48\x1f\
-\xc9\x3c\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\x40\xa7\x94\x91\
-\xbb\xd3\x47\x32\x09\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\xd0\
-\x23\x65\xe4\x41\xf4\x91\xcc\x40\x1c\x09\x00\x00\x00\x00\x00\x00\
-\x00\x00\x74\x67\xb8\x32\xf2\x97\x5f\x5e\x0f\x34\xaf\x3e\x92\xf2\
-\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\x40\x5f\x86\x2b\x23\xff\
-\xfd\xdb\x6f\x7f\xfd\xf5\xdf\xff\xfd\xfd\xf7\x40\x23\xeb\x23\xa9\
-\x4d\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x74\x64\xc4\x32\xf2\
-\xdd\xfb\xf7\x2f\x5f\xbe\xfc\xd7\xaf\xbf\xea\x23\xa1\x13\xe2\x48\
-\x00\x00\x00\x00\x00\x00\x00\x00\xa0\x17\xe3\x96\x91\xed\xd4\x47\
-\x42\x27\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\x40\x17\x46\x2f\
-\x23\x1b\x7d\x24\xf4\x40\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\
-\x9c\xaf\x46\x19\xd9\xe8\x23\xe1\x74\xe2\x48\x00\x00\x00\x00\x00\
-\x00\x00\x00\xe0\x64\x95\xca\xc8\x46\x1f\x09\xe7\x12\x47\x02\x00\
-\x00\x00\x00\x00\x00\x00\x00\x67\xaa\x57\x46\x36\xfa\x48\x38\x91\
-\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x38\x4d\xd5\x32\xb2\xd1\
-\x47\xc2\x59\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x39\x6a\
-\x97\x91\x8d\x3e\x12\x4e\x21\x8e\x04\x00\x00\x00\x00\x00\x00\x00\
-\x00\x4e\x30\x43\x19\xd9\xe8\x23\x21\x4f\x1c\x09\x00\x00\x00\x00\
-\x00\x00\x00\x00\xa4\xcd\x53\x46\x36\xfa\x48\x08\x13\x47\x02\x00\
-\x00\x00\x00\x00\x00\x00\x00\x51\xb3\x95\x91\x8d\x3e\x12\x92\xc4\
-\x91\x00\x00\x00\x00\x00\x00\x00\x00\x40\xce\x9c\x65\x64\xa3\x8f\
-\x84\x18\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x10\x32\x73\x19\
-\xd9\xe8\x23\x21\x43\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x24\
-\x28\x23\x1b\x7d\x24\x04\x88\x23\x01\x00\x00\x00\x00\x00\x00\x00\
-\x80\xc3\x29\x23\x7f\xa4\x8f\x84\xa3\x89\x23\x01\x00\x00\x00\x00\
-\x00\x00\x00\x80\x63\x29\x23\x9f\xd2\x47\xc2\xa1\xc4\x91\x00\x00\
-\x00\x00\x00\x00\x00\x00\xc0\x81\x94\x91\xcf\xd1\x47\xc2\x71\xc4\
-\x91\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x51\x94\x91\xd7\xe9\x23\
-\xe1\x20\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x00\xe0\x10\xca\xc8\
-\x25\xf4\x91\x70\x04\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\xb0\
-\x3f\x65\xe4\x72\xfa\x48\xd8\x9d\x38\x12\x00\x00\x00\x00\x00\x00\
-\x00\x00\xd8\x99\x32\xf2\x5e\xfa\x48\xd8\x97\x38\x12\x00\x00\x00\
-\x00\x00\x00\x00\x00\xd8\x93\x32\x72\x1d\x7d\x24\xec\x48\x1c\x09\
-\x00\x00\x00\x00\x00\x00\x00\x00\xec\x46\x19\xb9\x85\x3e\x12\xf6\
-\x22\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x00\xf6\xa1\x8c\xdc\x4e\
-\x1f\x09\xbb\x10\x47\x02\x00\x00\x00\x00\x00\x00\x00\x00\x3b\x50\
-\x46\xee\x45\x1f\x09\xdb\x89\x23\x01\x00\x00\x00\x00\x00\x00\x00\
-\x80\xad\x94\x91\xfb\xd2\x47\xc2\x46\xe2\x48\x00\x00\x00\x00\x00\
-\x00\x00\x00\x60\x13\x65\xe4\x11\xf4\x91\xb0\x85\x38\x12\x00\x00\
-\x00\x00\x00\x00\x00\x00\x58\x4f\x19\x79\x1c\x7d\x24\xac\x26\x8e\
-\x04\x00\x00\x00\x00\x00\x00\x00\x00\x56\x52\x46\x1e\x4d\x1f\x09\
-\xeb\x88\x23\x01\x00\x00\x00\x00\x00\x00\x00\x80\x35\x94\x91\x19\
-\xfa\x48\x58\x41\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\xdc\x4d\
-\x19\x99\xa4\x8f\x84\x7b\x89\x23\x01\x00\x00\x00\x00\x00\x00\x00\
-\x80\xfb\x28\x23\xf3\xf4\x91\x70\x17\x71\x24\x00\x00\x00\x00\x00\
-\x00\x00\x00\x70\x07\x65\xe4\x59\xf4\x91\xb0\x9c\x38\x12\x00\x00\
-\x00\x00\x00\x00\x00\x00\x58\x4a\x19\x79\x2e\x7d\x24\x2c\x24\x8e\
-\x04\x00\x00\x00\x00\x00\x00\x00\x00\x16\x51\x46\xf6\x40\x1f\x09\
-\x4b\x88\x23\x01\x00\x00\x00\x00\x00\x00\x00\x80\xdb\x94\x91\xfd\
-\xd0\x47\xc2\x4d\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x00\xe0\x06\
-\x65\x64\x6f\xf4\x91\x70\x9d\x38\x12\x00\x00\x00\x00\x00\x00\x00\
-\x00\xb8\x46\x19\xd9\x27\x7d\x24\x5c\x21\x8e\x04\x00\x00\x00\x00\
-\x00\x00\x00\x00\x9e\xa5\x8c\xec\x99\x3e\x12\x9e\x23\x8e\x04\x00\
-\x00\x00\x00\x00\x00\x00\x00\x2e\x53\x46\xf6\x4f\x1f\x09\x17\x89\
-\x23\x01\x00\x00\x00\x00\x00\x00\x00\x80\x0b\x94\x91\xa3\xd0\x47\
-\xc2\x53\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x00\xe0\x31\x65\xe4\
-\x58\xf4\x91\xf0\x88\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\xf8\
-\x89\x32\x72\x44\xfa\x48\xf8\x91\x38\x12\x00\x00\x00\x00\x00\x00\
-\x00\x00\xf8\x4e\x19\x39\x2e\x7d\x24\x7c\x23\x8e\x04\x00\x00\x00\
-\x00\x00\x00\x00\x00\xbe\x52\x46\x8e\x4e\x1f\x09\x8d\x38\x12\x00\
-\x00\x00\x00\x00\x00\x00\x00\xf8\x42\x19\x59\x83\x3e\x12\x5e\x88\
-\x23\x01\x00\x00\x00\x00\x00\x00\x00\x80\x17\xca\xc8\x5a\xf4\x91\
-\x20\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x80\xd9\x29\x23\xeb\xd1\
-\x47\x32\x39\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x4c\x4d\x19\
-\x59\x95\x3e\x92\x99\x89\x23\x01\x00\x00\x00\x00\x00\x00\x00\x60\
-\x5e\xca\xc8\xda\xf4\x91\x4c\x4b\x1c\x09\x00\x00\x00\x00\x00\x00\
-\x00\x00\x93\x52\x46\xce\x40\x1f\xc9\x9c\xc4\x91\x00\x00\x00\x00\
-\x00\x00\x00\x00\x30\x23\x65\xe4\x3c\xf4\x91\x4c\x48\x1c\x09\x00\
-\x00\x00\x00\x00\x00\x00\x00\xd3\x51\x46\xce\x46\x1f\xc9\x6c\xc4\
-\x91\x00\x00\x00\x00\x00\x00\x00\x00\x30\x17\x65\xe4\x9c\xf4\x91\
-\x4c\x45\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x13\x51\x46\xce\
-\x4c\x1f\xc9\x3c\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\x30\x0b\
-\x65\x24\xfa\x48\x26\x21\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x80\
-\x29\x28\x23\x69\xf4\x91\xcc\x40\x1c\x09\x00\x00\x00\x00\x00\x00\
-\x00\x00\xf5\x29\x23\xf9\x91\x3e\x92\xf2\xc4\x91\x00\x00\x00\x00\
-\x00\x00\x00\x00\x50\x9c\x32\x92\xa7\xf4\x91\xd4\x26\x8e\x04\x00\
-\x00\x00\x00\x00\x00\x00\x80\xca\x94\x91\x3c\x47\x1f\x49\x61\xe2\
-\x48\x00\x00\x00\x00\x00\x00\x00\x00\x28\x4b\x19\xc9\x75\xfa\x48\
-\xaa\x12\x47\x02\x00\x00\x00\x00\x00\x00\x00\x40\x4d\xca\x48\x96\
-\xd0\x47\x52\x92\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x0a\x52\
-\x46\xb2\x9c\x3e\x92\x7a\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\
-\x50\x8d\x32\x92\x7b\xe9\x23\x29\x46\x1c\x09\x00\x00\x00\x00\x00\
-\x00\x00\x00\xa5\x28\x23\x59\x47\x1f\x49\x25\xe2\x48\x00\x00\x00\
-\x00\x00\x00\x00\x00\xa8\x43\x19\xc9\x16\xfa\x48\xca\x10\x47\x02\
-\x00\x00\x00\x00\x00\x00\x00\x40\x11\xca\x48\xb6\xd3\x47\x52\x83\
-\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x2a\x50\x46\xb2\x17\x7d\
-\x24\x05\x88\x23\x01\x00\x00\x00\x00\x00\x00\x00\x60\x78\xca\x48\
-\xf6\xa5\x8f\x64\x74\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x00\x18\
-\x9b\x32\x92\x23\xe8\x23\x19\x9a\x38\x12\x00\x00\x00\x00\x00\x00\
-\x00\x00\x06\xa6\x8c\xe4\x38\xfa\x48\xc6\x25\x8e\x04\x00\x00\x00\
-\x00\x00\x00\x00\x80\x51\x29\x23\x39\x9a\x3e\x92\x41\x89\x23\x01\
-\x00\x00\x00\x00\x00\x00\x00\x60\x48\xca\x48\x32\x3e\x7c\xf8\x60\
-\x04\x86\x23\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x80\xf1\x28\x23\
-\xc9\xf8\xf3\x8f\x3f\xfe\xf3\xfb\xef\x03\x3d\xf8\xcd\x9b\x37\xef\
-\xde\xbd\xf3\x71\x88\x23\x01\x00\x00\x00\x00\x00\x00\x00\x60\x30\
-\xca\x48\x32\x94\x91\x8c\x4b\x1c\x09\x00\x00\x00\x00\x00\x00\x00\
-\x00\x23\x51\x46\x92\xa1\x8c\x64\x68\xe2\x48\x00\x00\x00\x00\x00\
-\x00\x00\x00\x18\x86\x32\x92\x0c\x65\x24\xa3\x13\x47\x02\x00\x00\
-\x00\x00\x00\x00\x00\xc0\x18\x94\x91\x64\x28\x23\x29\x40\x1c\x09\
-\x00\x00\x00\x00\x00\x00\x00\x00\x03\x50\x46\x92\xa1\x8c\xa4\x06\
-\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\xf4\x4e\x19\x49\x86\x32\
-\x92\x32\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\xd0\x35\x65\x24\
-\x19\xca\x48\x2a\x11\x47\x02\x00\x00\x00\x00\x00\x00\x00\x40\xbf\
-\x94\x91\x64\x28\x23\x29\x46\x1c\x09\x00\x00\x00\x00\x00\x00\x00\
-\x00\x9d\x52\x46\x92\xa1\x8c\xa4\x1e\x71\x24\x00\x00\x00\x00\x00\
-\x00\x00\x00\xf4\x48\x19\x49\x86\x32\x92\x92\xc4\x91\x00\x00\x00\
-\x00\x00\x00\x00\x00\xd0\x1d\x65\x24\x19\xca\x48\xaa\x12\x47\x02\
-\x00\x00\x00\x00\x00\x00\x00\x40\x5f\x94\x91\x64\x28\x23\x29\x4c\
-\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x1d\x51\x46\x92\xa1\x8c\
-\xa4\x36\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\xf4\x42\x19\x49\
-\x86\x32\x92\xf2\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\xd0\x05\
-\x65\x24\x19\xca\x48\x66\x20\x8e\x04\x00\x00\x00\x00\x00\x00\x00\
-\x80\xf3\x29\x23\xc9\x50\x46\x32\x09\x71\x24\x00\x00\x00\x00\x00\
-\x00\x00\x00\x9c\x4c\x19\x49\x86\x32\x92\x79\x88\x23\x01\x00\x00\
-\x00\x00\x00\x00\x00\xe0\x4c\xca\x48\x32\x94\x91\x4c\x45\x1c\x09\
-\x00\x00\x00\x00\x00\x00\x00\x00\xa7\x51\x46\x92\xa1\x8c\x64\x36\
-\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x00\x38\x87\x32\x92\x0c\x65\
-\x24\x13\x12\x47\x02\x00\x00\x00\x00\x00\x00\x00\xc0\x09\x94\x91\
-\x64\x28\x23\x99\x93\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\xd2\
-\x94\x91\x64\x28\x23\x99\x96\x38\x12\x00\x00\x00\x00\x00\x00\x00\
-\x00\xa2\x94\x91\x64\x28\x23\x99\x99\x38\x12\x00\x00\x00\x00\x00\
-\x00\x00\x00\x72\x94\x91\x64\x28\x23\x99\x9c\x38\x12\x00\x00\x00\
-\x00\x00\x00\x00\x00\x42\x94\x91\x64\x28\x23\x41\x1c\x09\x00\x00\
-\x00\x00\x00\x00\x00\x00\x09\xca\x48\x32\x94\x91\xf0\x42\x1c\x09\
-\x00\x00\x00\x00\x00\x00\x00\x00\x01\xca\x48\x32\x94\x91\xd0\x88\
-\x23\x01\x00\x00\x00\x00\x00\x00\x00\xe0\x58\xca\x48\x32\x94\x91\
-\xf0\x8d\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x0e\xa4\x8c\x24\
-\x43\x19\x09\x3f\x12\x47\x02\x00\x00\x00\x00\x00\x00\x00\xc0\x51\
-\x94\x91\x64\x28\x23\xe1\x11\x71\x24\x00\x00\x00\x00\x00\x00\x00\
-\x00\x1c\x42\x19\x49\x86\x32\x12\x9e\x12\x47\x02\x00\x00\x00\x00\
-\x00\x00\x00\xc0\xfe\x94\x91\x64\x28\x23\xe1\x22\x71\x24\x00\x00\
-\x00\x00\x00\x00\x00\x00\xec\x4c\x19\x49\x86\x32\x12\x9e\x23\x8e\
-\x04\x00\x00\x00\x00\x00\x00\x00\x80\x3d\x29\x23\xc9\x50\x46\xc2\
-\x15\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x00\xd8\x8d\x32\x92\x0c\
-\x65\x24\x5c\x27\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x80\x7d\x28\
-\x23\xc9\x50\x46\xc2\x4d\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x00\
-\xd8\x81\x32\x92\x0c\x65\x24\x2c\x21\x8e\x04\x00\x00\x00\x00\x00\
-\x00\x00\x80\xad\x94\x91\x64\x28\x23\x61\x21\x71\x24\x00\x00\x00\
-\x00\x00\x00\x00\x00\x6c\xa2\x8c\x24\x43\x19\x09\xcb\x89\x23\x01\
-\x00\x00\x00\x00\x00\x00\x00\x60\x3d\x65\x24\x19\xca\x48\xb8\x8b\
-\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x56\x52\x46\x92\xa1\x8c\
-\x84\x7b\x89\x23\x01\x00\x00\x00\x00\x00\x00\x00\x60\x0d\x65\x24\
-\x19\xca\x48\x58\x41\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x77\
-\x53\x46\x92\xa1\x8c\x84\x75\xc4\x91\x00\x00\x00\x00\x00\x00\x00\
-\x00\x70\x1f\x65\x24\x19\xca\x48\x58\x4d\x1c\x09\x00\x00\x00\x00\
-\x00\x00\x00\x00\x77\x50\x46\x92\xa1\x8c\x84\x2d\xc4\x91\x00\x00\
-\x00\x00\x00\x00\x00\x00\xb0\x94\x32\x92\x0c\x65\x24\x6c\x24\x8e\
-\x04\x00\x00\x00\x00\x00\x00\x00\x80\x45\x94\x91\x64\x28\x23\x61\
-\x3b\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\xdc\xa6\x8c\x24\x43\
-\x19\x09\xbb\x10\x47\x02\x00\x00\x00\x00\x00\x00\x00\xc0\x0d\xca\
-\x48\x32\x94\x91\xb0\x17\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\
-\x5c\xa3\x8c\x24\x43\x19\x09\x3b\x12\x47\x02\x00\x00\x00\x00\x00\
-\x00\x00\xc0\xb3\x94\x91\x64\x28\x23\x61\x5f\xe2\x48\x00\x00\x00\
-\x00\x00\x00\x00\x00\xb8\x4c\x19\x49\x86\x32\x12\x76\x27\x8e\x04\
-\x00\x00\x00\x00\x00\x00\x00\x80\x0b\x94\x91\x64\x28\x23\xe1\x08\
-\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x00\x78\x4c\x19\x49\x86\x32\
-\x12\x0e\x22\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x80\x9f\x28\x23\
-\xc9\x50\x46\xc2\x71\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\xf0\
-\x9d\x32\x92\x0c\x65\x24\x1c\x4a\x1c\x09\x00\x00\x00\x00\x00\x00\
-\x00\x00\x5f\x29\x23\xc9\x50\x46\xc2\xd1\xc4\x91\x00\x00\x00\x00\
-\x00\x00\x00\x00\xf0\x85\x32\x92\x0c\x65\x24\x04\x88\x23\x01\x00\
-\x00\x00\x00\x00\x00\x00\x40\x19\x49\x88\x32\x12\x32\xc4\x91\x00\
-\x00\x00\x00\x00\x00\x00\x00\xcc\x4e\x19\x49\x86\x32\x12\x62\xc4\
-\x91\x00\x00\x00\x00\x00\x00\x00\x00\x4c\x4d\x19\x49\x86\x32\x12\
-\x92\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\xcc\x4b\x19\x49\x86\
-\x32\x12\xc2\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\x4c\x4a\x19\
-\x49\x86\x32\x12\xf2\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\xcc\
-\x48\x19\x49\x86\x32\x12\x4e\x21\x8e\x04\x00\x00\x00\x00\x00\x00\
-\x00\x60\x3a\xca\x48\x32\x94\x91\x70\x16\x71\x24\x00\x00\x00\x00\
-\x00\x00\x00\x00\x73\x51\x46\x92\xa1\x8c\x84\x13\x89\x23\x01\x00\
-\x00\x00\x00\x00\x00\x00\x98\x88\x32\x92\x0c\x65\x24\x9c\x4b\x1c\
-\x09\x00\x00\x00\x00\x00\x00\x00\xc0\x2c\x94\x91\x64\x28\x23\xe1\
-\x74\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x00\xa6\xa0\x8c\x24\x43\
-\x19\x09\x3d\x10\x47\x02\x00\x00\x00\x00\x00\x00\x00\x50\x9f\x32\
-\x92\x0c\x65\x24\x74\x42\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x40\
-\x71\xca\x48\x32\x94\x91\xd0\x0f\x71\x24\x00\x00\x00\x00\x00\x00\
-\x00\x00\x95\x29\x23\xc9\x50\x46\x42\x57\xc4\x91\x00\x00\x00\x00\
-\x00\x00\x00\x00\x94\xa5\x8c\x24\x43\x19\x09\xbd\x11\x47\x02\x00\
-\x00\x00\x00\x00\x00\x00\x50\x93\x32\x92\x0c\x65\x24\x74\x48\x1c\
-\x09\x00\x00\x00\x00\x00\x00\x00\x40\x41\xca\x48\x32\x94\x91\xd0\
-\x27\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\xd5\x28\x23\xc9\x50\
-\x46\x42\xb7\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\x94\xa2\x8c\
-\x24\x43\x19\x09\x3d\x13\x47\x02\x00\x00\x00\x00\x00\x00\x00\x50\
-\x87\x32\x92\x0c\x65\x24\x74\x4e\x1c\x09\x00\x00\x00\x00\x00\x00\
-\x00\x40\x11\xca\x48\x32\x94\x91\xd0\x3f\x71\x24\x00\x00\x00\x00\
-\x00\x00\x00\x00\x15\x28\x23\xc9\x50\x46\xc2\x10\xc4\x91\x00\x00\
-\x00\x00\x00\x00\x00\x00\x0c\x4f\x19\x49\x86\x32\x12\x46\x21\x8e\
-\x04\x00\x00\x00\x00\x00\x00\x00\x60\x6c\xca\x48\x32\x94\x91\x30\
-\x10\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x03\x53\x46\x92\xa1\
-\x8c\x84\xb1\x88\x23\x01\x00\x00\x00\x00\x00\x00\x00\x18\x95\x32\
-\x92\x0c\x65\x24\x0c\x47\x1c\x09\x00\x00\x00\x00\x00\x00\x00\xc0\
-\x90\x94\x91\x64\x28\x23\x61\x44\xe2\x48\x00\x00\x00\x00\x00\x00\
-\x00\x00\xc6\xa3\x8c\x24\x43\x19\x09\x83\x12\x47\x02\x00\x00\x00\
-\x00\x00\x00\x00\x30\x18\x65\x24\x19\xca\x48\x18\x97\x38\x12\x00\
-\x00\x00\x00\x00\x00\x00\x80\x91\x28\x23\xc9\x50\x46\xc2\xd0\xc4\
-\x91\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x43\x19\x49\x86\x32\x12\
-\x46\x27\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x60\x0c\xca\x48\x32\
-\x94\x91\x50\x80\x38\x12\x00\x00\x00\x00\x00\x00\x00\x80\x01\x28\
-\x23\xc9\x50\x46\x42\x0d\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x00\
-\x7a\xa7\x8c\x24\x43\x19\x09\x65\x88\x23\x01\x00\x00\x00\x00\x00\
-\x00\x00\xe8\x9a\x32\x92\x0c\x65\x24\x54\x22\x8e\x04\x00\x00\x00\
-\x00\x00\x00\x00\xa0\x5f\xca\x48\x32\x94\x91\x50\x8c\x38\x12\x00\
-\x00\x00\x00\x00\x00\x00\x80\x4e\x29\x23\xc9\x50\x46\x42\x3d\xe2\
-\x48\x00\x00\x00\x00\x00\x00\x00\x00\x7a\xa4\x8c\x24\x43\x19\x09\
-\x25\x89\x23\x01\x00\x00\x00\x00\x00\x00\x00\xe8\x8e\x32\x92\x0c\
-\x65\x24\x54\x25\x8e\x04\x00\x00\x00\x00\x00\x00\x00\xa0\x2f\xca\
-\x48\x32\x94\x91\x50\x98\x38\x12\x00\x00\x00\x00\x00\x00\x00\x80\
-\x8e\x28\x23\xc9\x50\x46\x42\x6d\xe2\x48\x00\x00\x00\x00\x00\x00\
-\x00\x00\x7a\xa1\x8c\x24\x43\x19\x09\xe5\x89\x23\x01\x00\x00\x00\
-\x00\x00\x00\x00\xe8\x82\x32\x92\x0c\x65\x24\xcc\x40\x1c\x09\x00\
-\x00\x00\x00\x00\x00\x00\xc0\xf9\x94\x91\x64\x28\x23\x61\x12\xe2\
-\x48\x00\x00\x00\x00\x00\x00\x00\x00\x4e\xa6\x8c\x24\x43\x19\x09\
-\xf3\x10\x47\x02\x00\x00\x00\x00\x00\x00\x00\x70\x26\x65\x24\x19\
-\xca\x48\x98\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x80\xd3\x28\
-\x23\xc9\x50\x46\xc2\x6c\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\
-\x9c\x43\x19\x49\x86\x32\x12\x26\x24\x8e\x04\x00\x00\x00\x00\x00\
-\x00\x00\xe0\x04\xca\x48\x32\x94\x91\x30\x27\x71\x24\x00\x00\x00\
-\x00\x00\x00\x00\x00\x69\xca\x48\x32\x94\x91\x30\x2d\x71\x24\x00\
-\x00\x00\x00\x00\x00\x00\x00\x51\xca\x48\x32\x94\x91\x30\x33\x71\
-\x24\x00\x00\x00\x00\x00\x00\x00\x00\x39\xca\x48\x32\x94\x91\x30\
-\x39\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x21\xca\x48\x32\x94\
-\x91\x80\x38\x12\x00\x00\x00\x00\x00\x00\x00\x80\x04\x65\x24\x19\
-\xca\x48\xe0\x85\x38\x12\x00\x00\x00\x00\x00\x00\x00\x80\x00\x65\
-\x24\x19\xca\x48\xa0\x11\x47\x02\x00\x00\x00\x00\x00\x00\x00\x70\
-\x2c\x65\x24\x19\xca\x48\xe0\x1b\x71\x24\x00\x00\x00\x00\x00\x00\
-\x00\x00\x07\x52\x46\x92\xa1\x8c\x04\x7e\x24\x8e\x04\x00\x00\x00\
-\x00\x00\x00\x00\xe0\x28\xca\x48\x32\x94\x91\xc0\x23\xe2\x48\x00\
-\x00\x00\x00\x00\x00\x00\x00\x0e\xa1\x8c\x24\x43\x19\x09\x3c\x25\
-\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x60\x7f\xca\x48\x32\x94\x91\
-\xc0\x45\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x00\x76\xa6\x8c\x24\
-\x43\x19\x09\x3c\x47\x1c\x09\x00\x00\x00\x00\x00\x00\x00\xc0\x9e\
-\x94\x91\x64\x28\x23\x81\x2b\xc4\x91\x00\x00\x00\x00\x00\x00\x00\
-\x00\xec\x46\x19\x49\x86\x32\x12\xb8\x4e\x1c\x09\x00\x00\x00\x00\
-\x00\x00\x00\xc0\x3e\x94\x91\x64\x28\x23\x81\x9b\xc4\x91\x00\x00\
-\x00\x00\x00\x00\x00\x00\xec\x40\x19\x49\x86\x32\x12\x58\x42\x1c\
-\x09\x00\x00\x00\x00\x00\x00\x00\xc0\x56\xca\x48\x32\x94\x91\xc0\
-\x42\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x00\x36\x51\x46\x92\xa1\
-\x8c\x04\x96\x13\x47\x02\x00\x00\x00\x00\x00\x00\x00\xb0\x9e\x32\
-\x92\x0c\x65\x24\x70\x17\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\
-\x2b\x29\x23\xc9\x50\x46\x02\xf7\x12\x47\x02\x00\x00\x00\x00\x00\
-\x00\x00\xb0\x86\x32\x92\x0c\x65\x24\xb0\x82\x38\x12\x00\x00\x00\
-\x00\x00\x00\x00\x80\xbb\x29\x23\xc9\x50\x46\x02\xeb\x88\x23\x01\
-\x00\x00\x00\x00\x00\x00\x00\xb8\x8f\x32\x92\x0c\x65\x24\xb0\x9a\
-\x38\x12\x00\x00\x00\x00\x00\x00\x00\x80\x3b\x28\x23\xc9\x50\x46\
-\x02\x5b\x88\x23\x01\x00\x00\x00\x00\x00\x00\x00\x58\x4a\x19\x49\
-\x86\x32\x12\xd8\x48\x1c\x09\x00\x00\x00\x00\x00\x00\x00\xc0\x22\
-\xca\x48\x32\x94\x91\xc0\x76\xe2\x48\x00\x00\x00\x00\x00\x00\x00\
-\x00\x6e\x53\x46\x92\xa1\x8c\x04\x76\x21\x8e\x04\x00\x00\x00\x00\
-\x00\x00\x00\xe0\x06\x65\x24\x19\xca\x48\x60\x2f\xe2\x48\x00\x00\
-\x00\x00\x00\x00\x00\x00\xae\x51\x46\x92\xa1\x8c\x04\x76\x24\x8e\
-\x04\x00\x00\x00\x00\x00\x00\x00\xe0\x59\xca\x48\x32\x94\x91\xc0\
-\xbe\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\x5c\xa6\x8c\x24\x43\
-\x19\x09\xec\x4e\x1c\x09\x00\x00\x00\x00\x00\x00\x00\xc0\x05\xca\
-\x48\x32\x94\x91\xc0\x11\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\
-\x3c\xa6\x8c\x24\x43\x19\x09\x1c\x44\x1c\x09\x00\x00\x00\x00\x00\
-\x00\x00\xc0\x4f\x94\x91\x64\x28\x23\x81\xe3\x88\x23\x01\x00\x00\
-\x00\x00\x00\x00\x00\xf8\x4e\x19\x49\x86\x32\x12\x38\x94\x38\x12\
-\x00\x00\x00\x00\x00\x00\x00\x80\xaf\x94\x91\x64\x28\x23\x81\xa3\
-\x89\x23\x01\x00\x00\x00\x00\x00\x00\x00\xf8\x42\x19\x49\x86\x32\
-\x12\x08\x10\x47\x02\x00\x00\x00\x00\x00\x00\x00\xa0\x8c\x24\x44\
-\x19\x09\x64\x88\x23\x01\x00\x00\x00\x00\x00\x00\x00\x66\xa7\x8c\
-\x24\x43\x19\x09\xc4\x88\x23\x01\x00\x00\x00\x00\x00\x00\x00\xa6\
-\xa6\x8c\x24\x43\x19\x09\x24\x89\x23\x01\x00\x00\x00\x00\x00\x00\
-\x00\xe6\xa5\x8c\x24\x43\x19\x09\x84\x89\x23\x01\x00\x00\x00\x00\
-\x00\x00\x00\x26\xa5\x8c\x24\x43\x19\x09\xe4\x89\x23\x01\x00\x00\
-\x00\x00\x00\x00\x00\x66\xa4\x8c\x24\x43\x19\x09\x9c\x42\x1c\x09\
-\x00\x00\x00\x00\x00\x00\x00\x30\x1d\x65\x24\x19\xca\x48\xe0\x2c\
-\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x80\xb9\x28\x23\xc9\x50\x46\
-\x02\x27\x12\x47\x02\x00\x00\x00\x00\x00\x00\x00\x4c\x44\x19\x49\
-\x86\x32\x12\x38\x97\x38\x12\x00\x00\x00\x00\x00\x00\x00\x60\x16\
-\xca\x48\x32\x94\x91\xc0\xe9\xc4\x91\x00\x00\x00\x00\x00\x00\x00\
-\x00\x53\x50\x46\x92\xa1\x8c\x04\x7a\x20\x8e\x04\x00\x00\x00\x00\
-\x00\x00\x00\xa8\x4f\x19\x49\x86\x32\x12\xe8\x84\x38\x12\x00\x00\
-\x00\x00\x00\x00\x00\xa0\x38\x65\x24\x19\xca\x48\xa0\x1f\xe2\x48\
-\x00\x00\x00\x00\x00\x00\x00\x80\xca\x94\x91\x64\x28\x23\x81\xae\
-\x88\x23\x01\x00\x00\x00\x00\x00\x00\x00\xca\x52\x46\x92\xa1\x8c\
-\x04\x7a\x23\x8e\x04\x00\x00\x00\x00\x00\x00\x00\xa8\x49\x19\x49\
-\x86\x32\x12\xe8\x90\x38\x12\x00\x00\x00\x00\x00\x00\x00\xa0\x20\
-\x65\x24\x19\xca\x48\xa0\x4f\xe2\x48\x00\x00\x00\x00\x00\x00\x00\
-\x80\x6a\x94\x91\x64\x28\x23\x81\x6e\x89\x23\x01\x00\x00\x00\x00\
-\x00\x00\x00\x4a\x51\x46\x92\xa1\x8c\x04\x7a\x26\x8e\x04\x00\x00\
-\x00\x00\x00\x00\x00\xa8\x43\x19\x49\x86\x32\x12\xe8\x9c\x38\x12\
-\x00\x00\x00\x00\x00\x00\x00\xa0\x08\x65\x24\x19\xca\x48\xa0\x7f\
-\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x80\x0a\x94\x91\x64\x28\x23\
-\x81\x21\x88\x23\x01\x00\x00\x00\x00\x00\x00\x00\x86\xa7\x8c\x24\
-\x43\x19\x09\x8c\x42\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x30\x36\
-\x65\x24\x19\xca\x48\x60\x20\xe2\x48\x00\x00\x00\x00\x00\x00\x00\
-\x80\x81\x29\x23\xc9\x50\x46\x02\x63\x11\x47\x02\x00\x00\x00\x00\
-\x00\x00\x00\x8c\x4a\x19\x49\x86\x32\x12\x18\x8e\x38\x12\x00\x00\
-\x00\x00\x00\x00\x00\x60\x48\xca\x48\x32\x94\x91\xc0\x88\xc4\x91\
-\x00\x00\x00\x00\x00\x00\x00\x00\xe3\x51\x46\x92\xa1\x8c\x04\x06\
-\x25\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x18\x8c\x32\x92\x0c\x65\
-\x24\x30\x2e\x71\x24\x00\x00\x00\x00\x00\x00\x00\xc0\x48\x94\x91\
-\x64\x28\x23\x81\xa1\x89\x23\x01\x00\x00\x00\x00\x00\x00\x00\x86\
-\xa1\x8c\x24\x43\x19\x09\x8c\x4e\x1c\x09\x00\x00\x00\x00\x00\x00\
-\x00\x30\x06\x65\x24\x19\xca\x48\xa0\x00\x71\x24\x00\x00\x00\x00\
-\x00\x00\x00\xc0\x00\x94\x91\x64\x28\x23\x81\x1a\xc4\x91\x00\x00\
-\x00\x00\x00\x00\x00\x00\xbd\x53\x46\x92\xa1\x8c\x04\xca\x10\x47\
-\x02\x00\x00\xfc\x9f\xbd\xfb\x89\x91\xb3\xbc\x13\x3c\x8e\xd1\x1c\
-\x9b\x54\x71\x6a\x18\x66\x53\x65\x2a\x81\x03\x46\xd5\x0e\x91\x86\
-\xc1\x1e\x75\xd5\x18\x05\x27\xd9\xc4\x4d\x5b\xc0\xce\x6e\x76\xa9\
-\xb4\x41\x9b\x3d\x4c\x28\x13\x69\x72\x22\x14\x93\xd3\x44\x0a\xee\
-\xcc\x1e\x60\x95\x00\xed\x0d\x97\x30\x0b\x54\xc3\x8e\x70\x24\x7b\
-\x5d\x3d\x90\x19\xe6\x30\x51\x95\xcc\xec\x28\x7f\x5a\xbc\x75\x60\
-\x70\x9f\xf2\x36\x6a\xe5\xda\xdb\xa1\xb3\x0e\x31\x76\xbb\xff\x54\
-\x3d\xef\xbf\xcf\x47\xc8\x6a\x59\xa6\xeb\x79\x7f\x0f\x02\xf4\xe8\
-\xdb\xcf\x0b\x00\x00\x00\x00\x90\x6a\xca\x48\xc2\x50\x46\x02\x79\
-\x22\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x48\x2f\x65\x24\x61\x28\
-\x23\x81\x9c\x11\x47\x02\x00\x00\x00\x00\x00\x00\x00\xa4\x94\x32\
-\x92\x30\x94\x91\x40\xfe\x88\x23\x01\x00\x00\x00\x00\x00\x00\x00\
-\xd2\x48\x19\x49\x18\xca\x48\x20\x97\xc4\x91\x00\x00\x00\x00\x00\
-\x00\x00\x00\xa9\xa3\x8c\x24\x0c\x65\x24\x90\x57\xe2\x48\x00\x00\
-\x00\x00\x00\x00\x00\x80\x74\x51\x46\x12\x86\x32\x12\xc8\x31\x71\
-\x24\x00\x00\x00\x00\x00\x00\x00\x40\x8a\x28\x23\x09\x43\x19\x09\
-\xe4\x9b\x38\x12\x00\x00\x00\x00\x00\x00\x00\x20\x2d\x94\x91\x84\
-\xa1\x8c\x04\x72\x4f\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x90\x0a\
-\xca\x48\xc2\x50\x46\x02\x45\x20\x8e\x04\x00\x00\x00\x00\x00\x00\
-\x00\x48\x9e\x32\x92\x30\x94\x91\x40\x41\x88\x23\x01\x00\x00\x00\
-\x00\x00\x00\x00\x12\xa6\x8c\x24\x0c\x65\x24\x50\x1c\xe2\x48\x00\
-\x00\x00\x00\x00\x00\x00\x80\x24\x29\x23\x09\x43\x19\x09\x14\x8a\
-\x38\x12\x00\x00\x00\x00\x00\x00\x00\x20\x31\xca\x48\xc2\x50\x46\
-\x02\x45\x23\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x48\x86\x32\x92\
-\x30\x94\x91\x40\x01\x89\x23\x01\x00\x00\x00\x00\x00\x00\x00\x12\
-\xa0\x8c\x24\x0c\x65\x24\x50\x4c\xe2\x48\x00\x00\x00\x00\x00\x00\
-\x00\x80\xd0\x94\x91\x84\xa1\x8c\x04\x0a\x4b\x1c\x09\x00\x00\x00\
-\x00\x00\x00\x00\x10\x94\x32\x92\x30\x94\x91\x40\x91\x89\x23\x01\
-\x00\x00\x00\x00\x00\x00\x00\xc2\x51\x46\x12\x86\x32\x12\x28\x38\
-\x71\x24\x00\x00\x00\x00\x00\x00\x00\x40\x20\xca\x48\xc2\x50\x46\
-\x02\x88\x23\x01\x00\x00\x00\x00\x00\x00\x00\x42\x50\x46\x12\x86\
-\x32\x12\xe0\x3a\x71\x24\x00\x00\x00\x00\x00\x00\x00\x40\x00\xca\
-\x48\xc2\x50\x46\x02\x6c\x12\x47\x02\x00\x00\x00\x00\x00\x00\x00\
-\x8c\x97\x32\x92\x30\x94\x91\x00\x97\x88\x23\x01\x00\x00\x00\x00\
-\x00\x00\x00\xc6\x48\x19\x49\x18\xca\x48\x80\x8f\x12\x47\x02\x00\
-\x00\x00\x00\x00\x00\x00\x8c\x8b\x32\x92\x30\x94\x91\x00\x97\x11\
-\x47\x02\x00\x00\x00\x00\x00\x00\x00\x8c\x85\x32\x92\x30\x94\x91\
-\x00\x1f\x27\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x18\x3d\x65\x24\
-\x61\x28\x23\x01\xae\x48\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x30\
-\x62\xca\x48\xc2\x50\x46\x02\x5c\x8d\x38\x12\x00\x00\x00\x00\x00\
-\x00\x00\x60\x94\x94\x91\x84\xa1\x8c\x04\xd8\x82\x38\x12\x00\x00\
-\x00\x00\x00\x00\x00\x60\x64\x94\x91\x84\xa1\x8c\x04\xd8\x9a\x38\
-\x12\x00\x00\x00\x00\x00\x00\x00\x60\x34\x94\x91\x84\xa1\x8c\x04\
-\xb8\x26\x71\x24\x00\x00\x00\x00\x00\x00\x00\xc0\x08\x28\x23\x09\
-\x43\x19\x09\xb0\x1d\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x80\xbd\
-\x52\x46\x12\x86\x32\x12\x60\x9b\xc4\x91\x00\x00\x00\x00\x00\x00\
-\x00\x00\x7b\xa2\x8c\x24\x0c\x65\x24\xc0\xf6\x89\x23\x01\x00\x00\
-\x00\x00\x00\x00\x00\x76\x4f\x19\x49\x18\xca\x48\x80\x1d\x11\x47\
-\x02\x00\x00\x00\x00\x00\x00\x00\xec\x92\x32\x92\x30\x94\x91\x00\
-\x3b\x25\x8e\x04\x00\x00\x00\x00\x00\x00\x00\xd8\x0d\x65\x24\x61\
-\x28\x23\x01\x76\x41\x1c\x09\x00\x00\x00\x00\x00\x00\x00\xb0\x63\
-\xca\x48\xc2\x50\x46\x02\xec\x8e\x38\x12\x00\x00\x00\x00\x00\x00\
-\x00\x60\x67\x94\x91\x84\xa1\x8c\x04\xd8\x35\x71\x24\x00\x00\x00\
-\x00\x00\x00\x00\xc0\x0e\x28\x23\x09\x43\x19\x09\xb0\x17\xe2\x48\
-\x00\x00\x00\x00\x00\x00\x00\x80\xed\x52\x46\x12\x86\x32\x12\x60\
-\x8f\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x00\xdb\xa2\x8c\x24\x0c\
-\x65\x24\xc0\xde\x89\x23\x01\x00\x00\x00\x00\x00\x00\x00\xae\x4d\
-\x19\x49\x18\xca\x48\x80\x91\x10\x47\x02\x00\x00\x00\x00\x00\x00\
-\x00\x5c\x83\x32\x92\x30\x94\x91\x00\xa3\x22\x8e\x04\x00\x00\x00\
-\x00\x00\x00\x00\xd8\x8a\x32\x92\x30\x94\x91\x00\x23\x24\x8e\x04\
-\x00\x00\x00\x00\x00\x00\x00\xb8\x2a\x65\x24\x61\x28\x23\x01\x46\
-\x4b\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x70\x65\xca\x48\xc2\x50\
-\x46\x02\x8c\x9c\x38\x12\x00\x00\x00\x00\x00\x00\x00\xe0\x0a\x94\
-\x91\x84\xa1\x8c\x04\x18\x07\x71\x24\x00\x00\x00\x00\x00\x00\x00\
-\xc0\xe5\x94\x91\x84\xa1\x8c\x04\x18\x13\x71\x24\x00\x00\x00\x00\
-\x00\x00\x00\xc0\xef\x51\x46\x12\x86\x32\x12\x60\x7c\xc4\x91\x00\
-\x00\x00\x00\x00\x00\x00\x00\xbf\xa3\x8c\x24\x0c\x65\x24\xc0\x58\
-\x89\x23\x01\x00\x00\x00\x00\x00\x00\x00\x7e\x4b\x19\x49\x18\xca\
-\x48\x80\x71\x13\x47\x02\x00\x00\x00\x00\x00\x00\x00\xfc\x86\x32\
-\x92\x30\x94\x91\x00\x01\x88\x23\x01\x00\x00\x00\x00\x00\x00\x00\
-\x94\x91\x04\xa2\x8c\x04\x08\x43\x1c\x09\x00\x00\x00\x00\x00\x00\
-\x00\x14\x9d\x32\x92\x30\x94\x91\x00\xc1\x88\x23\x01\x00\x00\x00\
-\x00\x00\x00\x80\x42\x53\x46\x12\x86\x32\x12\x20\x24\x71\x24\x00\
-\x00\x00\x00\x00\x00\x00\x50\x5c\xca\x48\xc2\x50\x46\x02\x04\x26\
-\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x0a\x4a\x19\x49\x18\xca\x48\
-\x80\xf0\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x40\x11\x29\x23\x09\
-\x43\x19\x09\x90\x08\x71\x24\x00\x00\x00\x00\x00\x00\x00\x50\x38\
-\xca\x48\xc2\x50\x46\x02\x24\x45\x1c\x09\x00\x00\x00\x00\x00\x00\
-\x00\x14\x8b\x32\x92\x30\x94\x91\x00\x09\x12\x47\x02\x00\x00\x00\
-\x00\x00\x00\x00\x05\xa2\x8c\x24\x0c\x65\x24\x40\xb2\xc4\x91\x00\
-\x00\x00\x00\x00\x00\x00\x40\x51\x28\x23\x09\x43\x19\x09\x90\x38\
-\x71\x24\x00\x00\x00\x00\x00\x00\x00\x50\x08\xca\x48\xc2\x50\x46\
-\x02\xa4\x81\x38\x12\x00\x00\x00\x00\x00\x00\x00\xc8\x3f\x65\x24\
-\x61\x28\x23\x01\x52\x42\x1c\x09\x00\x00\x00\x00\x00\x00\x00\xe4\
-\x9c\x32\x92\x30\x94\x91\x00\xe9\x21\x8e\x04\x00\x00\x00\x00\x00\
-\x00\x00\xf2\x4c\x19\x49\x18\xca\x48\x80\x54\x11\x47\x02\x00\x00\
-\x00\x00\x00\x00\x00\xb9\xa5\x8c\x24\x0c\x65\x24\x40\xda\x88\x23\
-\x01\x00\x00\x00\x00\x00\x00\x80\x7c\x52\x46\x12\x86\x32\x12\x20\
-\x85\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x40\x0e\x29\x23\x09\x43\
-\x19\x09\x90\x4e\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x20\x6f\x94\
-\x91\x84\xa1\x8c\x04\x48\x2d\x71\x24\x00\x00\x00\x00\x00\x00\x00\
-\x90\x2b\xca\x48\xc2\x50\x46\x02\xa4\x99\x38\x12\x00\x00\x00\x00\
-\x00\x00\x00\xc8\x0f\x65\x24\x61\x28\x23\x01\x52\x4e\x1c\x09\x00\
-\x00\x00\x00\x00\x00\x00\xe4\x84\x32\x92\x30\x94\x91\x00\xe9\x27\
-\x8e\x04\x00\x00\x00\x00\x00\x00\x00\xf2\x40\x19\x49\x18\xca\x48\
-\x80\x4c\x10\x47\x02\x00\x00\x00\x00\x00\x00\x00\x99\xa7\x8c\x24\
-\x0c\x65\x24\x40\x56\x88\x23\x01\x00\x00\x00\x00\x00\x00\x80\x6c\
-\x53\x46\x12\x86\x32\x12\x20\x43\xc4\x91\x00\x00\x00\x00\x00\x00\
-\x00\x40\x86\x29\x23\x09\x43\x19\x09\x90\x2d\xe2\x48\x00\x00\x00\
-\x00\x00\x00\x00\x20\xab\x94\x91\x84\xa1\x8c\x04\xc8\x1c\x71\x24\
-\x00\x00\x00\x00\x00\x00\x00\x90\x49\xca\x48\xc2\x50\x46\x02\x64\
-\x91\x38\x12\x00\x00\x00\x00\x00\x00\x00\xc8\x1e\x65\x24\x61\x28\
-\x23\x01\x32\x4a\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x64\x8c\x32\
-\x92\x30\x94\x91\x00\xd9\x25\x8e\x04\x00\x00\x00\x00\x00\x00\x00\
-\xb2\x44\x19\x49\x18\xca\x48\x80\x4c\x13\x47\x02\x00\x00\x00\x00\
-\x00\x00\x00\x99\xa1\x8c\x24\x0c\x65\x24\x40\xd6\x89\x23\x01\x00\
-\x00\x00\x00\x00\x00\x80\x6c\x50\x46\x12\x86\x32\x12\x20\x07\xc4\
-\x91\x00\x00\x00\x00\x00\x00\x00\x40\x06\x28\x23\x09\x43\x19\x09\
-\x90\x0f\xe2\x48\x00\x00\x00\x00\x00\x00\x00\x20\xed\x94\x91\x84\
-\xa1\x8c\x04\xc8\x0d\x71\x24\x00\x00\x00\x00\x00\x00\x00\x90\x6a\
-\xca\x48\xc2\x50\x46\x02\xe4\x89\x38\x12\x00\x00\x00\x00\x00\x00\
-\x00\x48\x2f\x65\x24\x61\x28\x23\x01\x72\x46\x1c\x09\x00\x00\x00\
-\x00\x00\x00\x00\xa4\x94\x32\x92\x30\x94\x91\x00\xf9\x23\x8e\x04\
-\x00\x00\x00\x00\x00\x00\x00\xd2\x48\x19\x49\x18\xca\x48\x80\x5c\
-\x12\x47\x02\x00\x00\x00\x00\x00\x00\x00\xa9\xa3\x8c\x24\x0c\x65\
-\x24\x40\x5e\x89\x23\x01\x00\x00\x00\x00\x00\x00\x80\x74\x51\x46\
-\x12\x86\x32\x12\x20\xc7\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x40\
-\x8a\x28\x23\x09\x43\x19\x09\x90\x6f\xe2\x48\x00\x00\x00\x00\x00\
-\x00\x00\x20\x2d\x94\x91\x84\xa1\x8c\x04\xc8\x3d\x71\x24\x00\x00\
-\x00\x00\x00\x00\x00\x90\x0a\xca\x48\xc2\x50\x46\x02\x14\x81\x38\
-\x12\x00\x00\x00\x00\x00\x00\x00\x48\x9e\x32\x92\x30\x94\x91\x00\
-\x05\x21\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x12\xa6\x8c\x24\x0c\
-\x65\x24\x40\x71\x88\x23\x01\x00\x00\x00\x00\x00\x00\x80\x24\x29\
-\x23\x09\x43\x19\x09\x50\x28\x7f\x60\x04\x00\x00\x90\x15\x71\x1c\
-\xf7\xfb\xfd\xeb\x3e\x3c\x28\xdc\xf8\x7a\xe3\x8b\xe8\x43\x97\xfe\
-\xc0\xd2\xd2\x92\x29\x01\x00\x00\x00\x8c\xc9\xf4\xf4\xf4\xa5\xaf\
-\xab\x1f\xda\xf8\xa2\x5c\x2e\x4f\x4d\x4d\x6d\x7c\xb1\xf1\xeb\xc6\
-\xd7\xa6\x04\xbb\xa0\x8c\x24\x0c\x65\x24\x40\xd1\xec\x5b\x5f\x5f\
-\x37\x05\x00\x00\x48\x95\xcd\x08\x72\x33\x7c\xdc\xec\x20\x37\x7e\
-\xcd\xd0\xc9\x20\x00\x00\x00\x40\x61\x95\x4a\xa5\xcd\x4a\x72\xe3\
-\xd7\xcd\x80\x52\x34\x09\x5b\x53\x46\x12\x86\x32\x12\xa0\x80\xc4\
-\x91\x00\x00\x90\xb0\xcd\xf6\xb1\xd7\xeb\x6d\xd6\x90\x6e\x7f\x04\
-\x00\x00\x00\xc8\x9f\xe9\xe9\xe9\xcd\x56\xb2\xd1\x68\xc8\x25\xe1\
-\x12\x65\x24\x61\x28\x23\x01\x8a\x49\x1c\x09\x00\x00\xa1\xc5\x71\
-\xdc\xeb\xf5\x36\x83\x48\x57\x42\x02\x00\x00\x00\x14\xd0\xe6\x05\
-\x93\x9b\xa1\xe4\xc6\xaf\x5a\x49\x8a\x49\x19\x49\x18\xca\x48\x80\
-\xc2\x12\x47\x02\x00\x40\x08\x97\x52\xc8\x8d\x5f\x87\xc3\xa1\x81\
-\x00\x00\x00\x00\x70\x49\xa5\x52\xb9\x14\x4a\x6e\xfc\x6a\x20\x14\
-\x81\x32\x92\x30\x94\x91\x00\x45\x26\x8e\x04\x00\x80\x71\xd9\x4c\
-\x21\x37\xb9\x1e\x12\x00\x00\x00\x80\xed\x28\x95\x4a\x8d\xff\x4f\
-\x28\x49\x5e\x29\x23\x09\x43\x19\x09\x50\x70\xe2\x48\x00\x00\x18\
-\xa5\xcd\x57\x66\x77\xbb\x5d\x37\x44\x02\x00\x00\x00\xb0\x47\x9b\
-\x37\x4a\x6e\x98\x99\x99\xf1\xea\x6d\x72\x43\x19\x49\x18\xca\x48\
-\x00\xc4\x91\x00\x00\x30\x02\x51\x14\x75\x3f\xb4\xb4\xb4\x64\x1a\
-\x00\x00\x00\x00\x8c\xdc\xf4\xf4\xf4\xcc\x87\xaa\xd5\xaa\x69\x90\
-\x5d\xca\x48\xc2\x50\x46\x02\x70\x9d\x38\x12\x00\x00\xf6\xa2\xdf\
-\xef\x2f\x2c\x2c\xf4\x7a\xbd\xc1\x60\x60\x1a\x00\x00\x00\x00\x04\
-\x50\xaf\xd7\x1b\x8d\x46\xab\xd5\xf2\xd2\x6d\x32\x47\x19\x49\x18\
-\xca\x48\x00\x36\x89\x23\x01\x00\x60\xc7\xa2\x28\x5a\xf8\x90\x17\
-\x67\x03\x00\x00\x00\x90\x94\x4a\xa5\x32\x33\x33\xd3\x6e\xb7\xdd\
-\x25\x49\x26\x28\x23\x09\x43\x19\x09\xc0\x25\xe2\x48\x00\x00\xd8\
-\xae\x38\x8e\x37\x9b\x48\xf7\x44\x02\x00\x00\x00\x90\x1e\xf5\x7a\
-\xbd\xf5\xa1\x72\xb9\x6c\x1a\xa4\x93\x32\x92\x30\x94\x91\x00\x7c\
-\x94\x38\x12\x00\x00\xae\xad\xdb\xed\x2e\x2c\x2c\x2c\x2e\x2e\x1a\
-\x05\x00\x00\x00\x00\xa9\x75\xec\xd8\xb1\x56\xab\x35\x33\x33\x63\
-\x14\xa4\x8a\x32\x92\x30\x94\x91\x00\x5c\x46\x1c\x09\x00\x00\x57\
-\xe5\xf5\xd9\x00\x00\x00\x00\x64\x4e\xa5\x52\xd9\xbc\x48\xd2\xeb\
-\xb6\x49\x03\x65\x24\x61\x28\x23\x01\xf8\x38\x71\x24\x00\x00\x5c\
-\x41\xaf\xd7\x9b\x9f\x9f\x77\x55\x24\x00\x00\x00\x00\xd9\xe5\x22\
-\x49\x12\xa7\x8c\x24\x0c\x65\x24\x00\x57\x24\x8e\x04\x00\x80\xdf\
-\x89\xe3\xb8\xdb\xed\x76\x3a\x1d\x57\x45\x02\x00\x00\x00\x90\x0f\
-\x95\x4a\xa5\xd3\xe9\xcc\xcc\xcc\x94\xcb\x65\xd3\x20\x24\x65\x24\
-\x61\x28\x23\x01\xb8\x1a\x71\x24\x00\x00\xfc\xc6\xe6\x1b\xb4\xe7\
-\xe7\xe7\x33\x74\x54\x07\x00\x00\x00\x00\xdb\x54\x2a\x95\xda\xed\
-\xb6\x77\x6d\x13\x8c\x32\x92\x30\x94\x91\x00\x6c\x41\x1c\x09\x00\
-\x40\xd1\x45\x51\xd4\xe9\x74\x4e\x9f\x3e\x6d\x14\x00\x00\x00\x00\
-\xe4\xde\xc3\x0f\x3f\xdc\xe9\x74\x24\x92\x8c\x95\x32\x92\x30\x94\
-\x91\x00\x6c\x4d\x1c\x09\x00\x40\x71\xc9\x22\x01\x00\x00\x00\x28\
-\x26\x89\x24\xe3\xa3\x8c\x24\x0c\x65\x24\x00\xd7\x24\x8e\x04\x00\
-\xa0\x88\x64\x91\x00\x00\x00\x00\x20\x91\x64\xe4\x94\x91\x84\xa1\
-\x8c\x04\x60\x3b\xc4\x91\x00\x00\x14\x8b\x2c\x12\x00\x00\x00\x00\
-\x3e\x4a\x22\xc9\xa8\x28\x23\x09\x43\x19\x09\xc0\x36\x89\x23\x01\
-\x00\x28\x0a\x59\x24\x00\x00\x00\x00\x5c\x8d\x44\x92\x3d\x52\x46\
-\x12\x86\x32\x12\x80\xed\x13\x47\x02\x00\x90\x7f\x71\x1c\xcf\x7f\
-\x28\x43\x07\x73\x00\x00\x00\x00\x10\xde\x93\x4f\x3e\xd9\x6e\xb7\
-\xcb\xe5\xb2\x51\xb0\x23\xca\x48\xc2\x50\x46\x02\xb0\x23\xe2\x48\
-\x00\x00\x72\x6e\x61\x61\xa1\xdd\x6e\xcb\x22\x01\x00\x00\x00\x60\
-\x3b\x4a\xa5\x52\xa7\xd3\x69\xb7\xdb\x46\xc1\x36\x29\x23\x09\x43\
-\x19\x09\xc0\x4e\x89\x23\x01\x00\xc8\xad\x5e\xaf\xd7\x6e\xb7\x07\
-\x83\x81\x51\x00\x00\x00\x00\xc0\x8e\x54\x2a\x95\x85\x85\x85\x46\
-\xa3\x61\x14\x6c\x4d\x19\x49\x18\xca\x48\x00\x76\xe1\x7a\x23\x00\
-\x00\x20\x7f\xa2\x28\x9a\x99\x99\x69\x36\x9b\xca\x48\x00\x00\x00\
-\x00\xd8\x85\xe1\x70\xd8\x6c\x36\x67\x66\x66\xa2\x28\x32\x0d\xae\
-\x46\x19\x49\x18\xca\x48\x00\x76\x47\x1c\x09\x00\x40\xde\x74\x3a\
-\x9d\xa9\xa9\xa9\xc5\xc5\x45\xa3\x00\x00\x00\x00\x80\xbd\x58\x5c\
-\x5c\x9c\x9a\x9a\xea\x64\xaa\x49\x22\x18\x65\x24\x61\x28\x23\x01\
-\xd8\x35\xaf\xd5\x06\x00\x20\x3f\xbc\x47\x1b\x00\x00\x00\x00\xc6\
-\xc1\x5b\xb6\xb9\x8c\x32\x92\x30\x94\x91\x00\xec\x85\x9b\x23\x01\
-\x00\xc8\x83\x38\x8e\xdb\xed\xb6\xf7\x68\x03\x00\x00\x00\xc0\x38\
-\x6c\xbe\x65\xbb\xdd\x6e\xc7\x71\x6c\x1a\x28\x23\x09\x43\x19\x09\
-\xc0\x1e\xb9\x39\x12\x00\x80\xcc\xeb\xf5\x7a\xad\x56\x6b\x38\x1c\
-\x1a\x05\x00\x00\x00\x00\x8c\x55\xa9\x54\x5a\x58\x58\x98\x99\x99\
-\x31\x8a\xc2\x52\x46\x12\x86\x32\x12\x80\xbd\x13\x47\x02\x00\x90\
-\x61\x71\x1c\xb7\x5a\xad\xc5\xc5\x45\xa3\x00\x00\x00\x00\x80\x60\
-\x8e\x1d\x3b\xb6\xb0\xb0\x50\x2e\x97\x8d\xa2\x68\x94\x91\x84\xa1\
-\x8c\x04\x60\x24\xc4\x91\x00\x00\x64\x95\x0b\x23\x01\x00\x00\x00\
-\x20\x29\xa5\x52\xa9\xdb\xed\x36\x1a\x0d\xa3\x28\x0e\x65\x24\x61\
-\x28\x23\x01\x18\x95\xeb\x8d\x00\x00\x80\xcc\x89\xe3\xb8\xdd\x6e\
-\x37\x9b\x4d\x65\x24\x00\x00\x00\x00\x24\x62\x75\x75\xb5\xd9\x6c\
-\xb6\xdb\xed\x38\x8e\x4d\xa3\x08\x94\x91\x84\xa1\x8c\x04\x60\x84\
-\xdc\x1c\x09\x00\x40\xc6\xf4\xfb\xfd\x56\xab\x35\x18\x0c\x8c\x02\
-\x00\x00\x00\x00\x12\x57\xaf\xd7\x17\x16\x16\xa6\xa6\xa6\x8c\x22\
-\xc7\x94\x91\x84\xa1\x8c\x04\x60\xb4\xdc\x1c\x09\x00\x40\x96\xcc\
-\xcf\xcf\x1f\x3c\x78\x50\x19\x09\x00\x00\x00\x00\x29\x31\x18\x0c\
-\x0e\x1e\x3c\x38\x3f\x3f\x6f\x14\x79\xa5\x8c\x24\x0c\x65\x24\x00\
-\x23\xe7\xe6\x48\x00\x00\xb2\x21\x8e\xe3\x56\xab\xb5\xb8\xb8\x68\
-\x14\x00\x00\x00\x00\x90\x42\xc7\x8e\x1d\x5b\x58\x58\x28\x97\xcb\
-\x46\x91\x27\xca\x48\xc2\x50\x46\x02\x30\x0e\xe2\x48\x00\x00\x32\
-\xa0\xdf\xef\xcf\xcc\xcc\x0c\x87\x43\xa3\x00\x00\x00\x00\x80\xd4\
-\xaa\x54\x2a\xdd\x6e\xd7\x2b\xb6\x73\x43\x19\x49\x18\xca\x48\x00\
-\xc6\xc4\x6b\xb5\x01\x00\x48\xbb\xcd\x57\x69\x2b\x23\x01\x00\x00\
-\x00\x20\xe5\x86\xc3\xa1\x57\x6c\xe7\x86\x32\x92\x30\x94\x91\x00\
-\x8c\x8f\x9b\x23\x01\x00\x48\xaf\x38\x8e\xdb\xed\xf6\xe9\xd3\xa7\
-\x8d\x02\x00\x00\x00\x00\x32\xe4\xe1\x87\x1f\x9e\x9f\x9f\xf7\x8a\
-\xed\xec\x52\x46\x12\x86\x32\x12\x80\xb1\x12\x47\x02\x00\x90\x52\
-\x51\x14\xcd\xcc\xcc\x0c\x06\x03\xa3\x00\x00\x00\x00\x80\xcc\xa9\
-\xd7\xeb\xdd\x6e\xb7\x5a\xad\x1a\x45\xe6\x28\x23\x09\x43\x19\x09\
-\xc0\xb8\x89\x23\x01\x00\x48\xa3\xcc\x9d\xbe\x01\x00\x00\x00\x00\
-\x97\x29\x95\x4a\xdd\x6e\xb7\xd1\x68\x18\x45\x86\x28\x23\x09\x43\
-\x19\x09\x40\x00\xd7\x1b\x01\x00\x00\x69\xb3\xb0\xb0\x70\xf0\xe0\
-\x41\x65\x24\x00\x00\x00\x00\x64\xda\xea\xea\x6a\xb3\xd9\x94\x13\
-\x65\x88\x32\x92\x30\x94\x91\x00\x84\xe1\xe6\x48\x00\x00\xd2\xa5\
-\xdd\x6e\x7f\xef\x7b\xdf\x33\x87\x5d\x3b\x3e\x3b\x5b\x2e\x97\xcd\
-\x01\x00\x00\x00\x60\x84\xe2\x38\x7e\xf9\x95\x57\xcc\x61\xd7\x74\
-\x45\x99\xa0\x8c\x24\x0c\x65\x24\x00\xc1\x88\x23\x01\x00\x48\x8b\
-\x38\x8e\xdb\xed\xf6\xe9\xd3\xa7\x8d\x62\x0b\x9b\xed\xe3\x81\x3b\
-\x0f\x7c\xe2\x13\x9f\xb8\xe5\x0f\x6f\xb9\xe9\xe6\x9b\x37\x7e\xb3\
-\x56\xab\x39\x01\x04\x00\x00\x00\x08\x63\x6d\x6d\x6d\x79\x79\x79\
-\xe3\x8b\x8b\xef\xbf\xff\xde\xbf\xbd\xf7\xc1\x07\x1f\xbc\x73\xe1\
-\x1d\xf5\xe4\x35\x1d\x3b\x76\x6c\x61\x61\xc1\x8f\xf5\xa6\x96\x32\
-\x92\x30\x94\x91\x00\x84\x24\x8e\x04\x00\x20\x15\xe2\x38\x6e\x34\
-\x1a\x83\xc1\xc0\x28\x2e\xa9\x56\x2b\x47\xfe\xec\xc8\x81\x3b\x0f\
-\xdc\x72\xcb\x2d\xb7\xdd\x76\xfb\x4d\x37\xdd\x34\x39\x39\x69\x2c\
-\x00\x00\x00\x00\xa9\xb5\xd9\x4d\xfe\xfc\xe7\x3f\x7b\xef\xbd\xf7\
-\xde\xb9\xf0\xce\xb9\xff\x73\x2e\x8a\x86\xc6\x72\x49\xbd\x5e\xef\
-\xf5\x7a\xfa\xc8\x14\x52\x46\x12\x86\x32\x12\x80\xc0\xc4\x91\x00\
-\x00\x24\xaf\xdf\xef\xb7\x5a\x2d\x65\xe4\x66\x0d\x79\xcf\xa1\x7b\
-\x6e\xbf\xed\xf6\x4f\x7d\xfa\xd3\x52\x48\x00\x00\x00\x80\xac\x5b\
-\x59\x59\xf9\xe5\x2f\x7e\xf1\xb3\x9f\xff\xec\x1f\x7e\xf2\x0f\x5a\
-\xc9\x0d\x95\x4a\xa5\xdb\xed\x4e\x4d\x4d\xf9\x67\x23\x3d\x94\x91\
-\x84\xa1\x8c\x04\x20\x3c\x71\x24\x00\x00\x09\xcb\xdc\xd1\xdb\x68\
-\x55\xab\x95\xd9\xfb\x67\xef\xfe\x93\xbb\x3f\xf3\x99\xbb\x6a\xb5\
-\x9a\x7f\x1e\x00\x00\x00\x00\x72\x6c\x79\x79\xf9\xa7\x3f\xfd\xe7\
-\x7f\xfd\xbf\xff\xda\x5b\xea\x9d\x3f\xdf\x2b\xe6\x10\x4a\xa5\x52\
-\xaf\xd7\xd3\x47\xa6\x84\x32\x92\x30\x94\x91\x00\x24\x42\x1c\x09\
-\x00\x40\x92\x0a\x5b\x46\x3e\x7e\xf2\xa4\x20\x12\x00\x00\x00\xa0\
-\xc8\x36\x43\xc9\xb7\xff\xf1\xed\xa7\x4f\x9d\x2a\xda\xb3\xeb\x23\
-\x53\x42\x19\x49\x18\xca\x48\x00\x92\x22\x8e\x04\x00\x20\x31\x0b\
-\x0b\x0b\xed\x76\xbb\x38\x65\x64\xb5\x5a\xf9\x6a\xeb\xab\x47\x8e\
-\x1c\x39\x74\xf8\xb0\xdd\x07\x00\x00\x00\xe0\x92\x9f\xbc\xf5\xd6\
-\xb9\x73\xe7\x8a\x76\x9d\xe4\x0b\x2f\xbc\xd0\x6a\xb5\xec\x7e\x52\
-\x94\x91\x84\xa1\x8c\x04\x20\x41\xe2\x48\x00\x00\x92\xb1\xb0\xb0\
-\xf0\xd5\xaf\x7e\xb5\x08\x4f\xda\x6c\x36\xbe\xfc\xe5\x2f\x7f\xe9\
-\x4b\x5f\x76\x49\x24\x00\x00\x00\x00\x5b\x5b\x5e\x5e\x7e\xfd\xf5\
-\xd7\x36\x14\xa4\x92\xd4\x47\x26\x45\x19\x49\x18\xca\x48\x00\x92\
-\x25\x8e\x04\x00\x20\x01\x45\x28\x23\x37\xef\x89\x3c\x36\x33\x53\
-\xaf\xd7\xed\x38\x00\x00\x00\x00\x3b\x32\x18\x0c\x16\xbb\xdd\x17\
-\x16\x5e\x88\xa2\x61\xbe\x9f\x54\x1f\x19\x9e\x32\x92\x30\x94\x91\
-\x00\x24\x4e\x1c\x09\x00\x40\x68\xb9\x2f\x23\x4f\xcc\xcd\x3d\xf0\
-\xc0\x03\xf7\x1d\x3d\x6a\xaf\x01\x00\x00\x00\xd8\xa3\x1f\x9f\x39\
-\xf3\xb7\x7f\xfb\xb7\xcf\x3d\xff\x7c\x8e\x9f\x51\x1f\x19\x92\x32\
-\x92\x30\x94\x91\x00\xa4\x81\x38\x12\x00\x80\xa0\x72\x5c\x46\x56\
-\xab\x95\xc7\x1e\x7b\xec\xcf\xff\xfc\x3f\x4e\x4e\x4e\xda\x68\x00\
-\x00\x00\x00\x46\x68\x65\x65\xe5\xef\xfe\xee\x7f\x7f\xfb\xdb\xdf\
-\xce\xeb\x45\x92\xfa\xc8\x30\x94\x91\x84\xa1\x8c\x04\x20\x25\xc4\
-\x91\x00\x00\x84\x93\xd7\x32\xf2\xf8\xec\xec\xa3\x8f\x3e\xea\xaa\
-\x48\x00\x00\x00\x00\xc6\xed\xc7\x67\xce\x7c\xff\xfb\xdf\x7f\xf9\
-\x95\x57\xf2\xf7\x68\xfa\xc8\x71\x53\x46\x12\x86\x32\x12\x80\xf4\
-\x10\x47\x02\x00\x10\x48\x2e\xcb\xc8\xc7\x4f\x9e\xfc\x2f\x0f\x3f\
-\x5c\xaf\xd7\xed\x2f\x00\x00\x00\x00\xc1\x0c\x06\x83\xff\x79\xfa\
-\xf4\xd3\xa7\x4e\xe5\xec\xb9\xf4\x91\xe3\xa3\x8c\x24\x0c\x65\x24\
-\x00\xa9\x22\x8e\x04\x00\x20\x84\xfc\x95\x91\x4f\x75\x3a\xff\xf5\
-\x6b\x5f\xf3\x06\x6d\x00\x00\x00\x00\x92\xb2\xb2\xb2\xf2\x3f\x9e\
-\x7d\x36\x5b\x1d\xd2\x35\xe9\x23\xc7\x41\x19\x49\x18\xca\x48\x00\
-\xd2\x46\x1c\x09\x00\xc0\xd8\xf5\x7a\xbd\x66\xb3\x99\x9b\xc7\x91\
-\x45\x02\x00\x00\x00\x90\x1e\xf9\x4b\x24\x5f\x7d\xf5\xd5\x99\x99\
-\x19\x3b\x3b\x2a\xca\x48\xc2\x50\x46\x02\x90\x42\xe2\x48\x00\x00\
-\xc6\x2b\x73\x47\x6f\x5b\x90\x45\x02\x00\x00\x00\x90\x4e\x79\x4a\
-\x24\x4b\xa5\x52\xaf\xd7\x9b\x9a\x9a\xb2\xad\x7b\xa7\x8c\x24\x0c\
-\x65\x24\x00\xe9\x24\x8e\x04\x00\x60\x8c\x72\x53\x46\x3e\x7e\xf2\
-\xe4\x5f\x7e\xf3\x9b\xb2\x48\x00\x00\x00\x00\xd2\x2c\x37\x89\xa4\
-\x3e\x72\x24\x94\x91\x84\xa1\x8c\x04\x20\xb5\xc4\x91\x00\x00\x8c\
-\x4b\x1c\xc7\x53\x53\x53\xc3\xe1\x30\xd3\x4f\x71\x62\x6e\xee\x2f\
-\xbe\xfe\xf5\x7a\xbd\x6e\x43\x01\x00\x00\x00\xc8\x84\xc1\x60\xf0\
-\xdf\xff\xe6\x6f\x9e\x7b\xfe\xf9\x4c\x3f\x45\xa9\x54\x8a\xa2\xa8\
-\x5c\x2e\xdb\xd0\xdd\x51\x46\x12\x86\x32\x12\x80\x34\x13\x47\x02\
-\x00\x30\x16\x71\x1c\x37\x1a\x8d\xc1\x60\x90\xdd\x47\x68\x36\x1b\
-\xdf\xfc\xcb\x6f\xde\x77\xf4\xa8\xdd\x04\x00\x00\x00\x20\x73\x7e\
-\x7c\xe6\xcc\x5f\x7f\xe7\xaf\xcf\x9f\xef\x65\xf7\x11\xea\xf5\x7a\
-\xaf\xd7\xd3\x47\xee\x82\x32\x92\x30\x94\x91\x00\xa4\x9c\x38\x12\
-\x00\x80\xb1\x68\x34\x1a\x4b\x4b\x4b\xd9\x5d\xff\x73\xcf\xfd\xe0\
-\xc1\x07\x1f\x72\x18\x07\x00\x00\x00\x40\x76\xad\xad\xad\xbd\xf4\
-\xd2\x8f\x4e\x9c\x78\x24\xbb\x8f\x30\x3d\x3d\xdd\xeb\xf5\x6c\xe5\
-\x8e\x28\x23\x09\x43\x19\x09\x40\xfa\x5d\x6f\x04\x00\x00\x8c\x5c\
-\xab\xd5\xca\x6e\x19\x79\x62\x6e\xee\xe2\xc5\x8b\x73\x73\x27\x1c\
-\xc6\x01\x00\x00\x00\x90\x69\x13\x13\x13\x73\x73\x27\x2e\x5e\xbc\
-\x78\x62\x6e\x2e\xa3\x8f\xb0\xb4\xb4\xd4\x6a\xb5\x6c\xe5\xf6\x29\
-\x23\x09\x43\x19\x09\x40\x26\xb8\x39\x12\x00\x80\x11\x9b\x9f\x9f\
-\x3f\x79\xf2\x64\x16\x57\x5e\xad\x56\x9e\x7d\xe6\x59\xef\xd1\x06\
-\x00\x00\x00\x20\x7f\x7e\xf2\xd6\x5b\x5f\xf9\xcf\x5f\x89\xa2\x61\
-\x16\x17\x7f\xea\xd4\xa9\x76\xbb\x6d\x13\xaf\x49\x19\x49\x18\xca\
-\x48\x00\xb2\x42\x1c\x09\x00\xc0\x28\x75\xbb\xdd\xfb\xef\xbf\x3f\
-\x8b\x2b\x7f\xfc\xe4\xc9\xa7\xfe\xea\xaf\x1c\xc3\x01\x00\x00\x00\
-\x90\x57\x6b\x6b\x6b\x4f\x7e\xeb\x5b\x4f\x9f\x3a\x95\xc5\xc5\xbf\
-\xfa\xea\xab\x33\x33\x33\x36\x71\x0b\xca\x48\xc2\x50\x46\x02\x90\
-\x21\xe2\x48\x00\x00\x46\x26\x73\xa7\x6f\x9b\xaa\xd5\xca\x8b\x3f\
-\x7c\xf1\xd0\xe1\xc3\x76\x10\x00\x00\x00\x80\xdc\xcb\xe8\x15\x92\
-\xa5\x52\xa9\xd7\xeb\x4d\x4d\x4d\xd9\xc1\x2b\x52\x46\x12\x86\x32\
-\x12\x80\x6c\xb9\xde\x08\x00\x00\x18\x89\x38\x8e\x5b\xad\x56\xe6\
-\xca\xc8\xc7\x4f\x9e\xbc\x70\xe1\x1d\x65\x24\x00\x00\x00\x00\x05\
-\x71\xe8\xf0\xe1\x0b\x17\xde\x79\xfc\xe4\xc9\x6c\x2d\x7b\x75\x75\
-\xb5\xd5\x6a\xc5\x71\x6c\x07\x3f\x4e\x19\x49\x18\xca\x48\x00\x32\
-\x47\x1c\x09\x00\xc0\x68\xb4\x5a\xad\xc1\x60\x90\xa1\x05\x57\xab\
-\x95\x97\x5e\xfa\xd1\x77\x9f\x7e\xda\x19\x1c\x00\x00\x00\x00\x85\
-\x32\x31\x31\xf1\xdd\xa7\x9f\x7e\xe9\xa5\x1f\x55\xab\x95\x0c\x2d\
-\x7b\x30\x18\xb4\x5a\x2d\xdb\x77\x19\x65\x24\x61\x28\x23\x01\xc8\
-\x22\x71\x24\x00\x00\x23\xd0\xe9\x74\x16\x17\x17\x33\xb4\xe0\xe3\
-\xb3\xb3\x67\xcf\x9e\x7b\xe0\x81\x07\xed\x1d\x00\x00\x00\x00\xc5\
-\xf4\xc0\x03\x0f\x9e\x3d\x7b\xee\xf8\xec\x6c\x86\xd6\xbc\xb8\xb8\
-\xd8\xc9\x54\x9e\x35\x6e\xca\x48\xc2\x50\x46\x02\x90\x51\xfb\xd6\
-\xd7\xd7\x4d\x01\x00\x80\xbd\xe8\xf5\x7a\xcd\x66\x33\x43\x0b\x7e\
-\xaa\xd3\x79\xfc\x1b\xdf\x70\x00\x07\x00\x00\x00\x00\x6b\x6b\x6b\
-\x4f\x7f\xf7\xbb\xd9\xca\x9e\xce\x9f\x3f\xdf\x68\x34\xec\x9d\x32\
-\x92\x30\x94\x91\x00\x64\x97\x38\x12\x00\x80\x3d\x89\xe3\xb8\x5a\
-\xad\x66\xe5\x00\xae\x5a\xad\x3c\xfb\xcc\xb3\xf7\x1d\x3d\x6a\xe3\
-\x00\x00\x00\x00\xe0\x92\x1f\x9f\x39\xf3\xb5\xff\xf6\xb5\x28\x1a\
-\x66\x62\xb5\xa5\x52\xa9\xdf\xef\x57\xab\xd5\x22\x6f\x99\x32\x92\
-\x30\x94\x91\x00\x64\x9a\xd7\x6a\x03\x00\xb0\x27\x33\x33\x33\x59\
-\x39\x80\x6b\x36\x1b\x67\xcf\x9e\x53\x46\x02\x00\x00\x00\xc0\x65\
-\xee\x3b\x7a\xf4\xec\xd9\x73\xcd\x66\x23\x13\xab\x5d\x5d\x5d\x9d\
-\x99\x99\x29\xf2\x7e\x29\x23\x09\x43\x19\x09\x40\xd6\x89\x23\x01\
-\x00\xd8\xbd\x4e\xa7\xb3\xb4\xb4\x94\x89\xa5\x9e\x98\x9b\x7b\xed\
-\xb5\xd7\x6b\xb5\x9a\x5d\x03\x00\x00\x00\x80\x8f\xab\xd5\x6a\xaf\
-\xbd\xf6\xfa\x89\xb9\xb9\x4c\xac\x76\x30\x18\x74\x32\xd5\x6c\x8d\
-\x90\x32\x92\x30\x94\x91\x00\xe4\x80\xd7\x6a\x03\x00\xb0\x4b\xbd\
-\x5e\xaf\xd9\x6c\x66\x62\xa9\x4f\x75\x3a\xdf\x7a\xf2\x49\x5b\x06\
-\x00\x00\x00\x00\xd7\x94\xa1\x22\xea\xfc\xf9\xf3\x8d\x46\xa3\x50\
-\xbb\xa3\x8c\xc4\xbf\x07\xae\x48\x19\x09\xc0\x15\x89\x23\x01\x00\
-\xd8\x8d\x38\x8e\xa7\xa6\xa6\x86\xc3\x61\xfa\x97\x7a\xe6\x8d\x37\
-\xbc\x4a\x1b\x00\x00\x00\x00\xb6\xef\xc7\x67\xce\x1c\xfd\xfc\xe7\
-\xd3\xbf\xce\x52\xa9\x14\x45\x51\xb9\x5c\x2e\xc8\xbe\x28\x23\x09\
-\x43\x19\x09\x40\x6e\x78\xad\x36\x00\x00\xbb\xd1\x6a\xb5\xd2\x5f\
-\x46\x56\xab\x95\xb7\xde\x7c\x53\x19\x09\x00\x00\x00\x00\x3b\x72\
-\xdf\xd1\xa3\x6f\xbd\xf9\x66\xb5\x5a\x49\xf9\x3a\x57\x57\x57\x5b\
-\xad\x56\x41\x36\x45\x19\x49\x18\xca\x48\x00\xf2\xc4\xcd\x91\x00\
-\x00\xec\x58\xb7\xdb\xbd\xff\xfe\xfb\x53\xbe\xc8\x6a\xb5\x72\xf6\
-\xec\xb9\x5a\xad\x66\xbf\x00\x00\x00\x00\x60\x17\x96\x97\x97\xef\
-\xbd\xf7\x48\x14\xa5\xfd\x67\xa4\x5f\x78\xe1\x85\xdc\x27\x92\xca\
-\x48\xc2\x50\x46\x02\x90\x33\x6e\x8e\x04\x00\x60\x67\xa2\x28\x4a\
-\xff\x51\xe3\xf1\xd9\x59\x65\x24\x00\x00\x00\x00\xec\x45\xad\x56\
-\x3b\x7b\xf6\xdc\xf1\xd9\xd9\x94\xaf\xb3\xdd\x6e\x47\x51\x94\xe3\
-\x8d\x50\x46\x12\x86\x32\x12\x80\xfc\x71\x73\x24\x00\x00\x3b\xd3\
-\x68\x34\x96\x96\x96\xd2\xbc\x42\x47\x6f\x00\x00\x00\x00\x30\x2a\
-\x6b\x6b\x6b\xad\x87\x1f\x7e\xf9\x95\x57\xd2\xbc\xc8\xe9\xe9\xe9\
-\x5e\xaf\x97\xcb\xf9\x2b\x23\x09\x43\x19\x09\x40\x2e\xb9\x39\x12\
-\x00\x80\x1d\x98\x9f\x9f\x57\x46\x02\x00\x00\x00\x40\x71\x4c\x4c\
-\x4c\x2c\x9c\x3e\x9d\xf2\xfb\x23\x97\x96\x96\xe6\xe7\xe7\xf3\x37\
-\x7c\x65\x24\x61\x28\x23\x01\xc8\x2b\x37\x47\x02\x00\xb0\x5d\x51\
-\x14\x4d\x4d\x4d\xa5\xf9\x24\xce\xd1\x1b\x00\x00\x00\x00\x8c\x43\
-\xfa\xef\x8f\x2c\x95\x4a\xfd\x7e\xbf\x5a\xad\xe6\x66\xe6\xca\x48\
-\xc2\x50\x46\x02\x90\x63\x6e\x8e\x04\x00\x60\xbb\xda\xed\xb6\x32\
-\x12\x00\x00\x00\x00\x0a\x28\xfd\xf7\x47\xae\xae\xae\xb6\x5a\xad\
-\xdc\x0c\x5c\x19\x49\x18\xca\x48\x00\xf2\x4d\x1c\x09\x00\xc0\xb6\
-\x74\xbb\xdd\xc5\xc5\xc5\xd4\x2e\xcf\xd1\x1b\x00\x00\x00\x00\x8c\
-\x55\xfa\xfb\xc8\xa5\xa5\xa5\x6e\xb7\x9b\x83\x51\x2b\x23\x09\x43\
-\x19\x09\x40\xee\x79\xad\x36\x00\x00\xd7\x16\xc7\x71\xb5\x5a\x4d\
-\xed\x61\x9c\xa3\x37\x00\x00\x00\x00\x08\x23\xe5\xef\xd7\x2e\x95\
-\x4a\x51\x14\x95\xcb\xe5\xec\x4e\x58\x19\x49\x18\xca\x48\x00\x8a\
-\xc0\xcd\x91\x00\x00\x5c\x5b\xa7\xd3\x51\x46\x02\x00\x00\x00\x00\
-\x29\xbf\x3f\x72\x75\x75\xb5\x93\xa9\xde\xeb\x32\xca\x48\xc2\x50\
-\x46\x02\x50\x10\x6e\x8e\x04\x00\xe0\x1a\xfa\xfd\xfe\xc1\x83\x07\
-\xd3\xb9\x36\x47\x6f\x00\x00\x00\x00\x10\x5e\xca\xef\x8f\x3c\x7f\
-\xfe\x7c\xa3\xd1\xc8\xdc\x54\x95\x91\x84\xa1\x8c\x04\xa0\x38\xc4\
-\x91\x00\x00\x5c\x43\xa3\xd1\x58\x5a\x5a\x4a\xe1\xc2\xaa\xd5\xca\
-\xdb\x6f\xff\xd3\xe4\xe4\xa4\x3d\x02\x00\x00\x00\x80\xc0\xd6\xd6\
-\xd6\xee\xbc\xf3\x40\x14\x0d\x53\xb8\xb6\x7a\xbd\xde\xef\xf7\xb3\
-\x35\x4f\x65\x24\x61\x28\x23\x01\x28\x14\xaf\xd5\x06\x00\x60\x2b\
-\x0b\x0b\x0b\xa9\x2d\x23\xcf\x9e\x3d\xa7\x8c\x04\x00\x00\x00\x80\
-\x44\x4c\x4c\x4c\x9c\x3d\x7b\xae\x5a\xad\xa4\x70\x6d\x83\xc1\x20\
-\x5b\x35\x95\x32\x92\x30\x94\x91\x00\x14\x8d\x9b\x23\x01\x00\xb8\
-\xaa\x38\x8e\xab\xd5\x6a\x3a\x8f\xe4\xfa\xfd\x7e\xbd\x5e\xb7\x47\
-\x00\x00\x00\x00\x90\xa0\xe5\xe5\xe5\x4f\x7d\xea\x53\x29\x5c\x58\
-\xa9\x54\x8a\xa2\xa8\x5c\x2e\xa7\x7f\x86\xca\x48\xc2\x50\x46\x02\
-\x50\x40\x6e\x8e\x04\x00\xe0\xaa\xe6\xe7\xe7\xd3\x79\x24\x77\xe6\
-\x8d\x37\x94\x91\x00\x00\x00\x00\x90\xb8\x5a\xad\x76\xe6\x8d\x37\
-\x52\xb8\xb0\xd5\xd5\xd5\xf9\xf9\xf9\xf4\x0f\x50\x19\x49\x18\xca\
-\x48\x00\x8a\xc9\xcd\x91\x00\x00\x5c\x59\x14\x45\xfb\xf7\xef\x4f\
-\xe1\xc2\x4e\x9d\x7a\xba\xdd\x3e\x69\x83\x00\x00\x00\x00\x20\x25\
-\x9e\x7f\xfe\xb9\x13\x27\x1e\x49\xe1\xc2\xde\x7d\xf7\xdd\x6a\xb5\
-\x9a\xda\xb9\x29\x23\x09\x43\x19\x09\x40\x61\xb9\x39\x12\x00\x80\
-\x2b\xeb\xa4\xf2\xac\xe4\xf1\x93\x27\x95\x91\x00\x00\x00\x00\x90\
-\x2a\x73\x73\x27\x1e\x3f\x99\xc6\x53\xbb\x76\xbb\x9d\xda\xa1\x29\
-\x23\x09\x43\x19\x09\x40\x91\xb9\x39\x12\x00\x80\x2b\xe8\xf5\x7a\
-\xcd\x66\x33\x6d\xab\x72\xfa\x06\x00\x00\x00\x00\xe9\xb4\xb6\xb6\
-\xd6\x7a\xf8\xe1\x97\x5f\x79\x25\x6d\x0b\x3b\x7f\xfe\x7c\xa3\xd1\
-\x48\xdb\xaa\x94\x91\x84\xa1\x8c\x04\xa0\xe0\xc4\x91\x00\x00\x5c\
-\x41\xa3\xd1\x58\x5a\x5a\x4a\xd5\x92\xaa\xd5\xca\xd9\xb3\xe7\x6a\
-\xb5\x9a\xdd\x01\x00\x00\x00\x80\x14\x5a\x5e\x5e\xbe\xf7\xde\x23\
-\x51\x34\x4c\xd5\xaa\xa6\xa7\xa7\x7b\xbd\x5e\xaa\x96\xa4\x8c\x24\
-\x0c\x65\x24\x00\x88\x23\x01\x00\xb8\x5c\x3a\xaf\x8d\x7c\xeb\xcd\
-\x37\x0f\x1d\x3e\x6c\x77\x00\x00\x00\x00\x20\xb5\x7e\xf2\xd6\x5b\
-\x87\xff\xf4\x4f\xd3\xb6\xaa\x54\x5d\x1e\xa9\x8c\x24\x0c\x65\x24\
-\x00\x6c\xb8\xde\x08\x00\x00\xb8\x4c\x27\x7d\x27\x26\xa7\x4e\x3d\
-\xad\x8c\x04\x00\x00\x00\x80\x94\x3b\x74\xf8\xf0\x73\xcf\xfd\x20\
-\x6d\xab\x6a\xb7\xdb\x29\x59\x89\x32\x92\x30\x94\x91\x00\xb0\x49\
-\x1c\x09\x00\xc0\xef\xe9\xf5\x7a\x69\x7b\xa1\xf6\xf1\xd9\xd9\x76\
-\xfb\xa4\xad\x01\x00\x00\x00\x80\xf4\x9b\x9b\x3b\x71\x62\x6e\x2e\
-\x55\x4b\x1a\x0c\x06\x69\xe8\xae\x94\x91\x84\xa1\x8c\x04\x80\x4b\
-\xbc\x56\x1b\x00\x80\xdf\x33\x35\x35\x35\x18\x0c\xd2\xb3\x9e\x6a\
-\xb5\xf2\xf6\xdb\xff\x34\x39\x39\x69\x6b\x00\x00\x00\x00\x20\x13\
-\x56\x56\x56\xee\xbe\xfb\x8f\xa3\x68\x98\x9e\x25\x55\x2a\x95\x28\
-\x8a\x12\x5c\x80\x32\x92\x30\x94\x91\x00\xf0\x51\x6e\x8e\x04\x00\
-\xe0\x77\xba\xdd\x6e\xaa\xca\xc8\x0d\x2f\xfe\xf0\x45\x65\x24\x00\
-\x00\x00\x00\x64\xc8\xe4\xe4\xe4\x8b\x3f\x7c\x31\x55\x4b\x1a\x0e\
-\x87\x09\x06\x58\xca\x48\xc2\x50\x46\x02\xc0\x65\xc4\x91\x00\x00\
-\xfc\xce\xfc\xfc\x7c\xaa\xd6\xf3\x54\xa7\x73\xe8\xf0\x61\xfb\x02\
-\x00\x00\x00\x00\xd9\x72\xe8\xf0\xe1\x53\xa7\x9e\x4e\xd5\x92\x3a\
-\x09\x45\x63\xca\x48\xc2\x50\x46\x02\xc0\xc7\x89\x23\x01\x00\xf8\
-\xad\x5e\xaf\xb7\xb4\xb4\x94\x9e\xf5\x34\x9b\x8d\xc7\xbf\xf1\x0d\
-\xfb\x02\x00\x00\x00\x00\x59\xf4\xc8\x23\x8f\x36\x9b\x8d\xf4\xac\
-\x67\x38\x1c\xf6\x7a\xbd\xc0\x1f\xaa\x8c\x24\x0c\x65\x24\x00\x5c\
-\xd1\xbe\xf5\xf5\x75\x53\x00\x00\x60\x43\xa3\xd1\x48\x55\x1c\xd9\
-\xef\xf7\xeb\xf5\xba\x7d\x01\x00\x00\x00\x80\x8c\x1a\x0c\x06\x53\
-\x53\x53\xe9\x59\xcf\xf4\xf4\x74\xc8\x3e\x52\x19\x49\x18\xca\x48\
-\x00\xb8\x1a\x37\x47\x02\x00\xf0\x1b\x69\xbb\x36\xf2\xd4\xa9\xa7\
-\x95\x91\x00\x00\x00\x00\x90\x69\xf5\x7a\x3d\x55\x2f\xd7\x5e\x5a\
-\x5a\x0a\x16\x47\x2a\x23\x09\x43\x19\x09\x00\x5b\x10\x47\x02\x00\
-\xf0\x1b\xf3\xf3\xf3\xe9\x59\x4c\xb3\xd9\x78\xe4\x91\x47\x6d\x0a\
-\x00\x00\x00\x00\x64\x5d\xda\x5e\xae\x1d\xe6\x20\x54\x19\x49\x18\
-\xca\x48\x00\xd8\x9a\xd7\x6a\x03\x00\x70\x5d\x14\x45\xfb\xf7\xef\
-\x4f\xcf\x7a\xbc\x50\x1b\x00\x00\x00\x00\x72\x23\x6d\x2f\xd7\x7e\
-\xf7\xdd\x77\xab\xd5\xea\xf8\xbe\xbf\x32\x92\x30\x94\x91\x00\x70\
-\x4d\x6e\x8e\x04\x00\xe0\xba\x4e\x9a\x0e\x50\x9e\xea\x74\x94\x91\
-\x00\x00\x00\x00\x90\x1b\xf5\x7a\xfd\xa9\x34\x9d\x40\x8e\xf5\x38\
-\x54\x19\x49\x18\xca\x48\x00\xd8\x0e\x37\x47\x02\x00\x14\x5d\x1c\
-\xc7\xd5\x6a\x35\x25\xa7\x75\xd5\x6a\xe5\xc2\x85\x77\x9c\xc4\x01\
-\x00\x00\x00\x40\x9e\xac\xad\xad\xdd\x79\xe7\x81\x28\x1a\xa6\x61\
-\x31\xa5\x52\x29\x8a\xa2\x72\xb9\x3c\xf2\xef\xac\x8c\x24\x0c\x65\
-\x24\x00\x6c\x93\x9b\x23\x01\x00\x8a\x6e\x61\x61\x21\x3d\xa7\x75\
-\xdf\xf9\xce\x77\x9c\xc4\x01\x00\x00\x00\x40\xce\x4c\x4c\x4c\x3c\
-\xfb\xcc\xb3\x29\x59\xcc\xea\xea\xea\x38\x3a\x2d\x65\x24\x61\x28\
-\x23\x01\x60\xfb\xdc\x1c\x09\x00\x50\x74\xd5\x6a\x75\x38\x4c\xc5\
-\x4f\x6c\x1f\x9f\x9d\xfd\x5f\x2f\xbf\x6c\x47\x00\x00\x00\x00\x20\
-\x97\x1e\x39\x71\xe2\xb9\xe7\x9f\x4f\xc3\x4a\x2a\x95\x4a\x14\x45\
-\x23\xfc\x86\xca\x48\xc2\x50\x46\x02\xc0\x8e\xb8\x39\x12\x00\xa0\
-\xd0\xba\xdd\x6e\x4a\xca\xc8\x0d\x4f\x7c\xeb\x5b\x76\x04\x00\x00\
-\x00\x00\xf2\xea\x2f\xbe\xfe\xf5\x94\xac\x64\x38\x1c\x76\xbb\xdd\
-\x51\x7d\x37\x65\x24\x61\x28\x23\x01\x60\xa7\xc4\x91\x00\x00\x85\
-\x96\x9e\x83\x89\xa7\x3a\x9d\x7a\xbd\x6e\x47\x00\x00\x00\x00\x20\
-\xaf\xea\xf5\xfa\x53\xa9\x49\xbb\x46\x75\x34\xaa\x8c\x24\x0c\x65\
-\x24\x00\xec\x82\xd7\x6a\x03\x00\x14\x57\x14\x45\xfb\xf7\xef\x4f\
-\xc9\x62\x2e\x5e\xbc\x38\x39\x39\x69\x53\x00\x00\x00\x00\x20\xc7\
-\x56\x56\x56\xee\xbe\xfb\x8f\xa3\x28\x15\x6f\xb3\x79\xf7\xdd\x77\
-\xab\xd5\xea\x5e\xbe\x83\x32\x92\x30\x94\x91\x00\xb0\x3b\x6e\x8e\
-\x04\x00\x28\xae\x11\xbe\x38\x66\x8f\x9e\x7b\xee\x07\xca\x48\x00\
-\x00\x00\x00\xc8\xbd\xc9\xc9\xc9\x27\x9e\x78\x22\x25\x8b\xd9\x63\
-\xbc\xa5\x8c\x24\x0c\x65\x24\x00\xec\x9a\x9b\x23\x01\x00\x8a\xab\
-\x5a\xad\x0e\x87\xc3\x14\x2c\xa3\x72\xe1\xc2\x3b\x8e\xe4\x00\x00\
-\x00\x00\xa0\x08\xd6\xd6\xd6\xee\xbc\xf3\x40\x1a\x2e\x8f\xac\x54\
-\x2a\x51\x14\xed\xee\xef\x55\x46\x12\x86\x32\x12\x00\xf6\xc2\xcd\
-\x91\x00\x00\x05\xd5\xeb\xf5\xd2\x50\x46\x6e\x78\xe2\x89\x27\x1c\
-\xc9\x01\x00\x00\x00\x40\x41\x4c\x4c\x4c\xa4\xe4\xf2\xc8\xe1\x70\
-\xd8\xeb\xf5\x76\xf1\x37\x2a\x23\x09\x43\x19\x09\x00\x7b\x24\x8e\
-\x04\x00\x28\xa8\x94\x9c\x50\x54\xab\x95\x07\x1f\x7c\xc8\x76\x00\
-\x00\x00\x00\x40\x71\x3c\xf8\xe0\x43\xd5\x6a\x25\x0d\x2b\xd9\xc5\
-\x31\xa9\x32\x92\x30\x94\x91\x00\xb0\x77\xe2\x48\x00\x80\x82\xea\
-\x76\xbb\x69\x58\x86\x6b\x23\x01\x00\x00\x00\xa0\x68\xd2\x73\x79\
-\x64\xb7\xdb\x8d\xe3\x78\xfb\x7f\x5e\x19\x49\x18\xca\x48\x00\x18\
-\x09\x71\x24\x00\x40\x11\x2d\x2c\x2c\xa4\xe1\xfc\xce\xb5\x91\x00\
-\x00\x00\x00\x50\x4c\x29\xb9\x3c\x72\x75\x75\x75\xfb\x3f\x46\xae\
-\x8c\x24\x0c\x65\x24\x00\x8c\x8a\x38\x12\x00\xa0\x88\x5c\x1b\x09\
-\x00\x00\x00\x00\x24\x28\x55\x97\x47\x6e\xe7\x8f\x29\x23\x09\x43\
-\x19\x09\x00\x23\xb4\x6f\x7d\x7d\xdd\x14\x00\x00\x0a\x25\x8e\xe3\
-\x1b\x6f\xbc\x31\xf1\x65\x54\xab\x95\x0b\x17\xde\x71\x36\x07\x00\
-\x00\x00\x00\xc5\xb4\xb6\xb6\x76\xe7\x9d\x07\xa2\x68\x98\xf8\x4a\
-\x7e\xf5\xab\x5f\x95\xcb\xe5\x2d\xfe\x80\x32\x92\x30\x94\x91\x00\
-\x30\x5a\x6e\x8e\x04\x00\x28\x1c\xd7\x46\x02\x00\x00\x00\x00\x89\
-\xcb\xca\xe5\x91\xca\x48\xc2\x50\x46\x02\xc0\xc8\x89\x23\x01\x00\
-\x0a\x27\x25\x71\xe4\x17\xbf\xf8\xef\xed\x05\x00\x00\x00\x00\x14\
-\xd9\x83\x0f\x3e\x94\x86\x65\x6c\x71\x64\xaa\x8c\x24\x0c\x65\x24\
-\x00\x8c\x83\x38\x12\x00\xa0\x58\xe2\x38\x5e\x5c\x5c\x4c\x7c\x19\
-\x4f\x75\x3a\x93\x93\x93\xb6\x03\x00\x00\x00\x00\x8a\x6c\x62\x62\
-\xe2\xa9\x14\x04\x61\x8b\x8b\x8b\x71\x1c\x7f\xfc\xf7\x95\x91\x84\
-\xa1\x8c\x04\x80\x31\x11\x47\x02\x00\x14\x4b\x4a\xae\x8d\xfc\x4f\
-\x5f\xf9\x8a\xbd\x00\x00\x00\x00\x00\x52\x72\x54\xf8\xf1\x83\x53\
-\x65\x24\x61\x28\x23\x01\x60\x7c\xc4\x91\x00\x00\xc5\xd2\xeb\xf5\
-\x12\x5f\xc3\x89\xb9\xb9\x5a\xad\x66\x2f\x00\x00\x00\x00\x80\x5a\
-\xad\x76\x62\x6e\x2e\xf1\x65\x5c\x16\x47\x2a\x23\x09\x43\x19\x09\
-\x00\x63\x25\x8e\x04\x00\x28\x96\x34\xdc\x1c\xf9\xc0\x03\x0f\xd8\
-\x08\x00\x00\x00\x00\x60\x53\x1a\x0e\x0c\x3f\xfa\x53\xe5\xca\x48\
-\xc2\x50\x46\x02\xc0\xb8\x89\x23\x01\x00\x0a\xa4\xd7\xeb\x25\x7e\
-\xa2\x57\xad\x56\xee\x3b\x7a\xd4\x5e\x00\x00\x00\x00\x00\x9b\xee\
-\x3b\x7a\xb4\x5a\xad\x24\xbb\x86\xd5\xd5\xd5\xcd\x1f\x2c\x57\x46\
-\x12\x86\x32\x12\x00\x02\x10\x47\x02\x00\x14\x48\x1a\xae\x8d\x7c\
-\xec\xb1\xc7\x6c\x04\x00\x00\x00\x00\xf0\x51\x69\x38\x36\xec\xf5\
-\x7a\xca\x48\xc2\x50\x46\x02\x40\x18\xfb\xd6\xd7\xd7\x4d\x01\x00\
-\xa0\x20\xa6\xa6\xa6\x06\x83\x41\xb2\x6b\xf8\xe5\x2f\x7f\x59\xab\
-\xd5\xec\x05\x00\x00\x00\x00\x70\xc9\xca\xca\xca\x4d\x37\xdd\x94\
-\xec\x1a\x6e\xbe\xf9\xe6\x5f\xff\xfa\xd7\xca\x48\xc6\x4d\x19\x09\
-\x00\xc1\xb8\x39\x12\x00\xa0\x28\xa2\x28\x4a\xbc\x8c\x3c\x3e\x3b\
-\xab\x8c\x04\x00\x00\x00\x00\x2e\x33\x39\x39\x79\x7c\x76\x36\xd9\
-\x35\xbc\xff\xfe\xfb\xca\x48\xc6\x4d\x19\x09\x00\x21\x89\x23\x01\
-\x00\x8a\xa2\xd7\xeb\x25\xbe\x86\x87\xfe\xc3\x43\x36\x02\x00\x00\
-\x00\x00\xf8\xb8\x47\x1f\x7d\xd4\x10\xb6\x49\x19\x99\x51\xca\x48\
-\x00\x08\x4c\x1c\x09\x00\x50\x14\x69\x88\x23\x3f\xff\xf9\x2f\xd8\
-\x08\x00\x00\x00\x00\xe0\xe3\x0e\x1d\x3e\x6c\x08\xdb\xa1\x8c\xcc\
-\x28\x65\x24\x00\x84\x27\x8e\x04\x00\x28\x8a\xc4\xe3\xc8\xc7\x4f\
-\x9e\x74\x60\x07\x00\x00\x00\x00\x5c\xd1\xc4\xc4\xc4\xe3\x27\x4f\
-\x9a\xc3\xd6\x94\x91\x19\xa5\x8c\x04\x80\x44\x88\x23\x01\x00\x0a\
-\x21\x8a\xa2\xe1\x70\x98\xec\x1a\x3e\xf7\xb9\xcf\xd9\x08\x00\x00\
-\x00\x00\xe0\x6a\x1c\x21\x6e\x4d\x19\x99\x51\xca\x48\x00\x48\x8a\
-\x38\x12\x00\xa0\x10\xd2\xf0\x4e\x6d\xaf\xc5\x01\x00\x00\x00\x00\
-\xb6\xe0\x08\x71\x0b\xca\xc8\x8c\x52\x46\x02\x40\x82\xc4\x91\x00\
-\x00\x85\xe0\x9d\xda\x00\x00\x00\x00\x40\xca\x79\xb3\xf6\xd5\x28\
-\x23\x33\x4a\x19\x09\x00\xc9\x12\x47\x02\x00\x14\x42\xe2\x71\xa4\
-\x17\xe2\x00\x00\x00\x00\x00\xd7\xe4\x20\xf1\xe3\x94\x91\x19\xa5\
-\x8c\x04\x80\xc4\xed\x5b\x5f\x5f\x37\x05\x00\x80\x7c\x8b\xe3\xf8\
-\xc6\x1b\x6f\x4c\x76\x0d\x17\x2f\x5e\x9c\x9c\x9c\xb4\x17\x00\x00\
-\x00\x00\xc0\x16\xd6\xd6\xd6\x6e\xb8\xe1\x06\x73\xb8\x44\x19\x99\
-\x51\xca\x48\x00\x48\x03\x37\x47\x02\x00\xe4\x5f\xe2\xd7\x46\x1e\
-\x9f\x9d\x55\x46\x02\x00\x00\x00\x00\xd7\x34\x31\x31\x71\x7c\x76\
-\xd6\x1c\x36\x29\x23\x33\x4a\x19\x09\x00\x29\x21\x8e\x04\x00\xc8\
-\xbf\x7e\xbf\x9f\xec\x02\xbe\xf0\xc5\x2f\xd8\x05\x00\x00\x00\x00\
-\x60\x3b\x1c\x27\x6e\x52\x46\x66\x94\x32\x12\x00\xd2\x43\x1c\x09\
-\x00\x90\x7f\x89\xdf\x1c\x79\xd7\x5d\x9f\xb5\x0b\x00\x00\x00\x00\
-\xc0\x76\x4c\x4f\x37\x0c\x41\x19\x99\x51\xca\x48\x00\x48\x95\x7d\
-\xeb\xeb\xeb\xa6\x00\x00\x90\x6f\xe5\x72\x79\x75\x75\x35\xa9\x4f\
-\xaf\x56\x2b\xef\xbe\x1b\xd9\x05\x00\x00\x00\x00\x60\x9b\xf6\xef\
-\xaf\x46\xd1\xb0\xb0\x8f\xaf\x8c\xcc\x28\x65\x24\x00\xa4\x8d\x9b\
-\x23\x01\x00\x72\x2e\x8a\xa2\x04\xcb\xc8\x0d\xb3\xf7\xcf\xda\x05\
-\x00\x00\x00\x00\x60\xfb\x8a\x7c\xa8\xa8\x8c\xcc\x28\x65\x24\x00\
-\xa4\x90\x38\x12\x00\x20\xe7\xfa\xfd\x7e\xb2\x0b\xb8\xfb\x4f\xee\
-\xb6\x0b\x00\x00\x00\x00\xc0\xf6\x15\xf6\x50\x51\x19\x99\x51\xca\
-\x48\x00\x48\x27\x71\x24\x00\x40\xce\x25\x1e\x47\x7e\xe6\x33\x77\
-\xd9\x05\x00\x00\x00\x00\x60\xfb\x8a\x79\xa8\xa8\x8c\xcc\x28\x65\
-\x24\x00\xa4\x96\x38\x12\x00\x20\xe7\x92\x8d\x23\xab\xd5\x4a\xad\
-\x56\xb3\x0b\x00\x00\x00\x00\xc0\xf6\xd5\x6a\xb5\x6a\xb5\x52\xa8\
-\x47\x56\x46\x66\x94\x32\x12\x00\xd2\x4c\x1c\x09\x00\x90\x73\xc9\
-\xc6\x91\x47\xfe\xec\x88\x2d\x00\x00\x00\x00\x00\x76\x6a\xf6\xfe\
-\xd9\xe2\x3c\xac\x32\x32\xa3\x94\x91\x00\x90\x72\xe2\x48\x00\x80\
-\x9c\x1b\x0e\x87\x09\x7e\xfa\x3d\x87\xee\xb1\x05\x00\x00\x00\x00\
-\xc0\x4e\xdd\x71\xe0\x8e\x82\x3c\xa9\x32\x32\xa3\x94\x91\x00\x90\
-\x7e\xe2\x48\x00\x80\x3c\xeb\xf5\x7a\xc9\x2e\xe0\xae\xbb\x3e\x6b\
-\x17\x00\x00\x00\x00\x80\x9d\x2a\xc8\xd1\xa2\x32\x32\xa3\x94\x91\
-\x00\x90\x09\xe2\x48\x00\x80\x3c\x8b\xe3\x38\xd9\x05\xd4\x6a\x35\
-\xbb\x00\x00\x00\x00\x00\xec\x54\x11\x8e\x16\x95\x91\x19\xa5\x8c\
-\x04\x80\xac\x10\x47\x02\x00\xe4\x59\xbf\xdf\x4f\xf0\xd3\x9b\xcd\
-\x86\x73\x3d\x00\x00\x00\x00\x60\x17\x26\x26\x26\x9a\xcd\x46\x8e\
-\x1f\x50\x19\x99\x51\xca\x48\x00\xc8\x10\x71\x24\x00\x40\x9e\x45\
-\x51\x94\xe0\xa7\xdf\xba\xff\x56\x5b\x00\x00\x00\x00\x00\xec\xce\
-\xc1\xa9\x83\x79\x7d\x34\x65\x64\x46\x29\x23\x01\x20\x5b\xc4\x91\
-\x00\x00\x79\x96\x6c\x1c\x79\xcf\xa1\x7b\x6c\x01\x00\x00\x00\x00\
-\xb0\x3b\x77\x1c\xb8\x23\x97\xcf\xa5\x8c\xcc\x28\x65\x24\x00\x64\
-\x8e\x38\x12\x00\x20\xcf\x92\x7d\xad\xf6\xed\xb7\xdd\x6e\x0b\x00\
-\x00\x00\x00\x80\xdd\xc9\xe5\x01\xa3\x32\x32\xa3\x94\x91\x00\x90\
-\x45\xe2\x48\x00\x80\x3c\x5b\x5d\x5d\x4d\xf0\xd3\x6f\xba\xf9\x66\
-\x5b\x00\x00\x00\x00\x00\xec\x4e\xfe\x0e\x18\x95\x91\x19\xa5\x8c\
-\x04\x80\x8c\xda\xb7\xbe\xbe\x6e\x0a\x00\x00\xb9\xd4\xef\xf7\x0f\
-\x1e\x3c\x98\xe0\x02\xfc\xaf\x26\x00\x00\x00\x00\xb0\x17\xfb\xf6\
-\xed\xcb\xcd\xb3\x28\x23\x33\x4a\x19\x09\x00\xd9\xe5\xe6\x48\x00\
-\x80\xdc\x8a\xe3\x38\xc1\x4f\x6f\x36\x1b\xb6\x00\x00\x00\x00\x00\
-\xd8\x8b\xe3\xb3\xb3\xb9\x79\x10\x65\x64\x16\x29\x23\x01\x20\xd3\
-\xc4\x91\x00\x00\xb9\x15\x45\x51\x82\x9f\x7e\xeb\xfe\x5b\x6d\x01\
-\x00\x00\x00\x00\xb0\x17\xe5\x72\x39\x07\x4f\xa1\x8c\xcc\x28\x65\
-\x24\x00\x64\x9d\x38\x12\x00\x20\xb7\x92\x8d\x23\x0f\xdc\x79\xc0\
-\x16\x00\x00\x00\x00\x00\x7b\x71\xcf\xa1\x7b\xb2\xfe\x08\xca\xc8\
-\x8c\x52\x46\x02\x40\x0e\x88\x23\x01\x00\x18\x8b\x4f\x7c\xe2\x13\
-\x86\x00\x00\x00\x00\x00\x14\x99\x32\x32\xa3\x94\x91\x00\x90\x0f\
-\xe2\x48\x00\x80\xdc\xea\xf7\xfb\x09\x7e\xfa\xed\xb7\xdd\x6e\x0b\
-\x00\x00\x00\x00\x80\xbd\xb8\xeb\xae\xcf\x66\x77\xf1\xca\xc8\x8c\
-\x52\x46\x02\x40\x6e\x88\x23\x01\x00\x72\x2b\x8e\xe3\x04\x3f\x7d\
-\xe2\x86\x1b\x6c\x01\x00\x00\x00\x00\x50\x4c\xca\xc8\x8c\x52\x46\
-\x02\x40\x9e\x88\x23\x01\x00\x18\x8b\x9b\x6e\xba\xc9\x10\x00\x00\
-\x00\x00\x80\xbd\xa8\xd5\x6a\x59\x5c\xb6\x32\x32\xa3\x94\x91\x00\
-\x90\x33\xfb\xd6\xd7\xd7\x4d\x01\x00\x20\x97\xca\xe5\xf2\xea\xea\
-\x6a\x52\x9f\xee\xff\x33\x01\x00\x00\x00\x80\xbd\xdb\xb7\x6f\x5f\
-\xb6\x16\xac\x8c\xcc\x28\x65\x24\x00\xe4\x8f\x9b\x23\x01\x00\x72\
-\x2b\xc1\x32\x12\x00\x00\x00\x00\x60\xef\x96\x97\x97\xb3\xb5\x60\
-\x65\x64\x46\x29\x23\x01\x20\x97\xc4\x91\x00\x00\x8c\xde\xf1\xd9\
-\x59\x43\x00\x00\x00\x00\x00\xf6\x62\x79\x79\xf9\xde\x7b\x8f\x64\
-\x68\xc1\xca\xc8\x8c\x52\x46\x02\x40\x5e\x89\x23\x01\x00\x18\xbd\
-\x72\xb9\x6c\x08\x00\x00\x00\x00\xc0\xae\x6d\x96\x91\x51\x34\xcc\
-\xca\x82\x95\x91\x19\xa5\x8c\x04\x80\x1c\x13\x47\x02\x00\xe4\x53\
-\x14\x45\x86\x00\x00\x00\x00\x00\x64\x91\x32\x92\x30\x94\x91\x00\
-\x90\x6f\xe2\x48\x00\x80\x7c\x4a\x36\x8e\x2c\x95\x4a\xb6\x00\x00\
-\x00\x00\x00\xd8\x05\x65\x24\x61\x28\x23\x01\x20\xf7\xc4\x91\x00\
-\x00\x8c\xde\x1d\x07\xee\x30\x04\x00\x00\x00\x00\x60\xa7\x94\x91\
-\x84\xa1\x8c\x04\x80\x22\x10\x47\x02\x00\x00\x00\x00\x00\x00\x90\
-\x3c\x65\x24\x61\x28\x23\x01\xa0\x20\xc4\x91\x00\x00\x00\x00\x00\
-\x00\x00\x24\x4c\x19\x49\x18\xca\x48\x00\x28\x0e\x71\x24\x00\x00\
-\x00\x00\x00\x00\x00\x49\x52\x46\x12\x86\x32\x12\x00\x0a\x45\x1c\
-\x09\x00\x00\x00\x00\x00\x00\x40\x62\x94\x91\x84\xa1\x8c\x04\x80\
-\xa2\x11\x47\x02\x00\x00\x00\x00\x00\x00\x90\x0c\x65\x24\x61\x28\
-\x23\x01\xa0\x80\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x24\x40\x19\
-\x49\x18\xca\x48\x00\x28\x26\x71\x24\x00\x00\x00\x00\x00\x00\x00\
-\xa1\x29\x23\x09\x43\x19\x09\x00\x85\x25\x8e\x04\x00\x00\x00\x00\
-\x00\x00\x20\x28\x65\x24\x61\x28\x23\x01\xa0\xc8\xc4\x91\x00\x00\
-\x00\x00\x00\x00\x00\x84\xa3\x8c\x24\x0c\x65\x24\x00\x14\x9c\x38\
-\x12\x00\x00\x00\x00\x00\x00\x80\x40\x94\x91\x84\xa1\x8c\x04\x00\
-\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x84\xa0\x8c\x24\x0c\x65\x24\
-\x00\x70\x9d\x38\x12\x00\x00\x00\x00\x00\x00\x80\x00\x94\x91\x84\
-\xa1\x8c\x04\x00\x36\x89\x23\x01\x00\x00\x00\x00\x00\x00\x18\x2f\
-\x65\x24\x61\x28\x23\x01\x80\x4b\xc4\x91\x00\x00\x00\x00\x00\x00\
-\x00\x8c\x91\x32\x92\x30\x94\x91\x00\xc0\x47\x89\x23\x01\x00\x00\
-\x00\x00\x00\x00\x18\x17\x65\x24\x61\x28\x23\x01\x80\xcb\x88\x23\
-\x01\x00\x00\x00\x00\x00\x00\x18\x0b\x65\x24\x61\x28\x23\x01\x80\
-\x8f\x13\x47\x02\x00\x00\x00\x00\x00\x00\x30\x7a\xca\x48\xc2\x50\
-\x46\x02\x00\x57\x24\x8e\x04\x00\x00\x00\x00\x00\x00\x60\xc4\x94\
-\x91\x84\xa1\x8c\x04\x00\xae\x46\x1c\x09\x00\x00\x00\x00\x00\x00\
-\xc0\x28\x29\x23\x09\x43\x19\x09\x00\x6c\x41\x1c\x09\x00\x00\x00\
-\x00\x00\x00\xc0\xc8\x28\x23\x09\x43\x19\x09\x00\x6c\x4d\x1c\x09\
-\x00\x00\x00\x00\x00\x00\xc0\x68\x28\x23\x09\x43\x19\x09\x00\x5c\
-\x93\x38\x12\x00\x00\x00\x00\x00\x00\x80\x11\x50\x46\x12\x86\x32\
-\x12\x00\xd8\x0e\x71\x24\x00\x00\x00\x00\x00\x00\x00\x7b\xa5\x8c\
-\x24\x0c\x65\x24\x00\xb0\x4d\xe2\x48\x00\x00\x00\x00\x00\x00\x00\
-\xf6\x44\x19\x49\x18\xca\x48\x00\x60\xfb\xc4\x91\x00\x00\x00\x00\
-\x00\x00\x00\xec\x9e\x32\x92\x30\x94\x91\x00\xc0\x8e\x88\x23\x01\
-\x00\x00\x00\x00\x00\x00\xd8\x25\x65\x24\x61\x28\x23\x01\x80\x9d\
-\x12\x47\x02\x00\x00\x00\x00\x00\x00\xb0\x1b\xca\x48\xc2\x50\x46\
-\x02\x00\xbb\x20\x8e\x04\x00\x00\x00\x00\x00\x00\x60\xc7\x94\x91\
-\x84\xa1\x8c\x04\x00\x76\x47\x1c\x09\x00\x00\x00\x00\x00\x00\xc0\
-\xce\x28\x23\x09\x43\x19\x09\x00\xec\x9a\x38\x12\x00\x00\x00\x00\
-\x00\x00\x80\x1d\x50\x46\x12\x86\x32\x12\x00\xd8\x0b\x71\x24\x00\
-\x00\x00\x00\x00\x00\x00\xdb\xa5\x8c\x24\x0c\x65\x24\x00\xb0\x47\
-\xe2\x48\x00\x00\x00\x00\x00\x00\x00\xb6\x45\x19\x49\x18\xca\x48\
-\x00\x60\xef\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x5c\x9b\x32\x92\
-\x30\x94\x91\x00\xc0\x48\x88\x23\x01\x00\x00\x00\x00\x00\x00\xb8\
-\x06\x65\x24\x61\x28\x23\x01\x80\x51\x11\x47\x02\x00\x00\x00\x00\
-\x00\x00\xb0\x15\x65\x24\x61\x28\x23\x01\x80\x11\x12\x47\x02\x00\
-\x00\x00\x00\x00\x00\x70\x55\xca\x48\xc2\x50\x46\x02\x00\xa3\x25\
-\x8e\x04\x00\x00\x00\x00\x00\x00\xe0\xca\x94\x91\x84\xa1\x8c\x04\
-\x00\x46\x4e\x1c\x09\x00\x00\x00\x00\x00\x00\xc0\x15\x28\x23\x09\
-\x43\x19\x09\x00\x8c\x83\x38\x12\x00\x00\x00\x00\x00\x00\x80\xcb\
-\x29\x23\x09\x43\x19\x09\x00\x8c\x89\x38\x12\x00\x00\x00\x00\x00\
-\x00\x80\xdf\xa3\x8c\x24\x0c\x65\x24\x00\x30\x3e\xe2\x48\x00\x00\
-\x00\x00\x00\x00\x00\x7e\x47\x19\x49\x18\xca\x48\x00\x60\xac\xc4\
-\x91\x00\x00\x00\x00\x00\x00\x00\xfc\x96\x32\x92\x30\x94\x91\x00\
-\xc0\xb8\x89\x23\x01\x00\x00\x00\x00\x00\x00\xf8\x0d\x65\x24\x61\
-\x28\x23\x01\x80\x00\xc4\x91\x00\x00\x00\x00\x00\x00\x00\x28\x23\
-\x09\x44\x19\x09\x00\x84\xf1\x07\x46\x00\x00\x00\x00\x00\x40\xda\
-\xac\xac\xac\x5c\xdc\xf0\xfe\xfb\xef\xfd\xdb\x7b\x1f\x7c\xf0\xc1\
-\x3b\x17\xde\xd9\xf8\xcd\x38\x8e\x5f\x7e\xe5\x95\xed\x7f\x93\xe3\
-\xb3\xb3\xe5\x72\x79\xe3\x8b\x4f\x7e\xf2\x93\x7f\xf4\xef\xfe\xe8\
-\x86\x1b\x6e\xb8\xed\xb6\xdb\x27\x26\x26\x6a\xb5\x9a\x09\x03\xc0\
-\x65\x94\x91\x84\xa1\x8c\x04\x00\x82\x11\x47\x02\x00\x00\x00\x00\
-\x90\xb0\x95\x95\x95\x5f\xfe\xe2\x17\x3f\xfb\xf9\xcf\xfe\xe5\x9d\
-\x7f\x19\x0e\x87\x3b\x2a\x20\xb7\xb0\xc5\xf7\x69\x36\x1b\xb7\xee\
-\xbf\xf5\x9e\x43\xf7\xdc\xf2\x87\xb7\x7c\xea\xd3\x9f\x96\x4b\x02\
-\x50\x70\xca\x48\xc2\x50\x46\x02\x00\x21\x89\x23\x01\x00\x00\x00\
-\x00\x48\xc0\xf2\xf2\xf2\x4f\x7f\xfa\xcf\x6f\xff\xe3\xdb\xaf\xbc\
-\xfa\x4a\xf8\x14\xe3\xfc\xf9\xde\xc6\x5f\xcf\x3d\xff\xfc\xa5\xdf\
-\x39\x31\x37\x77\xcf\xa1\x7b\xee\xba\xeb\xb3\xb5\x5a\x4d\x69\x01\
-\x40\xd1\xfe\xa3\xac\x8c\x24\x00\x65\x24\x00\x10\x98\x38\x12\x00\
-\x00\x00\x00\x80\x40\x56\x56\x56\xfe\xfe\xef\x97\x92\x0a\x22\xb7\
-\xf6\xdc\xf3\xcf\x5f\x6a\x25\x37\x43\xc9\xe9\xe9\x86\x1b\x25\x01\
-\xc8\x3d\x65\x24\x61\x28\x23\x01\x80\xf0\xc4\x91\x00\x00\x00\x00\
-\x30\x02\x83\xc1\x60\x6a\x6a\xca\x1c\xb2\xab\xdf\xef\xd7\xeb\x75\
-\x73\x18\x93\xe5\xe5\xe5\xd7\x5f\x7f\xed\xad\x37\xdf\x1a\xd5\xfb\
-\xb2\xc7\xed\x52\x28\xd9\x6c\x36\x1a\xd3\x8d\x23\x47\x8e\x1c\x3a\
-\x7c\xd8\x3e\x02\x90\xcb\xff\x46\x2b\x23\x09\x40\x19\x09\x00\x24\
-\x42\x1c\x09\x00\x00\x00\x00\xc0\x58\x6c\xde\x13\xf9\xcc\x33\xcf\
-\x9c\x3f\xdf\xcb\xe8\x23\x6c\xbe\x7d\xfb\xc9\x4e\xa7\x5a\xad\x3c\
-\xf6\xd8\x63\x5f\xfa\xd2\x97\xdd\x25\x09\x40\x6e\x28\x23\xf9\x7f\
-\xec\xdd\xd1\x6f\x9d\xe5\x7d\xc0\x71\x36\xf5\xd2\x69\x7b\x67\x33\
-\x68\x62\x72\x42\xb2\xaa\x20\x47\xa5\x55\x59\xe2\xd2\x98\x20\x35\
-\xb9\x28\x65\x4e\xe3\xf4\xa2\x13\x6d\x9c\xaa\xd0\x5d\x80\x13\x89\
-\x5d\x85\xd8\x44\x63\x4a\x24\x62\x4a\x2f\xc6\x04\x3e\x01\x2d\x5a\
-\x47\x5c\x9f\x4a\xc9\x5a\x39\x15\xc6\xa9\xe2\xb0\x22\x61\x88\xdb\
-\xa0\x2e\x29\x27\xd8\x21\x29\x3e\x77\x21\x7e\xff\x80\x1d\xd5\x53\
-\xc4\x42\x9a\x9c\x73\x6c\x3f\x7e\x9e\xf7\x7c\x3e\xaa\x10\x42\x15\
-\xf9\xf9\xf7\x9c\x07\x5b\xf2\x57\xef\x1b\x86\x32\x12\x00\x58\x2e\
-\x7f\x6d\x05\x00\x00\x00\x00\xb0\x70\x93\x93\x6f\x5b\x02\x5c\x73\
-\x62\x74\x74\x57\x6f\x6f\x5b\x5b\x5b\x4f\xcf\x8e\x74\xcb\xc8\x4f\
-\x9a\x9e\x9e\xe9\xeb\xdb\xbd\x66\xcd\x9a\xef\x6c\xdb\x36\x3c\x7c\
-\x34\xcb\x32\xa7\x0c\x40\xd2\x94\x91\x84\xa1\x8c\x04\x00\x96\x91\
-\x27\x47\x02\x00\x00\x00\x00\xb0\x38\xb2\x2c\x3b\x7a\xf4\xb5\x23\
-\x47\x8e\xe4\x23\x88\xbc\xa1\x91\x52\xa9\xfa\xbf\xf6\xf6\x55\x3f\
-\xf8\xfe\x0f\x7e\xf4\xd8\x63\xad\xad\xad\xce\x1d\x80\xe4\x28\x23\
-\x09\x43\x19\x09\x00\x2c\x2f\x4f\x8e\x04\x00\x00\x00\x80\x45\xf0\
-\xe6\xe9\x37\x2d\x81\x66\x56\xa9\x54\x9e\x19\x18\x58\xb1\x62\x45\
-\x6f\xef\xae\x1c\x97\x91\xd7\x4c\x4f\xcf\xec\xeb\xef\x6f\x6b\x6b\
-\xdb\xb3\x7b\xf7\xd4\xd4\x94\x0f\x00\x00\x09\x51\x46\x12\x86\x32\
-\x12\x00\x58\x76\xe2\x48\x00\x00\x00\x00\x00\x1a\x37\x9f\x45\xb6\
-\xb5\xb5\xa5\xf5\xcb\xef\xc5\x72\x68\x70\x70\xfd\xfa\xf5\xbb\x7a\
-\x7b\x25\x92\x00\x24\x41\x19\x49\x18\xca\x48\x00\x20\x06\xe2\x48\
-\x00\x00\x00\x00\x58\x04\x43\xc5\xa2\x25\xd0\x6c\x9a\x3c\x8b\xbc\
-\xee\xbf\x00\xeb\xd7\xaf\xdf\xb3\x7b\x77\x75\x27\x3e\x18\x00\x44\
-\x4b\x19\x49\x18\xca\x48\x00\x20\x12\xe2\x48\x00\x00\x00\x00\x00\
-\xea\x93\x65\x59\xb1\x38\x74\xff\xfd\x5f\x93\x45\x7e\xd2\xa1\xc1\
-\xc1\xb6\xb6\xb6\xe7\x9f\x1f\xac\xee\xc7\x36\x00\x88\x8d\x32\x92\
-\x30\x94\x91\x00\x40\x3c\xc4\x91\x00\x00\x00\x00\xb0\x50\x5e\xa7\
-\x4b\x53\x39\x31\x3a\xfa\xf0\xc3\xdf\xea\xed\xdd\x95\x50\x5d\x11\
-\x52\x5f\xdf\xee\x7b\xef\xbd\x67\x78\xf8\xa8\x55\x00\x10\x0f\x65\
-\x24\x61\x28\x23\x01\x80\xa8\x88\x23\x01\x00\x00\x00\x00\xa8\x49\
-\xa5\x52\xd9\xd5\xdb\xbb\x65\xeb\xd6\xf1\xf1\x93\xb6\x71\x13\xd3\
-\xd3\x33\x3d\x3d\x3b\xaa\xbb\x2a\x97\xcb\xb6\x01\xc0\xb2\x53\x46\
-\x12\x86\x32\x12\x00\x88\x8d\x38\x12\x00\x00\x00\x00\x16\x6a\x72\
-\xf2\x6d\x4b\x20\xf7\xe6\xdf\xa3\x3d\x54\x2c\x5a\x45\x8d\xaa\xbb\
-\x5a\xb3\x66\x4d\x75\x6f\x56\x01\xc0\x32\x52\x46\x12\x86\x32\x12\
-\x00\x88\x90\x38\x12\x00\x00\x00\x00\x80\x9b\xa9\x54\x2a\xdf\xd9\
-\xb6\xcd\x7b\xb4\x1b\x53\xdd\x5b\x75\x7b\xd5\x1d\x5a\x05\x00\xe1\
-\x29\x23\x09\x43\x19\x09\x00\xc4\x49\x1c\x09\x00\x00\x00\x00\x0b\
-\xf5\xe6\xe9\x37\x2d\x81\xbc\x3a\x31\x3a\x7a\xff\xfd\x5f\x1b\x29\
-\x95\xac\xa2\x61\xd5\xed\x55\x77\x58\xdd\xa4\x55\x00\x10\x92\x32\
-\x92\x30\x94\x91\x00\x40\xb4\xc4\x91\x00\x00\x00\x00\x00\xdc\x40\
-\x96\x65\x7b\x76\xef\xde\xb2\x75\xab\x07\x46\x2e\x5c\x75\x87\xd5\
-\x4d\x3e\x33\x30\x50\xdd\xaa\x6d\x00\x10\x80\x32\x92\x30\x94\x91\
-\x00\x40\xcc\xc4\x91\x00\x00\x00\x00\xb0\x50\x43\xc5\xa2\x25\x90\
-\x33\xe5\x72\xf9\xfb\x8f\x3e\x7a\x68\x70\xd0\x2a\x16\xd1\xbe\xfe\
-\xfe\xea\x56\xbd\x62\x1b\x80\x00\xdf\xc7\x95\x91\x04\xa0\x8c\x04\
-\x00\x22\x27\x8e\x04\x00\x00\x00\x00\xe0\xff\x39\x31\x3a\xfa\xd0\
-\x43\x9b\xbd\x4a\x7b\x29\xcc\xbf\x62\xbb\x5c\x2e\x5b\x05\x00\x4b\
-\x44\x19\x49\x18\xca\x48\x00\x20\x7e\xe2\x48\x00\x00\x00\x00\x58\
-\x90\xa9\xa9\x29\x4b\x20\x4f\x8a\xc5\x21\xaf\xd2\x5e\x52\xd5\xdd\
-\xae\x59\xb3\xe6\xc4\xe8\xa8\x55\x00\xb0\xe8\x94\x91\x84\xa1\x8c\
-\x04\x00\x92\x20\x8e\x04\x00\x00\x00\x00\xe0\xff\x3c\x33\x30\xd0\
-\xdb\xbb\xcb\x1e\x02\xd8\xb2\x75\xeb\xf0\xf0\x51\x7b\x00\x60\x11\
-\x29\x23\x09\xf6\x13\xa3\x32\x12\x00\x48\x82\x38\x12\x00\x00\x00\
-\x00\x16\x64\x72\xf2\x6d\x4b\x20\x07\xb2\x2c\xfb\xce\xb6\x6d\x69\
-\xfd\x9e\x3b\x75\x3d\x3d\x3b\x9e\x19\x18\xb0\x07\x00\x16\x85\x32\
-\x92\x30\x94\x91\x00\x40\x42\xc4\x91\x00\x00\x00\x00\x00\xcd\x2e\
-\xcb\xb2\xef\x3f\xfa\xe8\x48\xa9\x64\x15\x81\xed\xeb\xef\xd7\x47\
-\x02\xb0\x70\xca\x48\xc2\x50\x46\x02\x00\x69\x11\x47\x02\x00\x00\
-\x00\xc0\x82\xbc\x79\xfa\x4d\x4b\x20\x69\xca\xc8\xe5\xa5\x8f\x04\
-\x60\x81\x94\x91\x84\xa1\x8c\x04\x00\x92\x23\x8e\x04\x00\x00\x00\
-\x80\x05\xb9\x72\xe5\x8a\x25\x90\x2e\x65\x64\x0c\xf4\x91\x00\x34\
-\x4c\x19\x49\x18\xca\x48\x00\x20\x45\xe2\x48\x00\x00\x00\x00\x58\
-\x10\x55\x19\xe9\x52\x46\xc6\x43\x1f\x09\x40\x03\x94\x91\x84\xa1\
-\x8c\x04\x00\x12\x25\x8e\x04\x00\x00\x00\x80\xc6\x65\x59\x66\x09\
-\xa4\xfb\xe9\x55\x46\x46\x45\x1f\x09\x40\x5d\x94\x91\x84\xa1\x8c\
-\x04\x00\xd2\x25\x8e\x04\x00\x00\x00\x80\xc6\x95\xcb\x65\x4b\x20\
-\x45\xca\xc8\x38\xed\xeb\xef\x1f\x1e\x3e\x6a\x0f\x00\xd4\xf2\x53\
-\xa8\x32\x92\x00\x94\x91\x00\x40\xd2\xc4\x91\x00\x00\x00\x00\xd0\
-\xb8\x6c\x6e\xce\x12\x48\xef\x73\xab\x8c\x8c\x58\x4f\xcf\x8e\x13\
-\xa3\xa3\xf6\x00\xc0\x4d\x28\x23\x09\x43\x19\x09\x00\xa4\x4e\x1c\
-\x09\x00\x00\x00\x00\x8d\x3b\x77\xfe\x9c\x25\x90\x9c\x43\xcf\x3d\
-\xa7\x8c\x8c\xd9\x96\xad\x5b\x3d\x95\x16\x80\xbf\x44\x19\x49\x18\
-\xca\x48\x00\x20\x07\xc4\x91\x00\x00\x00\x00\xd0\xb8\xab\x57\xaf\
-\x5a\x02\x69\x79\xfe\xf9\xc1\xb4\x7e\xcf\xdd\x9c\x1e\x7a\x68\x73\
-\xa5\x52\xb1\x07\x00\xae\xa3\x8c\x24\x0c\x65\x24\x00\x90\x0f\xe2\
-\x48\x00\x00\x00\x00\x68\xdc\xd9\xdf\x9f\xb5\x04\x12\x72\x62\x74\
-\xb4\xaf\x6f\xb7\x3d\xc4\x6f\x7a\x7a\xe6\x1f\x7f\xfc\xe3\x2c\xcb\
-\xac\x02\x80\x6b\x94\x91\x84\xa1\x8c\x04\x00\x72\x43\x1c\x09\x00\
-\x00\x00\x00\x8d\xbb\x72\xe5\x8a\x25\x90\x8a\x72\xb9\xbc\x65\xeb\
-\x56\x7b\x48\xc5\x48\xa9\x74\xe8\xb9\xe7\xec\x01\x80\x6b\xdf\xc7\
-\x95\x91\x04\xa0\x8c\x04\x00\xf2\x44\x1c\x09\x00\x00\x00\x00\x8d\
-\x1b\x29\x95\x2c\x81\x24\x64\x59\xf6\xd0\x43\x9b\xed\x21\x2d\xfb\
-\xfa\xfb\x87\x87\x8f\xda\x03\x00\xca\x48\xc2\x50\x46\x02\x00\x39\
-\x23\x8e\x04\x00\x00\x00\x80\x06\x79\xe3\x2d\x09\x79\xf2\x89\x27\
-\x12\x2a\x2a\xb8\xa6\xa7\x67\x47\xb9\x5c\xb6\x07\x80\x66\xa6\x8c\
-\x24\x0c\x65\x24\x00\x90\x3f\xe2\x48\x00\x00\x00\x00\x68\x90\x62\
-\x89\x54\x14\x8b\x43\x43\xc5\xa2\x3d\x24\xea\x9f\x9e\x7a\x4a\x8a\
-\x0d\xd0\xcc\x3f\x70\x2a\x23\x09\x40\x19\x09\x00\xe4\x92\x38\x12\
-\x00\x00\x00\x00\x1a\x94\xcd\xcd\x59\x02\xf1\x9b\x9a\x9a\xea\xed\
-\xdd\x65\x0f\xe9\x1a\x29\x95\x5e\x7e\xf9\x25\x7b\x00\x68\x42\xca\
-\x48\xc2\x50\x46\x02\x00\x79\x25\x8e\x04\x00\x00\x00\x80\x06\x9d\
-\x3b\x7f\xce\x12\x88\x5c\x96\x65\x8f\x3c\xf2\x6d\x7b\x48\x5d\x5f\
-\xdf\xee\xa9\xa9\x29\x7b\x00\x68\x2a\xca\x48\xc2\x50\x46\x02\x00\
-\x39\x26\x8e\x04\x00\x00\x00\x80\x06\x5d\xbd\x7a\xd5\x12\x88\xdc\
-\xbe\xa7\x9f\x4e\x28\xaa\xe0\x26\x1e\x79\xe4\xdb\x5e\xae\x0d\xd0\
-\x3c\x94\x91\x84\xa1\x8c\x04\x00\xf2\x4d\x1c\x09\x00\x00\x00\x00\
-\x0d\x3a\xfb\xfb\xb3\x96\x40\xcc\x4e\x8c\x8e\x1e\x1a\x1c\xb4\x87\
-\x7c\x98\x9e\x9e\x39\xf4\xdc\x73\xf6\x00\xd0\x0c\x94\x91\x84\xa1\
-\x8c\x04\x00\x72\x4f\x1c\x09\x00\x00\x00\x00\x0d\xba\x72\xe5\x8a\
-\x25\x10\xad\x4a\xa5\xf2\xd8\xe3\x8f\xd9\x43\x9e\xec\xeb\xef\xf7\
-\x72\x6d\x80\xdc\x53\x46\x12\x86\x32\x12\x00\x68\x06\xe2\x48\x00\
-\x00\x00\x00\x68\xd0\x48\xa9\x64\x09\x44\xeb\xe0\x81\x03\x5e\xa8\
-\x9d\x3f\x7d\x7d\x4f\x5a\x02\x40\x8e\x29\x23\x09\x43\x19\x09\x00\
-\x34\x09\x71\x24\x00\x00\x00\x00\x34\x22\xcb\x32\x4b\x20\x5a\xa7\
-\x27\x26\xbc\x50\x3b\x97\xc6\xc7\x4f\x16\x8b\x43\xf6\x00\x90\x4b\
-\xca\x48\xc2\x50\x46\x02\x00\xcd\x43\x1c\x09\x00\x00\x00\x00\x8d\
-\x28\x97\xcb\x96\x40\x9c\xb2\x2c\xfb\xde\x3f\x7c\xcf\x1e\xf2\x6a\
-\xff\xfe\xfd\x95\x4a\xc5\x1e\x00\xf2\xf7\xb3\xa5\x32\x92\x00\x94\
-\x91\x00\x40\x53\x11\x47\x02\x00\x00\x00\x40\x23\xb2\xb9\x39\x4b\
-\x20\x4e\x2f\xbf\xfc\x92\x17\x6a\xe7\x58\xf5\x70\x0f\x1e\x38\x60\
-\x0f\x00\x79\xa2\x8c\x24\x0c\x65\x24\x00\xd0\x6c\xc4\x91\x00\x00\
-\x00\x00\xd0\x88\x73\xe7\xcf\x59\x02\x11\x2a\x97\xcb\x7d\x7d\xbb\
-\xed\x21\xdf\x0e\x0d\x0e\x4e\x4d\x4d\xd9\x03\x40\x6e\xbe\x77\x2b\
-\x23\x09\x40\x19\x09\x00\x34\x21\x71\x24\x00\x00\x00\x00\x34\xe2\
-\xea\xd5\xab\x96\x40\x84\xfe\xe5\xd9\x67\x2d\xa1\x19\xfc\xf4\x85\
-\x17\x2c\x01\x20\x07\x94\x91\x84\xa1\x8c\x04\x00\x9a\xd3\x67\xac\
-\x00\x00\x00\x00\x00\x1a\x70\xf6\xf7\x67\x2d\x81\xd8\x9c\x9e\x98\
-\x18\x2a\x16\xf3\xfd\x35\x6e\xeb\xee\xee\xfc\x7a\xe7\x1d\x77\xdc\
-\xb1\x76\xed\xba\x96\x96\x96\x42\xa1\x30\xff\xcf\xb3\x2c\x2b\x97\
-\xcb\xd5\xbf\x99\x9c\x7c\xfb\xbd\xb3\xef\xbd\x7b\xe6\xdd\xf1\xf1\
-\x93\x39\xde\x43\xf5\xa0\xb7\x6f\xdf\xfe\xcd\x2d\x5b\x7c\xec\x01\
-\xd2\xa5\x8c\x24\x0c\x65\x24\x00\xd0\xb4\xc4\x91\x00\x00\x00\x00\
-\xd0\x88\x2b\x57\xae\x58\x02\xb1\xd9\xfb\xf4\xde\xbc\x7e\x69\xdb\
-\xba\xbb\x77\x7c\x77\xc7\x03\x0f\x7c\xa3\xb5\xb5\xf5\x86\xff\x87\
-\x96\x96\x96\x8e\x8e\x8e\xea\xdf\xcc\xff\xf5\xb6\x3f\x17\x27\xc7\
-\x8f\x1f\xab\xca\x6b\x25\x79\xe0\xe0\x01\x71\x24\x40\xba\x94\x91\
-\x84\xa1\x8c\x04\x00\x9a\x99\xd7\x6a\x03\x00\x00\x00\x40\x23\x46\
-\x4a\x25\x4b\x20\x2a\xc3\xc3\x47\x73\x59\x01\x0e\xf4\xf7\x9f\x39\
-\x73\xe6\xe7\x23\x23\xdb\xb7\xf7\xfc\xa5\x32\xf2\x86\x0a\x85\xc2\
-\x93\x4f\xf6\xbd\xf1\xc6\xf8\xc4\xa9\x53\xbd\x3b\x77\xe6\x6f\x33\
-\xd5\xe3\x3e\x31\x3a\xea\x93\x0f\x90\x22\x65\x24\x61\x28\x23\x01\
-\x80\x26\x27\x8e\x04\x00\x00\x00\x80\xba\x65\x59\x66\x09\xc4\xf6\
-\x99\x7c\xea\xa9\xa7\x72\xf6\x45\xf5\xee\xdc\x79\xe6\xcc\x99\xa7\
-\xf7\xed\xbb\xf6\x30\xc8\xc6\x6c\xec\xec\x7c\x79\x68\x68\xe2\xd4\
-\xa9\xae\xae\x4d\x39\x5b\xd1\x81\x83\x07\x7c\xf8\x01\x92\xa3\x8c\
-\x24\x0c\x65\x24\x00\x80\x38\x12\x00\x00\x00\x00\xea\x56\x2e\x97\
-\x2d\x81\xa8\x1c\x3d\xfa\x5a\x42\x8d\x45\x8d\x5f\xd1\xcb\x43\x43\
-\x0b\xcc\x22\x3f\x69\x63\x67\xe7\xb1\x63\xc7\x07\x07\x0f\xe5\x69\
-\x4b\x1e\x1e\x09\x90\xe2\x8f\x91\xca\x48\x02\x50\x46\x02\x00\xdc\
-\x26\x8e\x04\x00\x00\x00\x98\xf7\x57\xcb\x64\x57\x6f\xaf\xe5\xa7\
-\x28\x9b\x9b\xb3\x04\x22\xfa\x40\x66\xd9\xfe\xfd\xfb\x73\xf3\xe5\
-\x74\x75\x6d\x7a\xff\xfd\xf7\xb7\x6f\xef\x59\xf4\x7f\x73\x4b\x4b\
-\xcb\x93\x4f\xf6\x4d\x9c\x3a\xd5\xde\xbe\x2a\x37\xeb\xf2\xf0\x48\
-\x80\x84\x28\x23\x09\x43\x19\x09\x00\x30\x4f\x1c\x09\x00\x00\x00\
-\x00\x75\x3b\x77\xfe\x9c\x25\x10\x8f\x3c\x3d\x36\x72\x5b\x77\xf7\
-\xb1\x63\xc7\x0b\x85\xc2\xd2\xfd\x11\x1b\x3b\x3b\x5f\x7f\x7d\xac\
-\xfa\x07\xe5\x63\x63\x1e\x1e\x09\x90\x0a\x65\x24\x61\x28\x23\x01\
-\x00\xae\x11\x47\x02\x00\x00\x00\x40\xdd\x2e\x7d\x78\xc9\x12\x88\
-\x44\x9e\x1e\x1b\x39\xd0\xdf\xff\xf3\x91\x91\x00\x11\x46\xa1\x50\
-\x78\xe5\xd5\x57\x73\xd3\x47\x7a\x78\x24\x40\xfc\x94\x91\x84\xa1\
-\x8c\x04\x00\xf8\xa4\xcf\x58\x01\x00\x00\x00\x00\xd4\xeb\xe2\xc5\
-\x8b\x71\x0e\x76\xf4\xe8\x6b\x6b\xd7\xae\x73\x40\x0d\x58\xd2\x47\
-\x15\x2e\xf5\xa1\xe7\xe3\xb1\x91\x03\xfd\xfd\x4f\xef\xdb\x17\xec\
-\x8f\x6b\x69\x69\x79\xe5\xd5\x57\xab\x7f\x33\x52\x2a\xa5\xbe\xba\
-\xf1\xf1\x93\x53\x53\x53\x1d\x1d\x1d\x2e\x32\x40\x9c\x94\x91\x84\
-\xa1\x8c\x04\x00\xb8\x8e\x38\x12\x00\x00\x00\x00\xea\x76\xe1\x83\
-\x0b\x71\x0e\xf6\xc0\x03\xdf\x68\x6d\x6d\x75\x40\x4d\x25\x1f\x8f\
-\x8d\xdc\xd6\xdd\x1d\xb2\x8c\x9c\x37\xdf\x47\x4e\xbe\x33\x99\x83\
-\xba\xf4\xa7\x2f\xbc\xf0\xf2\xd0\x90\xeb\x00\x10\x21\x65\x24\x61\
-\x28\x23\x01\x00\x3e\xcd\x6b\xb5\x01\x00\x00\x00\xa0\x6e\xe3\xe3\
-\x27\xe3\x1c\x4c\x19\xd9\x6c\x4e\x8c\x8e\xe6\x20\xec\x9b\x8f\x30\
-\x96\xe5\x8f\x6e\x69\x69\x79\xfd\xf5\xb1\xf6\xf6\x55\xa9\xef\x70\
-\xa8\x58\xac\x54\x2a\x6e\x04\x40\x6c\x94\x91\x84\xa1\x8c\x04\x00\
-\xb8\x21\x71\x24\x00\x00\x00\x00\xd4\x27\xda\x02\x69\x5b\x77\xb7\
-\xd3\x69\x36\x07\x0e\x1e\x48\xfd\x4b\x68\x6f\x5f\x75\xe0\xe0\xc1\
-\x65\x8c\x30\x0a\x85\xc2\x8b\xff\xfa\x62\x0e\x3e\x0c\xff\xf6\xe2\
-\x8b\x6e\x04\x40\x54\x94\x91\x84\xa1\x8c\x04\x00\xf8\x4b\xc4\x91\
-\x00\x00\x00\x00\x50\x9f\xd9\xd9\xd9\x38\x07\xfb\xfc\xe7\x3f\xef\
-\x74\x9a\xca\xe9\x89\x89\x68\x1f\x62\x5a\xbb\x23\xff\x7e\xa4\x50\
-\x28\x2c\xef\x0c\xdf\xdc\xb2\x65\x70\xf0\x50\xea\x9b\x3c\xfc\xca\
-\xe1\x2c\xcb\xdc\x0b\x80\x48\x28\x23\x09\x43\x19\x09\x00\x70\x13\
-\xe2\x48\x00\x00\x00\x00\xa8\xcf\xec\x47\x1f\xc5\x39\xd8\x86\x8d\
-\x1b\x9c\x4e\x53\x39\x7c\xf8\x70\xea\x5f\xc2\x40\x7f\xff\xc6\xce\
-\xce\x18\x26\xd9\xb5\xeb\x87\x5d\x5d\x9b\x92\x5e\xe6\xf4\xf4\xcc\
-\xe9\x89\x09\xf7\x02\x20\x06\xca\x48\xc2\x50\x46\x02\x00\xdc\x9c\
-\x38\x12\x00\x00\x00\x00\xea\x73\xf9\x4f\x97\xe3\x1c\x6c\xc5\x8a\
-\x15\x4e\xa7\x79\x54\x2a\x95\xa1\x62\x31\xe9\x2f\xa1\xab\x6b\xd3\
-\xee\x3d\x7b\x22\x19\xa6\xa5\xa5\x65\x70\xf0\xf9\xd4\x3f\x15\x2f\
-\xbd\xf4\x92\xab\x01\xb0\xec\x94\x91\x84\xa1\x8c\x04\x00\xb8\x25\
-\x71\x24\x00\x00\x00\x00\xd4\xe7\xd2\x87\x97\xe2\x1c\x6c\xed\xda\
-\x75\x4e\xa7\x79\xfc\xec\x67\xff\x91\xfa\x97\xb0\xff\x99\xfd\x51\
-\x75\x18\x1d\x1d\x1d\x03\x49\x15\x06\x9f\x36\x52\x2a\x95\xcb\x65\
-\xb7\x03\x60\x19\x29\x23\x09\x43\x19\x09\x00\x50\x0b\x71\x24\x00\
-\x00\x00\x00\xd4\xe7\xe2\xc5\x8b\x71\x0e\xd6\xd6\xd6\xe6\x74\x9a\
-\xc7\x4f\x7e\xf2\x93\xa4\xe7\xef\xdd\xb9\x33\x92\x17\x6a\x7f\xd2\
-\xee\x3d\x7b\xda\xdb\x57\x25\xbd\xd8\xe3\xc7\x8f\xb9\x1d\x00\xcb\
-\x45\x19\x49\x18\xca\x48\x00\x80\x1a\x89\x23\x01\x00\x00\x00\xa0\
-\x3e\x17\x3e\xb8\x10\xe7\x60\xad\xad\xad\x4e\xa7\x49\x9c\x18\x1d\
-\x4d\x28\xbc\xb8\xa1\x7f\x7e\xf6\xd9\x08\xa7\x6a\x69\x69\xd9\xbb\
-\x77\x6f\xd2\x8b\x4d\xbd\x9a\x05\x48\x97\x32\x92\x30\x94\x91\x00\
-\x00\xb5\x13\x47\x02\x00\x00\x00\x40\x7d\xc6\xc7\x4f\x46\x38\x55\
-\x57\xd7\x26\x47\xd3\x3c\x86\x87\x87\x93\x9e\x7f\x70\xf0\x50\xb4\
-\x2d\x6f\x4f\xcf\x8e\xa4\x1f\x1e\x39\x3d\x3d\x73\x7a\x62\xc2\x1d\
-\x01\x08\x4c\x19\x49\x18\xca\x48\x00\x80\xba\x88\x23\x01\x00\x00\
-\x00\xa0\x0e\x95\x4a\x25\xce\xc1\x56\xdf\xb5\xda\xe9\x34\xcf\x87\
-\x70\xa8\x58\x4c\x77\xfe\xf6\xf6\x55\xbb\x76\xfd\x30\xda\xf1\x72\
-\xf0\xf0\xc8\xb1\xb1\x31\xd7\x04\x20\x24\x65\x24\x61\x28\x23\x01\
-\x00\xea\x25\x8e\x04\x00\x00\x00\x80\x3a\xcc\xce\xce\xc6\x39\xd8\
-\x3d\xf7\xde\xe3\x74\x9a\xc4\x2f\x7f\xf9\x5f\x49\xcf\xbf\x77\xef\
-\xde\xc8\x6b\x8c\xd4\x1f\x1e\x79\xf8\x95\xc3\xae\x09\x40\x30\xca\
-\x48\xc2\x50\x46\x02\x00\x34\x40\x1c\x09\x00\x00\x00\x00\x75\x98\
-\xfd\xe8\xa3\x38\x07\xfb\xec\x67\x3f\xeb\x74\x9a\xc4\x91\x23\x47\
-\x92\x9e\xbf\xa7\x67\x47\xe4\x13\xa6\xfe\xf0\xc8\xe9\xe9\x99\x13\
-\xa3\xa3\x6e\x0a\x40\x00\xca\x48\xc2\x50\x46\x02\x00\x34\x46\x1c\
-\x09\x00\x00\x00\x00\x75\xb8\xfc\xa7\xcb\x71\x0e\x76\xdf\x7d\x5f\
-\x71\x3a\xcd\xa0\x5c\x2e\x8f\x8f\x9f\x4c\x77\xfe\x81\xfe\xfe\x24\
-\x82\x8c\xf8\x0b\xce\x9b\xfb\xf5\xaf\x7f\xed\xb2\x00\x04\xf8\xa6\
-\xac\x8c\x24\x00\x65\x24\x00\x40\xc3\xc4\x91\x00\x00\x00\x00\x50\
-\x87\x4b\x1f\x5e\x8a\x73\x30\xbf\xe7\x6e\x12\xc7\x8f\x1f\x4b\x7a\
-\xfe\x1f\x3d\xf6\x58\x12\x73\x56\x2f\xd4\x40\x52\x15\xc2\x75\x4a\
-\xbf\x28\xb9\x2c\x00\x4b\x4a\x19\x49\x18\xca\x48\x00\x80\x85\x10\
-\x47\x02\x00\x00\x00\x40\x1d\x2e\x5e\xbc\x18\xe7\x60\x85\x42\xc1\
-\xe9\x34\x83\x63\xc7\x12\x8e\x23\x7b\x77\xee\x6c\x6d\x6d\x4d\x65\
-\xda\x6f\x3f\xf2\x48\xba\xab\x9e\x9e\x9e\x39\x3d\x31\xe1\xbe\x00\
-\x2c\x11\x65\x24\x61\x28\x23\x01\x00\x16\x48\x1c\x09\x00\x00\x00\
-\x00\x75\xb8\xf0\xc1\x85\x08\xa7\xea\xea\xda\xe4\x68\x9a\x41\xea\
-\xef\xd4\xde\xbe\x7d\x7b\x42\xd3\x76\x74\x74\x24\x7d\xb3\xc6\xc6\
-\xc6\x5c\x19\x80\x25\xfa\x76\xac\x8c\x24\x00\x65\x24\x00\xc0\xc2\
-\x89\x23\x01\x00\x00\x00\xa0\x0e\x71\xa6\x69\xab\xef\x5a\xed\x68\
-\x9a\x41\xd2\xef\xd4\x6e\x6f\x5f\xf5\xcd\x2d\x5b\xd2\x9a\xf9\xf1\
-\xc7\x1f\x4f\x77\xe1\x87\x5f\x39\xec\xca\x00\x2c\x3a\x65\x24\x61\
-\x28\x23\x01\x00\x16\x85\x38\x12\x00\x00\x00\x00\x6a\x55\xa9\x54\
-\xe2\x1c\x6c\xe5\xca\x95\x4e\xa7\x19\x24\xfd\x4e\xed\x27\x9e\x78\
-\x22\xb9\x99\x1f\x78\xe0\x1b\xe9\x2e\x7c\x7a\x7a\xa6\x5c\x2e\xbb\
-\x35\x00\x8b\x48\x19\x49\x18\xca\x48\x00\x80\xc5\x22\x8e\x04\x00\
-\x00\x00\x80\x5a\xcd\xce\xce\xc6\x39\xd8\x9d\x5f\xb8\xd3\xe9\xe4\
-\x5e\xea\xef\xd4\xfe\xd6\xb7\x1e\x4e\x6e\xe6\xd6\xd6\xd6\x6d\xdd\
-\xdd\xe9\xee\xfc\x37\xbf\x39\xe9\xe2\x00\x2c\xe2\x37\x62\x65\x24\
-\x01\x28\x23\x01\x00\x16\x91\x38\x12\x00\x00\x00\x00\x6a\x35\xfb\
-\xd1\x47\x71\x0e\xb6\x6e\xed\x3a\xa7\x93\x7b\xef\xbc\x33\x99\xee\
-\xf0\x5d\x5d\x9b\x0a\x85\x42\x8a\x93\xef\xf8\xee\x8e\x74\xd7\xfe\
-\xab\x5f\xfe\xca\xc5\x01\x58\x14\xca\x48\xc2\x50\x46\x02\x00\x2c\
-\x2e\x71\x24\x00\x00\x00\x00\xd4\xea\xf2\x9f\x2e\xc7\x39\x58\xcb\
-\x8a\x15\x4e\x27\xf7\x5e\xfb\xcf\xd7\xd2\x1d\xfe\xe1\x87\x1f\x4e\
-\x74\xf2\xa4\xdf\xac\x3d\x52\x2a\x65\x59\xe6\xee\x00\x2c\x90\x32\
-\x92\x30\x94\x91\x00\x00\x8b\x4e\x1c\x09\x00\x00\x00\x00\xb5\xba\
-\xf4\xe1\xa5\x38\x07\xeb\xe8\xe8\x70\x3a\xf9\x96\x65\xd9\x48\xa9\
-\x94\xee\xfc\x29\xbe\x53\x7b\x5e\xea\x6f\xd6\x9e\x3a\x73\xc6\xf5\
-\x01\x58\x08\x65\x24\x61\x28\x23\x01\x00\x96\x82\x38\x12\x00\x00\
-\x00\x00\x6a\x75\xf1\xe2\xc5\x08\xa7\x6a\x6f\x5f\xe5\x68\x72\xef\
-\xf4\xc4\x44\xba\xc3\xa7\xfb\x4e\xed\x79\x9d\x5f\xef\x4c\x77\xf8\
-\xb1\xb1\x31\xd7\x07\xa0\x61\xca\x48\xc2\x50\x46\x02\x00\x2c\x11\
-\x71\x24\x00\x00\x00\x00\xd4\xea\xc2\x07\x17\x22\x9c\x6a\xf3\x83\
-\x9b\x1d\x4d\xee\xbd\xf5\xd6\x5b\xe9\x0e\x9f\xee\x3b\xb5\xe7\x75\
-\x75\x3d\x98\xee\xf0\x27\x7f\x73\xd2\xf5\x01\x68\x8c\x32\x92\x30\
-\x94\x91\x00\x00\x4b\x47\x1c\x09\x00\x00\x00\x00\xb5\x1a\x1f\x3f\
-\x19\xe1\x54\x2b\x57\xae\x74\x34\xb9\x97\x74\xe2\xf6\xd5\xaf\x7c\
-\x35\xe9\xe5\x77\x74\x74\xa4\xfb\x7c\xd6\xea\x7f\xb5\x2a\x95\x8a\
-\x1b\x04\x50\x2f\x65\x24\x61\x28\x23\x01\x00\x96\x94\x38\x12\x00\
-\x00\x00\x00\x6a\x12\x6d\x60\x74\xe7\x17\xee\x74\x3a\xf9\x56\x2e\
-\x97\xe3\x0c\x73\x6b\xb4\xb1\xb3\x33\xf5\x23\xe8\xfe\xfb\xee\x74\
-\x87\x3f\xf3\xee\xbb\x2e\x11\x40\xbd\xdf\x79\x95\x91\x04\xa0\x8c\
-\x04\x00\x58\x6a\xe2\x48\x00\x00\x00\x00\xa8\xc9\xec\xec\x6c\x9c\
-\x83\xad\x5b\xbb\xce\xe9\xe4\xdb\x3b\xef\x4c\xa6\x3b\x7c\xef\xce\
-\x9d\x39\x38\x82\xfb\xff\xee\xfe\x74\x87\xff\xc3\xff\xfc\xc1\x25\
-\x02\xa8\x9d\x32\x92\x30\x94\x91\x00\x00\x01\x88\x23\x01\x00\x00\
-\x00\xa0\x26\xe7\xcf\x9f\x8b\x73\xb0\x96\x15\x2b\x9c\x4e\xbe\xfd\
-\xf6\xbf\x7f\x9b\xee\xf0\x1b\x36\x6e\xc8\xc1\x11\x7c\xf9\xcb\xf7\
-\xa5\x3b\xfc\xc4\xa9\x09\x97\x08\xa0\x46\xca\x48\xc2\x50\x46\x02\
-\x00\x84\x21\x8e\x04\x00\x00\x00\x80\x9a\xcc\xcd\xcd\xc5\x39\x58\
-\xa1\x50\x70\x3a\xf9\x56\xfa\x45\x29\xdd\xe1\xef\xbb\xef\x2b\x39\
-\x38\x82\xa4\x6f\xd9\x48\xa9\x94\x65\x99\x7b\x04\x70\x4b\xca\x48\
-\xc2\x50\x46\x02\x00\x04\x23\x8e\x04\x00\x00\x00\x80\x9a\xbc\x77\
-\xf6\xbd\x38\x07\xf3\x1b\xf1\x7c\x2b\x97\xcb\x09\x55\x1a\x9f\xd6\
-\xd1\xd1\x91\x8f\x83\x48\xfa\xfd\xe0\xd5\x4f\x91\xab\x04\x70\xcb\
-\xff\x54\x2a\x23\x09\x40\x19\x09\x00\x10\x92\x38\x12\x00\x00\x00\
-\x00\x6a\xf2\xf1\xc7\x1f\x47\x38\x55\xd2\xc1\x16\xb5\x78\xff\x8f\
-\x7f\x4c\x77\xf8\x3c\x7d\x3e\x93\x7e\x3f\xf8\xe4\xe4\xdb\xae\x12\
-\xc0\x4d\x28\x23\x09\x43\x19\x09\x00\x10\x98\x38\x12\x00\x00\x00\
-\x00\x6a\x32\xf6\xc6\x58\x84\x53\x7d\xee\x73\x9f\x73\x34\xf9\xf6\
-\xd6\x5b\x6f\xa5\x3b\x7c\xd2\x41\xe1\x75\xd6\xad\x5d\x97\xee\xf0\
-\xd1\x3e\xf8\x16\x20\x06\xca\x48\xc2\x50\x46\x02\x00\x84\x27\x8e\
-\x04\x00\x00\x00\x80\x9a\xc4\xf9\x2b\xf3\x2f\xdd\xf3\x25\x47\x93\
-\x6f\xbf\xfb\xdd\xef\xd2\x1d\x3e\xe9\xa0\xf0\x3a\x6b\xee\xbe\x3b\
-\xdd\xe1\x4b\xbf\x28\xb9\x4a\x00\x37\xa4\x8c\x24\x0c\x65\x24\x00\
-\xc0\xb2\x10\x47\x02\x00\x00\x00\xc0\xad\x95\xcb\xe5\x38\x07\xbb\
-\xe3\x6f\xee\x70\x3a\x39\x96\x65\xd9\x48\x29\xe1\xac\xad\x63\xfd\
-\xfa\xdc\x9c\x45\x6b\x6b\x6b\x7b\xfb\xaa\x44\x87\x9f\x9e\x9e\xa9\
-\x54\x2a\x2e\x14\xc0\xa7\x7f\xc0\x53\x46\x12\x80\x32\x12\x00\x60\
-\xb9\x88\x23\x01\x00\x00\x00\xe0\xd6\xb2\x2c\x8b\x73\xb0\xb6\xdb\
-\x6f\x77\x3a\x39\x16\x6d\x95\x5b\x8b\xae\xae\x4d\x39\xab\x37\x36\
-\x3f\xb8\x39\xdd\xe1\x67\x67\x67\x5d\x28\x80\xeb\xbe\xc9\x2a\x23\
-\x09\x40\x19\x09\x00\xb0\x8c\xc4\x91\x00\x00\x00\x00\x70\x6b\xe7\
-\xcf\x9f\x8b\x73\xb0\x42\xa1\xe0\x74\x72\x6c\x72\xf2\xed\x74\x87\
-\x5f\x7d\xd7\xea\x9c\x1d\xc7\x86\x8d\x1b\x7c\x96\x00\xf2\x41\x19\
-\x49\x18\xca\x48\x00\x80\xe5\x25\x8e\x04\x00\x00\x00\x80\x5b\x9b\
-\x9b\x9b\x8b\x73\x30\xbf\x23\xcf\xb7\xf7\xce\xbe\x97\xee\xf0\x49\
-\xa7\x84\x37\x94\xf4\x5b\xec\x93\xfe\x2c\x01\x2c\x2e\x65\x24\x61\
-\x28\x23\x01\x00\x96\x9d\x38\x12\x00\x00\x00\x00\x6e\x2d\xce\xae\
-\xa8\x77\xe7\x4e\x47\x93\x6f\xef\x9e\x79\x37\xdd\xe1\xd7\xad\x5d\
-\x97\xb3\xe3\x58\x73\xf7\xdd\xe9\x0e\x3f\x33\x33\xe3\x42\x01\xdc\
-\xa6\x8c\x24\x14\x65\x24\x00\x40\x0c\xc4\x91\x00\x00\x00\x00\x70\
-\x6b\x1f\x7f\xfc\xb1\x25\x10\x58\x96\x65\xe3\xe3\x27\xd3\x9d\xbf\
-\xed\xf6\xdb\x73\x76\x22\x49\xbf\xc5\x7e\xa4\x54\x72\xa7\x00\x94\
-\x91\x84\xa1\x8c\x04\x00\x88\xc4\x67\xac\x00\x00\x00\x00\x00\x6e\
-\x69\xec\x8d\xb1\x08\xa7\x5a\xb9\x72\x65\xb1\x38\x74\xdb\x9f\x1f\
-\x6c\x39\x9f\x6f\x5e\xf8\xe0\x42\xc3\x39\x5d\x57\xd7\xa6\xd5\x77\
-\xad\xbe\xf6\x6f\xbe\xf3\x0b\x77\xde\xf6\xe7\xf7\x08\xb7\xdd\x7e\
-\x7b\x4b\x4b\x4b\xd2\x59\x58\xa2\xca\xe5\x72\xd2\xf3\xe7\xf2\x33\
-\x53\xbd\x26\xe9\x16\xab\x53\x53\x53\x1d\x1d\x1d\x6e\x16\xd0\xcc\
-\xdf\x58\x95\x91\x04\xa0\x8c\x04\x00\x88\x87\x38\x12\x00\x00\x00\
-\x00\x6e\x2d\xce\xdf\xa3\x2f\xee\xaf\x5d\xc7\xc7\x4f\xde\xb2\xfa\
-\x9a\x7f\x91\xf7\x86\x8d\x1b\x56\xac\x58\xb1\x76\xed\xba\x42\xa1\
-\xe0\x17\xf6\x4b\xe7\xfc\xf9\x73\xe9\x0e\xbf\xad\xbb\x3b\x97\x87\
-\xb2\xfa\xae\xd5\xe9\xc6\x91\xd9\xdc\x9c\x6b\x05\x34\x2d\x65\x24\
-\x61\x28\x23\x01\x00\xa2\x22\x8e\x04\x00\x00\x00\x80\x5b\x48\xfd\
-\x01\x7e\x8b\x68\xa8\x58\xbc\xf6\xd7\x79\xed\xed\xab\x36\x3f\xb8\
-\xf9\x9e\x7b\xef\xf9\xe2\xdf\x7e\x71\xcd\xdd\x77\x7b\xc0\xe4\x22\
-\xba\x7c\xf9\x72\xba\xc3\xaf\x5a\xb5\x2a\x97\x87\xb2\x61\xe3\x86\
-\x4f\x7e\xfe\xd3\x72\xee\xfc\xb9\x8d\x9d\x9d\x6e\x16\xd0\x9c\x3f\
-\xcb\x29\x23\x09\x40\x19\x09\x00\x10\x9b\xff\x15\x80\xbd\x3b\x8e\
-\xad\xb3\xbc\x0f\x3d\x9e\x4d\xfd\xf3\x04\xf8\xef\x98\x42\xf1\x29\
-\x07\xc2\x58\x13\x9c\x2e\x54\xd0\xc4\x40\x4c\x2a\x62\xda\xbb\x4a\
-\x3b\x5e\xc2\x76\xc7\x2e\xad\x4d\x35\xba\xab\xb5\x4d\x90\xe8\xc6\
-\x44\x6c\x07\x8d\xab\x21\x11\xd3\x4e\x77\xad\xd4\x1c\x43\xb4\x4c\
-\x1a\x70\xe3\x75\x74\xbd\x09\x15\x8e\xd3\xc6\x49\x89\x9a\x80\xdd\
-\x24\xeb\x4d\xe0\xac\x4e\x4a\x4a\xfc\x5f\xc0\xe7\xff\xde\x43\x4f\
-\xe7\x65\x71\xe2\x38\xce\x39\xef\x79\x9f\xe7\xfd\x7c\x14\x21\x97\
-\xb1\xf8\x79\x7f\xef\xfb\x9e\x44\xf2\x57\xcf\x23\x8e\x04\x00\x00\
-\x00\x80\xcb\xa8\x56\xab\x86\x70\x29\x53\x53\xa7\x2e\x68\xc5\xfa\
-\x7a\x7b\x97\xaf\x58\xfe\xa9\x3b\x3f\x75\xcb\xad\xb7\xe6\xf3\x79\
-\x23\x5a\xb4\x63\x47\x8f\x85\xbb\xf8\x4f\x2c\xff\x84\x3b\x98\x36\
-\xc7\x8f\x1d\x37\x04\x20\x83\x94\x91\x24\x43\x19\x09\x00\x90\x42\
-\xe2\x48\x00\x00\x00\x00\xb8\x8c\xa0\x4f\x37\x4e\xde\xf9\xad\x64\
-\x57\xd7\xda\xb5\xf7\xad\xbd\xeb\xae\xbb\xd6\x74\x76\xfa\x19\xff\
-\x95\x1a\xdd\x3b\x1a\xee\xe2\x6f\xf8\xe8\x0d\x51\xde\x94\x55\xab\
-\xee\x0c\x77\xf1\xef\xbf\xff\xbe\xd7\x0a\xc8\x1a\x65\x24\xc9\x50\
-\x46\x02\x00\xa4\x93\x38\x12\x00\x00\x00\x00\x2e\x63\x66\x66\xc6\
-\x10\x16\x67\x6c\x6c\x5f\xed\x57\xfd\xeb\x9e\x52\xe9\xb3\x9f\xfb\
-\xec\x7d\xf7\xad\x75\xf4\xf6\x42\x54\xab\xd5\x80\x4a\x8e\xb9\xda\
-\xae\xbf\x3e\xca\xfb\x12\x74\xad\x52\x1e\x1e\xde\x5e\x2e\x7b\xb9\
-\x80\xec\x50\x46\x92\x0c\x65\x24\x00\x40\x6a\x89\x23\x01\x00\x00\
-\x00\xe0\x32\x9c\x45\xdb\x10\xbb\x46\x46\x6a\xbf\x96\xfc\xc7\x76\
-\x92\xeb\xd6\xad\x5b\xd3\xd9\x69\x2c\x97\x52\xa9\x54\x82\x5e\x7f\
-\xac\x09\x6c\xe8\xd7\x55\xad\x56\x35\x37\x40\x76\xfe\x24\x55\x46\
-\x92\x00\x65\x24\x00\x40\x9a\xfd\xb6\x11\x00\x00\x00\x00\xc0\xfc\
-\x9c\x45\xdb\x58\x63\x63\xfb\xfa\x07\x06\x3a\xef\xb9\xe7\xe3\x1f\
-\x2f\x6c\x1d\x1c\x0c\xbd\x02\x6c\x92\xb3\xef\xbd\x17\xf4\xfa\x23\
-\x6e\x3b\x0a\x85\xf6\x70\x17\xef\x75\x03\x32\x42\x19\x49\x32\x94\
-\x91\x00\x00\x29\x27\x8e\x04\x00\x00\x00\x80\xcb\x18\xdd\x3b\x6a\
-\x08\xcd\x30\x35\x75\xaa\x7f\x60\xe0\x96\x5b\x6e\xb9\xff\xfe\xae\
-\xe1\xe1\xf2\xf4\xf4\xb4\x99\xcc\x3a\xf3\xcb\x33\xe1\x2e\xbe\xa7\
-\x54\x8a\xf8\xd6\xac\xbb\x7f\x5d\xb8\x8b\x0f\x3d\xba\x05\x58\x08\
-\x65\x24\xc9\x50\x46\x02\x00\xa4\x9f\x38\x12\x00\x00\x00\x00\x2e\
-\x23\xa0\x1f\xae\x07\x6a\x6c\x6c\x5f\x5f\xdf\xa3\x6d\x6d\x6d\x8f\
-\x6f\xde\x3c\x39\x39\x69\x20\x4b\x02\x3f\xcc\xfd\xba\xeb\xae\x73\
-\x07\xd3\x29\xe8\xe8\x16\x60\x21\x94\x91\x24\x43\x19\x09\x00\x10\
-\x04\x71\x24\x00\x00\x00\x00\xcc\xc7\x29\xb4\x49\xda\x36\x34\xb4\
-\x72\xe5\xca\xfb\xef\xef\x7a\x6d\xcf\x9e\x6a\xb5\x9a\xe5\x51\x04\
-\x7d\x98\xfb\x4d\x37\xdd\x14\xf1\xad\x59\xbe\x62\x79\xb8\x8b\xff\
-\xe0\x83\x0f\x7c\xce\x00\x71\xff\xb5\x4d\x19\x49\x02\x94\x91\x00\
-\x00\xa1\x10\x47\x02\x00\x00\x00\xc0\x7c\x32\x9e\xe8\xb5\xc4\xd8\
-\xd8\xbe\xee\x07\x1f\x5c\xb1\x62\xf9\xf0\x70\x39\xb3\xf3\x2f\x0f\
-\x0f\x87\xbb\xf8\x1b\x3f\x76\x63\xc4\xb7\xe6\x9a\x6b\xae\x09\x77\
-\xf1\xc7\x8e\x1e\xf3\x09\x03\xc4\x4a\x19\x49\x32\x94\x91\x00\x00\
-\x01\x11\x47\x02\x00\x00\x00\xc0\x7c\x4e\x9e\x3c\x61\x08\x2d\x31\
-\x35\x75\xaa\xaf\xef\xd1\x8c\x27\x92\x81\x5a\xba\x74\xa9\xab\x4b\
-\xa7\x73\xe7\xce\x79\x3e\x81\x28\x29\x23\x49\x86\x32\x12\x00\x20\
-\x2c\xe2\x48\x00\x00\x00\x00\x98\xcf\xcc\xcc\x8c\x21\xb4\x50\x36\
-\x13\xc9\xc9\xc9\xc9\xa0\xd7\xbf\x6c\xd9\x6d\x11\xdf\x9d\xa0\xaf\
-\x6e\xd7\xc8\x88\x4f\x15\x20\x3e\xca\x48\x92\xa1\x8c\x04\x00\x08\
-\x8e\x38\x12\x00\x00\x00\x00\xe6\x73\xfc\xd8\x71\x43\x68\xb9\xd9\
-\x44\xf2\xb5\x3d\x7b\x4c\x03\x00\x98\xa5\x8c\x24\x19\xca\x48\x00\
-\x80\x10\x89\x23\x01\x00\x00\x00\x60\x3e\xef\xbf\xff\xbe\x21\xa4\
-\xc4\xd4\xd4\xa9\xee\x07\x1f\xfc\xc3\x9e\x9e\xd0\x37\x56\xbc\xac\
-\xd0\x0f\x73\x6f\x6b\x6b\x8b\xf8\xee\x84\x7e\x75\x95\x4a\xc5\x87\
-\x09\x10\x0d\x65\x24\xc9\x50\x46\x02\x00\x04\x4a\x1c\x09\x00\x00\
-\x00\x00\xf3\x19\xdd\x3b\x6a\x08\xa9\xb2\x6b\x64\x64\xe5\xca\x95\
-\x5b\x07\x07\x23\x3e\x65\x3b\xf4\xc3\xdc\xf3\xf9\x7c\xc4\x4f\x60\
-\xe8\x57\x97\x9d\xe3\xe9\x81\xe8\x29\x23\x49\x86\x32\x12\x00\x20\
-\x5c\xe2\x48\x00\x00\x00\x00\x98\x4f\x40\x3f\x71\xcf\x94\xfe\x81\
-\x81\x15\x2b\x96\x1f\x18\x1f\x8f\xf2\xea\xde\xfd\xc5\xbb\x6e\x31\
-\x00\xcc\x43\x19\x49\x32\x94\x91\x00\x00\x41\x13\x47\x02\x00\x00\
-\x00\xc0\x25\x45\x7f\x7c\x73\xd0\xa6\xa6\x4e\x75\xde\x73\xcf\xe3\
-\x9b\x37\xc7\xb7\x13\xde\xe9\xd3\xa7\xc3\x5d\x7c\x57\xd7\xda\xe8\
-\x9f\xbd\x42\xa1\x3d\xdc\xc5\x1f\x39\x72\xd8\xa7\x07\x10\x3a\x65\
-\x24\xc9\x50\x46\x02\x00\x84\x4e\x1c\x09\x00\x00\x00\x00\x04\x6c\
-\xdb\xd0\x50\xc4\x5b\x48\x86\xe8\xe6\x8f\xdf\x1c\xfd\x35\xae\xbb\
-\x7f\x9d\x1b\x0d\xd0\x2a\xca\x48\x92\xa1\x8c\x04\x00\x88\x80\x38\
-\x12\x00\x00\x00\x00\x2e\xc9\x16\x6b\x41\xa8\x6f\x21\xf9\xfc\xf3\
-\x43\xd1\x6c\x21\x39\xba\x77\xd4\x6d\x05\x80\xb9\x94\x91\x24\x43\
-\x19\x09\x00\x10\x07\x71\x24\x00\x00\x00\x00\x10\x83\x4d\x9b\x36\
-\x7f\xe1\x91\x47\x2a\x95\x4a\x04\xd7\x12\x50\xf3\x41\x70\x0e\x1e\
-\x38\x68\x08\x40\xa0\x94\x91\x24\x43\x19\x09\x00\x10\x0d\x71\x24\
-\x00\x00\x00\x00\x5c\x92\x8a\x28\x2c\xbb\x46\x46\x3e\xf3\x99\x75\
-\xaf\xed\xd9\x63\x14\x2d\xb4\x7c\xc5\xf2\xe8\xaf\xf1\xda\x6b\xaf\
-\x75\xa3\x01\x12\xa6\x8c\x24\x19\xca\x48\x00\x80\x98\x88\x23\x01\
-\x00\x00\x00\x80\x78\x4c\x4d\x9d\xea\x7e\xf0\xc1\xad\x83\x83\xe1\
-\x5e\x42\xe8\x9b\x5f\x5e\x73\xcd\x35\xd1\x3f\x66\x9f\x58\xfe\x09\
-\xef\x1a\x40\xc2\x7f\x38\x2a\x23\x49\x80\x32\x12\x00\x20\x32\xe2\
-\x48\x00\x00\x00\x00\xb8\xa4\xf2\xf0\xb0\x21\x84\xa8\x7f\x60\xe0\
-\xd1\xbe\xbe\x6a\xb5\x1a\xe2\xe2\x03\x5d\x36\xa1\x38\x77\xee\x9c\
-\x21\x00\x61\x51\x46\x92\x0c\x65\x24\x00\x40\x7c\xc4\x91\x00\x00\
-\x00\x00\x40\x84\xca\xc3\xc3\x5f\x78\xe4\x91\xe9\xe9\x69\xa3\x80\
-\xf3\xed\x1a\x19\x31\x04\x20\x20\xca\x48\x92\xa1\x8c\x04\x00\x88\
-\x92\x38\x12\x00\x00\x00\x00\x2e\x6e\x72\x72\xd2\x10\x82\xb6\x6b\
-\x64\xe4\xee\xbb\xef\x0a\xee\x94\xea\xea\xcc\x8c\x7b\x07\x00\x4b\
-\x94\x91\x24\x45\x19\x09\x00\x10\x2b\x71\x24\x00\x00\x00\x00\x10\
-\xad\xa9\xa9\x53\x9f\xf9\xcc\xba\xb0\xfa\xc8\x13\x27\x4f\x04\x3d\
-\xf3\x55\xab\xee\xf4\xe0\x01\x70\xf5\x94\x91\x24\x43\x19\x09\x00\
-\x10\x31\x71\x24\x00\x00\x00\x00\x5c\xdc\x91\x23\x87\x0d\x21\x02\
-\x21\xf6\x91\xa4\x9c\x00\x14\xa0\xd9\x94\x91\x24\x43\x19\x09\x00\
-\x10\x37\x71\x24\x00\x00\x00\x00\x10\x39\x7d\x24\x9c\xaf\x5a\xad\
-\x1a\x02\x90\x66\xca\x48\x92\xa1\x8c\x04\x00\x88\x9e\x38\x12\x00\
-\x00\x00\x00\x2e\xee\xe0\x81\x83\x86\x10\x0d\x7d\x24\xcc\xf2\x22\
-\x00\x29\xff\x8c\x52\x46\x92\x00\x65\x24\x00\x40\x16\x88\x23\x01\
-\x00\x00\x00\x80\x4c\xa8\xf7\x91\xe9\xdf\x33\xef\xdd\x5f\xbc\xeb\
-\x66\x01\x90\x4d\xca\x48\x92\xa1\x8c\x04\x00\xc8\x08\x71\x24\x00\
-\x00\x00\x00\x5c\x5c\x79\x78\xd8\x10\x22\x33\x35\x75\xea\x0b\x8f\
-\x3c\x92\xf2\x3e\xf2\xf4\xe9\xd3\xee\x14\x00\x19\xa4\x8c\x24\x19\
-\xca\x48\x00\x80\xec\x10\x47\x02\x00\x00\x00\x00\x19\xb2\x6b\x64\
-\xa4\x7f\xcb\x16\x73\x00\x80\x54\x51\x46\x92\x0c\x65\x24\x00\x40\
-\xa6\x88\x23\x01\x00\x00\x00\xe0\x22\x26\x27\x27\x0d\x21\x56\xdb\
-\x86\x86\x86\x87\xcb\xe6\x00\x00\x29\xa1\x8c\x24\x19\xca\x48\x00\
-\x80\xac\x11\x47\x02\x00\x00\x00\x00\x99\xd3\xd7\xf7\xe8\x81\xf1\
-\x71\x73\x00\x80\x96\x53\x46\x92\x0c\x65\x24\x00\x40\x06\x89\x23\
-\x01\x00\x00\x00\xe0\x22\x8e\x1c\x39\x6c\x08\x71\x7b\xf8\x4f\x1f\
-\x9e\x9e\x9e\x36\x87\x86\x6b\x6b\x6b\x33\x04\x00\x16\x48\x19\x49\
-\x32\x94\x91\x00\x00\xd9\x24\x8e\x04\x00\x00\x00\x00\xb2\x68\x6a\
-\xea\xd4\x5f\x3f\xf9\xa4\x39\x34\x5c\x3e\x9f\x37\x04\x00\x16\x42\
-\x19\x49\x32\x94\x91\x00\x00\x99\x25\x8e\x04\x00\x00\x00\x80\x8b\
-\x38\x78\xe0\xa0\x21\x44\xaf\x3c\x5c\x53\x36\x07\x00\x48\x9e\x32\
-\x92\x64\x28\x23\x01\x00\xb2\x4c\x1c\x09\x00\x00\x00\x00\x64\x57\
-\x5f\xdf\xa3\x95\x4a\xc5\x1c\xb8\x22\x1d\x1d\x1d\x86\x00\x70\x35\
-\x94\x91\x24\x43\x19\x09\x00\x90\x71\xe2\x48\x00\x00\x00\x00\xb8\
-\x88\xf2\xf0\xb0\x21\x64\xc4\xff\x7a\xe6\x19\x43\x00\x80\xc4\x28\
-\x23\x49\x86\x32\x12\x00\x00\x71\x24\x00\x00\x00\x00\x90\x69\xe5\
-\xe1\xe1\x57\x5e\x79\xd9\x1c\x00\x20\x01\xca\x48\x92\xa1\x8c\x04\
-\x00\x60\x89\x38\x12\x00\x00\x00\x00\xe6\x9a\x9c\x9c\x34\x84\x4c\
-\x79\xe2\x89\x27\xaa\xd5\xaa\x39\x00\x40\x53\x29\x23\x49\x86\x32\
-\x12\x00\x80\x3a\x71\x24\x00\x00\x00\x00\x90\x75\x53\x53\xa7\xb6\
-\x3d\xf7\x9c\x39\x00\x40\xf3\x28\x23\x49\x86\x32\x12\x00\x80\x59\
-\xe2\x48\x00\x00\x00\x00\xb8\xd0\x91\x23\x87\x0d\x21\x6b\xfa\x07\
-\x06\xa6\xa7\xa7\xcd\x01\x00\x9a\x41\x19\x49\x32\x94\x91\x00\x00\
-\x9c\x4f\x1c\x09\x00\x00\x00\x00\xf0\xa1\xbf\x7e\xf2\x49\x43\x60\
-\x21\x2a\x95\x8a\x21\x00\x5c\xd1\xc7\xa6\x32\x92\x04\x28\x23\x01\
-\x00\xb8\xc0\x47\x8c\x00\x00\x00\x00\x00\x2e\x70\xf0\xc0\xc1\xe6\
-\xfd\xe6\x5d\x5d\x6b\x6f\xfe\xf8\xcd\x97\xfa\xbf\x8e\xee\x1d\x0d\
-\x28\x1d\x88\x4c\x79\x78\xf8\x2f\xbe\xf2\x95\x8e\x8e\x0e\xa3\x60\
-\x7e\xd5\x6a\xd5\x10\x00\x16\x48\x19\x49\x32\x94\x91\x00\x00\xcc\
-\x25\x8e\x04\x00\x00\x80\xac\x9b\x9c\x9c\x5c\xb9\x72\xa5\x39\xb4\
-\x4a\x79\x78\xb8\xf6\xcb\x1c\x7e\xf5\xab\x5f\xa5\x6a\x3d\xe7\xce\
-\x9d\xbb\xec\x7f\xd3\xd7\xdb\x5b\xff\x62\xf5\x9a\xd5\xf5\x2f\x6e\
-\xf8\xe8\x0d\x6d\xd7\x5f\x3f\xfb\x1f\x34\xb0\xb1\xab\x54\x2a\xb3\
-\x31\xd6\xd9\xf7\xde\x3b\xf3\xcb\x33\xb5\x2f\xde\xfd\xc5\xbb\xa7\
-\x4f\x9f\xae\x3f\x45\x1e\xa1\x46\xf9\xbb\x6f\x7e\x73\x7b\xb9\x6c\
-\x0e\x00\xd0\xa8\xbf\xc3\x28\x23\x49\x80\x32\x12\x00\x80\x8b\x12\
-\x47\x02\x00\x00\x00\xc0\x85\x76\x8d\x8c\xd4\xbf\xa8\xef\xf2\xb8\
-\x7c\xc5\xf2\x6b\xae\xb9\xe6\xb6\x65\xb7\xe5\x96\x2e\x6d\x6b\x6b\
-\xcb\xe7\xf3\x09\xaf\xa7\x58\x2c\xce\x7e\x3d\xb7\xb9\xac\xc7\x7c\
-\xf5\x80\xf2\xe4\xc9\x13\x33\x33\x33\x07\x0f\x1c\x3c\x77\xee\xdc\
-\xec\x55\xb0\x70\xe5\xe1\xe1\xbf\x7a\xf2\xc9\xf3\x07\x0e\x00\x2c\
-\x8e\x32\x92\x64\x28\x23\x01\x00\xb8\x14\x71\x24\x00\x00\x00\x00\
-\x5c\x68\x62\x62\xa2\x25\x11\xe4\xd5\xa8\xf7\x7c\xf5\x74\xb2\xb7\
-\xb7\xaf\xfe\x2f\x2b\x95\xca\x3b\x6f\xbf\x7d\xe6\x97\x67\x0e\x1e\
-\x38\xe8\xc0\xee\x05\xfa\xc7\x9d\x3b\xb7\xf4\xf7\x9b\xc3\xa2\x4d\
-\x4f\x4f\x87\xf5\xee\x00\xd0\x0c\xca\x48\x92\xa1\x8c\x04\x00\x60\
-\x1e\xe2\x48\x00\x00\x00\x00\xb8\x50\x03\x4f\xc4\x6e\xad\xe2\xaf\
-\x2d\xf9\x8f\x5c\xb2\xde\x4a\x1e\x3a\x74\x68\xdf\x0f\xf7\x8d\x8d\
-\xed\x73\xa3\x2f\xaa\x7f\x60\xe0\xcf\x1e\x7b\x4c\xde\xb7\x68\x67\
-\xcf\x9e\x35\x3d\x80\x8c\x53\x46\x92\x0c\x65\x24\x00\x00\xf3\xfb\
-\x6d\x23\x00\x00\x00\x00\x80\x8c\x28\x16\x8b\xeb\xbb\xbb\xb7\xf4\
-\xf7\xef\xdd\x3b\x76\xf6\xec\xd9\x3d\xbb\x77\x6f\xde\xb4\xa9\x50\
-\x68\x37\x99\x0b\x7c\xff\xfb\xff\x6a\x08\x00\xb0\x38\xca\x48\x92\
-\xa1\x8c\x04\x00\xe0\xb2\xc4\x91\x00\x00\x00\x00\x90\x45\xf9\x7c\
-\x7e\x7d\x77\xf7\x73\xdb\xb6\xfd\xfc\xe7\x53\xe3\xfb\xf7\x0f\x0e\
-\x0c\xa8\x24\x67\xed\xdc\xb9\xd3\x10\x00\x60\x11\x94\x91\x24\x43\
-\x19\x09\x00\xc0\x42\x88\x23\x01\x00\x00\x00\x20\xeb\xd6\x74\x76\
-\x6e\xe9\xef\x9f\xad\x24\x0d\x64\x6c\x6c\xdf\x81\xf1\xf1\x56\x7d\
-\xf7\xd5\x6b\x56\xbb\x05\x34\x55\xb1\x58\x34\x04\xa0\x19\x94\x91\
-\x24\x43\x19\x09\x00\xc0\x02\x89\x23\x01\x00\x00\x00\x80\xdf\xa8\
-\x57\x92\x33\x33\x33\x2f\xbf\xfc\x52\x57\xd7\xda\x2c\x8f\x62\x64\
-\x64\xc4\xf3\x40\xac\x64\x40\x40\x33\x28\x23\x49\x86\x32\x12\x00\
-\x80\x85\x13\x47\x02\x00\x00\x00\x00\xff\x45\x2e\x97\xdb\xb0\x61\
-\xe3\xde\xbd\x63\xe3\xfb\xf7\xf7\xf5\xf6\x66\x73\x08\xdb\x86\x86\
-\xaa\xd5\xaa\x87\x01\x00\x16\x42\x19\x49\x32\x94\x91\x00\x00\x5c\
-\x11\x71\x24\x00\x00\x00\x00\x70\x71\x6b\x3a\x3b\xb7\x97\xcb\x13\
-\x13\x13\xd9\x4c\x24\x5b\x78\xb2\x36\x29\x77\xf2\xe4\x09\x43\x00\
-\x98\xa5\x8c\x24\x19\xca\x48\x00\x00\xae\x94\x38\x12\x00\x00\x00\
-\x00\x98\x4f\x47\x47\x47\x3d\x91\xcc\xda\x41\xdb\x3f\xf8\xc1\x0f\
-\xdc\x7d\x2e\x6a\x66\x66\xc6\x10\x00\xea\x94\x91\x24\x43\x19\x09\
-\x00\xc0\x22\x88\x23\x01\x00\x00\x00\x80\xcb\xeb\xe8\xe8\xd8\xbb\
-\x77\xec\xe5\x97\x5f\x2a\x14\xda\x33\x72\xc9\xad\x3a\x59\x7b\xd5\
-\xaa\x3b\x3d\x6f\x34\x4f\x4f\xa9\x64\x08\x40\xa3\x28\x23\x49\x86\
-\x32\x12\x00\x80\xc5\x11\x47\x02\x00\x00\x00\x00\x0b\xb5\x61\xc3\
-\xc6\x37\xde\x38\x94\x9d\x53\xb6\x9d\xac\xbd\x08\x47\x8e\x1c\x36\
-\x84\x34\xbb\xee\xba\xeb\x0c\x01\x68\x08\x65\x24\xc9\x50\x46\x02\
-\x00\xb0\x68\xe2\x48\x00\x00\x00\x00\xe0\x0a\xe4\xf3\xf9\xed\xe5\
-\xf2\xcb\x2f\xbf\x94\x85\x8b\x3d\x74\xe8\x90\x3b\x0e\x00\x73\x29\
-\x23\x49\x86\x32\x12\x00\x80\xab\x21\x8e\x04\x00\x00\x00\x00\xae\
-\xd8\x86\x0d\x1b\xdf\x79\xe7\x9d\xae\xae\xb5\x71\x5f\xe6\x0b\x2f\
-\xbe\x90\xfc\x37\xd5\x6d\xa4\xdf\x07\x1f\x7c\x60\x08\x40\x96\x29\
-\x23\x49\x86\x32\x12\x00\x80\xab\x24\x8e\x04\x00\x00\x00\x00\x16\
-\xa3\x58\x2c\xbe\xfa\xea\xf7\x7a\x4a\xa5\x88\xaf\x71\x6a\xea\x54\
-\xa5\x52\x49\x7e\xb0\x9e\xae\x94\x3b\x76\xf4\x58\xb8\x8b\x5f\xbd\
-\x66\xb5\x3b\x08\x5c\x0d\x65\x24\xc9\x50\x46\x02\x00\x70\xf5\xc4\
-\x91\x00\x00\x00\x00\xc0\x22\xe5\x72\xb9\x17\x77\xec\x18\x0c\xea\
-\xe7\xd6\x57\xea\xcd\x37\x8f\xb8\xd1\x57\xc4\xae\x8a\x00\x11\x53\
-\x46\x92\x0c\x65\x24\x00\x00\x0d\x21\x8e\x04\x00\x00\x00\x00\x16\
-\x2f\x97\xcb\x6d\xe9\xef\x8f\xb8\x8f\x7c\xe3\xc7\x6f\x24\xff\x4d\
-\x0b\x85\xf6\x70\x27\x16\xf4\xae\x8a\x00\xcc\x43\x19\x49\x32\x94\
-\x91\x00\x00\x34\x8a\x38\x12\x00\x00\x00\x00\xb8\x5a\x11\xf7\x91\
-\x6f\x4d\xbc\x95\xfc\x37\x5d\x77\xff\x3a\x0f\x55\x9a\x9d\x3b\x77\
-\x2e\xdc\xc5\xdf\xb6\xec\x36\x77\x10\x58\x04\x65\x24\xc9\x50\x46\
-\x02\x00\xd0\x40\xe2\x48\x00\x00\x00\x00\xa0\x01\x36\x3f\xfe\x78\
-\x4f\xa9\x14\xdf\x75\x8d\x8d\xed\xab\x56\xab\xee\x2f\xe7\xdb\x35\
-\x32\x12\xee\xe2\x73\x4b\x97\xba\x83\xc0\x95\x52\x46\x92\x0c\x65\
-\x24\x00\x00\x8d\x25\x8e\x04\x00\x00\x00\x00\x1a\x20\x97\xcb\xbd\
-\xb8\x63\x47\x57\xd7\xda\xf8\x2e\xad\x52\xa9\x24\xfc\x1d\x6f\xba\
-\xe9\xa6\x70\xc7\xf5\xef\x3f\xff\x77\xaf\x03\x40\x64\x7f\x0e\x2a\
-\x23\x49\x80\x32\x12\x00\x80\x86\x13\x47\x02\x00\x00\x00\x00\x8d\
-\x91\xcb\xe5\xbe\xf3\x9d\xed\xf1\x5d\xd7\x91\x23\x87\x13\xfe\x8e\
-\x37\x7e\xec\xc6\x70\xc7\x35\x36\xb6\xcf\xbb\x90\x66\x1d\x1d\x1d\
-\x86\x00\x2c\x9c\x32\x92\x64\x28\x23\x01\x00\x68\x06\x71\x24\x00\
-\x00\x00\x00\xd0\x30\xc5\x62\xb1\x5c\x8e\xad\x8f\x3c\x7e\xec\xb8\
-\x3b\xcb\xac\xc9\xc9\x49\x43\x00\x32\x42\x19\x49\x32\x94\x91\x00\
-\x00\x34\x89\x38\x12\x00\x00\x00\x00\x68\xa4\xde\xde\xbe\x9e\x52\
-\x29\xa6\x2b\x3a\x75\x2a\xe9\x28\x64\xd5\xaa\x3b\x83\x9e\xd8\xf4\
-\xf4\xb4\x17\x21\x9d\xa2\x3c\xf8\x1e\x68\x12\x65\x24\xc9\x50\x46\
-\x02\x00\xd0\x3c\xe2\x48\x00\x00\x00\x00\xa0\xc1\xfe\xf6\xd9\x67\
-\x63\xba\x9c\x5d\x23\x23\xee\xe9\x15\x39\x7b\xf6\xac\x21\xa4\xd3\
-\xcd\x1f\xbf\xd9\x10\x80\x85\x50\x46\x92\x0c\x65\x24\x00\x00\x4d\
-\x25\x8e\x04\x00\x00\x00\x00\x1a\xac\x58\x2c\x0e\x06\xf5\x73\xee\
-\xcb\x4a\x78\x2b\xc4\x8e\x8e\x0e\x4f\x51\x6a\x1d\x39\x72\x38\xdc\
-\xc5\x5f\x7b\xed\xb5\xee\x20\x70\x59\xca\x48\x92\xa1\x8c\x04\x00\
-\xa0\xd9\xc4\x91\x00\x00\x00\x00\x40\xe3\xfd\xd9\x63\x8f\xc5\x74\
-\x39\xb6\x42\xbc\x22\x27\x4f\x9e\x30\x84\x74\xfa\xc4\xf2\x4f\x18\
-\x02\x30\x3f\x65\x24\xc9\x50\x46\x02\x00\x90\x00\x71\x24\x00\x00\
-\x00\x00\xd0\x78\xf9\x7c\x3e\xa6\xcd\x23\xcf\xbe\xf7\x5e\xc2\xdf\
-\xb1\xa7\x54\x0a\x77\x5c\x33\x33\x33\x11\x3f\xdb\xef\xfe\xe2\xdd\
-\x70\x17\xbf\x74\xe9\x52\x9f\x4e\xc0\x3c\x94\x91\x24\x43\x19\x09\
-\x00\x40\x32\xc4\x91\x00\x00\x00\x00\x40\x53\xc4\xb4\x79\xe4\x99\
-\x5f\x9e\x49\xf8\x3b\x5e\x77\xdd\x75\xe1\x8e\xeb\x83\x0f\x3e\x88\
-\xf8\xc1\x3e\x7d\xfa\x74\xb8\x8b\x5f\xb6\xec\x36\x1f\x4d\xc0\xa5\
-\x28\x23\x49\x46\x70\x65\xe4\xfa\xf5\xeb\x95\x91\x00\x00\x81\x12\
-\x47\x02\x00\x00\x00\x00\x4d\x91\xcf\xe7\xfb\x7a\x7b\xe3\xb8\x96\
-\xe4\x6b\xbf\xd5\x6b\x56\x87\x3b\xae\x63\x47\x8f\x45\xfc\x60\x9f\
-\x3b\x77\x2e\xdc\xc5\x4b\x88\x80\x4b\x51\x46\x92\x8c\xe0\xca\xc8\
-\x9a\xbf\xfc\xcb\xbf\x74\xe3\x00\x00\x02\x25\x8e\x04\x00\x00\x00\
-\x00\x9a\x65\xc3\x86\x0d\x71\x5c\x48\xf2\xb5\x5f\xd0\xc7\x1f\x07\
-\x9d\x0f\x5e\xd6\xae\x91\x91\x70\x17\x5f\x2c\x16\x7d\x2e\x01\x73\
-\x29\x23\x49\x46\x88\x65\x24\x00\x00\x41\x13\x47\x02\x00\x00\x00\
-\x00\xcd\xb2\xa6\xb3\xd3\x10\x16\x27\xe8\xe3\x8f\x83\xce\x07\xe7\
-\x57\xad\x56\xc3\x5d\x7c\x57\xd7\x5a\x6f\x16\x30\x97\x32\x92\x64\
-\x28\x23\x01\x00\x48\x9e\x38\x12\x00\x00\x00\x00\x68\x96\x5c\x2e\
-\x17\xcd\xc9\xda\x09\x6b\x6b\x6b\x0b\x7a\xfd\x41\x47\x84\xf3\xa8\
-\x54\x2a\xe1\x2e\xfe\xe6\x8f\xdf\xec\xcd\x02\xe6\x7e\xac\x29\x23\
-\x49\x80\x32\x12\x00\x80\x96\x10\x47\x02\x00\x00\x00\x00\x4d\xb4\
-\xbe\x7b\x7d\x04\x57\x51\x1e\x1e\x4e\xf8\x3b\xe6\xf3\xf9\xa0\x27\
-\x16\x74\x44\x38\x8f\xea\xcc\x4c\xb8\x8b\x5f\xbe\x62\xb9\x4f\x24\
-\xe0\x82\xcf\x6a\x65\x24\x09\x50\x46\x02\x00\xd0\x2a\xe2\x48\x00\
-\x00\x00\x00\xa0\x89\x7e\xef\xf7\x56\x19\xc2\xe2\x04\xbd\xe9\xe6\
-\xd9\xf7\xde\x8b\xf2\xa6\x9c\x38\x79\x22\xdc\xc5\xdf\x70\xc3\x0d\
-\x5e\x2b\x60\x96\x32\x92\x64\x28\x23\x01\x00\x68\x21\x71\x24\x00\
-\x00\x00\x00\xd0\x44\xc5\x62\xd1\x10\x16\xe7\xda\x6b\xaf\x0d\x77\
-\xf1\x67\x7e\x79\x26\xca\x9b\xf2\xee\x2f\xde\x0d\x77\xf1\xcb\x96\
-\xdd\xe6\xb5\x02\xea\x94\x91\x24\x43\x19\x09\x00\x40\x6b\x89\x23\
-\x01\x00\x00\x00\x80\xe6\x0a\x7a\x07\xc4\x16\xfa\xc4\xf2\x4f\x84\
-\xbb\xf8\xe3\xc7\x8e\x47\x79\x53\x4e\x9f\x3e\x1d\xee\xe2\x95\xca\
-\x40\x9d\x32\x92\x64\x28\x23\x01\x00\x68\x39\x71\x24\x00\x00\x00\
-\x00\xd0\x5c\x37\xdd\x74\x93\x21\x2c\xc2\xaa\x55\x77\x86\xbb\xf8\
-\xf7\xdf\x7f\x3f\xca\x9b\x32\xba\x77\x34\xd0\x95\x17\x0a\xed\xba\
-\x22\x60\x89\x32\x92\xa4\x28\x23\x01\x00\x48\x03\x71\x24\x00\x00\
-\x00\x00\xd0\x5c\x37\x7e\xec\x46\x43\x58\x84\xb6\xb6\xb6\x70\x17\
-\x5f\x1e\x1e\x8e\xef\x8e\x54\xab\xd5\x80\x72\xa2\x0b\xac\xbb\x7f\
-\x9d\x77\x0a\x50\x46\x92\x0c\x65\x24\x00\x00\x29\xf1\x11\x23\x00\
-\x00\x00\x80\x8c\x2b\x16\x8b\x13\x13\x13\xe6\xb0\x72\xe5\xca\x96\
-\x7c\xdf\x9e\x52\xe9\xa9\x2d\x5b\xcc\x9f\xb8\xdd\xf0\xd1\x1b\x0c\
-\x61\x11\xf2\xf9\x7c\xd0\xeb\x9f\x9e\x9e\x0e\xfd\x12\x2e\x50\xa9\
-\x54\xc2\x5d\xfc\xf2\x15\xcb\xbd\x53\x90\x71\xca\x48\x92\xa1\x8c\
-\x04\x00\x20\x3d\xc4\x91\x00\x00\x00\x90\x75\xb9\x5c\xae\xa3\xa3\
-\xc3\x1c\x5a\xe5\xba\xeb\xae\x33\x7f\xa2\xd7\x76\xfd\xf5\x86\xb0\
-\x38\x7d\xbd\xbd\xe1\x6e\xc1\xf8\xce\xdb\x6f\x47\x16\x47\x9e\x3c\
-\x79\x22\xdc\xc5\xdf\xfe\x3b\xb7\x7b\xa1\x20\xcb\x94\x91\x24\x43\
-\x19\x09\x00\x40\xaa\x38\x56\x1b\x00\x00\x00\x00\x20\xa5\x82\xde\
-\xed\xef\x44\xc8\x29\xe1\x45\x9d\x39\x73\x26\xdc\xc5\x6b\x94\x21\
-\xcb\x94\x91\x24\x43\x19\x09\x00\x40\xda\x88\x23\x01\x00\x00\x00\
-\x00\x52\x2a\xe8\xdd\xfe\x8e\x1f\x3b\x1e\xd9\xed\x38\x76\xf4\x58\
-\xb8\x8b\xb7\x4b\x31\x64\x96\x32\x92\x64\x28\x23\x01\x00\x48\x21\
-\x71\x24\x00\x00\x00\x00\xd0\x5c\x6d\x6d\x6d\x86\xb0\x38\xb7\xdc\
-\x7a\x6b\xb8\x8b\x7f\x6b\xe2\xad\xc8\x6e\x47\xb8\x47\x9c\xf7\x94\
-\x4a\xde\x26\xc8\x26\x65\x24\xc9\x50\x46\x02\x00\x90\x4e\xe2\x48\
-\x00\x00\x00\x00\xa0\xb9\xf2\xf9\xbc\x21\x2c\x4e\xb1\x58\x2c\x14\
-\xda\x03\x5d\xfc\xd8\xd8\xbe\x6a\xb5\x1a\xcd\xbd\xa8\x54\x2a\xe1\
-\x2e\xfe\x8e\x3b\xee\xf0\x36\x41\x06\x29\x23\x49\x86\x32\x12\x00\
-\x80\xd4\x12\x47\x02\x00\x00\x00\x00\xcd\x35\x3d\x3d\x6d\x08\x8b\
-\xb6\xee\xfe\x75\xe1\x2e\x7e\x72\x62\x22\x9a\x1b\xf1\xce\xdb\x6f\
-\x87\xbb\xf8\xbb\xee\xba\xcb\xab\x04\x59\xa3\x8c\x24\x19\xca\x48\
-\x00\x00\xd2\x4c\x1c\x09\x00\x00\x00\x00\x34\xd7\xd9\xb3\x67\x43\
-\xbf\x84\x16\x6e\xdf\xb8\x7a\xcd\xea\x70\xe7\x76\xe2\xe4\x89\x68\
-\x1e\xe3\x9f\xfd\xbf\x9f\x85\xbb\xf8\xa0\xcf\x67\x07\x16\x41\x19\
-\x49\x32\x94\x91\x00\x00\xa4\x9c\x38\x12\x00\x00\x00\x00\xe0\x32\
-\x5a\xb8\x7d\xe3\xaa\x55\x77\x86\x3b\xb7\x83\x07\x0e\x46\xf3\x0c\
-\x1c\x3b\x7a\x2c\xdc\xc5\x17\x8b\x45\x6f\x31\x64\x87\x32\x92\x64\
-\x28\x23\x01\x00\x48\x3f\x71\x24\x00\x00\x00\x00\x40\x7a\x05\x9d\
-\xb5\x95\x87\x87\xa3\xb9\x11\xe1\x5e\x4b\x5f\x6f\xaf\xf7\x08\xb2\
-\x43\x19\x49\x32\x94\x91\x00\x00\x04\x41\x1c\x09\x00\x00\x00\x00\
-\x34\xd7\x91\x23\x87\x43\xbf\x84\x9b\x6e\xba\xa9\x55\xdf\x3a\x97\
-\xcb\xf5\x94\x4a\xe1\x8e\x6e\x72\x72\x32\x82\x67\x38\xe8\xab\x08\
-\xfa\x64\x76\xe0\x8a\x28\x23\x49\x86\x32\x12\x00\x80\x50\x88\x23\
-\x01\x00\x00\x00\x80\xe6\xfa\xe0\x83\x0f\x42\xbf\x84\x1b\x3f\x76\
-\x63\x0b\xbf\x7b\xe7\x3d\x9d\xe1\x8e\x2e\x82\x34\x36\xf4\xab\x08\
-\xfa\x64\x76\x60\xe1\x94\x91\x24\x43\x19\x09\x00\x40\x40\xc4\x91\
-\x00\x00\x00\x00\x40\x73\x1d\x3b\x7a\x2c\xf4\x4b\x58\xba\x74\x69\
-\x0b\xbf\xfb\xa7\xee\xfc\x54\xb8\xa3\x3b\x78\xe0\x60\x04\xcf\x70\
-\xd0\x57\xd1\xd1\xd1\xe1\x53\x08\xa2\xa7\x8c\x24\x19\xca\x48\x00\
-\x00\xc2\x22\x8e\x04\x00\x00\x00\x00\x9a\x6b\x74\xef\x68\xe8\x97\
-\xb0\x6c\xd9\x6d\x2d\xfc\xee\x1d\x2b\x57\x86\x3b\xba\xf2\xf0\x70\
-\xb5\x5a\x0d\xfd\x01\xa8\x5d\x45\xa0\x2b\xef\xeb\xed\xf5\x11\x04\
-\xd1\x53\x46\x92\x0c\x65\x24\x00\x00\xc1\x11\x47\x02\x00\x00\x00\
-\x00\x4d\x54\xa9\x54\x02\xca\x35\x2e\xa5\xad\xad\xad\x85\xdf\x3d\
-\x97\xcb\xf5\x94\x4a\xe1\x4e\x6f\x72\x62\x22\xe8\xbb\x7f\x60\x7c\
-\x3c\xdc\xc5\xaf\x5e\xb3\xda\xa7\x10\x44\xff\xe7\xac\x32\x92\x04\
-\x28\x23\x01\x00\x08\x91\x38\x12\x00\x00\x00\x00\x68\xa2\x37\xdf\
-\x3c\x12\xc1\x55\xe4\xf3\xf9\xd6\x2e\xa0\xf3\x9e\xce\x70\xa7\x37\
-\x3a\x1a\xf6\xd6\xa1\x3f\x39\xfc\x93\x70\x17\xbf\x6a\xd5\x9d\x3e\
-\x85\x20\x62\xca\x48\x92\xa1\x8c\x04\x00\x20\x50\xe2\x48\x00\x00\
-\x00\x00\xa0\x89\xde\xf8\xf1\x1b\xa1\x5f\x42\x1a\x0e\x26\xee\xea\
-\xba\x3f\xdc\x01\xbe\xf0\xe2\x0b\x41\x3f\x00\xaf\xbe\xfa\x6a\xa0\
-\x2b\x2f\x14\xda\x3b\x3a\x3a\x7c\x0a\x41\xac\x94\x91\x24\x43\x19\
-\x09\x00\x40\xb8\xc4\x91\x00\x00\x00\x00\x40\xb3\x54\xab\xd5\x6d\
-\x43\x43\xa1\x5f\xc5\xf2\x15\xcb\x5b\xbe\x86\xa0\x13\xb7\xa9\xa9\
-\x53\x95\x4a\x25\xd0\xc5\x4f\x4f\x4f\x8f\x8d\xed\x0b\x74\xf1\xa5\
-\x3f\x28\x2d\x01\x22\xa5\x8c\x24\x19\xca\x48\x00\x00\x82\x26\x8e\
-\x04\x00\x00\x00\x00\x9a\xe5\xc0\xf8\x78\x04\x57\x71\xfb\xef\xdc\
-\x9e\x86\x65\x6c\xde\xb4\x29\xdc\x19\x7e\xef\x7b\xa1\x6e\xbe\xf8\
-\xa3\x1f\xfd\x30\xdc\xb1\xdf\xfd\xe9\xbb\x7d\x0a\x41\x94\x94\x91\
-\x24\x43\x19\x09\x00\x40\xe8\xc4\x91\x00\x00\x00\x00\x40\xb3\xbc\
-\xf2\xca\x2b\x11\x5c\xc5\x2d\xb7\xde\x9a\x86\x65\x3c\xf0\xc0\x03\
-\xe1\xce\x30\xdc\x93\xa9\x5f\xfa\xa7\x97\xc2\x1d\xfb\xbd\xf7\xde\
-\xe7\x53\x08\xe2\xa3\x8c\x24\x19\xca\x48\x00\x00\x22\x20\x8e\x04\
-\x00\x00\x00\x00\x9a\xa2\x52\xa9\x94\x87\x87\x23\xb8\x90\x62\xb1\
-\x98\x86\x65\xac\xfc\xe4\x27\xc3\x9d\xe1\xd8\xd8\xbe\x10\xb7\x11\
-\x9d\x9e\x9e\xde\x35\x32\x12\xe8\xcc\x7b\x4a\xa5\x7c\x3e\xef\x83\
-\x08\xe2\xfb\xb3\x55\x19\x49\x02\x94\x91\x00\x00\xc4\x41\x1c\x09\
-\x00\x00\x00\x00\x34\xc5\x3f\xee\xdc\x19\xc1\x55\xf4\xf5\xf6\xa6\
-\x64\x25\xf9\x7c\xbe\xa7\x54\x0a\x77\x92\xa3\xa3\xa3\xc1\xad\xf9\
-\xfb\xdf\xff\xd7\x70\x07\xde\x79\x4f\xa7\x4f\x21\x88\x8c\x32\x92\
-\x64\x28\x23\x01\x00\x88\x86\x38\x12\x00\x00\x00\x00\x68\xbc\xe9\
-\xe9\xe9\x38\x7e\xac\xbe\x7a\xcd\xea\xf4\x2c\xe6\xa1\x3f\x7a\x28\
-\xdc\x49\xd6\x9e\x87\x6a\xb5\x1a\xd6\x9a\x77\x86\x1c\xf8\xfe\xfe\
-\xef\x7f\xde\x07\x11\xc4\x44\x19\x49\x32\x94\x91\x00\x00\xc4\x44\
-\x1c\x09\x00\x00\x00\x00\x34\xde\x5f\x3f\xf9\x64\x1c\x17\xb2\x6a\
-\xd5\x9d\xe9\x59\xcc\xbd\xf7\xde\x17\xf4\x30\x77\xef\xfe\xbf\x01\
-\xad\x76\x72\x72\x72\x6c\x6c\x5f\xa0\xa3\xee\xea\x5a\x9b\x92\xe3\
-\xe0\x81\x86\x50\x46\x92\x0c\x65\x24\x00\x00\x91\x11\x47\x02\x00\
-\x00\x00\x00\x0d\x76\x60\x7c\xbc\x3c\x3c\x1c\xc1\x85\x14\x0a\xed\
-\x1d\x1d\x1d\xe9\x59\x4f\x3e\x9f\xef\xea\x5a\x1b\xee\x3c\xbf\xf5\
-\xad\x6f\x05\xb4\xda\x7f\xf9\xee\x77\xc3\x1d\xf5\xe7\x3f\x6f\xdb\
-\x48\x88\x87\x32\x92\x64\x28\x23\x01\x00\x88\x8f\x38\x12\x00\x00\
-\x00\x00\x68\xa4\x6a\xb5\xfa\xd4\x96\xa7\xe2\xb8\x96\xd2\x1f\x94\
-\xd2\xb6\xa4\x87\x1f\x7e\x38\xdc\x79\x8e\x8d\xed\x3b\x30\x3e\x1e\
-\xc4\x52\x43\x3f\x17\xde\x99\xda\x10\x0d\x65\x24\xc9\x50\x46\x02\
-\x00\x10\x25\x71\x24\x00\x00\x00\x00\xd0\x48\xdb\x9e\x7b\x2e\xdc\
-\xc3\x88\x2f\xf0\xc0\x03\x0f\xa4\x6d\x49\x9f\xfb\xdc\x7f\x0b\x7a\
-\xa4\x2f\xbc\xf0\x42\x10\xeb\xfc\xfe\xf7\xff\x35\xdc\x21\x3b\x53\
-\x1b\xa2\xa1\x8c\x24\x19\xca\x48\x00\x00\x62\x25\x8e\x04\x00\x00\
-\x00\x00\x1a\xe6\xb5\x3d\x7b\x62\xfa\xe1\xfa\x9a\xce\xce\xb4\x2d\
-\x29\x9f\xcf\xf7\x94\x4a\xe1\x8e\xb4\x3c\x3c\x3c\x39\x39\x99\xf2\
-\x45\x56\xab\xd5\xa7\x9f\x7e\x3a\xdc\x21\x3b\x53\x1b\xe2\xa0\x8c\
-\x24\x19\xca\x48\x00\x00\x22\x26\x8e\x04\x00\x00\x00\x00\x1a\xa3\
-\x52\xa9\x3c\xf6\xe5\xc7\xa2\xb9\x9c\xcd\x9b\x36\xa5\xb3\xf0\x78\
-\xe8\x8f\x1e\x0a\x7a\xb0\x7f\xf7\xcd\x6f\xa6\x7c\x85\x2f\xbf\xfc\
-\x52\x40\x35\xd2\x5c\xce\xd4\x86\x38\xfe\x48\x55\x46\x92\x00\x65\
-\x24\x00\x00\x71\x13\x47\x02\x00\x00\x00\x00\x0d\x10\x5c\xc6\x71\
-\x59\x29\x3c\x53\xbb\xee\xde\x7b\xef\x0b\x7a\xb0\x29\xdf\x3c\x32\
-\xf4\x6d\x23\x9d\xa9\x0d\xfe\x48\x4d\x9e\x32\x32\x50\xca\x48\x00\
-\x00\xa2\x27\x8e\x04\x00\x00\x00\x00\xae\x56\xb5\x5a\xfd\xfa\x13\
-\x4f\xc4\x54\x46\x2e\x49\xe5\x99\xda\x75\xf9\x7c\x7e\xf3\xa6\x4d\
-\x41\xcf\xf6\xe9\xad\x5b\x53\xbb\xb6\xd0\xb7\x8d\xfc\xf2\x97\xbf\
-\xec\x13\x09\x82\xa6\x8c\x24\x19\xca\x48\x00\x00\xb2\x40\x1c\x09\
-\x00\x00\x00\x00\x5c\x95\x6a\xb5\xfa\x85\x47\x1e\xd9\x35\x32\x12\
-\xd3\x45\x0d\x0e\x0c\xa4\xb9\xf3\x28\x95\x4a\x41\x8f\xb7\xf6\xb4\
-\xbc\xb6\x67\x4f\x3a\x1f\xe6\xa0\xb7\x8d\x5c\x12\xfe\xc6\xa2\x90\
-\x71\xca\x48\x92\x11\x5c\x19\xd9\x13\xf8\xdf\x7c\x00\x00\x68\x15\
-\x71\x24\x00\x00\x00\x00\xb0\x78\x95\x4a\xe5\xf3\x9f\xff\xfd\xc8\
-\xca\xc8\x9a\x75\xeb\xd6\xa5\x79\x79\x6b\x3a\x3b\x0b\x85\xf6\xa0\
-\x27\xfc\xd8\x97\x1f\xab\x56\xab\x69\x5b\xd5\xb6\xe7\x9e\x0b\x7a\
-\xdb\xc8\xcd\x9b\x36\xe5\xf3\x79\x9f\x4b\x10\xee\x1f\xa9\xca\x48\
-\x12\x10\x5c\x19\x39\x38\x30\xf0\xd9\xcf\x7d\xd6\x8d\x03\x00\x60\
-\x11\xc4\x91\x00\x00\x00\x00\xf0\x1b\xcf\x3f\x3f\x34\x3c\x5c\x9e\
-\x9e\x9e\x36\x8a\x05\x9a\x9c\x9c\xfc\xcc\x67\xd6\x8d\x8d\xed\x8b\
-\xec\xba\xba\xba\xd6\xa6\xf6\x4c\xed\x59\x5f\xfd\xea\x57\x83\x1e\
-\xf2\xd4\xd4\xa9\xfe\x2d\x5b\xd2\xf6\x3c\x87\x7e\xc0\x68\xc9\xc6\
-\x5a\x10\x2c\x65\x24\xc9\x08\xb1\x8c\xdc\xd2\xdf\xef\xc6\x01\x00\
-\xb0\x38\xe2\x48\x00\x00\x00\x00\xf8\x8d\x57\x5f\x7d\xb5\xaf\xef\
-\xd1\xb6\xb6\xb6\xad\x83\x83\x95\x4a\xc5\x40\xe6\xf7\xca\x2b\x2f\
-\xaf\x5c\xb9\x32\xe8\x6d\xf6\x2e\xe5\xe1\x87\x1f\x4e\xff\x22\xff\
-\xf8\x8f\xff\x7b\xe8\x73\xde\x36\x34\x74\x60\x7c\x3c\x3d\xeb\x79\
-\x7a\xeb\xd6\xa0\xe7\x19\x44\xd4\x0b\x5c\x94\x32\x92\x64\x28\x23\
-\x01\x00\xc8\x1a\x71\x24\x00\x00\x00\x00\x7c\x68\x7a\x7a\x7a\x76\
-\x07\xc4\xfe\x81\x81\x5b\x6e\xb9\xe5\x0f\x7b\x7a\x5e\xdb\xb3\x27\
-\x85\x27\xff\xb6\x5c\x6d\x26\x8f\x6f\xde\xbc\x71\xe3\x43\xb1\x5e\
-\x60\x10\x97\x96\xcf\xe7\x37\x6f\xda\x14\xfa\xa8\x1f\xfe\xd3\x87\
-\x53\xb2\x57\xeb\xf3\xcf\x0f\x85\x7e\x3a\x7c\x10\x51\x2f\x30\x97\
-\x32\x92\x64\x28\x23\x01\x00\xc8\x20\x71\x24\x00\x00\x00\x00\x7c\
-\xe8\x9d\xb7\xdf\xbe\xe0\xdf\xec\x1a\x19\xe9\x7e\xf0\xc1\x15\x2b\
-\x96\x6f\x1d\x1c\x9c\x9c\x9c\x34\xa2\xba\x03\xe3\xe3\xb5\x99\x6c\
-\x1b\x1a\x8a\xf5\x02\x07\x07\x06\x42\x09\x3e\xfe\xc7\x23\x8f\x84\
-\x3e\xed\xa9\xa9\x53\xff\xf3\xcf\xff\x3c\x0d\x4f\xf5\xa6\x4d\x9b\
-\x43\x1f\x66\xc4\xbd\x32\x44\x4c\x19\x49\x32\x94\x91\x00\x00\x64\
-\x93\x38\x12\x00\x00\x00\x00\x3e\xf4\x93\xc3\x3f\xb9\xe8\xbf\x9f\
-\x9a\x3a\xd5\x3f\x30\xb0\x72\xe5\xca\xfb\xef\xef\x7a\xfe\xf9\xa1\
-\x2c\x1f\xb7\x3d\x3d\x3d\xfd\x68\x5f\x5f\xe7\x3d\xf7\x44\x79\x94\
-\xf6\xac\x3f\x7b\xec\xb1\x50\x96\xda\xd1\xd1\xd1\xd5\xb5\x36\xf4\
-\x81\xef\x1a\x19\xd9\x3a\x38\xd8\xc2\x05\xd4\x5e\xea\x87\xff\x34\
-\xf8\x3d\x17\x03\x8a\x7a\x81\xf3\x3f\x7f\x94\x91\x24\x40\x19\x09\
-\x00\x40\x66\x89\x23\x01\x00\x00\x00\xe0\x43\xe3\xfb\xc7\xe7\xff\
-\x0f\xc6\xc6\xf6\x6d\xda\xb4\xf9\x96\x5b\x6e\xc9\x60\x25\x59\xad\
-\x56\x87\x87\xcb\x6d\x6d\x6d\xe5\xe1\xe1\xb8\xaf\x74\x70\x60\x20\
-\x9f\xcf\x07\xb4\xe0\xaf\x3f\xf1\xf5\x08\xc6\xde\x3f\x30\x50\x7b\
-\xc0\x5a\xf5\x6c\x7f\xfd\x89\x27\x22\xe8\x7d\xff\xc4\x99\xda\x10\
-\x1a\x65\x24\xc9\x50\x46\x02\x00\x90\x65\xe2\x48\x00\x00\x00\x00\
-\xf8\x30\x90\xda\x35\x32\xb2\xc0\xff\xf8\xfc\x4a\x72\xeb\xe0\xe0\
-\x81\xf1\xf1\xb8\x27\x33\x3c\x5c\x5e\xb1\x62\x79\x5f\xdf\xa3\x59\
-\x78\x12\x02\xda\x36\xb2\x6e\x7d\x77\x77\xa1\xd0\x1e\xc1\xe4\x6b\
-\x0f\xd8\x6b\x7b\xf6\x24\xff\x78\x7f\xe1\x91\x47\x16\xfe\xee\xa7\
-\x77\x7a\xbd\xbd\xc5\x62\xd1\x27\x39\x04\x44\x19\x49\x32\x94\x91\
-\x00\x00\x64\x9c\x38\x12\x00\x00\x00\x00\x96\x4c\x4e\x4c\x2c\xe2\
-\xff\x6b\x6c\x6c\x5f\xff\xc0\x40\xe7\x3d\xf7\xfc\xd6\x6f\xfd\xd6\
-\xe3\x9b\x37\xbf\xf2\xca\xcb\x31\x6d\x27\x39\x3d\x3d\xbd\x75\x70\
-\xb0\x9e\x45\xc6\x7d\x8e\xf6\xac\xe0\xb6\x8d\xac\x7b\xea\xa9\xa7\
-\xe2\x98\x7f\xf7\x83\x0f\xd6\x5e\xa2\xc4\xbe\x5d\x34\x65\x64\xcd\
-\x5f\x7c\xe5\x2b\x3e\xc6\x21\x20\xca\x48\x92\xa1\x8c\x04\x00\x80\
-\x8f\x18\x01\x00\x00\x00\x00\x9c\x38\x79\xe2\x2a\x7f\x87\x6d\x43\
-\x43\x4b\x86\x3e\xfc\xa2\xab\x6b\xed\xda\xfb\xd6\xde\x75\xd7\x5d\
-\x2b\x3f\xf9\xc9\x10\x4b\xbb\x9a\xd7\xf6\xec\xf9\xc1\x0f\x7e\xf0\
-\xe1\x15\x65\x4c\x70\xdb\x46\xd6\x6d\xdc\xf8\xd0\xd3\x4f\x3f\x1d\
-\x47\xc0\x5a\xbb\x96\xc1\x81\x9f\x25\x10\x46\xc4\x54\x46\xf6\xf5\
-\xf6\x76\x74\x74\xf8\x18\x87\x50\x28\x23\x49\x86\x32\x12\x00\x00\
-\x96\x88\x23\x01\x00\x00\x00\xa0\xe6\xe0\x81\x83\x8d\xfa\xad\xc6\
-\xc6\xf6\xd5\x7e\xd5\xbf\xee\xea\x5a\xfb\xc9\x95\x9f\xbc\xfb\xd3\
-\x77\x2f\x5b\x76\x5b\xfa\xeb\xa5\x03\xe3\xe3\xa3\xa3\xa3\x2f\xbc\
-\xf8\x42\x46\xf6\x89\xbc\x40\xa0\xdb\x46\xd6\xe4\x72\xb9\xa7\x9e\
-\x7a\x2a\x9a\x73\xcf\xfb\x07\x06\x4e\x9f\x3e\xfd\xfc\x37\xbe\xd1\
-\xbc\x10\xa7\x52\xa9\x7c\xe9\x4b\x8f\xce\xbe\xa7\xa1\xb3\x6d\x24\
-\x04\x44\x19\x49\x32\x94\x91\x00\x00\x50\x27\x8e\x04\x00\x00\x00\
-\x80\x25\xe5\xe1\xe1\x66\xfc\xb6\xbf\x09\x25\xff\x63\x07\xc6\x9e\
-\x52\xe9\x8e\x3b\xee\xb8\xfd\x77\x6f\x4f\x4f\x2b\x39\x3d\x3d\x3d\
-\xf1\xd6\x5b\x87\x0e\x1d\xca\x6c\x13\x59\x57\x28\xb4\x07\xba\x6d\
-\x64\x5d\x4c\x9b\x47\xd6\xdf\xc7\xd1\xbd\xa3\x3b\xff\x61\xe7\x9a\
-\xce\xce\x86\xff\xe6\xaf\xbc\xf2\x72\x6d\x5c\xd1\x3c\xba\xb5\x4f\
-\x15\xdb\x46\x42\x28\x94\x91\x24\x43\x19\x09\x00\x00\xb3\xc4\x91\
-\x00\x00\x00\x00\x64\xdd\xe4\xe4\x64\x32\xdf\x68\xd7\xc8\xc8\xf9\
-\xc7\xf8\x76\x75\xad\xbd\xf9\xe3\x37\xaf\x5e\xb3\xfa\x86\x8f\xde\
-\xd0\x76\xfd\xf5\xc5\x62\x31\x99\xfe\xa0\x52\xa9\xbc\xf3\xf6\xdb\
-\x87\x0e\x1d\xda\xf7\xc3\x7d\xd1\x6c\x9e\x77\x95\x9e\x7a\xea\xa9\
-\x40\xb7\x8d\xac\x8b\x6c\xf3\xc8\x9a\xa9\xa9\x53\x9d\xf7\xdc\xd3\
-\xd7\xdb\xfb\x37\xcf\x3c\xd3\xa8\x5b\x53\x7b\xd3\x9f\xde\xba\x35\
-\x8e\xa3\xb4\xff\xf3\xd1\xdd\xb2\xc5\xfb\x0b\x41\x50\x46\x92\x0c\
-\x65\x24\x00\x00\x9c\x4f\x1c\x09\x00\x00\x00\x40\xd6\x1d\x39\x72\
-\xb8\x25\xdf\xb7\xbe\xaf\xe4\x05\x9b\x56\xf6\xf5\xf6\xd6\xfe\xb9\
-\x7a\xcd\xea\xda\x3f\x6f\x5b\x76\x5b\x6e\xe9\xd2\xda\x17\x8b\xde\
-\x19\x6e\x7a\x7a\xfa\xec\xd9\xb3\xd5\x99\x99\x13\x27\x4f\x1c\x3f\
-\x76\xfc\xd4\xa9\x53\x91\x95\x61\x0d\xd1\xd5\xb5\xb6\xb7\xb7\x2f\
-\xf4\xab\x88\x6c\xf3\xc8\xba\xda\xdb\x51\xfb\x35\x38\x30\xf0\x27\
-\x0f\x3f\x5c\x2c\x16\x17\xfd\xfb\x4c\x4e\x4e\xfe\xcb\x77\xbf\x1b\
-\x56\x2c\xb2\x10\xb5\x8f\x0b\xdb\x46\x42\x10\x94\x91\x24\x43\x19\
-\x09\x00\x00\x17\x10\x47\x02\x00\x00\x00\x90\x75\x07\x0f\x1c\x4c\
-\xcf\x62\xea\xad\xe4\xa5\x8e\xf9\xae\x6f\x36\x79\xd9\xdf\xe4\xdc\
-\xb9\x73\x22\xc8\x85\x1b\x1a\x7a\x3e\x82\xab\x88\x6f\xf3\xc8\x59\
-\xfd\x03\x03\xb5\x5f\x3d\xa5\xd2\x43\x7f\xf4\xd0\xbd\xf7\xde\xb7\
-\xf0\x8d\x24\xa7\xa7\xa7\x7f\xf4\xa3\x1f\xbe\xf4\x4f\x2f\xc5\xfa\
-\x3a\xfc\xc5\x57\xbe\xe2\xfd\x85\xf4\x53\x46\x92\x0c\x65\x24\x00\
-\x00\xcc\x25\x8e\x04\x00\x00\x00\x20\xeb\x46\xf7\x8e\x86\xb2\xd4\
-\xfa\x66\x93\x6e\x59\x03\x6d\xde\xb4\x29\x9a\xbd\xf7\x36\x6e\x7c\
-\x68\xe7\xce\x9d\xb1\x3e\x21\xb3\xa7\xd2\x77\x75\xad\x5d\x7b\xdf\
-\xda\xdb\x7f\xf7\xf6\x65\xcb\x6e\x5b\xf2\x5f\xf7\x55\xad\x54\x2a\
-\xd5\x6a\xf5\xe4\xc9\x13\x67\xce\x9c\x19\xdf\x3f\x1e\x77\x22\x6c\
-\xdb\x48\x08\x82\x32\x92\x64\x28\x23\x01\x00\xe0\xa2\xc4\x91\x00\
-\x00\x00\x00\x64\x5a\xa5\x52\x89\xec\x24\x62\x16\xae\x50\x68\x1f\
-\xdc\xba\x35\x9a\xcb\xc9\xe5\x72\x5f\x7f\xe2\xeb\xd1\xe7\xb3\x12\
-\xe1\xba\xbf\x79\xe6\x19\x43\x80\xf4\xff\x1d\x43\x19\x49\x02\x94\
-\x91\x00\x00\x70\x29\xbf\x6d\x04\x00\x00\x00\x00\x64\xd9\x9b\x6f\
-\x1e\x31\x84\xcc\xda\xf9\x0f\x3b\x23\x4b\x40\xd6\x77\x77\xf7\x94\
-\x4a\xee\x6c\xf4\x86\x86\xb6\x2d\xfc\x78\x71\xa0\x25\x94\x91\x24\
-\x43\x19\x09\x00\x00\xf3\x10\x47\x02\x00\x00\x00\x90\x69\x6f\xfc\
-\xf8\x0d\x43\xc8\xa6\xcd\x9b\x36\xad\xe9\xec\x8c\xef\xba\x9e\xda\
-\xb2\xc5\xcd\x8d\x5b\xa1\xd0\xfe\xe8\xa3\x5f\x32\x07\x48\x33\x65\
-\x24\xc9\x50\x46\x02\x00\xc0\xfc\xc4\x91\x00\x00\x00\x00\x64\xda\
-\x5b\x13\x6f\x19\x42\x06\x45\x76\xa0\xf6\xf9\x3a\x3a\x3a\x06\x83\
-\xea\x24\xb8\x52\xcf\x3e\xfb\xac\x80\x09\xd2\x4c\x19\x49\x32\x94\
-\x91\x00\x00\x70\x59\xe2\x48\x00\x00\x00\x00\xb2\x6b\x7a\x7a\x7a\
-\x6c\x6c\x9f\x39\x64\xd0\x77\xbf\xfb\x2f\x11\x57\x20\x9b\x1f\x7f\
-\xbc\x50\x68\x77\x97\xa3\xd4\x53\x2a\x6d\xd8\xb0\xd1\x1c\x20\xb5\
-\x94\x91\x24\x43\x19\x09\x00\x00\x0b\x21\x8e\x04\x00\x00\x00\x20\
-\xbb\x26\xde\xb2\x6d\x64\x16\x95\xcb\xdb\x3b\x3a\x3a\x22\xbe\xc0\
-\x5c\x2e\xf7\xec\xb3\xcf\xba\xd1\x51\xfa\x5b\x77\x16\x52\x4c\x19\
-\x49\x32\x94\x91\x00\x00\xb0\x40\xe2\x48\x00\x00\x00\x00\xb2\xeb\
-\xd0\xa1\x43\x86\x90\x35\x7d\xbd\x35\x7d\xd1\x5f\xe6\x86\x0d\x1b\
-\x6b\x57\xea\x76\x47\xa6\x5c\xde\x5e\x2c\x16\xcd\x01\xd2\x49\x19\
-\x49\x32\x94\x91\x00\x00\xb0\x70\xe2\x48\x00\x00\x00\x00\xb2\x6b\
-\xdf\x0f\xf7\x19\x42\xa6\x74\x75\xad\x7d\xfe\x1b\xdf\xc8\xc8\xc5\
-\xfe\xd5\x93\x4f\xba\xe3\x91\x3d\xbd\x1b\x37\x3e\x64\x0e\x90\x4e\
-\xca\x48\x92\xa1\x8c\x04\x00\x80\x2b\x22\x8e\x04\x00\x00\x00\x20\
-\xa3\xaa\xd5\xea\xd8\xd8\x3e\x73\xc8\x8e\x42\xa1\xfd\x3b\xdf\xd9\
-\x9e\x9d\x10\xa4\x58\x2c\x96\xcb\xdb\xdd\xf7\x68\x0c\x0d\x3d\x2f\
-\x63\x82\x74\x52\x46\x92\x0c\x65\x24\x00\x00\x5c\x29\x71\x24\x00\
-\x00\x00\x00\x19\x35\x39\x31\x61\x08\x99\xb2\xf3\x1f\x76\x66\xed\
-\x48\xe2\xde\xde\x3e\x87\x6b\xc7\xa1\x5c\xde\xde\xd1\xd1\x61\x0e\
-\x90\x42\xca\x48\x92\xa1\x8c\x04\x00\x80\x45\x10\x47\x02\x00\x00\
-\x00\x90\x51\x3f\x39\xfc\x13\x43\xc8\x8e\x3d\xbb\x77\xaf\xe9\xec\
-\xcc\xe0\x85\xff\xcd\x33\xcf\x14\x0a\xed\x1e\x80\xa0\xf5\x94\x4a\
-\xbd\xbd\x7d\xe6\x00\x29\xa4\x8c\x24\x19\xca\x48\x00\x00\x58\x1c\
-\x71\x24\x00\x00\x00\x00\x19\x35\xbe\x7f\xdc\x10\x32\x62\x68\x68\
-\xdb\xfa\xee\xee\x6c\x5e\x7b\x3e\x9f\xff\xf6\xb7\xbe\xed\x19\x08\
-\x57\xa1\xd0\xfe\xbf\xff\xfe\xef\xcd\x01\x52\x48\x19\x49\x32\x94\
-\x91\x00\x00\xb0\x68\xe2\x48\x00\x00\x00\x00\xb2\xa8\x5a\xad\xee\
-\x1a\x19\x31\x87\x2c\x18\x1c\x18\xf8\xda\xd7\x36\x65\x79\x02\xeb\
-\xbb\xbb\x07\x83\x8a\x2a\x38\xdf\xb7\xbf\xf5\xed\x7c\x3e\x6f\x0e\
-\x90\x36\xca\x48\x92\xa1\x8c\x04\x00\x80\xab\x21\x8e\x04\x00\x00\
-\x00\x20\x8b\x2a\x95\x8a\x21\x64\x81\x9f\xd0\xd7\x6d\x7e\xfc\xf1\
-\x9e\x52\xc9\x1c\x82\x93\xe5\x4d\x4f\x21\xe5\x7f\x8b\x50\x46\x92\
-\x00\x65\x24\x00\x00\x5c\x25\x71\x24\x00\x00\x00\x00\x59\x74\xe4\
-\xc8\x61\x43\x88\x9e\x9f\xd0\xcf\xca\xe5\x72\x7f\xfb\xec\xb3\x85\
-\x42\xbb\x51\x04\xa4\xa7\x54\xca\xf8\xa6\xa7\x90\x4e\xca\x48\x92\
-\xa1\x8c\x04\x00\x80\xab\x27\x8e\x04\x00\x00\x00\x20\x8b\x0e\x1e\
-\x38\x68\x08\x71\xf3\x13\xfa\x0b\x14\x8b\xc5\x9d\xff\xb0\xd3\x1c\
-\x42\x51\x28\xb4\xbf\xb8\x63\x87\x39\x40\xda\x28\x23\x49\x86\x32\
-\x12\x00\x00\x1a\x42\x1c\x09\x00\x00\x00\x40\x16\x95\x87\x87\x0d\
-\x21\x62\x7e\x42\x7f\x51\x6b\x3a\x3b\xcb\xe5\xed\xe6\x90\x7e\x85\
-\x42\xfb\xeb\xaf\x8f\x8a\x99\x20\x6d\x94\x91\x24\x43\x19\x09\x00\
-\x00\x8d\x22\x8e\x04\x00\x00\x00\x20\x73\x26\x27\x27\x0d\x21\x62\
-\x7e\x42\x3f\x8f\xde\xde\xbe\xc1\xa0\x7a\x8b\x6c\xfa\xf6\xb7\xbe\
-\x5d\x2c\x16\xcd\x01\x52\x45\x19\x49\x32\x94\x91\x00\x00\xd0\x40\
-\xe2\x48\x00\x00\x00\x00\x32\xe7\xc8\x91\xc3\x86\x10\xab\xa1\xa1\
-\x6d\x7e\x42\x3f\xbf\xda\x7c\x7a\x4a\x25\x73\x48\xad\x3d\xbb\x77\
-\xaf\xef\xee\x36\x07\x48\x15\x65\x24\xc9\x50\x46\x02\x00\x40\x63\
-\x7d\xc4\x08\x00\x00\x00\x00\xc8\x9a\xe3\xc7\x8e\x1b\x42\x94\x54\
-\x65\x0b\xf4\xe2\x8e\x1d\xb5\x7f\xee\x1a\x19\x31\x8a\xb4\x19\x1c\
-\x18\xf0\x0c\x43\xda\x28\x23\x49\x86\x32\x12\x00\x00\x1a\xce\xce\
-\x91\x00\x00\x00\x00\x64\xce\xc8\x3f\x6b\xc2\x62\x53\x28\xb4\x8f\
-\xef\xdf\xaf\x2a\x5b\xa0\x5c\x2e\xf7\xe2\x8e\x1d\x5d\x5d\x6b\x8d\
-\x22\x55\x54\x26\x90\x42\xca\x48\x92\xa1\x8c\x04\x00\x80\x66\x10\
-\x47\x02\x00\x00\x00\x90\x2d\x95\x4a\x25\xa0\xc4\x81\x85\xe8\xea\
-\x5a\xfb\xfa\xeb\xa3\x6b\x3a\x3b\x8d\x62\xe1\x72\xb9\xdc\x77\xbe\
-\xb3\xbd\x50\x68\x37\x8a\x94\x50\x99\x40\x3a\xff\xce\xa0\x8c\x24\
-\x01\xca\x48\x00\x00\x68\x12\x71\x24\x00\x00\x00\x00\xd9\xf2\xe6\
-\x9b\x47\x0c\x21\x26\x7d\xbd\xbd\xaf\xbe\xfa\xbd\x62\xb1\x68\x14\
-\x57\xaa\x36\xb4\xd7\x5f\x1f\xd5\x47\xa6\x81\xca\x04\x52\x48\x19\
-\x49\x32\x94\x91\x00\x00\xd0\x3c\xe2\x48\x00\x00\x00\x00\xb2\xe5\
-\x67\xff\xf6\x33\x43\x88\x46\xb9\xbc\x7d\x7b\xb9\x2c\x04\x59\x34\
-\x7d\x64\x1a\xa8\x4c\x20\x85\x94\x91\x24\x43\x19\x09\x00\x00\x4d\
-\x25\x8e\x04\x00\x00\x00\x20\x5b\xf6\xfd\x70\x9f\x21\x44\xa0\x50\
-\x68\x9f\x98\x98\xe8\xed\xed\x33\x8a\xab\xa4\x8f\x6c\x2d\x95\x09\
-\xa4\x90\x32\x92\x64\x28\x23\x01\x00\xa0\xd9\xc4\x91\x00\x00\x00\
-\x00\x64\xc8\xf4\xf4\xf4\xd8\xd8\x3e\x73\x08\x5d\x5f\x6f\xef\xd1\
-\xa3\xc7\x3a\x3a\x3a\x8c\xa2\x21\x8a\xc5\x62\x6d\x9e\x3d\xa5\x92\
-\x51\x24\x6c\x68\x68\x9b\xca\x04\xd2\x46\x19\x49\x32\x94\x91\x00\
-\x00\x90\x80\x8f\x18\x01\x00\x00\x00\x00\xd9\x31\xf1\xd6\x5b\x86\
-\x10\xb4\x42\xa1\xfd\xd9\x67\x9f\xdd\xb0\x61\xa3\x51\x34\x56\x2e\
-\x97\x7b\x71\xc7\x8e\xda\x17\xbb\x46\x46\x4c\x23\x19\x7b\x76\xef\
-\x5e\xdf\xdd\x6d\x0e\x90\x2a\xca\x48\x92\xa1\x8c\x04\x00\x80\x64\
-\xd8\x39\x12\x00\x00\x00\x80\x0c\x39\x74\xe8\x90\x21\x84\xab\xaf\
-\xb7\xf7\x8d\x37\x0e\x29\x23\x9b\xa4\xde\x47\x0e\x06\xd5\x6a\x04\
-\xaa\x50\x68\x1f\xdf\xbf\x5f\x19\x09\x69\xa3\x8c\x24\x19\xca\x48\
-\x00\x00\x48\x8c\x38\x12\x00\x00\x00\x80\x0c\xf9\xe9\x4f\x7f\x6a\
-\x08\x21\x2a\x14\xda\x5f\x7e\xf9\xa5\xed\xe5\x72\x3e\x9f\x37\x8d\
-\xe6\xc9\xe5\x72\x5b\xfa\xfb\xcb\xe5\xed\x46\xd1\x3c\x3d\xa5\xd2\
-\xeb\xaf\x8f\xae\xe9\xec\x34\x0a\x48\x15\x65\x24\xc9\x50\x46\x02\
-\x00\x40\x92\xc4\x91\x00\x00\x00\x00\x64\x45\xb5\x5a\x75\x64\x70\
-\x88\x36\x6f\xda\x64\xc3\xc8\x24\xf5\xf6\xf6\xed\xd9\xbd\xbb\x50\
-\x68\x37\x8a\x66\x3c\xcc\x2f\xee\xd8\x51\x2c\x16\x8d\x02\x52\x45\
-\x19\x49\x32\x94\x91\x00\x00\x90\x30\x71\x24\x00\x00\x00\x00\x59\
-\x31\x39\x31\x61\x08\x61\xe9\xea\x5a\x3b\x31\x31\xf1\xdc\xb6\x6d\
-\x36\x8c\x4c\xd8\xfa\xee\xee\xd7\x5f\x1f\xed\x29\x95\x8c\xa2\x81\
-\xca\xe5\xed\xb5\x87\x59\xcc\x04\x69\xa3\x8c\x24\x19\xca\x48\x00\
-\x00\x48\x9e\x38\x12\x00\x00\x00\x80\xac\xf8\xc9\xe1\x9f\x18\x42\
-\x28\x0a\x85\xf6\x72\x79\xfb\xde\xbd\x63\x1d\x1d\x1d\xa6\xd1\x12\
-\xc5\x62\xf1\xc5\x1d\x3b\x06\x83\xca\x38\x52\xab\xab\x6b\xed\x3b\
-\xef\xbc\xd3\xdb\xdb\x67\x14\x90\x36\xca\x48\x92\xa1\x8c\x04\x00\
-\x80\x96\x10\x47\x02\x00\x00\x00\x90\x15\xbf\x38\xfd\x0b\x43\x08\
-\xc2\xd0\xd0\xb6\xa3\x47\x8f\x29\xc9\x5a\x2e\x97\xcb\x6d\xe9\xef\
-\x1f\xdf\xbf\xdf\x11\xdb\x57\x63\x70\x60\xe0\xd5\x57\xbf\xe7\x28\
-\x6d\x48\x21\x65\x24\xc9\x50\x46\x02\x00\x40\xab\x88\x23\x01\x00\
-\x00\x00\xc8\x8a\xe7\xb6\x6d\xdb\xb3\x7b\x77\x57\xd7\x5a\xa3\x48\
-\xad\xc1\x81\x81\xb3\x67\xcf\x7e\xed\x6b\x9b\x94\x1f\xe9\xb1\xa6\
-\xb3\xf3\x8d\x37\x0e\xf5\xf5\xf6\x1a\xc5\x95\x2a\x14\xda\xc7\xf7\
-\xef\xdf\xd2\xdf\xef\x79\x86\x14\x52\x46\x92\x0c\x65\x24\x00\x00\
-\xb4\x90\x38\x12\x00\x00\x00\x80\x0c\x59\xdf\xdd\xbd\x77\xef\xd8\
-\xf8\xfe\xfd\x4a\xaf\xb4\xa9\x67\x91\x5b\xfa\xfb\xf3\xf9\xbc\x69\
-\xa4\x4d\xed\xa6\x6c\x2f\x97\xf7\xec\xde\x6d\x0b\xc9\x85\xab\x6f\
-\x80\xba\xa6\xb3\xd3\x28\x20\x85\x94\x91\x24\x43\x19\x09\x00\x00\
-\xad\x25\x8e\x04\x00\x00\x00\x20\x73\xd6\x74\x76\x6e\x2f\x97\x27\
-\x26\x26\x06\x83\xfa\x71\x75\xac\x64\x91\xa1\x58\xdf\xdd\x7d\xf4\
-\xe8\x31\x6f\xcd\x65\xf5\xf5\xf6\xd6\x3e\x5e\x6c\x80\x0a\xa9\xa5\
-\x8c\x24\x19\xca\x48\x00\x00\x68\x39\x71\x24\x00\x00\x00\x00\x19\
-\xd5\xd1\xd1\xb1\xa5\xbf\x7f\x66\x66\xa6\x5c\xde\xee\xac\xed\xe4\
-\x15\x0a\xed\xb5\xc9\xd7\xe6\x2f\x8b\x0c\x48\x2e\x97\xab\xdd\xaf\
-\x89\x89\x09\x7b\xaf\x5e\x54\xed\x93\x64\xcf\xee\xdd\xdb\xcb\xe5\
-\xda\xc7\x8b\x69\x40\x3a\x29\x23\x49\x86\x32\x12\x00\x00\xd2\x40\
-\x1c\x09\x00\x00\x00\x40\xa6\xe5\x72\xb9\xde\xde\xbe\xbd\x7b\xc7\
-\xea\x1b\x49\x3a\x35\x38\x01\x3d\xa5\xd2\x9e\xdd\xbb\x7f\xfe\xf3\
-\xa9\xda\xe4\xd5\x1e\x21\xea\xe8\xe8\xa8\x9f\xb2\xad\x2a\x9e\x55\
-\x8f\x7d\x5f\x7d\xf5\x7b\xeb\xbb\xbb\x4d\x03\x52\x4b\x19\x49\x32\
-\x94\x91\x00\x00\x90\x12\xe2\x48\x00\x00\x00\x00\xf8\x50\x7d\x23\
-\xc9\xa3\x47\x8f\xed\xd9\xbd\x7b\xf3\xa6\x4d\x06\xd2\x70\x85\x42\
-\xfb\xe0\xc0\xc0\x3b\xef\xbc\xf3\x7f\x76\xed\x12\x90\x45\xa0\x76\
-\x13\xf7\xee\x1d\x93\x48\xd6\xb3\xc8\xda\x47\x87\xd8\x17\x52\x4e\
-\x19\x49\x32\x94\x91\x00\x00\x90\x1e\xe2\x48\x00\x00\x00\x00\xf8\
-\x4f\xb9\x5c\x6e\x7d\x77\xf7\x73\xdb\xb6\xcd\xcc\xcc\xa8\x24\x1b\
-\xa5\x36\xc6\xda\x30\x8f\x1e\x3d\xb6\xa5\xbf\xbf\x58\x2c\x1a\x48\
-\x4c\xb2\x9c\x48\xd6\x2e\x59\x16\x09\xa1\x50\x46\x92\x0c\x65\x24\
-\x00\x00\xa4\xca\x47\x8c\x00\x00\x00\x00\x00\xe6\xaa\x57\x92\xf5\
-\x50\xf2\xc0\xf8\xf8\xe8\xe8\xe8\xbe\x1f\xee\x1b\x1b\xdb\x67\x32\
-\x0b\xd7\x53\x2a\x3d\xf4\x47\x0f\xdd\x7b\xef\x7d\xf9\x7c\xde\x34\
-\xe2\x56\x7f\x59\x5e\xdb\xb3\xe7\x95\x57\x5e\x29\x0f\x0f\x67\xe1\
-\xd9\xfe\xd2\x97\xbe\x64\x03\x54\x08\x85\x32\x92\x64\x28\x23\x01\
-\x00\x20\x6d\xc4\x91\x00\x00\x00\x00\x70\x19\x6b\x3a\x3b\x6b\xbf\
-\xb6\x2c\xe9\xaf\x54\x2a\x6f\xbe\x79\xe4\x8d\x1f\xbf\x31\xf2\xcf\
-\x23\x01\x35\x16\x09\xdb\xbc\x69\xd3\xdd\x9f\xbe\x5b\x13\x99\x41\
-\xf5\x44\xf2\xaf\x9e\x7c\xf2\x1f\x77\xee\x7c\xe1\xc5\x17\xe2\x7b\
-\x47\x0a\x85\xf6\x2f\x7e\xe1\x8b\x7f\xf2\xf0\xc3\x36\x40\x85\x80\
-\x28\x23\x49\x86\x32\x12\x00\x00\x52\x48\x1c\x09\x00\x00\x00\x00\
-\x0b\x55\xfc\xb5\x0d\x1b\x36\x3e\xb7\x6d\xdb\xe4\xe4\xe4\x91\x23\
-\x87\x8f\x1f\x3b\x2e\x94\x5c\xf2\xeb\xf3\x85\xd7\xde\xb7\x76\xdd\
-\xba\x75\x1d\x2b\x57\xea\x39\xbc\x26\x5b\xfa\xfb\x37\x3f\xfe\xf8\
-\x81\xf1\xf1\x68\x36\x92\xdc\xbc\x69\xd3\x03\x0f\x3c\xb0\xa6\xb3\
-\xd3\xe3\x0d\x61\x51\x46\x92\x0c\x65\x24\x00\x00\xa4\x93\x38\x12\
-\x00\x00\x00\x00\x16\xa3\xe3\xd7\x6a\x5f\x3c\xb7\x6d\x5b\xa5\x52\
-\x79\xe7\xed\xb7\x0f\x1d\x3a\xf4\xd3\x9f\xfe\x74\xd7\xc8\x48\x46\
-\x26\x50\x28\xb4\x97\xfe\xa0\x74\xf7\xa7\xef\xfe\xbd\xdf\x5b\x65\
-\x23\x3d\x2e\x30\x7b\x30\xfd\xdf\x3c\xf3\xcc\x8f\x7e\xf4\xc3\xd7\
-\xf6\xbc\x16\x62\x25\xa9\x89\x84\xa0\x29\x23\x49\x86\x32\x12\x00\
-\x00\x52\x4b\x1c\x09\x00\x00\x00\xf0\xa1\x5f\xfd\xea\x57\x86\xc0\
-\xa2\xd5\x77\x94\x5c\xdf\xdd\x5d\xff\x9f\x93\x93\x93\x27\x4f\x9e\
-\xf8\xd9\xbf\xfd\xec\xf4\xe9\xd3\x71\x6c\x9b\x37\xab\xa7\x54\xba\
-\xe3\x8e\x3b\xee\xba\xeb\xae\x5b\x6e\xbd\x55\x10\xc9\x42\xe4\xf3\
-\xf9\x0d\x1b\x36\xd6\x7e\x3d\xff\x8d\x6f\x1c\x18\x1f\x3f\x74\xe8\
-\x50\xca\x4f\xdc\xae\x3d\xe4\x9d\xf7\x74\x7e\xea\xce\x4f\xad\xe9\
-\xec\x74\xfb\x20\x5c\xd3\xd3\xd3\x61\x95\x91\x85\x42\xbb\x32\x32\
-\x44\xca\x48\x00\x00\x48\x33\x71\x24\x00\x00\x00\x00\x34\xd8\xec\
-\xa6\x92\x35\xdb\xcb\xe5\x4a\xa5\x72\xf6\xbd\xf7\x4e\x9c\x3c\xf1\
-\xee\x2f\xde\x0d\x2e\x97\xec\xeb\xed\x5d\xbe\x62\xf9\x0d\x37\xdc\
-\xb0\x6c\xd9\x6d\xb3\x17\x05\x8b\x30\xbb\x97\xe4\x96\xfe\xfe\xda\
-\x4b\xf1\xe6\x9b\x47\xde\xf8\xf1\x1b\x6f\x4d\xbc\x35\x36\xb6\x2f\
-\x25\xcf\xf9\xa7\xee\xfc\xd4\x2d\xb7\xde\x9a\xcf\xe7\xdd\x2c\x88\
-\x40\xed\x5d\xfe\xe2\x17\xbe\x18\x50\xb5\x36\x35\x75\x6a\xdb\x73\
-\xcf\xa9\xd6\xc2\xa2\x8c\x04\x00\x80\x94\x13\x47\x02\x00\x00\x00\
-\x40\x73\xd5\xf7\x95\x9c\xdd\x85\x6e\x7b\xb9\x5c\xad\x56\x2b\x95\
-\x4a\x75\x66\xe6\xc4\xc9\x13\x1f\x7c\xf0\xc1\xb1\xa3\xc7\x6a\xff\
-\xbe\xe5\xd1\x64\x5f\x6f\x6f\xed\x9f\xab\xd7\xac\x5e\xba\x74\xe9\
-\xb2\x65\xb7\xb5\xb5\xb5\xa9\xc4\x68\xea\x4b\xb1\x61\xc3\xc6\xda\
-\xd7\xf5\xd7\xe1\xc8\x91\xc3\xc7\x8f\x1d\x3f\x75\xea\x54\x02\x07\
-\xd3\x77\x75\xad\xbd\xf9\xe3\x37\x2f\x5f\xb1\xfc\xf6\xdf\xb9\xbd\
-\xed\xfa\xeb\x55\xbf\x10\xab\x7a\x04\x16\x50\xbb\x56\x5f\xaa\x76\
-\x2d\x14\xca\x48\x00\x00\x48\x3f\x71\x24\x00\x00\x00\x00\x24\x2d\
-\x97\xcb\xd5\x7b\xac\xf3\xcf\xed\xdd\x5e\x2e\x2f\xf9\xf5\x31\xa0\
-\x67\xcf\x9e\xad\x7d\x71\xf2\xe4\x89\x99\x99\x99\xda\x17\xb3\xf5\
-\x64\xdd\xbf\xff\xfc\xdf\x17\xb1\xd3\x5e\x3d\x7c\xac\x5b\xbe\x62\
-\xf9\x35\xd7\x5c\x53\xfb\xe2\xb6\x65\xb7\xe5\x96\x2e\xad\x2d\xc6\
-\x01\xd9\xb4\xfc\x75\x38\xbf\x50\xac\xbf\x05\x67\xdf\x7b\xef\xcc\
-\x2f\xcf\xcc\x3e\xff\xe7\xce\x9d\xbb\xa2\x6e\xb2\x5e\x40\xd6\xbe\
-\xb8\xe9\xa6\x9b\x6e\xfc\xd8\x8d\xb5\x2f\x56\xad\xba\xd3\xd3\x0e\
-\x59\xa3\x8f\xa4\x49\x94\x91\x00\x00\x10\x04\x71\x24\x00\x00\x00\
-\x00\xa4\x48\xfe\xd7\x96\xfc\xfa\x6c\x6e\xd3\x20\xcb\x6f\xc1\x42\
-\x5e\x81\xfa\xae\x93\xc5\x62\x31\x97\xcb\x99\x1b\x70\x51\xfa\x48\
-\x1a\x4e\x19\x09\x00\x00\xa1\x10\x47\x02\x00\x00\x00\x00\x10\xa4\
-\xd9\x4d\x58\x01\xe6\xa1\x8f\xa4\x81\x94\x91\x00\x00\x10\x90\xdf\
-\x36\x02\x00\x00\x00\x00\x00\x00\x22\xb6\xa5\xbf\x7f\x30\xa8\xa0\
-\xad\x7f\x60\x60\xeb\xe0\xa0\x1b\x97\x36\xca\x48\x00\x00\x08\x8b\
-\x38\x12\x00\x00\x00\x00\x00\x80\xc8\xe9\x23\xb9\x4a\xca\x48\x00\
-\x00\x08\x8e\x38\x12\x00\x00\x00\x00\x00\x80\xf8\xe9\x23\x59\x34\
-\x65\x24\x00\x00\x84\x48\x1c\x09\x00\x00\x00\x00\x00\x40\x26\xe8\
-\x23\x59\x04\x65\x24\x00\x00\x04\x4a\x1c\x09\x00\x00\x00\x00\x00\
-\x40\x56\xe8\x23\xb9\x22\xca\x48\x00\x00\x08\x97\x38\x12\x00\x00\
-\x00\x00\x00\x80\x0c\xd1\x47\xb2\x40\xca\x48\x00\x00\x08\x9a\x38\
-\x12\x00\x00\x00\x00\x00\x80\x6c\xd1\x47\x72\x59\xca\x48\x00\x00\
-\x08\x9d\x38\x12\x00\x00\x00\x00\x00\x80\xcc\xd1\x47\x32\x0f\x65\
-\x24\x00\x00\x44\x40\x1c\x09\x00\x00\x00\x00\x00\x40\x16\xe9\x23\
-\xb9\x28\x65\x24\x00\x00\xc4\x41\x1c\x09\x00\x00\x00\x00\x00\x40\
-\x46\xe9\x23\xb9\x80\x32\x12\x00\x00\xa2\x21\x8e\x04\x00\x00\x00\
-\x00\x00\x20\xbb\xf4\x91\xcc\x52\x46\x02\x00\x40\x4c\xc4\x91\x00\
-\x00\x00\x00\x00\x00\x64\x9a\x3e\x92\x25\xca\x48\x00\x00\x88\x8e\
-\x38\x12\x00\x00\x00\x00\x00\x80\xac\xd3\x47\x66\x9c\x32\x12\x00\
-\x00\xe2\x23\x8e\x04\x00\x00\x00\x00\x00\x00\x7d\x64\x76\x29\x23\
-\x01\x00\x20\x4a\xe2\x48\x00\x00\x00\x00\x00\x00\xf8\x90\x3e\x32\
-\x83\x94\x91\x00\x00\x10\x2b\x71\x24\x00\x00\x00\x00\x00\x00\xfc\
-\x86\x3e\x32\x53\x94\x91\x00\x00\x10\x31\x71\x24\x00\x00\x00\x00\
-\x00\x00\xfc\x27\x7d\x64\x46\x28\x23\x01\x00\x20\x6e\xe2\x48\x00\
-\x00\x00\x00\x00\x00\xf8\x2f\xf4\x91\xd1\x53\x46\x02\x00\x40\xf4\
-\xc4\x91\x00\x00\x00\x00\x00\x00\x70\xa1\x2d\xfd\xfd\x5f\xfb\xea\
-\x57\x03\x5a\xb0\x3e\x72\xe1\x94\x91\x00\x00\x90\x05\xe2\x48\x00\
-\x00\x00\x00\x00\x00\xb8\x50\xa5\x52\xf9\xee\xbf\x7c\x37\xac\x35\
-\xeb\x23\x17\x42\x19\x09\x00\x00\x19\x21\x8e\x04\x00\x00\x00\x00\
-\x00\x80\xff\xa2\x52\xa9\x7c\xe6\x33\xeb\xa6\xa6\x4e\x05\xb7\x72\
-\x7d\xe4\xfc\x94\x91\x00\x00\x90\x1d\xe2\x48\x00\x00\x00\x00\x00\
-\x00\xf8\x4f\xe1\x96\x91\x75\xfa\xc8\x4b\x51\x46\x02\x00\x40\xa6\
-\x88\x23\x01\x00\x00\x00\x00\x00\xe0\x37\x42\x2f\x23\xeb\xf4\x91\
-\x73\x29\x23\x01\x00\x20\x6b\xc4\x91\x00\x00\x00\x00\x00\x00\xf0\
-\xa1\x38\xca\xc8\x3a\x7d\xe4\xf9\x94\x91\x00\x00\x90\x41\xe2\x48\
-\x00\x00\x00\x00\x00\x00\x88\xaa\x8c\xac\xd3\x47\xd6\x29\x23\x01\
-\x00\x20\x9b\xc4\x91\x00\x00\x00\x00\x00\x00\x64\x5d\x7c\x65\x64\
-\x9d\x3e\x52\x19\x09\x00\x00\x99\x25\x8e\x04\x00\x00\x00\x00\x00\
-\x20\xd3\x62\x2d\x23\xeb\xb2\xdc\x47\x2a\x23\x01\x00\x20\xcb\xc4\
-\x91\x00\x00\x00\x00\x00\x00\x64\x57\xdc\x65\x64\x5d\x36\xfb\x48\
-\x65\x24\x00\x00\x64\x9c\x38\x12\x00\x00\x00\x00\x00\x80\x8c\xca\
-\x42\x19\x59\x97\xb5\x3e\x52\x19\x09\x00\x00\x88\x23\x01\x00\x00\
-\x00\x00\x00\xc8\xa2\xec\x94\x91\x75\xd9\xe9\x23\x95\x91\x00\x00\
-\xc0\x12\x71\x24\x00\x00\x00\x00\x00\x00\x19\x94\xb5\x32\xb2\x2e\
-\x0b\x7d\xa4\x32\x12\x00\x00\xa8\x13\x47\x02\x00\x00\x00\x00\x00\
-\x90\x2d\xd9\x2c\x23\xeb\xe2\xee\x23\x95\x91\x00\x00\xc0\x2c\x71\
-\x24\x00\x00\x00\x00\x00\x00\x19\x92\xe5\x32\xb2\x2e\xd6\x3e\x52\
-\x19\x09\x00\x00\x9c\x4f\x1c\x09\x00\x00\x00\x00\x00\x40\x56\x28\
-\x23\xeb\xe2\xeb\x23\x95\x91\x00\x00\xc0\x05\xc4\x91\x00\x00\x00\
-\x00\x00\x00\x64\x82\x32\xf2\x7c\x31\xf5\x91\xca\x48\x00\x00\x60\
-\x2e\x71\x24\x00\x00\x00\x00\x00\x00\xf1\x53\x46\xce\x15\x47\x1f\
-\xa9\x8c\x04\x00\x00\x2e\x4a\x1c\x09\x00\x00\x00\x00\x00\x40\xe4\
-\x94\x91\x97\x12\x7a\x1f\xa9\x8c\x04\x00\x00\x2e\x45\x1c\x09\x00\
-\x00\x00\x00\x00\x40\xcc\x94\x91\xf3\x0b\xb7\x8f\x54\x46\x02\x00\
-\x00\xf3\x10\x47\x02\x00\x00\x00\x00\x00\x10\x2d\x65\xe4\x42\x84\
-\xd8\x47\x2a\x23\x01\x00\x80\xf9\x89\x23\x01\x00\x00\x00\x00\x00\
-\x88\x93\x32\x72\xe1\xc2\xea\x23\x95\x91\x00\x00\xc0\x65\x89\x23\
-\x01\x00\x00\x00\x00\x00\x88\x90\x32\xf2\x4a\x85\xd2\x47\x2a\x23\
-\x01\x00\x80\x85\x10\x47\x02\x00\x00\x00\x00\x00\x10\x1b\x65\xe4\
-\xe2\xa4\xbf\x8f\x54\x46\x02\x00\x00\x0b\x24\x8e\x04\x00\x00\x00\
-\x00\x00\x20\x2a\xca\xc8\xab\x91\xe6\x3e\x52\x19\x09\x00\x00\x2c\
-\x9c\x38\x12\x00\x00\x00\x00\x00\x80\x78\x28\x23\xaf\x5e\x3a\xfb\
-\x48\x65\x24\x00\x00\x70\x45\xc4\x91\x00\x00\x00\x00\x00\x00\x44\
-\x42\x19\xd9\x28\x69\xeb\x23\x95\x91\x00\x00\xc0\x95\x12\x47\x02\
-\x00\x00\x00\x00\x00\x10\x03\x65\x64\x63\xa5\xa7\x8f\x54\x46\x02\
-\x00\x00\x8b\x20\x8e\x04\x00\x00\x00\x00\x00\x20\x78\xca\xc8\x66\
-\x48\x43\x1f\xa9\x8c\x04\x00\x00\x16\x47\x1c\x09\x00\x00\x00\x00\
-\x00\x40\xd8\x52\x5e\x46\x16\x0a\xed\x13\x13\x13\x3d\xa5\x52\x88\
-\xb3\x6d\x6d\x1f\xa9\x8c\x04\x00\x00\x16\xed\x23\x46\x00\x00\x00\
-\x00\x00\x00\x40\xb8\xd2\x5f\x46\xbe\xfe\xfa\x68\xb1\x58\x7c\x71\
-\xc7\x8e\xda\xff\xdc\x35\x32\x12\xdc\x84\xeb\x79\x62\xf2\xcd\x9f\
-\x32\x12\x00\x00\xb8\x1a\x76\x8e\x04\x00\x00\x00\x00\x00\x20\x54\
-\xa1\x94\x91\xb5\xaf\x73\xb9\xdc\x8b\x3b\x76\xd8\x3f\x72\x81\x94\
-\x91\x00\x00\xc0\x55\x12\x47\x02\x00\x00\x00\x00\x00\x10\xa4\x80\
-\xca\xc8\x3a\x7d\xe4\x02\x29\x23\x01\x00\x80\xab\x27\x8e\x04\x00\
-\x00\x00\x00\x00\x20\x3c\xc1\x95\x91\x75\xfa\xc8\xcb\x52\x46\x02\
-\x00\x00\x0d\x21\x8e\x04\x00\x00\x00\x00\x00\x20\x30\x81\x96\x91\
-\x75\xfa\xc8\x79\x28\x23\x01\x00\x80\x46\x11\x47\x02\x00\x00\x00\
-\x00\x00\x10\x92\xa0\xcb\xc8\x3a\x7d\xe4\x45\x29\x23\x01\x00\x80\
-\x06\x12\x47\x02\x00\x00\x00\x00\x00\x10\x8c\x08\xca\xc8\x3a\x7d\
-\xe4\x05\x94\x91\x00\x00\x40\x63\x89\x23\x01\x00\x00\x00\x00\x00\
-\x08\x43\x34\x65\x64\x9d\x3e\x72\x96\x32\x12\x00\x00\x68\x38\x71\
-\x24\x00\x00\x00\x00\x00\x00\x01\x88\xac\x8c\xac\xd3\x47\x2e\x51\
-\x46\x02\x00\x00\xcd\x21\x8e\x04\x00\x00\x00\x00\x00\x20\xed\xa2\
-\x2c\x23\xeb\x32\xde\x47\x2a\x23\x01\x00\x80\x26\x11\x47\x02\x00\
-\x00\x00\x00\x00\x90\x6a\x11\x97\x91\x75\x99\xed\x23\x95\x91\x00\
-\x00\x40\xf3\x88\x23\x01\x00\x00\x00\x00\x00\x48\xaf\xe8\xcb\xc8\
-\xba\x0c\xf6\x91\xca\x48\x00\x00\xa0\xa9\xc4\x91\x00\x00\x00\x00\
-\x00\x00\xa4\x54\x46\xca\xc8\xba\x4c\xf5\x91\xca\x48\x00\x00\xa0\
-\xd9\xc4\x91\x00\x00\x00\x00\x00\x00\xa4\x51\xa6\xca\xc8\xba\x8c\
-\xf4\x91\xca\x48\x00\x00\x20\x01\xe2\x48\x00\x00\x00\x00\x00\x00\
-\x52\x27\x83\x65\x64\x5d\xf4\x7d\xa4\x32\x12\x00\x00\x48\x86\x38\
-\x12\x00\x00\x00\x00\x00\x80\x74\xc9\x6c\x19\x59\x17\x71\x1f\xa9\
-\x8c\x04\x00\x00\x12\x23\x8e\x04\x00\x00\x00\x00\x00\x20\x45\x32\
-\x5e\x46\xd6\x45\xd9\x47\x2a\x23\x01\x00\x80\x24\x89\x23\x01\x00\
-\x00\x00\x00\x00\x48\x0b\x65\xe4\xac\xc8\xfa\x48\x65\x24\x00\x00\
-\x90\x30\x71\x24\x00\x00\x00\x00\x00\x00\xa9\xa0\x8c\xbc\x40\x34\
-\x7d\xa4\x32\x12\x00\x00\x48\xde\x47\x8c\x00\x00\x00\x00\x00\x00\
-\x80\x96\x53\x46\x5e\x54\xbd\x8f\xac\x7d\xb1\x6b\x64\x24\xb8\x7b\
-\x3a\x1b\x44\x2a\x23\x01\x00\x80\xe4\x89\x23\x01\x00\x00\x00\x00\
-\x00\x68\x31\x65\xe4\x3c\xe2\xe8\x23\x43\xa1\x8c\x04\x00\x80\x68\
-\x38\x56\x1b\x00\x00\x00\x00\x00\x80\x56\x52\x46\x5e\x56\xd0\xe7\
-\x6b\x07\x44\x19\x09\x00\x00\x31\x11\x47\x02\x00\x00\x00\x00\x00\
-\xd0\x32\xca\xc8\x05\xd2\x47\x36\x9b\x32\x12\x00\x00\x22\x23\x8e\
-\x04\x00\x00\x00\x00\x00\xa0\x35\x94\x91\x57\x44\x1f\xd9\x3c\xca\
-\x48\x00\x00\x88\x8f\x38\x12\x00\x00\x00\x00\x00\x80\x16\x50\x46\
-\x2e\x82\x3e\xb2\x19\x94\x91\x00\x00\x10\x25\x71\x24\x00\x00\x00\
-\x00\x00\x00\x49\x53\x46\x2e\x9a\x3e\xb2\xb1\x94\x91\x00\x00\x10\
-\x2b\x71\x24\x00\x00\x00\x00\x00\x00\x89\x52\x46\x5e\x25\x7d\x64\
-\xa3\x28\x23\x01\x00\x20\x62\xe2\x48\x00\x00\x00\x00\x00\x00\x92\
-\xa3\x8c\x6c\x08\x7d\xe4\xd5\x53\x46\x02\x00\x40\xdc\xc4\x91\x00\
-\x00\x00\x00\x00\x00\x24\x44\x19\xd9\x40\xfa\xc8\xab\xa1\x8c\x04\
-\x00\x80\xe8\x89\x23\x01\x00\x00\x00\x00\x00\x48\x82\x32\xb2\xe1\
-\xf4\x91\x8b\xa3\x8c\x04\x00\x80\x2c\x10\x47\x02\x00\x00\x00\x00\
-\x00\xd0\x74\xca\xc8\x26\xd1\x47\x5e\x29\x65\x24\x00\x00\x64\x84\
-\x38\x12\x00\x00\x00\x00\x00\x80\xe6\x52\x46\x36\x95\x3e\x72\xe1\
-\x94\x91\x00\x00\x90\x1d\xe2\x48\x00\x00\x00\x00\x00\x00\x9a\x48\
-\x19\x99\x00\x7d\xe4\x42\x28\x23\x01\x00\x20\x53\xc4\x91\x00\x00\
-\x00\x00\x00\x00\x34\x8b\x32\x32\x31\xfa\xc8\xf9\x29\x23\x01\x00\
-\x20\x6b\xc4\x91\x00\x00\x00\x00\x00\x00\x34\x85\x32\x32\x61\xfa\
-\xc8\x4b\x51\x46\x02\x00\x40\x06\x89\x23\x01\x00\x00\x00\x00\x00\
-\x68\x3c\x65\x24\x29\xa1\x8c\x04\x00\x80\x6c\x12\x47\x02\x00\x00\
-\x00\x00\x00\xd0\x60\xca\xc8\x96\xa8\x56\xab\x5f\x78\xe4\x91\x5d\
-\x23\x23\x9e\xc0\x59\xca\x48\x00\x00\xc8\x2c\x71\x24\x00\x00\x00\
-\x00\x00\x00\x8d\xa4\x8c\x6c\x09\x65\xe4\x5c\xca\x48\x00\x00\xc8\
-\x32\x71\x24\x00\x00\x00\x00\x00\x00\x0d\xa3\x8c\x6c\x09\x65\xe4\
-\x5c\xca\x48\x00\x00\xc8\x38\x71\x24\x00\x00\x00\x00\x00\x00\x8d\
-\xa1\x8c\x6c\x09\x65\xe4\x5c\xca\x48\x00\x00\x40\x1c\x09\x00\x00\
-\x00\x00\x00\x40\x03\x28\x23\x5b\x42\x19\x39\x97\x32\x12\x00\x00\
-\x58\x22\x8e\x04\x00\x00\x00\x00\x00\xe0\xea\x29\x23\x5b\x42\x19\
-\x39\x97\x32\x12\x00\x00\xa8\x13\x47\x02\x00\x00\x00\x00\x00\x70\
-\x55\x94\x91\x2d\xa1\x8c\x9c\x4b\x19\x09\x00\x00\xcc\x12\x47\x02\
-\x00\x00\x00\x00\x00\xb0\x78\xca\xc8\x96\x50\x46\xce\xa5\x8c\x04\
-\x00\x00\xce\x27\x8e\x04\x00\x00\x00\x00\x00\x60\x91\x94\x91\x2d\
-\xa1\x8c\x9c\x4b\x19\x09\x00\x00\x5c\x40\x1c\x09\x00\x00\x00\x00\
-\x00\xc0\x62\x28\x23\x5b\x42\x19\x39\x97\x32\x12\x00\x00\x98\x4b\
-\x1c\x09\x00\x00\x00\x00\x00\xc0\x15\x53\x46\xb6\x84\x32\x72\x2e\
-\x65\x24\x00\x00\x70\x51\xe2\x48\x00\x00\x00\x00\x00\x00\xae\x8c\
-\x32\xb2\x25\x94\x91\x73\x29\x23\x01\x00\x80\x4b\x11\x47\x02\x00\
-\x00\x00\x00\x00\x70\x05\x94\x91\x2d\xa1\x8c\x9c\x4b\x19\x09\x00\
-\x00\xcc\x43\x1c\x09\x00\x00\x00\x00\x00\xc0\x42\x29\x23\x5b\x42\
-\x19\x39\x97\x32\x12\x00\x00\x98\x9f\x38\x12\x00\x00\x00\x00\x00\
-\x80\x05\x51\x46\xb6\x84\x32\x72\x2e\x65\x24\x00\x00\x70\x59\xe2\
-\x48\x00\x00\x00\x00\x00\x00\x2e\x4f\x19\xd9\x12\xca\xc8\xb9\x94\
-\x91\x00\x00\xc0\x42\x88\x23\x01\x00\x00\x00\x00\x00\xb8\x0c\x65\
-\x64\x4b\x28\x23\xe7\x52\x46\x02\x00\x00\x0b\x24\x8e\x04\x00\x00\
-\x00\x00\x00\x60\x3e\xca\xc8\x96\x50\x46\xce\xa5\x8c\x04\x00\x00\
-\x16\x4e\x1c\x09\x00\x00\x00\x00\x00\xc0\x25\x29\x23\x5b\x42\x19\
-\x39\x97\x32\x12\x00\x00\xb8\x22\xe2\x48\x00\x00\x00\x00\x00\x00\
-\x2e\x4e\x19\xd9\x12\xca\xc8\xb9\x94\x91\x00\x00\xc0\x95\x12\x47\
-\x02\x00\x00\x00\x00\x00\x70\x11\xca\xc8\x96\x50\x46\xce\xa5\x8c\
-\x04\x00\x00\x16\x41\x1c\x09\xc0\xff\x67\xef\x8e\x62\xeb\xaa\xef\
-\x04\x8f\xa3\x11\x8f\xd7\x90\x37\x9b\x26\x24\x4e\x6e\x48\xa6\x22\
-\x19\x47\x0d\x15\x6c\x62\x4a\x1c\x23\x91\xcc\xaa\x4c\xd7\x69\xc2\
-\x3c\x74\x44\x65\x67\x54\x3a\xab\x9d\x36\x41\x62\xb5\x1d\x81\xaf\
-\x41\xdb\x11\x48\xc4\x4c\xe7\x61\xbb\x02\x5f\x40\xcb\xee\x2c\xc9\
-\xf8\x56\x82\xe9\xd4\xa9\x9a\xd8\x1d\x9c\x14\x24\x0c\x71\x71\x34\
-\x9b\xc0\x85\x6b\x93\x10\xdf\x37\x27\x3e\xef\x5d\xd3\x3b\x93\xc9\
-\x40\x08\x89\x7d\x7d\xef\xf9\xff\xcf\xe7\x23\x84\x5c\xa0\xb9\xbf\
-\xf3\xfb\xdf\xe3\xa7\xaf\xce\x01\x00\x00\x00\x00\xf8\x2c\x65\x64\
-\x53\x28\x23\x3f\x4f\x19\x09\x00\x00\x2c\x8e\x38\x12\x00\x00\x00\
-\x00\x00\x80\x7f\x47\x19\xd9\x14\xca\xc8\xcf\x53\x46\x02\x00\x00\
-\x8b\x26\x8e\x04\x00\x00\x00\x00\x00\xe0\xdf\x28\x23\x9b\x22\xe5\
-\x65\x64\x4b\x4b\xae\xf1\x1f\xaa\x8c\x04\x00\x00\x96\x42\x1c\x09\
-\x00\x00\x00\x00\x00\xc0\xbf\x50\x46\x36\x45\xca\xcb\xc8\x85\xb5\
-\xbf\xfb\xee\xa9\x81\x42\xa1\x91\x1f\xaa\x8c\x04\x00\x00\x96\x48\
-\x1c\x09\x00\x00\x00\x00\x00\xc0\xa7\x94\x91\x4d\x91\xfe\x32\xb2\
-\xb6\xf6\x27\xfa\xfb\x1b\xd6\x47\x2a\x23\x01\x00\x80\xa5\x13\x47\
-\x02\x00\x00\x00\x00\x00\xa0\x8c\x6c\x8e\x50\xca\xc8\xda\xff\x6c\
-\x4c\x1f\xa9\x8c\x04\x00\x00\xea\x42\x1c\x09\x00\x00\x00\x00\x00\
-\x90\x75\xca\xc8\xa6\x08\xab\x8c\xac\x59\xee\x3e\x52\x19\x09\x00\
-\x00\xd4\x8b\x38\x12\x00\x00\x00\x00\x00\x20\xd3\x94\x91\x4d\x11\
-\x62\x19\x59\xb3\x7c\x7d\xa4\x32\x12\x00\x00\xa8\x23\x71\x24\x00\
-\x00\x00\x00\x00\x40\x76\x29\x23\x9b\x22\xdc\x32\xb2\x66\x39\xfa\
-\x48\x65\x24\x00\x00\x50\x5f\xe2\x48\x00\x00\x00\x00\x00\x80\x8c\
-\x52\x46\x36\x45\xe8\x65\x64\x4d\x7d\xfb\x48\x65\x24\x00\x00\x50\
-\x77\xe2\x48\x00\x00\x00\x00\x00\x80\x2c\x52\x46\x36\x45\x1c\x65\
-\x64\x4d\xbd\xfa\x48\x65\x24\x00\x00\xb0\x1c\xc4\x91\x00\x00\x00\
-\x00\x00\x00\x99\xa3\x8c\x6c\x8a\x98\xca\xc8\x9a\xa5\xf7\x91\xca\
-\x48\x00\x00\x60\x99\x88\x23\x01\x00\x00\x00\x00\x00\xb2\x45\x19\
-\xd9\x14\xf1\x95\x91\x35\x4b\xe9\x23\x95\x91\x00\x00\xc0\xf2\x11\
-\x47\x02\x00\x00\x00\x00\x00\x64\x88\x32\xb2\x29\x62\x2d\x23\x6b\
-\x16\xd7\x47\x2a\x23\x01\x00\x80\x65\x25\x8e\x04\x00\x00\x00\x00\
-\x00\xc8\x0a\x65\x64\x53\xc4\x5d\x46\xd6\xdc\x68\x1f\xa9\x8c\x04\
-\x00\x00\x96\x9b\x38\x12\x00\x00\x00\x00\x00\x20\x13\x94\x91\x4d\
-\x91\x85\x32\xb2\xe6\xfa\xfb\x48\x65\x24\x00\x00\xd0\x00\xe2\x48\
-\x00\x00\x00\x00\x00\x80\xf8\x29\x23\x9b\x22\x3b\x65\x64\xcd\xf5\
-\xf4\x91\xca\x48\x00\x00\xa0\x31\xc4\x91\x00\x00\x00\x00\x00\x00\
-\x91\x53\x46\x36\x45\xd6\xca\xc8\x9a\x6b\xf7\x91\xca\x48\x00\x00\
-\xa0\x61\xc4\x91\x00\x00\x00\x00\x00\x00\x31\x53\x46\x36\x45\x36\
-\xcb\xc8\x9a\x2f\xea\x23\x95\x91\x00\x00\x40\x23\x89\x23\x01\x00\
-\x00\x00\x00\x00\xa2\xa5\x8c\x6c\x8a\x2c\x97\x91\x35\x9f\xef\x23\
-\x95\x91\x00\x00\x40\x83\x89\x23\x01\x00\x00\x00\x00\x00\xe2\xa4\
-\x8c\x6c\x0a\x65\x64\xcd\x95\x7d\xa4\x32\x12\x00\x00\x68\xbc\x9b\
-\xad\x00\x00\x00\x00\x00\x00\x20\x3e\xca\xc8\xa6\x50\x46\x5e\xe9\
-\x72\x10\xa9\x8c\x04\x00\x00\x1a\x4f\x1c\x09\x00\x00\x00\x00\x00\
-\x10\x1b\x65\x64\x53\x28\x23\x3f\x4f\x16\x09\x00\x00\x34\x8b\xd7\
-\x6a\x03\x00\x00\x00\x00\x00\x44\x45\x19\xd9\x14\xca\x48\x00\x00\
-\x80\x54\x11\x47\x02\x00\x00\x00\x00\x00\xc4\x43\x19\xd9\x14\xca\
-\x48\x00\x00\x80\xb4\x11\x47\x02\x00\x00\x00\x00\x00\x44\x42\x19\
-\xd9\x14\xca\x48\x00\x00\x80\x14\x12\x47\x02\x00\x00\x00\x00\x00\
-\xc4\x40\x19\xd9\x14\xca\x48\x00\x00\x80\x74\x12\x47\x02\x00\x00\
-\x00\x00\x00\x04\x4f\x19\xd9\x14\xca\x48\x00\x00\x80\xd4\x12\x47\
-\x02\x00\x00\x00\x00\x00\x84\x4d\x19\xd9\x14\xca\x48\x00\x00\x80\
-\x34\x13\x47\x02\x00\x00\x00\x00\x00\x04\x4c\x19\xd9\x14\xca\x48\
-\x00\x00\x80\x94\x13\x47\x02\x00\x00\x00\x00\x00\x84\x4a\x19\xd9\
-\x14\xca\x48\x00\x00\x80\xf4\x13\x47\x02\x00\x00\x00\x00\x00\x04\
-\x49\x19\xd9\x14\xca\x48\x00\x00\x80\x20\x88\x23\x01\x00\x00\x00\
-\x00\x00\xc2\xa3\x8c\x6c\x0a\x65\x24\x00\x00\x40\x28\xc4\x91\x00\
-\x00\x00\x00\x00\x00\x81\x51\x46\x36\x85\x32\x12\x00\x00\x20\x20\
-\xe2\x48\x00\x00\x00\x00\x00\x80\x90\x28\x23\x9b\x42\x19\x09\x00\
-\x00\x10\x16\x71\x24\x00\x00\x00\x00\x00\x40\x48\x66\x2f\x5c\x48\
-\x6d\x19\xb9\x60\xeb\xd7\xb6\xb6\xb6\xb6\x46\xb6\x73\x65\x24\x00\
-\x00\x40\x70\xc4\x91\x00\x00\x00\x00\x00\x00\x21\xd9\xde\xd9\x39\
-\xf2\x8b\x5f\xa4\x76\xbc\xe1\x52\xe9\xbb\x0f\x3f\x9c\x24\x49\x34\
-\x0b\x57\x46\x02\x00\x00\x84\x48\x1c\x09\x00\x00\x00\x00\x00\x10\
-\x98\x07\x76\xed\xd2\x47\x36\x86\x32\x12\x00\x00\x20\x50\xe2\x48\
-\x00\x00\x00\x00\x00\x80\xf0\xe8\x23\x1b\x40\x19\x09\x00\x00\x10\
-\x2e\x71\x24\x00\x00\x00\x00\x00\x40\x90\xf4\x91\xcb\x4a\x19\x09\
-\x00\x00\x10\x34\x71\x24\x00\x00\x00\x00\x00\x40\xa8\xf4\x91\xcb\
-\x44\x19\x09\x00\x00\x10\x3a\x71\x24\x00\x00\x00\x00\x00\x40\xc0\
-\xf4\x91\x75\xa7\x8c\x04\x00\x00\x88\x80\x38\x12\x00\x00\x00\x00\
-\x00\x20\x6c\xfa\xc8\x3a\x52\x46\x02\x00\x00\xc4\x41\x1c\x09\x00\
-\x00\x00\x00\x00\x10\x3c\x7d\x64\x5d\x28\x23\x01\x00\x00\xa2\x21\
-\x8e\x04\x00\x00\x00\x00\x00\x88\x81\x3e\x72\x89\x94\x91\x00\x00\
-\x00\x31\x11\x47\x02\x00\x00\x00\x00\x00\x44\x42\x1f\xb9\x68\xca\
-\x48\x00\x00\x80\xc8\x88\x23\x01\x00\x00\x00\x00\x00\xe2\xa1\x8f\
-\x5c\x84\x72\xb9\xfc\xe0\x83\xdf\x54\x46\x02\x00\x00\xc4\x44\x1c\
-\x09\x00\x00\x00\x00\x00\x10\x15\x7d\xe4\x0d\x29\x97\xcb\xf7\xdf\
-\xdf\x3d\x3a\x3a\x96\xce\x75\x29\x23\x01\x00\x00\x16\x47\x1c\x09\
-\x00\x00\x00\x00\x00\x10\x1b\x7d\xe4\x75\xaa\x95\x91\x95\xca\x74\
-\x3a\x17\xa5\x8c\x04\x00\x00\x58\x34\x71\x24\x00\x00\x00\x00\x00\
-\x40\x84\xf4\x91\x5f\x4a\x19\x09\x00\x00\x10\x31\x71\x24\x00\x00\
-\x00\x00\x00\x40\x9c\xf4\x91\xd7\xa0\x8c\x04\x00\x00\x88\x9b\x38\
-\x12\x00\x00\x00\x00\x00\x20\x5a\xfa\xc8\xab\x52\x46\x02\x00\x00\
-\x44\x4f\x1c\x09\x00\x00\x00\x00\x00\x10\x33\x7d\xe4\x67\x28\x23\
-\x01\x00\x00\xb2\x40\x1c\x09\x00\x00\x00\x00\x00\x10\x39\x7d\xe4\
-\x65\xca\x48\x00\x00\x80\x8c\x10\x47\x02\x00\x00\x00\x00\x00\xc4\
-\x4f\x1f\x79\x93\x32\x12\x00\x00\x20\x4b\xc4\x91\x00\x00\x00\x00\
-\x00\x00\x99\x90\xf1\x3e\x52\x19\x09\x00\x00\x90\x29\xe2\x48\x00\
-\x00\x00\x00\x00\x80\xac\xc8\x6c\x1f\xa9\x8c\x04\x00\x00\xc8\x1a\
-\x71\x24\x00\x00\x00\x00\x00\x40\x86\x64\xb0\x8f\x54\x46\x02\x00\
-\x00\x64\x90\x38\x12\x00\x00\x00\x00\x00\x20\x5b\x32\xd5\x47\x2a\
-\x23\x01\x00\x00\xb2\x49\x1c\x09\x00\x00\x00\x00\x00\x90\x39\x19\
-\xe9\x23\x95\x91\x00\x00\x00\x99\x25\x8e\x04\x00\x00\x00\x00\x00\
-\xc8\xa2\xe8\xfb\x48\x65\x24\x00\x00\x40\x96\x89\x23\x01\x00\x00\
-\x00\x00\x00\x32\x2a\xe2\x3e\x52\x19\x09\x00\x00\x90\x71\xe2\x48\
-\x00\x00\x00\x00\x00\x80\xec\x8a\xb2\x8f\x54\x46\x02\x00\x00\x20\
-\x8e\x04\x00\x00\x00\x00\x00\xc8\xb4\xc8\xfa\x48\x65\x24\x00\x00\
-\x00\x37\x89\x23\x01\x00\x00\x00\x00\x00\x88\xa6\x8f\x54\x46\x02\
-\x00\x00\x50\x23\x8e\x04\x00\x00\x00\x00\x00\x20\x86\x3e\x52\x19\
-\x09\x00\x00\xc0\x65\xe2\x48\x00\x00\x00\x00\x00\x00\x3e\x15\x74\
-\x1f\xa9\x8c\x04\x00\x00\xe0\x4a\xe2\x48\x00\x00\x00\x00\x00\x00\
-\xfe\x45\xa0\x7d\xa4\x32\x12\x00\x00\x80\xcf\x10\x47\x02\x00\x00\
-\x00\x00\x00\xf0\x6f\x82\xeb\x23\x95\x91\x00\x00\x00\x7c\x9e\x38\
-\x12\x00\x00\x00\x00\x00\x80\x7f\x27\xa0\x3e\x52\x19\x09\x00\x00\
-\xc0\x55\x89\x23\x01\x00\x00\x00\x00\x00\xf8\xac\x20\xfa\xc8\xc9\
-\xc9\x49\x65\x24\x00\x00\x00\x57\x25\x8e\x04\x00\x00\x00\x00\x00\
-\xe0\x2a\xd2\xdf\x47\x6e\xd9\xb2\x45\x19\x09\x00\x00\xc0\x55\x89\
-\x23\x01\x00\x00\x00\x00\x00\xb8\xba\x94\xf7\x91\xa9\xa5\x8c\x04\
-\x00\x00\x68\x3a\x71\x24\x00\x00\x00\x00\x00\x00\x5f\x48\x1f\x79\
-\xa3\x94\x91\x00\x00\x00\x69\x20\x8e\x04\x00\x00\x00\x00\x00\xe0\
-\x5a\xf4\x91\xd7\x4f\x19\x09\x00\x00\x90\x12\xe2\x48\x00\x00\x00\
-\x00\x00\x00\xbe\x84\x3e\xf2\x7a\x28\x23\x01\x00\x00\xd2\x43\x1c\
-\x09\x00\x00\x00\x00\x00\xc0\x97\xd3\x47\x5e\x9b\x32\x12\x00\x00\
-\x20\x55\xc4\x91\x00\x00\x00\x00\x00\x00\x5c\x17\x7d\xe4\x17\x51\
-\x46\x02\x00\x00\xa4\x8d\x38\x12\x00\x00\x00\x00\x00\x80\xeb\xa5\
-\x8f\xfc\x3c\x65\x24\x00\x00\x40\x0a\x89\x23\x01\x00\x00\x00\x00\
-\x00\xb8\x01\xfa\xc8\x2b\x29\x23\x01\x00\x00\xd2\x49\x1c\x09\x00\
-\x00\x00\x00\x00\xc0\x8d\xd1\x47\xd6\x28\x23\x01\x00\x00\x52\x4b\
-\x1c\x09\x00\x00\x00\x00\x00\xc0\x0d\xd3\x47\x2a\x23\x01\x00\x00\
-\xd2\x4c\x1c\x09\x00\x00\x00\x00\x00\xc0\x62\x64\xb9\x8f\x54\x46\
-\x02\x00\x00\xa4\x9c\x38\x12\x00\x00\x00\x00\x00\x80\x45\xca\x66\
-\x1f\xa9\x8c\x04\x00\x00\x48\x3f\x71\x24\x00\x00\x00\x00\x00\x00\
-\x8b\x97\xb5\x3e\x52\x19\x09\x00\x00\x10\x04\x71\x24\x00\x00\x00\
-\x00\x00\x00\x4b\x92\x9d\x3e\x52\x19\x09\x00\x00\x10\x0a\x71\x24\
-\x00\x00\x00\x00\x00\x00\x4b\x95\x85\x3e\x52\x19\x09\x00\x00\x10\
-\x10\x71\x24\x00\x00\x00\x00\x00\x00\x75\x10\x77\x1f\xa9\x8c\x04\
-\x00\x00\x08\x8b\x38\x12\x00\x00\x00\x00\x00\x80\xfa\x88\xb5\x8f\
-\x54\x46\x02\x00\x00\x04\x47\x1c\x09\x00\x00\x00\x00\x00\x40\xdd\
-\xc4\xd7\x47\x2a\x23\x01\x00\x00\x42\x24\x8e\x04\x00\x00\x00\x00\
-\x00\xa0\x9e\x62\xea\x23\x95\x91\x00\x00\x00\x81\x12\x47\x02\x00\
-\x00\x00\x00\x00\x50\x67\x71\xf4\x91\xca\x48\x00\x00\x80\x70\x89\
-\x23\x01\x00\x00\x00\x00\x00\xa8\xbf\xd0\xfb\x48\x65\x24\x00\x00\
-\x40\xd0\xc4\x91\x00\x00\x00\x00\x00\x00\x2c\x8b\x70\xfb\x48\x65\
-\x24\x00\x00\x40\xe8\xc4\x91\x00\x00\x00\x00\x00\x00\x2c\x97\x10\
-\xfb\x48\x65\x24\x00\x00\x40\x04\xc4\x91\x00\x00\x00\x00\x00\x00\
-\x2c\xa3\xb0\xfa\x48\x65\x24\x00\x00\x40\x1c\xc4\x91\x00\x00\x00\
-\x00\x00\x00\x2c\xaf\x50\xfa\x48\x65\x24\x00\x00\x40\x34\xc4\x91\
-\x00\x00\x00\x00\x00\x00\x2c\xbb\xf4\xf7\x91\xca\x48\x00\x00\x80\
-\x98\x88\x23\x01\x00\x00\x00\x00\x00\x68\x84\x34\xf7\x91\xca\x48\
-\x00\x00\x80\xc8\x88\x23\x01\x00\x00\x00\x00\x00\x68\x90\x74\xf6\
-\x91\xca\x48\x00\x00\x80\xf8\x88\x23\x01\x00\x00\x00\x00\x00\x68\
-\x9c\xb4\xf5\x91\xca\x48\x00\x00\x80\x28\x89\x23\x01\x00\x00\x00\
-\x00\x00\x68\xa8\xf4\xf4\x91\xca\x48\x00\x00\x80\x58\x89\x23\x01\
-\x00\x00\x00\x00\x00\x68\xb4\x34\xf4\x91\xca\x48\x00\x00\x80\x88\
-\x89\x23\x01\x00\x00\x00\x00\x00\x68\x82\xe6\xf6\x91\xca\x48\x00\
-\x00\x80\xb8\x89\x23\x01\x00\x00\x00\x00\x00\x68\x8e\x66\xf5\x91\
-\xca\x48\x00\x00\x80\xe8\x89\x23\x01\x00\x00\x00\x00\x00\x68\x9a\
-\xc6\xf7\x91\xca\x48\x00\x00\x80\x2c\x10\x47\x02\x00\x00\x00\x00\
-\x00\xd0\x4c\x8d\xec\x23\x95\x91\x00\x00\x00\x19\x21\x8e\x04\x00\
-\x00\x00\x00\x00\xa0\xc9\x1a\xd3\x47\x2a\x23\x01\x00\x00\xb2\x43\
-\x1c\x09\x00\x00\x00\x00\x00\x40\xf3\x2d\x77\x1f\xa9\x8c\x04\x00\
-\x00\xc8\x14\x71\x24\x00\x00\x00\x00\x00\x00\xa9\xb0\x7c\x7d\xa4\
-\x32\x12\x00\x00\x20\x6b\xc4\x91\x00\x00\x00\x00\x00\x00\xa4\xc5\
-\x72\xf4\x91\xca\x48\x00\x00\x80\x0c\x12\x47\x02\x00\x00\x00\x00\
-\x00\x90\x22\xf5\xed\x23\x95\x91\x00\x00\x00\xd9\x24\x8e\x04\x00\
-\x00\x00\x00\x00\x20\x5d\xea\xd5\x47\x2a\x23\x01\x00\x00\x32\x4b\
-\x1c\x09\x00\x00\x00\x00\x00\x40\xea\x2c\xbd\x8f\x54\x46\x02\x00\
-\x00\x64\xd9\xcd\x56\x00\x00\x00\x00\x00\xc0\xe2\x54\xab\xd5\xd9\
-\x05\x17\x2e\x9c\xff\xe4\xfc\xa5\x4b\x97\xa6\xde\x9b\x5a\xf8\x87\
-\x73\x73\x73\xc3\xa5\xd2\xf5\xff\x21\x7b\x7a\x7a\x56\xac\x58\xb1\
-\xf0\xc3\xea\xd5\xab\x57\xdd\xbe\xaa\xa5\xa5\x65\xc3\x86\x8d\xb9\
-\x5c\x4e\xcf\x04\xd4\xfa\xc8\x5d\xbb\x77\x2f\xe2\xff\xab\x8c\x04\
-\x00\x00\xc8\x38\x71\x24\x00\x00\x00\x00\x00\xd7\xa5\x5a\xad\x7e\
-\xf0\xfe\xfb\x67\xce\x9e\x39\x3d\x75\x7a\x7a\x7a\xfa\x86\x0a\xc8\
-\x6b\xb8\xc6\x9f\xd3\xd5\xb5\x63\xdd\xda\x75\xdb\xb6\x6f\x5b\xf9\
-\x95\x95\xeb\xef\xb8\x43\xe4\x04\x19\xb4\xb8\x3e\x52\x19\x09\x00\
-\x00\x80\x38\x12\x00\x00\x00\x00\x80\x2f\x54\x2e\x97\xdf\x79\x67\
-\xe2\xcd\xdf\xbc\x59\xfa\x59\xa9\x52\x99\x6e\xf0\xa7\x8f\x8e\x8e\
-\x2d\xfc\x35\x54\x2c\x5e\xfe\x27\x7d\xbd\xbd\xdb\xb6\x6f\xdb\xba\
-\xf5\xae\x7c\x3e\x9f\xcb\xe5\x1c\x10\x64\xc1\x8d\xf6\x91\xca\x48\
-\x00\x00\x00\x6e\x12\x47\x02\x00\x00\x00\x00\xf0\x19\xd5\x6a\xf5\
-\x9f\xfe\xe9\xd7\xcd\x0a\x22\xaf\x6d\xa8\x58\xbc\xdc\x4a\xd6\x42\
-\xc9\xfb\xee\xdb\x21\x81\x82\xe8\x5d\x7f\x1f\xa9\x8c\x04\x00\x00\
-\xa0\x46\x1c\x09\x00\x00\x00\x40\x86\x4c\x4e\x4e\x6e\xd9\xb2\xc5\
-\x1e\xc2\x75\xea\xd4\xa9\x8e\x8e\x0e\x7b\x58\x26\xe5\x72\xf9\xf5\
-\xd7\x5f\x1b\x7f\x63\xbc\x5e\xef\xcb\x5e\x6e\x97\x43\xc9\xae\xae\
-\x1d\x3b\xee\xdb\xd1\xdd\xdd\xbd\xbd\xb3\xd3\x39\x42\xac\xae\xa7\
-\x8f\x54\x46\x02\x00\x00\x70\xd9\x1f\x58\x01\x00\x00\x00\x00\x40\
-\x96\x55\xab\xd5\x23\x47\x0e\xef\xdc\xd9\xb5\x7e\xfd\xfa\x03\x07\
-\x0e\x86\x52\x46\x5e\x69\x74\x74\xac\xbf\x50\xe8\xbc\xf7\xde\xb5\
-\x6b\xdb\x9f\x7b\x6e\xb0\x5c\x2e\x3b\x56\x88\x52\xad\x8f\xfc\xa2\
-\x7f\xab\x8c\x04\x00\x00\xe0\x4a\xe2\x48\x00\x00\x00\x00\x32\x64\
-\x62\xe2\x6d\x4b\x80\xcb\x8e\x8e\x8c\xec\xef\xeb\x6b\x6b\x6b\xdb\
-\xb7\xef\xa1\xd1\xd1\xb1\x08\xae\xa8\x52\x99\x3e\x70\xe0\xe0\xfa\
-\xf5\xeb\xbf\xbd\x67\xcf\x91\x23\x87\x93\x24\x71\xca\x10\x99\x2f\
-\xea\x23\x95\x91\x00\x00\x00\x7c\x86\x38\x12\x00\x00\x00\x00\x20\
-\x5b\x92\x24\x29\x16\x87\x76\xee\xec\xda\xb5\x7b\x77\xed\xb5\xd4\
-\xf1\x19\x2e\x95\xf6\xed\x7b\x68\xf3\xe6\x4d\x4f\x0e\x0c\x54\xab\
-\x55\x87\x0e\x31\xf9\x7c\x1f\xa9\x8c\x04\x00\x00\xe0\xf3\xc4\x91\
-\x00\x00\x00\x00\x64\xc8\xc9\x13\x27\x2d\x81\x2c\xab\x56\xab\x4f\
-\x0e\x0c\xb4\xb4\xb4\xf4\xf5\xed\x8f\xe3\x51\x91\xd7\x56\xa9\x4c\
-\xf7\x17\x0a\x6d\x6d\x6d\x8f\x1e\x3c\x38\x39\x39\xe9\x0b\x00\xd1\
-\xb8\xb2\x8f\x54\x46\x02\x00\x00\x70\x55\xe2\x48\x00\x00\x00\x00\
-\x80\xf8\xd5\xb2\xc8\xb6\xb6\xb6\xfe\x42\x21\x83\x97\x7f\x68\x70\
-\x70\xcb\x96\x2d\xfb\xfb\xfa\x24\x92\x10\x8d\x5a\x1f\xa9\x8c\x04\
-\x00\x00\xe0\x8b\x88\x23\x01\x00\x00\x00\xc8\x90\x58\xdf\x20\x0c\
-\xd7\x90\xf1\x2c\xf2\x33\xbf\x01\xb6\x6c\xd9\xf2\xe8\xc1\x83\x5e\
-\xb4\x0d\x71\x78\x60\xd7\xae\xf7\xde\x9b\x52\x46\x02\x00\x00\x70\
-\x55\xe2\x48\x00\x00\x00\x00\x80\x38\x25\x49\x52\x2c\x0e\xdd\x73\
-\xcf\xdd\xb2\xc8\x2b\x1d\x1a\x1c\x6c\x6b\x6b\x7b\xee\xb9\xc1\x85\
-\xfd\xd8\x06\x84\x2e\x97\xcb\x59\x02\x00\x00\x00\x57\x25\x8e\x04\
-\x00\x00\x00\x20\x2b\xbc\x4e\x97\x4c\x39\x3a\x32\xf2\xe0\x83\xdf\
-\xec\xeb\xdb\x5f\xa9\x4c\xdb\xc6\xe7\x1d\x38\x70\x70\xf3\xe6\x4d\
-\x47\x8e\x1c\xb6\x0a\x00\x00\x00\x80\x28\x89\x23\x01\x00\x00\x00\
-\x00\xa2\x52\xad\x56\xf7\xf7\xf5\xed\xda\xbd\x7b\x74\x74\xcc\x36\
-\xae\xa1\x52\x99\xde\xb7\xef\xa1\x85\x5d\x95\xcb\x65\xdb\x00\x00\
-\x00\x00\x88\x8c\x38\x12\x00\x00\x00\x80\xac\x98\x98\x78\xdb\x12\
-\x88\x5e\xed\x3d\xda\x43\xc5\xa2\x55\x5c\xa7\x85\x5d\xad\x5f\xbf\
-\x7e\x61\x6f\x56\x01\x00\x00\x00\x10\x13\x71\x24\x00\x00\x00\x00\
-\x40\x0c\xaa\xd5\xea\xb7\xf7\xec\xf1\x1e\xed\xc5\x59\xd8\xdb\xc2\
-\xf6\x16\x76\x68\x15\x00\x00\x00\x00\x71\x10\x47\x02\x00\x00\x00\
-\x90\x15\x27\x4f\x9c\xb4\x04\x62\x75\x74\x64\xe4\x9e\x7b\xee\x1e\
-\x2e\x95\xac\x62\xd1\x16\xb6\xb7\xb0\xc3\x85\x4d\x5a\x05\x00\x00\
-\x00\x40\x04\xc4\x91\x00\x00\x00\x00\x00\x01\x4b\x92\xe4\xd1\x83\
-\x07\x77\xed\xde\xed\x81\x91\x4b\xb7\xb0\xc3\x85\x4d\x3e\x39\x30\
-\xb0\xb0\x55\xdb\x00\x00\x00\x00\x08\x9a\x38\x12\x00\x00\x00\x80\
-\xac\x18\x2a\x16\x2d\x81\xc8\x94\xcb\xe5\xef\x3e\xfc\xf0\xa1\xc1\
-\x41\xab\xa8\xa3\xfe\x42\x61\x61\xab\x5e\xb1\x0d\x00\x00\x00\x10\
-\x34\x71\x24\x00\x00\x00\x00\x40\x90\x8e\x8e\x8c\xdc\x7f\x7f\xb7\
-\x57\x69\x2f\x87\xda\x2b\xb6\xcb\xe5\xb2\x55\x00\x00\x00\x00\x04\
-\x4a\x1c\x09\x00\x00\x00\x40\x26\x4c\x4e\x4e\x5a\x02\x31\x29\x16\
-\x87\xbc\x4a\x7b\x59\x2d\xec\x76\xfd\xfa\xf5\x47\x47\x46\xac\x02\
-\x00\x00\x00\x20\x44\xe2\x48\x00\x00\x00\x00\x80\xc0\x3c\x39\x30\
-\xd0\xd7\xb7\xdf\x1e\x1a\x60\xd7\xee\xdd\x47\x8e\x1c\xb6\x07\x00\
-\x00\x00\x80\xe0\x88\x23\x01\x00\x00\x00\xc8\x84\x89\x89\xb7\x2d\
-\x81\x08\x24\x49\xf2\xed\x3d\x7b\xfa\x0b\x05\xab\x68\x98\x7d\xfb\
-\x1e\x7a\x72\x60\xc0\x1e\x00\x00\x00\x00\xc2\x22\x8e\x04\x00\x00\
-\x00\x00\x08\x43\x92\x24\xdf\x7d\xf8\xe1\xe1\x52\xc9\x2a\x1a\xac\
-\xbf\x50\xd0\x47\x02\x00\x00\x00\x84\x45\x1c\x09\x00\x00\x00\x40\
-\x26\x9c\x3c\x71\xd2\x12\x08\x9a\x32\xb2\xb9\xf4\x91\x00\x00\x00\
-\x00\x61\x11\x47\x02\x00\x00\x00\x90\x09\x73\x73\x73\x96\x40\xb8\
-\x94\x91\x69\xa0\x8f\x04\x00\x00\x00\x08\x88\x38\x12\x00\x00\x00\
-\x80\x4c\x50\x95\x11\x2e\x65\x64\x7a\xe8\x23\x01\x00\x00\x00\x42\
-\x21\x8e\x04\x00\x00\x00\x20\x7e\x49\x92\x58\x02\xe1\x7e\x7b\x95\
-\x91\xa9\xa2\x8f\x04\x00\x00\x00\x08\x82\x38\x12\x00\x00\x00\x80\
-\xf8\x95\xcb\x65\x4b\x20\x44\xca\xc8\x74\xea\x2f\x14\x8e\x1c\x39\
-\x6c\x0f\x00\x00\x00\x00\x69\x26\x8e\x04\x00\x00\x00\x20\x7e\xc9\
-\xfc\xbc\x25\x10\xde\xf7\x56\x19\x99\x62\xfb\xf6\x3d\x74\x74\x64\
-\xc4\x1e\x00\x00\x00\x00\x52\x4b\x1c\x09\x00\x00\x00\x40\xfc\xce\
-\x9c\x3d\x63\x09\x04\xe7\xd0\xb3\xcf\x2a\x23\xd3\x6c\xd7\xee\xdd\
-\x9e\x4a\x0b\x00\x00\x00\x90\x5a\xe2\x48\x00\x00\x00\x00\xe2\x77\
-\xe9\xd2\x25\x4b\x20\x2c\xcf\x3d\x37\xd8\x5f\x28\xd8\x43\xca\xdd\
-\x7f\x7f\x77\xb5\x5a\xb5\x07\x00\x00\x00\x80\x14\x12\x47\x02\x00\
-\x00\x00\x10\xbf\xa9\xf7\xa6\x2c\x81\x80\x1c\x1d\x19\x39\x70\xe0\
-\xa0\x3d\xa4\x5f\xa5\x32\xfd\x9f\xff\xe2\x2f\x92\x24\xb1\x0a\x00\
-\x00\x00\x80\xb4\x11\x47\x02\x00\x00\x00\x10\xbf\xb9\xb9\x39\x4b\
-\x20\x14\xe5\x72\x79\xd7\xee\xdd\xf6\x10\x8a\xe1\x52\xe9\xd0\xb3\
-\xcf\xda\x03\x00\x00\x00\x40\xda\x88\x23\x01\x00\x00\x00\x88\xdf\
-\x70\xa9\x64\x09\x04\x21\x49\x92\xfb\xef\xef\xb6\x87\xb0\xf4\x17\
-\x0a\x47\x8e\x1c\xb6\x07\x00\x00\x00\x80\x54\x11\x47\x02\x00\x00\
-\x00\x10\x39\x6f\xbc\x25\x20\x3f\xfc\xc1\x0f\x2a\x95\x69\x7b\x08\
-\xce\xbe\x7d\x0f\x95\xcb\x65\x7b\x00\x00\x00\x00\x48\x0f\x71\x24\
-\x00\x00\x00\x00\x91\x53\x2c\x11\x8a\x62\x71\x68\xa8\x58\xb4\x87\
-\x40\xfd\xd7\xc7\x1e\x93\x62\x03\x00\x00\x00\xa4\x87\x38\x12\x00\
-\x00\x00\x80\xc8\x25\xf3\xf3\x96\x40\xfa\x4d\x4e\x4e\xf6\xf5\xed\
-\xb7\x87\x70\x0d\x97\x4a\x2f\xbc\xf0\xbc\x3d\x00\x00\x00\x00\xa4\
-\x84\x38\x12\x00\x00\x00\x80\xc8\x9d\x39\x7b\xc6\x12\x48\xb9\x24\
-\x49\xbe\xf5\xad\x3f\xb1\x87\xd0\x1d\x38\x70\x70\x72\x72\xd2\x1e\
-\x00\x00\x00\x00\xd2\x40\x1c\x09\x00\x00\x00\x40\xe4\x2e\x5d\xba\
-\x64\x09\xa4\x5c\xff\x13\x4f\x54\x2a\xd3\xf6\x10\x81\x6f\x7d\xeb\
-\x4f\xbc\x5c\x1b\x00\x00\x00\x20\x0d\xc4\x91\x00\x00\x00\x00\x44\
-\x6e\xea\xbd\x29\x4b\x20\xcd\x8e\x8e\x8c\x1c\x1a\x1c\xb4\x87\x38\
-\x54\x2a\xd3\x87\x9e\x7d\xd6\x1e\x00\x00\x00\x00\x9a\x4e\x1c\x09\
-\x00\x00\x00\x40\xe4\xe6\xe6\xe6\x2c\x81\xd4\xaa\x56\xab\x8f\x7c\
-\xff\x11\x7b\x88\x49\x7f\xa1\xe0\xe5\xda\x00\x00\x00\x00\x4d\x27\
-\x8e\x04\x00\x00\x00\x20\x72\xc3\xa5\x92\x25\x90\x5a\xcf\x3c\xfd\
-\xb4\x17\x6a\xc7\xe7\xc0\x81\x1f\x5a\x02\x00\x00\x00\x40\x73\x89\
-\x23\x01\x00\x00\x00\x88\x59\x92\x24\x96\x40\x6a\x9d\x18\x1f\xf7\
-\x42\xed\x28\x8d\x8e\x8e\x15\x8b\x43\xf6\x00\x00\x00\x00\xd0\x44\
-\xe2\x48\x00\x00\x00\x00\x62\x56\x2e\x97\x2d\x81\x74\x4a\x92\xe4\
-\x3b\x7f\xf6\x1d\x7b\x88\xd5\x53\x4f\x3d\x55\xad\x56\xed\x01\x00\
-\x00\x00\xa0\x59\xc4\x91\x00\x00\x00\x00\xc4\x2c\x99\x9f\xb7\x04\
-\xd2\xe9\x85\x17\x9e\xf7\x42\xed\x88\x2d\x1c\xee\x33\x4f\x3f\x6d\
-\x0f\x00\x00\x00\x00\xcd\x22\x8e\x04\x00\x00\x00\x20\x66\x67\xce\
-\x9e\xb1\x04\x52\xa8\x5c\x2e\x1f\x38\x70\xd0\x1e\xe2\x76\x68\x70\
-\x70\x72\x72\xd2\x1e\x00\x00\x00\x00\x9a\x42\x1c\x09\x00\x00\x00\
-\x40\xcc\x2e\x5d\xba\x64\x09\xa4\xd0\x5f\xff\xf8\xc7\x96\x90\x05\
-\x7f\xfb\x93\x9f\x58\x02\x00\x00\x00\x40\x53\xdc\x6c\x05\x00\x00\
-\x00\x00\x44\x6c\xea\xbd\x29\x4b\x20\x6d\x4e\x8c\x8f\x0f\x15\x8b\
-\x71\x5f\xe3\x9e\x9e\x9e\xce\x7b\x3b\x57\xae\x5c\xb9\x61\xc3\xc6\
-\x5c\x2e\x97\xcf\xe7\x6b\xff\x3c\x49\x92\x72\xb9\xbc\xf0\xc3\xc4\
-\xc4\xdb\xa7\xa7\x4e\xbf\x7b\xea\xdd\xd1\xd1\xb1\x88\xf7\xb0\x70\
-\xd0\x7b\xf7\xee\x7d\x60\xd7\x2e\x5f\x7b\x00\x00\x00\x80\x06\x13\
-\x47\x02\x00\x00\x00\x10\xb3\xb9\xb9\x39\x4b\x20\x6d\x1e\x7f\xe2\
-\xf1\x58\x2f\x6d\x4f\x4f\xcf\x43\x7f\xfa\xd0\x37\xbe\x71\x5f\x6b\
-\x6b\xeb\x55\xff\x83\x5c\x2e\xd7\xd1\xd1\xb1\xf0\x43\xed\xef\x37\
-\xfd\xfe\x0d\xe3\xaf\xbf\xfe\xda\x82\x58\x2b\xc9\xa7\x9f\x79\x5a\
-\x1c\x09\x00\x00\x00\xd0\x78\x5e\xab\x0d\x00\x00\x00\x40\xcc\x86\
-\x4b\x25\x4b\x20\x55\x8e\x1c\x39\x1c\x65\x05\x38\x50\x28\x9c\x3a\
-\x75\xea\xef\x87\x87\xf7\xee\xdd\xf7\x45\x65\xe4\x55\xe5\xf3\xf9\
-\x1f\xfe\xf0\xc0\xf1\xe3\xa3\xe3\x6f\xbc\xd1\xd7\xdb\x1b\xdf\x66\
-\x16\x8e\xfb\xe8\xc8\x88\x6f\x3e\x00\x00\x00\x40\x83\x89\x23\x01\
-\x00\x00\x00\x88\x56\x92\x24\x96\x40\xda\xbe\x93\x8f\x3d\xf6\x58\
-\x64\x17\xd5\xd7\xdb\x7b\xea\xd4\xa9\x27\xfa\xfb\x2f\x3f\x0c\x72\
-\x71\xb6\x77\x76\xbe\x30\x34\x34\xfe\xc6\x1b\x5d\x5d\x3b\x22\x5b\
-\xd1\xd3\xcf\x3c\xed\xcb\x0f\x00\x00\x00\xd0\x60\xe2\x48\x00\x00\
-\x00\x00\xa2\x55\x2e\x97\x2d\x81\x54\x39\x7c\xf8\xd5\x4a\x65\x3a\
-\xb2\x2b\x7a\x61\x68\x68\x89\x59\xe4\x95\xb6\x77\x76\xbe\xf6\xda\
-\xeb\x83\x83\x87\x62\xda\x92\x87\x47\x02\x00\x00\x00\x34\x9e\x38\
-\x12\x00\x00\x00\x80\x68\x25\xf3\xf3\x96\x40\x8a\xbe\x90\x49\xf2\
-\xd4\x53\x4f\x45\x73\x39\x5d\x5d\x3b\x3e\xf8\xe0\x83\xbd\x7b\xf7\
-\xd5\xfd\x4f\xce\xe5\x72\x3f\xfc\xe1\x81\xf1\x37\xde\x68\x6f\x5f\
-\x13\xcd\xba\x3c\x3c\x12\x00\x00\x00\xa0\xc1\xc4\x91\x00\x00\x00\
-\x00\x44\xeb\xcc\xd9\x33\x96\x40\x7a\xc4\xf4\xd8\xc8\x3d\x3d\x3d\
-\xaf\xbd\xf6\x7a\x3e\x9f\x5f\xbe\x8f\xd8\xde\xd9\xf9\xab\x5f\x1d\
-\x5b\xf8\xa0\x38\x36\xe6\xe1\x91\x00\x00\x00\x00\x0d\x26\x8e\x04\
-\x00\x00\x00\x20\x5a\xe7\x3e\x3e\x67\x09\xa4\x44\x4c\x8f\x8d\x1c\
-\x28\x14\xfe\x7e\x78\x38\x97\xcb\x2d\xf7\x07\xe5\xf3\xf9\x97\x5e\
-\x7e\x39\x9a\x3e\xd2\xc3\x23\x01\x00\x00\x00\x1a\xe9\x66\x2b\x00\
-\x00\x00\x00\x20\x56\x33\x33\x33\xe9\x1c\xec\xf0\xe1\x57\x37\x6c\
-\xd8\xe8\x80\x16\x61\x59\x1f\x55\xb8\xdc\x87\x1e\xc7\x63\x23\x07\
-\x0a\x85\x27\xfa\xfb\x1b\xf6\x71\xb9\x5c\xee\xa5\x97\x5f\x5e\xf8\
-\x61\xb8\x54\x0a\x7d\x75\xa3\xa3\x63\x93\x93\x93\x1d\x1d\x1d\x6e\
-\x64\x00\x00\x00\x80\x06\x10\x47\x02\x00\x00\x00\x10\xad\x0f\x3f\
-\xfa\x30\x9d\x83\x7d\xe3\x1b\xf7\xb5\xb6\xb6\x3a\xa0\x4c\x89\xe3\
-\xb1\x91\x7b\x7a\x7a\x1a\x59\x46\xd6\xd4\xfa\xc8\x89\x77\x26\x22\
-\xa8\x4b\xff\xf6\x27\x3f\x79\x61\x68\xc8\xed\x00\x00\x00\x00\xd0\
-\x00\x5e\xab\x0d\x00\x00\x00\x40\xb4\x46\x47\xc7\xd2\x39\x98\x32\
-\x32\x6b\x8e\x8e\x8c\x44\x10\xf6\xed\xe9\xe9\xa9\x3d\xc4\xb1\xf1\
-\x72\xb9\xdc\xaf\x7e\x75\xac\xbd\x7d\x4d\xe8\x3b\x1c\x2a\x16\xab\
-\xd5\xaa\x3b\x02\x00\x00\x00\xa0\x01\xc4\x91\x00\x00\x00\x00\xc4\
-\x29\xb5\x05\xd2\x9e\x9e\x1e\xa7\x93\x35\x4f\x3f\xf3\x74\xe8\x97\
-\xd0\xde\xbe\xe6\xe9\x67\x9e\xc9\xe5\x72\xcd\x1a\x20\x9f\xcf\xff\
-\xf4\x7f\xfc\x34\x82\x2f\xc3\xff\xfc\xe9\x4f\xdd\x11\x00\x00\x00\
-\x00\x0d\x20\x8e\x04\x00\x00\x00\x20\x4e\xb3\xb3\xb3\xe9\x1c\x6c\
-\xc5\x8a\x15\x4e\x27\x53\x4e\x8c\x8f\xa7\xf6\x21\xa6\xd7\xef\x95\
-\xff\xf5\x4a\x3e\x9f\x6f\xee\x0c\x0f\xec\xda\x35\x38\x78\x28\xf4\
-\x4d\xbe\xf8\xd2\x8b\x49\x92\xb8\x2f\x00\x00\x00\x00\x96\x9b\x38\
-\x12\x00\x00\x00\x80\x38\xcd\x5e\xb8\x90\xce\xc1\xb6\x6d\xdf\xe6\
-\x74\x32\xe5\xc5\x17\x5f\x0c\xfd\x12\x06\x0a\x85\xed\x9d\x9d\x69\
-\x98\x64\xff\xfe\x3f\xef\xea\xda\x11\xf4\x32\x2b\x95\xe9\x13\xe3\
-\xe3\xee\x0b\x00\x00\x00\x80\xe5\x26\x8e\x04\x00\x00\x00\x20\x4e\
-\xe7\x3f\x39\x9f\xce\xc1\x5a\x5a\x5a\x9c\x4e\x76\x54\xab\xd5\xa1\
-\x62\x31\xe8\x4b\xe8\xea\xda\x71\xf0\xd1\x47\x53\x32\x4c\x2e\x97\
-\x1b\x1c\x7c\x2e\xf4\x6f\xc5\xf3\xcf\x3f\xef\xd6\x00\x00\x00\x00\
-\x58\x6e\xe2\x48\x00\x00\x00\x00\xe2\x74\xee\xe3\x73\xe9\x1c\x6c\
-\xc3\x86\x8d\x4e\x27\x3b\xfe\xee\xef\xfe\x4f\xe8\x97\xf0\xd4\x93\
-\x4f\xe5\x72\xb9\xf4\xcc\xd3\xd1\xd1\x31\x50\x28\x04\xbd\xd2\xe1\
-\x52\xa9\x5c\x2e\xbb\x3b\x00\x00\x00\x00\x96\x95\x38\x12\x00\x00\
-\x00\x80\x38\xcd\xcc\xcc\xa4\x73\xb0\xb6\xb6\x36\xa7\x93\x1d\x7f\
-\xf3\x37\x7f\x13\xf4\xfc\x7d\xbd\xbd\x29\x79\xa1\xf6\x95\x0e\x3e\
-\xfa\x68\x7b\xfb\x9a\xa0\x17\xfb\xfa\xeb\xaf\xb9\x3b\x00\x00\x00\
-\x00\x96\x95\x38\x12\x00\x00\x00\x80\x38\x7d\xf8\xd1\x87\xe9\x1c\
-\xac\xb5\xb5\xd5\xe9\x64\xc4\xd1\x91\x91\x4a\x65\x3a\xe8\x4b\xf8\
-\xef\x3f\xfe\x71\x0a\xa7\xca\xe5\x72\x8f\x3f\xfe\x78\xd0\x8b\x0d\
-\xbd\x9a\x05\x00\x00\x00\x48\x3f\x71\x24\x00\x00\x00\x00\x71\x1a\
-\x1d\x1d\x4b\xe1\x54\x5d\x5d\x3b\x1c\x4d\x76\x1c\x39\x72\x24\xe8\
-\xf9\x07\x07\x0f\xa5\xb6\xe5\xdd\xb7\xef\xa1\xa0\x1f\x1e\x59\xa9\
-\x4c\x9f\x18\x1f\x77\x8f\x00\x00\x00\x00\x2c\x1f\x71\x24\x00\x00\
-\x00\x00\x11\xaa\x56\xab\xe9\x1c\x6c\xdd\xda\x75\x4e\x27\x3b\x5f\
-\xc2\xa1\x62\x31\xdc\xf9\xdb\xdb\xd7\xec\xdf\xff\xe7\xa9\x1d\x2f\
-\x82\x87\x47\x1e\x3b\x76\xcc\x6d\x02\x00\x00\x00\xb0\x7c\xc4\x91\
-\x00\x00\x00\x00\x44\x68\x76\x76\x36\x9d\x83\x6d\xda\xbc\xc9\xe9\
-\x64\xc4\xcf\x7f\xfe\x0f\x41\xcf\xff\xf8\xe3\x8f\xe7\x72\xb9\x34\
-\x4f\x18\xfa\xc3\x23\x5f\x7c\xe9\x45\xb7\x09\x00\x00\x00\xc0\xf2\
-\x11\x47\x02\x00\x00\x00\x10\xa1\xd9\x0b\x17\xd2\x39\xd8\x2d\xb7\
-\xdc\xe2\x74\x32\xe2\x95\x57\x5e\x09\x7a\xfe\x7d\xfb\x1e\x4a\xf9\
-\x84\xa1\x3f\x3c\xb2\x52\x99\x3e\x3a\x32\xe2\x4e\x01\x00\x00\x00\
-\x58\x26\xe2\x48\x00\x00\x00\x00\x22\x74\xfe\x93\xf3\xe9\x1c\x6c\
-\xeb\xd6\xbb\x9c\x4e\x16\x94\xcb\xe5\xd1\xd1\xb1\x70\xe7\x1f\x28\
-\x14\x52\xfe\xd8\xc8\x9a\xf4\x17\x9c\xd7\xf6\xcb\x5f\xfe\xd2\xcd\
-\x02\x00\x00\x00\xb0\x4c\xc4\x91\x00\x00\x00\x00\x44\xe8\xdc\xc7\
-\xe7\xd2\x39\x58\x10\xc1\x19\x4b\xf7\xfa\xeb\xaf\x05\x3d\xff\xf7\
-\x1e\x79\x24\x88\x39\x17\x6e\xa8\x81\x42\x21\xdc\x3d\x97\x7e\x56\
-\x72\xb3\x00\x00\x00\x00\x2c\x13\x71\x24\x00\x00\x00\x00\x11\x9a\
-\x99\x99\x49\xe7\x60\xf9\x7c\xde\xe9\x64\xc1\x6b\xaf\x05\x1c\x47\
-\xf6\xf5\xf6\xb6\xb6\xb6\x86\x32\xed\x9f\x7c\xeb\x5b\xe1\xae\xba\
-\x52\x99\x3e\x31\x3e\xee\x7e\x01\x00\x00\x00\x58\x0e\xe2\x48\x00\
-\x00\x00\x00\x22\xf4\xe1\x47\x1f\xa6\x70\xaa\xae\xae\x1d\x8e\x26\
-\x0b\x42\x7f\xa7\xf6\xde\xbd\x7b\x03\x9a\xb6\xa3\xa3\x23\xe8\x3b\
-\xeb\xd8\xb1\x63\x6e\x19\x00\x00\x00\x80\xe5\x20\x8e\x04\x00\x00\
-\x00\x20\x42\xe9\x4c\xd3\xd6\xad\x5d\xe7\x68\xb2\x20\xe8\x77\x6a\
-\xb7\xb7\xaf\x79\x60\xd7\xae\xb0\x66\xfe\xfe\xf7\xbf\x1f\xee\xc2\
-\x5f\x7c\xe9\x45\xb7\x0c\x00\x00\x00\xc0\x72\x10\x47\x02\x00\x00\
-\x00\x10\x9b\x6a\xb5\x9a\xce\xc1\x56\xaf\x5e\xed\x74\xb2\x20\xe8\
-\x77\x6a\xff\xe0\x07\x3f\x08\x6e\xe6\x6f\x7c\xe3\xbe\x70\x17\x5e\
-\xa9\x4c\x97\xcb\x65\x77\x0d\x00\x00\x00\x40\xdd\x89\x23\x01\x00\
-\x00\x00\x88\xcd\xec\xec\x6c\x3a\x07\x5b\x75\xfb\x2a\xa7\x13\xbd\
-\xd0\xdf\xa9\xfd\xcd\x6f\x3e\x18\xdc\xcc\xad\xad\xad\x7b\x7a\x7a\
-\xc2\xdd\xf9\xaf\x7f\x3d\xe6\xc6\x01\x00\x00\x00\xa8\x3b\x71\x24\
-\x00\x00\x00\x00\xb1\x99\xbd\x70\x21\x9d\x83\x6d\xdc\xb0\xd1\xe9\
-\x44\xef\x9d\x77\x26\xc2\x1d\xbe\xab\x6b\x47\x3e\x9f\x0f\x71\xf2\
-\x87\xfe\xf4\xa1\x70\xd7\xfe\x8f\x3f\xff\x47\x37\x0e\x00\x00\x00\
-\x40\xdd\x89\x23\x01\x00\x00\x00\x88\xcd\xf9\x4f\xce\xa7\x73\xb0\
-\x5c\x4b\x8b\xd3\x89\xde\xab\xff\xf7\xd5\x70\x87\x7f\xf0\xc1\x07\
-\x03\x9d\x3c\xe8\x37\x6b\x0f\x97\x4a\x49\x92\xb8\x77\x00\x00\x00\
-\x00\xea\x4b\x1c\x09\x00\x00\x00\x40\x6c\xce\x7d\x7c\x2e\x9d\x83\
-\x75\x74\x74\x38\x9d\xb8\x25\x49\x32\x5c\x2a\x85\x3b\x7f\x88\xef\
-\xd4\xae\x09\xfd\xcd\xda\x93\xa7\x4e\xb9\x7d\x00\x00\x00\x00\xea\
-\x4b\x1c\x09\x00\x00\x00\x40\x6c\x66\x66\x66\x52\x38\x55\x7b\xfb\
-\x1a\x47\x13\xbd\x13\xe3\xe3\xe1\x0e\x1f\xee\x3b\xb5\x6b\x3a\xef\
-\xed\x0c\x77\xf8\x63\xc7\x8e\xb9\x7d\x00\x00\x00\x00\xea\x4b\x1c\
-\x09\x00\x00\x00\x40\x6c\x3e\xfc\xe8\xc3\x14\x4e\xd5\xbd\xb3\xdb\
-\xd1\x44\xef\xad\xb7\xde\x0a\x77\xf8\x70\xdf\xa9\x5d\xd3\xd5\xb5\
-\x33\xdc\xe1\xc7\x7e\x3d\xe6\xf6\x01\x00\x00\x00\xa8\x2f\x71\x24\
-\x00\x00\x00\x00\xb1\x19\x1d\x1d\x4b\xe1\x54\xab\x57\xaf\x76\x34\
-\xd1\x0b\x3a\x71\xfb\xfa\x5d\x5f\x0f\x7a\xf9\x1d\x1d\x1d\xe1\x3e\
-\x9f\x75\xe1\xb7\x56\xb5\x5a\x75\x07\x01\x00\x00\x00\xd4\x91\x38\
-\x12\x00\x00\x00\x80\xa8\xa4\x36\x30\x5a\x75\xfb\x2a\xa7\x13\xb7\
-\x72\xb9\x9c\xce\x30\xf7\x3a\x6d\xef\xec\x0c\xfd\x08\x7a\xfe\x53\
-\x4f\xb8\xc3\x9f\x7a\xf7\x5d\x37\x11\x00\x00\x00\x40\x1d\x89\x23\
-\x01\x00\x00\x00\x88\xca\xec\xec\x6c\x3a\x07\xdb\xb8\x61\xa3\xd3\
-\x89\xdb\x3b\xef\x4c\x84\x3b\x7c\x5f\x6f\x6f\x04\x47\x70\xcf\x7f\
-\xb8\x27\xdc\xe1\xff\xf9\xff\xfd\xb3\x9b\x08\x00\x00\x00\xa0\x8e\
-\xc4\x91\x00\x00\x00\x00\x44\xe5\xec\xd9\x33\xe9\x1c\x2c\xd7\xd2\
-\xe2\x74\xe2\xf6\xe6\x6f\xde\x0c\x77\xf8\x6d\xdb\xb7\x45\x70\x04\
-\x5f\xfb\xda\xd6\x70\x87\x1f\x7f\x63\xdc\x4d\x04\x00\x00\x00\x50\
-\x47\xe2\x48\x00\x00\x00\x00\xa2\x32\x3f\x3f\x9f\xce\xc1\xf2\xf9\
-\xbc\xd3\x89\x5b\xe9\x67\xa5\x70\x87\xdf\xba\xf5\xae\x08\x8e\x20\
-\xe8\xbb\x6c\xb8\x54\x4a\x92\xc4\x7d\x04\x00\x00\x00\x50\x2f\xe2\
-\x48\x00\x00\x00\x00\xa2\x72\x7a\xea\x74\x3a\x07\xcb\xe5\x72\x4e\
-\x27\x62\xe5\x72\xb9\x52\x99\x0e\x77\xfe\x8e\x8e\x8e\x38\x0e\x22\
-\xe8\xf7\x83\x2f\x7c\x8b\xdc\x4a\x00\x00\x00\x00\xf5\x22\x8e\x04\
-\x00\x00\x00\x20\x2a\x17\x2f\x5e\x4c\xe1\x54\x41\x07\x5b\x5c\x8f\
-\x0f\xde\x7f\x3f\xdc\xe1\x63\xfa\x7e\x06\xfd\x7e\xf0\x89\x89\xb7\
-\xdd\x4a\x00\x00\x00\x00\xf5\x22\x8e\x04\x00\x00\x00\x20\x2a\xc7\
-\x8e\x1f\x4b\xe1\x54\xb7\xde\x7a\xab\xa3\x89\xdb\x5b\x6f\xbd\x15\
-\xee\xf0\x41\x07\x85\x9f\xb1\x71\xc3\xc6\x70\x87\x4f\xed\x83\x6f\
-\x01\x00\x00\x00\x42\x24\x8e\x04\x00\x00\x00\x20\x2a\xe9\x7c\xb5\
-\xf1\x9d\x9b\xee\x74\x34\x71\xfb\xed\x6f\x7f\x1b\xee\xf0\x41\x07\
-\x85\x9f\xb1\xfe\x8e\x3b\xc2\x1d\xbe\xf4\xb3\x92\x5b\x09\x00\x00\
-\x00\xa0\x5e\xc4\x91\x00\x00\x00\x00\xc4\xa3\x5c\x2e\xa7\x73\xb0\
-\x95\x5f\x59\xe9\x74\x22\x96\x24\xc9\x70\x29\xe0\xac\xad\x63\xcb\
-\x96\x68\xce\xa2\xb5\xb5\xb5\xbd\x7d\x4d\xa0\xc3\x57\x2a\xd3\xd5\
-\x6a\xd5\x0d\x05\x00\x00\x00\x50\x17\xe2\x48\x00\x00\x00\x00\xe2\
-\x91\x24\x49\x3a\x07\x6b\xbb\xed\x36\xa7\x13\xb1\xd4\x56\xb9\xd7\
-\xa3\xab\x6b\x47\x2e\x97\x8b\xe9\x38\xba\x77\x76\x87\x3b\xfc\xec\
-\xec\xac\x1b\x0a\x00\x00\x00\xa0\x2e\xc4\x91\x00\x00\x00\x00\xc4\
-\xe3\xec\xd9\x33\xe9\x1c\x2c\x9f\xcf\x3b\x9d\x88\x4d\x4c\xbc\x1d\
-\xee\xf0\xeb\xd6\xae\x8b\xec\x38\xb6\x6d\xdf\xe6\xbb\x04\x00\x00\
-\x00\x80\x38\x12\x00\x00\x00\x80\x78\xcc\xcf\xcf\xa7\x73\xb0\xc8\
-\x9e\xcc\xc7\x67\x9c\x9e\x3a\x1d\xee\xf0\x41\xa7\x84\x57\x15\xf4\
-\x5b\xec\x83\xfe\x2e\x01\x00\x00\x00\xa4\x8a\x38\x12\x00\x00\x00\
-\x80\x78\xa4\xb3\x2b\xea\xeb\xed\x75\x34\x71\x7b\xf7\xd4\xbb\xe1\
-\x0e\xbf\x71\xc3\xc6\xc8\x8e\x63\xfd\x1d\x77\x84\x3b\xfc\xf4\xf4\
-\xb4\x1b\x0a\x00\x00\x00\xa0\x2e\xc4\x91\x00\x00\x00\x00\xc4\xe3\
-\xe2\xc5\x8b\x96\x40\x83\x25\x49\x32\x3a\x3a\x16\xee\xfc\x6d\xb7\
-\xdd\x16\xd9\x89\x04\xfd\x16\xfb\xe1\x52\xc9\x3d\x05\x00\x00\x00\
-\x50\x17\x37\x5b\x01\x00\x00\x00\x00\xd1\x38\x76\xfc\x58\x0a\xa7\
-\x5a\xbd\x7a\x75\xb1\x38\x74\xd3\xef\x1f\x6c\x59\xcb\x37\x3f\xfc\
-\xe8\xc3\x45\xe7\x74\x5d\x5d\x3b\xd6\xad\x5d\x77\xf9\x4f\x5e\x75\
-\xfb\xaa\x9b\x7e\xff\x1e\xe1\xb6\xdb\x6e\xcb\xe5\x72\x41\x67\x61\
-\x81\x2a\x97\xcb\x41\xcf\x1f\xe5\x77\x66\xe1\x36\x09\xb7\x58\x9d\
-\x9c\x9c\xec\xe8\xe8\x70\x67\x01\x00\x00\x00\x2c\x91\x38\x12\x00\
-\x00\x00\x80\x78\x54\x2a\x69\x7c\x23\x6d\x7f\xa1\x50\xc7\x3f\x6d\
-\x74\x74\xec\x4b\xab\xaf\xda\x8b\xbc\xb7\x6d\xdf\xd6\xd2\xd2\xb2\
-\x61\xc3\xc6\x7c\x3e\x9f\xcb\xe5\x7c\x3d\x96\xc9\xd9\xb3\x67\xc2\
-\x1d\x7e\x4f\x4f\x4f\x94\x87\xb2\x6e\xed\xba\x70\xe3\xc8\x64\x7e\
-\xde\x6d\x05\x00\x00\x00\xb0\x74\xe2\x48\x00\x00\x00\x00\x22\x11\
-\xfa\x03\xfc\xea\x68\xa8\x58\xbc\xfc\xf7\x9a\xf6\xf6\x35\xdd\x3b\
-\xbb\x37\x6d\xde\xf4\xd5\x3f\xfc\xea\xfa\x3b\xee\xf0\x80\xc9\x3a\
-\x3a\x7f\xfe\x7c\xb8\xc3\xaf\x59\xb3\x26\xca\x43\xd9\xb6\x7d\xdb\
-\x95\xdf\xff\xb0\x9c\x39\x7b\x66\x7b\x67\xa7\x3b\x0b\x00\x00\x00\
-\x60\x89\xc4\x91\x00\x00\x00\x00\x44\x22\x49\x12\x4b\xf8\x22\x95\
-\xca\xf4\x67\x5a\xb1\xbe\xde\xde\x4d\x9b\x37\x7d\xfd\xae\xaf\xaf\
-\xbf\xe3\x8e\xd6\xd6\x56\x2b\x5a\xb4\xa9\xf7\xa6\xc2\x1d\xfe\xce\
-\x4d\x77\x3a\xc1\xb4\x39\x3d\x75\xda\x12\x00\x00\x00\x00\x96\x4e\
-\x1c\x09\x00\x00\x00\x40\x24\x82\x7e\xbb\x71\xe3\x5d\xd9\x4a\x76\
-\x75\xed\xd8\x71\xdf\x8e\xbb\xef\xbe\x7b\x7b\x67\xa7\x17\x70\xdf\
-\xa8\x63\xc7\x8f\x85\x3b\xfc\xca\xaf\xac\x8c\xf2\x50\xb6\x6e\xbd\
-\x2b\xdc\xe1\x2f\x5e\xbc\xe8\xb6\x02\x00\x00\x00\x58\x3a\x71\x24\
-\x00\x00\x00\x00\x91\x98\x9f\x9f\xb7\x84\xc5\x19\x1d\x1d\x5b\xf8\
-\xab\xf6\xf3\x9e\x9e\x9e\x3f\xfe\x8f\x7f\x7c\xdf\x7d\x3b\xbc\x7a\
-\xfb\x7a\x24\x49\x52\xa9\x4c\x87\x3b\x7f\xdb\x6d\xb7\x45\x79\x2e\
-\x41\x37\xbe\x43\xc5\xe2\x0b\x43\x43\x6e\x2e\x00\x00\x00\x80\x25\
-\x12\x47\x02\x00\x00\x00\x10\x09\xef\xa2\xad\x8b\xe1\x52\x69\xe1\
-\xaf\x9b\xfe\xf5\x71\x92\xdd\xdd\xdd\xdb\x3b\x3b\xad\xe5\x8b\x94\
-\xcb\xe5\xa0\xe7\x8f\x35\x81\x0d\xfd\xba\x92\x24\xf1\x0c\x57\x00\
-\x00\x00\x80\x25\xfa\x03\x2b\x00\x00\x00\x00\x20\x0e\xde\x45\x5b\
-\x5f\xa3\xa3\x63\xfd\x85\x42\xe7\xbd\xf7\xae\x5d\xdb\xfe\xe4\xc0\
-\x40\xe8\x15\xe0\x32\x99\xbd\x70\x21\xe8\xf9\x23\x2e\xf0\xda\xdb\
-\xd7\x84\x3b\xbc\xdb\x0d\x00\x00\x00\x60\xe9\xc4\x91\x00\x00\x00\
-\x00\x44\xe2\xd8\xf1\x63\x96\xb0\x1c\x2a\x95\xe9\xfe\x42\x61\xfd\
-\xfa\xf5\x3b\x77\x76\x15\x8b\x43\xd5\x6a\xd5\x4e\x2e\x3b\xff\xc9\
-\xf9\x70\x87\xdf\xd3\xd3\x13\xf1\xd1\x74\xef\xec\x0e\x77\xf8\xd0\
-\xa3\x5b\x00\x00\x00\x80\x34\x10\x47\x02\x00\x00\x00\x10\x89\x4a\
-\x65\xda\x12\x96\xd5\xe8\xe8\x58\x5f\xdf\xfe\xb6\xb6\xb6\x47\x0f\
-\x1e\x9c\x9c\x9c\xb4\x90\x9b\x02\x7f\x99\xfb\x8a\x15\x2b\x9c\x60\
-\x3a\x05\x1d\xdd\x02\x00\x00\x00\xa4\x84\x38\x12\x00\x00\x00\x80\
-\x18\x78\x0b\x6d\x23\x1d\x1a\x1c\xdc\xb2\x65\xcb\xce\x9d\x5d\x47\
-\x47\x46\x92\x24\xc9\xf2\x2a\x82\x7e\x99\xfb\xea\xd5\xab\x23\x3e\
-\x9a\x4d\x9b\x37\x85\x3b\xfc\xa5\x4b\x97\xfc\x9e\x01\x00\x00\x00\
-\x58\x22\x71\x24\x00\x00\x00\x00\x31\xc8\x78\xa2\xd7\x14\xa3\xa3\
-\x63\xbb\x76\xef\xde\xbc\x79\x53\xb1\x38\x94\xd9\xfd\x0f\x15\x8b\
-\xe1\x0e\xbf\xea\xf6\x55\x11\x1f\xcd\x2d\xb7\xdc\x12\xee\xf0\x53\
-\xef\x4d\xf9\x0d\x03\x00\x00\x00\xb0\x44\xe2\x48\x00\x00\x00\x00\
-\x62\x70\xf6\xec\x19\x4b\x68\x8a\x4a\x65\xba\xaf\x6f\x7f\xc6\x13\
-\xc9\x40\xb5\xb4\xb4\xb8\xba\x74\x9a\x9b\x9b\xf3\xfd\x04\x00\x00\
-\x00\x58\x22\x71\x24\x00\x00\x00\x00\x31\x98\x9f\x9f\xb7\x84\x26\
-\xca\x66\x22\x39\x39\x39\x19\xf4\xfc\x1b\x36\x6c\x8c\xf8\x74\x82\
-\xbe\xba\xe1\x52\xc9\x6f\x15\x00\x00\x00\x80\x25\x12\x47\x02\x00\
-\x00\x00\x10\x83\xd3\x53\xa7\x2d\xa1\xe9\x2e\x27\x92\x47\x47\x46\
-\x6c\x03\x00\x00\x00\x00\x68\x22\x71\x24\x00\x00\x00\x00\x31\xb8\
-\x78\xf1\xa2\x25\xa4\x44\xa5\x32\xbd\x6b\xf7\xee\x6f\xef\xd9\x13\
-\xfa\x83\x15\xbf\x54\xe8\x2f\x73\x6f\x6b\x6b\x8b\xf8\x74\x42\xbf\
-\xba\x72\xb9\xec\x97\x09\x00\x00\x00\xc0\x52\x88\x23\x01\x00\x00\
-\x00\x88\xc1\xb1\xe3\xc7\x2c\x21\x55\x86\x4b\xa5\x2d\x5b\xb6\x3c\
-\x39\x30\x10\xf1\x5b\xb6\x43\x7f\x99\x7b\x6b\x6b\x6b\xc4\xdf\xc0\
-\xd0\xaf\x2e\x3b\xaf\xa7\x07\x00\x00\x00\x58\x26\xe2\x48\x00\x00\
-\x00\x00\x62\x50\xa9\x4c\x5b\x42\x0a\xf5\x17\x0a\x9b\x37\x6f\x3a\
-\x31\x3e\x1e\xe5\xd5\x9d\xfb\xf8\x9c\x23\x06\x00\x00\x00\x80\x74\
-\x12\x47\x02\x00\x00\x00\x10\xbc\xe8\x5f\xdf\x1c\xb4\x4a\x65\xba\
-\xf3\xde\x7b\x1f\x3d\x78\x30\xbe\x27\xe1\xcd\xcc\xcc\x84\x3b\x7c\
-\x57\xd7\x8e\xe8\xbf\x7b\xed\xed\x6b\xc2\x1d\x7e\x62\xe2\x6d\xbf\
-\x3d\x00\x00\x00\x00\x96\x42\x1c\x09\x00\x00\x00\x00\x2c\xbb\x43\
-\x83\x83\x11\x3f\x42\x32\x44\xeb\xd6\xae\x8b\xfe\x1a\xbb\x77\x76\
-\x3b\x68\x00\x00\x00\x80\xcc\x12\x47\x02\x00\x00\x00\x10\x3c\x8f\
-\x58\x0b\x42\xed\x11\x92\xcf\x3d\x37\x18\xcd\x23\x24\x8f\x1d\x3f\
-\xe6\x58\x01\x00\x00\x00\x20\x9d\xc4\x91\x00\x00\x00\x00\x40\xe3\
-\x1c\x38\x70\xf0\xbb\x0f\x3f\x5c\x2e\x97\x23\xb8\x96\x4a\x65\xda\
-\x81\xb2\x4c\x4e\x9e\x38\x69\x09\x00\x00\x00\x00\x4b\x21\x8e\x04\
-\x00\x00\x00\x20\x78\x2a\xa2\xb0\x0c\x97\x4a\xf7\xdf\xdf\x7d\x74\
-\x64\xc4\x2a\x9a\x68\xd3\xe6\x4d\xd1\x5f\xe3\xad\xb7\xde\xea\xa0\
-\x01\x00\x00\x00\x32\x4b\x1c\x09\x00\x00\x00\x00\x34\x5a\xa5\x32\
-\xbd\x6b\xf7\xee\x27\x07\x06\xc2\xbd\x84\xd0\x1f\x7e\x79\xcb\x2d\
-\xb7\x44\xff\x35\xbb\x73\xd3\x9d\xee\x35\x00\x00\x00\x80\xcc\x12\
-\x47\x02\x00\x00\x00\x10\xbc\xa1\x62\xd1\x12\x42\xd4\x5f\x28\xec\
-\xef\xeb\x4b\x92\x24\xc4\xe1\x03\x1d\x9b\x50\xcc\xcd\xcd\x59\x02\
-\x00\x00\x00\xc0\x52\x88\x23\x01\x00\x00\x00\x80\xa6\x19\x2a\x16\
-\xbf\xfb\xf0\xc3\xd5\x6a\xd5\x2a\xe0\x4a\xc3\xa5\x92\x25\x00\x00\
-\x00\x00\x2c\x85\x38\x12\x00\x00\x00\x80\xb0\x4d\x4e\x4e\x5a\x42\
-\xd0\x86\x4b\xa5\x7b\xee\xb9\x3b\xb8\xb7\x54\x27\xf3\xf3\xce\x0e\
-\x00\x00\x00\x00\x52\x4b\x1c\x09\x00\x00\x00\x00\x34\x59\xa5\x32\
-\x7d\xff\xfd\xdd\x61\xf5\x91\x67\xce\x9e\x09\x7a\xe7\x5b\xb7\xde\
-\xe5\x8b\x07\x00\x00\x00\x40\xc4\xc4\x91\x00\x00\x00\x00\x84\x6d\
-\x62\xe2\x6d\x4b\x88\x40\x88\x7d\x24\x29\x27\x00\x05\x00\x00\x00\
-\xc8\x32\x71\x24\x00\x00\x00\x00\x90\x0a\xfa\x48\xb8\x52\x92\x24\
-\x96\x00\x00\x00\x00\xb0\x68\xe2\x48\x00\x00\x00\x00\xc2\x76\xf2\
-\xc4\x49\x4b\x88\x86\x3e\x12\x2e\x73\x23\x00\x00\x00\x00\x2c\x85\
-\x38\x12\x00\x00\x00\x00\x48\x91\x5a\x1f\x99\xfe\x67\xe6\x9d\xfb\
-\xf8\x9c\xc3\x02\x00\x00\x00\x80\xd4\x12\x47\x02\x00\x00\x00\x10\
-\xb6\xa1\x62\xd1\x12\x22\x53\xa9\x4c\x7f\xf7\xe1\x87\x53\xde\x47\
-\xce\xcc\xcc\x38\x29\x00\x00\x00\x00\x48\x2d\x71\x24\x00\x00\x00\
-\x00\x90\x3a\xc3\xa5\x52\xff\x13\x4f\xd8\x03\x00\x00\x00\x00\xb0\
-\x38\xe2\x48\x00\x00\x00\x00\x02\x36\x39\x39\x69\x09\xb1\x3a\x34\
-\x38\x58\x2c\x0e\xd9\x03\x00\x00\x00\x00\xb0\x08\xe2\x48\x00\x00\
-\x00\x00\x20\xa5\xfa\xfa\xf6\x9f\x18\x1f\xb7\x07\x00\x00\x00\x00\
-\xe0\x46\x89\x23\x01\x00\x00\x00\x08\xd8\xc4\xc4\xdb\x96\x10\xb7\
-\xef\xfc\xd9\x77\xaa\xd5\xaa\x3d\xd4\x5d\x5b\x5b\x9b\x25\x00\x00\
-\x00\x00\x10\x31\x71\x24\x00\x00\x00\x00\x90\x5e\x95\xca\xf4\x5f\
-\xfd\xe8\x47\xf6\x50\x77\xad\xad\xad\x96\x00\x00\x00\x00\x40\xc4\
-\xc4\x91\x00\x00\x00\x00\x04\xec\xe4\x89\x93\x96\x10\xbd\xa1\xe2\
-\x82\x21\x7b\x00\x00\x00\x00\x00\xae\x9f\x38\x12\x00\x00\x00\x00\
-\x48\xbb\xbe\xbe\xfd\xe5\x72\xd9\x1e\xb8\x21\x1d\x1d\x1d\x96\x00\
-\x00\x00\x00\x90\x59\xe2\x48\x00\x00\x00\x00\x02\x36\x54\x2c\x5a\
-\x42\x46\xfc\xf5\x8f\x7f\x6c\x09\x00\x00\x00\x00\xc0\x75\x12\x47\
-\x02\x00\x00\x00\x00\x01\x18\x2a\x16\x8f\x1c\x39\x6c\x0f\x00\x00\
-\x00\x00\xc0\xf5\x10\x47\x02\x00\x00\x00\x10\xaa\xc9\xc9\x49\x4b\
-\xc8\x94\xc7\x1e\x7b\x2c\x49\x12\x7b\x00\x00\x00\x00\x00\xbe\x94\
-\x38\x12\x00\x00\x00\x00\x08\x43\xa5\x32\x7d\xe8\xd9\x67\xed\x01\
-\x00\x00\x00\x00\xf8\x52\xe2\x48\x00\x00\x00\x00\x42\x35\x31\xf1\
-\xb6\x25\x64\x4d\x7f\xa1\x50\xad\x56\xed\x01\x00\x00\x00\x00\xb8\
-\x36\x71\x24\x00\x00\x00\x00\x10\x92\xbf\xfa\xd1\x8f\x2c\x81\xeb\
-\x51\x2e\x97\x2d\x01\x00\x00\x00\x20\xb3\x6e\xb6\x02\x00\x00\x00\
-\x00\x02\x75\xf2\xc4\xc9\xe5\xfb\xc3\xbb\xba\x76\xac\x5b\xbb\xee\
-\x8b\xfe\xed\xb1\xe3\xc7\x2a\x95\x69\x47\xd0\x14\x43\xc5\xe2\x7f\
-\xf9\xcb\xbf\xec\xe8\xe8\xb0\x0a\xae\x2d\x49\x12\x4b\x00\x00\x00\
-\x00\xc8\x2c\x71\x24\x00\x00\x00\x00\xa1\x9a\x9b\x9b\xfb\xd2\xff\
-\xa6\xaf\xb7\xb7\xf6\xc3\xb6\xed\xdb\x6a\x3f\xac\xfc\xca\xca\xb6\
-\xdb\x6e\xbb\xfc\x1f\xd4\xb1\xb1\x2b\x97\xcb\x97\x63\xac\xd9\x0b\
-\x17\xce\x7f\x72\x7e\xe1\x87\x73\x1f\x9f\x9b\x99\x99\xb9\xe9\xf7\
-\x49\x9f\x23\xab\x97\xbf\xfd\xc9\x4f\x5e\x18\x1a\xb2\x07\x00\x00\
-\x00\x00\xe0\x8b\x88\x23\x01\x00\x00\x20\x8b\x26\x27\x27\xb7\x6c\
-\xd9\x62\x0f\x4b\xf7\xbb\xdf\xfd\xce\x12\x9a\x68\xb8\x54\xaa\xfd\
-\x50\x7b\xca\xe3\xa6\xcd\x9b\x6e\xb9\xe5\x96\x8d\x1b\x36\xe6\x5a\
-\x5a\xda\xda\xda\x5a\x5b\x5b\x1b\x3c\x4f\x3e\x9f\xbf\xfc\xf3\xe7\
-\x9b\xcb\x5a\xcc\x57\x0b\x28\xcf\x9e\x3d\x33\x3f\x3f\x7f\xf2\xc4\
-\xc9\xb9\xb9\xb9\xcb\x57\xc1\xf5\x1b\x2a\x16\xff\xdb\x8f\x7e\x74\
-\xe5\xc2\x01\x00\x00\x00\x00\xae\x24\x8e\x04\x00\x00\x00\x20\x54\
-\xa7\x4e\x9d\x6a\x4a\x04\xb9\x14\xb5\x9e\xaf\x96\x4e\xf6\xf6\xf6\
-\xd5\xfe\x61\xb9\x5c\xfe\xe0\xfd\xf7\xcf\x7f\x72\xfe\xe4\x89\x93\
-\x5e\xd8\x7d\x9d\xfe\xf7\x2b\xaf\x3c\xd1\xdf\x6f\x0f\x8b\x56\xad\
-\x56\xc3\xba\x77\x00\x00\x00\x00\xe0\x86\x88\x23\x01\x00\x00\x00\
-\x08\x55\x1d\xdf\x88\xdd\x5c\xf9\xdf\xbb\xe9\x5f\x73\xc9\x5a\x2b\
-\xf9\xd6\x5b\x6f\x8d\xfd\x7a\x6c\x74\x74\xcc\x41\x5f\x55\x7f\xa1\
-\xf0\xbd\x47\x1e\x91\xf7\x2d\xda\xec\xec\xac\xed\x01\x00\x00\x00\
-\x10\xb1\x3f\xb0\x02\x00\x00\x00\x00\x48\x95\x7c\x3e\xff\xc0\xae\
-\x5d\x4f\xf4\xf7\x1f\x3f\x3e\x3a\x3b\x3b\x3b\xf2\x8b\x5f\x1c\x3c\
-\x70\xa0\xbd\x7d\x8d\xcd\x7c\xc6\xcf\x7f\xfe\x0f\x96\x00\x00\x00\
-\x00\x00\x5c\x95\x38\x12\x00\x00\x00\x00\xd2\xab\xb5\xb5\xf5\x81\
-\x5d\xbb\x9e\x3d\x74\xe8\xa3\x8f\x2a\xe3\x6f\xbc\x31\x50\x28\xa8\
-\x24\x2f\x7b\xe5\x95\x57\x2c\x01\x00\x00\x00\x00\xb8\x2a\x71\x24\
-\x00\x00\x00\x00\x84\x61\x7b\x67\xe7\x13\xfd\xfd\x97\x2b\x49\x0b\
-\x19\x1d\x1d\x3b\x31\x3e\xde\xac\x4f\xdf\xb6\x7d\x9b\x23\x60\x59\
-\xe5\xf3\x79\x4b\x00\x00\x00\x00\x58\x34\x71\x24\x00\x00\x00\x00\
-\x04\xa6\x56\x49\xce\xcf\xcf\x1f\x3e\xfc\x6a\x57\xd7\x8e\x2c\xaf\
-\xa2\x54\x2a\xf9\x3e\x10\xab\x5c\x2e\x67\x09\x00\x00\x00\x00\x8b\
-\x26\x8e\x04\x00\x00\x00\x80\x20\xe5\x72\xb9\xbd\x7b\xf7\x1d\x3f\
-\x3e\x3a\xfe\xc6\x1b\x7d\xbd\xbd\xd9\x5c\xc2\xa1\xc1\xc1\x24\x49\
-\x7c\x19\x00\x00\x00\x00\x80\xcf\x10\x47\x02\x00\x00\x00\x40\xd8\
-\xb6\x77\x76\xbe\x30\x34\x74\xea\xd4\xa9\x6c\x26\x92\x4d\x7c\xb3\
-\x36\x29\x77\xf6\xec\x19\x4b\x00\x00\x00\x00\xc8\x2c\x71\x24\x00\
-\x00\x00\x00\xc4\xa0\xa3\xa3\xa3\x96\x48\x66\xed\x45\xdb\xbf\xfc\
-\xe5\x2f\x9d\x3e\x57\x35\x3f\x3f\x6f\x09\x00\x00\x00\x00\x99\x25\
-\x8e\x04\x00\x00\x00\x80\x78\x74\x74\x74\x1c\x3f\x3e\x7a\xf8\xf0\
-\xab\xed\xed\x6b\x32\x72\xc9\xcd\x7a\xb3\xf6\xd6\xad\x77\xf9\xbe\
-\xb1\x7c\xf6\xf4\xf4\x58\x02\x00\x00\x00\xc0\x52\x88\x23\x01\x00\
-\x00\x00\x20\x36\x7b\xf7\xee\x7b\xf3\xcd\xb7\xb2\xf3\x96\x6d\x6f\
-\xd6\x5e\x84\x89\x89\xb7\x2d\x21\xcd\x56\xac\x58\x61\x09\x00\x00\
-\x00\x00\x4b\x21\x8e\x04\x00\x00\x00\x80\x08\xb5\xb6\xb6\xbe\x30\
-\x34\x74\xf8\xf0\xab\x59\xb8\xd8\xb7\xde\x7a\xcb\x89\x03\x00\x00\
-\x00\x00\x57\x12\x47\x02\x00\x00\x00\x40\xb4\xf6\xee\xdd\xf7\xc1\
-\x07\x1f\x74\x75\xed\x88\xfb\x32\x5f\x7c\xe9\xc5\xc6\x7f\x68\x2e\
-\x97\xf3\x05\x4b\xb9\x4b\x97\x2e\x59\x02\x00\x00\x00\x40\x66\x89\
-\x23\x01\x00\x00\x00\x20\x66\xf9\x7c\xfe\xb5\xd7\x5e\xdf\xd3\xd3\
-\x13\xf1\x35\x56\x2a\xd3\xe5\x72\xb9\xf1\x8b\xf5\xed\x4a\xb9\xa9\
-\xf7\xa6\xc2\x1d\x7e\xdb\xf6\x6d\x4e\x10\x00\x00\x00\x60\x29\xc4\
-\x91\x00\x00\x00\x00\x10\xb9\x5c\x2e\xf7\xd2\xcb\x2f\x0f\x14\x0a\
-\x11\x5f\xe3\x3b\xef\x4c\x38\xe8\x1b\xe2\xa9\x8a\x00\x00\x00\x00\
-\xc4\x4d\x1c\x09\x00\x00\x00\x00\xf1\xcb\xe5\x72\x4f\xf4\xf7\x47\
-\xdc\x47\xbe\xf9\x9b\x37\x1b\xff\xa1\xed\xed\x6b\xc2\xdd\x58\xd0\
-\x4f\x55\x04\x00\x00\x00\x80\x2f\x25\x8e\x04\x00\x00\x00\x80\xac\
-\x88\xb8\x8f\x7c\xf7\xd4\xbb\x8d\xff\xd0\xee\x9d\xdd\xbe\x54\x69\
-\x36\x37\x37\x17\xee\xf0\x1b\x37\x6c\x74\x82\x00\x00\x00\x00\x4b\
-\x21\x8e\x04\x00\x00\x00\x80\x0c\x39\xf8\xe8\xa3\x7b\x7a\x7a\xe2\
-\xbb\xae\xd1\xd1\xb1\x24\x49\x9c\x2f\x57\x1a\x2e\x95\xc2\x1d\x3e\
-\xd7\xd2\xe2\x04\x01\x00\x00\x00\x96\x42\x1c\x09\x00\x00\x00\x00\
-\x19\x92\xcb\xe5\x5e\x7a\xf9\xe5\xae\xae\x1d\xf1\x5d\x5a\xb9\x5c\
-\x6e\xf0\x27\xae\x5e\xbd\x3a\xdc\x75\x7d\xf8\xd1\x87\x6e\x07\x00\
-\x00\x00\x00\x22\x26\x8e\x04\x00\x00\x00\x80\x6c\xc9\xe5\x72\xcf\
-\x3f\xff\x42\x7c\xd7\x35\x31\xf1\x76\x83\x3f\x71\xd5\xed\xab\xc2\
-\x5d\xd7\xe8\xe8\x98\x7b\x21\xcd\x3a\x3a\x3a\x2c\x01\x00\x00\x00\
-\x60\x29\xc4\x91\x00\x00\x00\x00\x90\x39\xf9\x7c\x7e\x68\x28\xb6\
-\x3e\xf2\xf4\xd4\x69\x27\xcb\x65\x93\x93\x93\x96\x00\x00\x00\x00\
-\x90\x65\xe2\x48\x00\x00\x00\x00\xc8\xa2\xde\xde\xbe\x3d\x3d\x3d\
-\x31\x5d\xd1\xf4\xf4\x74\x83\x3f\x71\xeb\xd6\xbb\x82\xde\x58\xb5\
-\x5a\x75\x23\xa4\x53\x94\x2f\xbe\x07\x00\x00\x00\x68\x30\x71\x24\
-\x00\x00\x00\x00\x64\xd4\xd3\xcf\x3c\x13\xd3\xe5\x0c\x97\x4a\xce\
-\xf4\x86\xcc\xce\xce\x5a\x42\x3a\xad\x5b\xbb\xce\x12\x00\x00\x00\
-\x00\x96\x48\x1c\x09\x00\x00\x00\x00\x19\x95\xcf\xe7\x07\x0a\x85\
-\x98\xae\xa8\xc1\x8f\x42\xec\xe8\xe8\xf0\x2d\x4a\xad\x89\x89\xb7\
-\xc3\x1d\xfe\xd6\x5b\x6f\x75\x82\x00\x00\x00\x00\x4b\x24\x8e\x04\
-\x00\x00\x00\x80\xec\xfa\xde\x23\x8f\xc4\x74\x39\x1e\x85\x78\x43\
-\xce\x9e\x3d\x63\x09\xe9\x74\xe7\xa6\x3b\x2d\x01\x00\x00\x00\x60\
-\x89\xc4\x91\x00\x00\x00\x00\x90\x5d\xad\xad\xad\x31\x3d\x3c\x72\
-\xf6\xc2\x85\x06\x7f\xe2\x9e\x9e\x9e\x70\xd7\x35\x3f\x3f\x1f\xf1\
-\x77\xfb\xdc\xc7\xe7\xc2\x1d\xbe\xa5\xa5\xc5\x6f\x27\x00\x00\x00\
-\x80\x25\x12\x47\x02\x00\x00\x00\x40\xa6\xc5\xf4\xf0\xc8\xf3\x9f\
-\x9c\x6f\xf0\x27\xae\x58\xb1\x22\xdc\x75\x5d\xba\x74\x29\xe2\x2f\
-\xf6\xcc\xcc\x4c\xb8\xc3\x6f\xd8\xb0\xd1\xaf\x26\x00\x00\x00\x80\
-\x25\x12\x47\x02\x00\x00\x00\x40\xa6\xb5\xb6\xb6\xf6\xf5\xf6\xc6\
-\x71\x2d\x8d\xaf\xfd\xb6\x6d\xdf\x16\xee\xba\xa6\xde\x9b\x8a\xf8\
-\x8b\x3d\x37\x37\x17\xee\xf0\xb9\x5c\xce\xaf\x26\x00\x00\x00\x80\
-\x25\x12\x47\x02\x00\x00\x00\x40\xd6\xed\xdd\xbb\x37\x8e\x0b\x69\
-\x7c\xed\x17\xf4\xeb\x8f\x83\xce\x07\xbf\xd4\x70\xa9\x14\xee\xf0\
-\xf9\x7c\xde\xef\x25\x00\x00\x00\x80\x25\x12\x47\x02\x00\x00\x00\
-\x40\xd6\x6d\xef\xec\xb4\x84\xc5\x09\xfa\xf5\xc7\x41\xe7\x83\xd7\
-\x96\x24\x49\xb8\xc3\x77\x75\xed\x70\x67\x01\x00\x00\x00\x2c\x9d\
-\x38\x12\x00\x00\x00\x00\xb2\x2e\x97\xcb\x45\xf3\x66\xed\x06\x6b\
-\x6b\x6b\x0b\x7a\xfe\xa0\x23\xc2\x6b\x28\x97\xcb\xe1\x0e\xbf\x6e\
-\xed\x3a\x77\x16\x00\x00\x00\xc0\xd2\x89\x23\x01\x00\x00\x00\x80\
-\x9b\x1e\xd8\xf5\x40\x04\x57\x31\x54\x2c\x36\xf8\x13\x5b\x5b\x5b\
-\x83\xde\x58\xd0\x11\xe1\x35\x24\xf3\xf3\xe1\x0e\xbf\x69\xf3\x26\
-\xbf\x91\x00\x00\x00\x00\x96\x4e\x1c\x09\x00\x00\x00\x00\xdc\xf4\
-\xb5\xaf\x6d\xb5\x84\xc5\x09\xfa\xa1\x9b\xb3\x17\x2e\x44\x79\x28\
-\x67\xce\x9e\x09\x77\xf8\x95\x2b\x57\xba\xad\x00\x00\x00\x00\x96\
-\x4e\x1c\x09\x00\x00\x00\x00\xdc\x94\xcf\xe7\x2d\x61\x71\x6e\xbd\
-\xf5\xd6\x70\x87\x3f\xff\xc9\xf9\x28\x0f\xe5\xdc\xc7\xe7\xc2\x1d\
-\x7e\xc3\x86\x8d\x6e\x2b\x00\x00\x00\x80\xa5\x13\x47\x02\x00\x00\
-\x00\x00\x9f\x0a\xfa\x09\x88\x4d\x74\xe7\xa6\x3b\xc3\x1d\xfe\xf4\
-\xd4\xe9\x28\x0f\x65\x66\x66\x26\xdc\xe1\x95\xca\x00\x00\x00\x00\
-\x75\x21\x8e\x04\x00\x00\x00\x00\x3e\xb5\x7a\xf5\x6a\x4b\x58\x84\
-\xad\x5b\xef\x0a\x77\xf8\x8b\x17\x2f\x46\x79\x28\xc7\x8e\x1f\x0b\
-\x74\xf2\xf6\xf6\x35\xb9\x5c\xce\x6d\x05\x00\x00\x00\xb0\x74\xe2\
-\x48\x00\x00\x00\x00\xe0\x53\xab\x6e\x5f\x65\x09\x8b\xd0\xd6\xd6\
-\x16\xee\xf0\x43\xc5\x62\x7c\x27\x92\x24\x49\xa5\x32\x1d\xe8\xf0\
-\xdd\x3b\xbb\xdd\x53\x00\x00\x00\x00\x75\x21\x8e\x04\x00\x00\x00\
-\x00\x3e\xb5\xf2\x2b\x2b\x2d\x61\x11\x5a\x5b\x5b\x83\x9e\xbf\x5a\
-\xad\x46\x76\x22\xe5\x72\x39\xdc\xe1\x37\x6d\xde\xe4\x9e\x02\x00\
-\x00\x00\xa8\x0b\x71\x24\x00\x00\x00\x00\xf0\xa9\xb6\xdb\x6e\xb3\
-\x84\xc5\xe9\xeb\xed\x0d\x77\xf8\x0f\xde\x7f\x3f\xb2\xe3\x38\x7b\
-\xf6\x4c\xb8\xc3\x7f\xf5\x0f\xbf\xea\x86\x02\x00\x00\x00\xa8\x0b\
-\x71\x24\x00\x00\x00\x00\xc0\x92\x04\xfd\xb4\xbf\x33\x21\xa7\x84\
-\x57\x75\xfe\xfc\xf9\x70\x87\xd7\x28\x03\x00\x00\x00\xd4\x8b\x38\
-\x12\x00\x00\x00\x00\x60\x49\x82\x7e\xda\xdf\xe9\xa9\xd3\x91\x1d\
-\xc7\xd4\x7b\x53\xe1\x0e\xdf\xd1\xd1\xe1\x86\x02\x00\x00\x00\xa8\
-\x8b\x9b\xad\x00\x00\x00\x00\x32\xa8\xa3\xa3\xe3\x77\xbf\xfb\x9d\
-\x3d\x00\x57\x6a\x6b\x6b\xb3\x84\xc5\x59\x7f\xc7\x1d\xe1\x0e\xff\
-\xee\xa9\x77\x23\x3b\x8e\xa1\x62\x31\xd0\xc9\xf7\xf4\xf4\xb8\x9b\
-\x00\x00\x00\x00\xea\xc5\x93\x23\x01\x00\x00\x00\x80\x4f\xb5\xb6\
-\xb6\x5a\xc2\xe2\xe4\xf3\xf9\xf6\xf6\x35\x81\x0e\x3f\x3a\x3a\x96\
-\x24\x49\x34\x67\x51\x2e\x97\xc3\x1d\xfe\x8f\xfe\xe8\x8f\xdc\x4d\
-\x00\x00\x00\x00\xf5\x22\x8e\x04\x00\x00\x00\x00\x3e\x55\xad\x56\
-\x2d\x61\xd1\xba\x77\x76\x87\x3b\xfc\xe4\xa9\x53\xd1\x1c\xc4\x07\
-\xef\xbf\x1f\xee\xf0\x77\xdf\x7d\xb7\x5b\x09\x00\x00\x00\xa0\x5e\
-\xc4\x91\x00\x00\x00\x00\xc0\xa7\x66\x67\x67\x43\xbf\x84\x26\x3e\
-\xbe\x71\xdb\xf6\x6d\xff\x9f\xbd\xfb\xff\xad\xbb\xbe\xef\x05\x9e\
-\x4e\xfd\xf1\xa4\xbf\x9e\xf4\xd2\xe1\xb3\x9e\x90\x8c\x29\x70\xc2\
-\x02\x82\xc6\x27\xc1\x2e\x55\xe2\x6a\xb7\x48\x3d\x5e\x92\xee\x36\
-\x1b\xdd\x31\x68\xb0\x69\x6d\x6d\x24\xd0\xb8\x8a\x7d\x9c\xa8\x48\
-\x8b\x14\x3b\xec\x6a\x03\xa9\x3e\x4e\xa2\xa6\xd2\x20\x8b\x47\xc3\
-\x7a\x6d\xaa\x38\x36\xc4\x49\x63\x91\x2f\x36\x09\x63\x09\x39\xab\
-\x43\xc7\x6d\xce\x6f\x88\x9c\x3f\xe0\x1e\x38\xf7\xfa\x72\x19\x63\
-\x01\xfc\xe5\xf3\x7e\x9f\xc7\x43\x96\x75\x1a\x51\x9f\xf7\xfb\xf9\
-\xf9\xf2\xd3\x53\xaf\x77\xb8\xb9\x5d\xbe\x72\x39\x9a\xdb\xf8\xcd\
-\x7f\x79\x33\xdc\xc5\x07\x7d\x3e\x3b\x00\x00\x00\x40\xd2\x28\x47\
-\x02\x00\x00\x00\x00\x91\x58\xc6\xf1\x8d\x1b\x36\xdc\x1d\x6e\x6e\
-\xa7\x4f\x9d\x8e\xe6\x1e\xb8\x74\xf1\x52\xb8\x8b\xcf\x66\xb3\x9e\
-\x62\x00\x00\x00\x80\x85\xa2\x1c\x09\x00\x00\x00\x00\xf0\x79\x05\
-\x5d\x6b\x2b\x0f\x0f\x47\x73\x21\xc2\xdd\x4b\x57\xb1\xe8\x39\x02\
-\x00\x00\x00\x58\x40\xca\x91\x00\x00\x00\x00\xc0\xfb\xce\x9d\x3b\
-\x1b\xfa\x16\x6e\xbd\xf5\xd6\xe5\xfa\xea\x54\x2a\xd5\x59\x28\x84\
-\x1b\xdd\xec\xec\x6c\x04\xf7\x70\xd0\xbb\x08\xfa\x64\x76\x00\x00\
-\x00\x80\x04\x52\x8e\x04\x00\x00\x00\x00\xde\xf7\xde\x7b\xef\x85\
-\xbe\x85\xaf\xfc\xf6\x57\x96\xf1\xdb\xf3\x9b\xf2\xe1\x46\x17\x41\
-\x35\x36\xf4\x5d\x04\x7d\x32\x3b\x00\x00\x00\x40\x02\x29\x47\x02\
-\x00\x00\x00\x00\xef\xbb\x74\xf1\x52\xe8\x5b\x58\xb9\x72\xe5\x32\
-\x7e\xfb\x3d\x77\xdf\x13\x6e\x74\xa7\x4f\x9d\x8e\xe0\x1e\x0e\x7a\
-\x17\xb9\x5c\xce\x5b\x08\x00\x00\x00\x60\x01\x29\x47\x02\x00\x00\
-\x00\x00\xef\x1b\x3f\x31\x1e\xfa\x16\xd6\xac\x59\xbb\x8c\xdf\x9e\
-\x5b\xbf\x3e\xdc\xe8\xca\xc3\xc3\xb5\x5a\x2d\xf4\x1b\xa0\xbe\x8b\
-\x40\x57\xde\x55\x2c\x7a\x05\x01\x00\x00\x00\x2c\x2c\xe5\x48\x00\
-\x00\x00\x00\x60\x45\xa5\x52\x99\x9b\xbb\x16\xfa\x2e\x56\xad\x5a\
-\xb5\x8c\xdf\x9e\x4a\xa5\x3a\x0b\x85\x70\xd3\x9b\x9d\x99\x09\xfa\
-\xea\x9f\x9a\x9a\x0a\x77\xf1\x1b\x5b\x37\x7a\x0b\x01\x00\x00\x00\
-\x2c\x2c\xe5\x48\x00\x00\x00\x00\x60\xc5\xf9\xf3\xe7\x22\xd8\x45\
-\x3a\x9d\x5e\xde\x05\xe4\x37\xe5\xc3\x4d\x6f\x7c\x3c\xec\xd1\xa1\
-\xaf\x9d\x7d\x2d\xdc\xc5\x6f\xd8\x70\xb7\xb7\x10\x00\x00\x00\xc0\
-\xc2\x52\x8e\x04\x00\x00\x00\x00\x56\x9c\xf9\xe5\x99\xd0\xb7\x90\
-\x84\x83\x89\xdb\xdb\xbf\x1e\x6e\x80\x07\x0e\x1e\x08\xfa\x06\x38\
-\x76\xec\x58\xa0\x2b\xcf\x64\x5a\x72\xb9\x9c\xb7\x10\x00\x00\x00\
-\xc0\xc2\x52\x8e\x04\x00\x00\x00\x80\x66\x57\xab\xd5\x06\x06\x07\
-\x43\xdf\xc5\xba\x3b\xd6\x2d\xfb\x1a\x82\xae\xb8\xcd\xcd\x5d\xab\
-\x54\x2a\x81\x2e\xbe\x5a\xad\x4e\x4c\x4c\x06\xba\xf8\xc2\xb7\x0b\
-\x2b\x00\x00\x00\x00\x58\x68\xca\x91\x00\x00\x00\x00\xd0\xec\x4e\
-\x4d\x4d\x45\xb0\x8b\xdb\x7f\xf7\xf6\x24\x2c\xa3\xa7\xbb\x3b\xdc\
-\x0c\x5f\x7a\x29\xd4\xe1\x8b\xaf\xbe\xfa\x4a\xb8\xb1\xdf\xf7\xb5\
-\xfb\xbc\x85\x00\x00\x00\x00\x16\x9c\x72\x24\x00\x00\x00\x00\x34\
-\xbb\x23\x47\x8e\x44\xb0\x8b\xd5\xb7\xdd\x96\x84\x65\x6c\xd9\xb2\
-\x25\xdc\x0c\xc3\x3d\x99\xfa\xf9\xbf\x7f\x3e\xdc\xd8\x37\x6f\xbe\
-\xdf\x5b\x08\x00\x00\x00\x60\xc1\x29\x47\x02\x00\x00\x00\x40\x53\
-\xab\x54\x2a\xe5\xe1\xe1\x08\x36\x92\xcd\x66\x93\xb0\x8c\xf5\x77\
-\xdd\x15\x6e\x86\x13\x13\x93\x21\x8e\x11\xad\x56\xab\x47\x47\x46\
-\x02\xcd\xbc\xb3\x50\x48\xa7\xd3\x5e\x44\x00\x00\x00\x00\x0b\x4e\
-\x39\x12\x00\x00\x00\x00\x9a\xda\x4f\x0f\x1f\x8e\x60\x17\x5d\xc5\
-\x62\x42\x56\x92\x4e\xa7\x3b\x0b\x85\x70\x93\x1c\x1f\x1f\x0f\x6e\
-\xcd\x3f\xff\xf9\x3f\x85\x1b\x78\x7e\x53\xde\x5b\x08\x00\x00\x00\
-\x60\x31\x28\x47\x02\x00\x00\x00\x40\xf3\xaa\x56\xab\x7d\xa5\x52\
-\x04\x1b\xd9\xd8\xba\x31\x39\x8b\xd9\xf1\x9d\x1d\xe1\x26\x59\xbf\
-\x1f\x6a\xb5\x5a\x58\x6b\x3e\x1c\x72\xc1\xf7\x5b\xdf\x7a\xd0\x8b\
-\x08\x00\x00\x00\x60\x31\x28\x47\x02\x00\x00\x00\x40\xf3\xfa\xef\
-\x4f\x3d\x15\xc7\x46\x36\x6c\xb8\x3b\x39\x8b\xd9\xbc\xf9\xfe\xa0\
-\xc3\x1c\x1d\xfd\x9f\x01\xad\x76\x76\x76\x76\x62\x62\x32\xd0\xa8\
-\xdb\xdb\xdb\x12\x72\x1c\x3c\x00\x00\x00\x40\x7c\x94\x23\x01\x00\
-\x00\x00\xa0\x49\x9d\x9a\x9a\x2a\x0f\x0f\x47\xb0\x91\x4c\xa6\x25\
-\x97\xcb\x25\x67\x3d\xe9\x74\xba\xbd\xbd\x2d\xdc\x3c\x9f\x7d\xf6\
-\xd9\x80\x56\xfb\xb3\x17\x5f\x0c\x37\xea\x07\x1f\x34\x36\x12\x00\
-\x00\x00\x60\xb1\x28\x47\x02\x00\x00\x00\x40\x33\xaa\xd5\x6a\xbb\
-\x7a\x77\xc5\xb1\x97\xc2\xb7\x0b\x49\x5b\xd2\xce\x9d\x3b\xc3\xcd\
-\x73\x62\x62\xf2\xd4\xd4\x54\x10\x4b\x0d\xfd\x5c\x78\x67\x6a\x03\
-\x00\x00\x00\x2c\x1e\xe5\x48\x00\x00\x00\x00\x68\x46\x03\xfb\xf6\
-\x85\x7b\x18\xf1\x47\x6c\xd9\xb2\x25\x69\x4b\xfa\x83\x3f\xf8\xaf\
-\x41\x47\x7a\xe0\xc0\x81\x20\xd6\xf9\xf3\x9f\xff\x53\xb8\x21\x3b\
-\x53\x1b\x00\x00\x00\x60\x51\x29\x47\x02\x00\x00\x00\x40\xd3\x79\
-\x79\x6c\x2c\xe8\x79\x7b\x1f\xd1\x9a\xcf\x27\x6d\x49\xe9\x74\xba\
-\xb3\x50\x08\x37\xd2\xf2\xf0\xf0\xec\xec\x6c\xc2\x17\x59\xab\xd5\
-\xf6\xec\xd9\x13\x6e\xc8\xce\xd4\x06\x00\x00\x00\x58\x54\xca\x91\
-\x00\x00\x00\x00\xd0\x5c\x2a\x95\xca\xa3\x8f\x3d\x1a\xcd\x76\x7a\
-\xba\xbb\x53\xa9\x54\x02\x17\xb6\xe3\x3b\x3b\x82\x0e\xf6\x7f\xfc\
-\xcd\xdf\x24\x7c\x85\x2f\xbc\xf0\xfc\xdc\xdc\xb5\x70\x13\x76\xa6\
-\x36\x00\x00\x00\xc0\xa2\x52\x8e\x04\x00\x00\x00\x80\x26\x52\xa9\
-\x54\xbe\xf1\x8d\x07\x82\xae\x94\x7d\x44\x02\xcf\xd4\x6e\xd8\xbc\
-\xf9\xfe\xa0\x83\x4d\xf8\xf0\xc8\xd0\xc7\x46\x3a\x53\x1b\x00\x00\
-\x00\x60\xb1\x29\x47\x02\x00\x00\x00\x40\xb3\xa8\xd5\x6a\x4f\x3e\
-\xf1\x44\x4c\xcd\xc8\x15\x89\x3c\x53\xbb\x21\x9d\x4e\xf7\x74\x77\
-\x07\x9d\xed\x9e\xdd\xbb\x13\xbb\xb6\xd0\xc7\x46\x3e\xf6\xd8\x63\
-\xde\x48\x00\x00\x00\x00\x8b\x4a\x39\x12\x00\x00\x00\x00\x9a\x42\
-\xad\x56\xfb\xde\x43\x0f\x1d\x1d\x19\x89\x69\x53\xfd\xa5\x52\x32\
-\xcf\xd4\x6e\x28\x14\x0a\x41\xc7\x5b\xbf\x5b\x5e\x1e\x1b\x4b\xe6\
-\xcd\x1c\xf4\xd8\xc8\x15\xe1\x0f\x16\x05\x00\x00\x00\x48\x3e\xe5\
-\x48\x00\x00\x00\x00\x88\x5f\xa5\x52\x79\xf0\xc1\x6f\x45\xd6\x8c\
-\xac\x7b\xe0\x81\x07\x92\xbc\xbc\xd6\x7c\x3e\x93\x69\x09\x3a\xe1\
-\x47\x1f\x7b\xb4\x56\xab\x25\x6d\x55\x03\xfb\xf6\x05\x3d\x36\xb2\
-\xa7\xbb\x3b\x9d\x4e\x7b\x2f\x01\x00\x00\x00\x2c\x2a\xe5\x48\x00\
-\x00\x00\x00\x02\xb3\x7f\xff\xe0\xf0\x70\xb9\x5a\xad\x8a\xe2\x26\
-\xcd\xce\xce\x7e\xe3\x1b\x0f\x4c\x4c\x4c\x46\xb6\xaf\xf6\xf6\xb6\
-\xc4\x9e\xa9\x3d\xef\x07\x3f\xf8\x41\xd0\x21\xcf\xcd\x5d\xeb\xeb\
-\xed\x4d\xda\xfd\xdc\x57\x2a\x05\x9d\x6a\xe8\x23\x45\x01\x00\x00\
-\x00\x82\xa0\x1c\x09\x00\x00\x00\x40\x60\x8e\x1d\x3b\xd6\xd5\xf5\
-\xf0\xaa\x55\xab\x76\xf7\xf7\x57\x2a\x15\x81\x7c\xb2\x23\x47\x5e\
-\x58\xbf\x7e\x7d\xd0\x63\xf6\xfe\x23\x3b\x77\xee\x4c\xfe\x22\xff\
-\xe8\x8f\xfe\x5b\xe8\x39\x0f\x0c\x0e\x9e\x9a\x9a\x4a\xce\x7a\xf6\
-\xec\xde\x1d\x74\x9e\x41\x94\x7a\x01\x00\x00\x00\x22\xa0\x1c\x09\
-\x00\x00\x00\x40\x48\xaa\xd5\xea\xfc\x04\xc4\xbe\x52\x69\xf5\xea\
-\xd5\x7f\xd8\xd9\xf9\xf2\xd8\x58\x02\x4f\xfe\x5d\x76\xf5\x4c\x1e\
-\xef\xe9\xd9\xbe\x7d\x47\xac\x1b\x0c\x62\x6b\xe9\x74\xba\xa7\xbb\
-\x3b\xf4\xa8\x77\xfe\xf1\xce\x84\xcc\x6a\xdd\xbf\x7f\x30\xf4\xd3\
-\xe1\x83\x28\xf5\x02\x00\x00\x00\x44\x40\x39\x12\x00\x00\x00\x80\
-\x90\x5c\x7d\xeb\xad\x8f\xfc\xcb\xd1\x91\x91\x8e\x6f\x7e\xf3\x8e\
-\x3b\xd6\xed\xee\xef\x9f\x9d\x9d\x15\x51\xc3\xa9\xa9\xa9\x7a\x26\
-\x03\x83\x83\xb1\x6e\xb0\xbf\x54\x4a\xa5\x52\x41\x2c\xf5\x4f\x1e\
-\x7a\x28\xf4\xb4\xe7\xe6\xae\xfd\xc5\x9f\xff\x79\x12\xee\xea\xee\
-\xee\x9e\xd0\xc3\x8c\xb8\xaf\x0c\x00\x00\x00\x90\x28\xca\x91\x00\
-\x00\x00\x00\x84\xe4\xb5\xb3\xaf\x7d\xec\xbf\xcf\xcd\x5d\xeb\x2b\
-\x95\xd6\xaf\x5f\xff\xf5\xaf\xb7\xef\xdf\x3f\xd8\xcc\xc7\x6d\x57\
-\xab\xd5\x87\xbb\xba\xf2\x9b\x36\x45\x79\x94\xf6\xbc\x3f\x7b\xf4\
-\xd1\x50\x96\x9a\xcb\xe5\xda\xdb\xdb\x42\x0f\xfc\xe8\xc8\xc8\xee\
-\xfe\xfe\x65\x5c\x40\xfd\xa1\xde\xf9\xc7\xc1\xcf\x5c\x0c\xa8\xd4\
-\x0b\x00\x00\x00\x10\x3a\xe5\x48\x00\x00\x00\x00\x42\x32\x75\x72\
-\xea\x93\xff\x83\x89\x89\xc9\xee\xee\x9e\xd5\xab\x57\x37\x61\x4b\
-\xb2\x56\xab\x0d\x0f\x97\x57\xad\x5a\x55\x1e\x1e\x8e\x7b\xa7\xfd\
-\xa5\x52\x3a\x9d\x0e\x68\xc1\x4f\x3e\xf1\x64\x04\xb1\xf7\x95\x4a\
-\xf5\x1b\x6c\xb9\xee\xed\x27\x9f\x78\x22\x82\xbe\xef\x77\x9d\xa9\
-\x0d\x00\x00\x00\xb0\x54\x94\x23\x01\x00\x00\x00\x08\x46\xad\x56\
-\x3b\x3a\x32\x72\x93\xff\xf1\x87\x5b\x92\xbb\xfb\xfb\x4f\x4d\x4d\
-\xc5\x9d\xcc\xf0\x70\xf9\x8e\x3b\xd6\x75\x75\x3d\xdc\x0c\x77\x42\
-\x40\x63\x23\x1b\xb6\x76\x74\x64\x32\x2d\x11\x24\x5f\xbf\xc1\x5e\
-\x1e\x1b\x5b\xfa\xdb\xfb\x7b\x0f\x3d\x74\xf3\xcf\x7e\x72\xd3\x2b\
-\x16\xb3\xd9\xac\x37\x39\x00\x00\x00\xc0\xd2\x50\x8e\x04\x00\x00\
-\x00\x20\x18\xb3\x33\x33\x9f\xe1\xff\x35\x31\x31\xd9\x57\x2a\xe5\
-\x37\x6d\xfa\xc2\x17\xbe\xf0\x78\x4f\xcf\x91\x23\x2f\xc4\x34\x4e\
-\xb2\x5a\xad\xee\xee\xef\x6f\xd4\x22\xe3\x3e\x47\x7b\x5e\x70\x63\
-\x23\x1b\x76\xed\xda\x15\x47\xfe\x1d\xdf\xfc\x66\xfd\x21\x5a\xb2\
-\xaf\x8b\xa6\x19\x59\xf7\x97\xdf\xff\xbe\xd7\x38\x00\x00\x00\xc0\
-\x92\xf9\xa2\x08\x00\x00\x00\x00\x08\xc5\xe5\x2b\x97\x3f\xe7\x5f\
-\x18\x18\x1c\x5c\x31\xf8\xfe\x87\xf6\xf6\xb6\xb6\xfb\xdb\xee\xbd\
-\xf7\xde\xf5\x77\xdd\x15\x62\xd3\xae\xee\xe5\xb1\xb1\x5f\xfc\xe2\
-\x17\xef\xef\xa8\xc9\x04\x37\x36\xb2\x61\xfb\xf6\x1d\x7b\xf6\xec\
-\x89\xa3\xc0\x5a\xdf\x4b\x7f\xe9\xcd\xde\xbe\xbe\xc5\xfe\xa2\x98\
-\x9a\x91\x5d\xc5\x62\x2e\x97\xf3\x1a\x07\x00\x00\x00\x58\x32\xca\
-\x91\x00\x00\x00\x00\x04\xe3\xf4\xa9\xd3\x0b\xf5\xa7\x26\x26\x26\
-\xeb\x3f\x8d\xcf\xed\xed\x6d\x77\xad\xbf\xeb\xbe\xaf\xdd\xb7\x66\
-\xcd\xda\xe4\xb7\x97\x4e\x4d\x4d\x8d\x8f\x8f\x1f\x38\x78\xa0\x49\
-\xe6\x44\x7e\x44\xa0\x63\x23\xeb\x52\xa9\xd4\xae\x5d\xbb\xa2\x39\
-\xf7\xbc\xaf\x54\x7a\xfb\xed\xb7\xf7\x3f\xf3\x4c\x7d\x5f\x8b\xf4\
-\x15\x95\x4a\xe5\x91\x47\x1e\x9e\x7f\x4e\x43\x67\x6c\x24\x00\x00\
-\x00\xc0\x12\x53\x8e\x04\x00\x00\x00\x20\x18\xe5\xe1\xe1\xc5\xf8\
-\xb3\xff\xa7\x28\xf9\x7f\x27\x30\x76\x16\x0a\x77\xde\x79\xe7\xed\
-\xbf\x77\x7b\x72\xba\x92\xd5\x6a\x75\xe6\xc2\x85\xe9\xe9\xe9\xa6\
-\xed\x44\x36\x64\x32\x2d\x81\x8e\x8d\x6c\x88\x69\x78\x64\xe3\x79\
-\x1c\x3f\x31\x7e\xf8\x27\x87\x5b\xf3\xf9\x05\xff\xe3\x47\x8e\xbc\
-\x50\x8f\x2b\x9a\x5b\xb7\xfe\x56\x31\x36\x12\x00\x00\x00\x60\x89\
-\x29\x47\x02\x00\x00\x00\x10\x86\xd9\xd9\xd9\xa5\xf9\xa2\xa3\x23\
-\x23\x1f\x3e\xc6\xb7\xbd\xbd\xed\xab\xbf\xf3\xd5\x8d\xad\x1b\x6f\
-\xf9\x2f\xb7\xac\xfa\xf2\x97\xb3\xd9\xec\xe2\x8d\xca\xfb\xb0\x4a\
-\xa5\x72\xf5\xad\xb7\xa6\xa7\xa7\x27\x5f\x99\x8c\x66\x78\xde\xe7\
-\xb4\x6b\xd7\xae\x40\xc7\x46\x36\x44\x36\x3c\xb2\x6e\x6e\xee\x5a\
-\x7e\xd3\xa6\xae\x62\xf1\x47\x4f\x3f\xbd\x50\x97\xa6\xfe\xa4\xef\
-\xd9\xbd\x3b\x8e\xa3\xb4\xff\xdf\xad\xdb\xdb\xeb\xf9\x05\x00\x00\
-\x00\x58\x62\xca\x91\x00\x00\x00\x00\x84\xe1\xdc\xb9\xb3\xcb\xf2\
-\xbd\x8d\xb9\x92\x1f\x19\x5a\xd9\x55\x2c\xd6\x7f\x6f\x6c\xdd\x58\
-\xff\xbd\x76\xcd\xda\xd4\xca\x95\xf5\x0f\x9f\x79\x32\x5c\xb5\x5a\
-\xbd\x7e\xfd\x7a\xed\xc6\x8d\xcb\x57\x2e\xbf\x71\xe9\x8d\x6b\xd7\
-\xae\x45\xd6\x0c\x5b\x10\xed\xed\x6d\xc5\x62\x57\xe8\xbb\x88\x6c\
-\x78\x64\x43\xfd\xe9\xa8\xff\xf4\x97\x4a\xdf\xdd\xb9\x33\x9b\xcd\
-\x7e\xe6\xbf\x33\x3b\x3b\xfb\xb3\x17\x5f\xec\x2b\x95\x22\xbb\x75\
-\xeb\xaf\x0b\x63\x23\x01\x00\x00\x00\x96\x9e\x72\x24\x00\x00\x00\
-\x00\x61\x38\x7d\xea\x74\x72\x16\xd3\xe8\x4a\xfe\x47\xc7\x7c\x37\
-\x86\x4d\xfe\xa7\x7f\xe4\xdd\x77\xdf\x55\x82\xbc\x79\x83\x83\xfb\
-\x23\xd8\x45\x7c\xc3\x23\xe7\xf5\x95\x4a\xf5\x9f\xce\x42\x61\xc7\
-\x77\x76\x6c\xde\x7c\xff\xcd\x0f\x92\xac\x56\xab\xaf\xbe\xfa\xca\
-\xf3\x7f\xff\x7c\xac\x8f\xc3\x5f\x7e\xff\xfb\x9e\x5f\x00\x00\x00\
-\x80\xa5\xa7\x1c\x09\x00\x00\x00\x40\x18\xc6\x4f\x8c\x87\xb2\xd4\
-\xc6\xb0\x49\x97\x6c\x01\xf5\x74\x77\x47\x33\x7b\x6f\xfb\xf6\x1d\
-\x87\x0f\x1f\x8e\xf5\x0e\x99\x3f\x95\xbe\xbd\xbd\xad\xed\xfe\xb6\
-\xdb\x7f\xef\xf6\x35\x6b\xd6\xae\xf8\xff\xe7\xaa\x56\x2a\x95\x5a\
-\xad\x76\xe5\xca\xe5\x77\xde\x79\x67\xea\xe4\x54\xdc\x15\x61\x63\
-\x23\x01\x00\x00\x00\x96\x8b\x72\x24\x00\x00\x00\x00\x01\xa8\x54\
-\x2a\x91\x9d\x44\xcc\xcd\xcb\x64\x5a\xfa\x77\xef\x8e\x66\x3b\xa9\
-\x54\xea\xc9\x27\x9e\x8c\xbe\x3e\xab\x22\xdc\xf0\xa3\xa7\x9f\x16\
-\x02\x00\x00\x00\xc0\xb2\xf8\x2d\x11\x00\x00\x00\x00\x90\x7c\xe7\
-\xcf\x9f\x13\x42\xd3\x3a\xfc\x93\xc3\xa9\x54\x2a\xa6\x1d\x6d\xed\
-\xe8\xe8\x2c\x14\x5c\xd9\xe8\x0d\x0e\x0e\xdc\xfc\xf1\xe2\x00\x00\
-\x00\x00\x2c\x2c\xe5\x48\x00\x00\x00\x00\x02\x70\xe6\x97\x67\x84\
-\xd0\x9c\x7a\xba\xbb\x5b\xf3\xf9\xf8\xf6\xb5\xab\xb7\xd7\xc5\x8d\
-\x5b\x26\xd3\xf2\xf0\xc3\x8f\xc8\x01\x00\x00\x00\x60\xb9\x28\x47\
-\x02\x00\x00\x00\x10\x80\x0b\x33\x17\x84\xd0\x84\x22\x3b\x50\xfb\
-\xc3\x72\xb9\x5c\x7f\xa9\xe4\x12\x47\x6c\xef\xde\xbd\x91\x4d\x3c\
-\x05\x00\x00\x00\x08\x8b\x72\x24\x00\x00\x00\x00\x49\x57\xad\x56\
-\x27\x26\x26\xe5\xd0\x84\x5e\x7c\xf1\x67\x11\xd7\xcb\x7a\x1e\x7f\
-\x3c\x93\x69\x71\x95\xa3\xd4\x59\x28\x6c\xdb\xb6\x5d\x0e\x00\x00\
-\x00\x00\xcb\x48\x39\x12\x00\x00\x00\x80\xa4\x9b\xb9\x60\x6c\x64\
-\x33\x2a\x97\x87\x72\xb9\x5c\xc4\x1b\x4c\xa5\x52\x7b\xf7\xee\x75\
-\xa1\xa3\xf4\xd7\xae\x2c\x00\x00\x00\xc0\x72\x53\x8e\x04\x00\x00\
-\x00\x20\xe9\xa6\xa7\xa7\x85\xd0\x6c\xba\x8a\x75\x5d\xd1\x6f\x73\
-\xdb\xb6\xed\xf5\x9d\xba\xdc\x91\x29\x97\x87\xb2\xd9\xac\x1c\x00\
-\x00\x00\x00\x96\x97\x72\x24\x00\x00\x00\x00\x49\x37\xf9\xca\xa4\
-\x10\x9a\x4a\x7b\x7b\xdb\xfe\x67\x9e\x69\x92\xcd\xfe\xd5\x53\x4f\
-\xb9\xe2\x91\xdd\xbd\xdb\xb7\xef\x90\x03\x00\x00\x00\xc0\xb2\x53\
-\x8e\x04\x00\x00\x00\x20\xd1\x6a\xb5\xda\xc4\xc4\xa4\x1c\x9a\x47\
-\x26\xd3\xf2\xe3\x1f\x0f\xa5\x52\xa9\x26\xd9\x6f\x36\x9b\x2d\x97\
-\x87\x5c\xf7\x68\x0c\x0e\xee\x6f\x9e\xbb\x17\x00\x00\x00\x20\xc9\
-\x94\x23\x01\x00\x00\x00\x48\xb4\xd9\x99\x19\x21\x34\x95\xc3\x3f\
-\x39\xdc\x6c\x47\x12\x17\x8b\x5d\x0e\xd7\x8e\x43\xb9\x3c\x94\xcb\
-\xe5\xe4\x00\x00\x00\x00\x90\x04\xca\x91\x00\x00\x00\x00\x24\xda\
-\x6b\x67\x5f\x13\x42\xf3\x18\x1b\x1d\x6d\xcd\xe7\x9b\x70\xe3\x3f\
-\x7a\xfa\xe9\x4c\xa6\xc5\x0d\x10\xb4\xce\x42\xa1\x58\xec\x92\x03\
-\x00\x00\x00\x40\x42\x28\x47\x02\x00\x00\x00\x90\x68\x53\x27\xa7\
-\x84\xd0\x24\x06\x07\x07\xb6\x76\x74\x34\xe7\xde\xd3\xe9\xf4\x73\
-\xcf\x3e\xe7\x1e\x08\x57\x26\xd3\xf2\xb7\x7f\xf7\x77\x72\x00\x00\
-\x00\x00\x48\x0e\xe5\x48\x00\x00\x00\x00\x92\xab\x56\xab\x1d\x1d\
-\x19\x91\x43\x33\xe8\x2f\x95\x7e\xf8\xc3\xee\x66\x4e\x60\x6b\x47\
-\x47\x3d\x04\x77\x42\xa0\x9e\x7b\xf6\xb9\x74\x3a\x2d\x07\x00\x00\
-\x00\x80\xe4\x50\x8e\x04\x00\x00\x00\x20\xb9\x2a\x95\x8a\x10\x9a\
-\x41\x7f\xa9\xd4\xdb\xd7\x27\x87\x9e\xc7\x1f\xef\x2c\x14\xe4\x10\
-\x9c\x66\x1e\x7a\x0a\x00\x00\x00\x90\x58\xca\x91\x00\x00\x00\x00\
-\x24\xd7\xb9\x73\x67\x85\x10\x3d\xcd\xc8\x79\xa9\x54\xea\xaf\xf7\
-\xee\xcd\x64\x5a\x44\x11\x90\xce\x42\xa1\xc9\x87\x9e\x02\x00\x00\
-\x00\x24\x93\x72\x24\x00\x00\x00\x00\xc9\x75\xfa\xd4\x69\x21\xc4\
-\x4d\x33\xf2\x23\xb2\xd9\xec\xe1\x9f\x1c\x96\x43\x28\x32\x99\x96\
-\x83\x87\x0e\xc9\x01\x00\x00\x00\x20\x81\x94\x23\x01\x00\x00\x00\
-\x48\xae\xf2\xf0\xb0\x10\x22\xa6\x19\xf9\xb1\x5a\xf3\xf9\x72\x79\
-\x48\x0e\xc9\x97\xc9\xb4\x1c\x3f\x3e\x9e\x4a\xa5\x44\x01\x00\x00\
-\x00\x90\x40\xca\x91\x00\x00\x00\x00\x24\xd4\xec\xec\xac\x10\x22\
-\xa6\x19\xf9\x09\x8a\xc5\xae\x7a\x3e\x72\x48\xb8\xe7\x9e\x7d\x2e\
-\x9b\xcd\xca\x01\x00\x00\x00\x20\x99\x94\x23\x01\x00\x00\x00\x48\
-\xa8\x73\xe7\xce\x0a\x21\x56\x83\x83\x03\x9a\x91\x9f\xac\x9e\x4f\
-\x67\xa1\x20\x87\xc4\x1a\x1b\x1d\xdd\xda\xd1\x21\x07\x00\x00\x00\
-\x80\xc4\xfa\xa2\x08\x00\x00\x00\x00\x48\xa6\x37\x2e\xbd\x21\x84\
-\x28\x69\x95\xdd\xa4\x83\x87\x0e\xd5\x7f\x1f\x1d\x19\x11\x45\xd2\
-\xf4\x97\x4a\xee\x61\x00\x00\x00\x80\x84\x33\x39\x12\x00\x00\x00\
-\x80\x84\x1a\xf9\x47\x9d\xb0\xd8\x64\x32\x2d\x53\x27\x4f\x6a\x95\
-\xdd\xa4\x54\x2a\x75\xf0\xd0\xa1\xf6\xf6\x36\x51\x24\x8a\x13\xe1\
-\x01\x00\x00\x00\x82\xa0\x1c\x09\x00\x00\x00\x40\x12\x55\x2a\x95\
-\xb9\xb9\x6b\x72\x88\x49\x7b\x7b\xdb\xf1\xe3\xe3\xad\xf9\xbc\x28\
-\x6e\x5e\x2a\x95\xfa\xf1\x8f\x87\x32\x99\x16\x51\x24\x84\x66\x24\
-\x00\x00\x00\x40\x28\x94\x23\x01\x00\x00\x00\x48\xa2\xf3\xe7\xcf\
-\x09\x21\x26\x5d\xc5\xe2\xb1\x63\x2f\x65\xb3\x59\x51\x7c\x5a\xf5\
-\xd0\x8e\x1f\x1f\xd7\x8f\x4c\x02\xcd\x48\x00\x00\x00\x80\x80\x28\
-\x47\x02\x00\x00\x00\x90\x44\x6f\xfe\xf3\x9b\x42\x88\x46\xb9\x3c\
-\x34\x54\x2e\xa7\x52\x29\x51\x7c\x36\xfa\x91\x49\xa0\x19\x09\x00\
-\x00\x00\x10\x16\xe5\x48\x00\x00\x00\x00\x92\x68\xf2\x95\x49\x21\
-\x44\x20\x93\x69\x99\x99\x99\x29\x16\xbb\x44\xf1\x39\xe9\x47\x2e\
-\x2f\xcd\x48\x00\x00\x00\x80\xe0\x28\x47\x02\x00\x00\x00\x90\x38\
-\xd5\x6a\x75\x62\x62\x52\x0e\xa1\xeb\x2a\x16\x2f\x5e\xbc\x94\xcb\
-\xe5\x44\xb1\x20\xb2\xd9\x6c\x3d\xcf\xce\x42\x41\x14\x4b\x6c\x70\
-\x70\x40\x33\x12\x00\x00\x00\x20\x38\x5f\x14\x01\x00\x00\x00\x00\
-\x49\x33\x73\xe1\x82\x10\x82\x96\xc9\xb4\xec\xdd\xbb\x77\xdb\xb6\
-\xed\xa2\x58\x58\xa9\x54\xea\xe0\xa1\x43\xf5\x0f\x47\x47\x46\xa4\
-\xb1\x34\xc6\x46\x47\xb7\x76\x74\xc8\x01\x00\x00\x00\x20\x38\x26\
-\x47\x02\x00\x00\x00\x90\x38\xd3\xd3\xd3\x42\x08\x57\x57\xb1\x78\
-\xe6\xcc\xb4\x66\xe4\x22\x69\xf4\x23\xfb\x4b\x25\x51\x2c\xb6\x4c\
-\xa6\x65\xea\xe4\x49\xcd\x48\x00\x00\x00\x80\x40\x29\x47\x02\x00\
-\x00\x00\x90\x38\xaf\xbf\xfe\xba\x10\x42\x94\xc9\xb4\xbc\xf0\xc2\
-\xf3\x43\xe5\x72\x3a\x9d\x96\xc6\xe2\x49\xa5\x52\xbd\x7d\x7d\xe5\
-\xf2\x90\x28\x16\x4f\x67\xa1\x70\xfc\xf8\x78\x6b\x3e\x2f\x0a\x00\
-\x00\x00\x80\x40\x29\x47\x02\x00\x00\x00\x90\x2c\xb5\x5a\xcd\x91\
-\xc1\x21\xea\xe9\xee\x36\x30\x72\x29\x15\x8b\x5d\x63\xa3\xa3\x99\
-\x4c\x8b\x28\x16\xe3\x66\x3e\x78\xe8\x50\x36\x9b\x15\x05\x00\x00\
-\x00\x40\xb8\x94\x23\x01\x00\x00\x00\x48\x96\xd9\x99\x19\x21\x84\
-\xa5\xbd\xbd\x6d\x66\x66\x66\xdf\xc0\x80\x81\x91\x4b\x6c\x6b\x47\
-\xc7\xf1\xe3\xe3\x9d\x85\x82\x28\x16\x50\xb9\x3c\x54\xbf\x99\x53\
-\xa9\x94\x28\x00\x00\x00\x00\x82\xa6\x1c\x09\x00\x00\x00\x40\xb2\
-\xbc\x76\xf6\x35\x21\x84\x22\x93\x69\x29\x97\x87\x4e\x9c\x98\xc8\
-\xe5\x72\xd2\x58\x16\xd9\x6c\xf6\xe0\xa1\x43\xfd\xa5\x92\x28\x3e\
-\xbf\xf6\xf6\xb6\xab\x57\xaf\x16\x8b\x5d\xa2\x00\x00\x00\x00\x88\
-\x80\x72\x24\x00\x00\x00\x00\xc9\xf2\xeb\xb7\x7f\x2d\x84\x20\x0c\
-\x0e\x0e\x5c\xbc\x78\x49\x93\x6c\xd9\xa5\x52\xa9\xde\xbe\xbe\xa9\
-\x93\x27\x1d\xb1\xfd\x79\xf4\x97\x4a\xc7\x8e\xbd\xe4\x28\x6d\x00\
-\x00\x00\x80\x68\x28\x47\x02\x00\x00\x00\x90\x2c\xfb\x06\x06\xc6\
-\x46\x47\xdb\xdb\xdb\x44\x91\x58\xfd\xa5\xd2\xf5\xeb\xd7\x7f\xf8\
-\xc3\x6e\x47\x0f\x27\x47\x6b\x3e\x7f\xe6\xcc\x74\x57\xb1\x28\x8a\
-\x4f\x2b\x93\x69\x99\x3a\x79\xb2\xb7\xaf\xcf\xfd\x0c\x00\x00\x00\
-\x10\x13\xe5\x48\x00\x00\x00\x00\x12\x67\x6b\x47\xc7\x89\x13\x13\
-\x53\x27\x4f\x6a\x7a\x25\x4d\xa3\x16\xd9\xdb\xd7\x97\x4e\xa7\xa5\
-\x91\x34\xf5\x8b\x32\x54\x2e\x8f\x8d\x8e\x1a\x21\x79\xf3\x1a\x03\
-\x50\x5b\xf3\x79\x51\x00\x00\x00\x00\x44\x46\x39\x12\x00\x00\x00\
-\x80\x84\x6a\xcd\xe7\x87\xca\xe5\x99\x99\x99\xfe\x52\x49\x1a\xcb\
-\x4e\x2d\x32\x14\x5b\x3b\x3a\x2e\x5e\xbc\xe4\xa9\xf9\x4f\x75\x15\
-\x8b\xf5\xd7\x8b\x01\xa8\x00\x00\x00\x00\xb1\x52\x8e\x04\x00\x00\
-\x00\x20\xd1\x72\xb9\x5c\x6f\x5f\xdf\x8d\x1b\x37\xca\xe5\x21\x67\
-\x6d\x2f\xbd\x4c\xa6\xa5\x9e\x7c\x3d\x7f\xb5\xc8\x80\xa4\x52\xa9\
-\xfa\xf5\x9a\x99\x99\x31\x7b\xf5\x63\xd5\xdf\x24\x63\xa3\xa3\x43\
-\xe5\x72\xfd\xf5\x22\x0d\x00\x00\x00\x80\x58\x29\x47\x02\x00\x00\
-\x00\x10\x80\x54\x2a\x55\x2c\x76\x9d\x38\x31\xd1\x18\x24\xe9\xd4\
-\xe0\x25\xd0\x59\x28\x8c\x8d\x8e\xfe\xea\x57\x73\xf5\xe4\x8d\xd6\
-\x0b\x51\x2e\x97\x6b\x9c\xb2\xad\x55\x3c\xaf\x51\xf6\x3d\x76\xec\
-\xa5\xad\x1d\x1d\xd2\x00\x00\x00\x00\x88\x9b\x72\x24\x00\x00\x00\
-\x00\x21\x69\x0c\x92\xbc\x78\xf1\xd2\xd8\xe8\x68\x4f\x77\xb7\x40\
-\x16\x5c\x26\xd3\xd2\x5f\x2a\x5d\xbd\x7a\xf5\x1f\x8e\x1e\x55\x20\
-\x8b\x40\xfd\x22\x9e\x38\x31\xa1\x22\xd9\xa8\x45\xd6\x5f\x1d\xca\
-\xbe\x00\x00\x00\x00\x4d\x42\x39\x12\x00\x00\x00\x80\xf0\xa4\x52\
-\xa9\xad\x1d\x1d\xfb\x06\x06\x6e\xdc\xb8\xa1\x25\xb9\x50\xea\x31\
-\xd6\xc3\xbc\x78\xf1\x52\x6f\x5f\x5f\x36\x9b\x15\x48\x4c\x9a\xb9\
-\x22\x59\xdf\xb2\x5a\x24\x00\x00\x00\x40\x13\xfa\xa2\x08\x00\x00\
-\x00\x00\x08\x57\xa3\x25\xd9\x28\x4a\x9e\x9a\x9a\x1a\x1f\x1f\x9f\
-\x7c\x65\x72\x62\x62\x52\x32\x37\xaf\xb3\x50\xd8\xf1\x9d\x1d\x9b\
-\x37\xdf\x9f\x4e\xa7\xa5\x11\xb7\xc6\xc3\xf2\xf2\xd8\xd8\x91\x23\
-\x47\xca\xc3\xc3\xcd\x70\x6f\x3f\xf2\xc8\x23\x06\xa0\x02\x00\x00\
-\x00\x34\x27\xe5\x48\x00\x00\x00\x00\x22\xd1\x9a\xcf\xd7\x7f\x7a\
-\x57\xf4\x55\x2a\x95\xf3\xe7\xcf\x9d\xf9\xe5\x99\x91\x7f\x1c\x99\
-\x9b\xbb\x26\x99\x8f\xd5\xd3\xdd\x7d\xdf\xd7\xee\xd3\x89\x6c\x42\
-\x8d\x8a\xe4\x5f\x3d\xf5\xd4\x4f\x0f\x1f\x3e\x70\xf0\x40\x7c\xcf\
-\x48\x26\xd3\xf2\xa7\xdf\xfb\xd3\xef\xee\xdc\x69\x00\x2a\x00\x00\
-\x00\x40\x33\x53\x8e\x04\x00\x00\x00\x20\x36\xd9\x0f\x6c\xdb\xb6\
-\x7d\xdf\xc0\xc0\xec\xec\xec\xb9\x73\x67\xdf\xb8\xf4\x86\xa2\xe4\
-\x8a\x0f\xce\x17\x6e\xbb\xbf\xed\x81\x07\x1e\xc8\xad\x5f\xef\x7c\
-\x61\x8f\x49\x6f\x5f\x5f\xcf\xe3\x8f\x9f\x9a\x9a\x8a\x66\x90\x64\
-\x4f\x77\xf7\x96\x2d\x5b\x5a\xf3\x79\xb7\x37\x00\x00\x00\x00\xca\
-\x91\x00\x00\x00\x00\xc4\x2c\xf7\x81\xfa\x87\x7d\x03\x03\x95\x4a\
-\xe5\xea\x5b\x6f\x4d\x4f\x4f\xbf\xfe\xfa\xeb\x47\x47\x46\x9a\x24\
-\x81\x4c\xa6\xa5\xf0\xed\xc2\x7d\x5f\xbb\xef\xf7\x7f\x7f\x83\x41\
-\x7a\x7c\xc4\xfc\xc1\xf4\x3f\x7a\xfa\xe9\x57\x5f\x7d\xe5\xe5\xb1\
-\x97\x43\x6c\x49\xea\x44\x02\x00\x00\x00\xf0\xef\x29\x47\x02\x00\
-\x00\x00\xd0\x2c\x1a\x13\x25\xb7\x76\x74\x34\xfe\xe7\xec\xec\xec\
-\x95\x2b\x97\xdf\xfc\xe7\x37\xdf\x7e\xfb\xed\x38\xc6\xe6\xcd\xeb\
-\x2c\x14\xee\xbc\xf3\xce\x7b\xef\xbd\x77\xf5\x6d\xb7\x29\x44\x72\
-\x33\xd2\xe9\xf4\xb6\x6d\xdb\xeb\x3f\xfb\x9f\x79\xe6\xd4\xd4\xd4\
-\xf4\xf4\x74\xc2\x4f\xdc\xae\xdf\xe4\xf9\x4d\xf9\x7b\xee\xbe\xa7\
-\x35\x9f\x77\xf9\x00\x00\x00\x00\xf8\xf7\x94\x23\x01\x00\x00\x00\
-\x68\x52\xf3\x43\x25\xeb\x86\xca\xe5\x4a\xa5\x72\xfd\x37\xbf\xb9\
-\x7c\xe5\xf2\xbf\xfd\xfa\xdf\x82\xab\x4b\x76\x15\x8b\xeb\xee\x58\
-\x77\xcb\x2d\xb7\xac\x59\xb3\x76\x7e\x53\xf0\x19\xcc\xcf\x92\xec\
-\xed\xeb\xab\x3f\x14\xe7\xcf\x9f\x3b\xf3\xcb\x33\x17\x66\x2e\x4c\
-\x4c\x4c\x26\xe4\x3e\xbf\xe7\xee\x7b\x56\xdf\x76\x5b\x3a\x9d\x76\
-\xb1\x00\x00\x00\x00\xf8\x04\xca\x91\x00\x00\x00\x00\xf0\xbe\xc6\
-\x5c\xc9\xf9\x29\x74\x43\xe5\x72\xad\x56\xab\x54\x2a\xb5\x1b\x37\
-\x2e\x5f\xb9\xfc\xde\x7b\xef\x5d\xba\x78\xa9\xfe\xef\xcb\x5e\x9a\
-\xec\x2a\x16\xeb\xbf\x37\xb6\x6e\x5c\xb9\x72\xe5\x9a\x35\x6b\x57\
-\xad\x5a\xa5\x25\xc6\xa2\x3e\x14\xdb\xb6\x6d\xaf\x7f\x6e\x3c\x0e\
-\xe7\xce\x9d\x7d\xe3\xd2\x1b\xd7\xae\x5d\x5b\x82\x83\xe9\xdb\xdb\
-\xdb\xbe\xfa\x3b\x5f\x5d\x77\xc7\xba\xdb\x7f\xf7\xf6\x55\x5f\xfe\
-\xb2\xd6\x2f\x00\x00\x00\x00\x9f\x8a\x72\x24\x00\x00\x00\x00\x7c\
-\xbc\x54\x2a\xd5\xe8\x63\x7d\xf8\xdc\xde\xa1\x72\xb9\xfe\xbb\x5a\
-\xad\x5e\xbf\x7e\xbd\xfe\xe1\xca\x95\xcb\x37\x6e\xdc\xa8\x7f\x98\
-\x6f\x4f\x36\xfc\xeb\xaf\xfe\xf5\x33\x4c\xda\x6b\x14\x1f\x1b\xd6\
-\xdd\xb1\xee\x4b\x5f\xfa\x52\xfd\xc3\xda\x35\x6b\x53\x2b\x57\xd6\
-\x17\xe3\x80\x6c\x96\xfd\x71\xf8\x70\x43\xb1\xf1\x14\x5c\xff\xcd\
-\x6f\xde\xf9\x5f\xef\xcc\xdf\xff\xef\xbe\xfb\xee\xa7\xea\x4d\x36\
-\x1a\x90\xf5\x0f\xb7\xde\x7a\xeb\x57\x7e\xfb\x2b\xf5\x0f\x1b\x36\
-\xdc\xed\x6e\x07\x00\x00\x00\xe0\xf3\x53\x8e\x04\x00\x00\x00\x80\
-\x4f\x2d\xfd\x81\x15\x1f\x9c\xcd\x2d\x0d\x9a\xf9\x29\xb8\x99\x47\
-\xa0\x31\x75\x32\x9b\xcd\xa6\x52\x29\xb9\x01\x00\x00\x00\xb0\x34\
-\x94\x23\x01\x00\x00\x00\x00\x58\x44\xf3\x43\x58\x01\x00\x00\x00\
-\x60\xc9\xfc\x96\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x98\
-\x28\x47\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x51\x51\x8e\x04\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa2\xa2\x1c\x09\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x44\x45\x39\x12\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x88\x8a\x72\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x10\x15\xe5\x48\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x2a\xca\
-\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\x54\x94\x23\x01\x00\
-\x00\x00\x00\x00\x00\x00\x00\x80\xa8\x28\x47\x02\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x51\x51\x8e\x04\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\xa2\xa2\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\x44\
-\x45\x39\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x72\x24\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\xe5\x48\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x20\x2a\xca\x91\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x40\x54\x94\x23\x01\x00\x00\x00\x00\x00\x00\x00\x00\
-\x80\xa8\x28\x47\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x51\x51\
-\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa2\xa2\x1c\x09\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x44\x45\x39\x12\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x88\x8a\x72\x24\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x10\x15\xe5\x48\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\
-\x2a\xca\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\x54\x94\x23\
-\x01\x00\x00\x00\x00\x00\x00\x00\x00\x80\xa8\x28\x47\x02\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x51\x51\x8e\x04\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\xa2\xa2\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x44\x45\x39\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\
-\x72\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\xe5\x48\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x20\x2a\xca\x91\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x40\x54\x94\x23\x01\x00\x00\x00\x00\x00\x00\
-\x00\x00\x80\xa8\x28\x47\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x51\x51\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa2\xa2\x1c\
-\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\x44\x45\x39\x12\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x72\x24\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x10\x15\xe5\x48\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x20\x2a\xca\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\x54\
-\x94\x23\x01\x00\x00\x00\x00\x00\x00\x00\x00\x80\xa8\x28\x47\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x51\x51\x8e\x04\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\xa2\xa2\x1c\x09\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x44\x45\x39\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x88\x8a\x72\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\xe5\
-\x48\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x2a\xca\x91\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x40\x54\x94\x23\x01\x00\x00\x00\x00\
-\x00\x00\x00\x00\x80\xa8\x28\x47\x02\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x51\x51\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa2\
-\xa2\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\x44\x45\x39\x12\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x72\x24\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x10\x15\xe5\x48\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x20\x2a\xca\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x40\x54\x94\x23\x01\x00\x00\x00\x00\x00\x00\x00\x00\x80\xa8\x28\
-\x47\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x51\x51\x8e\x04\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\xa2\xa2\x1c\x09\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x44\x45\x39\x12\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x88\x8a\x72\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\
-\x15\xe5\x48\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x2a\xca\x91\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\x54\x94\x23\x01\x00\x00\
-\x00\x00\x00\x00\x00\x00\x80\xa8\x28\x47\x02\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x51\x51\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xa2\xa2\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\x44\x45\
-\x39\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x72\x24\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\xe5\x48\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x20\x2a\xca\x91\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x40\x54\x94\x23\x01\x00\x00\x00\x00\x00\x00\x00\x00\x80\
-\xa8\x28\x47\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x51\x51\x8e\
-\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa2\xa2\x1c\x09\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x44\x45\x39\x12\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x88\x8a\x72\x24\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x10\x15\xe5\x48\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x2a\
-\xca\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\x54\x94\x23\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\x80\xa8\x28\x47\x02\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x51\x51\x8e\x04\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xa2\xa2\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x44\x45\x39\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x72\
-\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\xe5\x48\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x20\x2a\xca\x91\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x40\x54\x94\x23\x01\x00\x00\x00\x00\x00\x00\x00\
-\x00\x80\xa8\x28\x47\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x51\
-\x51\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa2\xa2\x1c\x09\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x44\x45\x39\x12\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x88\x8a\x72\x24\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x15\xe5\x48\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x20\x2a\xca\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\x54\x94\
-\x23\x01\x00\x00\x00\x00\x00\x00\x00\x00\x80\xa8\x28\x47\x02\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x51\x51\x8e\x04\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xa2\xa2\x1c\x09\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x44\x45\x39\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\
-\x8a\x72\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\xe5\x48\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x2a\xca\x91\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x40\x54\x94\x23\x01\x00\x00\x00\x00\x00\
-\x00\x00\x00\x80\xa8\x28\x47\x02\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x51\x51\x8e\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa2\xa2\
-\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\x44\x45\x39\x12\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x72\x24\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x10\x15\xe5\x48\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x20\x2a\xca\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\
-\x54\x94\x23\x01\x00\x00\x00\x00\x00\x00\x00\x00\x80\xa8\x28\x47\
-\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x51\x51\x8e\x04\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\xa2\xa2\x1c\x09\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x44\xe5\x7f\x0b\xc0\xde\xfd\xfd\x46\x79\xdf\x89\
-\x1e\xcf\x1e\xf5\x72\x22\xf5\x6e\x68\xd9\x53\x4f\x33\x24\xb9\xd8\
-\x5d\x99\x86\x44\x10\x70\xb0\x27\x8e\xf8\x91\x1c\xdc\x74\x5c\xa0\
-\x17\x7b\x54\xb0\x59\x6d\xba\x7b\x91\xd8\x91\x72\xae\x12\x4c\xa2\
-\xd3\x23\x22\x05\xa7\xdd\x8b\xf6\x28\xb1\xa1\x3a\xd1\xd9\x0d\x2c\
-\x13\xc9\x9c\x44\xb6\x55\x67\x0c\x0c\x6a\x50\x03\xd8\x5d\xd0\x6e\
-\xdb\x8c\x34\xbe\xc8\x36\x73\xd7\x76\x9f\x3f\xe0\x4c\x97\x8a\xa6\
-\x14\x0f\xfe\x85\xbf\xf3\x7c\xe7\xf5\x52\x55\x45\x55\x95\xef\x87\
-\xef\x67\x1e\xae\xde\x7a\x1e\x71\x24\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\
-\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\
-\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\
-\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\
-\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\
-\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\
-\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\
-\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\
-\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\
-\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\
-\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\
-\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\
-\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\
-\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x95\x2f\xb8\x02\x00\x00\
-\x00\x58\x96\xf1\xf1\xb1\xc1\xc1\x23\xee\x01\x00\x80\xf5\x31\x37\
-\x37\xd7\xd9\xd9\xe9\x1e\x00\x00\x00\x60\x59\xbc\x39\x12\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\
-\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\
-\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\
-\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\
-\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\
-\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\
-\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\
-\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\
-\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\
-\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\
-\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\
-\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\
-\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\
-\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\
-\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x88\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\
-\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x88\x8a\x38\x12\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x88\xca\x17\x5c\x01\x00\x00\x00\x2c\xcb\x33\xcf\
-\xfc\xb7\xb9\xb9\x39\xf7\x00\x00\xc0\xfa\xc8\xe7\xf3\x2e\x01\x00\
-\x00\x00\x96\x4b\x1c\x09\x00\x00\x00\xcb\x93\xfd\x4f\xee\x01\x00\
-\x00\x00\x00\x00\xa0\x65\xf9\xac\x36\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\
-\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\
-\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\
-\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\
-\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\
-\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\
-\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\
-\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\
-\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\
-\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\
-\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\
-\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\
-\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x10\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\
-\x15\x71\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x15\x71\x24\
-\x00\x00\x00\x00\xb0\x06\xa6\x26\x27\xff\x2c\x28\x2b\x00\x00\x00\
-\x00\x00\x6e\x11\x47\x02\x00\x00\x00\x00\x6b\x60\x7a\x7a\x3a\xe0\
-\xe9\xc3\x43\x43\x56\x00\x00\x00\x00\x00\xdc\x22\x8e\x04\x00\x00\
-\x00\x00\xd6\x40\xe9\xbd\x52\xc0\xd3\xb7\x3d\xbe\xcd\x0a\x00\x00\
-\x00\x00\x80\x5b\xc4\x91\x00\x00\x00\x00\xc0\x6a\x5d\xaa\x54\x6a\
-\xb5\x85\x80\x03\xec\xdc\xd9\x6d\x0b\x00\x00\x00\x00\xc0\x2d\xe2\
-\x48\x00\x00\x00\x00\x60\xb5\x7e\xfa\xf1\x4f\x03\x9e\xde\x5f\x2c\
-\x66\xb3\x59\x5b\x00\x00\x00\x00\x00\x6e\x11\x47\x02\x00\x00\x00\
-\x00\xab\x35\x31\x31\x11\xf0\xf4\xae\x27\xba\xac\x00\x00\x00\x00\
-\x00\xf8\x3c\x71\x24\x00\x00\x00\x00\xb0\x2a\xd5\x6a\xb5\x5c\x9e\
-\x0d\x38\xc0\xbe\x7d\x7d\xb6\x00\x00\x00\x00\x00\x7c\x9e\x38\x12\
-\x00\x00\x00\x00\x58\x95\xab\x57\xaf\x04\x3c\x3d\x97\xeb\xc8\xe7\
-\xf3\xb6\x00\x00\x00\x00\x00\x7c\x9e\x38\x12\x00\x00\x00\x00\x58\
-\x95\xa9\xc9\xa9\x80\xa7\x1f\x3e\x74\xd8\x0a\x00\x00\x00\x00\x80\
-\xdb\x88\x23\x01\x00\x00\x00\x80\x95\x4b\x92\x64\x6c\x7c\x3c\xe0\
-\x00\x5b\xb7\x6e\xb5\x05\x00\x00\x00\x00\xe0\x36\x5f\x70\x05\x00\
-\x00\x00\x00\xc0\x8a\x5d\xaa\x54\xc2\x0e\xb0\xa3\xab\xcb\x16\x88\
-\x40\xbd\x5e\xff\xac\xe1\x57\xbf\xfa\xf4\xdf\x3f\xfd\xed\x6f\x7f\
-\x7b\xfd\x5f\xae\x37\xfe\xc7\x5f\xff\xfa\xd7\x67\x4b\xa5\xa5\xff\
-\x4b\xfa\x8b\xc5\x2f\x7e\xf1\x8b\x8d\x7f\xf8\xca\x57\xbe\xf2\xe7\
-\xff\xf5\xcf\xef\xbf\xff\xfe\x87\x1e\x7a\x38\x93\xc9\xf8\xf4\x3c\
-\x00\x00\x00\xd0\x86\xc4\x91\x00\x00\x00\x00\xc0\xca\x5d\xbe\x7c\
-\x39\xe0\xe9\x83\x03\x03\x99\x4c\xc6\x16\x48\x9d\x7a\xbd\xfe\xc9\
-\x2f\x7f\xf9\xf3\x5f\xfc\xfc\xc6\xf5\x1b\x0b\x0b\x0b\xcb\x2a\x20\
-\x9b\x68\xf2\xef\x29\x14\x7a\x1e\xf8\xea\x03\xdb\x77\x6c\xdf\xf8\
-\xe5\x8d\x9b\x1e\x7c\x50\x2e\x09\x00\x00\x00\x44\x4f\x1c\x09\x00\
-\x00\x00\x00\xac\xdc\xc9\x53\x27\x03\x9e\xbe\x7b\xcf\x6e\x2b\x20\
-\x2d\xaa\xd5\xea\xd5\xab\x57\x3e\xfa\xc9\x47\xa5\xf7\x4a\xb5\xda\
-\xc2\x3a\x9f\x5e\x2e\xcf\x36\xfe\x33\x36\x3e\x7e\xeb\x7f\x19\x1c\
-\x18\xd8\xbe\x63\xfb\x96\x2d\x8f\xe6\xf3\x79\x91\x31\x00\x00\x00\
-\x10\x1f\x71\x24\x00\x00\x00\x00\xb0\x42\xd5\x6a\x75\xfd\x1b\xaf\
-\xcf\x7b\xe4\x91\x2d\xb6\x40\x2b\xab\xd7\xeb\x17\x2e\x9c\x0f\x15\
-\x44\x36\x37\x36\x3e\x7e\xab\x95\xbc\x19\x4a\x76\x77\xf7\x78\xa3\
-\x24\x00\x00\x00\x10\x0d\x71\x24\x00\x00\x00\x00\xb0\x42\xe7\xce\
-\x4d\x04\x3c\xbd\x50\x10\x72\xd1\xa2\xaa\xd5\x6a\xe3\xe9\xa8\x5c\
-\xac\xac\xd5\xf7\xb2\xef\xb5\x5b\xa1\x64\xe3\xb1\xea\xe9\xee\xe9\
-\xed\xed\xdd\xd1\xd5\x65\x8f\x00\x00\x00\x40\xaa\x89\x23\x01\x00\
-\x00\x00\x80\x15\xaa\x5c\xac\x04\x3c\xbd\xaf\xaf\xcf\x0a\x68\x29\
-\x37\xdf\x13\xf9\x83\x1f\xfc\xa0\x5c\x9e\x4d\xe9\x1f\xe1\xe6\xd7\
-\xb7\x8f\x8e\x8c\xe4\x72\x1d\xcf\x3f\xff\xfc\xbe\x7d\x7d\x12\x64\
-\x00\x00\x00\x20\xa5\xfe\x8b\x2b\x00\x00\x00\x00\x00\x56\xa0\x5e\
-\xaf\x87\x7d\x2b\xde\x63\x8f\x3e\x66\x0b\xb4\x88\xa9\xc9\xc9\x23\
-\x83\x83\x1b\x36\x6c\x38\x70\xe0\x60\x7a\xcb\xc8\xcf\xab\xd5\x16\
-\x86\x86\x86\x37\x6d\xda\xf4\xcd\xfe\xfe\x33\x67\x4e\x27\x49\x62\
-\xcb\x00\x00\x00\x40\xba\x78\x73\x24\x00\x00\x00\x00\xb0\x12\x73\
-\xd7\xae\x85\x1d\xc0\x67\x7f\x09\x2e\x49\x92\xd3\xa7\xdf\x7d\xe7\
-\x9d\x77\xe2\x08\x22\xef\xe8\x6c\xa9\xd4\xf8\x4f\x2e\xd7\x71\xf8\
-\xd0\xe1\xbf\x7d\xee\xb9\x6c\x36\x6b\xef\x00\x00\x00\x40\x2a\x78\
-\x73\x24\x00\x00\x00\x00\xb0\x12\xd3\xd3\xd3\x01\x4f\x1f\x1e\x1a\
-\xb2\x02\x02\xaa\xd7\xeb\xaf\x1e\x3b\x76\xff\xfd\xf7\x0f\x0e\x1e\
-\x89\xb8\x8c\xbc\xa5\x56\x5b\x38\x3a\x32\xb2\x61\xc3\x86\x17\x87\
-\x87\xe7\xe7\xe7\xfd\x00\x00\x00\x00\x80\xd6\x27\x8e\x04\x00\x00\
-\x00\x00\x56\xe2\xc4\xe8\x68\xc0\xd3\x77\xed\xda\x65\x05\x04\x71\
-\x33\x8b\xdc\xb0\x61\xc3\xd1\x91\x91\xf6\x7c\xf0\x37\x6f\xde\x7c\
-\x64\x70\x50\x22\x09\x00\x00\x00\xb4\x38\x71\x24\x00\x00\x00\x00\
-\xb0\x6c\x97\x2a\x95\xb0\x03\x6c\xfe\xda\xd7\x6c\x81\x75\xd6\xe6\
-\x59\xe4\xe7\x8d\x8d\x8f\x6f\xde\xbc\xf9\xc5\xe1\xe1\xc6\x9d\xf8\
-\x61\x00\x00\x00\x00\xad\x49\x1c\x09\x00\x00\x00\x00\x2c\xdb\xcc\
-\xcc\x4c\xc0\xd3\xfb\x8b\xc5\x6c\x36\x6b\x0b\xac\x9b\x24\x49\xc6\
-\xc7\xc7\xb6\x6d\xdb\x2a\x8b\xfc\xbc\x13\xa3\xa3\x1b\x36\x6c\x78\
-\xf3\xcd\xd1\xc6\xfd\xb8\x0d\x00\x00\x00\xa0\xd5\x88\x23\x01\x00\
-\x00\x00\x80\x65\x9b\x3d\x3f\x1b\xf0\xf4\xa7\x9f\x79\xda\x0a\x58\
-\x37\x53\x93\x93\x7d\x7d\xfb\x06\x07\x8f\xd4\x6a\x0b\x6e\xe3\x4f\
-\x0d\x0d\x0d\xff\xd5\x5f\xfd\xe5\x99\x33\xa7\x5d\x05\x00\x00\x00\
-\xd0\x52\xc4\x91\x00\x00\x00\x00\xc0\xf2\x54\xab\xd5\x72\x79\x36\
-\xe0\x00\xdd\xdd\x3d\xb6\xc0\x3a\xa8\xd7\xeb\x47\x06\x07\xf7\xec\
-\xdd\x1b\xf6\x07\xdf\xfa\x6a\xb5\x85\x03\x07\x0e\x36\xee\xaa\xf1\
-\x97\x83\xdb\x00\x00\x00\x00\x5a\x84\x38\x12\x00\x00\x00\x00\x58\
-\x9e\xab\x57\xaf\x04\x3c\x3d\x97\xeb\xc8\xe7\xf3\xb6\xc0\xbd\x76\
-\xf3\x3b\xda\x63\xe3\xe3\xae\x62\x89\x1a\x77\xb5\x69\xd3\xa6\xc6\
-\xbd\xb9\x0a\x00\x00\x00\xa0\x15\x88\x23\x01\x00\x00\x00\x80\xe5\
-\x79\xf7\x9f\xde\x0d\x78\xfa\xe1\x43\x87\xad\x80\x7b\xaa\x5e\xaf\
-\x7f\xb3\xbf\xdf\x77\xb4\x57\xa6\x71\x6f\x8d\xdb\x6b\xdc\xa1\xab\
-\x00\x00\x00\x00\xc2\x12\x47\x02\x00\x00\x00\x00\xcb\x90\x24\xc9\
-\xd9\x52\x29\xe0\x00\xbd\xbd\xbd\xb6\xc0\xbd\x33\x35\x39\xb9\x6d\
-\xdb\xd6\xb0\x3f\xf2\xb4\x6b\xdc\x5e\xe3\x0e\x1b\x37\xe9\x2a\x00\
-\x00\x00\x80\x80\xc4\x91\x00\x00\x00\x00\xc0\x32\x5c\xaa\x54\xc2\
-\x0e\xd0\xb9\x79\xb3\x2d\x70\x2f\x24\x49\xf2\xe2\xf0\xf0\x9e\xbd\
-\x7b\xbd\x30\x72\xf5\x1a\x77\xd8\xb8\xc9\x57\x8f\x1d\x6b\xdc\xaa\
-\xdb\x00\x00\x00\x00\x82\x10\x47\x02\x00\x00\x00\x00\xcb\x70\xf9\
-\xf2\xe5\x80\xa7\x0f\x0e\x0c\x64\x32\x19\x5b\x60\xcd\x55\xab\xd5\
-\x43\xdf\xfe\xf6\x89\xd1\x51\x57\xb1\x86\x8e\x8e\x8c\x34\x6e\xd5\
-\x27\xb6\x01\x00\x00\x80\x20\xc4\x91\x00\x00\x00\x00\xc0\x32\x9c\
-\x3c\x75\x32\xe0\xe9\xbb\xf7\xec\xb6\x02\xd6\xdc\xd4\xe4\xe4\x53\
-\x4f\xf5\xfa\x94\xf6\xbd\x70\xf3\x13\xdb\xd5\x6a\xd5\x55\x00\x00\
-\x00\x00\xeb\x4c\x1c\x09\x00\x00\x00\x00\x2c\xd5\xfc\xfc\x7c\xd8\
-\x2f\x0e\xef\xdc\xd9\x6d\x0b\xac\xad\xf1\xf1\x31\x9f\xd2\xbe\xa7\
-\x1a\x77\xbb\x69\xd3\xa6\xa9\xc9\x49\x57\x01\x00\x00\x00\xac\x27\
-\x71\x24\x00\x00\x00\x00\xb0\x54\xe5\xf2\x87\x01\x4f\x2f\x14\x7a\
-\xb2\xd9\xac\x2d\xb0\x86\x5e\x3d\x76\x6c\x70\xf0\x88\x7b\x58\x07\
-\x7b\xf6\xee\x3d\x73\xe6\xb4\x7b\x00\x00\x00\x00\xd6\x8d\x38\x12\
-\x00\x00\x00\x00\x58\xaa\xca\xc5\x4a\xc0\xd3\xfb\xfa\xfa\xac\x80\
-\xb5\x92\x24\xc9\x37\xfb\xfb\x8f\x8e\x8c\xb8\x8a\x75\x73\xe0\xc0\
-\xc1\x57\x8f\x1d\x73\x0f\x00\x00\x00\xc0\xfa\x10\x47\x02\x00\x00\
-\x00\x00\x4b\x52\xaf\xd7\xcf\x96\x4a\x01\x07\x78\xec\xd1\xc7\x6c\
-\x81\x35\x91\x24\xc9\xa1\x6f\x7f\x3b\xec\xef\xb9\x3d\x1d\x1d\x19\
-\xd1\x47\x02\x00\x00\x00\xeb\x43\x1c\x09\x00\x00\x00\x00\x2c\xc9\
-\x85\x0b\xe7\x03\x9e\x9e\xcb\x75\xec\xe8\xea\xb2\x05\x56\x4f\x19\
-\x19\x96\x3e\x12\x00\x00\x00\x58\x1f\xe2\x48\x00\x00\x00\x00\x60\
-\x49\x3e\xfa\xc9\x47\x01\x4f\x2f\x7e\xa3\x68\x05\xac\x9e\x32\xb2\
-\x15\xe8\x23\x01\x00\x00\x80\x75\x20\x8e\x04\x00\x00\x00\x00\xee\
-\x2e\x49\x92\x13\xa3\xa3\x01\x07\xd8\xb5\x6b\x97\x2d\xb0\xfa\x9f\
-\xb1\x32\xb2\x45\xe8\x23\x01\x00\x00\x80\x7b\x4d\x1c\x09\x00\x00\
-\x00\x00\xdc\xdd\xfc\xdc\x5c\xd8\x01\x7c\x53\x9b\x55\x52\x46\xb6\
-\x1a\x7d\x24\x00\x00\x00\x70\x4f\x89\x23\x01\x00\x00\x00\x80\xbb\
-\x9b\x99\x99\x09\x78\x7a\x7f\xb1\x98\xc9\x64\x6c\x81\x15\x53\x46\
-\xb6\xa6\xa3\x23\x23\x67\xce\x9c\x76\x0f\x00\x00\x00\xc0\xbd\x20\
-\x8e\x04\x00\x00\x00\x00\xee\x6e\xf6\xfc\x6c\xc0\xd3\x9f\x7e\xe6\
-\x69\x2b\x60\xc5\x94\x91\xad\xec\xc0\x81\x83\x53\x93\x93\xee\x01\
-\x00\x00\x00\x58\x73\xe2\x48\x00\x00\x00\x00\xe0\x2e\xaa\xd5\x6a\
-\xb9\x3c\x1b\x70\x80\xee\xee\x1e\x5b\x60\xc5\x4e\xbc\xf1\x86\x32\
-\xb2\x95\xed\xd9\xbb\xb7\xf1\x97\x8c\x7b\x00\x00\x00\x00\xd6\x96\
-\x38\x12\x00\x00\x00\x00\xb8\x8b\xf3\x41\x5f\x1b\x59\x28\xf4\xe4\
-\xf3\x79\x5b\x60\x65\xde\x7c\x73\xf4\xe8\xc8\x88\x7b\x68\x71\x4f\
-\x3d\xd5\x5b\xaf\xd7\xdd\x03\x00\x00\x00\xb0\x86\xc4\x91\x00\x00\
-\x00\x00\xc0\x5d\x7c\xf0\xfe\x07\x01\x4f\xef\xf1\xda\x48\x56\x6a\
-\x6a\x72\x72\x68\x68\xd8\x3d\xb4\xbe\x5a\x6d\xe1\xef\xff\xee\xef\
-\x92\x24\x71\x15\x00\x00\x00\xc0\x5a\x11\x47\x02\x00\x00\x00\x00\
-\xcd\x24\x49\x12\xf6\x93\xc4\xbd\xbd\xbd\xb6\xc0\x0a\x54\xab\xd5\
-\x3d\x7b\xf7\xba\x87\xb4\x68\xfc\x3d\x73\xe2\x8d\x37\xdc\x03\x00\
-\x00\x00\xb0\x56\xc4\x91\x00\x00\x00\x00\x40\x33\x97\x2a\x95\xb0\
-\x03\x74\x6e\xde\x6c\x0b\x2c\x57\x92\x24\x4f\x3d\x25\xab\x4d\x99\
-\xa3\x23\x23\x67\xce\x9c\x76\x0f\x00\x00\x00\xc0\x9a\x10\x47\x02\
-\x00\x00\x00\x00\xcd\x4c\x4f\x4f\x07\x3c\x7d\x78\x68\x28\x93\xc9\
-\xd8\x02\xcb\xf5\xc2\xf3\xcf\xd7\x6a\x0b\xee\x21\x75\x0e\x1c\x38\
-\x58\xad\x56\xdd\x03\x00\x00\x00\xb0\x7a\xe2\x48\x00\x00\x00\x00\
-\xa0\x99\xd2\x7b\x21\xbf\xa9\xbd\xed\xf1\x6d\x56\xc0\x72\x8d\x8f\
-\x8f\x8d\x8d\x8f\xbb\x87\x94\xfa\x1f\x2f\xbd\x94\x24\x89\x7b\x00\
-\x00\x00\x00\x56\x49\x1c\x09\x00\x00\x00\x00\x2c\x6a\x7e\x7e\x3e\
-\xec\xeb\xf7\x76\xee\xec\xb6\x05\x96\xfb\xa3\x1d\x1c\x3c\xe2\x1e\
-\xd2\xeb\x6c\xa9\xf4\xf6\xdb\x6f\xb9\x07\x00\x00\x00\x60\x95\xc4\
-\x91\x00\x00\x00\x00\xc0\xa2\xca\xe5\x0f\x03\x9e\x5e\x28\xf4\x64\
-\xb3\x59\x5b\x60\xe9\x92\x24\x79\xf6\xd9\xaf\xbb\x87\xb4\x1b\x1a\
-\x1a\x9e\x9f\x9f\x77\x0f\x00\x00\x00\xc0\x6a\x88\x23\x01\x00\x00\
-\x00\x80\x45\x4d\x4c\x4c\x04\x3c\xbd\xaf\xaf\xcf\x0a\x58\x96\xa3\
-\xaf\xbc\x12\xf6\x5d\xa7\xac\x95\x67\x9f\xfd\xba\x8f\x6b\x03\x00\
-\x00\x00\xab\x21\x8e\x04\x00\x00\x00\x00\xee\xac\x5e\xaf\x97\xcb\
-\xb3\x01\x07\x28\x14\x9e\xb4\x05\x96\x6e\x6a\x72\xf2\xc4\xe8\xa8\
-\x7b\x88\x43\xad\xb6\x70\xe2\x8d\x37\xdc\x03\x00\x00\x00\xb0\x62\
-\xe2\x48\x00\x00\x00\x00\xe0\xce\x2e\x5c\x38\x1f\xf0\xf4\x5c\xae\
-\xa3\xb3\xb3\xd3\x16\x58\xa2\x7a\xbd\xfe\xdc\x77\x9e\x73\x0f\x31\
-\x39\x3a\x32\xe2\xe3\xda\x00\x00\x00\xc0\x8a\x89\x23\x01\x00\x00\
-\x00\x80\x3b\x9b\x9a\x9c\x0a\x78\xfa\xe1\x43\x87\xad\x80\xa5\x7b\
-\xfd\xf8\x71\x1f\xd4\x8e\xcf\xd0\xd0\x0b\x2e\x01\x00\x00\x00\x58\
-\x19\x71\x24\x00\x00\x00\x00\x70\x07\x49\x92\x8c\x8d\x8f\x07\x1c\
-\x60\xeb\xd6\xad\xb6\xc0\x12\x5d\xaa\x54\x7c\x50\x3b\x4a\xe5\xf2\
-\xec\xf8\xf8\x98\x7b\x00\x00\x00\x00\x56\x40\x1c\x09\x00\x00\x00\
-\x00\xdc\xc1\xfc\xdc\x5c\xd8\x01\x76\x74\x75\xd9\x02\x4b\x91\x24\
-\xc9\x5f\xff\xf7\xbf\x76\x0f\xb1\x7a\xed\xb5\xd7\xea\xf5\xba\x7b\
-\x00\x00\x00\x00\x96\x4b\x1c\x09\x00\x00\x00\x00\xdc\xc1\xcc\xcc\
-\x4c\xc0\xd3\xfb\x8b\xc5\x4c\x26\x63\x0b\x2c\xc5\xdb\x6f\xbf\xe5\
-\x83\xda\x11\x6b\x2c\xf7\xf5\xe3\xc7\xdd\x03\x00\x00\x00\xb0\x5c\
-\xe2\x48\x00\x00\x00\x00\xe0\x0e\x4e\x9e\x3a\x19\xf0\xf4\x83\xdf\
-\x3a\x68\x05\x2c\x45\xb5\x5a\x1d\x1a\x1a\x76\x0f\x71\x3b\x31\x3a\
-\x3a\x3f\x3f\xef\x1e\x00\x00\x00\x80\x65\x11\x47\x02\x00\x00\x00\
-\x00\xb7\xab\x56\xab\x61\x5f\xc5\xf7\xc8\x23\x5b\x6c\x81\xa5\xf8\
-\x5f\xdf\xfd\xae\x4b\x68\x07\xff\xf0\xfd\xef\xbb\x04\x00\x00\x00\
-\x60\x59\xbe\xe0\x0a\x00\x00\x00\x00\x80\xdb\x9c\x3f\x3f\x1b\xf0\
-\xf4\x42\xa1\x27\x9f\xcf\xdb\x02\x77\x75\xa9\x52\x19\x1b\x1f\x8f\
-\xfb\xcf\xd8\x5f\x2c\x76\x3d\xd1\xb5\x71\xe3\xc6\x87\x1e\x7a\x38\
-\x93\xc9\xdc\x7a\x34\x92\x24\xa9\x56\xab\x8d\x7f\xb8\x72\xe5\xe3\
-\x1b\xd7\x6f\x5c\x9b\xbb\x56\x2e\xcf\x46\x7c\x0f\x8d\x45\xef\xdf\
-\xbf\x7f\xf7\x9e\x3d\x7e\xf6\x00\x00\x00\xc0\x12\x89\x23\x01\x00\
-\x00\x00\x80\xdb\x7d\xf0\xfe\x07\x01\x4f\xef\xe9\xee\xb1\x02\x96\
-\xe2\xe5\x57\x5e\x8e\xf5\x8f\xd6\x5f\x2c\x1e\xfc\xd6\xc1\x9d\x3b\
-\xbb\xb3\xd9\xec\x1d\xff\x0f\x99\x4c\xa6\xb3\xb3\xb3\xf1\x0f\x37\
-\xff\xfb\xbe\xff\x7c\xe1\xeb\xb9\x73\x13\x0d\xb1\x56\x92\xc7\x5f\
-\x3f\x2e\x8e\x04\x00\x00\x00\x96\xce\x67\xb5\x01\x00\x00\x00\x80\
-\x3f\x52\xaf\xd7\xcf\x96\x4a\x01\x07\xe8\xed\xed\xb5\x05\xee\xea\
-\xcc\x99\xd3\x51\x56\x80\xc7\x46\x46\xe6\xe6\xe6\xfe\xf9\xec\xd9\
-\xfd\xfb\x0f\x2c\x56\x46\xde\x51\x3e\x9f\x7f\xe1\x85\xa1\x0f\x3f\
-\x2c\x57\x2e\x5e\x1c\x1c\x18\x88\xef\x66\x1a\xeb\x9e\x9a\x9c\xf4\
-\xcb\x07\x00\x00\x00\x96\x48\x1c\x09\x00\x00\x00\x00\xfc\x91\xb9\
-\x6b\xd7\xc2\x0e\xb0\xa3\xab\xcb\x16\x68\x2e\x49\x92\x97\x5e\x7a\
-\x29\xb2\x3f\xd4\xe0\xc0\xc0\xdc\xdc\xdc\x2b\x47\x8f\xde\x7a\x19\
-\xe4\x8a\x9f\xa0\xb7\xc7\xc6\x2a\x17\x2f\x16\x0a\x3d\x91\x5d\xd1\
-\xf1\xd7\x8f\xfb\xf1\x03\x00\x00\x00\x4b\x24\x8e\x04\x00\x00\x00\
-\x00\xfe\xc8\xf4\xf4\x74\xc0\xd3\x87\x87\x86\xac\x80\xbb\x3a\x7d\
-\xfa\xdd\x5a\x6d\x21\xb2\x3f\xd1\xdb\x63\x63\xab\xcc\x22\x3f\x6f\
-\x47\x57\xd7\xc4\xc4\xb9\xd1\xd1\x13\x31\xdd\x92\x97\x47\x02\x00\
-\x00\x00\x4b\x27\x8e\x04\x00\x00\x00\x08\xe9\xcf\x02\x39\x32\x38\
-\xe8\xf2\x59\x4c\xe9\xbd\x90\xdf\xd4\xde\xf6\xf8\x36\x2b\xa0\xb9\
-\x24\x49\x5e\x7b\xed\xb5\x68\xfe\x38\x85\x42\xcf\x27\x9f\x7c\xb2\
-\x7f\xff\x81\x35\xff\x37\x67\x32\x99\x17\x5e\x18\xaa\x5c\xbc\x98\
-\xcb\x75\x44\x73\x5d\x5e\x1e\x09\x00\x00\x00\x2c\x91\x38\x12\x00\
-\x00\x00\x00\xf8\x83\x4b\x95\x4a\xd8\x17\xf2\xed\xdc\xd9\x6d\x0b\
-\x34\x17\xd3\x6b\x23\xfb\x8b\xc5\x89\x89\x73\xf9\x7c\xfe\xde\x1d\
-\xb1\xa3\xab\xeb\xc7\x3f\x9e\x69\x1c\x14\xc7\x8d\x79\x79\x24\x00\
-\x00\x00\xb0\x44\xe2\x48\x00\x00\x00\x00\xe0\x0f\x7e\xfa\xf1\x4f\
-\x03\x9e\xde\x5f\x2c\x66\xb3\x59\x5b\xa0\x89\x98\x5e\x1b\x79\x6c\
-\x64\xe4\x9f\xcf\x9e\xcd\x64\x32\xf7\xfa\xa0\x7c\x3e\x7f\xea\x47\
-\x3f\x8a\xa6\x8f\xf4\xf2\x48\x00\x00\x00\x60\x29\xc4\x91\x00\x00\
-\x00\x00\xc0\x1f\x4c\x4c\x4c\x04\x3c\xbd\xeb\x89\x2e\x2b\xa0\xb9\
-\x68\x5e\x1b\x79\x6c\x64\xe4\x95\xa3\x47\xd7\xed\xb8\x4c\x26\x13\
-\x4d\x1f\x59\x2e\xcf\xce\xcf\xcf\x7b\x16\x00\x00\x00\x80\xe6\xc4\
-\x91\x00\x00\x00\x00\xc0\xef\x55\xab\xd5\x72\x79\x36\xe0\x00\xfb\
-\xf6\xf5\xd9\x02\xcd\xc5\xf1\xda\xc8\xfe\x62\x71\x3d\xcb\xc8\x9b\
-\x6e\xf6\x91\xb9\x5c\x47\x04\x17\xf8\x0f\xdf\xff\xbe\x67\x01\x00\
-\x00\x00\x68\x4e\x1c\x09\x00\x00\x00\x00\xfc\xde\xd5\xab\x57\x02\
-\x9e\x9e\xcb\x75\xe4\xf3\x79\x5b\xa0\x89\xa9\xc9\xc9\x08\x5e\x1b\
-\xd9\x5f\x2c\x9e\xfa\xd1\x8f\x82\x1c\x9d\xc9\x64\x7e\xfc\xe3\x99\
-\x08\xfa\xc8\xb1\xf1\xf1\x7a\xbd\xee\x89\x00\x00\x00\x00\x9a\x10\
-\x47\x02\x00\x00\x00\x00\xbf\x37\x35\x39\x15\xf0\xf4\xc3\x87\x0e\
-\x5b\x01\xcd\x1d\x7f\xfd\x78\xda\xff\x08\xb9\x5c\xc7\xf1\xd7\x5f\
-\xcf\x64\x32\xa1\x06\xc8\xe7\xf3\x3f\xfc\xc1\x0f\x23\xf8\x31\xfc\
-\xef\x1f\xfe\xd0\x13\x01\x00\x00\x00\x34\x21\x8e\x04\x00\x00\x00\
-\x00\x7e\x27\x49\x92\xb1\xf1\xf1\x80\x03\x6c\xdd\xba\xd5\x16\x68\
-\xe2\x52\xa5\x12\xf6\xb3\xef\x6b\xe2\x9d\xff\xf3\x4e\xf0\x37\xa4\
-\xee\xde\xb3\x67\x74\xf4\x44\xda\x6f\xf2\xe4\xa9\x93\x8d\xbf\xb5\
-\x3c\x17\x00\x00\x00\xc0\x62\xc4\x91\x00\x00\x00\x00\xc0\xef\x5c\
-\xaa\x54\xc2\x0e\xb0\xa3\xab\xcb\x16\x68\xe2\xe4\xc9\x93\x69\xff\
-\x23\x1c\x1b\x19\x69\x91\xdf\xf9\x91\x23\x7f\x53\x28\xf4\xa4\xfa\
-\x32\x6b\xb5\x85\xe0\x7f\x6b\x01\x00\x00\x00\xad\x4c\x1c\x09\x00\
-\x00\x00\x00\xfc\xce\xe5\xcb\x97\x03\x9e\x3e\x38\x30\x10\xf0\x43\
-\xc3\xb4\xbe\x7a\xbd\x1e\xf6\xcd\xa6\xab\x57\x28\xf4\x0c\xbf\xf8\
-\x62\x8b\x0c\xd3\x78\xdc\x46\x47\xdf\x4c\xfb\xaf\xe2\xad\xb7\xde\
-\xf2\x68\x00\x00\x00\x00\x8b\x11\x47\x02\x00\x00\x00\x00\xbf\x73\
-\xf2\x54\xc8\xd7\xf2\xed\xde\xb3\xdb\x0a\x68\xe2\x1f\xff\xf1\xff\
-\xa6\xfd\x8f\xf0\xda\xab\xaf\xb5\x54\x01\xdc\xd9\xd9\x79\x6c\x64\
-\x24\xd5\x57\x7a\xb6\x54\xaa\x56\xab\x9e\x0e\x00\x00\x00\xe0\x8e\
-\xc4\x91\x00\x00\x00\x00\xc0\x7d\xd5\x6a\xb5\x56\x5b\x08\x38\xc0\
-\x23\x8f\x6c\xb1\x05\x9a\xf8\xde\xf7\xbe\x97\xea\xf9\x07\x07\x06\
-\x5a\xf0\xc3\xf1\xc3\x2f\xbe\x98\xcb\x75\xa4\xfa\x62\xcf\x9d\x9b\
-\xf0\x74\x00\x00\x00\x00\x77\x24\x8e\x04\x00\x00\x00\x00\x02\x07\
-\x46\x85\x42\x4f\x3e\x9f\xb7\x05\x16\x33\x35\x39\x19\x36\xde\x5d\
-\xbd\xff\xf9\xdd\xef\xb6\xe0\x54\x99\x4c\xe6\xe5\x97\x5f\x4e\xf5\
-\xc5\xa6\xbd\x9a\x05\x00\x00\x00\xee\x1d\x71\x24\x00\x00\x00\x00\
-\x70\x5f\xe5\x62\x25\xe0\xe9\x7d\x7d\x7d\x56\x40\x13\x67\xce\x9c\
-\x49\xf5\xfc\xa3\xa3\x27\xb2\xd9\x6c\x6b\xce\x76\xe0\xc0\xc1\x54\
-\xbf\x3c\xb2\x56\x5b\xb8\x54\xa9\x78\x46\x00\x00\x00\x80\x3f\x25\
-\x8e\x04\x00\x00\x00\x80\x76\x57\xaf\xd7\xcf\x96\x4a\x01\x07\x78\
-\xec\xd1\xc7\x6c\x81\x26\xbf\xcf\xb1\xf1\xf1\xf4\xce\x9f\xcb\x75\
-\x1c\x39\xf2\x37\x2d\x3b\x5e\x04\x2f\x8f\x9c\x99\x99\xf1\x98\x00\
-\x00\x00\x00\x7f\x4a\x1c\x09\x00\x00\x00\x00\xed\x6e\xee\xda\xb5\
-\x80\xa7\xe7\x72\x1d\x3b\xba\xba\x6c\x81\xc5\xbc\xff\xfe\xff\x4b\
-\xf5\xfc\x2f\xbf\xfc\x72\x26\x93\x69\xe5\x09\xd3\xfe\xf2\xc8\x93\
-\xa7\x4e\x7a\x4c\x00\x00\x00\x80\x3f\x25\x8e\x04\x00\x00\x00\x80\
-\x76\x37\x3d\x3d\x1d\xf0\xf4\xe2\x37\x8a\x56\x40\x13\xef\xbc\xf3\
-\x4e\xaa\xe7\x3f\x70\xe0\x60\x8b\x4f\x98\xf6\x97\x47\xd6\x6a\x0b\
-\x53\x93\x93\x9e\x14\x00\x00\x00\xe0\x36\xe2\x48\x00\x00\x00\x00\
-\x68\x77\x27\x46\x47\x03\x9e\xbe\x6b\xd7\x2e\x2b\x60\x31\xd5\x6a\
-\xb5\x5c\x9e\x4d\xef\xfc\xc7\x46\x46\x5a\xfc\xb5\x91\x37\xb5\x7e\
-\xc1\xd9\x5c\xd8\xc2\x1b\x00\x00\x00\x68\x4d\xe2\x48\x00\x00\x00\
-\x00\x68\x6b\x97\x2a\x95\xb0\x03\x6c\xfe\xda\xd7\x6c\x81\xc5\x9c\
-\x3b\x37\x91\xea\xf9\xff\xf6\xb9\xe7\x52\x31\x67\x26\x93\x39\x36\
-\x32\x92\xde\x7b\x2e\xbd\x57\xf2\xb0\x00\x00\x00\x00\xb7\x11\x47\
-\x02\x00\x00\x00\x40\x5b\x9b\x99\x99\x09\x78\x7a\x7f\xb1\x98\xcd\
-\x66\x6d\x81\xc5\x4c\x4c\xa4\x38\x8e\x1c\x1c\x18\x48\xd1\xcf\xfb\
-\xeb\xcf\x3e\x9b\xde\xab\xae\xd5\x16\x82\x77\xde\x00\x00\x00\x40\
-\xab\x11\x47\x02\x00\x00\x00\x40\x5b\x9b\x3d\x3f\x1b\xf0\xf4\xa7\
-\x9f\x79\xda\x0a\x58\x4c\xda\xbf\xa9\xbd\x7f\xff\xfe\x14\x4d\xdb\
-\xd9\xd9\x59\x28\xf4\xa4\xf7\xb6\xc3\x76\xde\x00\x00\x00\x40\x0b\
-\x12\x47\x02\x00\x00\x00\x40\xfb\x0a\x1e\x9f\x75\x77\xf7\xd8\x02\
-\x8b\x49\xf5\x37\xb5\x73\xb9\x8e\xdd\x7b\xf6\xa4\x6b\xe6\xef\x7c\
-\xe7\x3b\xe9\xbd\xf0\x93\xa7\x4e\x7a\x64\x00\x00\x00\x80\xcf\x13\
-\x47\x02\x00\x00\x00\x40\xfb\xba\x7a\xf5\x4a\xc0\xd3\x73\xb9\x8e\
-\x7c\x3e\x6f\x0b\x2c\x26\xd5\xdf\xd4\x7e\xfe\xf9\xe7\x53\x37\xf3\
-\xce\x9d\xdd\xe9\xbd\xf0\x5a\x6d\xa1\x5a\xad\x7a\x6a\x00\x00\x00\
-\x80\x5b\xc4\x91\x00\x00\x00\x00\xd0\xbe\xde\xfd\xa7\x77\x03\x9e\
-\x7e\xf8\xd0\x61\x2b\x60\x31\x69\xff\xa6\xf6\xbe\x7d\x7d\xa9\x9b\
-\x39\x9b\xcd\xf6\x17\x8b\xe9\xbd\xf3\xf3\xe7\x67\x3d\x38\x00\x00\
-\x00\xc0\x2d\xe2\x48\x00\x00\x00\x00\x68\x53\x49\x92\x9c\x2d\x95\
-\x02\x0e\xd0\xdb\xdb\x6b\x0b\x2c\x26\xec\x6b\x4d\x57\xa9\x50\xe8\
-\x49\xe9\x5b\x51\x0f\x7e\xeb\x60\x7a\xaf\xfd\x83\xf7\x3f\xf0\xe0\
-\x00\x00\x00\x00\xb7\x88\x23\x01\x00\x00\x00\xa0\x4d\x5d\xaa\x54\
-\xc2\x0e\xd0\xb9\x79\xb3\x2d\xb0\x98\xb0\xaf\x35\x5d\xa5\xbe\xbe\
-\xbe\x94\x4e\x9e\xea\x2f\x6b\x9f\x2d\x95\x92\x24\xf1\xec\x00\x00\
-\x00\x00\x37\x89\x23\x01\x00\x00\x00\xa0\x4d\x5d\xbe\x7c\x39\xe0\
-\xe9\x83\x03\x03\x99\x4c\xc6\x16\xb8\xa3\xe0\xaf\x35\x5d\xa5\x34\
-\x7e\x53\xfb\xa6\xb4\x7f\x59\x7b\x7e\x6e\xce\xe3\x03\x00\x00\x00\
-\xdc\x24\x8e\x04\x00\x00\x00\x80\x36\x75\xf2\xd4\xc9\x80\xa7\xef\
-\xde\xb3\xdb\x0a\x58\x4c\xf0\xd7\x9a\xae\x46\x7a\xbf\xa9\x7d\x53\
-\xd7\x13\x5d\xe9\x1d\x7e\x66\x66\xc6\xe3\x03\x00\x00\x00\xdc\x24\
-\x8e\x04\x00\x00\x00\x80\x76\x34\x3f\x3f\x5f\xab\x2d\x04\x1c\x20\
-\xd5\x5f\xef\xe5\x5e\x0b\xfb\x5a\xd3\x55\x4a\xef\x37\xb5\x6f\x2a\
-\x14\x9e\x4c\xef\xf0\xb3\xe7\x67\x3d\x3e\x00\x00\x00\xc0\x4d\xe2\
-\x48\x00\x00\x00\x00\x68\x47\xe5\xf2\x87\x01\x4f\x2f\x14\x7a\xb2\
-\xd9\xac\x2d\xb0\x98\x54\x27\x6e\x8f\x3d\xfa\x58\xaa\x2f\xbf\xb3\
-\xb3\x33\x97\xeb\x48\xed\xdf\x6c\xb3\xf5\x7a\xdd\x13\x04\x00\x00\
-\x00\xdc\x27\x8e\x04\x00\x00\x00\x80\xf6\x54\xb9\x18\xf2\xb3\xc5\
-\x69\x7f\xb5\x1e\xf7\x54\xb5\x5a\x2d\x97\x67\xd3\x3b\xff\x8e\xae\
-\xae\xb4\xaf\xa0\xf8\x8d\x62\x7a\x87\x9f\xbb\x76\xcd\x43\x04\x00\
-\x00\x00\xdc\x27\x8e\x04\x00\x00\x00\x80\x36\x54\xaf\xd7\xcf\x96\
-\x4a\x01\x07\x48\xf5\x77\x7b\xb9\xd7\xae\x5e\xbd\x92\xde\xe1\x07\
-\x07\x06\x22\x58\xc1\xb6\xc7\xb7\xa5\x77\xf8\x7f\xfd\xb7\x7f\xf5\
-\x10\x01\x00\x00\x00\xf7\x89\x23\x01\x00\x00\x00\xa0\x0d\x5d\xb8\
-\x70\x3e\xe0\xe9\xb9\x5c\x47\x67\x67\xa7\x2d\xb0\x98\x8f\x7e\xf2\
-\x51\x7a\x87\xdf\xbe\x63\x7b\x04\x2b\x78\xe4\x91\x2d\xe9\x1d\x3e\
-\xec\x6b\x71\x01\x00\x00\x80\xd6\x21\x8e\x04\x00\x00\x00\x80\xb6\
-\x13\x36\x3e\x4b\xf5\x17\x7b\x59\x07\xa5\xf7\x4a\xe9\x1d\x7e\xcb\
-\x96\x47\x23\x58\x41\x3e\x9f\x4f\xef\xf0\x67\x4b\xa5\x24\x49\x3c\
-\x47\x00\x00\x00\x80\x38\x12\x00\x00\x00\x00\xda\x4b\x92\x24\x27\
-\x46\x47\x03\x0e\xb0\x6b\xd7\x2e\x5b\x60\x31\xd5\x6a\xb5\x56\x5b\
-\x48\xef\xfc\xd1\xbc\x15\x35\xd5\xdf\x07\x6f\xfc\x8a\x3c\x4a\x00\
-\x00\x00\x80\x38\x12\x00\x00\x00\x00\xda\xcb\xfc\xdc\x5c\xd8\x01\
-\x76\x74\x75\xd9\x02\x8b\xf9\xe4\x97\xbf\x4c\xef\xf0\xa9\x0e\x0a\
-\x6f\x93\xea\xef\x83\x5f\xb9\xf2\xb1\x47\x09\x00\x00\x00\x10\x47\
-\x02\x00\x00\x00\x40\x7b\x99\x99\x99\x09\x78\x7a\x7f\xb1\x98\xc9\
-\x64\x6c\x81\xc5\x5c\xbe\x7c\x39\xbd\xc3\xa7\x3a\x28\xbc\xcd\xc3\
-\x0f\x3d\x9c\xde\xe1\x6f\x5c\xbf\xe1\x51\x02\x00\x00\x00\xc4\x91\
-\x00\x00\x00\x00\xd0\x5e\x66\xcf\xcf\x06\x3c\xfd\xe9\x67\x9e\xb6\
-\x02\x9a\xf8\xd9\xcf\x7e\x96\xde\xe1\x53\x1d\x14\xde\x66\xd3\x83\
-\x0f\xa6\x77\xf8\xd2\x7b\x25\x8f\x12\x00\x00\x00\x20\x8e\x04\x00\
-\x00\x00\x80\x36\x52\xad\x56\xcb\xe5\xd9\x80\x03\x74\x77\xf7\xd8\
-\x02\x8b\x49\x92\xe4\x6c\x29\xc5\x59\x5b\xe7\xe6\xcd\xd1\xec\x22\
-\x9b\xcd\xe6\x72\x1d\x29\x1d\xbe\x56\x5b\xa8\xd7\xeb\x1e\x28\x00\
-\x00\x00\x68\x73\xe2\x48\x00\x00\x00\x00\x68\x23\xe7\x83\xbe\x36\
-\xb2\x50\xe8\xc9\xe7\xf3\xb6\xc0\x62\xaa\xd5\x6a\x7a\x87\x6f\xfc\
-\xbc\x23\xfb\x64\x7c\xef\x93\xbd\xe9\x1d\xfe\xb3\xcf\x3e\xf3\x40\
-\x01\x00\x00\x40\x9b\x13\x47\x02\x00\x00\x00\x40\x1b\xf9\xe0\xfd\
-\x0f\x02\x9e\xde\xe3\xb5\x91\x34\x75\xe5\xca\xc7\xe9\x1d\xfe\x81\
-\xaf\x3e\x10\xd9\x3a\xb6\xef\xd8\xee\xb7\x04\x00\x00\x00\xa4\x97\
-\x38\x12\x00\x00\x00\x00\xda\x45\xf0\x6f\x16\xf7\xf6\xf6\xda\x02\
-\x4d\xdc\xb8\x7e\x23\xbd\xc3\xa7\x3a\x25\xbc\xa3\x8d\x5f\xde\xe8\
-\xb7\x04\x00\x00\x00\xa4\x97\x38\x12\x00\x00\x00\x00\xda\xc5\xa5\
-\x4a\x25\xec\x00\x9d\x9b\x37\xdb\x02\x4d\x5c\x9b\xbb\x96\xde\xe1\
-\x1f\x7e\xe8\xe1\xc8\xd6\xb1\xe9\xc1\x07\xd3\x3b\xfc\xc2\xc2\x82\
-\x07\x0a\x00\x00\x00\xda\x9c\x38\x12\x00\x00\x00\x00\xda\xc5\xf4\
-\xf4\x74\xc0\xd3\x87\x87\x86\x32\x99\x8c\x2d\xb0\x98\x24\x49\xca\
-\xe5\xd9\xf4\xce\xbf\xe1\x4b\x5f\x8a\x6c\x23\xf9\x7c\x3e\xbd\xc3\
-\x87\x7d\x4b\x2e\x00\x00\x00\xd0\x0a\xc4\x91\x00\x00\x00\x00\xd0\
-\x2e\x4a\xef\x85\xac\x85\xb6\x3d\xbe\xcd\x0a\x68\xa2\x5a\xad\xa6\
-\x7a\xfe\x54\xa7\x84\x8b\x29\x14\x7a\xd2\x3b\xfc\xfc\xfc\xbc\xc7\
-\x0a\x00\x00\x00\xda\x99\x38\x12\x00\x00\x00\x00\xda\xc2\xfc\xfc\
-\x7c\xad\x16\xf2\x3b\xb3\x3b\x77\x76\xdb\x02\x4d\xfc\xe2\x17\x3f\
-\x4f\xef\xf0\xfd\xc5\x62\x94\x4b\x79\xe0\xab\x0f\xa4\x77\xf8\xe4\
-\x3f\xfe\xc3\x63\x05\x00\x00\x00\xed\x4c\x1c\x09\x00\x00\x00\x00\
-\x6d\xa1\x5c\xfe\x30\xe0\xe9\xfd\xc5\x62\x36\x9b\xb5\x05\x9a\xf8\
-\xf4\xd3\x4f\xd3\x3b\x7c\x47\x47\x47\x94\x4b\xd9\xbe\x63\x7b\x7a\
-\x87\xff\x79\x9a\x73\x5b\x00\x00\x00\x60\xf5\xc4\x91\x00\x00\x00\
-\x00\xd0\x16\x26\x26\x26\x02\x9e\xde\xf5\x44\x97\x15\xd0\xdc\xf5\
-\x7f\xb9\x9e\xde\xe1\xff\xe2\x2f\xff\xc2\x06\x5b\xcd\x8d\xeb\x37\
-\x5c\x02\x00\x00\x00\xb4\x33\x71\x24\x00\x00\x00\x00\xc4\xaf\x5e\
-\xaf\x97\xcb\xb3\x01\x07\x28\x14\x9e\xb4\x05\x9a\x9b\xf9\x70\x26\
-\xbd\xc3\x6f\xfc\xf2\xc6\x28\x97\xb2\x65\xcb\xa3\xe9\x1d\xfe\x37\
-\xbf\xf9\x8d\xc7\x0a\x00\x00\x00\xda\x99\x38\x12\x00\x00\x00\x00\
-\xe2\x77\xe1\xc2\xf9\x80\xa7\xe7\x72\x1d\x9d\x9d\x9d\xb6\x40\x13\
-\x49\x92\xd4\x6a\x0b\xe9\x9d\x7f\xc3\x97\xbe\x14\xe5\x5e\x32\x99\
-\x4c\x7a\x87\x1f\x1b\x1f\xf7\x64\x01\x00\x00\x40\x3b\x13\x47\x02\
-\x00\x00\x00\x40\xfc\xa6\x26\xa7\x02\x9e\x7e\xf8\xd0\x61\x2b\xa0\
-\xb9\x6a\xb5\x9a\xea\xf9\xf3\xf9\x7c\x94\x7b\x49\xfb\x9f\x2b\x49\
-\x12\x0f\x17\x00\x00\x00\xb4\x2d\x71\x24\x00\x00\x00\x00\x44\x2e\
-\x49\x92\xb0\x6f\x50\xdb\xba\x75\xab\x2d\xd0\xdc\x67\xbf\xfa\x55\
-\xaa\xe7\x4f\xf5\x1b\x16\x9b\xcb\xe5\x3a\xd2\x3b\x7c\xda\xa3\x5b\
-\x00\x00\x00\x60\x35\xc4\x91\x00\x00\x00\x00\x10\xb9\xf9\xb9\xb9\
-\xb0\x03\xec\xe8\xea\xb2\x05\x9a\xfb\xf4\xdf\x3f\x4d\xef\xf0\xfd\
-\xc5\x62\xc4\xab\xe9\x7d\xb2\xf7\xff\xb3\x77\xbf\xb1\x71\xd7\x77\
-\x9e\xc0\x9b\x53\x1f\x0e\x8d\xf7\xd1\xa4\xda\x2e\x33\x61\x28\xdd\
-\x5e\x43\xc7\x21\xa0\x50\x32\x10\x1b\x4b\x8e\x17\x8e\x90\x8e\x17\
-\xd2\xbd\x63\x8f\xc4\xa6\xd2\xb6\xab\xed\xe2\x54\x6a\x75\x3d\x91\
-\x38\x45\x5b\xa9\x48\x24\x6d\x57\xb7\xe5\x54\xec\x04\x1d\x77\x5b\
-\xda\x8d\xdb\x9a\x26\x24\x11\xc6\x4e\x18\xd3\x44\x21\xc4\xa3\x04\
-\x75\x49\x33\xcd\x38\x85\x25\xf3\x68\x03\x99\xe7\x3e\xb7\x59\xb1\
-\x2c\xa5\x90\xc4\x7f\xbe\xbf\xef\x6f\x5e\x2f\xf1\x80\xad\xb6\x7c\
-\x3f\xf3\x79\xfb\x67\xa1\xe9\x3b\xdf\x5f\xbc\xc3\xc7\x5e\xba\x05\
-\x00\x00\x00\xe6\x42\x39\x12\x00\x00\x00\x00\x52\x6e\x6c\x6c\x2c\
-\xe0\xe9\xbd\xe5\x72\x8a\x2f\xd5\x63\xbe\xbc\x7a\xea\xd5\x78\x87\
-\x6f\x6b\x6b\x93\x60\x32\x45\x5d\xba\x05\x00\x00\x00\xe6\x48\x39\
-\x12\x00\x00\x00\x00\x52\x6e\xd7\xee\x5d\x01\x4f\xdf\xf8\x85\x8d\
-\x22\xe0\x43\xbd\xf5\xd6\x5b\xf1\x0e\x7f\xed\xb5\xd7\xa6\x38\x9a\
-\x15\x37\xae\x88\x77\xf8\xb7\xdf\x7e\xdb\xc3\x05\x00\x00\x00\x2d\
-\x4b\x39\x12\x00\x00\x00\x00\xd2\xac\x56\xab\xd5\xeb\xd3\x01\x07\
-\xb8\xe9\xa6\x55\x52\xe0\x43\x0d\x0d\x0f\xc7\x3b\xfc\x27\xfe\xe4\
-\x13\x29\x8e\xe6\x63\x1f\xfb\x58\xbc\xc3\x9f\x3a\x79\xca\xc3\x05\
-\x00\x00\x00\x2d\x4b\x39\x12\x00\x00\x00\x00\xd2\xec\xd0\xa1\x89\
-\x80\xa7\x77\x76\x76\x14\x0a\x05\x29\x90\x6e\xd7\x5c\x73\x8d\x4f\
-\x97\x4c\x17\x2e\x5c\xf0\xf3\x09\x00\x00\x00\x2d\x4b\x39\x12\x00\
-\x00\x00\x00\xd2\x6c\xdf\xde\x7d\x01\x4f\xef\x58\xdb\x21\x02\x3e\
-\x54\xb5\x5a\x8d\x7a\xfe\x1b\x6e\xf8\x54\x8a\xd3\x89\xfa\xd3\xed\
-\x19\x19\xf1\x7c\x01\x00\x00\x40\xcb\x52\x8e\x04\x00\x00\x00\x80\
-\xd4\x6a\x34\x1a\x61\xbb\x41\x5d\x5d\x5d\x52\x00\x00\x00\x00\x00\
-\x16\x9f\x72\x24\x00\x00\x00\x00\xa4\xd6\xd4\x89\x13\x61\x07\x58\
-\x53\x2a\x49\x81\x0f\x75\xfa\xf4\x6b\x51\xcf\xbf\x6c\xd9\xb2\x14\
-\xa7\x13\xfb\xa7\xab\xd5\x6a\x1e\x31\x00\x00\x00\x68\x4d\xca\x91\
-\x00\x00\x00\x00\x90\x5a\x07\x0f\x1e\x0c\x78\xfa\x96\x81\x01\x11\
-\x70\x39\x2e\x5e\xbc\x18\xf5\xfc\xd9\x6c\x36\xc5\xe9\xc4\xfe\xe9\
-\x9a\xcd\xa6\x47\x0c\x00\x00\x00\x5a\x93\x72\x24\x00\x00\x00\x00\
-\xa4\xd6\xc8\x4f\x42\xbe\x53\xbb\xbb\xbb\x5b\x04\x5c\x8e\xd7\x7f\
-\xf3\xba\x25\x00\x00\x00\x00\x30\xbf\x94\x23\x01\x00\x00\x00\x20\
-\x9d\x26\x2b\x95\x7a\x7d\x3a\xe0\x00\xed\x2b\x57\x4a\x81\xcb\x71\
-\xee\xdc\xb9\x78\x87\xef\xec\xec\x48\x7d\x40\xf9\x7c\x2e\xde\xe1\
-\x8f\x1f\x7f\xd9\x23\x06\x00\x00\x00\xad\x49\x39\x12\x00\x00\x00\
-\x00\xd2\xe9\xd8\xcb\xc7\x02\x9e\xde\x5b\x2e\xa7\xfb\x5d\xc3\x70\
-\xc9\x75\xcb\xaf\x4b\xfd\x67\xec\xba\xb3\x4b\xd0\x00\x00\x00\x40\
-\x74\x94\x23\x01\x00\x00\x00\x20\x9d\x46\x47\x47\x03\x9e\x5e\xba\
-\xbd\x24\x02\x2e\xd3\xd8\x0b\x63\x96\x00\x00\x00\x00\xc0\xfc\x52\
-\x8e\x04\x00\x00\x00\x80\x14\xaa\xd5\x6a\xe3\xe3\x13\x01\x07\xb8\
-\xe7\x9e\xf5\x52\xe0\x32\x85\x7d\xff\x3b\xe9\xf6\xd2\xe4\x4b\x96\
-\x00\x00\x00\x00\xad\x49\x39\x12\x00\x00\x00\x00\x52\xe8\x95\x57\
-\x8e\x07\x3c\x3d\x9f\xcf\x15\x0a\x05\x29\xd0\x0a\x56\xdc\xb8\x22\
-\xf5\x9f\x71\xe9\xd2\xa5\x82\x06\x00\x00\x00\xa2\xa3\x1c\x09\x00\
-\x00\x00\x00\x29\x74\x60\xff\x81\x80\xa7\x6f\xde\xb4\x59\x04\x5c\
-\xa6\x5a\xad\x16\xf5\xfc\x1f\xfb\xd8\xc7\x52\x9f\xd1\x67\x56\x7c\
-\xc6\x0f\x2a\x00\x00\x00\x10\x1d\xe5\x48\x00\x00\x00\x00\x48\x9b\
-\x66\xb3\x39\x34\x3c\x1c\x70\x80\xd5\xab\x57\x4b\x81\xcb\xff\x71\
-\xb5\x04\x16\xce\x85\x0b\x17\x2c\x01\x00\x00\x00\x5a\x93\x72\x24\
-\x00\x00\x00\x00\xa4\xcd\x64\xa5\x12\x76\x80\x35\xa5\x92\x14\x80\
-\x24\xd8\x33\x32\x62\x09\x00\x00\x00\xd0\x9a\x94\x23\x01\x00\x00\
-\x00\x20\x6d\x8e\x1e\x3d\x1a\xf0\xf4\xfe\xbe\xbe\x4c\x26\x23\x05\
-\x2e\x53\xf3\xe2\x45\x4b\x00\x00\x00\x00\x60\xde\x29\x47\x02\x00\
-\x00\x00\x40\xda\xec\xda\xbd\x2b\xe0\xe9\xeb\x7a\xd6\x89\x80\xcb\
-\xf7\xda\xe9\xd7\xa2\x9e\x7f\xd5\xaa\x9b\x85\x08\x00\x00\x00\x90\
-\x40\xca\x91\x00\x00\x00\x00\x90\x2a\xb5\x5a\xad\x5e\x9f\x0e\x38\
-\xc0\x4d\x37\xad\x92\x02\xa4\x89\x02\x28\x00\x00\x00\x10\x23\xe5\
-\x48\x00\x00\x00\x00\x48\x95\x67\x9f\x1d\x0d\x78\x7a\x67\x67\x47\
-\xa1\x50\x90\x02\x90\x1c\xcd\x66\xd3\x12\x00\x00\x00\xa0\x05\x29\
-\x47\x02\x00\x00\x00\x40\xaa\x54\x5e\xac\x04\x3c\x7d\xfd\xfa\xf5\
-\x22\x00\x12\xa5\x56\xab\x59\x02\x00\x00\x00\xb4\x20\xe5\x48\x00\
-\x00\x00\x00\x48\x8f\x46\xa3\xb1\x67\x64\x24\xe0\x00\xb7\xdc\x7c\
-\x8b\x14\xb8\x22\xaf\xff\xe6\x75\x4b\x00\x00\x00\x00\x60\xde\x29\
-\x47\x02\x00\x00\x00\x40\x7a\x1c\x3e\x7c\x28\xe0\xe9\xf9\x7c\x6e\
-\x4d\xa9\x24\x05\xae\xc8\xb9\x73\xe7\x2c\x01\x00\x00\x00\x80\x79\
-\xa7\x1c\x09\x00\x00\x00\x00\xe9\x71\xe4\x17\x47\x02\x9e\x5e\xfe\
-\x7c\x59\x04\x00\x00\x00\x00\x40\x12\x28\x47\x02\x00\x00\x00\x40\
-\x7a\xec\xd8\xb9\x33\xe0\xe9\xdd\xdd\xdd\x22\x00\x00\x00\x00\x00\
-\x92\x40\x39\x12\x00\x00\x00\x00\x52\x62\xb2\x52\x09\x3b\x40\xfb\
-\xca\x95\x52\x00\x00\x00\x00\x00\x92\x40\x39\x12\x00\x00\x00\x00\
-\x52\x62\x6c\x6c\x2c\xe0\xe9\xbd\xe5\x72\x36\x9b\x95\x02\xad\x66\
-\xd9\xb2\x65\x96\x00\x00\x00\x00\x90\x40\xca\x91\x00\x00\x00\x00\
-\x90\x12\x13\x87\x26\x02\x9e\x7e\xd7\xdd\x77\x89\x80\x16\xa4\x13\
-\x0c\x00\x00\x00\x90\x4c\xca\x91\x00\x00\x00\x00\x90\x06\xb5\x5a\
-\x6d\x7c\x7c\x22\xe0\x00\x6b\xd7\x76\x48\x01\x00\x00\x00\x00\x48\
-\x08\xe5\x48\x00\x00\x00\x00\x48\x83\x57\x5e\x39\x1e\xf0\xf4\x7c\
-\x3e\x57\x28\x14\xa4\x00\xa9\x54\x2c\x16\x2d\x01\x00\x00\x00\x88\
-\x8e\x72\x24\x00\x00\x00\x00\xa4\xc1\x33\x3f\x7c\x26\xe0\xe9\x9b\
-\x37\x6d\x16\x01\x00\x00\x00\x00\x90\x1c\xca\x91\x00\x00\x00\x00\
-\x10\xbd\x66\xb3\xb9\x67\x64\x24\xe0\x00\x5d\x5d\x5d\x52\x00\x00\
-\x00\x00\x00\x92\x43\x39\x12\x00\x00\x00\x00\xa2\x37\x59\xa9\x84\
-\x1d\xa0\xd8\xde\x2e\x05\x00\x00\x00\x00\x20\x39\x94\x23\x01\x00\
-\x00\x00\x20\x7a\x47\x8f\x1e\x0d\x78\x7a\x7f\x5f\x5f\x26\x93\x91\
-\x02\x00\x00\x00\x00\x90\x1c\xca\x91\x00\x00\x00\x00\x10\xbd\x5d\
-\xbb\x77\x05\x3c\x7d\x5d\xcf\x3a\x11\x00\x00\x00\x00\x00\x89\xa2\
-\x1c\x09\x00\x00\x00\x00\x71\xab\x56\xab\xf5\xfa\x74\xc0\x01\xee\
-\xb8\x63\xad\x14\x20\xc5\x6a\xb5\x9a\x25\x00\x00\x00\x00\xd1\x51\
-\x8e\x04\x00\x00\x00\x80\xb8\x8d\x8f\xbf\x10\xf0\xf4\xce\xce\x8e\
-\x6c\x36\x2b\x05\x48\xb1\x66\xb3\x69\x09\x00\x00\x00\x40\x74\x3e\
-\x6a\x05\x00\x00\x00\x40\x10\xd5\x6a\xb5\xbd\xbd\xdd\x1e\x42\x19\
-\x1a\x1e\x9e\xfd\xcb\x1e\x66\x66\x66\x52\xf0\x29\x46\x47\x47\x03\
-\x9e\xbe\x7e\xfd\x7a\x3f\x48\x00\x00\x00\x00\x40\xd2\x28\x47\x02\
-\x00\x00\x00\x40\xc4\x1a\x8d\xc6\xf8\xf8\x44\xc0\x01\x3a\x3b\xef\
-\x8c\x68\x5d\x6a\xd9\xf3\x25\x1d\xc5\x62\x00\x00\x00\x00\x52\xcc\
-\x6b\xb5\x01\x00\x00\x00\x20\x62\x87\x0f\x1f\x0a\x78\x7a\x3e\x9f\
-\x2b\x16\x8b\x52\xa0\x95\x35\x1a\x0d\x4b\x00\x00\x00\x00\x48\x20\
-\xe5\x48\x00\x00\x00\x00\x88\xd8\x91\x5f\x1c\x09\x78\x7a\xf9\xf3\
-\x65\x11\xd0\xe2\xce\x9f\x3f\x6f\x09\x00\x00\x00\x00\x09\xa4\x1c\
-\x09\x00\x00\x00\x00\xb1\x6a\x36\x9b\x3b\x76\xee\x0c\x38\x40\x77\
-\x77\xb7\x14\x00\x00\x00\x00\x80\x04\x52\x8e\x04\x00\x00\x00\x80\
-\x58\x55\xa7\xa6\xc2\x0e\xb0\xa6\x54\x92\x02\x00\x00\x00\x00\x90\
-\x40\xca\x91\x00\x00\x00\x00\x10\xab\xb1\xb1\xb1\x80\xa7\xf7\x96\
-\xcb\x99\x4c\x46\x0a\xcc\xd1\x6d\x6b\x6e\xb3\x04\x16\x54\xa1\x50\
-\xb0\x04\x00\x00\x00\x68\x41\xca\x91\x00\x00\x00\x00\x10\xab\x89\
-\x43\x13\x01\x4f\xbf\xeb\xee\xbb\x44\x00\x24\x9f\x1a\x37\x00\x00\
-\x00\xb4\x26\xe5\x48\x00\x00\x00\x00\x88\x52\xad\x56\x1b\x1f\x9f\
-\x08\x38\xc0\xda\xb5\x1d\x52\x00\x00\x00\x00\x00\x92\x49\x39\x12\
-\x00\x00\x00\x00\xa2\x74\x28\xe8\xb5\x91\x9d\x9d\x1d\xde\x54\x0b\
-\x2d\xe2\xf4\xe9\xd7\x2c\x01\x00\x00\x00\x88\x8e\x72\x24\x00\x00\
-\x00\x00\x44\x69\xdf\xde\x7d\x01\x4f\xef\x70\x6d\x24\xb4\x8c\x8b\
-\x17\x2f\x5a\x02\x00\x00\x00\x10\x1d\xe5\x48\x00\x00\x00\x00\x88\
-\x4f\xb3\xd9\xdc\x33\x32\x12\x70\x80\xae\xae\x2e\x29\x30\x2f\x56\
-\xad\xba\xd9\x12\x58\x38\xbd\xe5\xb2\x25\x00\x00\x00\x40\x6b\x52\
-\x8e\x04\x00\x00\x00\x80\xf8\x4c\x56\x2a\x61\x07\x28\xb6\xb7\x4b\
-\x01\x66\x1d\x3f\xfe\xb2\x25\x24\x59\x5b\x5b\x9b\x25\x00\x00\x00\
-\x40\x6b\x52\x8e\x04\x00\x00\x00\x80\xf8\x1c\x3c\x78\x30\xe0\xe9\
-\x5b\x06\x06\x32\x99\x8c\x14\x00\x00\x00\x00\x80\xc4\x52\x8e\x04\
-\x00\x00\x00\x80\xf8\x8c\xfc\x24\xe4\x3b\xb5\x6f\xfd\xdc\xad\x22\
-\x60\xbe\x28\xda\x26\xdf\xdb\x6f\xbf\x6d\x09\x00\x00\x00\x40\x74\
-\x94\x23\x01\x00\x00\x00\x20\x32\x93\x95\x4a\xbd\x3e\x1d\x70\x80\
-\x3b\xee\x58\x2b\x05\xe6\x4b\xa1\x50\xb0\x84\x84\x3b\x75\xf2\x54\
-\xbc\xc3\xdf\xb6\xe6\x36\x09\x02\x00\x00\x40\x6b\x52\x8e\x04\x00\
-\x00\x00\x80\xc8\x1c\x7b\xf9\x58\xc0\xd3\x7b\xcb\xe5\x6c\x36\x2b\
-\x05\xb8\xc4\xad\x8a\x00\x00\x00\x00\xc9\xa4\x1c\x09\x00\x00\x00\
-\x00\x91\x19\x1d\x1d\x0d\x78\x7a\xe9\xf6\x92\x08\x98\x5f\xf9\x7c\
-\x2e\xde\xe1\xa3\xbe\x55\x11\x00\x00\x00\x20\xc5\x94\x23\x01\x00\
-\x00\x00\x20\x26\x8d\x46\x63\x7c\x7c\x22\xe0\x00\x9d\x9d\x77\x4a\
-\x81\xf9\xd5\x75\x67\x97\x25\x24\xd9\x85\x0b\x17\xe2\x1d\xfe\x53\
-\x37\x7c\x4a\x82\x00\x00\x00\xd0\x9a\x94\x23\x01\x00\x00\x00\x20\
-\x26\x87\x0f\x1f\x0a\x78\x7a\x3e\x9f\x2b\x16\x8b\x52\x80\x96\xb2\
-\x67\x64\x24\xde\xe1\x33\xd7\x5c\x23\x41\x00\x00\x00\x68\x4d\xca\
-\x91\x00\x00\x00\x00\x10\x93\x03\xfb\x0f\x04\x3c\x7d\xf3\xa6\xcd\
-\x22\x60\xde\x5d\x7b\xed\xb5\xf1\x0e\xff\xeb\xb3\xbf\x96\x20\x00\
-\x00\x00\x40\x02\x29\x47\x02\x00\x00\x00\x40\x34\x9a\xcd\xe6\xd0\
-\xf0\x70\xc0\x01\x56\xaf\x5e\x2d\x05\xe6\xdd\x27\xfe\xe4\x13\xf1\
-\x0e\x1f\xf6\x35\xf7\x7c\x28\x97\xdd\x02\x00\x00\x40\xcb\x52\x8e\
-\x04\x00\x00\x00\x80\x68\x54\xa7\xa6\xc2\x0e\xb0\xa6\x54\x92\x02\
-\xb4\xd6\xaf\x9d\x6a\xd5\x12\x00\x00\x00\x80\x18\x29\x47\x02\x00\
-\x00\x00\x40\x34\xc6\xc6\xc6\x02\x9e\xde\x5b\x2e\x67\x32\x19\x29\
-\x30\xef\x56\xad\xba\x39\xea\xf9\x1b\x8d\x86\x10\x93\xa9\xb3\xb3\
-\xc3\x12\x00\x00\x00\xa0\x65\x29\x47\x02\x00\x00\x00\x40\x34\x76\
-\xed\xde\x15\xf0\xf4\x8d\x5f\xd8\x28\x02\xf8\x7d\xe7\xcf\x9f\xb7\
-\x84\x64\xba\x6e\xf9\x75\x96\x00\x00\x00\x00\x2d\x4b\x39\x12\x00\
-\x00\x00\x00\xe2\x50\xab\xd5\xea\xf5\xe9\x80\x03\xdc\x74\xd3\x2a\
-\x29\xb0\x10\x8a\xc5\xa2\x25\x24\xd6\xf1\xe3\x2f\xc7\x3b\xfc\xd2\
-\xa5\x4b\x25\x08\x00\x00\x00\x2d\x4b\x39\x12\x00\x00\x00\x00\xe2\
-\x70\xe8\xd0\x44\xc0\xd3\x3b\x3b\x3b\x0a\x85\x82\x14\xe0\xf7\x9d\
-\x3e\xfd\x9a\x25\x24\xd3\x67\x56\x7c\xc6\x12\x00\x00\x00\xa0\x65\
-\x29\x47\x02\x00\x00\x00\x40\x1c\xf6\xed\xdd\x17\xf0\xf4\x8e\xb5\
-\x1d\x22\x60\xe1\xf4\x96\xcb\xf1\x0e\x7f\xf1\xe2\xc5\x14\x47\xf3\
-\xfa\x6f\x5e\x8f\x77\xf8\x6b\xae\xb9\xc6\xc3\x05\x00\x00\x00\x2d\
-\x4b\x39\x12\x00\x00\x00\x00\x22\xd0\x68\x34\xf6\x8c\x8c\x04\x1c\
-\xa0\xab\xab\x4b\x0a\x2c\x9c\xb6\xb6\xb6\x78\x87\x7f\xfb\xed\xb7\
-\x53\x1c\xcd\xb9\x73\xe7\xe2\x1d\xfe\x86\x1b\x3e\xe5\xe1\x02\x00\
-\x00\x80\x96\xa5\x1c\x09\x00\x00\x00\x00\x11\x98\x3a\x71\x22\xec\
-\x00\x6b\x4a\x25\x29\xb0\x70\x6e\x5b\x73\x5b\xbc\xc3\x9f\x3a\x79\
-\x2a\xc5\xd1\x5c\xb8\x70\x21\xde\xe1\x33\x99\x8c\x87\x0b\x00\x00\
-\x00\x5a\x96\x72\x24\x00\x00\x00\x00\x44\xe0\xe0\xc1\x83\x01\x4f\
-\xdf\x32\x30\x20\x02\x16\x54\xd4\xaf\x3f\x8e\xba\x3e\xf8\xa1\xc2\
-\xde\x59\x3b\x47\x85\x42\xc1\xc3\x05\x00\x00\x00\x2d\x4b\x39\x12\
-\x00\x00\x00\x00\x22\xb0\x63\xe7\xce\x80\xa7\x77\x77\x77\x8b\x80\
-\x05\x15\xf5\xeb\x8f\xa3\xae\x0f\x7e\xb0\x66\xb3\x19\xef\xf0\x9d\
-\x9d\x1d\x9e\x2c\x00\x00\x00\x68\x65\xca\x91\x00\x00\x00\x00\x90\
-\x74\x93\x95\x4a\xd8\x01\xda\x57\xae\x94\x02\x0b\x6a\xd9\xb2\x65\
-\x51\xcf\x1f\x75\x89\xf0\x03\xd4\x6a\xb5\x78\x87\xbf\x6e\xf9\x75\
-\x9e\x2c\x00\x00\x00\x68\x65\xca\x91\x00\x00\x00\x00\x90\x74\xc7\
-\x5e\x3e\x16\xf0\xf4\xde\x72\x39\x9b\xcd\x4a\x81\x05\x15\xfb\xcf\
-\x58\xd4\x25\xc2\x0f\xd0\xbc\x78\x31\xde\xe1\x57\xdc\xb8\xc2\x93\
-\x05\x00\x00\x00\xad\x4c\x39\x12\x00\x00\x00\x00\x92\x6e\x74\x74\
-\x34\xe0\xe9\xa5\xdb\x4b\x22\x60\x11\xf4\xf7\xf5\xc5\x3b\xfc\xf9\
-\x37\xdf\x4c\x65\x28\xaf\x9d\x7e\x2d\xde\xe1\xff\xf8\x8f\xff\xd8\
-\x63\x05\x00\x00\x00\xad\x4c\x39\x12\x00\x00\x00\x00\x12\xad\x56\
-\xab\x8d\x8f\x4f\x04\x1c\xe0\x9e\x7b\xd6\x4b\x81\x45\xb0\x74\xe9\
-\xd2\x78\x87\x7f\xe3\x5f\xde\x48\x65\x28\xaf\xff\xe6\xf5\x78\x87\
-\xbf\xe1\x86\x4f\x79\xac\x00\x00\x00\xa0\x95\x29\x47\x02\x00\x00\
-\x00\x40\xa2\xbd\xf2\xca\xf1\x80\xa7\xe7\xf3\xb9\x42\xa1\x20\x05\
-\x16\xc1\x67\x56\x7c\x26\xde\xe1\x5f\x3d\xf5\x6a\x2a\x43\x39\x77\
-\xee\x5c\xbc\xc3\xfb\xdd\x05\x00\x00\x00\x2d\x4e\x39\x12\x00\x00\
-\x00\x00\x12\xed\xc0\xfe\x03\x01\x4f\xdf\xbc\x69\xb3\x08\x58\x1c\
-\xab\x56\xdd\x1c\xef\xf0\x6f\xbd\xf5\x56\x2a\x43\x19\x7b\x61\x2c\
-\xd2\xc9\xf3\xf9\x5c\x26\x93\xf1\x58\x01\x00\x00\x40\x2b\x53\x8e\
-\x04\x00\x00\x00\x80\xe4\x6a\x36\x9b\x43\xc3\xc3\x01\x07\x58\xbd\
-\x7a\xb5\x14\x58\x1c\xcb\x96\x2d\x8b\x77\xf8\xb0\xcf\xe9\xc2\xfd\
-\xfe\xa9\xd7\xa7\x23\x1d\xbe\xeb\xce\x2e\xcf\x14\x00\x00\x00\xb4\
-\xb8\x8f\x5a\x01\x00\x00\x00\x10\x44\xa1\x50\x98\x9a\x9a\xb2\x87\
-\xf6\xf6\xf6\x20\xe7\xf6\x96\xcb\x8f\x6c\xdd\x6a\xff\xc9\x37\x59\
-\xa9\x84\x1d\x60\x4d\xa9\x24\x05\x16\x47\x36\x9b\x8d\x7a\xfe\x46\
-\xa3\x11\xfb\x47\x78\x8f\x5a\xad\x16\xef\xf0\x2b\x6e\x5c\xe1\x99\
-\x02\x00\x00\x80\x16\xa7\x1c\x09\x00\x00\x00\x84\x91\xc9\x64\x8a\
-\xc5\xa2\x3d\x84\xd2\xd6\xd6\x66\xff\x51\x38\x7a\xf4\x68\xc0\xd3\
-\xfb\xfb\xfa\xbc\x97\x96\x45\xfe\x91\x8b\xf7\x0a\xc6\x33\xbf\xfa\
-\x55\xca\xca\x91\xa7\x4f\xbf\x16\xef\xf0\x9f\xfe\xd3\x4f\x7b\xa0\
-\x00\x00\x00\xa0\xc5\x79\xad\x36\x00\x00\x00\x00\x24\xd7\xae\xdd\
-\xbb\x02\x9e\xbe\xae\x67\x9d\x08\x58\x4c\x51\xdf\xf6\xf7\x5a\xcc\
-\x55\xc2\xf7\xf5\xc6\x1b\x6f\xc4\x3b\xfc\xb2\x8f\x7f\xdc\x03\x05\
-\x00\x00\x00\x2d\x4e\x39\x12\x00\x00\x00\x00\x12\xaa\x56\xab\xd5\
-\xeb\xd3\x01\x07\xb8\xe9\xa6\x55\x52\x60\x31\x45\x7d\xdb\xdf\xab\
-\xa7\x5e\x4d\x59\x1c\xa7\x4e\x9e\x8a\x77\x78\xb7\x23\x03\x00\x00\
-\x00\x5e\xab\x0d\x00\x00\x00\x00\x09\xf5\xec\xb3\xa3\x01\x4f\xef\
-\xec\xec\x28\x14\x0a\x29\x5b\x69\xb1\x58\x9c\x99\x99\xf1\xa3\x95\
-\x58\xd7\x7f\xf2\x93\xf1\x0e\x7f\x62\xea\x44\xca\xe2\x88\xf7\x15\
-\xe7\xbd\xe5\xb2\xa7\x09\x00\x00\x00\x70\x73\x24\x00\x00\x00\x00\
-\x24\x54\xe5\xc5\x4a\xc0\xd3\xd7\xaf\x5f\x2f\x02\x16\x59\xa1\x50\
-\xc8\xe7\x73\x91\x0e\x3f\x3e\x3e\xd1\x6c\x36\x53\x93\x45\xad\x56\
-\x8b\x77\xf8\xcf\x7e\xf6\xb3\x9e\x26\x00\x00\x00\x40\x39\x12\x00\
-\x00\x00\x00\x92\xa8\xd1\x68\xec\x19\x19\x09\x38\xc0\x2d\x37\xdf\
-\x22\x05\x16\x5f\xd7\x9d\x5d\xf1\x0e\x5f\x9d\x9a\x4a\x4d\x10\x67\
-\x7e\xf5\xab\x78\x87\x5f\xbd\x7a\xb5\x47\x09\x00\x00\x00\x50\x8e\
-\x04\x00\x00\x00\x80\x24\x3a\x7c\xf8\x50\xc0\xd3\xf3\xf9\xdc\x9a\
-\x52\x49\x0a\x2c\xbe\xdb\xd6\xdc\x16\xef\xf0\xaf\x9d\x7e\x2d\x35\
-\x41\xfc\xf2\x9f\x7f\x19\xef\xf0\x51\xbf\x9f\x1d\x00\x00\x00\x98\
-\x2f\xca\x91\x00\x00\x00\x00\x90\x44\x47\x7e\x71\x24\xe0\xe9\xe5\
-\xcf\x97\x45\x40\x10\xab\x56\xdd\x1c\xef\xf0\x2f\x4d\xbe\x94\x9a\
-\x20\x4e\x9d\x3c\x15\xef\xf0\x85\x42\xc1\xa3\x04\x00\x00\x00\x28\
-\x47\x02\x00\x00\x00\x40\x12\xed\xd8\xb9\x33\xe0\xe9\xdd\xdd\xdd\
-\x22\x20\x88\xa8\x6b\x6d\x43\xc3\xc3\xa9\x09\x22\xde\xcf\xd2\xdf\
-\xd7\xe7\x39\x02\x00\x00\x00\x3e\xa2\x1c\x09\x00\x00\x00\x00\x09\
-\x34\x59\xa9\x84\x1d\xa0\x7d\xe5\x4a\x29\x10\x44\x26\x93\xe9\x2d\
-\x47\x7c\x71\x69\xb5\x5a\x4d\x41\x0a\x51\x7f\x8a\xa8\xdf\xcc\x0e\
-\x00\x00\x00\xcc\x23\xe5\x48\x00\x00\x00\x00\x48\x9c\xb1\xb1\xb1\
-\x80\xa7\xf7\x96\xcb\xd9\x6c\x56\x0a\x84\x52\xba\xbd\x14\xef\xf0\
-\xc7\x8f\xbf\x9c\x82\x08\xa2\xfe\x14\x51\xbf\x99\x1d\x00\x00\x00\
-\x98\x47\xca\x91\x00\x00\x00\x00\x90\x38\x13\x87\x26\x02\x9e\x7e\
-\xd7\xdd\x77\x89\x80\x80\x6e\xb9\xf9\x96\x78\x87\x7f\x69\xf2\xa5\
-\x14\x44\x10\xf5\xa7\x28\x16\x8b\x1e\x22\x00\x00\x00\xe0\x23\xca\
-\x91\x00\x00\x00\x00\x90\x34\xb5\x5a\x6d\x7c\x7c\x22\xe0\x00\x6b\
-\xd7\x76\x48\x81\x80\x8a\xed\xed\xf1\x0e\x3f\x34\x3c\xdc\x6c\x36\
-\x63\x8f\x60\xf6\x53\x44\x3a\x79\x7f\x5f\x9f\x27\x08\x00\x00\x00\
-\xb8\x44\x39\x12\x00\x00\x00\x00\x92\xe5\x95\x57\x8e\x07\x3c\x3d\
-\x9f\xcf\x15\x0a\x05\x29\x10\x50\x26\x93\xe9\x2d\x97\xe3\x9d\xbf\
-\x3a\x35\x15\xf5\xfe\x27\x2b\x95\x78\x87\xbf\x6d\xcd\x6d\x9e\x20\
-\x00\x00\x00\xe0\x12\xe5\x48\x00\x00\x00\x00\x48\x96\x67\x7e\xf8\
-\x4c\xc0\xd3\x37\x6f\xda\x2c\x02\x82\x2b\xdd\x5e\x8a\x77\xf8\xb1\
-\xb1\xb1\xa8\x97\x7f\xec\xe5\x63\xf1\x0e\xbf\x6a\xd5\xcd\x1e\x1f\
-\x00\x00\x00\xe0\x12\xe5\x48\x00\x00\x00\x00\x48\x90\x66\xb3\xb9\
-\x67\x64\x24\xe0\x00\x5d\x5d\x5d\x52\x20\xb8\xce\xce\x3b\xe3\x1d\
-\x7e\xd7\xee\x5d\x51\x2f\x7f\x74\x74\x34\xd2\xc9\xf3\xf9\x5c\xb1\
-\x58\xf4\xf8\x00\x00\x00\x00\x97\x28\x47\x02\x00\x00\x00\x40\x82\
-\x04\x7f\xa1\x6d\xb1\xbd\x5d\x0a\x04\x17\x75\xc5\xad\x5e\x9f\xae\
-\xd5\x6a\x91\x0e\xdf\x68\x34\xc6\xc7\x27\x22\x1d\xbe\xfc\xf9\xb2\
-\x67\x07\x00\x00\x00\x78\x87\x72\x24\x00\x00\x00\x00\x24\xc8\xd1\
-\xa3\x47\x03\x9e\xde\xdf\xd7\x97\xc9\x64\xa4\x40\x12\x6c\x19\x18\
-\x88\x77\xf8\x67\x9f\x8d\xf5\xf2\xc5\xc3\x87\x0f\xc5\xbb\xf6\x5b\
-\x3f\x77\xab\x07\x07\x00\x00\x00\x78\x87\x72\x24\x00\x00\x00\x00\
-\x24\x48\xd8\x17\xf2\xae\xeb\x59\x27\x02\x12\xa2\xbb\xbb\x3b\xde\
-\xe1\xe3\x7d\x33\xf5\x33\x3f\x7c\x26\xde\xb5\xdf\x71\xc7\x5a\x0f\
-\x0e\x00\x00\x00\xf0\x0e\xe5\x48\x00\x00\x00\x00\x48\x8a\x6a\xb5\
-\x5a\xaf\x4f\x07\x1c\x40\xb5\x88\xe4\x68\x5f\xb9\x32\xde\xe1\xc7\
-\xc7\x27\x26\x2b\x95\xe8\xc6\x6e\x34\x1a\x7b\x46\x46\x22\xdd\x79\
-\x6f\xb9\x9c\xcd\x66\x3d\x38\x00\x00\x00\xc0\x3b\x94\x23\x01\x00\
-\x00\x00\x20\x29\xc6\xc7\x5f\x08\x78\x7a\x67\x67\x87\x6a\x11\xc9\
-\x31\xfb\xd3\xd8\x5b\x2e\xc7\x3b\xff\xd8\xd8\x58\x74\x33\xef\xdd\
-\xfb\xf3\x78\x17\x5e\xba\xbd\xe4\xa9\x01\x00\x00\x00\xde\x4d\x39\
-\x12\x00\x00\x00\x00\x92\x22\xec\xab\x78\xd7\xaf\x5f\x2f\x02\x12\
-\x65\xe3\x17\x36\xc6\x3b\xfc\xb6\xc1\xc1\x66\xb3\x19\xd7\xcc\x4f\
-\x3f\xfd\x74\xbc\x0b\xbf\xe7\x1e\xbf\xc1\x00\x00\x00\x80\xff\x40\
-\x39\x12\x00\x00\x00\x00\x12\xa1\xd1\x68\x8c\x8f\x4f\x04\x1c\xa0\
-\xb3\xf3\x4e\x29\x90\x28\xb1\xbf\xe7\xfd\xb9\xe7\xf6\x45\x34\x6d\
-\xb5\x5a\x0d\xfb\x2b\x68\x6e\xbf\xbe\x3a\x0a\x85\x82\x47\x06\x00\
-\x00\x00\x78\x37\xe5\x48\x00\x00\x00\x00\x48\x84\xc3\x87\x0f\x05\
-\x3c\x3d\x9f\xcf\x15\x8b\x45\x29\x90\x28\xd9\x6c\xb6\xb3\xb3\x23\
-\xde\xf9\xbf\xff\xfd\xef\x47\x34\xed\xcf\x7e\xfa\xd3\x78\x57\xed\
-\xe2\x5b\x00\x00\x00\xe0\xf7\x29\x47\x02\x00\x00\x00\x40\x22\x1c\
-\xf9\xc5\x91\x80\xa7\x97\x3f\x5f\x16\x01\x09\xf4\xc0\x03\x0f\xc4\
-\x3b\xfc\xf8\xf8\xc4\x64\xa5\x12\xc5\xa8\x8d\x46\x63\xdb\xe0\x60\
-\xbc\xab\xf6\x4e\x6d\x00\x00\x00\xe0\xf7\x29\x47\x02\x00\x00\x00\
-\x40\x78\xcd\x66\x73\xc7\xce\x9d\x01\x07\xe8\xee\xee\x96\x02\x09\
-\x74\xf7\xdd\xff\x25\xea\xf9\x77\xed\xda\x15\xc5\x9c\x7b\xf7\xfe\
-\x3c\xde\x25\x7b\xa7\x36\x00\x00\x00\xf0\xbe\x94\x23\x01\x00\x00\
-\x00\x20\xbc\xea\xd4\x54\xd8\x01\xd6\x94\x4a\x52\x20\x81\xb2\xd9\
-\x6c\x6f\x39\xe2\x6b\x4d\x87\x86\x87\xab\xd5\x6a\xc2\x87\x6c\x36\
-\x9b\x8f\x3e\xfa\x68\xbc\x4b\xf6\x4e\x6d\x00\x00\x00\xe0\x7d\x29\
-\x47\x02\x00\x00\x00\x40\x78\x63\x63\x63\x01\x4f\xef\x2d\x97\x33\
-\x99\x8c\x14\x48\xa6\x8d\x5f\xd8\x18\xf5\xfc\x7f\xff\xbd\xef\x25\
-\x7c\xc2\x1f\xfd\xe8\x99\x7a\x7d\x3a\xde\x0d\x7b\xa7\x36\x00\x00\
-\x00\xf0\xbe\x94\x23\x01\x00\x00\x00\x20\xbc\x89\x43\x13\x01\x4f\
-\xbf\xeb\xee\xbb\x44\x40\x62\xdd\x71\xc7\xda\xa8\xe7\x4f\xf8\xe5\
-\x91\xb1\x5f\x1b\xe9\x9d\xda\x00\x00\x00\xc0\x1f\xa2\x1c\x09\x00\
-\x00\x00\x00\x81\xd5\x6a\xb5\xf1\xf1\x89\x80\x03\xac\x5d\xdb\x21\
-\x05\x12\x2b\x9b\xcd\x6e\x19\x18\x88\xfa\x23\x3c\xfa\xcd\x6f\x26\
-\x76\xb6\xd8\xaf\x8d\xfc\xd2\x97\xbe\xe4\x19\x01\x00\x00\x00\xde\
-\x97\x72\x24\x00\x00\x00\x00\x04\x76\x28\xe8\xb5\x91\xee\x5d\x23\
-\xf9\xca\xe5\x72\xd4\xf3\xef\x19\x19\x39\xb0\x7f\x7f\x02\x07\x8b\
-\xfd\xda\xc8\x8f\xc4\x7f\xb1\x28\x00\x00\x00\xb0\x70\x94\x23\x01\
-\x00\x00\x00\x20\xb0\x7d\x7b\xf7\x05\x3c\xbd\xc3\xb5\x91\x24\xde\
-\x9a\x52\x29\x9f\xcf\x45\xfd\x11\xfe\xea\x4b\x7f\xd5\x6c\x36\x93\
-\x36\xd5\x8e\xc7\x1f\x8f\xfa\xda\xc8\x2d\x03\x03\xd9\x6c\xd6\x03\
-\x02\x00\x00\x00\xbc\x2f\xe5\x48\x00\x00\x00\x00\x08\xa9\xd9\x6c\
-\xee\x19\x19\x09\x38\x40\x57\x57\x97\x14\x48\xbe\xbf\xfd\xdb\xbf\
-\x8d\x7a\xfe\x7a\x7d\x7a\xdb\xd6\xad\x89\x1a\xa9\x5a\xad\x6e\x1b\
-\x1c\x8c\x7a\xab\xb1\x5f\x29\x0a\x00\x00\x00\x2c\x28\xe5\x48\x00\
-\x00\x00\x00\x08\x69\xb2\x52\x09\x3b\x40\xb1\xbd\x5d\x0a\x24\xdf\
-\x5f\xfc\xc5\x7f\x8d\xfd\x23\xec\xd8\xb9\x33\xf8\xf3\xfe\x6e\x8f\
-\x7e\xf3\x9b\x51\xef\xb3\xb3\xb3\x63\x4d\xa9\xe4\xd1\x00\x00\x00\
-\x00\xfe\x10\xe5\x48\x00\x00\x00\x00\x08\xe9\xe0\xc1\x83\x01\x4f\
-\xdf\x32\x30\x90\xc9\x64\xa4\x40\xf2\x65\xb3\xd9\xd9\x1f\xd7\xd8\
-\x3f\xc5\x03\x7f\xf9\x40\xa3\xd1\x48\xc2\x24\xdf\xf9\xce\xce\xb0\
-\x77\xd6\xce\xc3\x32\x1f\x78\xc0\x73\x01\x00\x00\x00\x7c\x00\xe5\
-\x48\x00\x00\x00\x00\x08\x69\xe4\x27\x21\xfb\x49\xb7\x7e\xee\x56\
-\x11\x10\x8b\xff\xfe\xe0\x83\xb1\x7f\x84\x7a\x7d\xfa\xaf\xbf\xfc\
-\xe5\xe0\x63\x4c\x56\x2a\x03\x03\x5b\x62\x5f\xe6\xfd\xf7\x6f\xf4\
-\x50\x00\x00\x00\x00\x1f\x40\x39\x12\x00\x00\x00\x00\x82\x99\xac\
-\x54\xea\xf5\xe9\x80\x03\xdc\x71\xc7\x5a\x29\x10\x8b\x62\xb1\xd8\
-\xd9\xd9\x11\xfb\xa7\xd8\x33\x32\xf2\xcd\xed\xdb\x03\x0e\x50\xab\
-\xd5\x1e\xf8\xcb\xe8\xef\x5c\xdc\x3e\x38\xe8\xd6\x5b\x00\x00\x00\
-\xe0\x83\x29\x47\x02\x00\x00\x00\x40\x30\xc7\x5e\x3e\x16\xf0\xf4\
-\xde\x72\x39\x9b\xcd\x4a\x81\x88\x7c\xfd\x6b\x5f\x4f\xc1\xa7\xd8\
-\x36\x38\x38\x3c\x3c\x14\xe4\xe8\x66\xb3\xf9\xf5\xaf\x7d\x2d\x6c\
-\x27\x7b\x5e\xfc\x37\xef\xd4\x06\x00\x00\x00\x3e\x8c\x72\x24\x00\
-\x00\x00\x00\x04\x33\x3a\x3a\x1a\xf0\xf4\xd2\xed\x25\x11\x10\x97\
-\x75\x3d\x3d\xf9\x7c\x2e\x05\x1f\xa4\xbf\xff\xa1\x03\xfb\xf7\x2f\
-\xf2\xa1\xcd\x66\x73\xd3\x83\x0f\xee\x19\x19\x89\x7e\x7b\x7d\x7d\
-\x85\x42\xc1\xe3\x00\x00\x00\x00\x7c\x30\xe5\x48\x00\x00\x00\x00\
-\x08\xa3\xd1\x68\x8c\x8f\x4f\x04\x1c\xa0\xb3\xf3\x4e\x29\x10\x9d\
-\x47\x1e\x79\x24\x1d\x1f\xa4\xe7\xcf\xfe\xec\xc7\x3f\xfe\xd1\xa2\
-\x1d\x97\x9a\x66\xe4\xac\xbf\xf9\xca\x57\x3c\x08\x00\x00\x00\xc0\
-\x87\x52\x8e\x04\x00\x00\x00\x80\x30\x0e\x1f\x3e\x14\xf0\xf4\x7c\
-\x3e\x57\x2c\x16\xa5\x40\x74\xee\xbf\x7f\x63\x3a\x2e\x8f\xbc\xf4\
-\x59\xbe\xb9\x7d\xfb\x22\x1c\x94\xa6\x66\x64\x7f\x5f\x9f\xdf\x5d\
-\x00\x00\x00\xc0\xe5\x50\x8e\x04\x00\x00\x00\x80\x30\x0e\xec\x3f\
-\x10\xf0\xf4\xcd\x9b\x36\x8b\x80\x18\x65\x32\x99\xd4\x5c\x1e\x39\
-\x6b\xdb\xe0\xe0\x43\xfd\xfd\xcd\x66\x73\xe1\x8e\xa8\xd5\x6a\xeb\
-\xd7\xdf\x93\x8e\x66\xe4\x47\x5c\x1b\x09\x00\x00\x00\x5c\x36\xe5\
-\x48\x00\x00\x00\x00\x08\xa0\xd9\x6c\x0e\x0d\x0f\x07\x1c\x60\xf5\
-\xea\xd5\x52\x20\x52\x69\xba\x3c\x72\xd6\xec\xaf\x82\x1b\x6f\x5c\
-\x31\x59\xa9\x2c\xc4\x3f\xfc\xc7\x3f\xfe\xd1\xf5\xd7\x5f\x3f\x3e\
-\x3e\x91\x8e\x5d\xf5\x96\xcb\xae\x8d\x04\x00\x00\x00\x2e\x93\x72\
-\x24\x00\x00\x00\x00\x04\x50\x9d\x9a\x0a\x3b\xc0\x9a\x52\x49\x0a\
-\x44\x2a\x65\x97\x47\xce\xaa\xd7\xa7\x4b\xb7\xdf\xfe\x50\x7f\x7f\
-\xa3\xd1\x98\xb7\x5f\x32\xd5\xea\x9f\xf7\xf6\xde\x7f\xff\xc6\x34\
-\x2d\xea\x91\xad\x5b\xfd\xfc\x03\x00\x00\x00\x97\x49\x39\x12\x00\
-\x00\x00\x00\x02\x18\x1b\x1b\x0b\x78\x7a\x6f\xb9\x9c\xc9\x64\xa4\
-\x40\xbc\x52\x76\x79\xe4\x25\x43\xc3\xc3\xcb\x96\x2d\xfb\xe6\xf6\
-\xed\xb5\x5a\x6d\x2e\xff\x9c\x6a\xb5\x3a\xfb\x0f\x69\x6f\x6f\x4f\
-\xcd\xab\xb4\x2f\xe9\xef\xeb\x73\x6d\x24\x00\x00\x00\x70\xf9\x94\
-\x23\x01\x00\x00\x00\x20\x80\x5d\xbb\x77\x05\x3c\x7d\xe3\x17\x36\
-\x8a\x80\xa8\xa5\xef\xf2\xc8\x77\x6c\x1b\x1c\xbc\xfe\xfa\xeb\xff\
-\xbc\xb7\xf7\xc7\x3f\xfe\xd1\x15\x5d\x24\x39\xfb\xff\x3c\xfb\x5f\
-\x99\xfd\x2f\xb6\xb7\xb7\xcf\xfe\x43\xd2\xb7\x99\xbf\xf9\xca\x57\
-\xfc\xe4\x03\x00\x00\x00\x97\xef\xa3\x56\x00\x00\x00\x00\x00\x8b\
-\xac\x56\xab\xd5\xeb\xd3\x01\x07\xb8\xe9\xa6\x55\x52\x20\x76\xf7\
-\xdf\xbf\xf1\xe9\xa7\x9f\x1e\x1f\x9f\x48\xe5\xa7\xdb\x33\x32\x72\
-\xe9\xde\xc7\xce\xce\x8e\x8e\xb5\x1d\x9f\xfe\xcf\x9f\xbe\xe1\x86\
-\x4f\xcd\xfe\x9f\xef\xbe\x3a\x71\xf6\x37\x49\xb3\xd9\x3c\x7d\xfa\
-\xb5\x37\xde\x78\xa3\xf2\x62\x25\x65\xf7\x44\xbe\x87\x6b\x23\x01\
-\x00\x00\x80\x2b\xa5\x1c\x09\x00\x00\x00\x00\x8b\xed\xd0\xa1\x89\
-\x80\xa7\x77\x76\x76\x14\x0a\x05\x29\x10\xbb\x4c\x26\xf3\xf5\xaf\
-\x7d\x3d\xad\xe5\xc8\x77\xcc\x7e\xc0\xd4\x7f\xc6\xcb\xf1\x77\xdf\
-\xfa\x96\x25\x00\x00\x00\x00\x57\xc4\x6b\xb5\x01\x00\x00\x00\x60\
-\xb1\xed\xdb\xbb\x2f\xe0\xe9\x1d\x6b\x3b\x44\x40\x3a\xac\xeb\xe9\
-\xe9\x2d\x97\xed\x21\xf5\x76\xee\xdc\x91\xcd\x66\xed\x01\x00\x00\
-\x00\xb8\x22\xca\x91\x00\x00\x00\x00\xb0\xa8\x1a\x8d\x46\xd8\xb7\
-\xdf\x76\x75\x75\x49\x81\xd4\x78\x64\xeb\x56\x4b\x48\xb7\x7c\x3e\
-\xf7\xd0\x43\x5f\xb4\x07\x00\x00\x00\xe0\x4a\x29\x47\x02\x00\x00\
-\x00\xc0\xa2\x9a\x3a\x71\x22\xec\x00\x6b\x4a\x25\x29\x90\x1a\xc5\
-\x62\x71\xfb\xe0\xa0\x3d\xa4\xd8\x63\x8f\x3d\x96\xc9\x64\xec\x01\
-\x00\x00\x00\xb8\x52\xca\x91\x00\x00\x00\x00\xb0\xa8\x0e\x1e\x3c\
-\x18\xf0\xf4\x2d\x03\x03\x22\x20\x65\xb6\x7c\xf5\xab\xf9\x7c\xce\
-\x1e\x52\xa9\xb7\x5c\xbe\xef\xbe\xfb\xed\x01\x00\x00\x00\xb8\x0a\
-\xca\x91\x00\x00\x00\x00\xb0\xa8\x76\xec\xdc\x19\xf0\xf4\xee\xee\
-\x6e\x11\x90\x32\x99\x4c\xe6\xb1\xc7\x1e\xb3\x87\x54\xfa\xb6\x64\
-\x01\x00\x00\x80\xab\xa5\x1c\x09\x00\x00\x00\x00\x8b\x67\xb2\x52\
-\x09\x3b\x40\xfb\xca\x95\x52\x20\x7d\xee\xbb\xef\xfe\xfe\xbe\x3e\
-\x7b\x48\x99\xa1\xa1\x27\x0b\x85\x82\x3d\x00\x00\x00\x00\x57\x47\
-\x39\x12\x00\x00\x00\x00\x16\xcf\xb1\x97\x8f\x05\x3c\xbd\xb7\x5c\
-\xce\x66\xb3\x52\x20\x95\xfe\xc7\x37\xbe\x61\x09\x69\xd2\xd9\xd9\
-\x71\xff\xfd\x1b\xed\x01\x00\x00\x00\xb8\x6a\xca\x91\x00\x00\x00\
-\x00\xb0\x78\x46\x47\x47\x03\x9e\x5e\xba\xbd\x24\x02\xd2\xaa\x50\
-\x28\x0c\x0d\x3d\x69\x0f\xa9\xb1\x73\xe7\x77\x32\x99\x8c\x3d\x00\
-\x00\x00\x00\x57\x4d\x39\x12\x00\x00\x00\x00\x16\x49\xad\x56\x1b\
-\x1f\x9f\x08\x38\xc0\x3d\xf7\xac\x97\x02\x29\xd6\xd7\xd7\xef\xe5\
-\xda\xe9\x30\x34\xf4\x64\xb1\x58\xb4\x07\x00\x00\x00\x60\x2e\x94\
-\x23\x01\x00\x00\x00\x60\x91\xbc\xf2\xca\xf1\x80\xa7\xe7\xf3\xb9\
-\x42\xa1\x20\x05\xd2\xed\xef\xbe\xf5\xad\xd9\x1f\x75\x7b\x88\x5a\
-\x6f\xb9\xdc\xd7\xd7\x6f\x0f\x00\x00\x00\xc0\x1c\x29\x47\x02\x00\
-\x00\x00\xc0\x22\x39\xb0\xff\x40\xc0\xd3\x37\x6f\xda\x2c\x02\x52\
-\x2f\x9b\xcd\x3e\xf1\xfd\x27\xec\x21\x5e\xf9\x7c\xee\x7f\xfd\xc3\
-\x3f\xd8\x03\x00\x00\x00\x30\x77\xca\x91\x00\x00\x00\x00\xb0\x18\
-\x9a\xcd\xe6\xd0\xf0\x70\xc0\x01\x56\xaf\x5e\x2d\x05\x5a\xc1\xba\
-\x9e\x9e\xed\x83\x83\xf6\x10\xa9\x27\xbe\xff\x44\x36\x9b\xb5\x07\
-\x00\x00\x00\x60\xee\x94\x23\x01\x00\x00\x00\x60\x31\x4c\x56\x2a\
-\x61\x07\x58\x53\x2a\x49\x81\x16\xb1\xe5\xab\x5f\xed\x2d\x97\xed\
-\x21\x3a\x3b\x77\xee\x58\xd7\xd3\x63\x0f\x00\x00\x00\xc0\xbc\x50\
-\x8e\x04\x00\x00\x00\x80\xc5\x70\xf4\xe8\xd1\x80\xa7\xf7\xf7\xf5\
-\x65\x32\x19\x29\xd0\x22\x66\x7f\xda\xbf\xfd\xd8\x63\xf9\x7c\xce\
-\x2a\x22\xd2\x5b\x2e\x3f\xfc\xf0\x80\x3d\x00\x00\x00\x00\xf3\x45\
-\x39\x12\x00\x00\x00\x00\x16\xc3\xae\xdd\xbb\x02\x9e\xbe\xae\x67\
-\x9d\x08\x68\x29\x85\x42\xe1\xe9\xff\xf3\xb4\x3d\xc4\x22\x9f\xcf\
-\xed\x7e\xea\x29\x7b\x00\x00\x00\x00\xe6\x91\x72\x24\x00\x00\x00\
-\x00\x2c\xb8\x5a\xad\x56\xaf\x4f\x07\x1c\xe0\xa6\x9b\x56\x49\x81\
-\x56\xb3\xa6\x54\x1a\x1a\x7a\xd2\x1e\x92\x2f\x9f\xcf\x3d\xff\xfc\
-\x98\xdb\x6d\x01\x00\x00\x80\xf9\xa5\x1c\x09\x00\x00\x00\x00\x0b\
-\xee\xd9\x67\x47\x03\x9e\xde\xd9\xd9\x51\x28\x14\xa4\x40\x0b\xea\
-\xeb\xeb\xdf\x3e\x38\x68\x0f\x09\xf7\xc4\xf7\x9f\xf0\x3b\x0a\x00\
-\x00\x00\x98\x77\xca\x91\x00\x00\x00\x00\xb0\xe0\x2a\x2f\x56\x02\
-\x9e\xbe\x7e\xfd\x7a\x11\xd0\xb2\xb6\x6e\xdb\xd6\x5b\x2e\xdb\x43\
-\x62\xed\x7f\xee\xb9\x75\x3d\x3d\xf6\x00\x00\x00\x00\xcc\x3b\xe5\
-\x48\x00\x00\x00\x00\x58\x58\x8d\x46\x63\xcf\xc8\x48\xc0\x01\x6e\
-\xb9\xf9\x16\x29\xd0\xca\x76\x3f\xf5\x94\x7e\x64\x32\x6d\x1f\x1c\
-\xd4\x8c\x04\x00\x00\x00\x16\x88\x72\x24\x00\x00\x00\x00\x2c\xac\
-\xc3\x87\x0f\x05\x3c\x3d\x9f\xcf\xad\x29\x95\xa4\x40\x2b\xcb\x64\
-\x32\xbb\x9f\x7a\xaa\xb3\xb3\xc3\x2a\x12\x65\xfb\xe0\xe0\xd6\x6d\
-\xdb\xec\x01\x00\x00\x00\x58\x20\xca\x91\x00\x00\x00\x00\xb0\xb0\
-\x8e\xfc\xe2\x48\xc0\xd3\xcb\x9f\x77\x61\x1e\xfc\xb6\x1f\xf9\x83\
-\x1f\x3c\x99\xcf\xe7\xac\x22\x21\x34\x23\x01\x00\x00\x80\x85\xa6\
-\x1c\x09\x00\x00\x00\x00\x0b\x6b\xc7\xce\x9d\x01\x4f\xef\xee\xee\
-\x16\x01\xcc\x2a\x14\x0a\xcf\x3f\x3f\xa6\x1f\x99\x04\x9a\x91\x00\
-\x00\x00\xc0\x22\x50\x8e\x04\x00\x00\x00\x80\x05\x34\x59\xa9\x84\
-\x1d\xa0\x7d\xe5\x4a\x29\xc0\x25\xfa\x91\x49\xa0\x19\x09\x00\x00\
-\x00\x2c\x0e\xe5\x48\x00\x00\x00\x00\x58\x40\x63\x63\x63\x01\x4f\
-\xef\x2d\x97\xb3\xd9\xac\x14\xe0\x1d\xfa\x91\x61\x69\x46\x02\x00\
-\x00\x00\x8b\x46\x39\x12\x00\x00\x00\x00\x16\xd0\xc4\xa1\x89\x80\
-\xa7\xdf\x75\xf7\x5d\x22\x80\xf7\x28\x14\x0a\x27\x4f\x9e\xea\x2d\
-\x97\xad\x62\x91\xed\xdc\xb9\x43\x33\x12\x00\x00\x00\x58\x34\x1f\
-\xb5\x02\x00\x00\x00\x00\x58\x20\xb5\x5a\x6d\x7c\x7c\x22\xe0\x00\
-\x6b\xd7\x76\x48\x01\x7e\x5f\x26\x93\xd9\xfd\xd4\x53\xb3\x7f\xb3\
-\x67\x64\xc4\x36\x16\xc7\xfe\xe7\x9e\x5b\xd7\xd3\x63\x0f\x00\x00\
-\x00\xc0\xa2\x71\x73\x24\x00\x00\x00\x00\x2c\x94\x57\x5e\x39\x1e\
-\xf0\xf4\x7c\x3e\x57\x28\x14\xa4\x00\xef\xeb\x52\x3f\x72\xfb\xe0\
-\xa0\x55\x2c\xc2\xef\xa2\xca\x8b\x2f\x6a\x46\x02\x00\x00\x00\x8b\
-\x4c\x39\x12\x00\x00\x00\x00\x16\xca\x33\x3f\x7c\x26\xe0\xe9\x9b\
-\x37\x6d\x16\x01\x7c\x80\x4c\x26\xb3\x75\xdb\xb6\xa1\xa1\x27\xad\
-\x62\xe1\xf4\x96\xcb\xcf\x3f\x3f\xb6\xa6\x54\xb2\x0a\x00\x00\x00\
-\x60\x91\x29\x47\x02\x00\x00\x00\xc0\x82\x68\x36\x9b\x61\xdf\xd8\
-\xdb\xd5\xd5\x25\x05\xf8\x50\x7d\x7d\xfd\xfb\x9f\x7b\x2e\x9f\xcf\
-\x59\xc5\xbc\xdb\x32\x30\xb0\xfb\xa9\xa7\x5c\x61\x0b\x00\x00\x00\
-\x04\xa1\x1c\x09\x00\x00\x00\x00\x0b\x62\xb2\x52\x09\x3b\x40\xb1\
-\xbd\x5d\x0a\x70\x39\xd6\xf5\xf4\x3c\xff\xfc\x58\x6f\xb9\x6c\x15\
-\xf3\x68\x68\xe8\xc9\xc7\x77\xec\xc8\x64\x32\x56\x01\x00\x00\x00\
-\x04\xa1\x1c\x09\x00\x00\x00\x00\x0b\xe2\xe8\xd1\xa3\x01\x4f\xef\
-\xef\xeb\xd3\x49\x82\xcb\x57\x28\x14\x76\x3f\xf5\xd4\xf6\xc1\x41\
-\xab\x98\xbb\xce\xce\x8e\x33\x67\xce\xf4\xf5\xf5\x5b\x05\x00\x00\
-\x00\x10\x90\x72\x24\x00\x00\x00\x00\x2c\x88\x5d\xbb\x77\x05\x3c\
-\x7d\x5d\xcf\x3a\x11\xc0\x15\xc9\x64\x32\x5b\xb7\x6d\xab\xbc\xf8\
-\xa2\x57\x6c\xcf\xc5\xf6\xc1\xc1\xd1\xd1\x67\xbd\x4a\x1b\x00\x00\
-\x00\x08\x4e\x39\x12\x00\x00\x00\x00\xe6\x5f\xb5\x5a\xad\xd7\xa7\
-\x03\x0e\x70\xc7\x1d\x6b\xa5\x00\x57\x61\x4d\xa9\x74\xe4\xc8\xd1\
-\xfe\xbe\x3e\xab\xb8\x52\xf9\x7c\xae\xf2\xe2\x8b\x5b\xb7\x6d\x73\
-\x6d\x2d\x00\x00\x00\x90\x04\xca\x91\x00\x00\x00\x00\x30\xff\xc6\
-\xc7\x5f\x08\x78\x7a\x67\x67\x47\x36\x9b\x95\x02\x5c\x9d\xd9\xc7\
-\xe7\xc9\xa1\xa1\xfd\xcf\x3d\xe7\x0a\xc9\xcb\xb7\x73\xe7\x8e\x93\
-\x27\x4f\xad\x29\x95\xac\x02\x00\x00\x00\x48\x08\xe5\x48\x00\x00\
-\x00\x00\x98\x7f\xa3\xa3\xa3\x01\x4f\x5f\xbf\x7e\xbd\x08\x60\x8e\
-\xd6\xf5\xf4\x9c\x3c\x79\x6a\xfb\xe0\xa0\x55\x7c\xb0\xfe\xbe\xbe\
-\xa9\xa9\xa9\x87\x1f\x1e\x70\x61\x24\x00\x00\x00\x90\x28\xca\x91\
-\x00\x00\x00\x00\x30\xcf\x1a\x8d\xc6\xf8\xf8\x44\xc0\x01\x3a\x3b\
-\xef\x94\x02\xcc\x5d\x26\x93\xd9\xba\x6d\xdb\xd4\xd4\x94\xb7\x6c\
-\xff\x81\x5f\x35\x1d\xfb\x9f\x7b\xee\xc9\xa1\xa1\x62\xb1\x68\x1b\
-\x00\x00\x00\x40\xd2\x28\x47\x02\x00\x00\x00\xc0\x3c\x3b\x7c\xf8\
-\x50\xc0\xd3\xf3\xf9\x9c\xa2\x12\xcc\xa3\xd9\x07\xea\xd2\x5b\xb6\
-\x3b\x3b\x3b\x6c\xe3\x9d\xdf\x33\x43\x43\x4f\x8e\x8e\x3e\xbb\xae\
-\xa7\xc7\x36\x00\x00\x00\x80\x64\x52\x8e\x04\x00\x00\x00\x80\x79\
-\x76\xe4\x17\x47\x02\x9e\x5e\xfe\x7c\x59\x04\x30\xef\xd6\xf5\xf4\
-\xbc\xf0\xc2\xb8\x8a\xe4\xa5\x5a\xe4\xc9\x93\xa7\xfa\xfa\xfa\xbd\
-\x47\x1b\x00\x00\x00\x48\x32\xe5\x48\x00\x00\x00\x00\x98\x4f\xcd\
-\x66\x73\xc7\xce\x9d\x01\x07\xe8\xee\xee\x96\x02\x2c\x90\x56\xae\
-\x48\xce\x7e\x64\xb5\x48\x00\x00\x00\x20\x22\xca\x91\x00\x00\x00\
-\x00\x30\x9f\xaa\x53\x53\x61\x07\x58\x53\x2a\x49\x01\x16\xd4\x3b\
-\x15\xc9\xfe\xbe\xbe\x56\xf8\xbc\xbd\xe5\xf2\xec\x87\x9d\xfd\xc8\
-\x6a\x91\x00\x00\x00\x40\x44\x94\x23\x01\x00\x00\x00\x60\x3e\x8d\
-\x8d\x8d\x05\x3c\xbd\xb7\x5c\x56\x5d\x82\xc5\xb1\xae\xa7\xe7\xc9\
-\xa1\xa1\x33\x67\xce\x6c\x1f\x1c\xcc\xe7\x73\xe9\xfb\x80\xb3\x1f\
-\x6a\xf6\xa3\xcd\x7e\xc0\x7f\xda\xb3\x67\xf6\xc3\x4a\x1c\x00\x00\
-\x00\x88\x8b\x72\x24\x00\x00\x00\x00\xcc\xa7\x89\x43\x13\x01\x4f\
-\xbf\xeb\xee\xbb\x44\x00\x8b\xa9\x50\x28\x6c\xdd\xb6\xed\xe4\xc9\
-\x53\x69\xba\x48\x72\xcb\xc0\xc0\xec\xc7\x99\xfd\x50\xb3\x1f\x6d\
-\xf6\x03\x4a\x19\x00\x00\x00\x88\xd1\x47\xad\x00\x00\x00\x00\x00\
-\xe6\x4b\xad\x56\x1b\x1f\x9f\x08\x38\xc0\xda\xb5\x1d\x52\x80\xc5\
-\x97\xc9\x64\xd6\xf5\xf4\xcc\xfe\xf5\x77\xdf\xfa\xd6\xe1\xc3\x87\
-\x0e\xec\x3f\x30\x34\x3c\x1c\xdd\xa7\xd8\x32\x30\xd0\xdd\xdd\xbd\
-\xa6\x54\x72\x01\x2d\x00\x00\x00\x90\x02\xca\x91\x00\x00\x00\x00\
-\x21\xcd\xcc\xcc\x58\x42\x9a\x1c\x0a\x7a\x6d\x64\x67\x67\x87\x3b\
-\xde\x20\xac\x6c\x36\x7b\xdf\x7d\xf7\xcf\xfe\xf5\x9d\xef\x7e\x77\
-\xb2\x52\x39\x7a\xf4\xe8\xae\xdd\xbb\xea\xf5\xe9\xc4\x0e\xdc\x5b\
-\x2e\x97\x6e\x2f\xdd\x72\xf3\x2d\x6b\x4a\x25\xf1\x01\x00\x00\x00\
-\x69\xa2\x1c\x09\x00\x00\x00\x00\xf3\x66\xdf\xde\x7d\x01\x4f\xef\
-\x70\x6d\x24\x24\xc6\x3b\x77\x49\x6e\xdd\xb6\xad\x56\xab\xbd\xf2\
-\xca\xf1\x23\xbf\x38\x72\x62\xea\x44\xd8\xcb\x65\x2f\xe9\xef\xeb\
-\x5b\x71\xe3\x8a\x5b\x6e\xbe\xe5\xfa\x4f\x7e\x32\x9b\xcd\x0a\x0b\
-\x00\x00\x00\x48\x25\xe5\x48\x00\x00\x00\x00\x98\x1f\xcd\x66\x73\
-\xcf\xc8\x48\xc0\x01\xba\xba\xba\xa4\x00\x09\x54\xf8\x9d\xfb\xee\
-\xbb\xff\xd2\x2f\x8a\x5a\xad\x76\xfc\xf8\xcb\xaf\x9e\x7a\x75\x7a\
-\x7a\x7a\x11\x7e\x69\x74\x76\x76\x5c\xb7\xfc\xba\x15\x37\xae\xf8\
-\xf4\x9f\x7e\x7a\xd9\xc7\x3f\x5e\x2c\x16\x25\x02\x00\x00\x00\xb4\
-\x02\xe5\x48\x00\x00\x00\x00\x98\x1f\x93\x95\x4a\xd8\x01\x8a\xed\
-\xed\x52\x80\x84\xcb\x64\x32\xc5\xdf\x79\xe7\x3f\x69\x34\x1a\xe7\
-\x67\xbd\xf9\xe6\x1b\xff\xf2\xc6\xdb\x6f\xbf\x7d\xea\xe4\xa9\xd9\
-\xff\xf0\xc2\x85\x0b\x57\xd4\x9b\xbc\xd4\x80\x9c\xfd\x9b\x6b\xaf\
-\xbd\xf6\x13\x7f\xf2\x89\xd9\xbf\x59\xb5\xea\xe6\xd9\xb3\x0a\x85\
-\x82\x9d\x03\x00\x00\x00\xad\x49\x39\x12\x00\x00\x00\x00\xe6\xc7\
-\xc1\x83\x07\x03\x9e\xbe\x65\x60\x20\x93\xc9\x48\x01\xa2\x93\xfd\
-\x9d\xcb\xb9\xd0\xf1\xd2\xad\x93\x85\x42\xc1\xc3\x0e\x00\x00\x00\
-\xf0\xa1\x94\x23\x01\x00\x00\x00\x60\x7e\x8c\xfc\x24\xe4\x3b\xb5\
-\x6f\xfd\xdc\xad\x22\x80\x74\xbb\x74\xeb\xa4\x3d\x00\x00\x00\x00\
-\x5c\x8e\xff\x64\x05\x00\x00\x00\x00\x30\x77\x93\x95\x4a\xbd\x3e\
-\x1d\x70\x80\x3b\xee\x58\x2b\x05\x00\x00\x00\x00\x80\x4b\x94\x23\
-\x01\x00\x00\x00\x60\x1e\x1c\x7b\xf9\x58\xc0\xd3\x7b\xcb\xe5\x6c\
-\x36\x2b\x05\x00\x00\x00\x00\x80\x4b\x94\x23\x01\x00\x00\x00\x60\
-\x1e\x8c\x8e\x8e\x06\x3c\xbd\x74\x7b\x49\x04\x00\x00\x00\x00\x00\
-\xef\x50\x8e\x04\x00\x00\x00\x80\xb9\x6a\x34\x1a\xe3\xe3\x13\x01\
-\x07\xe8\xec\xbc\x53\x0a\x00\x00\x00\x00\x00\xef\x50\x8e\x04\x00\
-\x00\x00\x80\xb9\x3a\x7c\xf8\x50\xc0\xd3\xf3\xf9\x5c\xb1\x58\x94\
-\x02\x00\x00\x00\x00\xc0\x3b\x94\x23\x01\x00\x00\x00\x60\xae\x0e\
-\xec\x3f\x10\xf0\xf4\xcd\x9b\x36\x8b\x00\x00\x00\x00\x00\xe0\xdd\
-\x94\x23\x01\x00\x00\x00\x60\x4e\x9a\xcd\xe6\xd0\xf0\x70\xc0\x01\
-\x56\xaf\x5e\x2d\x05\x00\x00\x00\x00\x80\x77\x53\x8e\x04\x00\x00\
-\x00\x80\x39\xa9\x4e\x4d\x85\x1d\x60\x4d\xa9\x24\x05\x00\x00\x00\
-\x00\x80\x77\x53\x8e\x04\x00\x00\x00\x80\x39\x19\x1b\x1b\x0b\x78\
-\x7a\x6f\xb9\x9c\xc9\x64\xa4\x00\x00\x00\x00\x00\xf0\x6e\xca\x91\
-\x00\x00\x00\x00\x30\x27\xbb\x76\xef\x0a\x78\xfa\xc6\x2f\x6c\x14\
-\x01\x00\x00\x00\x00\xc0\x7b\x28\x47\x02\x00\x00\x00\xc0\xd5\xab\
-\xd5\x6a\xf5\xfa\x74\xc0\x01\x6e\xba\x69\x95\x14\x00\x00\x00\x00\
-\x00\xde\xe3\xa3\x56\x00\x00\x00\x00\x00\x57\x2d\x9b\xcd\x4e\x4d\
-\x4d\x05\x1c\xa0\x50\x28\x48\x01\x00\x00\x00\x00\xe0\x3d\x94\x23\
-\x01\x00\x00\x00\xe0\xea\x65\x32\x99\x62\xb1\x68\x0f\x00\x00\x00\
-\x00\x00\x89\xe2\xb5\xda\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\
-\xaa\x28\x47\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa9\xa2\x1c\
-\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa4\x8a\x72\x24\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x90\x2a\xca\x91\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x40\xaa\x28\x47\x02\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\xa9\xa2\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa4\
-\x8a\x72\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x2a\xca\x91\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\xaa\x28\x47\x02\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\xa9\xa2\x1c\x09\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\xa4\x8a\x72\x24\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x90\x2a\xca\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\xaa\
-\x28\x47\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa9\xa2\x1c\x09\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa4\x8a\x72\x24\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x90\x2a\xca\x91\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x40\xaa\x28\x47\x02\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xa9\xa2\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa4\x8a\
-\x72\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x2a\xca\x91\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x40\xaa\x28\x47\x02\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\xa9\xa2\x1c\x09\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xa4\x8a\x72\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x90\x2a\xca\x91\x00\x00\xcc\xbf\xb7\xdf\x7e\xdb\x12\x00\x00\x00\
-\x00\x00\x00\x00\x08\x45\x39\x12\x00\x80\xf9\x77\xea\xe4\x29\x4b\
-\x00\x00\x00\x00\x00\xe6\xee\xa5\xc9\x97\x2c\x01\x00\x80\xab\xa0\
-\x1c\x09\x00\x90\x4e\x1d\x1d\x1d\x96\x00\x00\x00\x00\x00\x30\x17\
-\xf9\x7c\xde\x12\x00\x00\x22\xa5\x1c\x09\x00\x00\x00\x00\x00\x00\
-\x00\xef\x43\x39\x12\x00\x20\x5e\xca\x91\x00\x00\xcc\xbf\x5f\x9f\
-\xfd\xb5\x25\x00\x00\x00\x00\x00\x73\x77\xe1\xc2\x05\x4b\x00\x00\
-\xe0\x2a\x2c\x99\x99\x99\xb1\x05\x00\x80\x74\xfe\xab\xde\x92\x25\
-\x01\x4f\xf7\xef\x99\x00\x00\x00\x00\xc0\xdc\xf9\x9e\x13\x00\x80\
-\xab\xe3\xe6\x48\x00\x80\xd4\x2a\x16\x8b\x96\x00\x00\x00\x00\x00\
-\x70\x75\x72\xb9\x9c\x25\x00\x00\xc4\x4b\x39\x12\x00\x20\xb5\xda\
-\xda\xda\x02\x9e\x5e\xab\xd5\x44\x00\x00\x00\x00\x00\xcc\x45\xd8\
-\xaf\x19\xf3\xf9\xbc\x08\x00\x00\xe2\xa5\x1c\x09\x00\xc0\x82\x68\
-\x36\x9b\x96\x00\x00\x00\x00\x00\xcc\x85\xaf\x19\x01\x00\xb8\x6a\
-\xca\x91\x00\x00\xa9\x15\xf6\x8f\x35\x9f\x7f\xf3\x4d\x11\x00\x00\
-\x00\x00\x00\x73\x11\xf6\x6b\x46\x37\x47\x02\x00\x44\x4d\x39\x12\
-\x00\x20\xb5\xc2\x7e\x73\xf7\xc6\xbf\xbc\x21\x02\x00\x00\x00\x00\
-\x60\x2e\xc2\x7e\xcd\xa8\x1c\x09\x00\x10\x35\xe5\x48\x00\x00\x16\
-\xc4\xeb\xbf\x79\xdd\x12\x00\x00\x00\x00\x80\xb9\xf0\x35\x23\x00\
-\x00\x57\x4d\x39\x12\x00\x20\xb5\x3a\x3a\x3a\x02\x9e\x7e\xee\xdc\
-\x39\x11\x00\x00\x00\x00\x00\x73\x11\xf6\x6b\xc6\xf6\xf6\x76\x11\
-\x00\x00\xc4\x4b\x39\x12\x00\x80\x05\x31\xf6\xc2\x98\x25\x00\x00\
-\x00\x00\x00\x73\x11\xf6\x6b\xc6\xb6\xb6\x36\x11\x00\x00\xc4\x6b\
-\xc9\xcc\xcc\x8c\x2d\x00\x00\xa4\xd2\x85\x0b\x17\xfe\xe8\x8f\xfe\
-\x28\xe0\x00\x17\x2f\x5e\xcc\x64\x32\x82\x00\x00\x00\x00\x00\xae\
-\xce\x92\x25\x4b\x02\x9e\x7e\xf6\xec\xd9\x7c\x3e\x2f\x05\x00\x80\
-\x48\xb9\x39\x12\x00\x20\xb5\x82\xff\xb1\xe6\x5a\xad\x26\x05\x00\
-\x00\x00\x00\xe0\xea\x54\xab\xd5\xb0\x03\x68\x46\x02\x00\x44\x4d\
-\x39\x12\x00\x20\xcd\x8a\xc5\x62\xc0\xd3\x4f\x9f\x7e\x4d\x04\x00\
-\x00\x00\x00\xc0\xd5\x39\xff\xe6\x9b\x01\x4f\xcf\xe5\x72\x22\x00\
-\x00\x88\x9a\x72\x24\x00\x40\x9a\x85\xbd\x3c\xf2\x8d\x37\xde\x10\
-\x01\x00\x00\x00\x00\x70\x75\x7e\xf9\xcf\xbf\x0c\x78\xba\x6b\x23\
-\x01\x00\x62\xa7\x1c\x09\x00\x90\x66\xed\xed\xed\x01\x4f\x3f\x75\
-\xf2\x94\x08\x00\x00\x00\x00\x80\xab\x13\xf6\x0b\xc6\xb0\x5f\xae\
-\x02\x00\x30\x77\xca\x91\x00\x00\x69\x16\xf6\xe6\xc8\xa1\xe1\x61\
-\x11\x00\x00\x00\x00\x00\x57\x67\xec\x85\xb1\x80\xa7\x87\xfd\x72\
-\x15\x00\x80\xb9\x53\x8e\x04\x00\x48\xb3\x8e\x8e\x8e\xb0\x03\xd4\
-\x6a\x35\x29\x00\x00\x00\x00\x00\x57\xaa\xd1\x68\xd4\xeb\xd3\x01\
-\x07\x08\xfe\xe5\x2a\x00\x00\x73\xa4\x1c\x09\x00\x90\x66\xf9\x7c\
-\x3e\xec\x00\x67\x7e\xf5\x2b\x29\x00\x00\x00\x00\x00\x57\x6a\xea\
-\xc4\x89\xb0\x03\x04\xff\x72\x15\x00\x80\x39\x52\x8e\x04\x00\x48\
-\xb3\xe0\xdf\xdf\xfd\xf2\x9f\x7f\x29\x05\x00\x00\x00\x00\xe0\x4a\
-\x05\xff\x6a\x51\x39\x12\x00\x20\x76\xca\x91\x00\x00\x29\xb7\x76\
-\xed\xda\x80\xa7\x57\x5e\xac\x88\x00\x00\x00\x00\x00\xb8\x52\x61\
-\xbf\x5a\x0c\xfb\xb5\x2a\x00\x00\xf3\x42\x39\x12\x00\x20\xe5\xc2\
-\xfe\xf9\xe6\x3d\x23\x23\xcd\x66\x53\x0a\x00\x00\x00\x00\xc0\x15\
-\xd9\x33\x32\x12\xf0\x74\xd7\x46\x02\x00\xa4\x80\x72\x24\x00\x40\
-\xca\xb5\xb7\xb7\x87\x1d\xa0\x3a\x35\x25\x05\x00\x00\x00\x00\xe0\
-\xf2\x55\xab\xd5\xb0\x03\x28\x47\x02\x00\xa4\x80\x72\x24\x00\x40\
-\xca\x05\x2f\x47\x1e\x7b\xf9\x98\x14\x00\x00\x00\x00\x80\xcb\x77\
-\xfc\xf8\xcb\x61\x07\xe8\xe8\xe8\x90\x02\x00\x40\xec\x94\x23\x01\
-\x00\x52\x2e\x78\x39\xb2\xf2\x62\x45\x0a\x00\x00\x00\x00\xc0\xe5\
-\xdb\xb7\x77\x5f\xd8\x01\x82\x7f\xad\x0a\x00\xc0\xdc\x2d\x99\x99\
-\x99\xb1\x05\x00\x80\x74\xcb\xe7\xf3\xd3\xd3\xd3\x01\x07\xb8\x78\
-\xf1\x62\x26\x93\x11\x04\x00\x00\x00\x00\xf0\xa1\x9a\xcd\xe6\x35\
-\xd7\x5c\x13\x70\x80\x5c\x2e\x57\xaf\xd7\x05\x01\x00\x10\x3b\x37\
-\x47\x02\x00\xa4\x5f\xf0\x3f\xe5\x3c\x59\x71\x79\x24\x00\x00\x00\
-\x00\x70\x59\xaa\x53\x53\x61\x07\x70\x6d\x24\x00\x40\x3a\x28\x47\
-\x02\x00\xa4\x5f\x47\x47\x47\xd8\x01\x8e\x1e\x3d\x2a\x05\x00\x00\
-\x00\x00\xe0\x72\x8c\x8d\x8d\x85\x1d\x40\x39\x12\x00\x20\x1d\x94\
-\x23\x01\x00\xd2\x2f\xf8\x77\x79\xbb\x76\xef\x92\x02\x00\x00\x00\
-\x00\x70\x39\x26\x0e\x4d\x84\x1d\x20\xf8\x9f\x36\x07\x00\x60\x5e\
-\x2c\x99\x99\x99\xb1\x05\x00\x80\xf4\xff\x6b\xdf\x92\x25\x61\x07\
-\x38\x73\xe6\x4c\xa1\x50\x10\x04\x00\x00\x00\x00\xf0\x01\x6a\xb5\
-\xda\xf5\xd7\x5f\x1f\x76\x06\xff\x1b\x3a\x00\x40\x3a\xb8\x39\x12\
-\x00\xa0\x25\xac\x5d\xbb\x36\xec\x00\xcf\x3e\x3b\x2a\x05\x00\x00\
-\x00\x00\xe0\x83\x05\xff\x22\xb1\x58\x2c\x4a\x01\x00\x20\x1d\x94\
-\x23\x01\x00\x5a\x42\xf0\x17\xc1\x8c\x8e\x2a\x47\x02\x00\x00\x00\
-\x00\x1f\x22\xf8\x17\x89\xde\xa9\x0d\x00\x90\x1a\xca\x91\x00\x00\
-\x2d\xa1\xbd\xbd\x3d\xec\x00\xe3\xe3\x13\xb5\x5a\x4d\x10\x00\x00\
-\x00\x00\xc0\x1f\xd2\x68\x34\xc6\xc7\x27\xc2\xce\xa0\x1c\x09\x00\
-\x90\x1a\xca\x91\x00\x00\x2d\x21\x09\xdf\xe8\x79\xb3\x36\x00\x00\
-\x00\x00\xf0\x01\xf6\xee\xfd\x79\xf0\x19\x94\x23\x01\x00\x52\x43\
-\x39\x12\x00\xa0\x25\xb4\xb5\xb5\x15\x8b\xc5\xb0\x33\x78\xb3\x36\
-\x00\x00\x00\x00\xf0\x01\x9e\x7e\xfa\xe9\xb0\x03\x14\x8b\xc5\xb6\
-\xb6\x36\x41\x00\x00\xa4\x83\x72\x24\x00\x40\xab\x08\xfe\x27\x9e\
-\xbd\x59\x1b\x00\x00\x00\x00\xf8\x43\x6a\xb5\x9a\x77\x6a\x03\x00\
-\x30\x8f\x94\x23\x01\x00\x5a\xc5\x86\x0d\x1b\x82\xcf\xe0\xcd\xda\
-\x00\x00\x00\x00\xc0\xfb\x4a\xc2\x97\x87\xca\x91\x00\x00\x69\xb2\
-\x64\x66\x66\xc6\x16\x00\x00\x5a\xe5\x5f\xfe\x96\x2c\x09\x3b\x40\
-\x3e\x9f\x3b\x7b\xb6\x2e\x08\x00\x00\x00\x00\xe0\x3d\x96\x2f\xcf\
-\xd7\xeb\xd3\x61\x67\xf0\xbf\x9e\x03\x00\xa4\x89\x9b\x23\x01\x00\
-\x5a\xc8\xbd\xf7\xde\x1b\x76\x80\x7a\x7d\xfa\xc0\xfe\xfd\x82\x00\
-\x00\x00\x00\x00\xde\x6d\xb2\x52\x09\xde\x8c\x0c\xfe\xf5\x29\x00\
-\x00\xf3\x4b\x39\x12\x00\xa0\x85\x24\xe1\xa5\x30\x07\x0f\x1e\x14\
-\x04\x00\x00\x00\x00\xf0\x6e\x23\x23\x23\xc1\x67\xf0\x4e\x6d\x00\
-\x80\x94\xf1\x5a\x6d\x00\x80\x16\x52\xaf\xd7\x97\x2f\x5f\x1e\x7c\
-\x8c\xf3\xe7\xcf\x67\xb3\x59\x71\x00\x00\x00\x00\x00\xb3\x1a\x8d\
-\xc6\xb2\x65\xcb\x82\x8f\x71\xf6\xec\xd9\x7c\x3e\x2f\x0e\x00\x80\
-\xd4\x70\x73\x24\x00\x40\x0b\xc9\xe7\xf3\xc5\x62\x31\xf8\x18\xff\
-\xf8\x8f\xff\x4f\x16\x00\x00\x00\x00\xc0\x25\x7b\xf7\xfe\x3c\xf8\
-\x0c\xb9\x5c\x4e\x33\x12\x00\x20\x65\x94\x23\x01\x00\x5a\x4b\x12\
-\x5e\x0d\xf3\xdd\xef\x7e\x57\x10\x00\x00\x00\x00\xc0\x25\x8f\x3e\
-\xfa\x68\xf0\x19\x36\x6c\xd8\x20\x08\x00\x80\x94\x51\x8e\x04\x00\
-\x68\x2d\x9b\x36\x6d\x0a\x3e\x43\xbd\x3e\x7d\x60\xff\x7e\x59\x00\
-\x00\x00\x00\x00\x07\xf6\xef\xaf\xd7\xa7\x83\x8f\x91\x84\x2f\x4e\
-\x01\x00\x98\x5f\xca\x91\x00\x00\xad\xa5\xbd\xbd\x3d\x97\xcb\x05\
-\x1f\xe3\x07\x3f\xf8\x81\x2c\x00\x00\x00\x00\x80\x24\x7c\x55\x98\
-\xcb\xe5\xda\xdb\xdb\x65\x01\x00\x90\x32\xca\x91\x00\x00\x2d\x27\
-\x09\x2f\x88\xd9\x33\x32\x52\xad\x56\x65\x01\x00\x00\x00\x00\xad\
-\xac\x5a\xad\xee\x19\x19\x09\x3e\x86\x77\x6a\x03\x00\xa4\x92\x72\
-\x24\x00\x40\xcb\x49\xc8\x0b\x62\xfe\xfe\x7b\xdf\x93\x05\x00\x00\
-\x00\x00\xb4\xb2\x84\x7c\x49\xa8\x1c\x09\x00\x90\x4a\x4b\x66\x66\
-\x66\x6c\x01\x00\xa0\xd5\xe4\xf3\xf9\xe9\xe9\xe9\xe0\x63\x9c\x39\
-\x73\xa6\x50\x28\x88\x03\x00\x00\x00\x00\x5a\x50\xa3\xd1\x58\xb6\
-\x6c\x59\xf0\x31\x72\xb9\x5c\xbd\x5e\x17\x07\x00\x40\xfa\xb8\x39\
-\x12\x00\xa0\x15\x25\xe4\x4f\x42\xff\xdf\xa7\x9f\x96\x05\x00\x00\
-\x00\x00\xb4\xa6\xff\xfd\xc4\x13\x49\x18\xc3\xb5\x91\x00\x00\x69\
-\xe5\xe6\x48\x00\x80\x56\x34\x35\x35\xb5\x72\xe5\xca\x24\x4c\x72\
-\xfe\xfc\xf9\x6c\x36\x2b\x11\x00\x00\x00\x00\x68\x29\x09\xb9\x36\
-\x72\xd6\x89\x13\x27\xda\xdb\xdb\x25\x02\x00\x90\x3e\x6e\x8e\x04\
-\x00\x68\x45\xed\xed\xed\xb9\x5c\x2e\x09\x93\x24\xe4\x4f\x87\x03\
-\x00\x00\x00\x00\x8b\x29\x21\x5f\x0c\xe6\x72\x39\xcd\x48\x00\x80\
-\xb4\x52\x8e\x04\x00\x68\x51\x0f\x3f\xfc\x70\x12\xc6\xd8\x36\x38\
-\xd8\x68\x34\xc4\x01\x00\x00\x00\x00\xad\xa3\xd1\x68\x6c\x1b\x1c\
-\x4c\xc2\x24\x09\xf9\x9a\x14\x00\x80\x85\xa0\x1c\x09\x00\xd0\xa2\
-\x36\x6c\xd8\x90\x90\x49\xfe\xe7\x37\xbe\x21\x0e\x00\x00\x00\x00\
-\x68\x1d\x8f\x7d\xfb\xdb\x09\x99\x24\x39\x5f\x93\x02\x00\x30\xef\
-\x96\xcc\xcc\xcc\xd8\x02\x00\x40\x6b\xda\xb0\x61\xc3\xcf\x7e\xf6\
-\xb3\x24\x4c\x32\x35\x35\x55\x2c\x16\x25\x02\x00\x00\x00\x00\xa9\
-\x57\xad\x56\x13\xf2\x26\xeb\x7b\xef\xbd\xf7\xa7\x3f\xfd\xa9\x44\
-\x00\x00\xd2\xca\xcd\x91\x00\x00\xad\x6b\xd3\xa6\x4d\x09\x99\xe4\
-\xef\xbf\xf7\x3d\x71\x00\x00\x00\x00\x40\x2b\x48\xce\x97\x81\xae\
-\x8d\x04\x00\x48\x37\x37\x47\x02\x00\xb4\xb4\xb6\xb6\xb6\xb7\xde\
-\x7a\x2b\x09\x93\x54\x5e\x7c\x71\x4d\xa9\x24\x11\x00\x00\x00\x00\
-\x48\xb1\xc9\x4a\xa5\x74\xfb\xed\x49\x98\x64\xe9\xd2\xa5\x17\x2e\
-\x5c\x90\x08\x00\x40\x8a\xb9\x39\x12\x00\xa0\xa5\x3d\xfc\xf0\xc3\
-\x09\x99\xe4\x91\xad\x8f\x88\x03\x00\x00\x00\x00\xd2\x2d\x39\x5f\
-\x03\x26\xe7\xbd\x3a\x00\x00\x2c\x10\x37\x47\x02\x00\xb4\xb4\x7a\
-\xbd\xbe\x7c\xf9\xf2\x84\x0c\x33\x34\xf4\x64\x5f\x5f\xbf\x50\x00\
-\x00\x00\x00\x20\x95\x86\x87\x87\xfa\xfb\x1f\x4a\xc8\x30\x67\xcf\
-\x9e\xcd\xe7\xf3\x42\x01\x00\x48\x31\x37\x47\x02\x00\xb4\xb4\x7c\
-\x3e\x7f\xef\xbd\xf7\x26\x64\x98\x47\x1f\x7d\xb4\xd1\x68\x08\x05\
-\x00\x00\x00\x00\xd2\xa7\xd9\x6c\x3e\xfa\xe8\xa3\x09\x19\xe6\xde\
-\x7b\xef\xd5\x8c\x04\x00\x48\x3d\xe5\x48\x00\x80\x56\x97\x9c\x37\
-\x6b\xd7\xeb\xd3\x8f\x7d\xfb\xdb\x12\x01\x00\x00\x00\x80\xf4\xd9\
-\xf1\xf8\xe3\xf5\xfa\x74\x42\x86\xf1\x4e\x6d\x00\x80\x56\xe0\xb5\
-\xda\x00\x00\xfc\xf6\xfe\xc8\xe9\xe9\xa4\x7c\x2f\x39\x35\x35\x55\
-\x2c\x16\x85\x02\x00\x00\x00\x00\xa9\x51\xad\x56\xdb\xdb\xdb\x13\
-\x32\x4c\x2e\x97\xab\xd7\xeb\x42\x01\x00\x48\x3d\x37\x47\x02\x00\
-\xf0\x91\xc1\xc1\xc1\xe4\x0c\x33\x30\xf0\x70\xb3\xd9\x14\x0a\x00\
-\x00\x00\x00\xa4\xc6\xc0\xc0\xc3\xc9\x19\x26\x51\x5f\x87\x02\x00\
-\xb0\x70\xdc\x1c\x09\x00\xc0\x6f\xb5\xb5\xb5\xbd\xf5\xd6\x5b\x09\
-\x19\x66\x68\xe8\xc9\xbe\xbe\x7e\xa1\x00\x00\x00\x00\x40\x0a\x0c\
-\x0f\x0f\xf5\xf7\x3f\x94\x90\x61\x96\x2e\x5d\x5a\xaf\xd7\xdb\xda\
-\xda\xe4\x02\x00\x90\x7a\x6e\x8e\x04\x00\xe0\xb7\x1e\x7e\x38\x41\
-\x7f\x74\xbb\xbf\xff\xa1\x5a\xad\x26\x14\x00\x00\x00\x00\x88\x5d\
-\xad\x56\x4b\x4e\x33\xf2\x23\xbf\xfb\x22\x54\x33\x12\x00\xa0\x45\
-\xb8\x39\x12\x00\x80\xdf\xba\x70\xe1\x42\x3e\x9f\x4f\xce\xe5\x91\
-\xbd\xe5\xf2\x3f\xed\xd9\x23\x17\x00\x00\x00\x00\x88\xda\x9f\xf7\
-\xf6\xee\x19\x19\x49\xce\x3c\xff\xfa\xaf\xff\xaa\x1c\x09\x00\xd0\
-\x22\xdc\x1c\x09\x00\xc0\x6f\xb5\xb5\xb5\x6d\xd8\xb0\x21\x39\xf3\
-\xec\x19\x19\x19\x1e\x1e\x92\x0b\x00\x00\x00\x00\xc4\x6b\x78\x78\
-\x28\x51\xcd\xc8\x07\x1f\x7c\x50\x33\x12\x00\xa0\x75\xb8\x39\x12\
-\x00\x80\x7f\x53\xaf\xd7\x97\x2f\x5f\x9e\xa8\x91\xce\x9c\x39\x53\
-\x28\x14\x44\x03\x00\x00\x00\x00\xd1\xa9\xd5\x6a\xd7\x5f\x7f\x7d\
-\xa2\x46\x3a\x7b\xf6\x6c\x3e\x9f\x17\x0d\x00\x40\x8b\x70\x73\x24\
-\x00\x00\xff\x26\x9f\xcf\x3f\xf8\xe0\x83\x89\x1a\xe9\x8b\x5f\x7c\
-\xa8\xd9\x6c\x8a\x06\x00\x00\x00\x00\xe2\xd2\x6c\x36\xbf\xf8\xc5\
-\x87\x12\x35\xd2\x83\x0f\x3e\xa8\x19\x09\x00\xd0\x52\x94\x23\x01\
-\x00\xf8\x77\x83\x83\x83\x89\x9a\x67\x7c\x7c\x62\xc7\xe3\x8f\xcb\
-\x05\x00\x00\x00\x00\xe2\xb2\xe3\xf1\xc7\xc7\xc7\x27\x12\x35\x52\
-\xd2\xbe\xfc\x04\x00\x60\xa1\x29\x47\x02\x00\xf0\xef\x12\x78\x79\
-\xe4\xb6\xc1\xc1\x03\xfb\xf7\x8b\x06\x00\x00\x00\x00\x62\x31\x59\
-\xa9\x6c\x4b\x58\x13\xd1\xb5\x91\x00\x00\x2d\x68\xc9\xcc\xcc\x8c\
-\x2d\x00\x00\xf0\x8e\x7a\xbd\xbe\x7c\xf9\xf2\x44\x8d\x94\xcf\xe7\
-\x9e\x7f\x7e\xac\x50\x28\x48\x07\x00\x00\x00\x00\x12\xae\xd1\x68\
-\xdc\x7a\xeb\xea\x7a\x7d\x3a\x51\x53\x9d\x3d\x7b\x56\x39\x12\x00\
-\xa0\xd5\xb8\x39\x12\x00\x80\xff\x20\x81\x97\x47\xd6\xeb\xd3\x5f\
-\xff\xda\xd7\x9a\xcd\xa6\x74\x00\x00\x00\x00\x20\xc9\x9a\xcd\xe6\
-\x5f\x7f\xf9\xcb\x49\x6b\x46\xba\x36\x12\x00\xa0\x35\xb9\x39\x12\
-\x00\x80\xf7\xba\x70\xe1\x42\x3e\x9f\x7f\xeb\xad\xff\xcf\xde\xfd\
-\xc4\xc6\x99\xd6\x07\x1c\x37\x9c\x2d\xe6\xbd\x65\xb7\x1c\x66\x16\
-\xa3\x52\x04\xd5\xbc\x48\x45\xdd\x42\x96\x79\x53\x5b\x22\x3e\x10\
-\x8f\x12\x36\x2b\x5a\x24\xcf\xae\x57\x2a\xb7\xf1\x72\xe0\x40\x05\
-\x33\x0e\x2a\x07\x0e\xd8\xdc\xa8\x44\xe2\xd7\x12\x2d\x22\xd1\x46\
-\x63\x2e\xeb\xa0\x4d\xfd\x5a\xcd\x72\x69\xa5\x7d\x47\x05\x51\x2a\
-\x4c\xdf\x39\xd0\xc5\xb7\x31\xf2\x7d\xeb\xc6\x6d\x94\xb2\xd9\xc4\
-\x49\xfc\xe7\x9d\x67\x3e\x9f\x83\x35\xb2\x72\x78\xe6\xf7\xcb\x29\
-\xfa\xe6\x79\x76\x4b\x75\xaa\xa5\x6e\xf7\x9b\x9d\x8e\xed\x00\x00\
-\x00\x00\x40\x69\x5d\x59\x5a\x2a\xdb\x83\xda\x13\xae\x8d\x04\x00\
-\x18\x57\x6e\x8e\x04\x00\xe0\x0f\x45\x51\xb4\xb8\xb8\x58\xb6\x53\
-\x75\xba\xdd\x5b\x1b\x1b\xb6\x03\x00\x00\x00\x00\xe5\x74\x6b\x63\
-\xa3\x84\x65\x64\xa7\xd3\x51\x46\x02\x00\x8c\x27\x37\x47\x02\x00\
-\xf0\x00\xe5\xbc\x3c\x72\xdf\xaf\x7f\xfd\xeb\xa9\xa9\x29\x0b\x02\
-\x00\x00\x00\x80\x52\xd9\xde\xde\xfe\xe8\x47\x3f\x5a\xb6\x53\x55\
-\x2a\x95\xa2\x28\xa2\x28\xb2\x20\x00\x80\x31\xe4\xe6\x48\x00\x00\
-\x1e\x20\x8a\xa2\x6e\xf9\xfe\x93\xf7\xbe\x99\x99\xe9\x9d\x9d\x1d\
-\x0b\x02\x00\x00\x00\x80\xf2\xd8\xd9\xd9\x99\x99\x99\x2e\xe1\xc1\
-\x16\x17\x17\x95\x91\x00\x00\x63\xcb\xcd\x91\x00\x00\xbc\xaf\x5a\
-\xad\x36\x18\x0c\xca\x76\xaa\x4b\x17\x2f\xa6\x6b\x6b\x93\x93\x93\
-\x16\x04\x00\x00\x00\x00\xa7\x6e\x6f\x6f\xaf\x35\x3f\xff\xfa\xcd\
-\x9b\x65\x3b\x58\xb5\x5a\x2d\x8a\xc2\x82\x00\x00\xc6\x96\x9b\x23\
-\x01\x00\x78\x5f\x69\x9a\x96\xf0\x54\xaf\xdf\xbc\xb9\xd8\x6e\xdb\
-\x0e\x00\x00\x00\x00\x94\x41\xe7\x9b\xdf\x2c\x61\x19\xb9\x6f\x65\
-\x65\xc5\x76\x00\x00\xc6\x99\x38\x12\x00\x80\xf7\x95\x24\x49\xa3\
-\xd1\x28\xe1\xc1\xae\x5e\xbb\x76\x65\x69\xc9\x82\x00\x00\x00\x00\
-\xe0\x74\x5d\x59\x5a\xfa\xee\xf2\x72\x09\x0f\xd6\x68\x34\x9a\xcd\
-\xa6\x05\x01\x00\x8c\x33\xcf\x6a\x03\x00\xf0\x30\x45\x51\x3c\xf7\
-\xdc\x73\xe5\x3c\xdb\xd5\xab\x3f\x78\xe5\x95\x05\x3b\x02\x00\x00\
-\x00\x80\x53\x71\xe3\xc6\xf5\xcb\x97\x5f\x2a\xe7\xd9\xde\x7e\xfb\
-\xed\x38\x8e\xed\x08\x00\x60\x9c\xb9\x39\x12\x00\x80\x87\xa9\xd5\
-\x6a\x9d\x4e\xa7\x9c\x67\x5b\x58\x78\xf5\xd6\xc6\x86\x1d\x01\x00\
-\x00\x00\xc0\xc9\xbb\xb5\xb1\x51\xda\x32\xb2\xdd\x6e\x2b\x23\x01\
-\x00\x70\x73\x24\x00\x00\x8f\x30\x1c\x0e\xe3\x38\x1e\x0c\x06\xe5\
-\x3c\xde\xc6\x1b\x6f\x7c\xfe\xfc\x79\x6b\x02\x00\x00\x00\x80\x13\
-\x73\x6b\x63\xe3\xfc\xec\x6c\x39\xcf\x56\xa9\x54\x8a\xa2\x88\xa2\
-\xc8\x9a\x00\x00\xc6\x9c\x9b\x23\x01\x00\x78\x84\x28\x8a\x56\x56\
-\x56\x4a\x7b\xbc\xf3\xb3\xb3\x6f\xdd\xb9\x63\x4d\x00\x00\x00\x00\
-\x70\x32\xfa\xfd\x7e\x69\xcb\xc8\x7d\x69\x9a\x2a\x23\x01\x00\x98\
-\x70\x73\x24\x00\x00\x87\x94\x24\xc9\xd6\xd6\x56\x39\xcf\x56\xab\
-\x55\xdf\x7c\xf3\xf6\xd4\xd4\x94\x35\x01\x00\x00\x00\xc0\xb1\xda\
-\xde\xde\x9e\x99\x99\x2e\x8a\x92\xbe\x33\xd3\x68\x34\xb2\x2c\xb3\
-\x26\x00\x00\x26\xc4\x91\x00\x00\x1c\x52\x51\x14\x71\x1c\xef\xee\
-\xee\x96\xf3\x78\xfa\x48\x00\x00\x00\x00\x38\x6e\x25\x2f\x23\x2b\
-\x95\x4a\x9e\xe7\xb5\x5a\xcd\xa6\x00\x00\x98\xf0\xac\x36\x00\x00\
-\x87\x54\xab\xd5\xba\xdd\x6e\x69\x8f\x57\x14\x83\x99\x99\xe9\xed\
-\xed\x6d\x9b\x02\x00\x00\x00\x80\xe3\x50\xf2\x32\x72\x5f\xb7\xdb\
-\x55\x46\x02\x00\x70\x8f\x9b\x23\x01\x00\x78\x0c\x65\x7e\x5c\x7b\
-\xe2\xee\xfd\x91\xbd\xde\x7a\xbd\x5e\xb7\x29\x00\x00\x00\x00\x38\
-\x42\xe5\x2f\x23\xeb\xf5\x7a\x9e\xe7\x36\x05\x00\xc0\x3d\x6e\x8e\
-\x04\x00\xe0\x31\xa4\x69\x5a\xa9\x54\x4a\x7b\xbc\xa2\x18\xc4\x71\
-\x7c\x6b\x63\xc3\xa6\x00\x00\x00\x00\xe0\xa8\xdc\xda\xd8\x28\x79\
-\x19\x39\x71\xf7\x9f\x2e\x6d\x0a\x00\x80\xfb\x89\x23\x01\x00\x78\
-\x0c\x25\x7f\x5c\xfb\xc0\xf9\xd9\x59\x7d\x24\x00\x00\x00\x00\x1c\
-\x89\x5b\x1b\x1b\xe7\x67\x67\x4b\x5e\x46\x76\x3a\x9d\x38\x8e\x2d\
-\x0b\x00\x80\xfb\x79\x56\x1b\x00\x80\xc7\x56\xf2\xc7\xb5\x0f\x6c\
-\xbc\xf1\xc6\xe7\xcf\x9f\xb7\x2c\x00\x00\x00\x00\x78\x62\x07\x65\
-\x64\xc9\x0f\xd9\x68\x34\xb2\x2c\xb3\x2c\x00\x00\xfe\x80\x9b\x23\
-\x01\x00\x78\x6c\x25\x7f\x5c\xfb\xc0\xf9\xd9\xd9\x2b\x4b\x4b\x96\
-\x05\x00\x00\x00\x00\x4f\xe6\xca\xd2\x52\xf9\xcb\xc8\x4a\xa5\xe2\
-\x41\x6d\x00\x00\x1e\x48\x1c\x09\x00\xc0\x63\xab\xd5\x6a\x2b\x2b\
-\x2b\xe5\x3f\x67\xa7\xdb\xbd\xb2\xb4\xb4\xb7\xb7\x67\x65\x00\x00\
-\x00\x00\x70\x78\x7b\x7b\x7b\x57\x96\x96\x3a\xdd\x6e\xf9\x8f\xda\
-\xed\x76\x6b\xb5\x9a\x95\x01\x00\xf0\x5e\x9e\xd5\x06\x00\xe0\x09\
-\x35\x9b\xcd\xf5\xf5\xf5\xf2\x9f\xf3\xd2\xc5\x8b\xe9\xda\xda\xe4\
-\xe4\xa4\x95\x01\x00\x00\x00\xc0\x23\xed\xed\xed\xb5\xe6\xe7\x5f\
-\xbf\x79\xb3\xfc\x47\x9d\x9b\x9b\xeb\xf5\x7a\x56\x06\x00\xc0\x03\
-\x89\x23\x01\x00\x78\x42\xc3\xe1\x30\x8e\xe3\xc1\x60\x50\xfe\xa3\
-\xd6\x6a\xd5\x37\xdf\xbc\x3d\x35\x35\x65\x6b\x00\x00\x00\x00\xf0\
-\x10\xdb\xdb\xdb\x33\x33\xd3\x45\x31\x02\xff\xe8\x57\xad\x56\xf3\
-\x3c\x8f\xa2\xc8\xd6\x00\x00\x78\x20\xcf\x6a\x03\x00\xf0\x84\xa2\
-\x28\x1a\x95\xff\x96\x5d\x14\x83\x99\x99\xe9\x5b\x1b\x1b\xb6\x06\
-\x00\x00\x00\x00\xef\xe7\xd6\xc6\xc6\xa8\x94\x91\xfb\xd2\x34\x55\
-\x46\x02\x00\xf0\x10\xe2\x48\x00\x00\x9e\x5c\x1c\xc7\xcb\xcb\xcb\
-\x23\x71\xd4\xa2\x18\x9c\x9f\x9d\x5d\x59\x59\xb6\x35\x00\x00\x00\
-\x00\x78\xaf\x95\x95\xe5\xf3\xb3\xb3\xa3\x52\x46\x76\x3a\x9d\x24\
-\x49\x6c\x0d\x00\x80\x87\xf0\xac\x36\x00\x00\x4f\xab\xd9\x6c\xae\
-\xaf\xaf\x8f\xca\x69\x2f\x5d\xbc\x98\xae\xad\x4d\x4e\x4e\x5a\x1c\
-\x00\x00\x00\x00\xec\xdb\xdb\xdb\x5b\x6c\xb7\xaf\x5e\xbb\x36\x2a\
-\x07\x6e\x34\x1a\x59\x96\x59\x1c\x00\x00\x0f\x27\x8e\x04\x00\xe0\
-\x69\x0d\x87\xc3\x38\x8e\x07\x83\xc1\xa8\x1c\xb8\x56\xab\xf6\x7a\
-\xeb\xf5\x7a\xdd\xee\x00\x00\x00\x00\x18\x73\xfd\x7e\xbf\xd9\x9c\
-\x1b\x95\x0b\x23\xf7\x55\xab\xd5\x3c\xcf\x3d\xa8\x0d\x00\xc0\x23\
-\x79\x56\x1b\x00\x80\xa7\x15\x45\x51\xaf\xd7\xab\x54\x2a\xa3\x72\
-\xe0\xa2\x18\xc4\x71\xec\x89\x6d\x00\x00\x00\x00\xc6\xdc\xb5\x6b\
-\x57\xe3\x38\x1e\xa1\x32\x72\x5f\xaf\xd7\x53\x46\x02\x00\x70\x18\
-\xe2\x48\x00\x00\x8e\xc0\xdd\xd6\x70\x65\xb4\xce\xfc\xda\x6b\x5f\
-\xfd\xe2\xa5\x4b\xdb\xdb\xdb\xd6\x07\x00\x00\x00\xc0\xb8\xd9\xd9\
-\xd9\xf9\xe2\xa5\x4b\x0b\x0b\xaf\x8e\xd6\xb1\x57\x57\x57\xe3\x38\
-\xb6\x3e\x00\x00\x0e\x43\x1c\x09\x00\xc0\xd1\x68\xb5\x5a\xf3\xf3\
-\xf3\xa3\x75\xe6\xd7\x6f\xde\x9c\x99\x99\xbe\x71\xe3\xba\xf5\x01\
-\x00\x00\x00\x30\x3e\x6e\xdc\xb8\xfe\xfc\xf3\x7f\xfe\xfa\xcd\x9b\
-\xa3\x75\xec\xf9\xf9\xf9\x56\xab\x65\x7d\x00\x00\x1c\xd2\x07\xde\
-\x7d\xf7\x5d\x53\x00\x00\xe0\xa8\x24\x49\xb2\xb5\xb5\x35\x72\xc7\
-\x5e\x78\xe5\x95\xbf\xfb\xf6\xb7\xcf\x9c\x39\x63\x83\x00\x00\x00\
-\x00\x04\x6c\x67\x67\xe7\x6f\xbf\xfe\xf5\xab\xd7\xae\x8d\xdc\xc9\
-\xeb\xf5\x7a\x9e\xe7\x36\x08\x00\xc0\xe1\x89\x23\x01\x00\x38\x4a\
-\xc3\xe1\x30\x49\x92\x7e\xbf\x3f\x72\x27\xaf\xd5\xaa\xdf\xf9\xce\
-\x77\x5e\x7c\xf1\xb2\x25\x02\x00\x00\x00\x10\xa4\x1b\x37\xae\x7f\
-\xed\x6b\x5f\x2b\x8a\xc1\xc8\x9d\xbc\x5a\xad\xe6\x79\x1e\x45\x91\
-\x25\x02\x00\x70\x78\x9e\xd5\x06\x00\xe0\x28\x45\x51\x94\xa6\x69\
-\xa5\x52\x19\xb9\x93\x17\xc5\xe0\xf2\xe5\x97\x5e\x5d\x58\xd8\xde\
-\xde\xb6\x47\x00\x00\x00\x00\x42\xb2\xbd\xbd\xfd\xea\xc2\xc2\xe5\
-\xcb\x2f\x8d\x62\x19\x59\xa9\x54\x7a\xbd\x9e\x32\x12\x00\x80\xc7\
-\xe5\xe6\x48\x00\x00\x8e\x5e\x96\x65\xe7\xce\x9d\x1b\xdd\xf3\x5f\
-\xbd\xfa\x83\xcb\x97\x5f\x9a\x9c\x9c\xb4\x4a\x00\x00\x00\x00\x46\
-\xda\xde\xde\xde\xf5\xeb\x3f\x5e\x58\x78\x75\x74\xbf\xc2\xe6\xe6\
-\x66\x92\x24\x56\x09\x00\xc0\xe3\x72\x73\x24\x00\x00\x47\x2f\x49\
-\x92\xd5\xd5\xd5\xd1\x3d\xff\xc2\xc2\xab\x17\x2e\x7c\xe1\xad\x3b\
-\x77\xac\x12\x00\x00\x00\x80\xd1\xf5\xd6\x9d\x3b\x17\x2e\x7c\x61\
-\xa4\xcb\xc8\xd5\xd5\x55\x65\x24\x00\x00\x4f\x46\x1c\x09\x00\xc0\
-\xb1\x68\xb5\x5a\x9d\x4e\x67\x74\xcf\xbf\xb9\x99\x9d\x7d\xe1\x05\
-\xaf\x6c\x03\x00\x00\x00\x30\x8a\x0e\xde\xd1\x3e\xfb\xc2\x0b\x9b\
-\x9b\xd9\xe8\x7e\x8b\x76\xbb\xdd\x6a\xb5\x6c\x13\x00\x80\x27\xe3\
-\x59\x6d\x00\x00\x8e\x51\xab\xd5\x5a\x5b\x5b\x1b\xf5\x6f\xb1\xd4\
-\xed\xfe\xcd\x57\xbe\x72\xe6\xcc\x19\x0b\x05\x00\x00\x00\xa0\xe4\
-\x76\x76\x76\xfe\xfe\xfb\xdf\xef\x74\xbb\xa3\xfe\x45\xe6\xe7\xe7\
-\xd3\x34\xb5\x50\x00\x00\x9e\x98\x38\x12\x00\x80\xe3\x15\x46\x1f\
-\xb9\xef\xea\xd5\x1f\x5c\xbe\xfc\xd2\xe4\xe4\xa4\x9d\x02\x00\x00\
-\x00\x50\x42\x7b\x7b\x7b\xd7\xaf\xff\xf8\x5b\xdf\xfa\x56\x51\x0c\
-\x46\xfd\xbb\xcc\xcd\xcd\xf5\x7a\x3d\x3b\x05\x00\xe0\x69\x88\x23\
-\x01\x00\x38\x5e\xc3\xe1\x30\x49\x92\x7e\xbf\x1f\xc0\x77\xa9\xd5\
-\xaa\xdf\xf8\xc6\x37\x24\x92\x00\x00\x00\x00\x94\x4a\x48\x59\xe4\
-\xbe\x7a\xbd\x9e\x65\x59\x14\x45\x36\x0b\x00\xc0\xd3\x10\x47\x02\
-\x00\x70\xec\x42\xea\x23\x27\x24\x92\x00\x00\x00\x00\x94\x46\x60\
-\x59\xe4\x84\x32\x12\x00\x80\xa3\x23\x8e\x04\x00\xe0\x24\x04\xd6\
-\x47\x4e\xdc\x4d\x24\xdb\xed\xf6\x97\xbe\xf4\x57\x67\xce\x9c\xb1\
-\x5f\x00\x00\x00\x00\x4e\xd8\xce\xce\xce\x8f\x7e\xf4\x8f\xdf\xfb\
-\xde\xf7\x82\xc9\x22\x27\x94\x91\x00\x00\x1c\x29\x71\x24\x00\x00\
-\x27\x24\xbc\x3e\xf2\xc0\x52\xb7\xfb\xd7\x5f\xfe\xf2\xd4\xd4\x94\
-\x15\x03\x00\x00\x00\x70\x02\xb6\xb7\xb7\xff\xe1\x87\x3f\xec\x74\
-\xbb\x81\x7d\x2f\x65\x24\x00\x00\x47\x4b\x1c\x09\x00\xc0\xc9\x09\
-\xb5\x8f\xdc\xb7\xf0\xca\x2b\x2f\xbe\xf8\xe2\xe7\xcf\x9f\xb7\x65\
-\x00\x00\x00\x00\x8e\xc9\xad\x8d\x8d\x1b\x37\x6e\x5c\xbd\x76\x2d\
-\xbc\xaf\xa6\x8c\x04\x00\xe0\xc8\x89\x23\x01\x00\x38\x51\x01\xf7\
-\x91\x13\xde\xda\x06\x00\x00\x00\xe0\x18\x04\xf9\x82\xf6\xfd\x94\
-\x91\x00\x00\x1c\x07\x71\x24\x00\x00\x27\x2d\xec\x3e\xf2\xc0\xc1\
-\x45\x92\x9f\x3d\x7b\x76\x72\x72\xd2\xc6\x01\x00\x00\x00\x78\x02\
-\x7b\x7b\x7b\x6f\xdd\xb9\x13\xea\x55\x91\xf7\x28\x23\x01\x00\x38\
-\x26\xe2\x48\x00\x00\x4e\xc1\x38\xf4\x91\x07\x96\xba\xdd\xe9\xe9\
-\xe9\xcf\x9e\x3d\x6b\xe9\x00\x00\x00\x00\x1c\xd2\x5b\x77\xee\xdc\
-\xbe\x7d\xbb\xd3\xed\x06\xff\x4d\x95\x91\x00\x00\x1c\x1f\x71\x24\
-\x00\x00\xa7\x63\x7c\xfa\xc8\x89\xbb\xcf\x6d\xbf\xdc\x7a\x79\x7a\
-\x7a\xba\x1e\xc7\xee\x92\x04\x00\x00\x00\xe0\x81\x0e\x9a\xc8\xd5\
-\x74\x35\xd4\xe7\xb3\xff\x80\x32\x12\x00\x80\x63\x25\x8e\x04\x00\
-\xe0\xd4\x8c\x55\x1f\x79\xcf\x57\x5f\x7b\xed\xf9\xbf\x78\xfe\x73\
-\x9f\x6b\x9c\x39\x73\xc6\xdf\x01\x00\x00\x00\x80\x31\xb7\xb3\xb3\
-\x93\xbf\xfd\xf6\x4f\x7f\xfa\xd3\xef\x2e\x2f\x8f\xd5\x17\x57\x46\
-\x02\x00\x70\xdc\xc4\x91\x00\x00\x9c\xa6\xe1\x70\xd8\x6c\x36\xb7\
-\xb6\xb6\xc6\xf0\xbb\x9f\x3b\x97\x5c\xb8\x70\xe1\xd3\x7f\xf6\x69\
-\xd7\x49\x02\x00\x00\x00\x8c\x95\xbd\xbd\xbd\x7e\x9e\xff\xcb\xbf\
-\xfe\xcb\x4f\x7e\xf2\x93\xcd\xcd\x6c\x0c\x27\xd0\x68\x34\x7a\xbd\
-\x9e\x32\x12\x00\x80\x63\x25\x8e\x04\x00\xe0\xf4\xb5\x5a\xad\xb5\
-\xb5\xb5\x71\x9e\xc0\xa5\x8b\x17\xcf\xbe\x70\xf6\xe3\x7f\xf2\xf1\
-\xf8\x53\x9f\x72\xa3\x24\x00\x00\x00\x40\x78\x0e\x6e\x88\xfc\xe5\
-\xbf\xff\xf2\xce\x3f\xdf\x79\xfd\xe6\xcd\x71\x1e\xc5\xfc\xfc\x7c\
-\x9a\xa6\xfe\x4a\x00\x00\x70\xdc\xc4\x91\x00\x00\x94\x82\x3e\xf2\
-\x9e\x5a\xad\x3a\xfd\x97\xd3\x9f\xf9\xec\x67\x3e\xf6\xc7\x1f\x7b\
-\xe6\xd9\x67\xa7\xa6\xa6\xcc\x04\x00\x00\x00\x60\xe4\x6c\x6f\x6f\
-\xff\xee\x9d\x77\x7e\xf5\x1f\xbf\xfa\xd9\x5b\x3f\xbb\xfd\x4f\xb7\
-\x8b\x62\x60\x26\x13\xca\x48\x00\x00\x4e\x90\x38\x12\x00\x80\xb2\
-\x48\xd3\xf4\xe5\x97\x5f\x36\x87\xf7\xba\x74\xf1\x62\xb5\x5a\xfd\
-\xc4\x27\x3f\xf1\xe1\x3f\xfa\xf0\x33\xcf\x3e\xfb\xcc\x33\xcf\xb8\
-\x5d\x12\x00\x00\x00\xa0\x3c\x76\x76\x76\x7e\xb7\xef\x9d\x77\x7e\
-\xfb\x5f\xbf\xfd\xc5\xcf\x7f\x31\x18\x0c\xc6\xfc\x6e\xc8\xf7\xb3\
-\xba\xba\xda\x6a\xb5\xcc\x01\x00\x80\x93\x21\x8e\x04\x00\xa0\x44\
-\x7a\xbd\x5e\xab\xd5\xda\xdd\xdd\x35\x8a\x47\x3a\x77\x2e\xf9\xc8\
-\x73\x1f\xd9\xff\xf0\xc9\x3f\xfd\xe4\x87\x3e\xf4\xa1\xfd\x0f\x07\
-\xe9\xe4\x7b\xff\x64\xbd\x5e\x37\x2e\x00\x00\x00\x80\xc7\xd2\xef\
-\xf7\xdf\xfb\xcb\x83\xfc\x71\xff\xc3\xef\x7f\xff\xfb\x9f\xff\xdb\
-\xcf\xf7\x3f\xfc\xe6\x3f\x7f\xb3\xb9\x99\x19\xd7\x23\x55\x2a\x95\
-\x95\x95\x15\x65\x24\x00\x00\x27\x49\x1c\x09\x00\x40\xb9\xe4\x79\
-\x9e\x24\x89\x3e\x12\x00\x00\x00\x00\xc2\x50\xa9\x54\xb2\x2c\x8b\
-\xe3\xd8\x28\x00\x00\x38\x49\x1f\x34\x02\x00\x00\x4a\x25\x8e\xe3\
-\xa2\x28\x5c\x76\x08\x00\x00\x00\x00\x01\xa8\xd7\xeb\x45\x51\x28\
-\x23\x01\x00\x38\x79\xe2\x48\x00\x00\x4a\x27\x8a\xa2\x2c\xcb\xe6\
-\xe7\xe7\x8d\x02\x00\x00\x00\x00\x46\xd7\xfc\xfc\x7c\x96\x65\x51\
-\x14\x19\x05\x00\x00\x27\x4f\x1c\x09\x00\x40\x19\x45\x51\x94\xa6\
-\xe9\xf2\xf2\xb2\x51\x00\x00\x00\x00\xc0\x28\x5a\x5e\x5e\x4e\xd3\
-\x54\x19\x09\x00\xc0\x69\xf9\xc0\xbb\xef\xbe\x6b\x0a\x00\x00\x94\
-\x56\x96\x65\xcd\x66\x73\x77\x77\xd7\x28\x00\x00\x00\x00\x60\x24\
-\x54\x2a\x95\x5e\xaf\x97\x24\x89\x51\x00\x00\x70\x8a\xc4\x91\x00\
-\x00\x94\xdd\x70\x38\x4c\x92\xa4\xdf\xef\x1b\x05\x00\x00\x00\x00\
-\x94\x5c\xbd\x5e\xef\xf5\x7a\xb5\x5a\xcd\x28\x00\x00\x38\x5d\x9e\
-\xd5\x06\x00\xa0\xec\xa2\x28\xca\xf3\xbc\xdd\x6e\x1b\x05\x00\x00\
-\x00\x00\x94\x59\xbb\xdd\xce\xf3\x5c\x19\x09\x00\x40\x19\xb8\x39\
-\x12\x00\x80\x91\xd1\xeb\xf5\x5a\xad\x96\x27\xb6\x01\x00\x00\x00\
-\xa0\x6c\x2a\x95\x4a\x9a\xa6\xcd\x66\xd3\x28\x00\x00\x28\x09\x71\
-\x24\x00\x00\xa3\x64\x38\x1c\x36\x9b\xcd\xad\xad\x2d\xa3\x00\x00\
-\x00\x00\x80\x92\x68\x34\x1a\x69\x9a\xba\x30\x12\x00\x80\x52\xf1\
-\xac\x36\x00\x00\xa3\x24\x8a\xa2\x2c\xcb\x3a\x9d\x8e\x51\x00\x00\
-\x00\x00\x40\x19\x74\x3a\x9d\x2c\xcb\x94\x91\x00\x00\x94\x8d\x9b\
-\x23\x01\x00\x18\x49\x79\x9e\xb7\x5a\xad\x7e\xbf\x6f\x14\x00\x00\
-\x00\x00\x70\x2a\xea\xf5\x7a\x9a\xa6\x71\x1c\x1b\x05\x00\x00\x25\
-\xe4\xe6\x48\x00\x00\x46\x52\x1c\xc7\x79\x9e\xb7\xdb\x6d\xa3\x00\
-\x00\x00\x00\x80\x93\xd7\x6e\xb7\xb3\x2c\x53\x46\x02\x00\x50\x5a\
-\x6e\x8e\x04\x00\x60\xb4\x65\x59\xd6\x6a\xb5\x06\x83\x81\x51\x00\
-\x00\x00\x00\xc0\x09\xa8\x56\xab\x69\x9a\x26\x49\x62\x14\x00\x00\
-\x94\x99\x9b\x23\x01\x00\x18\x6d\x49\x92\xe4\x79\xde\xe9\x74\x8c\
-\x02\x00\x00\x00\x00\x8e\x5b\xbb\xdd\xce\xf3\x5c\x19\x09\x00\x40\
-\xf9\xb9\x39\x12\x00\x80\x40\xe4\x79\xde\x6a\xb5\xfa\xfd\xbe\x51\
-\x00\x00\x00\x00\xc0\x91\xab\xd7\xeb\x69\x9a\x7a\x47\x1b\x00\x80\
-\x51\xe1\xe6\x48\x00\x00\x02\x11\xc7\x71\x9e\xe7\xcb\xcb\xcb\x95\
-\x4a\xc5\x34\x00\x00\x00\x00\xe0\xa8\x54\x2a\x95\x4e\xa7\x93\xe7\
-\xb9\x32\x12\x00\x80\x11\xe2\xe6\x48\x00\x00\x42\x53\x14\xc5\xe2\
-\xe2\xe2\xfa\xfa\xba\x51\x00\x00\x00\x00\xc0\x53\x9a\x9b\x9b\x5b\
-\x59\x59\xa9\xd5\x6a\x46\x01\x00\xc0\x68\x11\x47\x02\x00\x10\xa6\
-\x2c\xcb\x5a\xad\xd6\x60\x30\x30\x0a\x00\x00\x00\x00\x78\x02\xd5\
-\x6a\x35\x4d\xd3\x24\x49\x8c\x02\x00\x80\x51\xe4\x59\x6d\x00\x00\
-\xc2\x94\x24\x49\x51\x14\x5e\xd9\x06\x00\x00\x00\x80\xc7\x55\xa9\
-\x54\x96\x97\x97\x8b\xa2\x50\x46\x02\x00\x30\xba\xc4\x91\x00\x00\
-\x84\x6c\x71\x71\xb1\x28\x8a\x76\xbb\x6d\x14\x00\x00\x00\x00\x70\
-\x18\xed\x76\xbb\x28\x8a\xc5\xc5\x45\xa3\x00\x00\x60\xa4\x79\x56\
-\x1b\x00\x80\xb1\x50\x14\x45\xb7\xdb\x5d\x5b\x5b\x33\x0a\x00\x00\
-\x00\x00\x78\xa0\xb9\xb9\xb9\x95\x95\x95\x5a\xad\x66\x14\x00\x00\
-\x04\xc0\xcd\x91\x00\x00\x8c\x85\x5a\xad\x96\xa6\xe9\xe6\xe6\x66\
-\xa3\xd1\x30\x0d\x00\x00\x00\x00\xb8\x5f\xa3\xd1\xd8\xdc\xdc\xec\
-\xf5\x7a\xca\x48\x00\x00\x82\xe1\xe6\x48\x00\x00\xc6\x4e\x96\x65\
-\xdd\x6e\x77\x6b\x6b\xcb\x28\x00\x00\x00\x00\x18\x73\x8d\x46\xa3\
-\xdb\xed\x26\x49\x62\x14\x00\x00\x04\x46\x1c\x09\x00\xc0\x98\x92\
-\x48\x02\x00\x00\x00\x30\xce\x64\x91\x00\x00\x84\x4d\x1c\x09\x00\
-\xc0\x58\x93\x48\x02\x00\x00\x00\x30\x6e\x64\x91\x00\x00\x8c\x03\
-\x71\x24\x00\x00\xfc\x4f\x22\x99\xa6\xe9\xda\xda\x9a\x51\x00\x00\
-\x00\x00\x10\xb0\xf9\xf9\xf9\x56\xab\x25\x8b\x04\x00\x60\x1c\x88\
-\x23\x01\x00\xe0\x7f\x15\x45\xd1\xed\x76\x7b\xbd\xde\xee\xee\xae\
-\x69\x00\x00\x00\x00\x10\x8c\x4a\xa5\xd2\x6c\x36\xbb\xdd\x6e\xad\
-\x56\x33\x0d\x00\x00\xc6\x84\x38\x12\x00\x00\xfe\x9f\xe1\x70\x98\
-\xa6\xe9\xca\xca\xca\x60\x30\x30\x0d\x00\x00\x00\x00\x46\x5a\xb5\
-\x5a\x5d\x5c\x5c\x6c\xb5\x5a\x51\x14\x99\x06\x00\x00\x63\x45\x1c\
-\x09\x00\x00\x0f\xd6\xeb\xf5\xd2\x34\x5d\x5f\x5f\x37\x0a\x00\x00\
-\x00\x00\x46\xce\xdc\xdc\x5c\xab\xd5\x6a\x36\x9b\x46\x01\x00\xc0\
-\x78\x12\x47\x02\x00\xc0\xc3\x14\x45\x91\xde\xe5\x22\x49\x00\x00\
-\x00\x00\xca\xaf\x5a\xad\xb6\xee\xf2\x82\x36\x00\x00\x63\x4e\x1c\
-\x09\x00\x00\x87\xd2\xbb\x6b\x6d\x6d\xcd\x28\x00\x00\x00\x00\x28\
-\xa1\xf9\xf9\xf9\xe6\x5d\x46\x01\x00\x00\x13\xe2\x48\x00\x00\x78\
-\x2c\xc3\xe1\xf0\xe0\xb9\xed\xad\xad\x2d\xd3\x00\x00\x00\x00\xe0\
-\xd4\x35\x1a\x8d\x83\xe7\xb3\xa3\x28\x32\x0d\x00\x00\xb8\x47\x1c\
-\x09\x00\x00\x4f\xa2\x28\x8a\x83\x4a\xb2\xdf\xef\x9b\x06\x00\x00\
-\x00\x00\x27\xac\x5e\xaf\x1f\x34\x91\x9e\xcf\x06\x00\x80\x07\x12\
-\x47\x02\x00\xc0\x53\x39\xa8\x24\xb3\x2c\x5b\x5f\x5f\x37\x0d\x00\
-\x00\x00\x00\x8e\xd5\xdc\xdc\x5c\x92\x24\x9a\x48\x00\x00\x78\x24\
-\x71\x24\x00\x00\x1c\x8d\x83\x17\xb7\xb3\x2c\xdb\xff\xb9\xbb\xbb\
-\x6b\x20\x00\x00\x00\x00\x1c\x89\x4a\xa5\xd2\x6c\x36\x0f\x9a\x48\
-\x6f\x67\x03\x00\xc0\x21\x89\x23\x01\x00\xe0\xe8\xe5\x79\x7e\x10\
-\x4a\x6e\x6d\x6d\x99\x06\x00\x00\x00\x00\x4f\xa0\xd1\x68\x1c\x04\
-\x91\x71\x1c\x9b\x06\x00\x00\x3c\x2e\x71\x24\x00\x00\x1c\xaf\xec\
-\xff\x08\x25\x01\x00\x00\x00\x78\xb8\x83\x20\xf2\x80\x69\x00\x00\
-\xc0\xd3\x10\x47\x02\x00\xc0\xc9\x39\xa8\x24\xf3\xbb\x06\x83\x81\
-\x81\x00\x00\x00\x00\x8c\xb9\x6a\xb5\x1a\xdf\x25\x88\x04\x00\x80\
-\xa3\x25\x8e\x04\x00\x80\xd3\x51\x14\x45\x7e\x1f\xad\x24\x00\x00\
-\x00\xc0\x38\xb8\x57\x43\x1e\xa8\xd5\x6a\x66\x02\x00\x00\xc7\x41\
-\x1c\x09\x00\x00\x65\x91\x65\x59\x71\xd7\xfe\x87\xe1\x70\xd8\xef\
-\xf7\xcd\x04\x00\x00\x00\x60\xa4\xd5\xeb\xf5\x28\x8a\x92\x24\xa9\
-\xdd\xe5\x6e\x48\x00\x00\x38\x31\xe2\x48\x00\x00\x28\xaf\xe2\x3e\
-\xc3\xe1\x30\xcf\xf3\xfd\x5f\xee\xff\xdc\xdd\xdd\x35\x1c\x00\x00\
-\x00\x80\x92\xa8\x54\x2a\x71\x1c\xef\x7f\xd8\xff\x19\x45\x51\xed\
-\x3e\x86\x03\x00\x00\xa7\x45\x1c\x09\x00\x00\xa3\x2a\xcf\xf3\xe1\
-\x70\xf8\xde\xcf\xf7\xbb\x97\x54\x02\x00\x00\x00\x70\x78\x0f\x49\
-\x1b\xef\xdd\xfe\x18\x45\xd1\x41\x13\x09\x00\x00\x94\x90\x38\x12\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\xca\x07\x8d\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x08\x89\x38\x12\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\
-\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\
-\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\
-\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\
-\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\
-\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\
-\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\
-\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\
-\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\
-\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\
-\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\
-\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\
-\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\
-\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\
-\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x08\x8a\x38\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\xca\x7f\
-\x0b\xd0\xae\x1d\xc8\x00\x00\x00\x00\x0c\xf2\xb7\xbe\xc7\x57\x1c\
-\xc9\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\xac\xc8\x91\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xac\xc8\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\
-\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\xc8\x91\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xac\xc8\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\
-\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\xc8\x91\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xac\xc8\x91\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\xc8\
-\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\xac\xc8\x91\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\xac\xc8\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\xc8\x91\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\xac\xc8\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\
-\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\xc8\x91\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\xac\xc8\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\xc0\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\xc8\x91\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\xac\xc8\x91\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\
-\xc8\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\xac\xc8\x91\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xac\xc8\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\
-\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\xc8\x91\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xac\xc8\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\
-\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\xc8\x91\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xac\xc8\x91\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\xc8\
-\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\xac\xc8\x91\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\xac\xc8\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\xc8\x91\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\xac\xc8\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\
-\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\xc8\x91\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\xac\xc8\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\xc0\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\xc8\x91\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\xac\xc8\x91\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\
-\xc8\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\xac\xc8\x91\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xac\xc8\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\
-\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\xc8\x91\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xac\xc8\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\
-\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\xc8\x91\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xac\xc8\x91\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\xc8\
-\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\xac\xc8\x91\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\xac\xc8\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\xc8\x91\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xc0\x8a\x1c\x09\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\xac\xc8\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x8a\
-\x1c\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\xc8\x91\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\xc0\x4a\x3f\x80\x2c\x9d\x95\x11\xef\
-\x0f\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-"
-
-qt_resource_name = b"\
-\x00\x11\
-\x0e\x18\x91\x5a\
-\x00\x6e\
-\x00\x65\x00\x74\x00\x74\x00\x6f\x00\x5f\x00\x6e\x00\x75\x00\x6c\x00\x6c\x00\x5f\x00\x62\x00\x69\x00\x6c\x00\x61\x00\x6e\x00\x7a\
-\
-\x00\x08\
-\x0a\x61\x5a\xa7\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x28\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x28\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x9a\x24\xf3\xf2\x7f\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
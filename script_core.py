@@ -1,10 +1,27 @@
 # -*- coding: utf-8 -*-
+import cProfile
+import datetime
+import hashlib
+import io
+import json
 import os
+import pstats
+import re
+import time
 from collections import defaultdict
+from contextlib import nullcontext
 from typing import Callable, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from qgis.PyQt.QtCore import QVariant
+try:
+    from .instrumentation import HotspotRecorder
+    from .sensitivity import format_sensitivity_summary, is_range_column, run_sensitivity, sensitivity_lines
+except ImportError:
+    from instrumentation import HotspotRecorder
+    from sensitivity import format_sensitivity_summary, is_range_column, run_sensitivity, sensitivity_lines
+
 from qgis.core import (
     QgsProject,
     QgsGeometry,
@@ -15,6 +32,9 @@ from qgis.core import (
     QgsVectorFileWriter,
     QgsWkbTypes,
     QgsSpatialIndex,
+    QgsFeatureRequest,
+    QgsFeatureSource,
+    QgsRectangle,
 )
 
 
@@ -37,6 +57,13 @@ def calculate_total_layer_area(layer: QgsVectorLayer) -> float:
     return total_area
 
 
+def is_null_value(value) -> bool:
+    """None or a NULL QVariant (how PyQGIS returns empty attributes)."""
+    if value is None:
+        return True
+    return isinstance(value, QVariant) and value.isNull()
+
+
 def safe_polygon_geometry(geom: QgsGeometry):
     """
     Keep only valid area-bearing geometry.
@@ -64,53 +91,354 @@ def safe_polygon_geometry(geom: QgsGeometry):
 # ============================================================
 # FACTORS
 # ============================================================
-def load_factor_table(factors_csv: str) -> pd.DataFrame:
+def normalize_key(s) -> str:
+    """
+    Normalization for matching layer values to factor table keys, used by
+    the input validation and the factor lookup alike:
+    trim + casefold + ä->ae ö->oe ü->ue ß->ss + '-'->'_' + single spaces.
+    """
+    if is_null_value(s):
+        return ""
+    s = str(s).strip()
+    if not s:
+        return ""
+    s = s.casefold()
+    s = (
+        s.replace("ä", "ae")
+         .replace("ö", "oe")
+         .replace("ü", "ue")
+         .replace("ß", "ss")
+    )
+    s = s.replace("-", "_")
+    s = re.sub(r"\s+", " ", s)
+    return s
+
+
+def factor_key_map(df_factors: pd.DataFrame) -> dict:
+    """Normalized key -> Description (first entry wins, as in the lookups)."""
+    keys = {}
+    for description in df_factors["Description"]:
+        key = normalize_key(description)
+        if key and key not in keys:
+            keys[key] = description
+    return keys
+
+
+def missing_factor_values(values, key_map: dict) -> list:
+    """Layer values without factor table entry after normalize_key()."""
+    return sorted(v for v in values if normalize_key(v) not in key_map)
+
+
+def _factors_by_key(df_factors: pd.DataFrame, columns: list) -> pd.DataFrame:
+    """Factor columns indexed by normalized key (duplicates: first wins)."""
+    df = df_factors.assign(_key=df_factors["Description"].map(normalize_key))
+    return df[df["_key"] != ""].drop_duplicates("_key").set_index("_key")[columns]
+
+
+def load_factor_table(factors_csv: str, with_indicators: bool = False) -> pd.DataFrame:
+    """
+    Description + BFF_2020, optionally with all further indicator columns
+    (e.g. Mikroklima, Luftqualität, ...) as numeric columns.
+    """
     df_factors = pd.read_csv(factors_csv, sep=";")
     df_factors.columns = [c.strip() for c in df_factors.columns]
 
     if not {"Description", "BFF_2020"}.issubset(df_factors.columns):
         raise ValueError("Factor CSV must contain columns: 'Description' and 'BFF_2020'")
 
-    df_factors = df_factors[["Description", "BFF_2020"]].copy()
+    columns = ["Description", "BFF_2020"]
+    if with_indicators:
+        columns += indicator_columns(df_factors)
+
+    df_factors = df_factors[columns].copy()
     df_factors["Description"] = df_factors["Description"].astype(str).str.strip()
+    for c in columns[2:]:
+        df_factors[c] = pd.to_numeric(df_factors[c], errors="coerce")
     return df_factors
 
 
 # ============================================================
-# GEOMETRY HELPERS
+# INDICATORS (further factor columns next to BFF_2020)
 # ============================================================
-def find_polygon_overlaps(
-    layer: QgsVectorLayer,
-    min_overlap_area: float = 0.0,
+INDICATOR_AREA_SUFFIX = "_Area"
+# '*_Area' columns of the balance tables that are not indicators
+BALANCE_AREA_COLUMNS = ("BFF_Area", "Final_BFF_Area", "Zone_Area")
+
+
+def indicator_columns(df_factors: pd.DataFrame) -> list:
+    # BFF_2020_min / _max describe factor uncertainty (sensitivity.py), not an indicator
+    return [
+        c for c in df_factors.columns
+        if c not in ("Description", "BFF_2020") and not is_range_column(c)
+    ]
+
+
+def indicator_area_column(indicator: str) -> str:
+    return f"{indicator}{INDICATOR_AREA_SUFFIX}"
+
+
+def indicator_area_columns(df: pd.DataFrame) -> list:
+    """Per-indicator balance columns of an atomic or aggregated balance table."""
+    return [
+        c for c in df.columns
+        if c.endswith(INDICATOR_AREA_SUFFIX) and c not in BALANCE_AREA_COLUMNS
+    ]
+
+
+def add_indicator_balances(df: pd.DataFrame, df_factors: pd.DataFrame, indicators: list) -> pd.DataFrame:
+    """
+    Adds '<Indicator>_Area' = (factor_after - factor_before) * Area for all
+    indicators at once: the area vector times the factor-delta matrix
+    (rows x indicators) in one NumPy operation. Missing factors count as 0,
+    like BFF_2020.
+    """
+    if not indicators or df.empty:
+        return df
+
+    factor_matrix = _factors_by_key(df_factors, indicators)
+    # extra zero row: get_indexer() returns -1 for categories without factors
+    factors = np.vstack([
+        factor_matrix.to_numpy(dtype=float, na_value=0.0),
+        np.zeros((1, len(indicators))),
+    ])
+
+    before_idx = factor_matrix.index.get_indexer(df["Before"].map(normalize_key))
+    after_idx = factor_matrix.index.get_indexer(df["After"].map(normalize_key))
+    delta = factors[after_idx] - factors[before_idx]
+
+    balances = np.round(delta * df["Area"].to_numpy(dtype=float)[:, None], 2)
+    for j, indicator in enumerate(indicators):
+        df[indicator_area_column(indicator)] = balances[:, j]
+    return df
+
+
+# ============================================================
+# INPUT CHECKS (cheap, before any geometry work)
+# ============================================================
+def layer_distinct_values(layer: QgsVectorLayer, field_name: str) -> set:
+    """
+    Distinct non-empty values of one field.
+
+    Uses the provider's uniqueValues() (e.g. SELECT DISTINCT for GeoPackage /
+    PostGIS) instead of iterating all features.
+    """
+    field_idx = layer.fields().indexOf(field_name)
+    if field_idx < 0:
+        field_names = [f.name() for f in layer.fields()]
+        raise ValueError(
+            f"Field '{field_name}' not found in layer '{layer.name()}'. Available: {field_names}"
+        )
+
+    values = set()
+    for v in layer.uniqueValues(field_idx):
+        if is_null_value(v):
+            continue
+        s = str(v).strip()
+        if s:
+            values.add(s)
+    return values
+
+
+def validate_inputs(
+    base_layer: QgsVectorLayer,
+    base_field_name: str,
+    planning_layer: QgsVectorLayer,
+    plan_field_name: str,
+    factors_csv: str,
     log_cb: Optional[Callable[[str], None]] = None,
-) -> list:
+    phase_layers: Optional[list] = None,
+) -> str:
     """
-    Finds polygon overlaps inside one layer.
+    Cheap fail-fast checks, ordered by cost:
+    1. field existence
+    2. CRS compatibility of base, plan and phase layers
+    3. provider-side distinct values against the factor table
 
-    min_overlap_area is interpreted in the layer CRS units².
-    For a projected meter CRS, this is m².
+    phase_layers: further plan layers (later phases), checked with
+    plan_field_name like the plan layer.
+
+    Raises ValueError at the first failing stage, otherwise returns a short report.
     """
-    features = []
+    layers = [
+        (base_layer, base_field_name),
+        (planning_layer, plan_field_name),
+    ] + [(layer, plan_field_name) for layer in phase_layers or []]
+
+    # 1) field existence
+    for layer, field_name in layers:
+        field_names = [f.name() for f in layer.fields()]
+        if field_name not in field_names:
+            raise ValueError(
+                f"Field '{field_name}' not found in layer '{layer.name()}'. Available: {field_names}"
+            )
 
-    for feat in layer.getFeatures():
-        geom = safe_polygon_geometry(feat.geometry())
-        if geom is None:
+    # 2) CRS compatibility
+    base_crs = base_layer.crs()
+    plan_crs = planning_layer.crs()
+    if base_crs != plan_crs:
+        raise ValueError(
+            f"CRS mismatch: base layer '{base_layer.name()}' uses {base_crs.authid() or '(unknown)'}, "
+            f"plan layer '{planning_layer.name()}' uses {plan_crs.authid() or '(unknown)'}. "
+            f"Both layers must use the same projected CRS."
+        )
+    for layer in phase_layers or []:
+        if layer.crs() != plan_crs:
+            raise ValueError(
+                f"CRS mismatch: phase layer '{layer.name()}' uses {layer.crs().authid() or '(unknown)'}, "
+                f"plan layer '{planning_layer.name()}' uses {plan_crs.authid() or '(unknown)'}. "
+                f"All phase layers must use the CRS of the plan layer."
+            )
+
+    report_lines = [
+        "===== INPUT CHECK =====",
+        "Fields                 : OK",
+        f"CRS                    : {plan_crs.authid() or '(unknown)'}",
+    ]
+    if plan_crs.isGeographic():
+        report_lines.append(
+            "WARNING: geographic CRS, areas are not in m². Use a projected CRS."
+        )
+
+    # 3) distinct values vs. factor table (normalize_key, like apply_factors_to_rows)
+    factor_keys = factor_key_map(load_factor_table(factors_csv))
+
+    for layer, field_name in layers:
+        missing = missing_factor_values(layer_distinct_values(layer, field_name), factor_keys)
+        if missing:
+            raise ValueError(
+                f"Layer '{layer.name()}' / field '{field_name}' contains "
+                f"{len(missing)} value(s) without entry in the factor table:\n"
+                + "\n".join(f"  - {v}" for v in missing)
+            )
+
+    report_lines.append("Factor table coverage  : OK")
+    report_lines.append("===== END INPUT CHECK =====")
+
+    if log_cb:
+        log_cb("")
+        for line in report_lines:
+            log_cb(line)
+
+    return "\n".join(report_lines)
+
+
+# ============================================================
+# GEOMETRY HELPERS
+# ============================================================
+# features per window in out-of-core mode (see layer_windows)
+DEFAULT_WINDOW_FEATURES = 5000
+
+
+def geometry_vertex_count(geom) -> int:
+    if not geom or geom.isEmpty():
+        return 0
+    try:
+        return geom.constGet().nCoordinates()
+    except Exception:
+        return 0
+
+
+def has_provider_spatial_index(layer: QgsVectorLayer) -> bool:
+    """
+    True if the data source itself has a spatial index (GeoPackage R-tree,
+    PostGIS GiST, shapefile .qix), so setFilterRect() queries do not scan
+    the whole layer.
+    """
+    try:
+        return layer.hasSpatialIndex() == QgsFeatureSource.SpatialIndexPresent
+    except Exception:
+        return False
+
+
+def _grid_size(feature_count: int, window_features: int) -> int:
+    """Cells per axis of a square grid with about window_features features per cell."""
+    cells = max(1, -(-max(feature_count, 1) // max(window_features, 1)))
+    return max(1, int(np.ceil(np.sqrt(cells))))
+
+
+def layer_windows(layer: QgsVectorLayer, window_features: int) -> list:
+    """
+    Regular grid of rectangles over the layer extent with roughly
+    window_features features per cell (for evenly spread data).
+    """
+    extent = layer.extent()
+    if extent.isEmpty():
+        return []
+    n = _grid_size(layer.featureCount(), window_features)
+    dx = extent.width() / n
+    dy = extent.height() / n
+    windows = []
+    for i in range(n):
+        for j in range(n):
+            windows.append(QgsRectangle(
+                extent.xMinimum() + i * dx,
+                extent.yMinimum() + j * dy,
+                extent.xMaximum() if i == n - 1 else extent.xMinimum() + (i + 1) * dx,
+                extent.yMaximum() if j == n - 1 else extent.yMinimum() + (j + 1) * dy,
+            ))
+    return windows
+
+
+def _owns_point(window, point, extent) -> bool:
+    """
+    Half-open containment, so a point on a shared window edge belongs to
+    exactly one window (the upper / right layer border is closed).
+    """
+    x, y = point.x(), point.y()
+    in_x = window.xMinimum() <= x and (x < window.xMaximum() or window.xMaximum() >= extent.xMaximum())
+    in_y = window.yMinimum() <= y and (y < window.yMaximum() or window.yMaximum() >= extent.yMaximum())
+    return in_x and in_y
+
+
+def build_geometry_index(layer: QgsVectorLayer, request: Optional[QgsFeatureRequest] = None) -> QgsSpatialIndex:
+    """
+    Bulk-loaded (STR) spatial index over the features of request, storing
+    the feature geometries, so lookups go through index.geometry(fid).
+    """
+    request = QgsFeatureRequest(request) if request is not None else QgsFeatureRequest()
+    request.setNoAttributes()
+    return QgsSpatialIndex(layer.getFeatures(request), None, QgsSpatialIndex.FlagStoreFeatureGeometries)
+
+
+def _repaired_geometries(index: QgsSpatialIndex, ids: list) -> dict:
+    """
+    fid -> safe_polygon_geometry() result for the geometries that are not
+    already valid polygons (None = dropped). Valid geometries are read
+    from the index as they are, so no second copy is kept.
+    """
+    repaired = {}
+    for fid in ids:
+        geom = index.geometry(fid)
+        if not geom.isEmpty() and geom.isGeosValid() and geom.area() > 0:
             continue
-        features.append((feat.id(), geom))
+        repaired[fid] = safe_polygon_geometry(geom)
+    return repaired
 
-    index = QgsSpatialIndex()
-    geom_by_id = {}
 
-    for fid, geom in features:
-        tmp_feat = QgsFeature()
-        tmp_feat.setId(fid)
-        tmp_feat.setGeometry(geom)
-        index.addFeature(tmp_feat)
-        geom_by_id[fid] = geom
+def _scan_overlaps(
+    index: QgsSpatialIndex,
+    ids: list,
+    min_overlap_area: float,
+    stop_above_area: Optional[float],
+    owns=None,
+) -> tuple:
+    """
+    Pairwise overlap check of the features ids in a geometry index
+    (build_geometry_index). owns(inter_geom) optionally decides whether a
+    pair is reported here (windowed scan). Returns (overlaps, stopped).
+    """
+    repaired = _repaired_geometries(index, ids)
+
+    def geometry(fid):
+        return repaired[fid] if fid in repaired else index.geometry(fid)
 
     overlaps = []
 
-    for fid, geom in features:
+    for fid in sorted(ids):
+        geom = geometry(fid)
+        if geom is None:
+            continue
+
         candidate_ids = index.intersects(geom.boundingBox())
 
         for other_id in candidate_ids:
@@ -118,7 +446,7 @@ def find_polygon_overlaps(
             if other_id <= fid:
                 continue
 
-            other_geom = geom_by_id.get(other_id)
+            other_geom = geometry(other_id)
             if other_geom is None:
                 continue
 
@@ -129,6 +457,9 @@ def find_polygon_overlaps(
             if inter_geom is None:
                 continue
 
+            if owns is not None and not owns(inter_geom):
+                continue
+
             overlap_area = inter_geom.area()
             if overlap_area > min_overlap_area:
                 overlaps.append({
@@ -137,6 +468,71 @@ def find_polygon_overlaps(
                     "overlap_area": round(overlap_area, 2),
                 })
 
+            # same rounded value validate_layer_overlaps classifies by, so a stop is always critical
+            if stop_above_area is not None and round(overlap_area, 2) > stop_above_area:
+                return overlaps, True
+
+    return overlaps, False
+
+
+def find_polygon_overlaps(
+    layer: QgsVectorLayer,
+    min_overlap_area: float = 0.0,
+    log_cb: Optional[Callable[[str], None]] = None,
+    stop_above_area: Optional[float] = None,
+    out_of_core: bool = False,
+    window_features: int = DEFAULT_WINDOW_FEATURES,
+) -> list:
+    """
+    Finds polygon overlaps inside one layer.
+
+    min_overlap_area is interpreted in the layer CRS units².
+    For a projected meter CRS, this is m².
+
+    If stop_above_area is given, scanning stops at the first overlap
+    larger than this value (fail-fast); the returned list is then partial.
+
+    out_of_core: instead of holding all geometries in memory, the layer
+    extent is split into windows of about window_features features, each
+    fetched with setFilterRect() through the provider's spatial index. A
+    pair is reported by the window containing a point of its overlap, so
+    pairs spanning several windows are counted once. Layers without a
+    provider index are scanned in memory.
+    """
+    if out_of_core and not has_provider_spatial_index(layer):
+        if log_cb:
+            log_cb(f"Layer '{layer.name()}' has no provider spatial index, checking overlaps in memory")
+        out_of_core = False
+
+    if out_of_core:
+        overlaps, stopped = [], False
+        extent = layer.extent()
+        for window in layer_windows(layer, window_features):
+            index = build_geometry_index(layer, QgsFeatureRequest().setFilterRect(window))
+            found, stopped = _scan_overlaps(
+                index,
+                index.intersects(window),
+                min_overlap_area,
+                stop_above_area,
+                owns=lambda g, w=window: _owns_point(w, g.pointOnSurface().asPoint(), extent),
+            )
+            overlaps.extend(found)
+            if stopped:
+                break
+    else:
+        index = build_geometry_index(layer)
+        overlaps, stopped = _scan_overlaps(
+            index, list(layer.allFeatureIds()), min_overlap_area, stop_above_area
+        )
+
+    if stopped:
+        if log_cb:
+            log_cb(
+                f"Stopped overlap check for layer '{layer.name()}' "
+                f"at first overlap above {stop_above_area:.2f} m²"
+            )
+        return overlaps
+
     if log_cb:
         log_cb(
             f"Checked overlaps for layer '{layer.name()}': "
@@ -170,6 +566,8 @@ def validate_layer_overlaps(
     min_report_overlap_area: float = 0.01,
     label_field: Optional[str] = None,
     log_cb: Optional[Callable[[str], None]] = None,
+    fail_fast: bool = False,
+    out_of_core: bool = False,
 ) -> str:
     """
     Checks polygon overlaps inside one layer and returns a full validation report.
@@ -179,6 +577,12 @@ def validate_layer_overlaps(
     - overlaps <= max_allowed_overlap_area -> WARNING report, calculation continues
     - overlaps > max_allowed_overlap_area -> ERROR report, calculation aborts
 
+    With fail_fast=True the scan stops at the first critical overlap, so the
+    report only lists the overlaps found up to that point.
+
+    out_of_core: scan in windows through the provider's spatial index
+    (see find_polygon_overlaps).
+
     Areas are interpreted in layer CRS units².
     For a projected meter CRS, this is m².
     """
@@ -186,9 +590,16 @@ def validate_layer_overlaps(
         layer=layer,
         min_overlap_area=min_report_overlap_area,
         log_cb=None,
+        stop_above_area=max_allowed_overlap_area if fail_fast else None,
+        out_of_core=out_of_core,
     )
 
-    features_by_id = {feat.id(): feat for feat in layer.getFeatures()}
+    # only fetch the features that are actually referenced in the report
+    overlap_ids = {o["feature_1"] for o in overlaps} | {o["feature_2"] for o in overlaps}
+    features_by_id = {}
+    if overlap_ids:
+        request = QgsFeatureRequest().setFilterFids(list(overlap_ids))
+        features_by_id = {feat.id(): feat for feat in layer.getFeatures(request)}
 
     warning_overlaps = []
     critical_overlaps = []
@@ -231,6 +642,7 @@ def validate_layer_overlaps(
         f"Label field            : {label_field or '(none)'}",
         f"Max allowed overlap    : {max_allowed_overlap_area:.2f} m²",
         f"Minimum reported overlap: {min_report_overlap_area:.2f} m²",
+        f"Scan mode              : {'fail-fast (stops at first critical overlap)' if fail_fast else 'full'}",
         f"Validation result      : {validation_result}",
         f"Found overlaps         : {len(overlaps)}",
         f"Total overlap area     : {total_overlap_area:.2f} m²",
@@ -294,7 +706,11 @@ def validate_layer_overlaps(
 
     return report
 
-def build_union_geometries(base_layer: QgsVectorLayer, field_name: str) -> Tuple[dict, dict]:
+def build_union_geometries(
+    base_layer: QgsVectorLayer,
+    field_name: str,
+    hotspots=None,
+) -> Tuple[dict, dict]:
     geom_by_field = defaultdict(list)
 
     for feat in base_layer.getFeatures():
@@ -303,11 +719,20 @@ def build_union_geometries(base_layer: QgsVectorLayer, field_name: str) -> Tuple
             continue
         geom_by_field[feat[field_name]].append(geom)
 
-    union_by_field = {
-        field_value: QgsGeometry.unaryUnion(geoms)
-        for field_value, geoms in geom_by_field.items()
-        if geoms
-    }
+    union_by_field = {}
+    for field_value, geoms in geom_by_field.items():
+        if not geoms:
+            continue
+        t0 = time.perf_counter()
+        union_by_field[field_value] = QgsGeometry.unaryUnion(geoms)
+        if hotspots is not None:
+            hotspots.add(
+                "base_union",
+                field_value,
+                time.perf_counter() - t0,
+                vertices=sum(geometry_vertex_count(g) for g in geoms),
+                label=f"'{field_value}' ({len(geoms)} polygons)",
+            )
     return geom_by_field, union_by_field
 
 
@@ -329,6 +754,7 @@ def collect_plan_features(layer: QgsVectorLayer, attribute_name: str) -> list:
         out.append({
             "After": feat[attribute_name],
             "geometry": geom,
+            "fid": feat.id(),
         })
     return out
 
@@ -336,123 +762,483 @@ def collect_plan_features(layer: QgsVectorLayer, attribute_name: str) -> list:
 # ============================================================
 # NORMAL CHANGE ROWS (BASE -> PLAN)
 # ============================================================
+OVERLAY_ENGINE_PYTHON = "python"
+OVERLAY_ENGINE_SQL = "sql"
+
+
+def _plan_feature_rows(pf: dict, union_by_field: dict, total_base_union, hotspots=None) -> list:
+    """
+    Change rows of one plan feature against the (unioned) base categories.
+    """
+    plan_geom = pf["geometry"]
+    after_value = pf["After"]
+    plan_fid = pf.get("fid")
+    feature_rows = []
+
+    # intersection with base categories
+    for before_value, base_geom in union_by_field.items():
+        if not base_geom or base_geom.isEmpty():
+            continue
+
+        t0 = time.perf_counter()
+        intersects = base_geom.intersects(plan_geom)
+        inter_geom = base_geom.intersection(plan_geom) if intersects else None
+        if hotspots is not None:
+            hotspots.add(
+                "base_intersection",
+                before_value,
+                time.perf_counter() - t0,
+                vertices=geometry_vertex_count(base_geom),
+            )
+        if not intersects:
+            continue
+
+        inter_geom = safe_polygon_geometry(inter_geom)
+        if inter_geom is None:
+            continue
+
+        area = inter_geom.area()
+        if area <= 0:
+            continue
+
+        feature_rows.append({
+            "Before": before_value,
+            "After": after_value,
+            "Area": round(area, 2),
+            "geometry": inter_geom,
+            "Source": "intersection",
+            "PlanFid": plan_fid,
+        })
+
+    # uncovered part
+    uncovered_geom = plan_geom.difference(total_base_union) if total_base_union else plan_geom
+    uncovered_geom = safe_polygon_geometry(uncovered_geom)
+    if uncovered_geom is not None:
+        area = uncovered_geom.area()
+        if area > 0:
+            feature_rows.append({
+                "Before": "Uncovered",
+                "After": after_value,
+                "Area": round(area, 2),
+                "geometry": uncovered_geom,
+                "Source": "uncovered",
+                "PlanFid": plan_fid,
+            })
+    return feature_rows
+
+
+def _record_plan_feature(hotspots, pf: dict, seconds: float):
+    if hotspots is not None:
+        hotspots.add(
+            "plan_feature",
+            pf.get("fid"),
+            seconds,
+            vertices=geometry_vertex_count(pf["geometry"]),
+            label=f"fid={pf.get('fid')}, After='{pf['After']}'",
+        )
+
+
 def calculate_atomic_change_rows(
     union_by_field: dict,
     total_base_union,
     plan_features: list,
+    hotspots=None,
+    zone_index: Optional[dict] = None,
 ) -> list:
+    """
+    Overlays every plan feature with the unioned base categories.
+
+    hotspots: optional instrumentation.HotspotRecorder collecting GEOS time
+    per plan feature and per base category.
+
+    zone_index: optional build_zone_index() result; every row gets its 'Zone'
+    in the same pass (rows crossing zone borders are split).
+    """
     rows = []
 
     for pf in plan_features:
-        plan_geom = pf["geometry"]
-        after_value = pf["After"]
+        feature_start = time.perf_counter()
+        feature_rows = _plan_feature_rows(pf, union_by_field, total_base_union, hotspots=hotspots)
 
-        # intersection with base categories
-        for before_value, base_geom in union_by_field.items():
-            if not base_geom or base_geom.isEmpty():
-                continue
-            if not base_geom.intersects(plan_geom):
-                continue
+        if zone_index is not None:
+            feature_rows = assign_zones(feature_rows, zone_index, container_geom=pf["geometry"])
+        rows.extend(feature_rows)
 
-            inter_geom = base_geom.intersection(plan_geom)
-            inter_geom = safe_polygon_geometry(inter_geom)
-            if inter_geom is None:
-                continue
+        _record_plan_feature(hotspots, pf, time.perf_counter() - feature_start)
 
-            area = inter_geom.area()
-            if area <= 0:
-                continue
+    return rows
 
-            rows.append({
-                "Before": before_value,
-                "After": after_value,
-                "Area": round(area, 2),
-                "geometry": inter_geom,
-                "Source": "intersection",
-            })
 
-        # uncovered part
-        uncovered_geom = plan_geom.difference(total_base_union) if total_base_union else plan_geom
-        uncovered_geom = safe_polygon_geometry(uncovered_geom)
-        if uncovered_geom is not None:
-            area = uncovered_geom.area()
-            if area > 0:
-                rows.append({
-                    "Before": "Uncovered",
-                    "After": after_value,
-                    "Area": round(area, 2),
-                    "geometry": uncovered_geom,
-                    "Source": "uncovered",
-                })
+def local_base_unions(base_layer: QgsVectorLayer, field_name: str, rect) -> Tuple[dict, Optional[QgsGeometry]]:
+    """
+    Category unions of only the base features whose extent meets rect,
+    fetched through the provider's spatial index.
+    """
+    geom_by_field = defaultdict(list)
+    for feat in base_layer.getFeatures(QgsFeatureRequest().setFilterRect(rect)):
+        geom = safe_polygon_geometry(feat.geometry())
+        if geom is None:
+            continue
+        geom_by_field[feat[field_name]].append(geom)
 
-    return rows
+    union_by_field = {
+        value: QgsGeometry.unaryUnion(geoms) if len(geoms) > 1 else geoms[0]
+        for value, geoms in geom_by_field.items()
+    }
+    return union_by_field, build_total_base_union(geom_by_field)
 
 
-# ============================================================
-# MEASURES / BUILDING GREEN
-# ============================================================
-def add_building_green(results: list, building_green: list) -> list:
-    for green in building_green or []:
-        results.append(green)
-    return results
+def plan_feature_batches(plan_features: list, window_features: int) -> list:
+    """
+    Plan features grouped by the grid cell (about window_features features
+    each) that contains the centre of their bounding box.
+    """
+    if not plan_features:
+        return []
+    extent = QgsRectangle(plan_features[0]["geometry"].boundingBox())
+    for pf in plan_features[1:]:
+        extent.combineExtentWith(pf["geometry"].boundingBox())
+
+    n = _grid_size(len(plan_features), window_features)
+    dx = extent.width() / n
+    dy = extent.height() / n
+    batches = defaultdict(list)
+    for pf in plan_features:
+        center = pf["geometry"].boundingBox().center()
+        i = min(int((center.x() - extent.xMinimum()) / dx), n - 1) if dx > 0 else 0
+        j = min(int((center.y() - extent.yMinimum()) / dy), n - 1) if dy > 0 else 0
+        batches[(i, j)].append(pf)
+    return list(batches.values())
 
 
-def _bg_from_layer(
-    building_green_layer_name: str,
-    building_green_field_name: Optional[str],
-    log_cb: Optional[Callable[[str], None]] = None,
+def calculate_atomic_change_rows_windowed(
+    base_layer: QgsVectorLayer,
+    base_field_name: str,
+    plan_features: list,
+    hotspots=None,
+    zone_index: Optional[dict] = None,
+    window_features: int = DEFAULT_WINDOW_FEATURES,
 ) -> list:
     """
-    Measures from optional layer.
-    Assumption:
-    - Before is fixed as 'Versiegelte Belagsfläche'
-    - After comes from the provided field (e.g. Gründach ...)
+    Out-of-core variant of calculate_atomic_change_rows for base layers
+    larger than memory: instead of unioning the whole base layer up front,
+    the plan features are processed in windows (plan_feature_batches) and
+    each window is overlaid with the base unions of its extent only, read
+    once through the provider's spatial index. Intersection distributes
+    over the union, so the rows are the same. Only the base geometry is
+    windowed; plan features and the resulting rows stay in memory.
     """
-    out = []
-    if not building_green_layer_name:
-        return out
+    rows = []
 
-    bg_layer = get_layer_from_project(building_green_layer_name)
-    field_names = [f.name() for f in bg_layer.fields()]
+    for batch in plan_feature_batches(plan_features, window_features):
+        rect = QgsRectangle(batch[0]["geometry"].boundingBox())
+        for pf in batch[1:]:
+            rect.combineExtentWith(pf["geometry"].boundingBox())
+        union_by_field, total_base_union = local_base_unions(base_layer, base_field_name, rect)
 
-    area_field = "Area"
-    has_area = area_field in field_names
-    has_after = building_green_field_name in field_names if building_green_field_name else False
+        for pf in batch:
+            feature_start = time.perf_counter()
+            feature_rows = _plan_feature_rows(pf, union_by_field, total_base_union, hotspots=hotspots)
 
-    if log_cb:
-        log_cb(f"Building-green layer: {building_green_layer_name}")
-        log_cb(f"  Using area field: {area_field if has_area else '(geometry area)'}")
-        log_cb(f"  Using after field: {building_green_field_name if has_after else '(constant)'}")
+            if zone_index is not None:
+                feature_rows = assign_zones(feature_rows, zone_index, container_geom=pf["geometry"])
+            rows.extend(feature_rows)
 
-    for feat in bg_layer.getFeatures():
-        geom = safe_polygon_geometry(feat.geometry())
+            _record_plan_feature(hotspots, pf, time.perf_counter() - feature_start)
 
-        area_val = None
-        if has_area:
-            area_val = feat[area_field]
+    return rows
 
-        if area_val is None and geom is not None:
-            try:
-                area_val = float(geom.area())
-            except Exception:
-                area_val = None
 
-        if area_val is None:
-            continue
+# ============================================================
+# ZONES (optional zoning layer: blocks, parcels, phases)
+# ============================================================
+NO_ZONE = "(no zone)"
 
-        try:
-            area_val = float(area_val)
-        except Exception:
-            continue
 
-        if area_val == 0:
+def build_zone_index(layer: QgsVectorLayer, field_name: str) -> dict:
+    """
+    Zone polygons with a spatial index and prepared GEOS engines for fast
+    containment tests. Zones are expected not to overlap; several features
+    with the same value form one zone.
+    """
+    index = QgsSpatialIndex()
+    zones = {}
+    for feat in layer.getFeatures():
+        geom = safe_polygon_geometry(feat.geometry())
+        if geom is None:
             continue
+        value = feat[field_name]
+        engine = QgsGeometry.createGeometryEngine(geom.constGet())
+        engine.prepareGeometry()
+        zones[feat.id()] = {
+            "zone": NO_ZONE if is_null_value(value) or not str(value).strip() else str(value).strip(),
+            "geometry": geom,
+            "engine": engine,
+        }
+        index.addFeature(feat)
+    return {"index": index, "zones": zones}
 
-        after_val = "Building Green"
-        if has_after:
-            v = feat[building_green_field_name]
-            if v is not None and str(v).strip():
-                after_val = str(v).strip()
+
+def zone_geometries(zone_index: dict) -> dict:
+    """Zone value -> (unioned) geometry."""
+    geoms = defaultdict(list)
+    for z in zone_index["zones"].values():
+        geoms[z["zone"]].append(z["geometry"])
+    return {zone: QgsGeometry.unaryUnion(parts) if len(parts) > 1 else parts[0] for zone, parts in geoms.items()}
+
+
+def _candidate_zones(geom: QgsGeometry, zone_index: dict) -> list:
+    return [zone_index["zones"][fid] for fid in zone_index["index"].intersects(geom.boundingBox())]
+
+
+def _containing_zone(geom: QgsGeometry, zone_index: dict) -> Optional[str]:
+    for z in _candidate_zones(geom, zone_index):
+        if z["engine"].contains(geom.constGet()):
+            return z["zone"]
+    return None
+
+
+def _split_row_by_zones(row: dict, zone_index: dict) -> list:
+    """
+    Area-share split of a row crossing zone borders; Area is scaled by the
+    geometric share, so attribute-based areas stay consistent.
+    """
+    geom = row["geometry"]
+    geom_area = geom.area()
+    if geom_area <= 0:
+        return [{**row, "Zone": NO_ZONE}]
+
+    parts = []
+    touched = []
+    covered = 0.0
+    for z in _candidate_zones(geom, zone_index):
+        if not z["engine"].intersects(geom.constGet()):
+            continue
+        part = safe_polygon_geometry(geom.intersection(z["geometry"]))
+        if part is None:
+            continue
+        part_area = part.area()
+        if part_area <= 0:
+            continue
+        touched.append(z["geometry"])
+        covered += part_area
+        parts.append({
+            **row,
+            "Area": round(row["Area"] * part_area / geom_area, 2),
+            "geometry": part,
+            "Zone": z["zone"],
+        })
+
+    if geom_area - covered > 0.01:
+        rest = geom.difference(QgsGeometry.unaryUnion(touched)) if touched else geom
+        rest = safe_polygon_geometry(rest)
+        if rest is not None and rest.area() > 0:
+            parts.append({
+                **row,
+                "Area": round(row["Area"] * rest.area() / geom_area, 2),
+                "geometry": rest,
+                "Zone": NO_ZONE,
+            })
+    return parts
+
+
+def assign_zones(rows: list, zone_index: Optional[dict], container_geom: Optional[QgsGeometry] = None) -> list:
+    """
+    Tags rows with 'Zone'. Rows inside one zone are kept as they are, rows
+    crossing zone borders are split by area share; rows without geometry
+    (manual measures) and parts outside all zones get NO_ZONE.
+
+    container_geom: geometry enclosing all rows (their plan feature); if it
+    lies in one zone, a single containment test tags all rows.
+    """
+    if zone_index is None:
+        return rows
+
+    if container_geom is not None:
+        zone = _containing_zone(container_geom, zone_index)
+        if zone is not None:
+            for row in rows:
+                row["Zone"] = zone
+            return rows
+
+    out = []
+    for row in rows:
+        geom = row.get("geometry")
+        if geom is None or geom.isEmpty():
+            out.append({**row, "Zone": NO_ZONE})
+            continue
+        zone = _containing_zone(geom, zone_index)
+        if zone is not None:
+            out.append({**row, "Zone": zone})
+        else:
+            out.extend(_split_row_by_zones(row, zone_index))
+    return out
+
+
+# ============================================================
+# PHASES (base -> phase 1 -> phase 2 -> ...)
+# ============================================================
+def phase_coverage(plan_features: list):
+    geoms = [pf["geometry"] for pf in plan_features if pf.get("geometry") is not None]
+    if not geoms:
+        return None
+    return safe_polygon_geometry(QgsGeometry.unaryUnion(geoms))
+
+
+def next_phase_partition(union_by_field: dict, phase_rows: list, coverage) -> dict:
+    """
+    State after a phase, built from geometry that is already computed:
+    the previous partition outside the phase's plan coverage plus the
+    phase's change rows by their After category.
+    """
+    geoms = defaultdict(list)
+    for category, geom in union_by_field.items():
+        if geom is None or geom.isEmpty():
+            continue
+        rest = safe_polygon_geometry(geom.difference(coverage)) if coverage is not None else geom
+        if rest is not None:
+            geoms[category].append(rest)
+
+    for row in phase_rows:
+        geom = row.get("geometry")
+        if geom is not None and not geom.isEmpty():
+            geoms[row["After"]].append(geom)
+
+    return {
+        category: parts[0] if len(parts) == 1 else QgsGeometry.unaryUnion(parts)
+        for category, parts in geoms.items()
+    }
+
+
+def calculate_phase_chain(
+    union_by_field: dict,
+    total_base_union,
+    phases: list,
+    factors_csv: str,
+    first_phase_rows: Optional[list] = None,
+    hotspots=None,
+) -> pd.DataFrame:
+    """
+    Balance per construction phase and cumulatively.
+
+    phases: ordered list of (name, plan features). Each phase is overlaid
+    with the partition left by the previous one (see next_phase_partition),
+    not with the original base. first_phase_rows: already computed change
+    rows of the first phase (base -> phase 1).
+
+    State_BFF_Area / State_BFF_Factor describe the whole state after the
+    phase (base plus all phases so far).
+    """
+    factors = _factors_by_key(load_factor_table(factors_csv), ["BFF_2020"])["BFF_2020"].to_dict()
+
+    partition = union_by_field
+    total = total_base_union
+    cumulative = 0.0
+    records = []
+
+    for i, (name, plan_features) in enumerate(phases, start=1):
+        if i == 1 and first_phase_rows is not None:
+            rows = first_phase_rows
+        else:
+            rows = calculate_atomic_change_rows(
+                union_by_field=partition,
+                total_base_union=total,
+                plan_features=plan_features,
+                hotspots=hotspots,
+            )
+
+        df = apply_factors_to_rows(rows, factors_csv)
+        net_balance = float(df["BFF_Area"].sum()) if not df.empty else 0.0
+        cumulative += net_balance
+
+        coverage = phase_coverage(plan_features)
+        partition = next_phase_partition(partition, rows, coverage)
+        if coverage is not None:
+            total = safe_polygon_geometry(QgsGeometry.unaryUnion([total, coverage])) if total else coverage
+
+        state_area = total.area() if total else 0.0
+        state_bff_area = sum(
+            geom.area() * factors.get(normalize_key(category), 0.0) for category, geom in partition.items()
+        )
+
+        records.append({
+            "Phase": i,
+            "Layer": name,
+            "Changed_Area": round(float(df["Area"].sum()) if not df.empty else 0.0, 2),
+            "Net_Balance": round(net_balance, 2),
+            "Cumulative_Net_Balance": round(cumulative, 2),
+            "State_BFF_Area": round(state_bff_area, 2),
+            "State_BFF_Factor": round(state_bff_area / state_area, 4) if state_area > 0 else 0.0,
+        })
+
+    return pd.DataFrame(records)
+
+
+# ============================================================
+# MEASURES / BUILDING GREEN
+# ============================================================
+def add_building_green(results: list, building_green: list) -> list:
+    for green in building_green or []:
+        results.append(green)
+    return results
+
+
+def _bg_from_layer(
+    building_green_layer_name: str,
+    building_green_field_name: Optional[str],
+    log_cb: Optional[Callable[[str], None]] = None,
+) -> list:
+    """
+    Measures from optional layer.
+    Assumption:
+    - Before is fixed as 'Versiegelte Belagsfläche'
+    - After comes from the provided field (e.g. Gründach ...)
+    """
+    out = []
+    if not building_green_layer_name:
+        return out
+
+    bg_layer = get_layer_from_project(building_green_layer_name)
+    field_names = [f.name() for f in bg_layer.fields()]
+
+    area_field = "Area"
+    has_area = area_field in field_names
+    has_after = building_green_field_name in field_names if building_green_field_name else False
+
+    if log_cb:
+        log_cb(f"Building-green layer: {building_green_layer_name}")
+        log_cb(f"  Using area field: {area_field if has_area else '(geometry area)'}")
+        log_cb(f"  Using after field: {building_green_field_name if has_after else '(constant)'}")
+
+    for feat in bg_layer.getFeatures():
+        geom = safe_polygon_geometry(feat.geometry())
+
+        area_val = None
+        if has_area:
+            area_val = feat[area_field]
+
+        if area_val is None and geom is not None:
+            try:
+                area_val = float(geom.area())
+            except Exception:
+                area_val = None
+
+        if area_val is None:
+            continue
+
+        try:
+            area_val = float(area_val)
+        except Exception:
+            continue
+
+        if area_val == 0:
+            continue
+
+        after_val = "Building Green"
+        if has_after:
+            v = feat[building_green_field_name]
+            if v is not None and str(v).strip():
+                after_val = str(v).strip()
 
         out.append({
             "Before": "Versiegelte Belagsfläche",
@@ -489,25 +1275,21 @@ def split_rows_for_spatial(rows: list) -> tuple:
 # ============================================================
 # FACTOR APPLICATION
 # ============================================================
-def apply_factors_to_rows(rows: list, factors_csv: str) -> pd.DataFrame:
+def apply_factors_to_rows(rows, factors_csv: str) -> pd.DataFrame:
+    """
+    rows: list of row dicts or a DataFrame with Before / After / Area.
+    """
     df_results = pd.DataFrame(rows)
     if df_results.empty:
         return df_results
 
-    df_factors = load_factor_table(factors_csv)
+    df_factors = load_factor_table(factors_csv, with_indicators=True)
+    # matched by normalize_key(), the same rule as the input validation
+    bff_by_key = _factors_by_key(df_factors, ["BFF_2020"])["BFF_2020"]
 
-    df = (
-        df_results
-        .merge(
-            df_factors.rename(columns={"Description": "Before", "BFF_2020": "Factor_before"}),
-            on="Before",
-            how="left",
-        )
-        .merge(
-            df_factors.rename(columns={"Description": "After", "BFF_2020": "Factor_after"}),
-            on="After",
-            how="left",
-        )
+    df = df_results.assign(
+        Factor_before=df_results["Before"].map(normalize_key).map(bff_by_key),
+        Factor_after=df_results["After"].map(normalize_key).map(bff_by_key),
     )
 
     df["Factor_before"] = df["Factor_before"].fillna(0)
@@ -522,6 +1304,8 @@ def apply_factors_to_rows(rows: list, factors_csv: str) -> pd.DataFrame:
     # Area is made positive because this value represents the final state, not the change direction.
     df["Final_BFF_Area"] = (df["Area"].abs() * df["Factor_after"]).round(2)
 
+    df = add_indicator_balances(df, df_factors, indicator_columns(df_factors))
+
     def classify_delta(v):
         if v > 0:
             return "improvement"
@@ -542,24 +1326,421 @@ def aggregate_change_rows(df_atomic: pd.DataFrame) -> pd.DataFrame:
 
     group_cols = ["Before", "After", "Factor_before", "Factor_after", "DeltaFactor"]
 
+    sum_cols = ["Area", "BFF_Area", "Final_BFF_Area"] + indicator_area_columns(df_atomic)
+
     df_agg = (
         df_atomic.groupby(group_cols, dropna=False, as_index=False)
-        .agg({
-            "Area": "sum",
-            "BFF_Area": "sum",
-            "Final_BFF_Area": "sum",
-        })
+        .agg({c: "sum" for c in sum_cols})
     )
 
-    df_agg["Area"] = df_agg["Area"].round(2)
-    df_agg["BFF_Area"] = df_agg["BFF_Area"].round(2)
-    df_agg["Final_BFF_Area"] = df_agg["Final_BFF_Area"].round(2)
+    for c in sum_cols:
+        df_agg[c] = df_agg[c].round(2)
     return df_agg
 
 
+def aggregate_by_plan_feature(df_atomic: pd.DataFrame) -> pd.DataFrame:
+    """
+    Balance per plan feature (PlanFid) with the dominant Before category,
+    i.e. the one covering the largest share of the feature.
+    """
+    if df_atomic.empty or "PlanFid" not in df_atomic.columns:
+        return pd.DataFrame()
+
+    df = df_atomic[df_atomic["PlanFid"].notna()]
+    sum_cols = ["Area", "BFF_Area", "Final_BFF_Area"] + indicator_area_columns(df)
+    df_plan = df.groupby("PlanFid", as_index=False)[sum_cols].sum()
+
+    before_area = df.groupby(["PlanFid", "Before"], as_index=False)["Area"].sum()
+    dominant = before_area.loc[before_area.groupby("PlanFid")["Area"].idxmax(), ["PlanFid", "Before"]]
+    df_plan = df_plan.merge(dominant.rename(columns={"Before": "Dominant_Before"}), on="PlanFid", how="left")
+
+    df_plan["PlanFid"] = df_plan["PlanFid"].astype("int64")
+    for c in sum_cols:
+        df_plan[c] = df_plan[c].round(2)
+    return df_plan
+
+
+def aggregate_by_zone(df_atomic: pd.DataFrame, zone_areas: dict) -> pd.DataFrame:
+    """
+    Balance per zone; Zone_Area is the area of the zone polygon(s), so
+    Final_BFF_Factor and Percentage refer to the zone like the overall
+    summary refers to the planning area.
+    """
+    if df_atomic.empty or "Zone" not in df_atomic.columns:
+        return pd.DataFrame()
+
+    sum_cols = ["Area", "BFF_Area", "Final_BFF_Area"] + indicator_area_columns(df_atomic)
+    df_zone = df_atomic.groupby("Zone", as_index=False)[sum_cols].sum()
+
+    zone_area = df_zone["Zone"].map(zone_areas).fillna(0.0)
+    has_area = zone_area > 0
+    df_zone["Zone_Area"] = zone_area
+    df_zone["Percentage"] = np.where(has_area, df_zone["BFF_Area"] / zone_area.where(has_area, 1.0) * 100, 0.0)
+    df_zone["Final_BFF_Factor"] = np.where(has_area, df_zone["Final_BFF_Area"] / zone_area.where(has_area, 1.0), 0.0)
+
+    for c in sum_cols + ["Zone_Area", "Percentage"]:
+        df_zone[c] = df_zone[c].round(2)
+    df_zone["Final_BFF_Factor"] = df_zone["Final_BFF_Factor"].round(4)
+    return df_zone
+
+
+# ============================================================
+# BALANCE SUMMARY
+# ============================================================
+def summarize_balance(results_df: pd.DataFrame, total_planning_area: float) -> dict:
+    """
+    Net balance, final BFF values and indicator balances of aggregated rows.
+    """
+    net_balance = float(results_df["BFF_Area"].sum()) if "BFF_Area" in results_df.columns else 0.0
+    final_bff_area = float(results_df["Final_BFF_Area"].sum()) if "Final_BFF_Area" in results_df.columns else 0.0
+    final_bff_factor = (final_bff_area / total_planning_area) if total_planning_area > 0 else 0.0
+
+    return {
+        "total_planning_area": total_planning_area,
+        "net_balance": net_balance,
+        "percentage": (net_balance / total_planning_area * 100) if total_planning_area > 0 else 0.0,
+        "final_bff_area": final_bff_area,
+        "final_bff_factor": final_bff_factor,
+        "final_bff_percentage": final_bff_factor * 100,
+        # net balance per further indicator of the factor table (Mikroklima, ...)
+        "indicators": {
+            col[: -len(INDICATOR_AREA_SUFFIX)]: float(results_df[col].sum())
+            for col in indicator_area_columns(results_df)
+        },
+    }
+
+
+def format_balance_summary(values: dict) -> dict:
+    """
+    Display strings of summarize_balance() for the result dict / reports.
+    """
+    return {
+        "Total planning area": f"{values['total_planning_area']:.2f} m2",
+        "Net Balance": f"{values['net_balance']:.2f} m2",
+        "Percentage": f"{values['percentage']:.2f} %",
+        "Final BFF Area": f"{values['final_bff_area']:.2f} m2",
+        "Final BFF Factor": f"{values['final_bff_factor']:.4f}",
+        "Final BFF Percentage": f"{values['final_bff_percentage']:.2f} %",
+        **{f"Net Balance {name}": f"{value:.2f} m2" for name, value in values["indicators"].items()},
+    }
+
+
+def balance_summary_lines(values: dict) -> list:
+    lines = [
+        "===== BALANCE SUMMARY =====",
+        f"Total planning area : {values['total_planning_area']:.2f} m²",
+        f"Net Balance         : {values['net_balance']:.2f} m²",
+        f"Percentage          : {values['percentage']:.2f} %",
+        f"Final BFF Area      : {values['final_bff_area']:.2f} m²",
+        f"Final BFF Factor    : {values['final_bff_factor']:.4f}",
+        f"Final BFF Percentage: {values['final_bff_percentage']:.2f} %",
+        "",
+    ]
+    if values["indicators"]:
+        lines.append("===== INDICATOR BALANCES =====")
+        for name, value in values["indicators"].items():
+            lines.append(f"{name:<20}: {value:.2f} m²")
+        lines.append("")
+    return lines
+
+
+# ============================================================
+# TRANSITION CACHE
+# ============================================================
+TRANSITIONS_VERSION = 1
+TRANSITION_KEYS = ["PlanFid", "Source", "Before", "After"]
+
+
+def transitions_path_for(output_csv_path: str) -> str:
+    return os.path.splitext(output_csv_path)[0] + "_transitions.json"
+
+
+def build_transition_table(df_atomic: pd.DataFrame) -> pd.DataFrame:
+    """
+    Area per (plan feature, source, before, after) - everything the balance
+    needs besides the factors.
+    """
+    if df_atomic.empty:
+        return pd.DataFrame(columns=TRANSITION_KEYS + ["Area"])
+
+    df = df_atomic.reindex(columns=TRANSITION_KEYS + ["Area"])
+    df["PlanFid"] = df["PlanFid"].fillna(-1).astype("int64")
+    df["Source"] = df["Source"].fillna("manual")
+    # layer values may be NULL QVariants (not JSON serializable); "" matches
+    # no factor, exactly like NULL in normalize_key
+    for c in ("Before", "After"):
+        df[c] = df[c].map(lambda v: "" if is_null_value(v) or pd.isna(v) else str(v))
+    return df.groupby(TRANSITION_KEYS, as_index=False, sort=False)["Area"].sum()
+
+
+def write_transition_cache(
+    df_atomic: pd.DataFrame,
+    output_path: str,
+    total_planning_area: float,
+    inputs: Optional[dict] = None,
+) -> str:
+    """
+    Persists the area matrix (Before x After) and its per-plan-feature
+    breakdown, so the balance can be re-evaluated with another factor
+    table without any geometry work (see reevaluate_factors).
+    """
+    table = build_transition_table(df_atomic)
+    pairs = table.groupby(["Before", "After"], as_index=False, sort=False)["Area"].sum()
+
+    payload = {
+        "version": TRANSITIONS_VERSION,
+        "total_planning_area": total_planning_area,
+        "inputs": inputs or {},
+        "pairs": {col: pairs[col].tolist() for col in pairs.columns},
+        "features": {col: table[col].tolist() for col in table.columns},
+    }
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False)
+    return output_path
+
+
+def read_transition_cache(path: str) -> Tuple[pd.DataFrame, dict]:
+    """
+    Returns (transition rows, cache meta data).
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        payload = json.load(f)
+
+    if payload.get("version") != TRANSITIONS_VERSION:
+        raise ValueError(f"Unsupported transition cache version in {path}: {payload.get('version')}")
+
+    df = pd.DataFrame(payload.get("features") or payload["pairs"])
+    meta = {k: v for k, v in payload.items() if k not in ("pairs", "features")}
+    return df, meta
+
+
+def load_cached_balance(transitions_path: str, factors_csv: str) -> Tuple[pd.DataFrame, pd.DataFrame, dict]:
+    """
+    Aggregated balance of a cached run evaluated with factors_csv.
+    Returns (results_df, transition rows, cache meta data).
+    """
+    transitions_df, meta = read_transition_cache(transitions_path)
+    df_atomic = apply_factors_to_rows(transitions_df, factors_csv)
+    return aggregate_change_rows(df_atomic), transitions_df, meta
+
+
+def reevaluate_factors(
+    transitions_path: str,
+    factors_csv: str,
+    output_csv_path: str,
+    sensitivity_samples: int = 0,
+    log_cb: Optional[Callable[[str], None]] = None,
+    results_ready_cb: Optional[Callable[[pd.DataFrame, dict, dict], None]] = None,
+):
+    """
+    Recomputes the balance of a previous run from its transition cache with
+    another factor table. No layers are read and no geometry is touched, so
+    the spatial change layer of the original run is left unchanged.
+
+    Returns (result_dict, results_df) like main().
+    """
+    started = time.perf_counter()
+    if log_cb:
+        log_cb(f"Re-evaluating cached transitions from: {transitions_path}")
+        log_cb(f"Using factor table: {factors_csv}")
+
+    results_df, _, meta = load_cached_balance(transitions_path, factors_csv)
+
+    total_planning_area = float(meta.get("total_planning_area") or 0.0)
+    balance_values = summarize_balance(results_df, total_planning_area)
+    balance_summary = format_balance_summary(balance_values)
+    sensitivity = run_sensitivity(
+        results_df, factors_csv, total_planning_area, n_samples=sensitivity_samples, log_cb=log_cb
+    )
+
+    if results_ready_cb:
+        results_ready_cb(results_df.copy(), dict(balance_summary), {"sensitivity": sensitivity})
+
+    output_dir = os.path.dirname(output_csv_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    results_df.to_csv(output_csv_path, index=False, encoding="utf-8-sig")
+
+    # the outputs no longer match the fingerprinted inputs of the full run
+    fingerprint_path = fingerprint_path_for(output_csv_path)
+    if os.path.exists(fingerprint_path):
+        os.remove(fingerprint_path)
+
+    if log_cb:
+        log_cb(f"Results written to: {output_csv_path}")
+        log_cb("Spatial change layer not updated (geometry is not re-evaluated).")
+        log_cb("")
+        for line in balance_summary_lines(balance_values):
+            log_cb(line)
+        if sensitivity:
+            for line in sensitivity_lines(sensitivity):
+                log_cb(line)
+
+    result_dict = {
+        **balance_summary,
+        **(format_sensitivity_summary(sensitivity) if sensitivity else {}),
+        "Results path": output_csv_path,
+        "Transitions path": transitions_path,
+        "Spatial change path": "(unchanged, not re-evaluated)",
+        "Calculation time": f"{time.perf_counter() - started:.3f} s",
+    }
+    return result_dict, results_df
+
+
+# ============================================================
+# RESULT CACHE (input fingerprint)
+# ============================================================
+FINGERPRINT_VERSION = 3
+
+
+def fingerprint_path_for(output_csv_path: str) -> str:
+    return os.path.splitext(output_csv_path)[0] + "_fingerprint.json"
+
+
+def _update_with_layer(hasher, layer: QgsVectorLayer, field_names: Optional[list]) -> None:
+    """
+    Geometry (WKB) and the used attribute values of every feature;
+    field_names=None hashes all attributes.
+    """
+    if field_names is None:
+        field_names = layer.fields().names()
+    field_names = [f for f in field_names if f and layer.fields().indexOf(f) >= 0]
+    request = QgsFeatureRequest().setSubsetOfAttributes(field_names, layer.fields())
+    hasher.update(f"{layer.crs().authid()}|{layer.featureCount()}|{field_names}".encode("utf-8"))
+    for feat in layer.getFeatures(request):
+        geom = feat.geometry()
+        hasher.update(bytes(geom.asWkb()) if geom and not geom.isEmpty() else b"")
+        hasher.update(repr([feat[f] for f in field_names]).encode("utf-8"))
+
+
+def input_fingerprint(layers: list, files: list, params: dict) -> str:
+    """
+    sha256 over the content of all inputs.
+
+    layers: (layer, [field names]) pairs, None hashes all fields; files:
+    paths whose bytes are hashed (factors CSV); params: JSON-serializable
+    parameters (field names, manual rows, thresholds, options).
+    """
+    hasher = hashlib.sha256()
+    hasher.update(f"v{FINGERPRINT_VERSION}".encode("utf-8"))
+    hasher.update(json.dumps(params, sort_keys=True, default=str, ensure_ascii=False).encode("utf-8"))
+    for path in files:
+        with open(path, "rb") as f:
+            hasher.update(hashlib.sha256(f.read()).digest())
+    for layer, field_names in layers:
+        _update_with_layer(hasher, layer, field_names)
+    return hasher.hexdigest()
+
+
+def write_fingerprint(
+    path: str,
+    fingerprint: str,
+    result_dict: dict,
+    balance_summary: dict,
+    total_planning_area: float,
+) -> str:
+    payload = {
+        "version": FINGERPRINT_VERSION,
+        "fingerprint": fingerprint,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "total_planning_area": total_planning_area,
+        "summary": balance_summary,
+        "result": result_dict,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, ensure_ascii=False, default=str)
+    return path
+
+
+def restore_cached_run(
+    fingerprint_path: str,
+    fingerprint: str,
+    output_csv_path: str,
+    factors_csv: str,
+    sensitivity_samples: int = 0,
+    log_cb: Optional[Callable[[str], None]] = None,
+    results_ready_cb: Optional[Callable[[pd.DataFrame, dict, dict], None]] = None,
+):
+    """
+    Restores the results of an identical earlier run from its artifacts.
+    Returns (result_dict, results_df) or None if there is nothing to restore
+    (no or different fingerprint, spatial outputs deleted). A deleted result
+    CSV is rebuilt from the transition cache.
+    """
+    if not os.path.exists(fingerprint_path):
+        return None
+    try:
+        with open(fingerprint_path, "r", encoding="utf-8") as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if stored.get("version") != FINGERPRINT_VERSION or stored.get("fingerprint") != fingerprint:
+        return None
+
+    result_dict = dict(stored["result"])
+    transitions_path = result_dict.get("Transitions path")
+    # every written artifact except the CSV itself must still exist
+    required = [
+        value for key, value in result_dict.items()
+        if key.endswith("path") and key != "Results path" and not str(value).startswith("(")
+    ]
+    if not transitions_path or not all(os.path.exists(p) for p in required):
+        return None
+
+    if os.path.exists(output_csv_path):
+        results_df = pd.read_csv(output_csv_path, encoding="utf-8-sig")
+    else:
+        results_df, _, _ = load_cached_balance(transitions_path, factors_csv)
+        results_df.to_csv(output_csv_path, index=False, encoding="utf-8-sig")
+        if log_cb:
+            log_cb(f"Results rebuilt from transition cache: {output_csv_path}")
+
+    phases_path = result_dict.get("Phase balance path")
+    phases = pd.read_csv(phases_path, encoding="utf-8-sig") if phases_path and os.path.exists(phases_path) else None
+    sensitivity = run_sensitivity(
+        results_df,
+        factors_csv,
+        float(stored.get("total_planning_area") or 0.0),
+        n_samples=sensitivity_samples,
+        log_cb=log_cb,
+    )
+
+    if results_ready_cb:
+        results_ready_cb(
+            results_df.copy(),
+            dict(stored.get("summary") or {}),
+            {"sensitivity": sensitivity, "phases": phases},
+        )
+
+    if log_cb:
+        log_cb(f"Inputs unchanged (fingerprint {fingerprint[:12]}…), results restored from {stored.get('created')}.")
+        log_cb("")
+        for key, value in result_dict.items():
+            if key != "Validation report":
+                log_cb(f"{key:<20}: {value}")
+        log_cb("")
+
+    result_dict["Restored from"] = fingerprint_path
+    return result_dict, results_df
+
+
 # ============================================================
 # SPATIAL OUTPUT
 # ============================================================
+def geometry_hash(geom) -> Optional[str]:
+    """
+    Short content hash of a geometry (WKB), used to match change rows of
+    two runs (see compare_runs.py). Hashed as multi type, as it is stored
+    in the MultiPolygon change layer, so hashes of geometries read back
+    from the GPKG match.
+    """
+    if geom is None or geom.isEmpty():
+        return None
+    geom = QgsGeometry(geom)
+    geom.convertToMultiType()
+    return hashlib.blake2b(bytes(geom.asWkb()), digest_size=8).hexdigest()
+
+
 def write_spatial_change_layer(
     df: pd.DataFrame,
     output_path: str,
@@ -580,6 +1761,15 @@ def write_spatial_change_layer(
     fields.append(QgsField("Final_BFF", QVariant.Double))
     fields.append(QgsField("Class", QVariant.String))
     fields.append(QgsField("Source", QVariant.String))
+    fields.append(QgsField("PlanFid", QVariant.LongLong))
+    fields.append(QgsField("GeomHash", QVariant.String))
+    has_zone = "Zone" in df.columns
+    if has_zone:
+        fields.append(QgsField("Zone", QVariant.String))
+
+    indicator_cols = indicator_area_columns(df)
+    for c in indicator_cols:
+        fields.append(QgsField(c, QVariant.Double))
 
     options = QgsVectorFileWriter.SaveVectorOptions()
     options.driverName = "GPKG"
@@ -615,6 +1805,13 @@ def write_spatial_change_layer(
         feat["Final_BFF"] = float(row.get("Final_BFF_Area", 0))
         feat["Class"] = str(row.get("ChangeClass", ""))
         feat["Source"] = str(row.get("Source", ""))
+        plan_fid = row.get("PlanFid")
+        feat["PlanFid"] = int(plan_fid) if plan_fid is not None and not pd.isna(plan_fid) else None
+        feat["GeomHash"] = geometry_hash(geom)
+        if has_zone:
+            feat["Zone"] = str(row.get("Zone", NO_ZONE))
+        for c in indicator_cols:
+            feat[c] = float(row.get(c, 0))
 
         writer.addFeature(feat)
 
@@ -622,10 +1819,310 @@ def write_spatial_change_layer(
     return output_path
 
 
+def write_zone_layer(
+    df_zone: pd.DataFrame,
+    zone_geoms: dict,
+    output_path: str,
+    crs,
+    layer_name: str = "zone_balance",
+) -> str:
+    """
+    Zone polygons with their balance attributes (one feature per zone value).
+    """
+    fields = QgsFields()
+    fields.append(QgsField("Zone", QVariant.String))
+    fields.append(QgsField("Zone_Area", QVariant.Double))
+    fields.append(QgsField("Area", QVariant.Double))
+    fields.append(QgsField("BFF_Area", QVariant.Double))
+    fields.append(QgsField("Final_BFF", QVariant.Double))
+    fields.append(QgsField("Percent", QVariant.Double))
+    fields.append(QgsField("BFF_Factor", QVariant.Double))
+
+    indicator_cols = indicator_area_columns(df_zone)
+    for c in indicator_cols:
+        fields.append(QgsField(c, QVariant.Double))
+
+    options = QgsVectorFileWriter.SaveVectorOptions()
+    options.driverName = "GPKG"
+    options.layerName = layer_name
+
+    writer = QgsVectorFileWriter.create(
+        output_path,
+        fields,
+        QgsWkbTypes.MultiPolygon,
+        crs,
+        QgsProject.instance().transformContext(),
+        options,
+    )
+
+    if writer.hasError() != QgsVectorFileWriter.NoError:
+        raise ValueError(f"Could not create zone output: {writer.errorMessage()}")
+
+    for row in df_zone.to_dict(orient="records"):
+        geom = zone_geoms.get(row["Zone"])
+        if geom is None:
+            continue
+
+        feat = QgsFeature(fields)
+        feat.setGeometry(geom)
+        feat["Zone"] = str(row["Zone"])
+        feat["Zone_Area"] = float(row["Zone_Area"])
+        feat["Area"] = float(row["Area"])
+        feat["BFF_Area"] = float(row["BFF_Area"])
+        feat["Final_BFF"] = float(row["Final_BFF_Area"])
+        feat["Percent"] = float(row["Percentage"])
+        feat["BFF_Factor"] = float(row["Final_BFF_Factor"])
+        for c in indicator_cols:
+            feat[c] = float(row.get(c, 0))
+
+        writer.addFeature(feat)
+
+    del writer
+    return output_path
+
+
+PLAN_FEATURE_FIELDS = (
+    ("BFF_Area", "BFF_Area"),
+    ("Final_BFF", "Final_BFF_Area"),
+    ("Change_Area", "Area"),
+)
+
+
+def write_plan_feature_layer(
+    df_plan: pd.DataFrame,
+    planning_layer: QgsVectorLayer,
+    output_path: str,
+    layer_name: str = "plan_balance",
+) -> str:
+    """
+    Copy of the plan layer (all attributes) with the balance of every plan
+    feature from aggregate_by_plan_feature(). Features without change rows
+    get 0 / NULL. Names already used by the plan layer get a '_bal' suffix.
+    """
+    plan_fields = planning_layer.fields()
+    existing = {f.name().lower() for f in plan_fields}
+
+    def field_name(name):
+        return f"{name}_bal" if name.lower() in existing else name
+
+    value_fields = [(field_name(name), col) for name, col in PLAN_FEATURE_FIELDS]
+    value_fields += [(field_name(col), col) for col in indicator_area_columns(df_plan)]
+    dominant_field = field_name("Dominant_Before")
+
+    fields = QgsFields(plan_fields)
+    for name, _ in value_fields:
+        fields.append(QgsField(name, QVariant.Double))
+    fields.append(QgsField(dominant_field, QVariant.String))
+
+    options = QgsVectorFileWriter.SaveVectorOptions()
+    options.driverName = "GPKG"
+    options.layerName = layer_name
+
+    writer = QgsVectorFileWriter.create(
+        output_path,
+        fields,
+        QgsWkbTypes.multiType(planning_layer.wkbType()),
+        planning_layer.crs(),
+        QgsProject.instance().transformContext(),
+        options,
+    )
+
+    if writer.hasError() != QgsVectorFileWriter.NoError:
+        raise ValueError(f"Could not create plan feature output: {writer.errorMessage()}")
+
+    balance_by_fid = df_plan.set_index("PlanFid").to_dict(orient="index") if not df_plan.empty else {}
+    n_plan_attrs = plan_fields.count()
+
+    for plan_feat in planning_layer.getFeatures():
+        balance = balance_by_fid.get(plan_feat.id(), {})
+
+        feat = QgsFeature(fields)
+        feat.setGeometry(plan_feat.geometry())
+        attrs = plan_feat.attributes()[:n_plan_attrs]
+        attrs += [float(balance.get(col, 0.0)) for _, col in value_fields]
+        attrs.append(balance.get("Dominant_Before"))
+        feat.setAttributes(attrs)
+
+        writer.addFeature(feat)
+
+    del writer
+    return output_path
+
+
+ATOMIC_EXPORT_FORMATS = {
+    "parquet": ".parquet",
+    "feather": ".feather",
+}
+
+
+def _crs_to_projjson(crs):
+    """
+    PROJJSON representation of a QGIS CRS for GeoParquet metadata.
+    Returns None (= undefined CRS) if pyproj is not available.
+    """
+    try:
+        from pyproj import CRS
+        return CRS.from_wkt(crs.toWkt()).to_json_dict()
+    except Exception:
+        return None
+
+
+def _atomic_arrow_schema(df: pd.DataFrame, crs=None):
+    import pyarrow as pa
+
+    fields = []
+    for col in df.columns:
+        if col == "geometry":
+            continue
+        if col == "PlanFid":
+            fields.append(pa.field(col, pa.int64()))
+        elif pd.api.types.is_numeric_dtype(df[col]):
+            fields.append(pa.field(col, pa.float64()))
+        else:
+            fields.append(pa.field(col, pa.string()))
+    fields.append(pa.field("geometry", pa.binary()))
+
+    geo_metadata = {
+        "version": "1.0.0",
+        "primary_column": "geometry",
+        "columns": {
+            "geometry": {
+                "encoding": "WKB",
+                "geometry_types": [],
+                "crs": _crs_to_projjson(crs) if crs is not None else None,
+            }
+        },
+    }
+    return pa.schema(fields, metadata={b"geo": json.dumps(geo_metadata).encode("utf-8")})
+
+
+def _atomic_arrow_batch(df_batch: pd.DataFrame, schema):
+    import pyarrow as pa
+
+    arrays = []
+    for field in schema:
+        if field.name == "geometry":
+            geoms = df_batch["geometry"] if "geometry" in df_batch.columns else [None] * len(df_batch)
+            wkb = [
+                bytes(g.asWkb()) if isinstance(g, QgsGeometry) and not g.isEmpty() else None
+                for g in geoms
+            ]
+            arrays.append(pa.array(wkb, type=pa.binary()))
+        elif field.name == "PlanFid":
+            arrays.append(pa.array(df_batch[field.name].astype("Int64"), type=field.type))
+        elif pa.types.is_string(field.type):
+            values = df_batch[field.name]
+            values = values.where(values.isna(), values.astype(str))
+            arrays.append(pa.array(values, type=field.type, from_pandas=True))
+        else:
+            arrays.append(pa.array(df_batch[field.name], type=field.type, from_pandas=True))
+
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def write_atomic_change_table(
+    df: pd.DataFrame,
+    output_path: str,
+    crs=None,
+    file_format: str = "parquet",
+    row_group_size: int = 100_000,
+) -> str:
+    """
+    Writes the atomic change rows (one row per intersection piece / measure)
+    as columnar GeoParquet or Feather (Arrow IPC) file.
+
+    Geometry is stored as WKB in column 'geometry' (null for rows without
+    geometry, e.g. manual measures). Rows are written in row groups of
+    row_group_size so readers can use predicate pushdown.
+    """
+    if file_format not in ATOMIC_EXPORT_FORMATS:
+        raise ValueError(
+            f"Unknown atomic export format '{file_format}'. "
+            f"Use one of: {', '.join(ATOMIC_EXPORT_FORMATS)}"
+        )
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ValueError(
+            "Atomic change export requires the Python package 'pyarrow'. "
+            "Install it into the QGIS Python environment or disable the export."
+        ) from e
+
+    if df.empty:
+        return output_path
+
+    df = df.reset_index(drop=True)
+    schema = _atomic_arrow_schema(df, crs)
+
+    if file_format == "parquet":
+        writer = pq.ParquetWriter(output_path, schema)
+    else:
+        writer = pa.ipc.new_file(output_path, schema)
+
+    try:
+        for start in range(0, len(df), row_group_size):
+            batch = _atomic_arrow_batch(df.iloc[start:start + row_group_size], schema)
+            if file_format == "parquet":
+                writer.write_table(pa.Table.from_batches([batch]), row_group_size=row_group_size)
+            else:
+                writer.write_batch(batch)
+    finally:
+        writer.close()
+
+    return output_path
+
+
+# ============================================================
+# PROFILING
+# ============================================================
+def write_profile_artifacts(
+    profiler: cProfile.Profile,
+    hotspots: Optional[HotspotRecorder],
+    profile_path: str,
+    report_path: str,
+    top_n: int = 20,
+    log_cb: Optional[Callable[[str], None]] = None,
+) -> None:
+    """
+    Writes the cProfile stats (.prof, e.g. for snakeviz) and a text report
+    with the slowest geometries and the top functions by cumulative time.
+    """
+    os.makedirs(os.path.dirname(profile_path) or ".", exist_ok=True)
+    profiler.dump_stats(profile_path)
+
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(top_n)
+
+    report = []
+    if hotspots is not None:
+        report.append(hotspots.as_text(top_n))
+        report.append("")
+    report.append(f"===== TOP {top_n} FUNCTIONS (cumulative time) =====")
+    report.append(stream.getvalue().strip())
+
+    with open(report_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(report) + "\n")
+
+    if log_cb:
+        log_cb(f"Profile written to: {profile_path}")
+        log_cb(f"Slowest geometries report written to: {report_path}")
+
+
 # ============================================================
 # MAIN
 # ============================================================
-def main(
+def _stage(perf, name: str):
+    """
+    Stage context of an optional StageRecorder (no-op if perf is None).
+    """
+    if perf is None:
+        return nullcontext({})
+    return perf.stage(name)
+
+
+def _run_balance(
     plan_field_name: str,
     base_field_name: str,
     factors_csv: str,
@@ -635,82 +2132,287 @@ def main(
     building_green: list,
     building_green_layer_name: str = None,
     building_green_field_name: str = None,
+    zones_layer_name: str = None,
+    zones_field_name: str = None,
+    phase_layer_names: Optional[list] = None,
     max_allowed_overlap_area: float = 30.0,
     min_report_overlap_area: float = 0.01,
     validate_base_layer: bool = True,
     validate_planning_layer: bool = True,
+    atomic_export_format: Optional[str] = None,
+    fail_fast: bool = False,
+    inputs_validated: bool = False,
+    profile: bool = False,
+    sensitivity_samples: int = 0,
+    use_cache: bool = True,
+    out_of_core: bool = False,
+    overlay_engine: str = OVERLAY_ENGINE_PYTHON,
+    hotspots: Optional[HotspotRecorder] = None,
     log_cb: Optional[Callable[[str], None]] = None,
+    perf=None,
+    results_ready_cb: Optional[Callable[[pd.DataFrame, dict, dict], None]] = None,
 ):
     """
-    Main calculation entry point.
-
-    Logic:
-    - normal plan/base intersections
-    - measures from optional building_green layer
-    - manual building_green rows
-    - one shared factor logic
-    - balance and spatial output remain consistent
+    Calculation of main() (see there); hotspots collects GEOS time per
+    geometry when profiling.
     """
-    if log_cb:
-        log_cb(f"Using base layer: {base_layer_name}")
-    base_layer = get_layer_from_project(base_layer_name)
-
-    if log_cb:
-        log_cb(f"Using plan layer: {planning_layer_name}")
-    planning_layer = get_layer_from_project(planning_layer_name)
+    output_stem = os.path.splitext(output_csv_path)[0]
+
+    with _stage(perf, "read_layers") as rec:
+        if log_cb:
+            log_cb(f"Using base layer: {base_layer_name}")
+        base_layer = get_layer_from_project(base_layer_name)
+
+        if log_cb:
+            log_cb(f"Using plan layer: {planning_layer_name}")
+        planning_layer = get_layer_from_project(planning_layer_name)
+        rec["items"] = base_layer.featureCount() + planning_layer.featureCount()
+
+        phase_layers = []
+        for name in phase_layer_names or []:
+            if log_cb:
+                log_cb(f"Using phase layer: {name}")
+            phase_layer = get_layer_from_project(name)
+            # a phase in another CRS would be overlaid with wrong coordinates
+            if phase_layer.crs() != planning_layer.crs():
+                raise ValueError(
+                    f"CRS mismatch: phase layer '{name}' uses {phase_layer.crs().authid() or '(unknown)'}, "
+                    f"plan layer '{planning_layer_name}' uses {planning_layer.crs().authid() or '(unknown)'}."
+                )
+            phase_layers.append((name, phase_layer))
+
+        zones_layer = None
+        if zones_layer_name:
+            if not zones_field_name:
+                raise ValueError("A zone field is required when a zone layer is given")
+            if log_cb:
+                log_cb(f"Using zone layer: {zones_layer_name} | Field: {zones_field_name}")
+            zones_layer = get_layer_from_project(zones_layer_name)
+            # zones are intersected with the change rows in plan coordinates
+            if zones_layer.crs() != planning_layer.crs():
+                raise ValueError(
+                    f"CRS mismatch: zone layer '{zones_layer_name}' uses {zones_layer.crs().authid() or '(unknown)'}, "
+                    f"plan layer '{planning_layer_name}' uses {planning_layer.crs().authid() or '(unknown)'}."
+                )
+
+    fingerprint = None
+    fingerprint_path = fingerprint_path_for(output_csv_path)
+    if use_cache and not profile:
+        with _stage(perf, "fingerprint") as rec:
+            fingerprint_layers = [
+                (base_layer, [base_field_name]),
+                # all attributes: _plan_features.gpkg copies every plan field
+                (planning_layer, None),
+            ]
+            fingerprint_layers += [(layer, [plan_field_name]) for _, layer in phase_layers]
+            if zones_layer is not None:
+                fingerprint_layers.append((zones_layer, [zones_field_name]))
+            if building_green_layer_name:
+                fingerprint_layers.append((
+                    get_layer_from_project(building_green_layer_name),
+                    ["Area", building_green_field_name],
+                ))
+            fingerprint = input_fingerprint(
+                fingerprint_layers,
+                files=[factors_csv],
+                params={
+                    "plan_field_name": plan_field_name,
+                    "base_field_name": base_field_name,
+                    "building_green": building_green or [],
+                    "building_green_field_name": building_green_field_name,
+                    "zones_field_name": zones_field_name,
+                    "phases": list(phase_layer_names or []),
+                    "max_allowed_overlap_area": max_allowed_overlap_area,
+                    "min_report_overlap_area": min_report_overlap_area,
+                    "validate_base_layer": validate_base_layer,
+                    "validate_planning_layer": validate_planning_layer,
+                    "fail_fast": fail_fast,
+                    "atomic_export_format": atomic_export_format,
+                    "sensitivity_samples": sensitivity_samples,
+                    # engines differ on invalid geometries and in per-window rounding
+                    "overlay_engine": overlay_engine,
+                    "out_of_core": out_of_core,
+                },
+            )
+            rec["items"] = sum(layer.featureCount() for layer, _ in fingerprint_layers)
+
+        with _stage(perf, "restore"):
+            restored = restore_cached_run(
+                fingerprint_path,
+                fingerprint,
+                output_csv_path,
+                factors_csv,
+                sensitivity_samples=sensitivity_samples,
+                log_cb=log_cb,
+                results_ready_cb=results_ready_cb,
+            )
+        if restored is not None:
+            result_dict, results_df = restored
+            if perf is not None:
+                result_dict["Calculation time"] = f"{perf.total_wall():.2f} s (restored)"
+            return result_dict, results_df
 
     # --------------------------------------------------------
-    # 0) validate polygon overlaps before calculation
+    # 0) validate inputs / polygon overlaps before calculation
     # --------------------------------------------------------
     validation_reports = []
 
-    if validate_base_layer:
-        validation_reports.append(
-            validate_layer_overlaps(
-                base_layer,
-                max_allowed_overlap_area=max_allowed_overlap_area,
-                min_report_overlap_area=min_report_overlap_area,
-                label_field=base_field_name,
-                log_cb=log_cb,
+    if fail_fast and not inputs_validated:
+        with _stage(perf, "input_check"):
+            validation_reports.append(
+                validate_inputs(
+                    base_layer,
+                    base_field_name,
+                    planning_layer,
+                    plan_field_name,
+                    factors_csv,
+                    log_cb=log_cb,
+                    phase_layers=[layer for _, layer in phase_layers],
+                )
             )
-        )
 
-    if validate_planning_layer:
-        validation_reports.append(
-            validate_layer_overlaps(
-                planning_layer,
-                max_allowed_overlap_area=max_allowed_overlap_area,
-                min_report_overlap_area=min_report_overlap_area,
-                label_field=plan_field_name,
-                log_cb=log_cb,
+    with _stage(perf, "overlap_validation"):
+        if validate_base_layer:
+            validation_reports.append(
+                validate_layer_overlaps(
+                    base_layer,
+                    max_allowed_overlap_area=max_allowed_overlap_area,
+                    min_report_overlap_area=min_report_overlap_area,
+                    label_field=base_field_name,
+                    log_cb=log_cb,
+                    fail_fast=fail_fast,
+                    out_of_core=out_of_core,
+                )
             )
+
+        if validate_planning_layer:
+            # phase layers are plan layers too: overlaps inside a phase would
+            # be counted twice in the phase partition
+            for layer in [planning_layer] + [layer for _, layer in phase_layers]:
+                validation_reports.append(
+                    validate_layer_overlaps(
+                        layer,
+                        max_allowed_overlap_area=max_allowed_overlap_area,
+                        min_report_overlap_area=min_report_overlap_area,
+                        label_field=plan_field_name,
+                        log_cb=log_cb,
+                        fail_fast=fail_fast,
+                        out_of_core=out_of_core,
+                    )
+                )
+
+    with _stage(perf, "read_features") as rec:
+        # optional measures from layer
+        building_green_from_layer = _bg_from_layer(
+            building_green_layer_name,
+            building_green_field_name,
+            log_cb=log_cb,
         )
+        plan_features = collect_plan_features(planning_layer, plan_field_name)
+        rec["items"] = len(plan_features) + len(building_green_from_layer)
 
-    # optional measures from layer
-    building_green_from_layer = _bg_from_layer(
-        building_green_layer_name,
-        building_green_field_name,
-        log_cb=log_cb,
-    )
+    zone_index = None
+    if zones_layer is not None:
+        with _stage(perf, "zone_index") as rec:
+            zone_index = build_zone_index(zones_layer, zones_field_name)
+            rec["items"] = len(zone_index["zones"])
 
     # --------------------------------------------------------
     # 1) normal atomic rows from plan/base logic
     # --------------------------------------------------------
-    plan_features = collect_plan_features(planning_layer, plan_field_name)
-    geom_by_field, union_by_field = build_union_geometries(base_layer, base_field_name)
-    total_base_union = build_total_base_union(geom_by_field)
-
-    normal_atomic_rows = calculate_atomic_change_rows(
-        union_by_field=union_by_field,
-        total_base_union=total_base_union,
-        plan_features=plan_features,
-    )
+    if overlay_engine not in (OVERLAY_ENGINE_PYTHON, OVERLAY_ENGINE_SQL):
+        raise ValueError(f"Unknown overlay engine '{overlay_engine}'")
+
+    shared_gpkg = None
+    if overlay_engine == OVERLAY_ENGINE_SQL:
+        try:
+            from .sql_backend import calculate_atomic_change_rows_sql, shared_geopackage
+        except ImportError:
+            from sql_backend import calculate_atomic_change_rows_sql, shared_geopackage
+        if profile:
+            if log_cb:
+                log_cb("Profiling measures GEOS time per geometry in the Python overlay, SQL overlay not used")
+        else:
+            shared_gpkg = shared_geopackage(base_layer, planning_layer)
+            if shared_gpkg is None and log_cb:
+                log_cb("SQL overlay needs base and plan layer in the same GeoPackage (unfiltered), using the Python overlay")
+
+    normal_atomic_rows = None
+    if shared_gpkg is not None:
+        gpkg_path, base_table, plan_table = shared_gpkg
+        with _stage(perf, "overlay_sql") as rec:
+            if log_cb:
+                log_cb(f"Running overlay as SpatiaLite SQL in {gpkg_path}")
+            try:
+                normal_atomic_rows = calculate_atomic_change_rows_sql(
+                    gpkg_path, base_table, base_field_name, plan_table, plan_field_name
+                )
+            except ValueError as e:
+                if log_cb:
+                    log_cb(f"SQL overlay not possible ({e}), using the Python overlay")
+            else:
+                if zone_index is not None:
+                    normal_atomic_rows = assign_zones(normal_atomic_rows, zone_index)
+                rec["items"] = len(normal_atomic_rows)
+
+    windowed_overlay = normal_atomic_rows is None and out_of_core and has_provider_spatial_index(base_layer)
+    if normal_atomic_rows is None and out_of_core and not windowed_overlay and log_cb:
+        log_cb(f"Base layer '{base_layer_name}' has no provider spatial index, using the in-memory overlay")
+
+    if (normal_atomic_rows is None and not windowed_overlay) or phase_layers:
+        with _stage(perf, "unions") as rec:
+            geom_by_field, union_by_field = build_union_geometries(
+                base_layer, base_field_name, hotspots=hotspots
+            )
+            total_base_union = build_total_base_union(geom_by_field)
+            rec["items"] = len(union_by_field)
+
+    if normal_atomic_rows is None:
+        with _stage(perf, "overlay") as rec:
+            if windowed_overlay:
+                normal_atomic_rows = calculate_atomic_change_rows_windowed(
+                    base_layer,
+                    base_field_name,
+                    plan_features=plan_features,
+                    hotspots=hotspots,
+                    zone_index=zone_index,
+                )
+            else:
+                normal_atomic_rows = calculate_atomic_change_rows(
+                    union_by_field=union_by_field,
+                    total_base_union=total_base_union,
+                    plan_features=plan_features,
+                    hotspots=hotspots,
+                    zone_index=zone_index,
+                )
+            rec["items"] = len(normal_atomic_rows)
+
+    phase_df = None
+    if phase_layers:
+        with _stage(perf, "phase_overlay") as rec:
+            phases = [(planning_layer_name, plan_features)] + [
+                (name, collect_plan_features(layer, plan_field_name)) for name, layer in phase_layers
+            ]
+            phase_df = calculate_phase_chain(
+                union_by_field,
+                total_base_union,
+                phases,
+                factors_csv,
+                first_phase_rows=normal_atomic_rows,
+                hotspots=hotspots,
+            )
+            rec["items"] = len(phase_df)
 
     # --------------------------------------------------------
     # 2) measures rows
     # --------------------------------------------------------
+    manual_rows = [dict(row) for row in building_green or []]
+    if zone_index is not None:
+        building_green_from_layer = assign_zones(building_green_from_layer, zone_index)
+        manual_rows = assign_zones(manual_rows, zone_index)
+
     bg_layer_spatial_rows, bg_layer_nonspatial_rows = split_rows_for_spatial(building_green_from_layer)
-    manual_bg_spatial_rows, manual_bg_nonspatial_rows = split_rows_for_spatial(building_green or [])
+    manual_bg_spatial_rows, manual_bg_nonspatial_rows = split_rows_for_spatial(manual_rows)
 
     # --------------------------------------------------------
     # 3) master rows for balance
@@ -718,10 +2420,7 @@ def main(
     balance_rows = []
     balance_rows.extend(normal_atomic_rows)
     balance_rows.extend(building_green_from_layer)
-    balance_rows.extend(building_green or [])
-
-    balance_df_atomic = apply_factors_to_rows(balance_rows, factors_csv)
-    results_df = aggregate_change_rows(balance_df_atomic)
+    balance_rows.extend(manual_rows)
 
     # --------------------------------------------------------
     # 4) master rows for spatial output
@@ -731,48 +2430,153 @@ def main(
     spatial_rows.extend(bg_layer_spatial_rows)
     spatial_rows.extend(manual_bg_spatial_rows)
 
-    spatial_df = apply_factors_to_rows(spatial_rows, factors_csv)
+    with _stage(perf, "factor_application") as rec:
+        balance_df_atomic = apply_factors_to_rows(balance_rows, factors_csv)
+        spatial_df = apply_factors_to_rows(spatial_rows, factors_csv)
+        rec["items"] = len(balance_df_atomic) + len(spatial_df)
+
+    with _stage(perf, "aggregation") as rec:
+        results_df = aggregate_change_rows(balance_df_atomic)
+        rec["items"] = len(results_df)
+
+    with _stage(perf, "plan_feature_aggregation") as rec:
+        plan_feature_df = aggregate_by_plan_feature(balance_df_atomic)
+        rec["items"] = len(plan_feature_df)
+
+    zone_df = None
+    if zone_index is not None:
+        with _stage(perf, "zone_aggregation") as rec:
+            zone_geoms = zone_geometries(zone_index)
+            zone_df = aggregate_by_zone(
+                balance_df_atomic, {zone: geom.area() for zone, geom in zone_geoms.items()}
+            )
+            rec["items"] = len(zone_df)
 
     # --------------------------------------------------------
-    # 5) write outputs
+    # 5) balance summary (before writing, so results are available early)
     # --------------------------------------------------------
-    output_dir = os.path.dirname(output_csv_path)
-    os.makedirs(output_dir, exist_ok=True)
+    with _stage(perf, "summary"):
+        total_planning_area = calculate_total_layer_area(planning_layer)
 
-    results_df.to_csv(output_csv_path, index=False, encoding="utf-8-sig")
+    balance_values = summarize_balance(results_df, total_planning_area)
+    balance_summary = format_balance_summary(balance_values)
 
-    spatial_output_path = os.path.splitext(output_csv_path)[0] + "_spatial_changes.gpkg"
-    write_spatial_change_layer(
-        spatial_df,
-        output_path=spatial_output_path,
-        crs=planning_layer.crs(),
-        layer_name="spatial_changes",
-    )
+    with _stage(perf, "sensitivity") as rec:
+        sensitivity = run_sensitivity(
+            results_df, factors_csv, total_planning_area, n_samples=sensitivity_samples, log_cb=log_cb
+        )
+        rec["items"] = sensitivity_samples if sensitivity else 0
+
+    if results_ready_cb:
+        results_ready_cb(
+            results_df.copy(),
+            dict(balance_summary),
+            {"sensitivity": sensitivity, "phases": phase_df},
+        )
 
     # --------------------------------------------------------
-    # 6) summary / log
+    # 6) write outputs
     # --------------------------------------------------------
-    net_balance = float(results_df["BFF_Area"].sum()) if "BFF_Area" in results_df.columns else 0.0
-    final_bff_area = float(results_df["Final_BFF_Area"].sum()) if "Final_BFF_Area" in results_df.columns else 0.0
+    output_dir = os.path.dirname(output_csv_path)
+    os.makedirs(output_dir, exist_ok=True)
 
-    total_planning_area = calculate_total_layer_area(planning_layer)
+    with _stage(perf, "csv_write") as rec:
+        results_df.to_csv(output_csv_path, index=False, encoding="utf-8-sig")
+        rec["items"] = len(results_df)
+
+    transitions_path = transitions_path_for(output_csv_path)
+    with _stage(perf, "transitions_write") as rec:
+        write_transition_cache(
+            balance_df_atomic,
+            output_path=transitions_path,
+            total_planning_area=total_planning_area,
+            inputs={
+                "base_layer": base_layer_name,
+                "planning_layer": planning_layer_name,
+                "factors_csv": factors_csv,
+            },
+        )
+        rec["items"] = len(balance_df_atomic)
 
-    percentage = (net_balance / total_planning_area * 100) if total_planning_area > 0 else 0.0
-    final_bff_factor = (final_bff_area / total_planning_area) if total_planning_area > 0 else 0.0
-    final_bff_percentage = final_bff_factor * 100
+    spatial_output_path = os.path.splitext(output_csv_path)[0] + "_spatial_changes.gpkg"
+    with _stage(perf, "gpkg_write") as rec:
+        write_spatial_change_layer(
+            spatial_df,
+            output_path=spatial_output_path,
+            crs=planning_layer.crs(),
+            layer_name="spatial_changes",
+        )
+        rec["items"] = len(spatial_df)
+
+    plan_feature_path = output_stem + "_plan_features.gpkg"
+    with _stage(perf, "plan_feature_write") as rec:
+        write_plan_feature_layer(plan_feature_df, planning_layer, plan_feature_path)
+        rec["items"] = planning_layer.featureCount()
+
+    phase_csv_path = None
+    if phase_df is not None:
+        phase_csv_path = output_stem + "_phases.csv"
+        phase_df.to_csv(phase_csv_path, index=False, encoding="utf-8-sig")
+
+    zone_csv_path = zone_layer_path = None
+    if zone_df is not None:
+        zone_csv_path = output_stem + "_zones.csv"
+        zone_layer_path = output_stem + "_zones.gpkg"
+        with _stage(perf, "zone_write") as rec:
+            zone_df.to_csv(zone_csv_path, index=False, encoding="utf-8-sig")
+            write_zone_layer(zone_df, zone_geoms, zone_layer_path, crs=planning_layer.crs())
+            rec["items"] = len(zone_df)
+
+    atomic_output_path = None
+    if atomic_export_format:
+        atomic_output_path = (
+            os.path.splitext(output_csv_path)[0]
+            + "_atomic_changes"
+            + ATOMIC_EXPORT_FORMATS.get(atomic_export_format, "")
+        )
+        with _stage(perf, "atomic_export") as rec:
+            write_atomic_change_table(
+                balance_df_atomic,
+                output_path=atomic_output_path,
+                crs=planning_layer.crs(),
+                file_format=atomic_export_format,
+            )
+            rec["items"] = len(balance_df_atomic)
 
+    # --------------------------------------------------------
+    # 7) log
+    # --------------------------------------------------------
     if log_cb:
         log_cb(f"Results written to: {output_csv_path}")
         log_cb(f"Spatial change layer written to: {spatial_output_path}")
+        log_cb(f"Plan feature balance layer written to: {plan_feature_path}")
+        if atomic_output_path:
+            log_cb(f"Atomic change rows written to: {atomic_output_path}")
+        log_cb(f"Transition cache written to: {transitions_path}")
         log_cb("")
-        log_cb("===== BALANCE SUMMARY =====")
-        log_cb(f"Total planning area : {total_planning_area:.2f} m²")
-        log_cb(f"Net Balance         : {net_balance:.2f} m²")
-        log_cb(f"Percentage          : {percentage:.2f} %")
-        log_cb(f"Final BFF Area      : {final_bff_area:.2f} m²")
-        log_cb(f"Final BFF Factor    : {final_bff_factor:.4f}")
-        log_cb(f"Final BFF Percentage: {final_bff_percentage:.2f} %")
-        log_cb("")
+        for line in balance_summary_lines(balance_values):
+            log_cb(line)
+        if sensitivity:
+            for line in sensitivity_lines(sensitivity):
+                log_cb(line)
+        if phase_df is not None:
+            log_cb("===== PHASE BALANCES =====")
+            log_cb(f"  {'Phase':<24} {'Net Balance [m²]':>18} {'Cumulative [m²]':>18} {'State BFF Factor':>18}")
+            for row in phase_df.to_dict(orient="records"):
+                log_cb(
+                    f"  {str(row['Phase']) + ' ' + str(row['Layer']):<24} {row['Net_Balance']:>18.2f} "
+                    f"{row['Cumulative_Net_Balance']:>18.2f} {row['State_BFF_Factor']:>18.4f}"
+                )
+            log_cb(f"Phase balances written to: {phase_csv_path}")
+            log_cb("")
+        if zone_df is not None:
+            log_cb("===== ZONE BALANCES =====")
+            log_cb(f"  {'Zone':<24} {'Net Balance [m²]':>18} {'Final BFF Factor':>18}")
+            for row in zone_df.to_dict(orient="records"):
+                log_cb(f"  {str(row['Zone']):<24} {row['BFF_Area']:>18.2f} {row['Final_BFF_Factor']:>18.4f}")
+            log_cb(f"Zone balances written to: {zone_csv_path}")
+            log_cb(f"Zone layer written to: {zone_layer_path}")
+            log_cb("")
         log_cb("===== SPATIAL CHANGE FIELD =====")
         log_cb("Use field 'Delta' for coloring the polygons:")
         log_cb("  positive  = improvement")
@@ -786,14 +2590,179 @@ def main(
         log_cb(f"Measures manual (spatial)     : {len(manual_bg_spatial_rows)}")
 
     result_dict = {
-        "Total planning area": f"{total_planning_area:.2f} m2",
-        "Net Balance": f"{net_balance:.2f} m2",
-        "Percentage": f"{percentage:.2f} %",
-        "Final BFF Area": f"{final_bff_area:.2f} m2",
-        "Final BFF Factor": f"{final_bff_factor:.4f}",
-        "Final BFF Percentage": f"{final_bff_percentage:.2f} %",
+        **balance_summary,
+        **(format_sensitivity_summary(sensitivity) if sensitivity else {}),
         "Results path": output_csv_path,
+        "Transitions path": transitions_path,
         "Spatial change path": spatial_output_path,
+        "Plan feature layer path": plan_feature_path,
+        "Atomic change path": atomic_output_path or "(not exported)",
+        "Phase balance path": phase_csv_path or "(single phase)",
+        "Zone balance path": zone_csv_path or "(no zone layer)",
+        "Zone layer path": zone_layer_path or "(no zone layer)",
+        "Calculation time": f"{perf.total_wall():.2f} s" if perf is not None else "(not measured)",
         "Validation report": "\n\n".join(validation_reports),
     }
+    if fingerprint is not None:
+        write_fingerprint(fingerprint_path, fingerprint, result_dict, balance_summary, total_planning_area)
+    return result_dict, results_df
+
+
+def main(
+    plan_field_name: str,
+    base_field_name: str,
+    factors_csv: str,
+    output_csv_path: str,
+    base_layer_name: str,
+    planning_layer_name: str,
+    building_green: list,
+    building_green_layer_name: str = None,
+    building_green_field_name: str = None,
+    zones_layer_name: str = None,
+    zones_field_name: str = None,
+    phase_layer_names: Optional[list] = None,
+    max_allowed_overlap_area: float = 30.0,
+    min_report_overlap_area: float = 0.01,
+    validate_base_layer: bool = True,
+    validate_planning_layer: bool = True,
+    atomic_export_format: Optional[str] = None,
+    fail_fast: bool = False,
+    inputs_validated: bool = False,
+    profile: bool = False,
+    profile_top_n: int = 20,
+    sensitivity_samples: int = 0,
+    use_cache: bool = True,
+    out_of_core: bool = False,
+    overlay_engine: str = OVERLAY_ENGINE_PYTHON,
+    log_cb: Optional[Callable[[str], None]] = None,
+    perf=None,
+    results_ready_cb: Optional[Callable[[pd.DataFrame, dict, dict], None]] = None,
+):
+    """
+    Main calculation entry point.
+
+    Logic:
+    - normal plan/base intersections
+    - measures from optional building_green layer
+    - manual building_green rows
+    - one shared factor logic
+    - balance and spatial output remain consistent
+
+    zones_layer_name / zones_field_name: optional zoning polygon layer
+    (building blocks, parcels, phases). Every change row is assigned its zone
+    during the overlay; a per-zone balance is written as '<csv>_zones.csv'
+    and '<csv>_zones.gpkg'.
+
+    atomic_export_format: optional 'parquet' or 'feather' to additionally
+    export all atomic change rows (incl. plan fid and WKB geometry).
+
+    fail_fast: run the cheap input checks (fields, CRS, factor coverage)
+    before any geometry work and stop overlap scanning at the first critical
+    overlap. With fail_fast=False the full overlap report is collected.
+    inputs_validated: the caller already ran these input checks (the plugin's
+    own validation), so they are not repeated here.
+
+    perf: optional instrumentation.StageRecorder; wall/CPU time, peak memory
+    and item counts of every stage are recorded into it.
+
+    profile: run the calculation under cProfile and write '<csv>_profile.prof'
+    plus a '<csv>_slowest_geometries.txt' report (top profile_top_n plan
+    features / base categories by GEOS time, with vertex counts). The
+    per-geometry timing needs the Python overlay, so overlay_engine is
+    ignored while profiling.
+
+    sensitivity_samples: number of Monte Carlo factor samples for the
+    sensitivity analysis (sensitivity.py, factor ranges from the factors CSV);
+    0 disables it, and it is skipped if the factors CSV has no ranges.
+
+    phase_layer_names: optional ordered list of further plan layers (later
+    construction phases after planning_layer_name). Each phase is overlaid
+    with the state left by the previous phase; a phase-by-phase balance is
+    written as '<csv>_phases.csv'.
+
+    use_cache: fingerprint all inputs (layer contents, fields, factors CSV,
+    manual rows, options) and restore an identical earlier run from its
+    outputs instead of recomputing ('<csv>_fingerprint.json'). Ignored when
+    profiling.
+
+    out_of_core: for base layers larger than memory. Overlap validation
+    scans in windows and the overlay unions only the base features around
+    each window of plan features, both via setFilterRect() on the
+    provider's spatial index (GeoPackage R-tree, PostGIS GiST) instead of
+    unioning the whole base layer in memory. Plan features and result rows
+    are still held in memory. A base layer without provider index falls
+    back to the in-memory overlay. Phases still need the in-memory base
+    union.
+
+    overlay_engine: OVERLAY_ENGINE_SQL runs the base / plan overlay as one
+    SpatiaLite statement inside the GeoPackage (sql_backend.py) when both
+    layers are tables of the same file; otherwise, and when SpatiaLite is
+    unavailable or an input is invalid, the Python overlay is used. With
+    profile=True the Python overlay is always used (its per-geometry GEOS
+    time is what the hotspot report measures).
+
+    results_ready_cb: called with (results_df, balance summary, report
+    extras) as soon as the balance is aggregated, before CSV/GPKG are
+    written (e.g. to start plotting). Report extras are the keyword
+    arguments 'sensitivity' and 'phases' of plotting.write_report.
+    """
+    output_stem = os.path.splitext(output_csv_path)[0]
+    profile_path = output_stem + "_profile.prof"
+    hotspot_report_path = output_stem + "_slowest_geometries.txt"
+    hotspots = HotspotRecorder() if profile else None
+    profiler = cProfile.Profile() if profile else None
+    if profiler is not None:
+        profiler.enable()
+
+    try:
+        result_dict, results_df = _run_balance(
+            plan_field_name=plan_field_name,
+            base_field_name=base_field_name,
+            factors_csv=factors_csv,
+            output_csv_path=output_csv_path,
+            base_layer_name=base_layer_name,
+            planning_layer_name=planning_layer_name,
+            building_green=building_green,
+            building_green_layer_name=building_green_layer_name,
+            building_green_field_name=building_green_field_name,
+            zones_layer_name=zones_layer_name,
+            zones_field_name=zones_field_name,
+            phase_layer_names=phase_layer_names,
+            max_allowed_overlap_area=max_allowed_overlap_area,
+            min_report_overlap_area=min_report_overlap_area,
+            validate_base_layer=validate_base_layer,
+            validate_planning_layer=validate_planning_layer,
+            atomic_export_format=atomic_export_format,
+            fail_fast=fail_fast,
+            inputs_validated=inputs_validated,
+            profile=profile,
+            sensitivity_samples=sensitivity_samples,
+            use_cache=use_cache,
+            out_of_core=out_of_core,
+            overlay_engine=overlay_engine,
+            hotspots=hotspots,
+            log_cb=log_cb,
+            perf=perf,
+            results_ready_cb=results_ready_cb,
+        )
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            # a failing profile dump must not hide the result or the original error
+            try:
+                write_profile_artifacts(
+                    profiler,
+                    hotspots,
+                    profile_path=profile_path,
+                    report_path=hotspot_report_path,
+                    top_n=profile_top_n,
+                    log_cb=log_cb,
+                )
+            except Exception as e:
+                if log_cb:
+                    log_cb(f"Could not write profile: {e}")
+
+    if profile:
+        result_dict["Profile path"] = profile_path
+        result_dict["Slowest geometries path"] = hotspot_report_path
     return result_dict, results_df
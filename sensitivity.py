@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Monte Carlo sensitivity of the balance against factor uncertainty.
+
+Works on the aggregated Before -> After table of script_core.aggregate_change_rows.
+Because the balance is linear in the factors, the areas are first collapsed
+into one weight per category; all samples are then evaluated with a single
+matrix-vector product.
+
+Factor ranges come from optional columns of the factors CSV:
+
+    Description;BFF_2020;BFF_2020_min;BFF_2020_max;...
+
+Each factor is drawn from a triangular distribution (min, BFF_2020, max).
+Categories without a range use BFF_2020 -/+ default_spread (relative,
+clipped to 0..1); the default 0 keeps them fixed. Without any uncertain
+factor the analysis is skipped instead of reporting invented ranges.
+"""
+import time
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+FACTOR_COLUMN = "BFF_2020"
+RANGE_SUFFIXES = ("_min", "_max")
+DEFAULT_SAMPLES = 10_000
+DEFAULT_RELATIVE_SPREAD = 0.0
+DEFAULT_SEED = 2020
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+# ============================================================
+# FACTOR RANGES
+# ============================================================
+def is_range_column(column: str) -> bool:
+    return column.endswith(RANGE_SUFFIXES)
+
+
+def _normalize_key(value) -> str:
+    try:
+        from .script_core import normalize_key
+    except ImportError:  # standalone use; script_core imports this module
+        from script_core import normalize_key
+    return normalize_key(value)
+
+
+def load_factor_ranges(factors_csv: str, default_spread: float = DEFAULT_RELATIVE_SPREAD) -> pd.DataFrame:
+    """
+    Returns a DataFrame indexed by Description with columns low / mode / high.
+    Descriptions with the same script_core.normalize_key keep their first
+    row, like the factor lookup of the balance.
+    """
+    df = pd.read_csv(factors_csv, sep=";")
+    df.columns = [c.strip() for c in df.columns]
+    df["Description"] = df["Description"].astype(str).str.strip()
+    df = df[~df["Description"].map(_normalize_key).duplicated(keep="first")].set_index("Description")
+
+    mode = pd.to_numeric(df[FACTOR_COLUMN], errors="coerce").fillna(0.0)
+
+    def bound(suffix, default):
+        col = FACTOR_COLUMN + suffix
+        if col not in df.columns:
+            return default
+        return pd.to_numeric(df[col], errors="coerce").fillna(default)
+
+    low = bound("_min", (mode * (1 - default_spread)).clip(lower=0.0))
+    high = bound("_max", (mode * (1 + default_spread)).clip(upper=1.0))
+
+    return pd.DataFrame({
+        "low": np.minimum(low, mode),
+        "mode": mode,
+        "high": np.maximum(high, mode),
+    })
+
+
+def sample_factors(ranges: pd.DataFrame, n_samples: int, seed: Optional[int] = None) -> np.ndarray:
+    """
+    (n_samples x categories) matrix of triangular samples (inverse CDF, so
+    zero-width ranges simply return the mode).
+    """
+    low = ranges["low"].to_numpy(dtype=float)
+    mode = ranges["mode"].to_numpy(dtype=float)
+    high = ranges["high"].to_numpy(dtype=float)
+    width = high - low
+
+    rng = np.random.default_rng(seed)
+    u = rng.random((n_samples, len(ranges)))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        split = np.where(width > 0, (mode - low) / width, 0.0)
+    left = low + np.sqrt(u * width * (mode - low))
+    right = high - np.sqrt((1.0 - u) * width * (high - mode))
+    return np.where(u < split, left, right)
+
+
+# ============================================================
+# ANALYSIS
+# ============================================================
+def category_weights(results_df: pd.DataFrame, categories: pd.Index) -> tuple:
+    """
+    Collapses the transition rows into per-category weights:
+      net balance    = F @ (area ending in k - area starting in k)
+      final BFF area = F @ |area| ending in k
+    Categories are matched with script_core.normalize_key like in
+    script_core.apply_factors_to_rows; missing ones get factor 0 and
+    therefore no weight.
+    """
+    position = {_normalize_key(category): i for i, category in enumerate(categories)}
+
+    def indexer(values: pd.Series) -> np.ndarray:
+        return values.map(_normalize_key).map(position).fillna(-1).to_numpy(dtype=int)
+
+    area = results_df["Area"].to_numpy(dtype=float)
+    before = indexer(results_df["Before"])
+    after = indexer(results_df["After"])
+
+    k = len(categories)
+    known_before = before >= 0
+    known_after = after >= 0
+    gained = np.bincount(after[known_after], weights=area[known_after], minlength=k)
+    lost = np.bincount(before[known_before], weights=area[known_before], minlength=k)
+    final = np.bincount(after[known_after], weights=np.abs(area[known_after]), minlength=k)
+    return gained - lost, final
+
+
+def run_sensitivity(
+    results_df: pd.DataFrame,
+    factors_csv: str,
+    total_planning_area: float,
+    n_samples: int = DEFAULT_SAMPLES,
+    default_spread: float = DEFAULT_RELATIVE_SPREAD,
+    seed: Optional[int] = DEFAULT_SEED,
+    log_cb: Optional[Callable[[str], None]] = None,
+) -> Optional[dict]:
+    """
+    Distribution of Net Balance and Final BFF Factor over n_samples factor
+    samples. Returns None for an empty balance or if no factor has a range
+    (BFF_2020_min / _max columns or default_spread > 0).
+
+    The fixed default seed makes identical inputs give identical
+    percentiles (a restored run reports what the original run reported);
+    seed=None draws fresh samples.
+    """
+    if results_df is None or results_df.empty or n_samples <= 0:
+        return None
+
+    started = time.perf_counter()
+    ranges = load_factor_ranges(factors_csv, default_spread=default_spread)
+    uncertain = int(((ranges["high"] - ranges["low"]) > 0).sum())
+    if uncertain == 0:
+        if log_cb:
+            log_cb(
+                f"Sensitivity analysis skipped: the factor table has no ranges "
+                f"({FACTOR_COLUMN}_min / {FACTOR_COLUMN}_max columns)."
+            )
+            log_cb("")
+        return None
+
+    delta_weights, final_weights = category_weights(results_df, ranges.index)
+
+    samples = sample_factors(ranges, n_samples, seed=seed)
+    net_balance = samples @ delta_weights
+    final_bff_area = samples @ final_weights
+    if total_planning_area > 0:
+        final_bff_factor = final_bff_area / total_planning_area
+    else:
+        final_bff_factor = np.zeros(n_samples)
+
+    return {
+        "samples": n_samples,
+        "uncertain_factors": uncertain,
+        "default_spread": default_spread,
+        "net_balance": net_balance,
+        "final_bff_factor": final_bff_factor,
+        "net_balance_percentiles": dict(zip(PERCENTILES, np.percentile(net_balance, PERCENTILES))),
+        "final_bff_factor_percentiles": dict(zip(PERCENTILES, np.percentile(final_bff_factor, PERCENTILES))),
+        "prob_net_loss": float((net_balance < 0).mean()),
+        "seconds": time.perf_counter() - started,
+    }
+
+
+# ============================================================
+# REPORTING
+# ============================================================
+def format_sensitivity_summary(result: dict) -> dict:
+    net = result["net_balance_percentiles"]
+    factor = result["final_bff_factor_percentiles"]
+    return {
+        "Net Balance P5 / P50 / P95": f"{net[5]:.2f} / {net[50]:.2f} / {net[95]:.2f} m2",
+        "Final BFF Factor P5 / P50 / P95": f"{factor[5]:.4f} / {factor[50]:.4f} / {factor[95]:.4f}",
+        "Probability of net loss": f"{result['prob_net_loss'] * 100:.1f} %",
+    }
+
+
+def sensitivity_lines(result: dict) -> list:
+    lines = [
+        "===== SENSITIVITY (factor uncertainty) =====",
+        f"Samples             : {result['samples']} "
+        f"({result['uncertain_factors']} uncertain factors, {result['seconds'] * 1000:.0f} ms)",
+    ]
+    if result["default_spread"]:
+        lines.append(f"Factors without range: ±{result['default_spread'] * 100:.0f} % (triangular)")
+    lines.append(f"  {'Percentile':<10} {'Net Balance [m²]':>18} {'Final BFF Factor':>18}")
+    for p in PERCENTILES:
+        lines.append(
+            f"  {'P' + str(p):<10} {result['net_balance_percentiles'][p]:>18.2f} "
+            f"{result['final_bff_factor_percentiles'][p]:>18.4f}"
+        )
+    lines.append(f"Probability of net loss: {result['prob_net_loss'] * 100:.1f} %")
+    lines.append("")
+    return lines
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""
+SpatiaLite execution backend for the base / plan overlay.
+
+When base and plan layer are tables of the same GeoPackage, the overlay of
+script_core.calculate_atomic_change_rows is run as one SQL statement inside
+SQLite: candidate pairs come from the GeoPackage R-tree, intersections,
+unions and differences are computed by SpatiaLite (GEOS), and only the
+result rows leave the database.
+
+Requires an SQLite build that can load the 'mod_spatialite' extension
+(shipped with QGIS). SpatiaLite cannot repair invalid polygons the way
+script_core.safe_polygon_geometry does, so tables with invalid geometries
+are refused. Every reason the SQL overlay cannot run raises ValueError, on
+which script_core.main falls back to the Python overlay.
+"""
+import os
+import pathlib
+import sqlite3
+from typing import Optional
+
+from qgis.core import QgsGeometry, QgsProviderRegistry, QgsVectorLayer
+
+try:
+    from .script_core import safe_polygon_geometry
+except ImportError:
+    from script_core import safe_polygon_geometry
+
+
+SPATIALITE_EXTENSION = "mod_spatialite"
+
+
+# ============================================================
+# CONNECTION / TABLES
+# ============================================================
+def _quote(identifier: str) -> str:
+    return '"' + str(identifier).replace('"', '""') + '"'
+
+
+def layer_table(layer: QgsVectorLayer) -> Optional[tuple]:
+    """
+    (GeoPackage path, table name) of an unfiltered OGR GeoPackage layer,
+    otherwise None. The table name is None for single-layer files without
+    'layername' in the source.
+    """
+    if layer is None or layer.providerType() != "ogr" or layer.subsetString():
+        return None
+    parts = QgsProviderRegistry.instance().decodeUri("ogr", layer.source())
+    path = parts.get("path") or ""
+    if not path.lower().endswith(".gpkg") or not os.path.exists(path):
+        return None
+    return os.path.normcase(os.path.abspath(path)), parts.get("layerName") or None
+
+
+def shared_geopackage(base_layer: QgsVectorLayer, planning_layer: QgsVectorLayer) -> Optional[tuple]:
+    """
+    (path, base table, plan table) if both layers are tables of the same
+    GeoPackage, otherwise None.
+    """
+    base = layer_table(base_layer)
+    plan = layer_table(planning_layer)
+    if base is None or plan is None or base[0] != plan[0]:
+        return None
+    return base[0], base[1], plan[1]
+
+
+def connect_spatialite(gpkg_path: str) -> sqlite3.Connection:
+    """
+    Read-only connection with SpatiaLite loaded.
+    """
+    conn = sqlite3.connect(pathlib.Path(gpkg_path).resolve().as_uri() + "?mode=ro", uri=True)
+    try:
+        conn.enable_load_extension(True)
+        conn.load_extension(SPATIALITE_EXTENSION)
+    except (AttributeError, sqlite3.OperationalError) as e:
+        conn.close()
+        raise ValueError(
+            "The SQL overlay requires SQLite with the SpatiaLite extension "
+            f"('{SPATIALITE_EXTENSION}'): {e}"
+        ) from e
+    return conn
+
+
+def geopackage_table(conn: sqlite3.Connection, table: Optional[str]) -> dict:
+    """
+    Primary key, geometry column and R-tree (if any) of a GeoPackage
+    feature table. table=None picks the only feature table of the file.
+    """
+    if table is None:
+        tables = [r[0] for r in conn.execute("SELECT table_name FROM gpkg_geometry_columns")]
+        if len(tables) != 1:
+            raise ValueError("GeoPackage has several layers, the layer name is required")
+        table = tables[0]
+
+    row = conn.execute(
+        "SELECT column_name FROM gpkg_geometry_columns WHERE table_name = ?", (table,)
+    ).fetchone()
+    if row is None:
+        raise ValueError(f"Table '{table}' is not a GeoPackage feature table")
+    geom_column = row[0]
+
+    pk = [r[1] for r in conn.execute(f"PRAGMA table_info({_quote(table)})") if r[5]]
+    if len(pk) != 1:
+        raise ValueError(f"Table '{table}' needs a single integer primary key")
+
+    rtree = f"rtree_{table}_{geom_column}"
+    has_rtree = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (rtree,)
+    ).fetchone() is not None
+
+    return {"table": table, "pk": pk[0], "geometry": geom_column, "rtree": rtree if has_rtree else None}
+
+
+def invalid_geometry_count(conn: sqlite3.Connection, table: dict) -> int:
+    """Number of features SpatiaLite considers invalid (or cannot parse)."""
+    geom = _quote(table["geometry"])
+    row = conn.execute(
+        f"SELECT COUNT(*) FROM {_quote(table['table'])} "
+        f"WHERE {geom} IS NOT NULL AND COALESCE(ST_IsValid(GeomFromGPB({geom})), 0) <> 1"
+    ).fetchone()
+    return int(row[0])
+
+
+def check_valid_inputs(conn: sqlite3.Connection, *tables: dict) -> None:
+    for table in tables:
+        invalid = invalid_geometry_count(conn, table)
+        if invalid:
+            raise ValueError(
+                f"Table '{table['table']}' has {invalid} invalid geometries, "
+                "which only the Python overlay repairs"
+            )
+
+
+# ============================================================
+# SQL
+# ============================================================
+def _pairs_sql(base: dict, base_field: str, plan: dict, plan_field: str) -> str:
+    """
+    CTEs 'plan' (decoded plan geometries) and 'pairs' (plan feature x
+    intersecting base feature), candidates taken from the base R-tree.
+    """
+    b_geom = f"GeomFromGPB(b.{_quote(base['geometry'])})"
+    if base["rtree"]:
+        candidates = (
+            f"b.{_quote(base['pk'])} IN (SELECT id FROM {_quote(base['rtree'])} "
+            "WHERE minx <= MbrMaxX(plan.geom) AND maxx >= MbrMinX(plan.geom) "
+            "AND miny <= MbrMaxY(plan.geom) AND maxy >= MbrMinY(plan.geom))"
+        )
+    else:
+        candidates = f"MbrIntersects(plan.geom, {b_geom})"
+
+    return f"""
+WITH plan AS (
+    SELECT {_quote(plan['pk'])} AS plan_fid,
+           {_quote(plan_field)} AS after_value,
+           GeomFromGPB({_quote(plan['geometry'])}) AS geom
+    FROM {_quote(plan['table'])}
+    WHERE {_quote(plan['geometry'])} IS NOT NULL
+),
+pairs AS (
+    SELECT plan.plan_fid, plan.after_value, plan.geom AS plan_geom,
+           b.{_quote(base_field)} AS before_value,
+           {b_geom} AS base_geom
+    FROM plan
+    JOIN {_quote(base['table'])} AS b ON {candidates}
+    WHERE ST_Intersects(plan.geom, {b_geom})
+)"""
+
+
+def atomic_overlay_sql(base: dict, base_field: str, plan: dict, plan_field: str) -> str:
+    """
+    One row per plan feature and base category (intersection with the
+    category union) plus one 'uncovered' row per plan feature, like
+    script_core.calculate_atomic_change_rows.
+    """
+    return _pairs_sql(base, base_field, plan, plan_field) + """
+SELECT 'intersection', plan_fid, after_value, before_value,
+       AsBinary(ST_Union(ST_Intersection(plan_geom, base_geom)))
+FROM pairs
+GROUP BY plan_fid, before_value
+UNION ALL
+SELECT 'uncovered', plan.plan_fid, plan.after_value, NULL,
+       AsBinary(CASE WHEN covered.geom IS NULL THEN plan.geom ELSE ST_Difference(plan.geom, covered.geom) END)
+FROM plan
+LEFT JOIN (SELECT plan_fid, ST_Union(base_geom) AS geom FROM pairs GROUP BY plan_fid) AS covered
+    ON covered.plan_fid = plan.plan_fid
+"""
+
+
+def aggregated_overlay_sql(base: dict, base_field: str, plan: dict, plan_field: str) -> str:
+    """
+    Intersection area per Before -> After (without 'uncovered' rows and
+    without geometry), rounded per atomic row as in the Python overlay.
+    """
+    return _pairs_sql(base, base_field, plan, plan_field) + """
+SELECT before_value, after_value, SUM(area)
+FROM (
+    SELECT before_value, after_value,
+           ROUND(ST_Area(ST_Union(ST_Intersection(plan_geom, base_geom))), 2) AS area
+    FROM pairs
+    GROUP BY plan_fid, before_value
+)
+WHERE area > 0
+GROUP BY before_value, after_value
+"""
+
+
+# ============================================================
+# OVERLAY
+# ============================================================
+def calculate_atomic_change_rows_sql(
+    gpkg_path: str,
+    base_table: Optional[str],
+    base_field_name: str,
+    plan_table: Optional[str],
+    plan_field_name: str,
+) -> list:
+    """
+    Same rows as script_core.calculate_atomic_change_rows (Before, After,
+    Area, geometry, Source, PlanFid), computed by SpatiaLite. Raises
+    ValueError if the overlay cannot run in SQL.
+    """
+    conn = connect_spatialite(gpkg_path)
+    try:
+        base = geopackage_table(conn, base_table)
+        plan = geopackage_table(conn, plan_table)
+        check_valid_inputs(conn, base, plan)
+        try:
+            result = conn.execute(atomic_overlay_sql(base, base_field_name, plan, plan_field_name)).fetchall()
+        except sqlite3.Error as e:
+            raise ValueError(f"SpatiaLite overlay failed: {e}") from e
+
+        rows = []
+        for source, plan_fid, after_value, before_value, wkb in result:
+            if wkb is None:
+                continue
+            geom = QgsGeometry()
+            geom.fromWkb(bytes(wkb))
+            geom = safe_polygon_geometry(geom)
+            if geom is None:
+                continue
+            area = geom.area()
+            if area <= 0:
+                continue
+            rows.append({
+                "Before": before_value if source == "intersection" else "Uncovered",
+                "After": after_value,
+                "Area": round(area, 2),
+                "geometry": geom,
+                "Source": source,
+                "PlanFid": plan_fid,
+            })
+        return rows
+    finally:
+        conn.close()
+
+
+def aggregated_change_rows_sql(
+    gpkg_path: str,
+    base_table: Optional[str],
+    base_field_name: str,
+    plan_table: Optional[str],
+    plan_field_name: str,
+) -> list:
+    """
+    Before -> After intersection areas without moving any geometry to
+    Python ({'Before', 'After', 'Area'} rows, usable with
+    script_core.apply_factors_to_rows).
+    """
+    conn = connect_spatialite(gpkg_path)
+    try:
+        base = geopackage_table(conn, base_table)
+        plan = geopackage_table(conn, plan_table)
+        check_valid_inputs(conn, base, plan)
+        try:
+            result = conn.execute(aggregated_overlay_sql(base, base_field_name, plan, plan_field_name)).fetchall()
+        except sqlite3.Error as e:
+            raise ValueError(f"SpatiaLite overlay failed: {e}") from e
+        return [
+            {"Before": before_value, "After": after_value, "Area": round(area, 2)}
+            for before_value, after_value, area in result
+        ]
+    finally:
+        conn.close()